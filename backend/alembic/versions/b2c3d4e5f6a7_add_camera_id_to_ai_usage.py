@@ -0,0 +1,35 @@
+"""add camera_id to ai_usage
+
+Usage rows now carry the camera that triggered the AI call so the in-process
+cost ledger can maintain per-camera rollups and ``/system/ai-usage`` can fill
+its ``by_camera`` breakdown.
+
+The column is nullable and has no foreign key: manual re-analysis, Whisper
+transcription and historical rows have no camera attribution, and usage
+history must survive camera deletion.
+
+Revision ID: b2c3d4e5f6a7
+Revises: a1b2c3d4e5f6
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "b2c3d4e5f6a7"
+down_revision = "a1b2c3d4e5f6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("ai_usage") as batch_op:
+        batch_op.add_column(sa.Column("camera_id", sa.String(), nullable=True))
+        batch_op.create_index("ix_ai_usage_camera_id", ["camera_id"])
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("ai_usage") as batch_op:
+        batch_op.drop_index("ix_ai_usage_camera_id")
+        batch_op.drop_column("camera_id")
@@ -0,0 +1,137 @@
+"""externalize event media blobs to the content-addressed media store
+
+Inline base64 thumbnails and key-frame galleries are moved out of the
+``events`` table into hash-named files under ``data/media`` (see
+``app.services.media_store``). Events keep only the SHA-256 digests in the
+new ``thumbnail_hash`` / ``key_frame_hashes`` columns, and ``media_blobs``
+tracks how many references each stored blob has.
+
+The legacy ``thumbnail_base64`` / ``key_frames_base64`` columns are emptied
+but not dropped: removing a column on SQLite rebuilds the table, which would
+also drop the FTS5 triggers on ``events``. They are no longer mapped.
+
+Revision ID: c3d4e5f6a7b8
+Revises: b2c3d4e5f6a7
+Create Date: 2026-10-18
+"""
+import json
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "c3d4e5f6a7b8"
+down_revision = "b2c3d4e5f6a7"
+branch_labels = None
+depends_on = None
+
+BATCH_SIZE = 200
+
+
+def _events_table(*columns):
+    return sa.table("events", sa.column("id", sa.String), *columns)
+
+
+def upgrade() -> None:
+    from app.services.media_store import MediaStore
+
+    op.create_table(
+        "media_blobs",
+        sa.Column("digest", sa.String(64), primary_key=True),
+        sa.Column("size_bytes", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("ref_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False, server_default=sa.func.now()),
+    )
+    op.add_column("events", sa.Column("thumbnail_hash", sa.String(64), nullable=True))
+    op.add_column("events", sa.Column("key_frame_hashes", sa.Text(), nullable=True))
+
+    store = MediaStore()
+    conn = op.get_bind()
+    events = _events_table(
+        sa.column("thumbnail_base64", sa.Text),
+        sa.column("key_frames_base64", sa.Text),
+        sa.column("thumbnail_hash", sa.String),
+        sa.column("key_frame_hashes", sa.Text),
+    )
+    refs = {}
+    last_id = ""
+    while True:
+        rows = conn.execute(
+            sa.select(events.c.id, events.c.thumbnail_base64, events.c.key_frames_base64)
+            .where(events.c.id > last_id)
+            .where(events.c.thumbnail_base64.isnot(None) | events.c.key_frames_base64.isnot(None))
+            .order_by(events.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            break
+        for event_id, thumbnail_b64, key_frames_json in rows:
+            last_id = event_id
+            thumbnail_hash = None
+            key_frame_hashes = None
+            try:
+                if thumbnail_b64:
+                    thumbnail_hash = store.put_base64(thumbnail_b64)
+                if key_frames_json:
+                    frames = json.loads(key_frames_json) or []
+                    key_frame_hashes = json.dumps([store.put_base64(frame) for frame in frames]) if frames else None
+            except (ValueError, TypeError):
+                # Undecodable payloads were never displayable; drop them
+                # rather than failing the whole migration.
+                pass
+            for digest in ([thumbnail_hash] if thumbnail_hash else []) + (json.loads(key_frame_hashes) if key_frame_hashes else []):
+                refs[digest] = refs.get(digest, 0) + 1
+            conn.execute(
+                events.update()
+                .where(events.c.id == event_id)
+                .values(
+                    thumbnail_hash=thumbnail_hash,
+                    key_frame_hashes=key_frame_hashes,
+                    thumbnail_base64=None,
+                    key_frames_base64=None,
+                )
+            )
+
+    if refs:
+        blobs = sa.table(
+            "media_blobs",
+            sa.column("digest", sa.String),
+            sa.column("size_bytes", sa.Integer),
+            sa.column("ref_count", sa.Integer),
+        )
+        conn.execute(blobs.insert(), [
+            {"digest": digest, "size_bytes": store.size_of(digest), "ref_count": count}
+            for digest, count in refs.items()
+        ])
+
+
+def downgrade() -> None:
+    from app.services.media_store import MediaStore, parse_digest_list
+
+    store = MediaStore()
+    conn = op.get_bind()
+    events = _events_table(
+        sa.column("thumbnail_base64", sa.Text),
+        sa.column("key_frames_base64", sa.Text),
+        sa.column("thumbnail_hash", sa.String),
+        sa.column("key_frame_hashes", sa.Text),
+    )
+    rows = conn.execute(
+        sa.select(events.c.id, events.c.thumbnail_hash, events.c.key_frame_hashes)
+        .where(events.c.thumbnail_hash.isnot(None) | events.c.key_frame_hashes.isnot(None))
+    ).all()
+    for event_id, thumbnail_hash, key_frame_hashes in rows:
+        frames = [store.read_base64(digest) for digest in parse_digest_list(key_frame_hashes)]
+        conn.execute(
+            events.update()
+            .where(events.c.id == event_id)
+            .values(
+                thumbnail_base64=store.read_base64(thumbnail_hash) if thumbnail_hash else None,
+                key_frames_base64=json.dumps([f for f in frames if f]) if frames else None,
+            )
+        )
+
+    op.drop_column("events", "key_frame_hashes")
+    op.drop_column("events", "thumbnail_hash")
+    op.drop_table("media_blobs")
@@ -0,0 +1,36 @@
+"""add description_cache_enabled to cameras
+
+Per-camera switch for the AI description dedup cache
+(``app.services.description_cache_service``). Existing cameras default to
+enabled, matching new cameras.
+
+Revision ID: d4e5f6a7b8c9
+Revises: c3d4e5f6a7b8
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "d4e5f6a7b8c9"
+down_revision = "c3d4e5f6a7b8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.batch_alter_table("cameras") as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "description_cache_enabled",
+                sa.Boolean(),
+                nullable=False,
+                server_default=sa.true(),
+            )
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("cameras") as batch_op:
+        batch_op.drop_column("description_cache_enabled")
@@ -0,0 +1,56 @@
+"""add cluster coordination tables
+
+Membership heartbeats, named leases (scheduler leadership) and the pub/sub
+message log used by cluster mode (``app.services.cluster_service``).
+
+Revision ID: e5f6a7b8c9d0
+Revises: d4e5f6a7b8c9
+Create Date: 2026-10-19
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "e5f6a7b8c9d0"
+down_revision = "d4e5f6a7b8c9"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "cluster_members",
+        sa.Column("instance_id", sa.String(100), primary_key=True),
+        sa.Column("hostname", sa.String(255), nullable=True),
+        sa.Column("pid", sa.Integer(), nullable=True),
+        sa.Column("started_at", sa.Float(), nullable=False),
+        sa.Column("heartbeat_at", sa.Float(), nullable=False),
+    )
+    op.create_index("ix_cluster_members_heartbeat_at", "cluster_members", ["heartbeat_at"])
+
+    op.create_table(
+        "cluster_leases",
+        sa.Column("name", sa.String(100), primary_key=True),
+        sa.Column("holder", sa.String(100), nullable=False),
+        sa.Column("acquired_at", sa.Float(), nullable=False),
+        sa.Column("expires_at", sa.Float(), nullable=False),
+    )
+
+    op.create_table(
+        "cluster_messages",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column("channel", sa.String(100), nullable=False),
+        sa.Column("origin", sa.String(100), nullable=False),
+        sa.Column("payload", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.Float(), nullable=False),
+    )
+    op.create_index("ix_cluster_messages_created_at", "cluster_messages", ["created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_cluster_messages_created_at", table_name="cluster_messages")
+    op.drop_table("cluster_messages")
+    op.drop_table("cluster_leases")
+    op.drop_index("ix_cluster_members_heartbeat_at", table_name="cluster_members")
+    op.drop_table("cluster_members")
@@ -528,6 +528,7 @@ async def get_context_metrics():
     - Total requests and cache statistics
     - Timeout count
     - Cache TTL and size
+    - Per-component cache hit rates and recent gather times
 
     Example:
         GET /api/v1/ai/context-metrics
@@ -541,7 +542,15 @@ async def get_context_metrics():
             "timeouts": 2,
             "cache_ttl_seconds": 30,
             "timeout_threshold_ms": 80,
-            "cache_size": 5
+            "cache_size": 5,
+            "cache_max_size": 256,
+            "cache_evictions": 0,
+            "component_ttl_seconds": 600,
+            "component_hit_rate": 0.92,
+            "components": {"feedback": {"size": 5, "hits": 240, "misses": 5, ...}, ...},
+            "gather_count": 250,
+            "avg_gather_time_ms": 1.8,
+            "p95_gather_time_ms": 6.4
         }
     """
     try:
@@ -9,6 +9,7 @@ Audio event types:
 - gunshot: Sound of gunfire
 - scream: Human screaming or distress call
 - doorbell: Doorbell ringing sound
+- alarm: Smoke/CO alarm or siren tone
 - other: Other significant audio event
 """
 
@@ -37,6 +38,7 @@ class AudioThresholdsResponse(BaseModel):
     gunshot: float = Field(..., ge=0.0, le=1.0, description="Confidence threshold for gunshot detection")
     scream: float = Field(..., ge=0.0, le=1.0, description="Confidence threshold for scream detection")
     doorbell: float = Field(..., ge=0.0, le=1.0, description="Confidence threshold for doorbell detection")
+    alarm: float = Field(0.70, ge=0.0, le=1.0, description="Confidence threshold for alarm tone detection")
     other: float = Field(..., ge=0.0, le=1.0, description="Confidence threshold for other audio events")
 
     model_config = {
@@ -47,6 +49,7 @@ class AudioThresholdsResponse(BaseModel):
                     "gunshot": 0.70,
                     "scream": 0.70,
                     "doorbell": 0.70,
+                    "alarm": 0.70,
                     "other": 0.70
                 }
             ]
@@ -58,7 +61,7 @@ class ThresholdUpdateRequest(BaseModel):
     """Request schema for updating a single threshold"""
     event_type: str = Field(
         ...,
-        description="Audio event type to update (glass_break, gunshot, scream, doorbell, other)"
+        description="Audio event type to update (glass_break, gunshot, scream, doorbell, alarm, other)"
     )
     threshold: float = Field(
         ...,
@@ -125,6 +128,7 @@ async def get_audio_thresholds(
     - gunshot
     - scream
     - doorbell
+    - alarm
     - other
     """
     detector = get_audio_event_detector()
@@ -147,6 +151,7 @@ async def get_audio_thresholds(
         gunshot=thresholds.get("gunshot", 0.70),
         scream=thresholds.get("scream", 0.70),
         doorbell=thresholds.get("doorbell", 0.70),
+        alarm=thresholds.get("alarm", 0.70),
         other=thresholds.get("other", 0.70),
     )
 
@@ -161,7 +166,7 @@ async def get_audio_thresholds(
     The threshold determines the minimum confidence score required for
     audio detections of that type to be recorded as events.
 
-    Valid event types: glass_break, gunshot, scream, doorbell, other
+    Valid event types: glass_break, gunshot, scream, doorbell, alarm, other
     Valid threshold range: 0.0 to 1.0 (0% to 100%)
     """
 )
@@ -235,5 +240,6 @@ async def get_supported_audio_types() -> Dict[str, str]:
         "gunshot": "Sound of gunfire or explosions",
         "scream": "Human screaming, shouting, or distress calls",
         "doorbell": "Doorbell ring or chime sounds",
+        "alarm": "Smoke/CO alarm beeps or siren tones",
         "other": "Other significant audio events not classified above"
     }
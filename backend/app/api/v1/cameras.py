@@ -8,8 +8,9 @@ Provides REST API for camera configuration management:
 - PUT /cameras/{id} - Update camera
 - DELETE /cameras/{id} - Delete camera
 - POST /cameras/{id}/test - Test connection
+- GET /cameras/{id}/preview.jpg - Live preview as raw JPEG (ETag/304)
 """
-from fastapi import APIRouter, Depends, HTTPException, status, WebSocket, WebSocketDisconnect
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status, WebSocket, WebSocketDisconnect
 from sqlalchemy.orm import Session
 from typing import List, Optional
 import logging
@@ -18,6 +19,7 @@ import base64
 import numpy as np
 import asyncio
 import json
+import time
 
 try:
     import av
@@ -47,9 +49,19 @@ from app.services.detection_zone_manager import detection_zone_manager
 from app.services.event_processor import get_event_processor, ProcessingEvent
 from app.services.mqtt_discovery_service import on_camera_deleted, on_camera_disabled  # Story P4-2.2
 from app.services.stream_proxy_service import get_stream_proxy_service, StreamQuality  # Story P16-2.2
+from app.services.jpeg_cache import is_not_modified, jpeg_response, not_modified_response
 
 logger = logging.getLogger(__name__)
 
+# Live preview encoding
+PREVIEW_DEFAULT_WIDTH = 640
+PREVIEW_MIN_WIDTH = 64
+PREVIEW_MAX_WIDTH = 1920
+PREVIEW_JPEG_QUALITY = 80
+
+# Protect snapshots have no frame sequence; previews are versioned by time slot
+PROTECT_SNAPSHOT_INTERVAL_SECONDS = 1.0
+
 router = APIRouter(prefix="/cameras", tags=["cameras"])
 
 
@@ -112,6 +124,7 @@ def create_camera(
             audio_enabled=camera_data.audio_enabled,
             audio_event_types=camera_data.audio_event_types,
             audio_threshold=camera_data.audio_threshold,
+            description_cache_enabled=camera_data.description_cache_enabled,
         )
 
         # Save to database
@@ -510,6 +523,9 @@ async def update_camera(
         # Save changes
         db.commit()
         db.refresh(camera)
+        container.mcp_context_provider.invalidate_camera(camera_id_str)
+        # Prompt, analysis mode or cache settings may have changed
+        container.description_cache_service.invalidate_camera(camera_id_str)
 
         # Handle camera thread lifecycle
         if restart_needed and camera.is_enabled:
@@ -585,6 +601,7 @@ async def delete_camera(
         # Delete from database
         db.delete(camera)
         db.commit()
+        container.mcp_context_provider.invalidate_camera(camera_id_str)
 
         logger.info(f"Camera deleted: {camera_id_str} ({camera.name})")
 
@@ -1702,7 +1719,7 @@ async def get_camera_preview(
             return await _get_protect_camera_preview(camera)
         else:
             # RTSP/USB camera - use camera_service
-            return _get_rtsp_camera_preview(camera_id)
+            return await _get_rtsp_camera_preview(camera_id)
 
     except HTTPException:
         raise
@@ -1714,8 +1731,98 @@ async def get_camera_preview(
         )
 
 
+@router.get(
+    "/{camera_id}/preview.jpg",
+    response_class=Response,
+    responses={
+        200: {"content": {"image/jpeg": {}}, "description": "Preview JPEG"},
+        304: {"description": "Client copy is current"},
+    },
+)
+async def get_camera_preview_image(
+    camera_id: str,
+    request: Request,
+    width: int = Query(PREVIEW_DEFAULT_WIDTH, ge=PREVIEW_MIN_WIDTH, le=PREVIEW_MAX_WIDTH),
+    db: Session = Depends(get_db)
+):
+    """
+    Get current camera preview frame as raw image/jpeg
+
+    Binary variant of GET /{camera_id}/preview for dashboards that poll many
+    cameras: no base64 inflation, and encoded JPEGs are shared through the
+    JPEG cache keyed by (camera, frame sequence, width), so concurrent
+    viewers of the same frame cost one encode. The ETag identifies the frame,
+    so a poll with If-None-Match returns 304 until a new frame arrives.
+
+    Args:
+        camera_id: UUID of camera
+        width: Preview width in pixels (aspect ratio preserved)
+        db: Database session
+
+    Returns:
+        JPEG bytes with ETag/Last-Modified, or 304 Not Modified
+
+    Raises:
+        404: Camera not found
+        400: Camera disabled, not running or failed to capture frame
+    """
+    try:
+        camera = db.query(Camera).filter(Camera.id == camera_id).first()
+
+        if not camera:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"Camera {camera_id} not found"
+            )
+
+        if not camera.is_enabled:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Camera {camera_id} is disabled"
+            )
+
+        if camera.source_type == 'protect':
+            entry = await _get_protect_preview_jpeg(camera, width, request)
+        else:
+            entry = await _get_rtsp_preview_jpeg(camera_id, width, request)
+
+        if isinstance(entry, Response):
+            return entry
+        return jpeg_response(request, entry, cache_control="private, no-cache")
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Failed to get preview image for camera {camera_id}: {e}", exc_info=True)
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Failed to get camera preview: {str(e)}"
+        )
+
+
 async def _get_protect_camera_preview(camera: Camera) -> dict:
     """Get preview for a Protect camera via snapshot API."""
+    entry = await _get_protect_preview_jpeg(camera, PREVIEW_DEFAULT_WIDTH)
+    return {
+        "thumbnail_base64": base64.b64encode(entry.data).decode('utf-8')
+    }
+
+
+async def _get_protect_preview_jpeg(
+    camera: Camera,
+    width: int,
+    request: Optional[Request] = None,
+):
+    """
+    Fetch a Protect snapshot through the JPEG cache.
+
+    Protect snapshots carry no frame sequence, so the version is the current
+    PROTECT_SNAPSHOT_INTERVAL_SECONDS time slot: viewers polling within the
+    same slot share one snapshot fetch from the controller.
+
+    Returns:
+        CachedJPEG, or a 304 Response when request already holds this slot
+    """
     if not camera.protect_controller_id or not camera.protect_camera_id:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -1732,35 +1839,55 @@ async def _get_protect_camera_preview(camera: Camera) -> dict:
             detail="Protect controller is not connected"
         )
 
-    try:
-        snapshot_bytes = await protect_service.get_camera_snapshot(
+    slot = int(time.time() // PROTECT_SNAPSHOT_INTERVAL_SECONDS)
+    etag = f'"{camera.id}-p{slot}-{width}"'
+    if request is not None and is_not_modified(request, etag):
+        return not_modified_response(etag, cache_control="private, no-cache")
+
+    async def _fetch_snapshot() -> Optional[bytes]:
+        return await protect_service.get_camera_snapshot(
             controller_id=str(camera.protect_controller_id),
             protect_camera_id=camera.protect_camera_id,
-            width=640
+            width=width
         )
 
-        if not snapshot_bytes:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="No snapshot available from camera"
-            )
-
-        # Convert to base64
-        preview_b64 = base64.b64encode(snapshot_bytes).decode('utf-8')
-
-        return {
-            "thumbnail_base64": preview_b64
-        }
-
+    try:
+        entry = await container.jpeg_cache.get_or_encode(
+            (camera.id, f"p{slot}", width), _fetch_snapshot, etag=etag
+        )
     except ValueError as e:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=str(e)
         )
 
+    if entry is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No snapshot available from camera"
+        )
+    return entry
+
 
-def _get_rtsp_camera_preview(camera_id: str) -> dict:
+async def _get_rtsp_camera_preview(camera_id: str) -> dict:
     """Get preview for an RTSP/USB camera via camera_service."""
+    entry = await _get_rtsp_preview_jpeg(camera_id, PREVIEW_DEFAULT_WIDTH)
+    return {
+        "thumbnail_base64": base64.b64encode(entry.data).decode('utf-8')
+    }
+
+
+async def _get_rtsp_preview_jpeg(
+    camera_id: str,
+    width: int,
+    request: Optional[Request] = None,
+):
+    """
+    Encode the latest RTSP/USB frame through the JPEG cache.
+
+    Returns:
+        CachedJPEG, or a 304 Response when request already holds this frame
+    """
     # Get camera status from service
     cam_status = camera_service.get_camera_status(camera_id)
 
@@ -1770,25 +1897,50 @@ def _get_rtsp_camera_preview(camera_id: str) -> dict:
             detail=f"Camera {camera_id} is not currently running"
         )
 
-    # Get latest frame from camera service
-    latest_frame = camera_service.get_latest_frame(camera_id)
+    seq = camera_service.get_latest_frame_seq(camera_id)
+    if not seq:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="No frame available from camera"
+        )
 
-    if latest_frame is None:
+    # The frame sequence identifies the content, so a matching client copy
+    # needs neither the frame nor the cache.
+    etag = f'"{camera_id}-{seq}-{width}"'
+    if request is not None and is_not_modified(request, etag):
+        return not_modified_response(etag, cache_control="private, no-cache")
+
+    entry = container.jpeg_cache.get((camera_id, seq, width))
+    if entry is None:
+        # Take the frame and its sequence together: a newer frame may have
+        # arrived since the check above, and the cache key and ETag must
+        # describe the frame that is actually encoded.
+        frame, seq = camera_service.get_latest_frame_with_seq(camera_id)
+        if frame is not None:
+            async def _encode_frame() -> bytes:
+                return await asyncio.to_thread(_encode_preview_jpeg, frame, width)
+
+            entry = await container.jpeg_cache.get_or_encode(
+                (camera_id, seq, width), _encode_frame, etag=f'"{camera_id}-{seq}-{width}"'
+            )
+
+    if entry is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="No frame available from camera"
         )
+    return entry
 
-    # Resize to preview size (640x480 or maintain aspect ratio)
-    height, width = latest_frame.shape[:2]
-    preview_width = 640
-    aspect_ratio = width / height
-    preview_height = int(preview_width / aspect_ratio)
 
-    preview_frame = cv2.resize(latest_frame, (preview_width, preview_height))
+def _encode_preview_jpeg(frame: np.ndarray, width: int) -> bytes:
+    """Resize a frame to width (keeping aspect ratio) and encode it as JPEG."""
+    height, frame_width = frame.shape[:2]
+    aspect_ratio = frame_width / height
+    preview_height = int(width / aspect_ratio)
 
-    # Encode as JPEG
-    encode_param = [int(cv2.IMWRITE_JPEG_QUALITY), 80]
+    preview_frame = cv2.resize(frame, (width, preview_height))
+
+    encode_param = [int(cv2.IMWRITE_JPEG_QUALITY), PREVIEW_JPEG_QUALITY]
     ret, buffer = cv2.imencode('.jpg', preview_frame, encode_param)
 
     if not ret:
@@ -1796,13 +1948,7 @@ def _get_rtsp_camera_preview(camera_id: str) -> dict:
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to encode preview image"
         )
-
-    # Convert to base64
-    preview_b64 = base64.b64encode(buffer).decode('utf-8')
-
-    return {
-        "thumbnail_base64": preview_b64
-    }
+    return buffer.tobytes()
 
 
 @router.post("/{camera_id}/analyze")
@@ -11,7 +11,6 @@ Provides endpoints for:
 - Person matching for face recognition (P4-8.2)
 - Entity adjustment history for ML training (P9-4.6)
 """
-import base64
 import logging
 import os
 from datetime import datetime
@@ -21,7 +20,7 @@ from fastapi import APIRouter, Depends, HTTPException, Path, Query
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.models.event import Event
 from app.services.service_container import container
 from app.models.event_embedding import EventEmbedding
@@ -40,21 +39,43 @@ router = APIRouter(prefix="/context", tags=["context"])
 
 # Request/Response Models
 class BatchEmbeddingRequest(BaseModel):
-    """Request model for batch embedding generation."""
-    limit: int = Field(
-        default=100,
+    """Request model for starting an embedding backfill job."""
+    limit: Optional[int] = Field(
+        default=None,
         ge=1,
-        le=100,
-        description="Maximum number of events to process (max 100 per request)"
+        description="Maximum number of events to embed (default: every event missing an embedding)"
     )
-
-
-class BatchEmbeddingResponse(BaseModel):
-    """Response model for batch embedding generation."""
-    processed: int = Field(description="Number of embeddings successfully generated")
-    failed: int = Field(description="Number of embeddings that failed to generate")
-    total: int = Field(description="Total number of events processed")
-    remaining: int = Field(description="Number of events still without embeddings")
+    batch_size: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=256,
+        description="Events per batched CLIP inference (default EMBEDDING_BACKFILL_BATCH_SIZE)"
+    )
+    max_events_per_second: Optional[float] = Field(
+        default=None,
+        ge=0,
+        description="Pace limit so the job can run alongside live traffic, 0 for none "
+                    "(default EMBEDDING_BACKFILL_MAX_EVENTS_PER_SECOND)"
+    )
+
+
+class BatchEmbeddingJobResponse(BaseModel):
+    """Response model for an embedding backfill job."""
+    job_id: str = Field(description="Unique job identifier")
+    status: str = Field(description="Job status: running, completed, cancelled, failed")
+    total_events: int = Field(description="Events this job will process")
+    processed: int = Field(description="Events processed so far")
+    embedded: int = Field(description="Embeddings generated and stored")
+    failed: int = Field(description="Events whose thumbnail could not be read or embedded")
+    remaining: int = Field(description="Events of this job not processed yet")
+    batches: int = Field(description="Batches completed")
+    percent_complete: float = Field(description="Completion percentage")
+    events_per_second: float = Field(description="Average throughput")
+    batch_size: int = Field(description="Events per CLIP batch")
+    max_events_per_second: float = Field(description="Pace limit (0 = none)")
+    started_at: Optional[str] = Field(default=None, description="Job start time")
+    completed_at: Optional[str] = Field(default=None, description="Job completion time")
+    error_message: Optional[str] = Field(default=None, description="Error message if failed")
 
 
 class EmbeddingStatusResponse(BaseModel):
@@ -75,121 +96,58 @@ class EmbeddingStatsResponse(BaseModel):
     embedding_dimension: int = Field(description="Embedding vector dimension")
 
 
-@router.post("/embeddings/batch", response_model=BatchEmbeddingResponse)
+@router.post("/embeddings/batch", response_model=BatchEmbeddingJobResponse, status_code=202)
 async def batch_generate_embeddings(
     request: BatchEmbeddingRequest = BatchEmbeddingRequest(),
     db: Session = Depends(get_db),
-    embedding_service: EmbeddingService = Depends(get_embedding_service),
 ):
     """
-    Generate embeddings for events that don't have them yet.
+    Start a background job generating embeddings for events that don't have them yet.
 
-    AC8: Batch processing endpoint for generating embeddings on existing events
-    AC9: Batch processing respects rate limiting (max 100 events per request)
+    Missing events are selected in bulk, their thumbnails decoded on a thread
+    pool and embedded with batched CLIP inference, and each batch is inserted
+    with one statement. The job is rate limited so it can run alongside live
+    traffic; progress is broadcast over WebSocket (`embedding_backfill_progress`,
+    then `embedding_backfill_complete`) and available from
+    GET /context/embeddings/batch. Starting a new job after a cancel or restart
+    resumes with the events still missing embeddings.
 
-    Args:
-        request: Batch processing parameters (limit 1-100)
-        db: Database session
-        embedding_service: Embedding service instance
+    Returns 409 if a backfill is already running and 400 if no event is
+    missing an embedding.
+    """
+    backfill_service = container.embedding_backfill_service
 
-    Returns:
-        BatchEmbeddingResponse with processed/failed/remaining counts
-    """
-    # AC9: Enforce max 100 events per request
-    limit = min(request.limit, 100)
-
-    # Find events without embeddings
-    # Subquery to get event_ids that already have embeddings
-    events_with_embeddings = db.query(EventEmbedding.event_id).subquery()
-
-    # Get events that don't have embeddings and have thumbnails
-    events_without_embeddings = db.query(Event).filter(
-        ~Event.id.in_(events_with_embeddings),
-        (Event.thumbnail_base64.isnot(None)) | (Event.thumbnail_path.isnot(None))
-    ).limit(limit).all()
-
-    processed = 0
-    failed = 0
-
-    for event in events_without_embeddings:
-        try:
-            # Get thumbnail bytes
-            thumbnail_bytes = None
-
-            if event.thumbnail_base64:
-                # Use base64 thumbnail
-                b64_str = event.thumbnail_base64
-                if b64_str.startswith("data:"):
-                    comma_idx = b64_str.find(",")
-                    if comma_idx != -1:
-                        b64_str = b64_str[comma_idx + 1:]
-                thumbnail_bytes = base64.b64decode(b64_str)
-
-            elif event.thumbnail_path:
-                # AC10: Works for file-path thumbnails
-                # Resolve file path (handle relative paths like /api/v1/thumbnails/...)
-                if event.thumbnail_path.startswith("/api/v1/thumbnails/"):
-                    # Extract date and filename from path
-                    parts = event.thumbnail_path.split("/")
-                    if len(parts) >= 5:
-                        date_str = parts[-2]
-                        filename = parts[-1]
-                        file_path = os.path.join(
-                            os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))),
-                            "data", "thumbnails", date_str, filename
-                        )
-                        if os.path.exists(file_path):
-                            with open(file_path, "rb") as f:
-                                thumbnail_bytes = f.read()
-
-            if thumbnail_bytes:
-                # Generate embedding
-                embedding_vector = await embedding_service.generate_embedding(thumbnail_bytes)
-
-                # Store embedding
-                await embedding_service.store_embedding(
-                    db=db,
-                    event_id=event.id,
-                    embedding=embedding_vector,
-                )
-                processed += 1
-            else:
-                # No valid thumbnail
-                failed += 1
-                logger.warning(
-                    f"No valid thumbnail for event {event.id}",
-                    extra={"event_id": event.id}
-                )
-
-        except Exception as e:
-            failed += 1
-            logger.error(
-                f"Batch embedding failed for event {event.id}: {e}",
-                extra={"event_id": event.id, "error": str(e)}
-            )
+    try:
+        job = await backfill_service.start_backfill(
+            db=db,
+            limit=request.limit,
+            batch_size=request.batch_size,
+            max_events_per_second=request.max_events_per_second,
+        )
+    except ValueError as e:
+        if "already running" in str(e):
+            raise HTTPException(status_code=409, detail=str(e))
+        raise HTTPException(status_code=400, detail=str(e))
 
-    # Count remaining events without embeddings
-    remaining = db.query(Event).filter(
-        ~Event.id.in_(db.query(EventEmbedding.event_id)),
-        (Event.thumbnail_base64.isnot(None)) | (Event.thumbnail_path.isnot(None))
-    ).count()
+    return BatchEmbeddingJobResponse(**job.to_dict())
 
-    logger.info(
-        f"Batch embedding complete: {processed} processed, {failed} failed, {remaining} remaining",
-        extra={
-            "event_type": "batch_embedding_complete",
-            "processed": processed,
-            "failed": failed,
-            "remaining": remaining,
-        }
-    )
 
-    return BatchEmbeddingResponse(
-        processed=processed,
-        failed=failed,
-        total=len(events_without_embeddings),
-        remaining=remaining,
-    )
+@router.get("/embeddings/batch", response_model=Optional[BatchEmbeddingJobResponse])
+async def get_batch_embedding_status():
+    """Get the status of the current or most recent embedding backfill job."""
+    job = container.embedding_backfill_service.current_job
+    if not job:
+        return None
+    return BatchEmbeddingJobResponse(**job.to_dict())
+
+
+@router.delete("/embeddings/batch", response_model=BatchEmbeddingJobResponse)
+async def cancel_batch_embeddings():
+    """Cancel the running embedding backfill after its current batch. Stored embeddings are kept."""
+    job = await container.embedding_backfill_service.cancel_backfill()
+    if not job:
+        raise HTTPException(status_code=404, detail="No embedding backfill job is currently running")
+    return BatchEmbeddingJobResponse(**job.to_dict())
 
 
 @router.get("/embeddings/{event_id}", response_model=EmbeddingStatusResponse)
@@ -585,7 +543,7 @@ async def list_entities(
         default=None,
         description="Search by entity name (case-insensitive partial match)"
     ),
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     entity_service: EntityService = Depends(get_entity_service),
 ):
     """
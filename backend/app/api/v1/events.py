@@ -11,7 +11,7 @@ Provides REST API for AI-generated semantic event management:
 """
 from fastapi import APIRouter, Depends, HTTPException, status, Query, BackgroundTasks, Request, Response
 from fastapi.responses import StreamingResponse, FileResponse
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer
 from sqlalchemy import func, and_, or_, desc, asc, text
 from typing import Optional
 from datetime import datetime, timezone, timedelta, date
@@ -24,7 +24,7 @@ import csv
 import io
 import asyncio
 
-from app.core.database import get_db
+from app.core.database import get_db, get_read_db
 from app.schemas.types import iso_utc
 from app.models.event import Event
 from app.models.camera import Camera
@@ -40,6 +40,7 @@ from app.schemas.event import (
 )
 from app.schemas.system import CleanupResponse
 from app.services.service_container import container
+from app.services.jpeg_cache import jpeg_response, is_not_modified, not_modified_response
 from app.models.event_feedback import EventFeedback
 from app.schemas.feedback import FeedbackCreate, FeedbackUpdate, FeedbackResponse
 
@@ -69,6 +70,21 @@ def _normalize_thumbnail_path(thumbnail_path: str) -> str:
     return thumbnail_path
 
 
+def _get_thumbnail_path(event) -> Optional[str]:
+    """
+    Thumbnail location for API responses.
+
+    Thumbnails held in the media store are not inlined as base64; clients
+    are pointed at the binary /events/{id}/thumbnail.jpg endpoint instead so
+    list responses stay small and images are fetched only when displayed.
+    """
+    if event.thumbnail_path:
+        return event.thumbnail_path
+    if event.thumbnail_hash:
+        return f"/api/v1/events/{event.id}/thumbnail.jpg"
+    return None
+
+
 def _get_annotated_thumbnail_path(event) -> Optional[str]:
     """
     Get annotated thumbnail path for an event (Story P15-5.1).
@@ -343,7 +359,7 @@ def list_events(
     limit: int = Query(50, ge=1, le=500, description="Number of results per page"),
     offset: int = Query(0, ge=0, description="Pagination offset"),
     sort_order: str = Query("desc", pattern="^(asc|desc)$", description="Sort by timestamp"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     List events with filtering, pagination, and full-text search
@@ -370,6 +386,48 @@ def list_events(
         - GET /events?min_confidence=80&object_types=person,vehicle
         - GET /events?search_query=front+door&limit=20
     """
+    return _list_events(
+        db,
+        camera_id=camera_id,
+        start_time=start_time,
+        end_time=end_time,
+        min_confidence=min_confidence,
+        object_types=object_types,
+        alert_triggered=alert_triggered,
+        search_query=search_query,
+        source_type=source_type,
+        smart_detection_type=smart_detection_type,
+        analysis_mode=analysis_mode,
+        has_fallback=has_fallback,
+        low_confidence=low_confidence,
+        anomaly_severity=anomaly_severity,
+        limit=limit,
+        offset=offset,
+        sort_order=sort_order,
+    )
+
+
+def _list_events(
+    db: Session,
+    *,
+    camera_id: Optional[str],
+    start_time: Optional[datetime],
+    end_time: Optional[datetime],
+    min_confidence: Optional[int],
+    object_types: Optional[str],
+    alert_triggered: Optional[bool],
+    search_query: Optional[str],
+    source_type: Optional[str],
+    smart_detection_type: Optional[str],
+    analysis_mode: Optional[str],
+    has_fallback: Optional[bool],
+    low_confidence: Optional[bool],
+    anomaly_severity: Optional[str],
+    limit: int,
+    offset: int,
+    sort_order: str,
+) -> EventListResponse:
+    """Build and run the list_events query."""
     try:
         # Build base query
         query = db.query(Event)
@@ -531,8 +589,9 @@ def list_events(
         else:
             query = query.order_by(asc(Event.timestamp))
 
-        # Apply pagination
-        query = query.offset(offset).limit(limit)
+        # Apply pagination; bounding boxes are deferred on the model but
+        # returned by every list item, so load them with the page
+        query = query.options(undefer(Event.bounding_boxes)).offset(offset).limit(limit)
 
         # Execute query
         events = query.all()
@@ -580,8 +639,8 @@ def list_events(
                 "description": event.description,
                 "confidence": event.confidence,
                 "objects_detected": event.objects_detected,
-                "thumbnail_path": event.thumbnail_path,
-                "thumbnail_base64": event.thumbnail_base64,
+                "thumbnail_path": _get_thumbnail_path(event),
+                "thumbnail_base64": None,
                 "alert_triggered": event.alert_triggered,
                 "source_type": event.source_type,
                 "protect_event_id": event.protect_event_id,
@@ -752,7 +811,7 @@ async def export_events(
     end_date: Optional[date] = Query(None, description="End date (YYYY-MM-DD)"),
     camera_id: Optional[str] = Query(None, description="Filter by camera UUID"),
     min_confidence: Optional[int] = Query(None, ge=0, le=100, description="Minimum confidence score"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     Export events to JSON or CSV format
@@ -1482,9 +1541,9 @@ async def delete_event(
 
 
 @router.get("/{event_id}", response_model=EventResponse)
-async def get_event(
+def get_event(
     event_id: str,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     Get single event by ID
@@ -1504,93 +1563,15 @@ async def get_event(
     Example:
         GET /events/123e4567-e89b-12d3-a456-426614174000
     """
-    from app.schemas.event import CorrelatedEventResponse, MatchedEntitySummary
-    from app.services.entity_service import get_entity_service
+    from app.schemas.event import MatchedEntitySummary
 
     try:
-        event = db.query(Event).filter(Event.id == event_id).first()
-
-        if not event:
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Event {event_id} not found"
-            )
-
-        logger.debug(f"Retrieved event {event_id}")
-
-        # Story P2-4.4: Populate correlated_events if event has correlation_group_id
-        correlated_events = None
-        if event.correlation_group_id:
-            # Find all events in the same correlation group, excluding this event
-            related_events = db.query(Event).filter(
-                Event.correlation_group_id == event.correlation_group_id,
-                Event.id != event_id
-            ).all()
-
-            if related_events:
-                correlated_events = []
-                for related in related_events:
-                    # Get camera name
-                    camera = db.query(Camera).filter(Camera.id == related.camera_id).first()
-                    camera_name = camera.name if camera else f"Camera {related.camera_id[:8]}"
-
-                    # Build thumbnail URL
-                    thumbnail_url = None
-                    if related.thumbnail_path:
-                        thumbnail_url = f"/api/v1/thumbnails/{related.thumbnail_path}"
-
-                    correlated_events.append(CorrelatedEventResponse(
-                        id=related.id,
-                        camera_name=camera_name,
-                        thumbnail_url=thumbnail_url,
-                        timestamp=related.timestamp
-                    ))
-
-        # FF-003: Get camera name for this event
-        event_camera = db.query(Camera).filter(Camera.id == event.camera_id).first()
-        event_camera_name = event_camera.name if event_camera else f"Camera {event.camera_id[:8]}"
-
-        # Convert to dict and add correlated_events
-        event_dict = {
-            "id": event.id,
-            "camera_id": event.camera_id,
-            "camera_name": event_camera_name,
-            "timestamp": event.timestamp,
-            "description": event.description,
-            "confidence": event.confidence,
-            "objects_detected": event.objects_detected,
-            "thumbnail_path": event.thumbnail_path,
-            "thumbnail_base64": event.thumbnail_base64,
-            "alert_triggered": event.alert_triggered,
-            "source_type": event.source_type,
-            "protect_event_id": event.protect_event_id,
-            "smart_detection_type": event.smart_detection_type,
-            "is_doorbell_ring": event.is_doorbell_ring,
-            "created_at": event.created_at,
-            "correlation_group_id": event.correlation_group_id,
-            "correlated_events": correlated_events,
-            "provider_used": event.provider_used,
-            "fallback_reason": event.fallback_reason,
-            "analysis_mode": event.analysis_mode,
-            "frame_count_used": event.frame_count_used,
-            "audio_transcription": getattr(event, 'audio_transcription', None),
-            "ai_confidence": event.ai_confidence,
-            "low_confidence": event.low_confidence,
-            "vague_reason": event.vague_reason,
-            "reanalyzed_at": event.reanalyzed_at,
-            "reanalysis_count": event.reanalysis_count or 0,
-            # Story P7-2.1: Delivery carrier detection
-            "delivery_carrier": getattr(event, 'delivery_carrier', None),
-            # Story P15-5.1: AI Visual Annotations
-            "has_annotations": getattr(event, 'has_annotations', False),
-            "bounding_boxes": getattr(event, 'bounding_boxes', None),
-            "annotated_thumbnail_path": _get_annotated_thumbnail_path(event),
-        }
+        event_dict = _load_event_detail(db, event_id)
 
         # Story P4-3.3: Add matched entity if available (AC12)
         try:
             entity_service = container.entity_service
-            entity_data = await entity_service.get_entity_for_event(db, event_id)
+            entity_data = entity_service.get_entity_for_event(db, event_id)
             if entity_data:
                 event_dict["matched_entity"] = MatchedEntitySummary(
                     id=entity_data["id"],
@@ -1603,10 +1584,6 @@ async def get_event(
         except Exception as entity_error:
             logger.debug(f"Could not get entity for event {event_id}: {entity_error}")
 
-        # Story P4-5.1: Add feedback if exists
-        if event.feedback:
-            event_dict["feedback"] = FeedbackResponse.model_validate(event.feedback)
-
         return EventResponse(**event_dict)
 
     except HTTPException:
@@ -1619,6 +1596,108 @@ async def get_event(
         )
 
 
+def _load_event_detail(db: Session, event_id: str) -> dict:
+    """
+    Load an event and its related rows into the get_event response dict.
+
+    Raises:
+        HTTPException 404: Event not found
+    """
+    from app.schemas.event import CorrelatedEventResponse
+
+    event = db.query(Event).filter(Event.id == event_id).first()
+
+    if not event:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Event {event_id} not found"
+        )
+
+    logger.debug(f"Retrieved event {event_id}")
+
+    # Story P2-4.4: Populate correlated_events if event has correlation_group_id
+    correlated_events = None
+    if event.correlation_group_id:
+        # Find all events in the same correlation group, excluding this event
+        related_events = db.query(Event).filter(
+            Event.correlation_group_id == event.correlation_group_id,
+            Event.id != event_id
+        ).all()
+
+        if related_events:
+            correlated_events = []
+            for related in related_events:
+                # Get camera name
+                camera = db.query(Camera).filter(Camera.id == related.camera_id).first()
+                camera_name = camera.name if camera else f"Camera {related.camera_id[:8]}"
+
+                # Build thumbnail URL
+                thumbnail_url = None
+                if related.thumbnail_path:
+                    thumbnail_url = f"/api/v1/thumbnails/{related.thumbnail_path}"
+                elif related.thumbnail_hash:
+                    thumbnail_url = _get_thumbnail_path(related)
+
+                correlated_events.append(CorrelatedEventResponse(
+                    id=related.id,
+                    camera_name=camera_name,
+                    thumbnail_url=thumbnail_url,
+                    timestamp=related.timestamp
+                ))
+
+    # FF-003: Get camera name for this event
+    event_camera = db.query(Camera).filter(Camera.id == event.camera_id).first()
+    event_camera_name = event_camera.name if event_camera else f"Camera {event.camera_id[:8]}"
+
+    # Convert to dict and add correlated_events
+    event_dict = {
+        "id": event.id,
+        "camera_id": event.camera_id,
+        "camera_name": event_camera_name,
+        "timestamp": event.timestamp,
+        "description": event.description,
+        "confidence": event.confidence,
+        "objects_detected": event.objects_detected,
+        "thumbnail_path": _get_thumbnail_path(event),
+        "thumbnail_base64": None,
+        "key_frame_urls": [
+            f"/api/v1/events/{event.id}/key-frames/{index}.jpg"
+            for index in range(len(event.key_frame_digests))
+        ] or None,
+        "frame_timestamps": event.frame_timestamps,
+        "alert_triggered": event.alert_triggered,
+        "source_type": event.source_type,
+        "protect_event_id": event.protect_event_id,
+        "smart_detection_type": event.smart_detection_type,
+        "is_doorbell_ring": event.is_doorbell_ring,
+        "created_at": event.created_at,
+        "correlation_group_id": event.correlation_group_id,
+        "correlated_events": correlated_events,
+        "provider_used": event.provider_used,
+        "fallback_reason": event.fallback_reason,
+        "analysis_mode": event.analysis_mode,
+        "frame_count_used": event.frame_count_used,
+        "audio_transcription": getattr(event, 'audio_transcription', None),
+        "ai_confidence": event.ai_confidence,
+        "low_confidence": event.low_confidence,
+        "vague_reason": event.vague_reason,
+        "reanalyzed_at": event.reanalyzed_at,
+        "reanalysis_count": event.reanalysis_count or 0,
+        # Story P7-2.1: Delivery carrier detection
+        "delivery_carrier": getattr(event, 'delivery_carrier', None),
+        # Story P15-5.1: AI Visual Annotations
+        "has_annotations": getattr(event, 'has_annotations', False),
+        "bounding_boxes": getattr(event, 'bounding_boxes', None),
+        "annotated_thumbnail_path": _get_annotated_thumbnail_path(event),
+    }
+
+    # Story P4-5.1: Add feedback if exists
+    if event.feedback:
+        event_dict["feedback"] = FeedbackResponse.model_validate(event.feedback)
+
+    return event_dict
+
+
 @router.post("/{event_id}/reanalyze", response_model=EventResponse)
 async def reanalyze_event(
     event_id: str,
@@ -1964,8 +2043,8 @@ async def reanalyze_event(
             description=event.description,
             confidence=event.confidence,
             objects_detected=json.loads(event.objects_detected) if isinstance(event.objects_detected, str) else event.objects_detected,
-            thumbnail_path=event.thumbnail_path,
-            thumbnail_base64=event.thumbnail_base64,
+            thumbnail_path=_get_thumbnail_path(event),
+            thumbnail_base64=None,
             alert_triggered=event.alert_triggered,
             source_type=event.source_type,
             protect_event_id=event.protect_event_id,
@@ -2305,7 +2384,7 @@ def get_event_stats(
     camera_id: Optional[str] = Query(None, description="Filter by camera UUID"),
     start_time: Optional[datetime] = Query(None, description="Start of time range"),
     end_time: Optional[datetime] = Query(None, description="End of time range"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_read_db)
 ):
     """
     Get event statistics and aggregations
@@ -2478,6 +2557,7 @@ async def create_feedback(
         db.add(feedback)
         db.commit()
         db.refresh(feedback)
+        container.mcp_context_provider.invalidate_feedback(event.camera_id)
 
         logger.info(
             f"Created feedback for event {event_id}: rating={feedback_data.rating}, camera_id={event.camera_id}",
@@ -2598,6 +2678,7 @@ async def update_feedback(
 
         db.commit()
         db.refresh(feedback)
+        container.mcp_context_provider.invalidate_feedback(event.camera_id)
 
         logger.info(
             f"Updated feedback for event {event_id}",
@@ -2657,6 +2738,7 @@ async def delete_feedback(
 
         db.delete(feedback)
         db.commit()
+        container.mcp_context_provider.invalidate_feedback(event.camera_id)
 
         logger.info(f"Deleted feedback for event {event_id}")
 
@@ -3085,6 +3167,213 @@ async def download_event_video(
         )
 
 
+def _load_event_thumbnail_bytes(event: Event) -> bytes:
+    """
+    Load an event's thumbnail JPEG from the media store or thumbnail_path.
+
+    Raises:
+        HTTPException: 404 if the event has no readable thumbnail, 400 on an
+            unsafe path, 500 if reading fails
+    """
+    # Check for thumbnail
+    if not event.thumbnail_path and not event.thumbnail_hash:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Event has no thumbnail"
+        )
+
+    # Get thumbnail bytes
+    thumbnail_bytes = None
+
+    if event.thumbnail_hash:
+        thumbnail_bytes = container.media_store.read(event.thumbnail_hash)
+        if thumbnail_bytes is None:
+            logger.warning(
+                f"Media store blob missing for event thumbnail {event.thumbnail_hash}",
+                extra={"event_id": event.id}
+            )
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Thumbnail file not found"
+            )
+
+    elif event.thumbnail_path:
+        # Load from filesystem
+        thumb_path = _normalize_thumbnail_path(event.thumbnail_path)
+
+        # Security: Prevent path traversal
+        if ".." in thumb_path:
+            logger.warning(
+                "Path traversal attempt in thumbnail path",
+                extra={"event_id": event.id, "path": thumb_path}
+            )
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid thumbnail path"
+            )
+
+        thumbnail_file = os.path.join(THUMBNAIL_DIR, thumb_path)
+
+        if not os.path.exists(thumbnail_file):
+            logger.warning(
+                f"Thumbnail file not found: {thumbnail_file}",
+                extra={"event_id": event.id}
+            )
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Thumbnail file not found"
+            )
+
+        try:
+            with open(thumbnail_file, "rb") as f:
+                thumbnail_bytes = f.read()
+        except Exception as e:
+            logger.error(f"Failed to read thumbnail file for event {event.id}: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail="Failed to read thumbnail"
+            )
+
+    if not thumbnail_bytes:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Unable to retrieve thumbnail"
+        )
+
+    return thumbnail_bytes
+
+
+
+@router.get(
+    "/{event_id}/thumbnail.jpg",
+    response_class=Response,
+    responses={
+        200: {"content": {"image/jpeg": {}}, "description": "Thumbnail image"},
+        304: {"description": "Client copy is current"},
+        404: {"description": "Event or thumbnail not found"},
+    },
+)
+async def get_event_thumbnail_image(
+    event_id: str,
+    request: Request,
+    db: Session = Depends(get_read_db),
+):
+    """
+    Get an event thumbnail as raw image/jpeg.
+
+    Binary alternative to the thumbnail_base64 field for lists and galleries.
+    Decoded thumbnails are shared through the JPEG cache, and responses carry
+    ETag/Last-Modified so revalidation returns 304 without a body. The query
+    and the file/media store read run in a worker thread, off the event loop.
+
+    Args:
+        event_id: Event UUID
+        db: Database session
+
+    Returns:
+        JPEG bytes, or 304 Not Modified
+
+    Raises:
+        404: Event or thumbnail not found
+    """
+    event = await asyncio.to_thread(
+        lambda: db.query(Event).filter(Event.id == event_id).first()
+    )
+    if not event:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Event {event_id} not found"
+        )
+
+    # Thumbnails are written once per event; the source identifies the version
+    version = event.thumbnail_path or event.thumbnail_hash
+
+    async def _load() -> bytes:
+        return await asyncio.to_thread(_load_event_thumbnail_bytes, event)
+
+    entry = await container.jpeg_cache.get_or_encode(
+        (f"event:{event.id}", version, "thumbnail"),
+        _load,
+        last_modified=event.created_at,
+    )
+
+    return jpeg_response(request, entry, cache_control="private, max-age=86400")
+
+
+@router.get(
+    "/{event_id}/key-frames/{index}.jpg",
+    response_class=Response,
+    responses={
+        200: {"content": {"image/jpeg": {}}, "description": "Key frame image"},
+        304: {"description": "Client copy is current"},
+        404: {"description": "Event or key frame not found"},
+    },
+)
+async def get_event_key_frame_image(
+    event_id: str,
+    index: int,
+    request: Request,
+    db: Session = Depends(get_db),
+):
+    """
+    Stream one key frame of an event's gallery as image/jpeg.
+
+    Frames are read from the content-addressed media store in chunks; the
+    blob digest doubles as a strong ETag, so revalidation is a 304.
+
+    Args:
+        event_id: Event UUID
+        index: Zero-based position in the key frame gallery
+        db: Database session
+
+    Returns:
+        JPEG stream, or 304 Not Modified
+
+    Raises:
+        404: Event or key frame not found
+    """
+    event = db.query(Event).filter(Event.id == event_id).first()
+    if not event:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Event {event_id} not found"
+        )
+
+    digests = event.key_frame_digests
+    if index < 0 or index >= len(digests):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Key frame not found"
+        )
+
+    digest = digests[index]
+    etag = f'"{digest}"'
+    cache_control = "private, max-age=86400"
+    if is_not_modified(request, etag):
+        return not_modified_response(etag, cache_control=cache_control)
+
+    store = container.media_store
+    if not store.exists(digest):
+        logger.warning(
+            f"Media store blob missing for key frame {index} of event {event_id}",
+            extra={"event_id": event_id, "digest": digest}
+        )
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Key frame file not found"
+        )
+
+    return StreamingResponse(
+        store.iter_chunks(digest),
+        media_type="image/jpeg",
+        headers={
+            "ETag": etag,
+            "Cache-Control": cache_control,
+            "Content-Length": str(store.size_of(digest)),
+        },
+    )
+
+
 # =============================================================================
 # Story P11-2.6: Signed Thumbnail Endpoint for Push Notifications
 # =============================================================================
@@ -3169,75 +3458,7 @@ async def get_event_thumbnail_signed(
             detail=f"Event {event_id} not found"
         )
 
-    # Check for thumbnail
-    if not event.thumbnail_path and not event.thumbnail_base64:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Event has no thumbnail"
-        )
-
-    # Get thumbnail bytes
-    thumbnail_bytes = None
-
-    if event.thumbnail_base64:
-        # Decode base64 thumbnail
-        try:
-            b64_str = event.thumbnail_base64
-            if b64_str.startswith("data:"):
-                # Strip data URI prefix
-                comma_idx = b64_str.find(",")
-                if comma_idx > 0:
-                    b64_str = b64_str[comma_idx + 1:]
-            thumbnail_bytes = base64.b64decode(b64_str)
-        except Exception as e:
-            logger.error(f"Failed to decode base64 thumbnail for event {event_id}: {e}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to decode thumbnail"
-            )
-
-    elif event.thumbnail_path:
-        # Load from filesystem
-        thumb_path = _normalize_thumbnail_path(event.thumbnail_path)
-
-        # Security: Prevent path traversal
-        if ".." in thumb_path:
-            logger.warning(
-                "Path traversal attempt in thumbnail path",
-                extra={"event_id": event_id, "path": thumb_path}
-            )
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Invalid thumbnail path"
-            )
-
-        thumbnail_file = os.path.join(THUMBNAIL_DIR, thumb_path)
-
-        if not os.path.exists(thumbnail_file):
-            logger.warning(
-                f"Thumbnail file not found: {thumbnail_file}",
-                extra={"event_id": event_id}
-            )
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail="Thumbnail file not found"
-            )
-
-        try:
-            with open(thumbnail_file, "rb") as f:
-                thumbnail_bytes = f.read()
-        except Exception as e:
-            logger.error(f"Failed to read thumbnail file for event {event_id}: {e}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to read thumbnail"
-            )
-
-    if not thumbnail_bytes:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Unable to retrieve thumbnail"
-        )
+    thumbnail_bytes = _load_event_thumbnail_bytes(event)
 
     logger.debug(
         "Serving signed thumbnail",
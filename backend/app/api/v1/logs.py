@@ -6,7 +6,6 @@ Endpoints for querying and downloading application logs:
 - GET /api/v1/logs/download - Download log file for specific date
 """
 import os
-import json
 import logging
 from datetime import datetime, date
 from typing import Optional, List
@@ -14,6 +13,8 @@ from fastapi import APIRouter, HTTPException, status, Query
 from fastapi.responses import FileResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
+from app.core.log_index import INDEX_SUFFIX, LogFilter, LogQueryResult, query_log_entries
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(
@@ -49,6 +50,8 @@ class LogsResponse(BaseModel):
     limit: int
     offset: int
     has_more: bool
+    # False when the scan stopped after this page; total is then a lower bound
+    total_exact: bool = True
 
 
 class LogFilesResponse(BaseModel):
@@ -57,83 +60,6 @@ class LogFilesResponse(BaseModel):
     directory: str
 
 
-def _parse_log_line(line: str) -> Optional[dict]:
-    """
-    Parse a single JSON log line.
-
-    Args:
-        line: Raw log line from file
-
-    Returns:
-        Parsed log entry dict or None if parse fails
-    """
-    line = line.strip()
-    if not line:
-        return None
-
-    try:
-        return json.loads(line)
-    except json.JSONDecodeError:
-        # Not a JSON log line, skip
-        return None
-
-
-def _matches_filters(
-    entry: dict,
-    level: Optional[str],
-    module: Optional[str],
-    search: Optional[str],
-    start_date: Optional[date],
-    end_date: Optional[date]
-) -> bool:
-    """
-    Check if log entry matches filter criteria.
-
-    Args:
-        entry: Parsed log entry
-        level: Filter by log level
-        module: Filter by module name
-        search: Search text in message
-        start_date: Filter entries on or after this date
-        end_date: Filter entries on or before this date
-
-    Returns:
-        True if entry matches all filters
-    """
-    # Level filter
-    if level:
-        entry_level = entry.get('level', '').upper()
-        if entry_level != level.upper():
-            return False
-
-    # Module filter
-    if module:
-        entry_module = entry.get('module', '') or entry.get('logger', '')
-        if module.lower() not in entry_module.lower():
-            return False
-
-    # Search filter
-    if search:
-        message = entry.get('message', '')
-        if search.lower() not in message.lower():
-            return False
-
-    # Date filters
-    if start_date or end_date:
-        timestamp = entry.get('timestamp', '')
-        if timestamp:
-            try:
-                entry_date = datetime.fromisoformat(timestamp.replace('Z', '+00:00')).date()
-                if start_date and entry_date < start_date:
-                    return False
-                if end_date and entry_date > end_date:
-                    return False
-            except ValueError:
-                pass  # Can't parse timestamp, skip date filter
-
-    return True
-
-
 def _read_log_entries(
     level: Optional[str] = None,
     module: Optional[str] = None,
@@ -141,10 +67,11 @@ def _read_log_entries(
     start_date: Optional[date] = None,
     end_date: Optional[date] = None,
     limit: int = 100,
-    offset: int = 0
-) -> tuple[List[dict], int]:
+    offset: int = 0,
+    exact_total: bool = False
+) -> LogQueryResult:
     """
-    Read and filter log entries from log files.
+    Read one newest-first page of filtered entries from app.log and its backups.
 
     Args:
         level: Filter by log level
@@ -154,37 +81,24 @@ def _read_log_entries(
         end_date: Filter entries on or before this date
         limit: Maximum entries to return
         offset: Number of entries to skip
+        exact_total: Count every match instead of stopping after the page
 
     Returns:
-        Tuple of (list of matching entries, total count)
+        LogQueryResult with the page and the (possibly partial) match count
     """
-    entries = []
-    log_file = os.path.join(LOG_DIR, 'app.log')
-
-    if not os.path.exists(log_file):
-        return [], 0
-
-    # Read all entries (in reverse order - newest first)
-    all_entries = []
-    try:
-        with open(log_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                entry = _parse_log_line(line)
-                if entry and _matches_filters(entry, level, module, search, start_date, end_date):
-                    all_entries.append(entry)
-    except Exception as e:
-        logger.error(f"Error reading log file: {e}")
-        return [], 0
-
-    # Reverse to get newest first
-    all_entries.reverse()
-
-    total = len(all_entries)
-
-    # Apply pagination
-    entries = all_entries[offset:offset + limit]
-
-    return entries, total
+    return query_log_entries(
+        LOG_DIR,
+        LogFilter(
+            level=level,
+            module=module,
+            search=search,
+            start_date=start_date,
+            end_date=end_date,
+        ),
+        limit=limit,
+        offset=offset,
+        exact_total=exact_total,
+    )
 
 
 @router.get("", response_model=LogsResponse)
@@ -219,6 +133,10 @@ async def get_logs(
         0,
         ge=0,
         description="Number of entries to skip"
+    ),
+    exact_total: bool = Query(
+        False,
+        description="Count every matching entry (scans all log files)"
     )
 ):
     """
@@ -230,7 +148,10 @@ async def get_logs(
     - Search text in messages
     - Date range
 
-    Results are returned in reverse chronological order (newest first).
+    Results are returned in reverse chronological order (newest first),
+    across app.log and its rotated backups. The scan stops once the page (and
+    one extra entry for `has_more`) is found, so `total` is a lower bound
+    unless `total_exact` is true; pass `exact_total=true` to count everything.
 
     **Example:**
     ```
@@ -246,24 +167,26 @@ async def get_logs(
         "total": 150,
         "limit": 100,
         "offset": 0,
-        "has_more": true
+        "has_more": true,
+        "total_exact": false
     }
     ```
     """
     try:
-        entries, total = _read_log_entries(
+        result = _read_log_entries(
             level=level,
             module=module,
             search=search,
             start_date=start_date,
             end_date=end_date,
             limit=limit,
-            offset=offset
+            offset=offset,
+            exact_total=exact_total
         )
 
         # Convert to LogEntry models
         log_entries = []
-        for entry in entries:
+        for entry in result.entries:
             # Extract known fields
             known_fields = {'timestamp', 'level', 'message', 'module', 'logger', 'request_id', 'function', 'line'}
             extra = {k: v for k, v in entry.items() if k not in known_fields}
@@ -282,10 +205,11 @@ async def get_logs(
 
         return LogsResponse(
             entries=log_entries,
-            total=total,
+            total=result.total,
             limit=limit,
             offset=offset,
-            has_more=(offset + limit) < total
+            has_more=result.has_more,
+            total_exact=result.total_exact
         )
 
     except Exception as e:
@@ -379,7 +303,7 @@ async def list_log_files():
 
         files = [
             f for f in os.listdir(LOG_DIR)
-            if f.endswith('.log') or '.log.' in f
+            if (f.endswith('.log') or '.log.' in f) and not f.endswith(INDEX_SUFFIX)
         ]
         files.sort()
 
@@ -319,6 +319,33 @@ if settings.DEBUG_ENDPOINTS_ENABLED:
             "note": "These are lightweight in-memory counters. Use Prometheus (/metrics) for long-term observability.",
         }
 
+    @router.get("/debug/startup-profile", include_in_schema=False)
+    def debug_startup_profile(
+        request: Request,
+        top: int = Query(25, ge=1, le=500, description="Number of slowest imports to return"),
+        current_user: User = Depends(require_debug_access),
+    ):
+        """Debug endpoint returning the startup timing report.
+
+        Per-import (cumulative and self) durations recorded while main.py
+        loaded, per-lifespan-phase durations, and which heavy provider/media
+        libraries are currently loaded.
+
+        Requires admin role + optional X-Debug-Token header.
+        """
+        from app.core.startup_profiler import startup_profiler
+
+        logger.info(
+            "Debug endpoint accessed: Startup profile",
+            extra={
+                "event_type": "debug_startup_profile_accessed",
+                "user_id": current_user.id,
+                "username": current_user.username,
+            },
+        )
+
+        return startup_profiler.get_report(top=top)
+
     @router.get("/debug/network", include_in_schema=False)
     def debug_network_test(request: Request, current_user: User = Depends(require_debug_access)):
         """Debug endpoint to test network connectivity from server context.
@@ -2071,6 +2098,16 @@ class AIProvidersStatusResponse(BaseModel):
     """Response listing all AI providers and their configuration status"""
     providers: List[AIProviderStatus] = Field(..., description="List of provider statuses")
     order: List[str] = Field(..., description="Provider order for fallback chain")
+    routing: Optional[dict] = Field(
+        None,
+        description="Latency-aware routing: per provider/model p50/p95 and error rate, "
+                    "hedging outcomes with their extra cost, and recent routing decisions",
+    )
+    image_payload: Optional[dict] = Field(
+        None,
+        description="Image payloads: bytes and estimated image tokens sent per provider, "
+                    "encodes reused across retries/fallbacks, frames cropped to motion",
+    )
 
 
 @router.get("/ai-providers", response_model=AIProvidersStatusResponse)
@@ -2090,7 +2127,19 @@ async def get_ai_providers_status(db: Session = Depends(get_db)):
             {"provider": "grok", "configured": false},
             {"provider": "anthropic", "configured": true},
             {"provider": "google", "configured": false}
-        ]
+        ],
+        "order": ["openai", "grok", "anthropic", "google"],
+        "routing": {
+            "enabled": true,
+            "hedging_enabled": false,
+            "providers": [{"provider": "openai", "model": "gpt-4o-mini", "p50_ms": 1800.0, ...}],
+            "hedging": {"fired": 0, "backup_won": 0, "extra_cost_usd": 0.0, ...},
+            "recent_decisions": [...]
+        },
+        "image_payload": {
+            "encodes": 120, "reused_encodes": 14, "cropped_frames": 80,
+            "by_provider": {"openai": {"requests": 120, "bytes_per_request": 41210, ...}}
+        }
     }
     ```
 
@@ -2133,7 +2182,12 @@ async def get_ai_providers_status(db: Session = Depends(get_db)):
         else:
             order = default_order
 
-        return AIProvidersStatusResponse(providers=providers, order=order)
+        return AIProvidersStatusResponse(
+            providers=providers,
+            order=order,
+            routing=container.ai_latency_router.get_status(),
+            image_payload=container.image_payload_optimizer.get_stats(),
+        )
 
     except Exception as e:
         logger.error(f"Error getting AI providers status: {e}", exc_info=True)
@@ -2143,6 +2197,30 @@ async def get_ai_providers_status(db: Session = Depends(get_db)):
         )
 
 
+class ClusterStatusResponse(BaseModel):
+    """Cluster membership and leadership as seen by the replica answering"""
+    enabled: bool = Field(..., description="Whether cluster mode is enabled")
+    instance_id: str = Field(..., description="Id of the replica that answered")
+    is_leader: bool = Field(..., description="Whether this replica runs the singleton scheduled jobs")
+    leader_id: Optional[str] = Field(None, description="Replica holding the scheduler lease")
+    members: List[str] = Field(..., description="Live replicas")
+    pubsub_backend: Optional[str] = Field(None, description="Cross-replica pub/sub backend")
+    messages_published: int = Field(0, description="Messages sent to other replicas")
+    messages_received: int = Field(0, description="Messages received from other replicas")
+    rebalances: int = Field(0, description="Shard reconciliations that moved cameras or controllers")
+
+
+@router.get("/cluster", response_model=ClusterStatusResponse)
+async def get_cluster_status():
+    """
+    Get cluster membership, the current leader and pub/sub counters.
+
+    With cluster mode disabled the replica reports itself as the only
+    member and leader.
+    """
+    return ClusterStatusResponse(**container.cluster_service.get_status())
+
+
 # ============================================================================
 # AI Provider Stats API (Story P2-5.3)
 # ============================================================================
@@ -2312,9 +2390,8 @@ async def get_ai_usage(
     - 400: Invalid date format
     - 500: Internal server error
     """
-    from app.models.event import Event
     from app.models.camera import Camera
-    from sqlalchemy import func, cast, Date
+    from app.services.ai_cost_and_usage_tracker import get_ai_cost_and_usage_tracker
 
     try:
         # Parse date range (default: last 30 days)
@@ -2341,64 +2418,44 @@ async def get_ai_usage(
         else:
             start_dt = now - timedelta(days=30)
 
-        # Base query with date filter
-        base_query = db.query(AIUsage).filter(
-            AIUsage.timestamp >= start_dt,
-            AIUsage.timestamp <= end_dt
-        )
-
-        # Get all records for aggregation
-        records = base_query.all()
-
-        # Calculate totals
-        total_cost = sum(r.cost_estimate or 0.0 for r in records)
-        total_requests = len(records)
-
-        # Aggregate by date
-        by_date_dict = {}
-        for r in records:
-            date_key = r.timestamp.strftime("%Y-%m-%d")
-            if date_key not in by_date_dict:
-                by_date_dict[date_key] = {"cost": 0.0, "requests": 0}
-            by_date_dict[date_key]["cost"] += r.cost_estimate or 0.0
-            by_date_dict[date_key]["requests"] += 1
+        # Served from the tracker's in-memory hourly rollups (no ai_usage scan)
+        tracker = get_ai_cost_and_usage_tracker()
+        usage = tracker.get_usage_rollup(start_dt, end_dt, db=db)
+        total_cost = usage["total_cost"]
+        total_requests = usage["total_requests"]
 
         by_date = [
             AIUsageByDate(date=date, cost=data["cost"], requests=data["requests"])
-            for date, data in sorted(by_date_dict.items(), reverse=True)
+            for date, data in sorted(usage["by_date"].items(), reverse=True)
         ]
 
-        # Aggregate by provider
-        by_provider_dict = {}
-        for r in records:
-            provider = r.provider or "unknown"
-            if provider not in by_provider_dict:
-                by_provider_dict[provider] = {"cost": 0.0, "requests": 0}
-            by_provider_dict[provider]["cost"] += r.cost_estimate or 0.0
-            by_provider_dict[provider]["requests"] += 1
-
         by_provider = [
             AIUsageByProvider(provider=provider, cost=data["cost"], requests=data["requests"])
-            for provider, data in sorted(by_provider_dict.items(), key=lambda x: x[1]["cost"], reverse=True)
+            for provider, data in sorted(usage["by_provider"].items(), key=lambda x: x[1]["cost"], reverse=True)
         ]
 
-        # Aggregate by analysis mode
-        by_mode_dict = {}
-        for r in records:
-            mode = r.analysis_mode or "unknown"
-            if mode not in by_mode_dict:
-                by_mode_dict[mode] = {"cost": 0.0, "requests": 0}
-            by_mode_dict[mode]["cost"] += r.cost_estimate or 0.0
-            by_mode_dict[mode]["requests"] += 1
-
         by_mode = [
             AIUsageByMode(mode=mode, cost=data["cost"], requests=data["requests"])
-            for mode, data in sorted(by_mode_dict.items(), key=lambda x: x[1]["cost"], reverse=True)
+            for mode, data in sorted(usage["by_mode"].items(), key=lambda x: x[1]["cost"], reverse=True)
         ]
 
-        # Note: AIUsage doesn't have camera_id directly - we'd need to join through Event
-        # For now, return empty list for by_camera (can be implemented if Event-AIUsage link exists)
-        by_camera = []
+        # Only usage recorded with camera attribution appears here
+        camera_names = {}
+        if usage["by_camera"]:
+            camera_names = dict(
+                db.query(Camera.id, Camera.name)
+                .filter(Camera.id.in_(list(usage["by_camera"])))
+                .all()
+            )
+        by_camera = [
+            AIUsageByCamera(
+                camera_id=camera_id,
+                camera_name=camera_names.get(camera_id, "Deleted camera"),
+                cost=data["cost"],
+                requests=data["requests"],
+            )
+            for camera_id, data in sorted(usage["by_camera"].items(), key=lambda x: x[1]["cost"], reverse=True)
+        ]
 
         return AIUsageResponse(
             total_cost=round(total_cost, 6),
@@ -1,7 +1,7 @@
 """Application configuration using Pydantic Settings"""
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import field_validator
-from typing import List, Optional
+from typing import Dict, List, Optional
 from pathlib import Path
 from cryptography.fernet import Fernet
 import os
@@ -23,6 +23,139 @@ class Settings(BaseSettings):
     DB_POOL_RECYCLE: int = 1800  # seconds; recycle connections older than 30 min
     DB_POOL_PRE_PING: bool = True
 
+    # SQLite production profile (ignored for PostgreSQL). Pragmas are applied to
+    # every new connection; WAL lets readers proceed while the writer commits.
+    SQLITE_JOURNAL_MODE: str = "WAL"
+    SQLITE_SYNCHRONOUS: str = "NORMAL"  # durable at checkpoint; safe with WAL
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_CACHE_SIZE_KB: int = 65536  # per connection page cache
+    SQLITE_MMAP_SIZE_MB: int = 256
+    SQLITE_READ_POOL_SIZE: int = 8  # read-only (query_only) connections for heavy GETs
+    # Route hot-path writes (events, embeddings, motion events, last-seen) through
+    # one writer thread that group-commits them instead of contending for the lock
+    SQLITE_SINGLE_WRITER: bool = True
+    SQLITE_WRITER_BATCH_SIZE: int = 64
+    SQLITE_WRITER_BATCH_WAIT_MS: int = 5
+
+    # Post-processing graph (push, MQTT, HomeKit, embeddings, ...) run after an
+    # event is stored. Independent stages run concurrently within this budget.
+    POST_PROCESSING_MAX_CONCURRENCY: int = 4
+    POST_PROCESSING_STAGE_TIMEOUT_SECONDS: float = 10.0
+    # Per-stage overrides as "stage=seconds" pairs (stored as string to avoid
+    # pydantic-settings JSON parsing; use post_processing_stage_timeouts).
+    # Detections run face/vehicle inference and matching, so they get longer.
+    POST_PROCESSING_STAGE_TIMEOUTS: str = "detections=30,entity_alerts=15,audio_enrichment=15"
+
+    @property
+    def post_processing_stage_timeouts(self) -> Dict[str, float]:
+        """Parse POST_PROCESSING_STAGE_TIMEOUTS into {stage: seconds}"""
+        timeouts = {}
+        for pair in self.POST_PROCESSING_STAGE_TIMEOUTS.split(","):
+            name, sep, seconds = pair.partition("=")
+            if sep and name.strip():
+                timeouts[name.strip()] = float(seconds)
+        return timeouts
+
+    # Face/vehicle detection (DetectionService). Detectors run on their own
+    # bounded pool so SSD inference never competes with the default executor;
+    # OpenCV's internal thread count is pinned to avoid oversubscription.
+    DETECTION_WORKERS: int = 2
+    DETECTION_OPENCV_THREADS: int = 2
+    DETECTION_MAX_BATCH: int = 8  # frames per network call
+
+    # Overlay OCR. Each camera's overlay position is learned on the first match
+    # and only that region is re-read; unchanged crops (perceptual hash within
+    # OCR_OVERLAY_HASH_DISTANCE bits, byte-identical once a timestamp was read)
+    # skip tesseract entirely.
+    OCR_PROBE_WORKERS: int = 4  # corner regions OCRed in parallel when probing
+    OCR_OVERLAY_HASH_DISTANCE: int = 2
+    OCR_PROFILE_MAX_MISSES: int = 3  # forget a profile after this many misses
+
+    # AI description dedup cache (off by default). A frame within
+    # DESCRIPTION_CACHE_WINDOW_SECONDS of an analyzed frame from the same camera,
+    # with a frame hash within DESCRIPTION_CACHE_HASH_DISTANCE bits, a CLIP
+    # embedding cosine >= DESCRIPTION_CACHE_MIN_SIMILARITY and the same prompt
+    # context and matched entities, reuses the earlier description instead of
+    # calling a provider. Frames with OCR overlay text are never cached.
+    # Cameras can opt out individually (Camera.description_cache_enabled).
+    DESCRIPTION_CACHE_ENABLED: bool = False
+    DESCRIPTION_CACHE_WINDOW_SECONDS: float = 60.0
+    DESCRIPTION_CACHE_HASH_DISTANCE: int = 6  # of 64 bits
+    DESCRIPTION_CACHE_MIN_SIMILARITY: float = 0.97
+    DESCRIPTION_CACHE_MAX_ENTRIES: int = 8  # analyzed frames kept per camera
+
+    # Provider routing (VisionAnalysisOrchestrator). Measured providers are
+    # ordered by p50 latency / success rate over AI_LATENCY_WINDOW_SECONDS;
+    # those above AI_ROUTING_MAX_COST_PER_CALL_USD (0 = no budget) go last.
+    # With hedging on, a call running past its provider's p95 is raced against
+    # the next provider and the loser is cancelled.
+    AI_LATENCY_ROUTING_ENABLED: bool = True
+    AI_LATENCY_WINDOW_SECONDS: float = 900.0
+    AI_LATENCY_MIN_SAMPLES: int = 5
+    AI_ROUTING_MAX_COST_PER_CALL_USD: float = 0.0
+    AI_HEDGING_ENABLED: bool = False
+    AI_HEDGE_MIN_DELAY_MS: float = 500.0
+    # OpenAI-compatible endpoint for the LiteLLM path, e.g. the local stand-in
+    # (app.services.ai_providers.local_provider) when load testing
+    AI_OPENAI_API_BASE: Optional[str] = None
+
+    # Image payloads (ImagePayloadOptimizer). Frames are sized per provider from
+    # its image/tiling rules, shrunk to a tile boundary when that costs at most
+    # AI_IMAGE_TILE_SNAP_TOLERANCE of the scale, capped at
+    # AI_IMAGE_MAX_TOKENS_PER_IMAGE estimated tokens (0 = no cap) and, with
+    # AI_IMAGE_ROI_CROP_ENABLED, cropped to the motion box plus
+    # AI_IMAGE_ROI_PADDING context. Only RTSP/USB motion events carry a box;
+    # Protect events are always sent uncropped.
+    AI_IMAGE_OPTIMIZATION_ENABLED: bool = True
+    AI_IMAGE_ROI_CROP_ENABLED: bool = False
+    AI_IMAGE_ROI_PADDING: float = 0.5  # fraction of the box size per side
+    AI_IMAGE_TILE_SNAP_TOLERANCE: float = 0.2
+    AI_IMAGE_MAX_TOKENS_PER_IMAGE: int = 0
+    AI_IMAGE_JPEG_QUALITY: int = 85
+
+    # Cluster mode (ClusterService). Replicas sharing one database register in
+    # cluster_members; cameras and Protect controllers are sharded across live
+    # members by consistent hashing, singleton scheduler jobs run only on the
+    # holder of the "scheduler" lease, and WebSocket broadcasts and cache
+    # invalidations fan out over CLUSTER_PUBSUB_BACKEND ("auto" = PostgreSQL
+    # LISTEN/NOTIFY on PostgreSQL, polling cluster_messages otherwise).
+    CLUSTER_MODE_ENABLED: bool = False
+    CLUSTER_INSTANCE_ID: Optional[str] = None  # default: <hostname>-<pid>
+    CLUSTER_HEARTBEAT_SECONDS: float = 5.0
+    CLUSTER_MEMBER_TTL_SECONDS: float = 20.0
+    CLUSTER_LEASE_SECONDS: float = 30.0
+    CLUSTER_SHARD_VNODES: int = 64
+    CLUSTER_PUBSUB_BACKEND: str = "auto"  # auto | postgres | database | local
+    CLUSTER_PUBSUB_POLL_SECONDS: float = 0.5
+
+    # Embedding backfill (POST /context/embeddings/batch). Events missing an
+    # embedding are embedded in CLIP batches of EMBEDDING_BACKFILL_BATCH_SIZE,
+    # thumbnails decoded on EMBEDDING_BACKFILL_DECODE_WORKERS threads, paced to
+    # EMBEDDING_BACKFILL_MAX_EVENTS_PER_SECOND (0 = unlimited) so live traffic
+    # keeps the CPU and the database writer.
+    EMBEDDING_BACKFILL_BATCH_SIZE: int = 32
+    EMBEDDING_BACKFILL_DECODE_WORKERS: int = 4
+    EMBEDDING_BACKFILL_MAX_EVENTS_PER_SECOND: float = 20.0
+
+    # Protect media prefetch. A native event's snapshot and clip are fetched
+    # concurrently over the controller's existing client and the footage
+    # recorded so far is streamed to disk. Multi-frame analysis may opt into
+    # starting on the partial clip once it covers
+    # PROTECT_PREFETCH_PARTIAL_SECONDS; frames then only come from that prefix,
+    # so the default (0) waits for the full clip.
+    PROTECT_PREFETCH_ENABLED: bool = True
+    PROTECT_PREFETCH_MAX_CONCURRENCY: int = 2  # concurrent clip downloads per controller
+    PROTECT_PREFETCH_PARTIAL_SECONDS: float = 0.0  # of the 30s event clip
+    PROTECT_PREFETCH_PROBE_BYTES: int = 262144  # file growth between coverage probes
+
+    # Logging pipeline. Records are enqueued on a bounded queue (dropped and
+    # counted when full) and written by a background listener; DEBUG/INFO
+    # records are rate-limited per call site.
+    LOG_QUEUE_SIZE: int = 10000
+    LOG_SAMPLING_ENABLED: bool = True
+    LOG_SAMPLING_RATE_PER_SECOND: float = 20.0  # per call site, after the burst
+    LOG_SAMPLING_BURST: int = 100
+
     # Security
     ENCRYPTION_KEY: str  # Required - primary key used for new encryptions
     ENCRYPTION_KEY_PREVIOUS: Optional[str] = None  # Previous key (used for decryption during rotation)
@@ -1,8 +1,10 @@
 """Database connection and session management"""
-from contextlib import contextmanager
-from typing import Generator
+from contextlib import asynccontextmanager, contextmanager
+from typing import AsyncGenerator, Generator, Optional
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from app.core.config import settings
@@ -34,12 +36,115 @@ else:
         pool_timeout=settings.DB_POOL_TIMEOUT,
     )
 
+# In-memory SQLite databases are private to one connection, so the separate
+# reader/writer engines below would each see an empty database.
+_is_sqlite_file = _is_sqlite and make_url(settings.DATABASE_URL).database not in (None, "", ":memory:")
+
+
+def apply_sqlite_pragmas(dbapi_connection, query_only: bool = False) -> None:
+    """
+    Apply the SQLite production profile to a new DB-API connection.
+
+    WAL lets readers run alongside the single writer; busy_timeout makes
+    lock waits block briefly instead of failing with "database is locked";
+    synchronous=NORMAL is durable under WAL at a fraction of FULL's fsyncs;
+    cache_size and mmap_size keep hot pages out of the read() path.
+
+    Args:
+        dbapi_connection: Raw sqlite3 connection
+        query_only: Reject writes on this connection (read pool)
+    """
+    cursor = dbapi_connection.cursor()
+    try:
+        if _is_sqlite_file:
+            cursor.execute(f"PRAGMA journal_mode={settings.SQLITE_JOURNAL_MODE}")
+        cursor.execute(f"PRAGMA synchronous={settings.SQLITE_SYNCHRONOUS}")
+        cursor.execute(f"PRAGMA busy_timeout={int(settings.SQLITE_BUSY_TIMEOUT_MS)}")
+        # Negative cache_size is in KiB rather than pages
+        cursor.execute(f"PRAGMA cache_size=-{int(settings.SQLITE_CACHE_SIZE_KB)}")
+        cursor.execute(f"PRAGMA mmap_size={int(settings.SQLITE_MMAP_SIZE_MB) * 1024 * 1024}")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        if query_only:
+            cursor.execute("PRAGMA query_only=ON")
+    finally:
+        cursor.close()
+
+
 # Create SQLAlchemy engine
 engine = create_engine(settings.DATABASE_URL, **engine_kwargs)
 
+if _is_sqlite:
+    @event.listens_for(engine, "connect")
+    def _on_sqlite_connect(dbapi_connection, connection_record):
+        apply_sqlite_pragmas(dbapi_connection)
+
 # Session factory
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+
+def create_sqlite_read_engine(url: str, pool_size: int):
+    """
+    Engine for the read pool: query_only connections for heavy read
+    endpoints, so list and export queries never queue behind (or hold) the
+    write connection.
+    """
+    read_engine = create_engine(
+        url,
+        echo=settings.DEBUG,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        pool_size=pool_size,
+        max_overflow=pool_size,
+        connect_args={"check_same_thread": False},
+    )
+
+    @event.listens_for(read_engine, "connect")
+    def _on_sqlite_read_connect(dbapi_connection, connection_record):
+        apply_sqlite_pragmas(dbapi_connection, query_only=True)
+
+    return read_engine
+
+
+def create_sqlite_writer_engine(url: str):
+    """
+    Engine with the single connection owned by the DatabaseWriter thread.
+
+    The driver's implicit transaction handling is disabled so SQLAlchemy
+    emits BEGIN IMMEDIATE itself - the write lock is taken up front (no
+    deferred-lock upgrade deadlocks) and per-item SAVEPOINTs nest correctly.
+    """
+    writer_engine = create_engine(
+        url,
+        echo=settings.DEBUG,
+        pool_size=1,
+        max_overflow=0,
+        connect_args={"check_same_thread": False},
+    )
+
+    @event.listens_for(writer_engine, "connect")
+    def _on_sqlite_writer_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        apply_sqlite_pragmas(dbapi_connection)
+
+    @event.listens_for(writer_engine, "begin")
+    def _on_sqlite_writer_begin(conn):
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+    return writer_engine
+
+
+if _is_sqlite_file:
+    read_engine = create_sqlite_read_engine(settings.DATABASE_URL, settings.SQLITE_READ_POOL_SIZE)
+    writer_engine = create_sqlite_writer_engine(settings.DATABASE_URL)
+else:
+    # PostgreSQL handles concurrent writers itself; share the main pool
+    read_engine = engine
+    writer_engine = engine
+
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=read_engine)
+# Objects written by the writer thread are handed back detached, so they must
+# keep their loaded state after commit.
+WriterSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=writer_engine, expire_on_commit=False)
+
 # Base class for ORM models
 Base = declarative_base()
 
@@ -53,6 +158,20 @@ def get_db():
         db.close()
 
 
+def get_read_db():
+    """
+    Dependency for read-only FastAPI routes.
+
+    Sessions come from the query_only read pool on SQLite (the main pool on
+    PostgreSQL). Use only for handlers that never write.
+    """
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
 @contextmanager
 def get_db_session() -> Generator[Session, None, None]:
     """
@@ -81,3 +200,117 @@ def get_db_session() -> Generator[Session, None, None]:
         raise
     finally:
         db.close()
+
+
+# ---------------------------------------------------------------------------
+# Async engine (read-only lookups from the event pipeline)
+#
+# Writes never go through this engine: on SQLite they belong to the single
+# DatabaseWriter connection, so async connections are opened query_only and
+# PostgreSQL sessions are started READ ONLY.
+# ---------------------------------------------------------------------------
+
+# asyncio DBAPI drivers used in place of the sync ones
+ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "postgresql": "asyncpg",
+}
+
+_async_engine: Optional[AsyncEngine] = None
+_async_session_factory: Optional[async_sessionmaker] = None
+
+
+def to_async_url(url: str) -> str:
+    """
+    Swap the sync driver in a database URL for its asyncio counterpart.
+
+    ``sqlite:///data/app.db`` becomes ``sqlite+aiosqlite:///data/app.db``
+    and ``postgresql://...`` (or ``postgresql+psycopg2://``) becomes
+    ``postgresql+asyncpg://...``. URLs that already name an async driver
+    are returned unchanged.
+    """
+    parsed = make_url(url)
+    backend = parsed.get_backend_name()
+    driver = ASYNC_DRIVERS.get(backend)
+    if driver is None or parsed.get_driver_name() == driver:
+        return url
+    # Rewrite only the scheme so the rest of the URL is kept verbatim
+    return f"{backend}+{driver}{url[url.index(':'):]}"
+
+
+def create_async_db_engine(url: str, **kwargs) -> AsyncEngine:
+    """
+    Create a read-only AsyncEngine for a sync database URL.
+
+    SQLite connections get the same pragma profile as the read pool
+    (including query_only); PostgreSQL transactions are READ ONLY.
+
+    Args:
+        url: Sync database URL (as in settings.DATABASE_URL)
+        **kwargs: Extra create_async_engine arguments (e.g. poolclass)
+    """
+    engine_options = {"echo": settings.DEBUG, "pool_pre_ping": settings.DB_POOL_PRE_PING}
+    if not url.startswith("sqlite"):
+        engine_options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            max_overflow=settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            execution_options={"postgresql_readonly": True},
+        )
+    engine_options.update(kwargs)
+    async_engine = create_async_engine(to_async_url(url), **engine_options)
+
+    if url.startswith("sqlite"):
+        @event.listens_for(async_engine.sync_engine, "connect")
+        def _on_async_sqlite_connect(dbapi_connection, connection_record):
+            apply_sqlite_pragmas(dbapi_connection, query_only=True)
+
+    return async_engine
+
+
+def get_async_engine() -> AsyncEngine:
+    """Process-wide AsyncEngine, created on first use."""
+    global _async_engine
+    if _async_engine is None:
+        _async_engine = create_async_db_engine(settings.DATABASE_URL)
+    return _async_engine
+
+
+def get_async_session_factory() -> async_sessionmaker:
+    """Session factory bound to the process-wide AsyncEngine."""
+    global _async_session_factory
+    if _async_session_factory is None:
+        # expire_on_commit=False: attribute access after commit would need an
+        # implicit (sync) refresh, which AsyncSession cannot do
+        _async_session_factory = async_sessionmaker(
+            get_async_engine(), autoflush=False, expire_on_commit=False
+        )
+    return _async_session_factory
+
+
+async def dispose_async_engine() -> None:
+    """Close pooled async connections (application shutdown)."""
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    _async_engine = None
+    _async_session_factory = None
+
+
+@asynccontextmanager
+async def get_async_db_session() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Async counterpart of get_db_session for read-only lookups in the
+    event pipeline. Writes go through DatabaseWriter or get_db_session.
+
+    Usage:
+        async with get_async_db_session() as db:
+            event = await db.get(Event, event_id)
+    """
+    async with get_async_session_factory()() as db:
+        try:
+            yield db
+        except Exception:
+            await db.rollback()
+            raise
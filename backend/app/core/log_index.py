@@ -0,0 +1,476 @@
+"""
+Indexed Log Queries
+
+The /api/v1/logs endpoint used to JSON-parse every line of app.log, keep every
+match, reverse the list and slice out one page. This module replaces that with:
+
+- IndexedRotatingFileHandler: a RotatingFileHandler that records a sidecar
+  index (``app.log.idx``) while it writes. Every INDEX_BLOCK_LINES records
+  become one index line holding the block's byte range, first/last timestamp
+  and bitmaps of the levels and modules it contains. Sidecars rotate in step
+  with their log files (``app.log.1.idx``, ...).
+- query_log_entries: reads app.log and its rotated backups newest-first,
+  walking each file backwards through an mmap. Index blocks whose timestamps,
+  levels or modules cannot match are skipped without being read, cheap byte
+  checks reject most other lines before JSON parsing, and the scan stops once
+  ``offset + limit`` matches (plus one, for ``has_more``) are found.
+
+Byte ranges not covered by an index (older files, the block still being
+filled, a sidecar lost to a crash) are scanned like any other range, so the
+index only ever speeds queries up.
+"""
+import json
+import logging
+import logging.handlers
+import mmap
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+
+# Records per index block
+INDEX_BLOCK_LINES = 256
+
+# Sidecar suffix appended to each log file name
+INDEX_SUFFIX = ".idx"
+
+LEVEL_BITS = {
+    "DEBUG": 1,
+    "INFO": 2,
+    "WARNING": 4,
+    "ERROR": 8,
+    "CRITICAL": 16,
+}
+OTHER_LEVEL_BIT = 32
+
+
+def index_path(log_path: str) -> str:
+    """Return the sidecar index path for a log file."""
+    return log_path + INDEX_SUFFIX
+
+
+def _level_bit(level: str) -> int:
+    return LEVEL_BITS.get(level.upper(), OTHER_LEVEL_BIT)
+
+
+class LogIndexWriter:
+    """
+    Appends block summaries for one log file to its sidecar index.
+
+    Module names get a bit number the first time they appear in a sidecar;
+    the assignment is written as its own line so readers can rebuild it.
+    """
+
+    def __init__(self, path: str, block_lines: int = INDEX_BLOCK_LINES):
+        self.path = path
+        self.block_lines = block_lines
+        self._module_bits: Dict[str, int] = {}
+        self._new_modules: List[str] = []
+        self._block: Optional[dict] = None
+        self._file = None
+        for record in _read_sidecar_lines(path):
+            if "module" in record:
+                self._module_bits[record["module"]] = record["bit"]
+
+    def add(self, start: int, end: int, created: Optional[float], level: str, module: str) -> None:
+        """
+        Record one log line occupying bytes [start, end).
+
+        ``created`` is the epoch time of the line's timestamp field, or None
+        if it is unknown; a block with any unknown time is never skipped by
+        date.
+        """
+        bit = self._module_bits.get(module)
+        if bit is None:
+            bit = len(self._module_bits)
+            self._module_bits[module] = bit
+            self._new_modules.append(module)
+
+        block = self._block
+        if block is None or block["end"] != start:
+            # A gap (e.g. lines written by someone else) starts a new block
+            if block is not None:
+                self.flush()
+            block = self._block = {
+                "start": start, "end": end, "first": None, "last": None,
+                "levels": 0, "modules": 0, "lines": 0,
+            }
+        block["end"] = end
+        if created is None:
+            block["untimed"] = True
+        else:
+            block["first"] = created if block["first"] is None else min(block["first"], created)
+            block["last"] = created if block["last"] is None else max(block["last"], created)
+        block["levels"] |= _level_bit(level)
+        block["modules"] |= 1 << bit
+        block["lines"] += 1
+        if block["lines"] >= self.block_lines:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the pending block (and any new module names) to the sidecar."""
+        if self._block is None:
+            return
+        if self._file is None:
+            self._file = open(self.path, "a", encoding="utf-8")
+        for module in self._new_modules:
+            self._file.write(json.dumps({"module": module, "bit": self._module_bits[module]}) + "\n")
+        self._new_modules.clear()
+        self._file.write(json.dumps(self._block) + "\n")
+        self._file.flush()
+        self._block = None
+
+    def close(self) -> None:
+        self.flush()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+class IndexedRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler that maintains a sidecar index for query_log_entries.
+
+    Rotation renames the sidecars along with the log files, so every backup
+    keeps the index that describes it.
+    """
+
+    def __init__(self, filename, *args, index_block_lines: int = INDEX_BLOCK_LINES, **kwargs):
+        super().__init__(filename, *args, **kwargs)
+        self._index_block_lines = index_block_lines
+        self._index = LogIndexWriter(index_path(self.baseFilename), index_block_lines)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            start = self.stream.tell()
+            logging.FileHandler.emit(self, record)
+            self._index.add(
+                start, self.stream.tell(), _record_time(record), record.levelname, record.module
+            )
+        except Exception:
+            self.handleError(record)
+
+    def doRollover(self) -> None:
+        self._index.close()
+        base = self.baseFilename
+        for i in range(self.backupCount - 1, 0, -1):
+            source = index_path(self.rotation_filename(f"{base}.{i}"))
+            target = index_path(self.rotation_filename(f"{base}.{i + 1}"))
+            if os.path.exists(source):
+                os.replace(source, target)
+        current = index_path(base)
+        if os.path.exists(current):
+            if self.backupCount > 0:
+                os.replace(current, index_path(self.rotation_filename(f"{base}.1")))
+            else:
+                os.remove(current)
+        super().doRollover()
+        self._index = LogIndexWriter(current, self._index_block_lines)
+
+    def close(self) -> None:
+        self.acquire()
+        try:
+            self._index.close()
+        finally:
+            self.release()
+        super().close()
+
+
+def _record_time(record: logging.LogRecord) -> Optional[float]:
+    """Epoch time of the timestamp the JSON formatter will write for a record."""
+    override = getattr(record, "timestamp", None)
+    if not override:
+        return record.created
+    # An ``extra={"timestamp": ...}`` value replaces the formatter's own
+    try:
+        parsed = datetime.fromisoformat(str(override).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.timestamp()
+
+
+def _read_sidecar_lines(path: str) -> Iterator[dict]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # torn final line after a crash
+    except OSError:
+        return
+
+
+@dataclass
+class _FileIndex:
+    """Parsed sidecar for one log file."""
+    module_bits: Dict[str, int] = field(default_factory=dict)
+    blocks: List[dict] = field(default_factory=list)
+
+
+_index_cache: Dict[str, Tuple[Tuple[int, int], _FileIndex]] = {}
+_index_cache_lock = threading.Lock()
+
+
+def _load_index(log_path: str, file_size: int) -> _FileIndex:
+    """Load (and cache by sidecar mtime/size) the index for a log file."""
+    path = index_path(log_path)
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return _FileIndex()
+    key = (stat.st_mtime_ns, stat.st_size)
+    with _index_cache_lock:
+        cached = _index_cache.get(path)
+        if cached and cached[0] == key:
+            index = cached[1]
+        else:
+            index = _FileIndex()
+            for record in _read_sidecar_lines(path):
+                if "module" in record:
+                    index.module_bits[record["module"]] = record["bit"]
+                elif "start" in record:
+                    index.blocks.append(record)
+            index.blocks.sort(key=lambda b: b["start"])
+            _index_cache[path] = (key, index)
+    if index.blocks and index.blocks[-1]["end"] > file_size:
+        # Sidecar describes a longer file (log truncated or replaced): ignore it
+        return _FileIndex()
+    return index
+
+
+def _ranges_newest_first(file_size: int, index: _FileIndex) -> List[dict]:
+    """Indexed blocks plus wildcard ranges for any gaps, newest first."""
+    ranges = []
+    position = 0
+    for block in index.blocks:
+        if block["start"] < position:
+            continue  # overlapping block from a torn write
+        if block["start"] > position:
+            ranges.append({"start": position, "end": block["start"]})
+        ranges.append(block)
+        position = block["end"]
+    if position < file_size:
+        ranges.append({"start": position, "end": file_size})
+    ranges.reverse()
+    return ranges
+
+
+def _iter_lines_reverse(buffer, start: int, end: int) -> Iterator[bytes]:
+    """Yield the lines in buffer[start:end] from last to first."""
+    position = end
+    while position > start:
+        newline = buffer.rfind(b"\n", start, position - 1)
+        line_start = newline + 1 if newline >= 0 else start
+        yield buffer[line_start:position]
+        position = line_start
+
+
+def log_files_newest_first(log_dir: str, filename: str = "app.log") -> List[str]:
+    """Return ``filename`` and its rotated backups, newest first."""
+    backups = []
+    try:
+        names = os.listdir(log_dir)
+    except OSError:
+        return []
+    prefix = filename + "."
+    for name in names:
+        suffix = name[len(prefix):] if name.startswith(prefix) else ""
+        if suffix.isdigit():
+            backups.append((int(suffix), name))
+    files = [filename] if filename in names else []
+    files.extend(name for _, name in sorted(backups))
+    return [os.path.join(log_dir, name) for name in files]
+
+
+def _line_token(text: Optional[str]) -> Optional[bytes]:
+    """
+    Bytes that must appear in a lowercased raw line containing ``text``.
+
+    JSON escapes quotes, backslashes, control and non-ASCII characters, so
+    such text cannot be searched for in the raw line; None disables the check.
+    """
+    if not text or not text.isascii() or any(c in '"\\' or c < " " for c in text):
+        return None
+    return text.encode()
+
+
+@dataclass
+class LogFilter:
+    """Filter criteria for log queries (all optional, combined with AND)."""
+    level: Optional[str] = None
+    module: Optional[str] = None
+    search: Optional[str] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+
+    def __post_init__(self):
+        self._level = self.level.upper() if self.level else None
+        self._module = self.module.lower() if self.module else None
+        self._search = self.search.lower() if self.search else None
+        level_token = _line_token(self._level.lower()) if self._level else None
+        self._level_token = b'"' + level_token + b'"' if level_token else None
+        self._module_token = _line_token(self._module)
+        self._search_token = _line_token(self._search)
+        self._start_ts = (
+            datetime.combine(self.start_date, dt_time.min, tzinfo=timezone.utc).timestamp()
+            if self.start_date else None
+        )
+        self._end_ts = (
+            datetime.combine(self.end_date + timedelta(days=1), dt_time.min, tzinfo=timezone.utc).timestamp()
+            if self.end_date else None
+        )
+
+    def block_may_match(self, block: dict, index: _FileIndex) -> bool:
+        """Decide from the index alone whether a block can hold a match."""
+        if "levels" not in block:
+            return True
+        if self._level and not block["levels"] & _level_bit(self._level):
+            return False
+        if self._module:
+            mask = 0
+            for name, bit in index.module_bits.items():
+                if self._module in name.lower():
+                    mask |= 1 << bit
+            if not block["modules"] & mask:
+                return False
+        if block.get("untimed") or block["first"] is None:
+            return True
+        if self._start_ts is not None and block["last"] < self._start_ts:
+            return False
+        if self._end_ts is not None and block["first"] >= self._end_ts:
+            return False
+        return True
+
+    def line_may_match(self, line: bytes) -> bool:
+        """Cheap byte checks that reject most non-matching lines before parsing."""
+        if not (self._level_token or self._module_token or self._search_token):
+            return True
+        lowered = line.lower()
+        for token in (self._level_token, self._module_token, self._search_token):
+            if token and token not in lowered:
+                return False
+        return True
+
+    def matches(self, entry: dict) -> bool:
+        """Check a parsed log entry against every filter."""
+        if self._level and entry.get("level", "").upper() != self._level:
+            return False
+        if self._module:
+            entry_module = entry.get("module", "") or entry.get("logger", "")
+            if self._module not in entry_module.lower():
+                return False
+        if self._search and self._search not in entry.get("message", "").lower():
+            return False
+        if self.start_date or self.end_date:
+            timestamp = entry.get("timestamp", "")
+            if timestamp:
+                try:
+                    entry_date = datetime.fromisoformat(str(timestamp).replace("Z", "+00:00")).date()
+                    if self.start_date and entry_date < self.start_date:
+                        return False
+                    if self.end_date and entry_date > self.end_date:
+                        return False
+                except ValueError:
+                    pass  # Can't parse timestamp, skip date filter
+        return True
+
+
+def parse_log_line(line) -> Optional[dict]:
+    """Parse one JSON log line (str or bytes); None for blank or non-JSON lines."""
+    line = line.strip()
+    if not line:
+        return None
+    try:
+        entry = json.loads(line)
+    except (json.JSONDecodeError, UnicodeDecodeError):
+        return None
+    return entry if isinstance(entry, dict) else None
+
+
+@dataclass
+class LogQueryResult:
+    """One page of newest-first log entries."""
+    entries: List[dict]
+    total: int
+    total_exact: bool
+    has_more: bool
+    blocks_skipped: int = 0
+
+
+def query_log_entries(
+    log_dir: str,
+    log_filter: Optional[LogFilter] = None,
+    limit: int = 100,
+    offset: int = 0,
+    filename: str = "app.log",
+    exact_total: bool = False,
+) -> LogQueryResult:
+    """
+    Return matching log entries newest-first across ``filename`` and its backups.
+
+    Args:
+        log_dir: Directory holding the log files
+        log_filter: Filter criteria (None matches everything)
+        limit: Maximum entries to return
+        offset: Matching entries to skip
+        filename: Base log file name
+        exact_total: Scan every file to count all matches. Otherwise the scan
+            stops after ``offset + limit + 1`` matches and ``total`` is only
+            exact when ``total_exact`` is True.
+
+    Returns:
+        LogQueryResult with the requested page
+    """
+    log_filter = log_filter or LogFilter()
+    wanted = offset + limit + 1
+    entries: List[dict] = []
+    matched = 0
+    blocks_skipped = 0
+
+    for path in log_files_newest_first(log_dir, filename):
+        try:
+            with open(path, "rb") as f:
+                file_size = os.fstat(f.fileno()).st_size
+                if file_size == 0:
+                    continue
+                index = _load_index(path, file_size)
+                with mmap.mmap(f.fileno(), file_size, access=mmap.ACCESS_READ) as buffer:
+                    for block in _ranges_newest_first(file_size, index):
+                        if not log_filter.block_may_match(block, index):
+                            blocks_skipped += 1
+                            continue
+                        for line in _iter_lines_reverse(buffer, block["start"], block["end"]):
+                            if not log_filter.line_may_match(line):
+                                continue
+                            entry = parse_log_line(line)
+                            if entry is None or not log_filter.matches(entry):
+                                continue
+                            if offset <= matched < offset + limit:
+                                entries.append(entry)
+                            matched += 1
+                            if matched >= wanted and not exact_total:
+                                return LogQueryResult(
+                                    entries=entries,
+                                    total=matched,
+                                    total_exact=False,
+                                    has_more=True,
+                                    blocks_skipped=blocks_skipped,
+                                )
+        except (OSError, ValueError):
+            continue  # file rotated away mid-query
+
+    return LogQueryResult(
+        entries=entries,
+        total=matched,
+        total_exact=True,
+        has_more=matched > offset + limit,
+        blocks_skipped=blocks_skipped,
+    )
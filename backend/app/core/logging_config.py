@@ -4,19 +4,28 @@ Structured JSON Logging Configuration (Story 6.2)
 Provides centralized logging configuration with:
 - JSON formatted output for machine parsing
 - Request ID tracking via contextvars
-- File rotation (7 days, 100MB max)
+- File rotation (7 days, 100MB max) with a sidecar index for log queries
 - Configurable log levels via environment
+- Non-blocking output: callers only enqueue records on a bounded queue; a
+  QueueListener thread formats JSON and writes the console and files
+- Per-call-site rate limiting of DEBUG/INFO records from hot paths
 """
+import atexit
+import copy
 import logging
 import logging.handlers
 import os
 import contextvars
+import queue
 import re
+import threading
+import time
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Dict, Optional
 from pythonjsonlogger import jsonlogger
 
 from app.core.config import settings
+from app.core.log_index import IndexedRotatingFileHandler
 
 # Context variable for request ID propagation
 request_id_var: contextvars.ContextVar[Optional[str]] = contextvars.ContextVar(
@@ -97,6 +106,128 @@ class SanitizingFilter(logging.Filter):
         return True
 
 
+class SamplingFilter(logging.Filter):
+    """
+    Rate-limits DEBUG and INFO records per call site (token bucket).
+
+    Each ``pathname:lineno`` may emit ``burst`` records at once and
+    ``rate_per_second`` on average after that; the rest are dropped. Motion
+    checks, WebSocket updates and per-request logs stay visible at normal
+    rates but cannot flood the queue. WARNING and above always pass. The
+    first record a site emits after drops carries ``sampled_suppressed``
+    with the number of records it stands for.
+    """
+
+    def __init__(self, rate_per_second: float, burst: int):
+        super().__init__()
+        self.rate_per_second = rate_per_second
+        self.burst = burst
+        self.dropped = 0
+        self._sites: Dict[tuple, list] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.INFO:
+            return True
+        key = (record.pathname, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            site = self._sites.get(key)
+            if site is None:
+                # [tokens, last refill time, records suppressed since last emit]
+                site = self._sites[key] = [float(self.burst), now, 0]
+            else:
+                site[0] = min(self.burst, site[0] + (now - site[1]) * self.rate_per_second)
+                site[1] = now
+            if site[0] < 1.0:
+                site[2] += 1
+                self.dropped += 1
+                return False
+            site[0] -= 1.0
+            suppressed, site[2] = site[2], 0
+        if suppressed:
+            record.sampled_suppressed = suppressed
+        return True
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler for a bounded queue that drops (and counts) records when full.
+
+    Logging must never block the event loop or a capture thread, so a full
+    queue costs the record rather than the caller's time.
+    """
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """
+        Make a record safe to format on another thread.
+
+        Unlike the stdlib version this keeps the raw message and moves any
+        traceback into ``exc_text``, so the JSON formatter still emits it as
+        the ``exc_info`` field instead of folding it into ``message``.
+        """
+        record = copy.copy(record)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = _exception_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+
+_exception_formatter = logging.Formatter()
+
+# Active pipeline, replaced on every setup_logging call
+_queue_handler: Optional[DroppingQueueHandler] = None
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+_sampling_filter: Optional[SamplingFilter] = None
+# Drops counted by pipelines that setup_logging has since replaced
+_replaced_drops = {"dropped_queue_full": 0, "dropped_sampled": 0}
+
+
+def get_logging_stats() -> dict:
+    """
+    Return queue depth and drop counters for the logging pipeline.
+
+    Returns:
+        Dict with queue_depth, queue_capacity, and dropped_queue_full and
+        dropped_sampled totals since startup (all zero before setup_logging runs)
+    """
+    log_queue = _queue_handler.queue if _queue_handler else None
+    return {
+        "queue_depth": log_queue.qsize() if log_queue else 0,
+        "queue_capacity": log_queue.maxsize if log_queue else 0,
+        "dropped_queue_full": _replaced_drops["dropped_queue_full"]
+        + (_queue_handler.dropped if _queue_handler else 0),
+        "dropped_sampled": _replaced_drops["dropped_sampled"]
+        + (_sampling_filter.dropped if _sampling_filter else 0),
+    }
+
+
+def shutdown_logging() -> None:
+    """Stop the queue listener after writing every record already queued."""
+    global _queue_listener
+    if _queue_listener is not None:
+        listener, _queue_listener = _queue_listener, None
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+atexit.register(shutdown_logging)
+
+
 class CustomJsonFormatter(jsonlogger.JsonFormatter):
     """
     Custom JSON formatter that adds standard fields to all log entries.
@@ -121,9 +252,10 @@ class CustomJsonFormatter(jsonlogger.JsonFormatter):
     ) -> None:
         super().add_fields(log_record, record, message_dict)
 
-        # Standard timestamp in ISO format with UTC
+        # Standard timestamp in ISO format with UTC. Taken from the record, not
+        # the clock: records are formatted later on the queue listener thread.
         if not log_record.get('timestamp'):
-            log_record['timestamp'] = datetime.now(timezone.utc).isoformat()
+            log_record['timestamp'] = datetime.fromtimestamp(record.created, timezone.utc).isoformat()
 
         # Standard fields
         log_record['level'] = record.levelname
@@ -154,6 +286,10 @@ def setup_logging(
     """
     Configure application-wide logging with JSON format and rotation.
 
+    The root logger gets a single non-blocking DroppingQueueHandler; the
+    console and file handlers run on a QueueListener thread. Calling this
+    again stops the previous listener after it drains.
+
     Args:
         log_level: Override log level (default from settings.LOG_LEVEL)
         log_dir: Override log directory (default: backend/data/logs)
@@ -162,7 +298,7 @@ def setup_logging(
     Returns:
         Root logger configured for the application
     """
-    global APP_VERSION
+    global APP_VERSION, _queue_handler, _queue_listener, _sampling_filter
 
     level = getattr(logging, (log_level or settings.LOG_LEVEL).upper(), logging.INFO)
     directory = log_dir or LOG_DIR
@@ -187,21 +323,25 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
 
-    # Clear existing handlers
+    # Clear existing handlers and drain the previous pipeline
     root_logger.handlers.clear()
+    shutdown_logging()
+
+    # Output handlers run on the listener thread. RequestIdFilter is not
+    # among their filters: the request id lives in the caller's context and
+    # is stamped on by the queue handler before the record is enqueued.
 
     # Console handler (JSON format for production, readable for development)
     console_handler = logging.StreamHandler()
     console_handler.setLevel(level)
     console_handler.setFormatter(json_formatter)
-    console_handler.addFilter(RequestIdFilter())
     console_handler.addFilter(SanitizingFilter())
-    root_logger.addHandler(console_handler)
 
     # File handler with rotation
-    # Max 100MB per file, keep 7 days worth of logs
+    # Max 100MB per file, keep 7 days worth of logs. The sidecar index it
+    # maintains lets /api/v1/logs seek by date, level and module.
     log_file = os.path.join(directory, 'app.log')
-    file_handler = logging.handlers.RotatingFileHandler(
+    file_handler = IndexedRotatingFileHandler(
         log_file,
         maxBytes=100 * 1024 * 1024,  # 100MB
         backupCount=7,  # Keep 7 backup files
@@ -209,9 +349,7 @@ def setup_logging(
     )
     file_handler.setLevel(level)
     file_handler.setFormatter(json_formatter)
-    file_handler.addFilter(RequestIdFilter())
     file_handler.addFilter(SanitizingFilter())
-    root_logger.addHandler(file_handler)
 
     # Error-only file handler for critical issues
     error_log_file = os.path.join(directory, 'error.log')
@@ -223,9 +361,31 @@ def setup_logging(
     )
     error_handler.setLevel(logging.ERROR)
     error_handler.setFormatter(json_formatter)
-    error_handler.addFilter(RequestIdFilter())
     error_handler.addFilter(SanitizingFilter())
-    root_logger.addHandler(error_handler)
+
+    # Callers only pay for the level check, sampling and an enqueue
+    queue_handler = DroppingQueueHandler(queue.Queue(maxsize=settings.LOG_QUEUE_SIZE))
+    queue_handler.setLevel(level)
+    sampling_filter = None
+    if settings.LOG_SAMPLING_ENABLED:
+        sampling_filter = SamplingFilter(settings.LOG_SAMPLING_RATE_PER_SECOND, settings.LOG_SAMPLING_BURST)
+        queue_handler.addFilter(sampling_filter)
+    queue_handler.addFilter(RequestIdFilter())
+    root_logger.addHandler(queue_handler)
+
+    listener = logging.handlers.QueueListener(
+        queue_handler.queue,
+        console_handler,
+        file_handler,
+        error_handler,
+        respect_handler_level=True,
+    )
+    listener.start()
+    if _queue_handler is not None:
+        _replaced_drops["dropped_queue_full"] += _queue_handler.dropped
+    if _sampling_filter is not None:
+        _replaced_drops["dropped_sampled"] += _sampling_filter.dropped
+    _queue_handler, _queue_listener, _sampling_filter = queue_handler, listener, sampling_filter
 
     # Suppress noisy third-party loggers
     logging.getLogger('uvicorn.access').setLevel(logging.WARNING)
@@ -7,10 +7,12 @@ Provides Prometheus-compatible metrics for:
 - AI API usage and costs
 - Camera connection status
 - System resource usage (CPU, memory, disk)
+- Event loop lag
 """
+import asyncio
 import time
 import logging
-from typing import Optional
+from typing import Dict, Optional
 from prometheus_client import (
     Counter, Histogram, Gauge, Info,
     CollectorRegistry, generate_latest, CONTENT_TYPE_LATEST
@@ -101,6 +103,75 @@ ai_processing_duration_seconds = Histogram(
     registry=REGISTRY
 )
 
+post_processing_stage_duration_seconds = Histogram(
+    'argusai_post_processing_stage_duration_seconds',
+    'Duration of one post-processing stage for a stored event',
+    ['stage', 'status'],
+    buckets=[0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
+    registry=REGISTRY
+)
+
+post_processing_duration_seconds = Histogram(
+    'argusai_post_processing_duration_seconds',
+    'Wall-clock duration of the post-processing graph for one event',
+    buckets=[0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0],
+    registry=REGISTRY
+)
+
+time_to_notification_seconds = Histogram(
+    'argusai_time_to_notification_seconds',
+    'Time from dequeuing an event to dispatching its push notification',
+    buckets=[0.5, 1.0, 2.0, 5.0, 10.0, 20.0, 60.0],
+    registry=REGISTRY
+)
+
+# ============================================================================
+# Face / Vehicle Detection Metrics
+# ============================================================================
+
+detection_stage_duration_seconds = Histogram(
+    'argusai_detection_stage_duration_seconds',
+    'Duration of one fused detection step per batch (decode, preprocess, face, vehicle)',
+    ['stage'],
+    buckets=[0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0],
+    registry=REGISTRY
+)
+
+detection_batch_size = Histogram(
+    'argusai_detection_batch_size',
+    'Frames per fused detection network call',
+    buckets=[1, 2, 4, 8, 16],
+    registry=REGISTRY
+)
+
+# ============================================================================
+# Overlay OCR Metrics
+# ============================================================================
+
+ocr_region_runs_total = Counter(
+    'argusai_ocr_region_runs_total',
+    'Overlay OCR region lookups (unchanged = skipped via hash, profile = learned region, probe = corner scan)',
+    ['mode'],
+    registry=REGISTRY
+)
+
+# ============================================================================
+# AI Description Cache Metrics
+# ============================================================================
+
+description_cache_lookups_total = Counter(
+    'argusai_description_cache_lookups_total',
+    'AI description cache lookups (hit = provider call skipped, disabled = camera opted out)',
+    ['result'],
+    registry=REGISTRY
+)
+
+description_cache_cost_saved_usd_total = Counter(
+    'argusai_description_cache_cost_saved_usd_total',
+    'Estimated provider cost avoided by reusing cached descriptions (USD)',
+    registry=REGISTRY
+)
+
 # ============================================================================
 # AI API Metrics
 # ============================================================================
@@ -134,6 +205,56 @@ ai_api_cost_total = Counter(
     registry=REGISTRY
 )
 
+ai_hedged_requests_total = Counter(
+    'ai_hedged_requests_total',
+    'Hedged AI requests by outcome (primary_won, backup_won, both_failed)',
+    ['outcome'],
+    registry=REGISTRY
+)
+
+ai_hedge_extra_cost_usd_total = Counter(
+    'ai_hedge_extra_cost_usd_total',
+    'Estimated cost of hedged AI requests whose result was not used',
+    registry=REGISTRY
+)
+
+ai_image_payload_bytes_total = Counter(
+    'ai_image_payload_bytes_total',
+    'JPEG bytes sent to AI providers in image payloads',
+    ['provider'],
+    registry=REGISTRY
+)
+
+ai_image_payload_tokens_total = Counter(
+    'ai_image_payload_tokens_total',
+    'Estimated input tokens of images sent to AI providers',
+    ['provider'],
+    registry=REGISTRY
+)
+
+ai_image_encodes_total = Counter(
+    'ai_image_encodes_total',
+    'Image payload encodes (encoded) and variants reused across retries/providers (reused)',
+    ['result'],
+    registry=REGISTRY
+)
+
+# ============================================================================
+# Cluster Mode Metrics
+# ============================================================================
+
+cluster_members = Gauge(
+    'cluster_members',
+    'Live replicas seen by this replica (1 when cluster mode is off)',
+    registry=REGISTRY
+)
+
+cluster_is_leader = Gauge(
+    'cluster_is_leader',
+    'Whether this replica holds the scheduler lease (1 = leader, 0 = follower)',
+    registry=REGISTRY
+)
+
 # ============================================================================
 # AI Circuit Breaker Metrics (Story #436)
 # ============================================================================
@@ -379,6 +500,45 @@ system_disk_used_bytes = Gauge(
     registry=REGISTRY
 )
 
+# ============================================================================
+# Event Loop Health
+# ============================================================================
+
+# Fine-grained buckets: anything above a few ms means a coroutine (usually a
+# synchronous DB call or CPU work) held the loop.
+event_loop_lag_seconds = Histogram(
+    'argusai_event_loop_lag_seconds',
+    'Delay between when an event-loop timer was due and when it ran',
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+    registry=REGISTRY
+)
+
+event_loop_lag_last_seconds = Gauge(
+    'argusai_event_loop_lag_last_seconds',
+    'Most recent event-loop lag sample',
+    registry=REGISTRY
+)
+
+# ============================================================================
+# Logging Pipeline
+# ============================================================================
+
+log_queue_depth = Gauge(
+    'argusai_log_queue_depth',
+    'Log records waiting for the background writer',
+    registry=REGISTRY
+)
+
+log_records_dropped_total = Counter(
+    'argusai_log_records_dropped_total',
+    'Log records dropped (queue_full or sampled)',
+    ['reason'],
+    registry=REGISTRY
+)
+
+# Drop totals already added to log_records_dropped_total, by stats key
+_log_drops_counted: Dict[str, int] = {"dropped_queue_full": 0, "dropped_sampled": 0}
+
 # ============================================================================
 # Application Uptime
 # ============================================================================
@@ -686,10 +846,40 @@ def update_system_metrics():
         if _start_time:
             app_uptime_seconds.set(time.time() - _start_time)
 
+        # Logging pipeline backlog and drops
+        from app.core.logging_config import get_logging_stats
+        log_stats = get_logging_stats()
+        log_queue_depth.set(log_stats["queue_depth"])
+        for key, reason in (("dropped_queue_full", "queue_full"), ("dropped_sampled", "sampled")):
+            delta = log_stats[key] - _log_drops_counted[key]
+            if delta > 0:
+                log_records_dropped_total.labels(reason=reason).inc(delta)
+                _log_drops_counted[key] = log_stats[key]
+
     except Exception as e:
         logger.warning(f"Failed to update system metrics: {e}")
 
 
+async def monitor_event_loop_lag(interval_seconds: float = 0.25) -> None:
+    """
+    Sample event-loop lag until cancelled.
+
+    Sleeps for ``interval_seconds`` and records how much later than
+    requested the loop resumed. Run as a background task on the
+    application's loop.
+
+    Args:
+        interval_seconds: Sampling period
+    """
+    loop = asyncio.get_running_loop()
+    while True:
+        scheduled = loop.time() + interval_seconds
+        await asyncio.sleep(interval_seconds)
+        lag = max(0.0, loop.time() - scheduled)
+        event_loop_lag_seconds.observe(lag)
+        event_loop_lag_last_seconds.set(lag)
+
+
 def get_metrics() -> bytes:
     """
     Generate Prometheus metrics output.
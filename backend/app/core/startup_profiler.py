@@ -0,0 +1,234 @@
+"""
+Startup timing report for main.py.
+
+Cold start on small NVR hardware is dominated by module imports (provider
+SDKs, media libraries) and by the lifespan bringing up cameras, controllers
+and integrations. The profiler records both so a slow start can be traced to
+the import or phase responsible:
+
+- Imports: every module first loaded while tracking is on, with cumulative
+  time (including the modules it pulled in) and self time. Tracking wraps
+  ``builtins.__import__`` on the importing thread only and is switched off
+  once main.py has finished its imports.
+- Phases: lifespan phases timed checkpoint to checkpoint; starting a phase
+  ends the previous one.
+
+The report is served by ``GET /api/v1/system/debug/startup-profile`` and is
+logged once startup completes. Only the standard library is imported here so
+that tracking can start before any application module loads.
+
+Usage (main.py):
+    startup_profiler.start_import_tracking()
+    from app.api.v1.cameras import router as cameras_router
+    ...
+    startup_profiler.stop_import_tracking()
+
+    async def lifespan(app):
+        startup_profiler.begin_phase("database")
+        ...
+        startup_profiler.finish_startup()
+"""
+import builtins
+import importlib.util
+import sys
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+# Libraries that should only load when a configured provider or feature needs
+# them; the report lists which of these are resident
+HEAVY_MODULES = (
+    "litellm",
+    "openai",
+    "anthropic",
+    "google.generativeai",
+    "cv2",
+    "av",
+)
+
+
+@dataclass
+class ImportTiming:
+    """Load time of one module."""
+    module: str
+    cumulative_ms: float
+    self_ms: float
+    depth: int
+
+
+@dataclass
+class PhaseTiming:
+    """Duration of one lifespan phase."""
+    name: str
+    duration_ms: float
+
+
+class StartupProfiler:
+    """
+    Collects import and lifespan phase timings for the startup report.
+
+    Attributes:
+        created_at: perf_counter() value when the profiler was created
+    """
+
+    def __init__(self):
+        self.created_at = time.perf_counter()
+        self._original_import = None
+        # Kept after tracking stops in case another wrapper was installed on top
+        self._wrapped_import = builtins.__import__
+        # One bound method, so stop_import_tracking can tell whether it is still installed
+        self._hook = self._timed_import
+        self._thread_id: Optional[int] = None
+        self._stack: List[List[Any]] = []  # [module, started_at, child_seconds]
+        self._imports: List[ImportTiming] = []
+        self._import_seconds = 0.0
+        self._import_started_at: Optional[float] = None
+        self._phases: List[PhaseTiming] = []
+        self._phase_name: Optional[str] = None
+        self._phase_started_at: Optional[float] = None
+        self._startup_ms: Optional[float] = None
+
+    # ------------------------------------------------------------------
+    # Imports
+    # ------------------------------------------------------------------
+
+    @property
+    def tracking_imports(self) -> bool:
+        return self._original_import is not None
+
+    def start_import_tracking(self) -> None:
+        """Start timing module loads on the calling thread."""
+        if self.tracking_imports:
+            return
+        self._thread_id = threading.get_ident()
+        self._original_import = self._wrapped_import = builtins.__import__
+        self._import_started_at = time.perf_counter()
+        builtins.__import__ = self._hook
+
+    def stop_import_tracking(self) -> None:
+        """Restore the original import function."""
+        if not self.tracking_imports:
+            return
+        if builtins.__import__ is self._hook:
+            builtins.__import__ = self._original_import
+        self._original_import = None
+        self._import_seconds += time.perf_counter() - self._import_started_at
+        self._import_started_at = None
+
+    def _new_module_name(self, name, globals, fromlist, level) -> Optional[str]:
+        """Name of the module this import statement loads, None if already loaded."""
+        if level:
+            package = (globals or {}).get("__package__")
+            if not package:
+                return None
+            try:
+                name = importlib.util.resolve_name("." * level + name, package)
+            except (ImportError, ValueError):
+                return None
+        module = sys.modules.get(name)
+        if module is None:
+            return name
+        # ``from package import submodule`` loads the submodule inside this call
+        for item in fromlist or ():
+            if item != "*" and not hasattr(module, item):
+                return f"{name}.{item}"
+        return None
+
+    def _timed_import(self, name, globals=None, locals=None, fromlist=(), level=0):
+        original = self._wrapped_import
+        if not self.tracking_imports or threading.get_ident() != self._thread_id:
+            return original(name, globals, locals, fromlist, level)
+
+        module = self._new_module_name(name, globals, fromlist, level)
+        if module is None:
+            return original(name, globals, locals, fromlist, level)
+
+        frame = [module, time.perf_counter(), 0.0]
+        self._stack.append(frame)
+        try:
+            return original(name, globals, locals, fromlist, level)
+        finally:
+            self._stack.pop()
+            elapsed = time.perf_counter() - frame[1]
+            self._imports.append(ImportTiming(
+                module=module,
+                cumulative_ms=elapsed * 1000,
+                self_ms=(elapsed - frame[2]) * 1000,
+                depth=len(self._stack),
+            ))
+            if self._stack:
+                self._stack[-1][2] += elapsed
+
+    # ------------------------------------------------------------------
+    # Lifespan phases
+    # ------------------------------------------------------------------
+
+    def begin_phase(self, name: str) -> None:
+        """Start timing a lifespan phase, ending the current one."""
+        now = time.perf_counter()
+        self._end_phase(now)
+        self._phase_name = name
+        self._phase_started_at = now
+
+    def _end_phase(self, now: float) -> None:
+        if self._phase_name is not None:
+            self._phases.append(PhaseTiming(
+                name=self._phase_name,
+                duration_ms=(now - self._phase_started_at) * 1000,
+            ))
+        self._phase_name = None
+        self._phase_started_at = None
+
+    def finish_startup(self) -> None:
+        """End the last phase and record the total time since process start."""
+        now = time.perf_counter()
+        self._end_phase(now)
+        self._startup_ms = (now - self.created_at) * 1000
+
+    # ------------------------------------------------------------------
+    # Report
+    # ------------------------------------------------------------------
+
+    def get_report(self, top: int = 25) -> Dict[str, Any]:
+        """
+        Build the startup timing report.
+
+        Args:
+            top: Number of slowest modules to include
+
+        Returns:
+            Dict with total startup time, import and phase timings, and the
+            heavy libraries currently loaded
+        """
+        import_seconds = self._import_seconds
+        if self._import_started_at is not None:
+            import_seconds += time.perf_counter() - self._import_started_at
+
+        def as_dict(timing: ImportTiming) -> Dict[str, Any]:
+            return {
+                "module": timing.module,
+                "cumulative_ms": round(timing.cumulative_ms, 2),
+                "self_ms": round(timing.self_ms, 2),
+            }
+
+        slowest = sorted(self._imports, key=lambda t: t.cumulative_ms, reverse=True)
+        return {
+            "startup_complete": self._startup_ms is not None,
+            "startup_ms": round(self._startup_ms, 2) if self._startup_ms is not None else None,
+            "imports": {
+                "total_ms": round(import_seconds * 1000, 2),
+                "modules_loaded": len(self._imports),
+                "top_level": [as_dict(t) for t in self._imports if t.depth == 0],
+                "slowest": [as_dict(t) for t in slowest[:top]],
+            },
+            "phases": [
+                {"name": phase.name, "duration_ms": round(phase.duration_ms, 2)}
+                for phase in self._phases
+            ],
+            "heavy_modules_loaded": [name for name in HEAVY_MODULES if name in sys.modules],
+        }
+
+
+# Created at first import of this module, i.e. at the very top of main.py
+startup_profiler = StartupProfiler()
@@ -14,12 +14,14 @@ import logging
 from datetime import datetime, timezone
 from typing import Callable
 
+from sqlalchemy import update
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
 from starlette.responses import Response
 
 from app.core.database import get_db_session
 from app.models.device import Device
+from app.services.database_writer import get_database_writer
 
 logger = logging.getLogger(__name__)
 
@@ -100,6 +102,17 @@ class LastSeenMiddleware(BaseHTTPMiddleware):
         Uses a separate database session for isolation.
         """
         try:
+            writer = get_database_writer()
+            if writer.is_running:
+                await writer.run(
+                    lambda session: session.execute(
+                        update(Device)
+                        .where(Device.device_id == device_id, Device.user_id == user_id)
+                        .values(last_seen_at=datetime.now(timezone.utc))
+                    )
+                )
+                return
+
             with get_db_session() as db:
                 device = db.query(Device).filter(
                     Device.device_id == device_id,
@@ -6,6 +6,7 @@ from app.models.system_setting import SystemSetting
 from app.models.ai_usage import AIUsage
 from app.models.event import Event
 from app.models.event_frame import EventFrame
+from app.models.media_blob import MediaBlob
 from app.models.alert_rule import AlertRule, WebhookLog
 from app.models.notification import Notification
 from app.models.user import User, UserRole
@@ -32,6 +33,7 @@ from app.models.refresh_token import RefreshToken
 from app.models.api_key import APIKey
 from app.models.user_audit_log import UserAuditLog, AuditAction
 from app.models.hot_activity import HotCameraActivity, HotEntityActivity
+from app.models.cluster import ClusterMember, ClusterLease, ClusterMessage
 
 __all__ = [
     "ProtectController",
@@ -41,6 +43,7 @@ __all__ = [
     "AIUsage",
     "Event",
     "EventFrame",
+    "MediaBlob",
     "AlertRule",
     "WebhookLog",
     "Notification",
@@ -73,4 +76,7 @@ __all__ = [
     "AuditAction",
     "HotCameraActivity",
     "HotEntityActivity",
+    "ClusterMember",
+    "ClusterLease",
+    "ClusterMessage",
 ]
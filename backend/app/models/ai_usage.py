@@ -14,6 +14,7 @@ class AIUsage(Base):
     - Response time for performance monitoring
     - Analysis mode (single_image, multi_frame) for Phase 3 multi-frame analysis
     - Whether token count is estimated vs actual (Story P3-2.5)
+    - Camera that triggered the call, when known (per-camera cost rollups)
     """
     __tablename__ = "ai_usage"
 
@@ -33,5 +34,8 @@ class AIUsage(Base):
     # Phase 3 Cost Tracking fields (Story P3-7.1)
     image_count = Column(Integer, nullable=True)  # Number of images in multi-image requests
 
+    # Camera attribution for per-camera cost rollups (NULL for manual/Whisper calls)
+    camera_id = Column(String, nullable=True, index=True)
+
     def __repr__(self):
         return f"<AIUsage(provider='{self.provider}', success={self.success}, tokens={self.tokens_used}, mode={self.analysis_mode})>"
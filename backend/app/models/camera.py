@@ -46,6 +46,7 @@ class Camera(Base):
             - low: 640x480, 15fps, 500kbps
             - medium: 1280x720, 25fps, 1500kbps
             - high: 1920x1080, 30fps, 3000kbps
+        description_cache_enabled: Whether near-identical frames may reuse a recent AI description
         created_at: Record creation timestamp (UTC)
         updated_at: Last modification timestamp (UTC)
     """
@@ -89,6 +90,8 @@ class Camera(Base):
     # Phase 6 (P6-3.3): Per-camera audio event settings
     audio_event_types = Column(Text, nullable=True)  # JSON array: ["glass_break", "gunshot", "scream", "doorbell"]
     audio_threshold = Column(Float, nullable=True)  # Per-camera threshold override (0.0-1.0), null = use global
+    # Reuse recent AI descriptions for near-identical frames (DescriptionCacheService)
+    description_cache_enabled = Column(Boolean, default=True, nullable=False)
     created_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), nullable=False)
     updated_at = Column(DateTime, default=lambda: datetime.now(timezone.utc), onupdate=lambda: datetime.now(timezone.utc), nullable=False)
 
@@ -0,0 +1,39 @@
+"""Cluster-mode coordination tables (used by ClusterService)."""
+
+from sqlalchemy import Column, Float, Integer, String, Text
+from app.core.database import Base
+
+
+class ClusterMember(Base):
+    """A running replica; rows whose heartbeat is older than the member TTL are dead."""
+    __tablename__ = "cluster_members"
+
+    instance_id = Column(String(100), primary_key=True)
+    hostname = Column(String(255), nullable=True)
+    pid = Column(Integer, nullable=True)
+    started_at = Column(Float, nullable=False)  # unix timestamp
+    heartbeat_at = Column(Float, nullable=False, index=True)  # unix timestamp
+
+
+class ClusterLease(Base):
+    """A named lease (e.g. the scheduler leadership) held until expires_at unless renewed."""
+    __tablename__ = "cluster_leases"
+
+    name = Column(String(100), primary_key=True)
+    holder = Column(String(100), nullable=False)
+    acquired_at = Column(Float, nullable=False)  # unix timestamp
+    expires_at = Column(Float, nullable=False)  # unix timestamp
+
+
+class ClusterMessage(Base):
+    """
+    Pub/sub message log: the transport of the database backend, and the body
+    store for PostgreSQL NOTIFY payloads above the 8000 byte limit.
+    """
+    __tablename__ = "cluster_messages"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    channel = Column(String(100), nullable=False)
+    origin = Column(String(100), nullable=False)
+    payload = Column(Text, nullable=False)  # JSON
+    created_at = Column(Float, nullable=False, index=True)  # unix timestamp
@@ -1,7 +1,10 @@
 """Event SQLAlchemy ORM model for AI-generated semantic events"""
 from sqlalchemy import Column, String, Integer, Text, DateTime, Boolean, ForeignKey, CheckConstraint, Index, Float
-from sqlalchemy.orm import relationship
+from sqlalchemy import event as sa_event, inspect as sa_inspect
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import relationship, deferred, column_property
 from app.core.database import Base
+import json
 import uuid
 from datetime import datetime, timezone
 
@@ -21,7 +24,8 @@ class Event(Base):
         confidence: AI confidence score (0-100, CHECK constraint)
         objects_detected: JSON array of detected objects ["person", "vehicle", etc.]
         thumbnail_path: Optional file path to thumbnail (filesystem mode)
-        thumbnail_base64: Optional base64-encoded thumbnail (database mode)
+        thumbnail_hash: Media store digest of the thumbnail (database mode)
+        thumbnail_base64: Base64 view of the media store thumbnail, read and written through the store
         alert_triggered: Whether alert rules were triggered (Epic 5)
         source_type: Event source - 'rtsp', 'usb', or 'protect' (Phase 2)
         protect_event_id: UniFi Protect's native event ID (Phase 2)
@@ -57,7 +61,8 @@ class Event(Base):
         context_stats: JSON stats from context prompt service (entity_context, similar_events, etc.)
         post_processing_summary: JSON of post-processing actions performed (HomeKit, face/vehicle/entity, MQTT, push, etc.)
         analysis_skipped_reason: Reason AI analysis was skipped - "cost_cap_daily"/"cost_cap_monthly" (Story P3-7.3)
-        key_frames_base64: JSON array of base64-encoded frame thumbnails for gallery display (Story P3-7.5)
+        key_frame_hashes: JSON array of media store digests for the key frame gallery (Story P3-7.5)
+        key_frames_base64: JSON array view of the key frames as base64, read and written through the media store
         frame_timestamps: JSON array of float seconds from video start for each frame (Story P3-7.5)
         audio_event_type: Detected audio event type - glass_break/gunshot/scream/doorbell/other (Story P6-3.2)
         audio_confidence: Confidence score (0.0-1.0) for audio event detection (Story P6-3.2)
@@ -76,7 +81,8 @@ class Event(Base):
     confidence = Column(Integer, nullable=False)  # 0-100
     objects_detected = Column(Text, nullable=False)  # JSON array: ["person", "vehicle", "animal", "package", "unknown"]
     thumbnail_path = Column(String(500), nullable=True)  # Filesystem mode: relative path
-    thumbnail_base64 = Column(Text, nullable=True)  # Database mode: base64 JPEG
+    # active_history: the previous digest must be loaded so updates can release its reference
+    thumbnail_hash = column_property(Column(String(64), nullable=True), active_history=True)  # Database mode: media store digest of the JPEG
     alert_triggered = Column(Boolean, nullable=False, default=False)  # Epic 5 feature
     alert_rule_ids = Column(Text, nullable=True)  # JSON array of triggered rule UUIDs (Epic 5)
     # Phase 2: UniFi Protect event source fields
@@ -131,13 +137,13 @@ class Event(Base):
     ai_fallback_used = Column(Boolean, nullable=False, default=False)  # True if the final AI provider was reached via fallback
     # Story P4-3.4 / AIProcessingCoordinator: Context-enhanced prompt usage
     context_included = Column(Boolean, nullable=False, default=False)  # Whether context was applied to the AI prompt
-    context_stats = Column(Text, nullable=True)  # JSON: {entity_context_included, similar_events_count, time_pattern_included, gather_time_ms, ...}
+    context_stats = deferred(Column(Text, nullable=True))  # JSON: {entity_context_included, similar_events_count, time_pattern_included, gather_time_ms, ...}
     # Post-processing actions performed by AIProcessingCoordinator
-    post_processing_summary = Column(Text, nullable=True)  # JSON summary of which post-processing actions were executed
+    post_processing_summary = deferred(Column(Text, nullable=True))  # JSON summary of which post-processing actions were executed
     # Story P3-7.3: Cost cap enforcement - analysis skip reason
     analysis_skipped_reason = Column(String(50), nullable=True)  # "cost_cap_daily", "cost_cap_monthly" (null = not skipped)
     # Story P3-7.5: Key frames storage for event detail gallery
-    key_frames_base64 = Column(Text, nullable=True)  # JSON array of base64-encoded frame thumbnails (null = not stored)
+    key_frame_hashes = column_property(Column(Text, nullable=True), active_history=True)  # JSON array of media store digests (null = not stored)
     frame_timestamps = Column(Text, nullable=True)  # JSON array of float seconds from video start (null = not stored)
     # Story P4-5.4: A/B testing - tracks which prompt variant was used
     prompt_variant = Column(String(20), nullable=True, index=True)  # 'control', 'experiment' (null = no A/B test active)
@@ -157,7 +163,7 @@ class Event(Base):
     video_path = Column(String(500), nullable=True)  # Path to stored video file (null = no video stored)
     # Story P15-5.1: AI Visual Annotations - bounding boxes for detected objects
     has_annotations = Column(Boolean, nullable=False, default=False)  # True if bounding boxes are available
-    bounding_boxes = Column(Text, nullable=True)  # JSON array of bounding box objects (null = no annotations)
+    bounding_boxes = deferred(Column(Text, nullable=True))  # JSON array of bounding box objects (null = no annotations)
     created_at = Column(DateTime(timezone=True), nullable=False, default=lambda: datetime.now(timezone.utc))
 
     # Relationships
@@ -187,5 +193,132 @@ class Event(Base):
         Index('idx_events_camera_timestamp', 'camera_id', 'timestamp'),
     )
 
+    # Bulky image payloads live in the content-addressed media store; the row
+    # only carries their digests. The *_base64 properties keep the historical
+    # API (constructor kwargs, attribute reads, Event.thumbnail_base64.isnot(None)).
+    # Setting one only hashes the payload; the blob is written when the row is
+    # flushed (_write_pending_media), and read from disk only on access.
+
+    def _stage_media(self, value: str) -> str:
+        """Digest a base64 payload and keep its bytes until the row is flushed."""
+        import base64
+        from app.services.media_store import content_digest, decode_base64_payload
+        data = decode_base64_payload(value)
+        digest = content_digest(data)
+        self.__dict__.setdefault("_media_pending", {})[digest] = data
+        self.__dict__.setdefault("_media_cache", {})[digest] = base64.b64encode(data).decode("ascii")
+        return digest
+
+    def _read_media(self, digest: str):
+        cache = self.__dict__.setdefault("_media_cache", {})
+        if digest not in cache:
+            from app.services.media_store import get_media_store
+            cache[digest] = get_media_store().read_base64(digest)
+        return cache[digest]
+
+    @hybrid_property
+    def thumbnail_base64(self):
+        """Base64 thumbnail loaded from the media store on first access."""
+        if not self.thumbnail_hash:
+            return None
+        return self._read_media(self.thumbnail_hash)
+
+    @thumbnail_base64.setter
+    def thumbnail_base64(self, value):
+        self.thumbnail_hash = self._stage_media(value) if value else None
+
+    @thumbnail_base64.expression
+    def thumbnail_base64(cls):
+        return cls.thumbnail_hash
+
+    @hybrid_property
+    def key_frames_base64(self):
+        """JSON array of base64 key frames loaded from the media store on access."""
+        digests = self.key_frame_digests
+        if not digests:
+            return None
+        return json.dumps([self._read_media(digest) for digest in digests])
+
+    @key_frames_base64.setter
+    def key_frames_base64(self, value):
+        if isinstance(value, str):
+            value = json.loads(value)
+        if not value:
+            self.key_frame_hashes = None
+            return
+        self.key_frame_hashes = json.dumps([self._stage_media(frame) for frame in value])
+
+    @key_frames_base64.expression
+    def key_frames_base64(cls):
+        return cls.key_frame_hashes
+
+    @property
+    def key_frame_digests(self):
+        """Media store digests of the key frames, in gallery order."""
+        from app.services.media_store import parse_digest_list
+        return parse_digest_list(self.key_frame_hashes)
+
+    def media_digests(self):
+        """Every media store digest referenced by this event."""
+        digests = self.key_frame_digests
+        if self.thumbnail_hash:
+            digests.append(self.thumbnail_hash)
+        return digests
+
     def __repr__(self):
         return f"<Event(id={self.id}, camera_id={self.camera_id}, timestamp={self.timestamp}, confidence={self.confidence})>"
+
+
+def _history_digests(target, attr):
+    """(added, removed) digests for a changed media reference column."""
+    from app.services.media_store import parse_digest_list
+    history = sa_inspect(target).attrs[attr].history
+    if attr == "thumbnail_hash":
+        added = [value for value in history.added if value]
+        removed = [value for value in history.deleted if value]
+    else:
+        added = [digest for value in history.added for digest in parse_digest_list(value)]
+        removed = [digest for value in history.deleted for digest in parse_digest_list(value)]
+    return added, removed
+
+
+@sa_event.listens_for(Event, "before_insert")
+@sa_event.listens_for(Event, "before_update")
+def _write_pending_media(mapper, connection, target):
+    """Write blobs set on this event before its row references them."""
+    pending = target.__dict__.pop("_media_pending", None)
+    if pending:
+        from app.services.media_store import get_media_store
+        store = get_media_store()
+        for data in pending.values():
+            store.put(data)
+
+
+@sa_event.listens_for(Event, "after_insert")
+def _add_media_refs(mapper, connection, target):
+    digests = target.media_digests()
+    if digests:
+        from app.services.media_store import get_media_store
+        get_media_store().add_refs(connection, digests)
+
+
+@sa_event.listens_for(Event, "after_update")
+def _update_media_refs(mapper, connection, target):
+    added, removed = [], []
+    for attr in ("thumbnail_hash", "key_frame_hashes"):
+        attr_added, attr_removed = _history_digests(target, attr)
+        added += attr_added
+        removed += attr_removed
+    if added or removed:
+        from app.services.media_store import get_media_store
+        store = get_media_store()
+        store.add_refs(connection, added)
+        store.release_refs(connection, removed)
+
+
+@sa_event.listens_for(Event, "after_delete")
+def _release_media_refs(mapper, connection, target):
+    digests = target.media_digests()
+    if digests:
+        from app.services.media_store import get_media_store
+        get_media_store().release_refs(connection, digests)
@@ -0,0 +1,35 @@
+"""MediaBlob SQLAlchemy ORM model for content-addressed media store bookkeeping"""
+from sqlalchemy import Column, String, Integer, DateTime
+from app.core.database import Base
+from datetime import datetime, timezone
+
+
+class MediaBlob(Base):
+    """
+    Reference count for a blob held in the content-addressed media store.
+
+    The bytes themselves live on disk under ``data/media`` named by their
+    SHA-256 digest (see ``app.services.media_store``); this table only tracks
+    how many event fields point at each digest so identical thumbnails and
+    key frames are stored once and files are removed when nothing uses them.
+
+    Attributes:
+        digest: Hex SHA-256 of the blob contents (primary key, also the file name)
+        size_bytes: Blob size on disk
+        ref_count: Number of event fields referencing the blob
+        created_at: When the blob was first stored (UTC with timezone)
+    """
+
+    __tablename__ = "media_blobs"
+
+    digest = Column(String(64), primary_key=True)
+    size_bytes = Column(Integer, nullable=False, default=0)
+    ref_count = Column(Integer, nullable=False, default=0)
+    created_at = Column(
+        DateTime(timezone=True),
+        nullable=False,
+        default=lambda: datetime.now(timezone.utc)
+    )
+
+    def __repr__(self):
+        return f"<MediaBlob(digest={self.digest[:12]}, size_bytes={self.size_bytes}, ref_count={self.ref_count})>"
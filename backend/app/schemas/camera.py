@@ -49,8 +49,9 @@ class CameraCreate(CameraBase):
     device_index: Optional[int] = Field(None, ge=0, description="USB camera device index (0, 1, 2, ...)")
     # Phase 6 (P6-3.3): Audio settings
     audio_enabled: bool = Field(default=False, description="Whether audio stream extraction is enabled")
-    audio_event_types: Optional[Any] = Field(None, description="JSON array of audio event types to detect: glass_break, gunshot, scream, doorbell")
+    audio_event_types: Optional[Any] = Field(None, description="JSON array of audio event types to detect: glass_break, gunshot, scream, doorbell, alarm")
     audio_threshold: Optional[float] = Field(None, ge=0.0, le=1.0, description="Per-camera confidence threshold override (0.0-1.0)")
+    description_cache_enabled: bool = Field(default=True, description="Reuse a recent AI description when a new frame is near-identical")
 
     @field_validator('audio_event_types', mode='before')
     @classmethod
@@ -131,8 +132,9 @@ class CameraUpdate(BaseModel):
     # Phase 6 (P6-3.1): Audio stream extraction
     audio_enabled: Optional[bool] = Field(None, description="Whether audio stream extraction is enabled")
     # Phase 6 (P6-3.3): Per-camera audio event settings
-    audio_event_types: Optional[Any] = Field(None, description="JSON array of audio event types to detect: glass_break, gunshot, scream, doorbell")
+    audio_event_types: Optional[Any] = Field(None, description="JSON array of audio event types to detect: glass_break, gunshot, scream, doorbell, alarm")
     audio_threshold: Optional[float] = Field(None, ge=0.0, le=1.0, description="Per-camera confidence threshold override (0.0-1.0)")
+    description_cache_enabled: Optional[bool] = Field(None, description="Reuse a recent AI description when a new frame is near-identical")
 
     @field_validator('audio_event_types', mode='before')
     @classmethod
@@ -191,6 +193,7 @@ class CameraResponse(CameraBase):
     # Phase 6 (P6-3.3): Per-camera audio event settings
     audio_event_types: Optional[Any] = Field(None, description="JSON array of audio event types to detect")
     audio_threshold: Optional[float] = Field(None, description="Per-camera confidence threshold override (0.0-1.0)")
+    description_cache_enabled: bool = Field(default=True, description="Reuse a recent AI description when a new frame is near-identical")
 
     # Note: password field is intentionally omitted (write-only field)
     # Note: analysis_mode and homekit_stream_quality are inherited from CameraBase
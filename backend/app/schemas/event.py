@@ -300,6 +300,7 @@ class EventResponse(BaseModel):
     )
     # Story P3-7.5: Key frames gallery display
     key_frames_base64: Optional[List[str]] = Field(None, description="Base64-encoded key frames used for AI analysis")
+    key_frame_urls: Optional[List[str]] = Field(None, description="URLs streaming each key frame as image/jpeg from the media store")
     frame_timestamps: Optional[List[float]] = Field(None, description="Timestamps in seconds for each key frame")
     # Story P4-3.3: Recurring Visitor Detection
     matched_entity: Optional["MatchedEntitySummary"] = Field(None, description="Matched recurring entity, if any")
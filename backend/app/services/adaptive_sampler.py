@@ -1,9 +1,18 @@
 """
 AdaptiveSampler for content-aware frame selection (Story P8-2.4)
 
-Implements adaptive frame sampling using a two-stage algorithm:
-1. Fast histogram comparison as pre-filter (reject highly similar frames quickly)
-2. SSIM (Structural Similarity Index) for borderline cases
+Implements adaptive frame sampling using a tiered algorithm:
+1. Every frame is reduced once to a small grayscale thumbnail, a 64-bin
+   histogram and a 16x16 average hash (FrameSignatures)
+2. Histogram correlation and hash distances for all pairs are computed as
+   vectorized matrices; clearly different or near-identical pairs are
+   decided from these alone
+3. SSIM (Structural Similarity Index), on the thumbnails, only for the
+   remaining ambiguous pairs
+
+Callers that decode video can hand in decoder-scaled grayscale thumbnails
+(see thumbnail_size) instead of full-resolution RGB frames; thumbnails are
+used as-is.
 
 The algorithm prioritizes frames with visual differences while maintaining
 temporal coverage (minimum 500ms spacing). This improves AI analysis quality
@@ -13,6 +22,7 @@ Architecture Reference: docs/sprint-artifacts/tech-spec-epic-P8-2.md
 # Migrated to @singleton: Story P14-5.3
 """
 import logging
+from dataclasses import dataclass
 from typing import List, Tuple
 
 import cv2
@@ -27,15 +37,140 @@ HISTOGRAM_SIMILARITY_THRESHOLD = 0.98  # Fast reject highly similar frames
 SSIM_SIMILARITY_THRESHOLD = 0.95  # Detailed check for borderline cases
 MIN_TEMPORAL_SPACING_MS = 500.0  # Minimum spacing between selected frames
 
+# Tiered prefilter configuration
+THUMBNAIL_WIDTH = 160  # Frames are compared as grayscale thumbnails at most this wide
+HISTOGRAM_BINS = 64
+HASH_SIZE = 16  # 16x16 average hash = 256 bits
+HASH_DIFFERENT_BITS = 64  # >= 25% of hash bits differ: different without SSIM
+HASH_SAME_BITS = 2  # <= this many bits and a near-identical histogram: similar without SSIM
+HISTOGRAM_SAME_THRESHOLD = 0.999
+
+
+def thumbnail_size(width: int, height: int) -> Tuple[int, int]:
+    """
+    Thumbnail dimensions for a frame, preserving aspect ratio and never upscaling.
+
+    Also used by FrameExtractor to have the decoder scale candidate frames
+    directly to this size.
+    """
+    if width <= THUMBNAIL_WIDTH:
+        return width, height
+    return THUMBNAIL_WIDTH, max(1, round(height * THUMBNAIL_WIDTH / width))
+
+
+def make_thumbnail(frame: np.ndarray) -> np.ndarray:
+    """
+    Reduce a frame to a grayscale thumbnail.
+
+    Args:
+        frame: RGB frame (H, W, 3) or an already grayscale frame (H, W)
+
+    Returns:
+        uint8 grayscale array at most THUMBNAIL_WIDTH wide
+    """
+    height, width = frame.shape[:2]
+    size = thumbnail_size(width, height)
+    if size != (width, height):
+        frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+    if frame.ndim == 3:
+        frame = cv2.cvtColor(frame, cv2.COLOR_RGB2GRAY)
+    return frame
+
+
+def _ssim_gray(gray1: np.ndarray, gray2: np.ndarray) -> float:
+    """Mean SSIM of two grayscale images (resized to the smaller if shapes differ)."""
+    if gray1.shape != gray2.shape:
+        h = min(gray1.shape[0], gray2.shape[0])
+        w = min(gray1.shape[1], gray2.shape[1])
+        gray1 = cv2.resize(gray1, (w, h))
+        gray2 = cv2.resize(gray2, (w, h))
+
+    # OpenCV doesn't have built-in SSIM, so we implement it manually
+
+    # Constants for SSIM calculation
+    C1 = (0.01 * 255) ** 2
+    C2 = (0.03 * 255) ** 2
+
+    # Convert to float
+    img1 = gray1.astype(np.float64)
+    img2 = gray2.astype(np.float64)
+
+    # Calculate means
+    mu1 = cv2.GaussianBlur(img1, (11, 11), 1.5)
+    mu2 = cv2.GaussianBlur(img2, (11, 11), 1.5)
+
+    mu1_sq = mu1 ** 2
+    mu2_sq = mu2 ** 2
+    mu1_mu2 = mu1 * mu2
+
+    # Calculate variances and covariance
+    sigma1_sq = cv2.GaussianBlur(img1 ** 2, (11, 11), 1.5) - mu1_sq
+    sigma2_sq = cv2.GaussianBlur(img2 ** 2, (11, 11), 1.5) - mu2_sq
+    sigma12 = cv2.GaussianBlur(img1 * img2, (11, 11), 1.5) - mu1_mu2
+
+    # Calculate SSIM
+    ssim_map = ((2 * mu1_mu2 + C1) * (2 * sigma12 + C2)) / \
+               ((mu1_sq + mu2_sq + C1) * (sigma1_sq + sigma2_sq + C2))
+
+    # Ensure value is in valid range
+    return max(0.0, min(1.0, float(np.mean(ssim_map))))
+
+
+@dataclass
+class FrameSignatures:
+    """
+    Cheap per-frame features, computed once per frame.
+
+    Attributes:
+        thumbnails: Grayscale thumbnails (used for SSIM on ambiguous pairs)
+        histograms: (N, HISTOGRAM_BINS) min-max normalized histograms
+        hashes: (N, HASH_SIZE**2) average-hash bits as float32 0/1
+    """
+    thumbnails: List[np.ndarray]
+    histograms: np.ndarray
+    hashes: np.ndarray
+
+    @classmethod
+    def from_frames(cls, frames: List[np.ndarray]) -> "FrameSignatures":
+        thumbnails = [make_thumbnail(frame) for frame in frames]
+        histograms = np.empty((len(thumbnails), HISTOGRAM_BINS), dtype=np.float32)
+        hashes = np.empty((len(thumbnails), HASH_SIZE * HASH_SIZE), dtype=np.float32)
+        for i, thumb in enumerate(thumbnails):
+            hist = cv2.calcHist([thumb], [0], None, [HISTOGRAM_BINS], [0, 256])
+            cv2.normalize(hist, hist, 0, 1, cv2.NORM_MINMAX)
+            histograms[i] = hist.ravel()
+            small = cv2.resize(thumb, (HASH_SIZE, HASH_SIZE), interpolation=cv2.INTER_AREA)
+            hashes[i] = (small > small.mean()).ravel()
+        return cls(thumbnails=thumbnails, histograms=histograms, hashes=hashes)
+
+    def histogram_similarity(self) -> np.ndarray:
+        """
+        Pairwise histogram similarity matrix in [0, 1].
+
+        Pearson correlation of the histograms (what cv2.HISTCMP_CORREL
+        computes), mapped from [-1, 1] to [0, 1].
+        """
+        centered = self.histograms - self.histograms.mean(axis=1, keepdims=True)
+        norms = np.linalg.norm(centered, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        unit = centered / norms
+        return np.clip((unit @ unit.T + 1.0) / 2.0, 0.0, 1.0)
+
+    def hash_distance(self) -> np.ndarray:
+        """Pairwise Hamming distance matrix between the average hashes."""
+        inverse = 1.0 - self.hashes
+        return np.rint(self.hashes @ inverse.T + inverse @ self.hashes.T).astype(np.int32)
+
 
 @singleton
 class AdaptiveSampler:
     """
     Service for content-aware frame selection.
 
-    Uses a two-stage filtering approach:
-    1. Fast histogram comparison to quickly reject very similar frames
-    2. SSIM for borderline cases when histogram similarity is high
+    Uses a tiered filtering approach:
+    1. Vectorized histogram/hash matrices over per-frame thumbnails decide
+       clearly different and near-identical pairs
+    2. SSIM on the thumbnails for the remaining ambiguous pairs
 
     Key features:
     - Always selects first frame as anchor
@@ -141,50 +276,9 @@ class AdaptiveSampler:
             - 1.0 = identical images
             - 0.0 = completely different images
         """
-        # Convert to grayscale for SSIM
         gray1 = cv2.cvtColor(frame1, cv2.COLOR_RGB2GRAY)
         gray2 = cv2.cvtColor(frame2, cv2.COLOR_RGB2GRAY)
-
-        # Resize to same dimensions if needed
-        if gray1.shape != gray2.shape:
-            h = min(gray1.shape[0], gray2.shape[0])
-            w = min(gray1.shape[1], gray2.shape[1])
-            gray1 = cv2.resize(gray1, (w, h))
-            gray2 = cv2.resize(gray2, (w, h))
-
-        # Calculate SSIM using OpenCV (simplified implementation)
-        # OpenCV doesn't have built-in SSIM, so we implement it manually
-
-        # Constants for SSIM calculation
-        C1 = (0.01 * 255) ** 2
-        C2 = (0.03 * 255) ** 2
-
-        # Convert to float
-        img1 = gray1.astype(np.float64)
-        img2 = gray2.astype(np.float64)
-
-        # Calculate means
-        mu1 = cv2.GaussianBlur(img1, (11, 11), 1.5)
-        mu2 = cv2.GaussianBlur(img2, (11, 11), 1.5)
-
-        mu1_sq = mu1 ** 2
-        mu2_sq = mu2 ** 2
-        mu1_mu2 = mu1 * mu2
-
-        # Calculate variances and covariance
-        sigma1_sq = cv2.GaussianBlur(img1 ** 2, (11, 11), 1.5) - mu1_sq
-        sigma2_sq = cv2.GaussianBlur(img2 ** 2, (11, 11), 1.5) - mu2_sq
-        sigma12 = cv2.GaussianBlur(img1 * img2, (11, 11), 1.5) - mu1_mu2
-
-        # Calculate SSIM
-        ssim_map = ((2 * mu1_mu2 + C1) * (2 * sigma12 + C2)) / \
-                   ((mu1_sq + mu2_sq + C1) * (sigma1_sq + sigma2_sq + C2))
-
-        # Return mean SSIM
-        ssim = float(np.mean(ssim_map))
-
-        # Ensure value is in valid range
-        return max(0.0, min(1.0, ssim))
+        return _ssim_gray(gray1, gray2)
 
     def _is_frame_different(
         self,
@@ -194,9 +288,7 @@ class AdaptiveSampler:
         """
         Determine if a frame is sufficiently different from the reference.
 
-        Uses two-stage filtering:
-        1. Fast histogram comparison
-        2. SSIM for borderline cases
+        Single-pair form of the tiered comparison used by select_diverse_frames.
 
         Args:
             frame: Frame to evaluate
@@ -208,22 +300,60 @@ class AdaptiveSampler:
             - histogram_similarity: Histogram similarity score
             - ssim_similarity: SSIM score (0.0 if not computed)
         """
-        # Stage 1: Fast histogram comparison
-        hist_sim = self.calculate_histogram_similarity(frame, reference_frame)
+        signatures = FrameSignatures.from_frames([frame, reference_frame])
+        return self._compare(
+            signatures,
+            float(signatures.histogram_similarity()[0, 1]),
+            int(signatures.hash_distance()[0, 1]),
+            0,
+            1,
+        )
 
-        # If very different by histogram, definitely include
-        if hist_sim < self.histogram_threshold:
+    def _compare(
+        self,
+        signatures: FrameSignatures,
+        hist_sim: float,
+        hash_dist: int,
+        index: int,
+        reference: int
+    ) -> Tuple[bool, float, float]:
+        """
+        Tiered decision for one pair of frames.
+
+        1. Hash distance >= HASH_DIFFERENT_BITS or histogram similarity below
+           the threshold: different
+        2. Hash distance <= HASH_SAME_BITS with a near-identical histogram:
+           similar
+        3. Otherwise (ambiguous): SSIM on the thumbnails decides
+
+        Returns:
+            Tuple of (is_different, histogram_similarity, ssim_similarity),
+            ssim_similarity being 0.0 when SSIM was not needed
+        """
+        if hash_dist >= HASH_DIFFERENT_BITS or hist_sim < self.histogram_threshold:
             logger.debug(
-                f"Frame accepted (histogram={hist_sim:.3f} < {self.histogram_threshold})",
+                f"Frame accepted (histogram={hist_sim:.3f}, hash_distance={hash_dist})",
                 extra={
                     "event_type": "frame_accepted_histogram",
-                    "histogram_similarity": hist_sim
+                    "histogram_similarity": hist_sim,
+                    "hash_distance": hash_dist
                 }
             )
             return True, hist_sim, 0.0
 
-        # Stage 2: Borderline case - use SSIM for accurate comparison
-        ssim_sim = self.calculate_ssim_similarity(frame, reference_frame)
+        if hash_dist <= HASH_SAME_BITS and hist_sim >= HISTOGRAM_SAME_THRESHOLD:
+            logger.debug(
+                f"Frame rejected (histogram={hist_sim:.3f}, hash_distance={hash_dist})",
+                extra={
+                    "event_type": "frame_rejected_prefilter",
+                    "histogram_similarity": hist_sim,
+                    "hash_distance": hash_dist
+                }
+            )
+            return False, hist_sim, 0.0
+
+        # Ambiguous - use SSIM on the thumbnails for an accurate comparison
+        ssim_sim = _ssim_gray(signatures.thumbnails[index], signatures.thumbnails[reference])
 
         if ssim_sim < self.ssim_threshold:
             logger.debug(
@@ -259,17 +389,18 @@ class AdaptiveSampler:
 
         Algorithm:
         1. Always select first frame as anchor
-        2. For each subsequent frame:
+        2. Compute thumbnails, histograms and hashes once per frame, and the
+           pairwise histogram-similarity and hash-distance matrices
+        3. For each subsequent frame:
            a. Check temporal spacing (min 500ms from last selected)
-           b. Fast histogram comparison vs last selected
-           c. If histogram similarity < threshold, accept
-           d. If borderline, run SSIM comparison
-           e. Accept if SSIM < threshold
-        3. If insufficient frames selected, fill with uniform sampling
-        4. Return selected frames with original indices
+           b. Accept if clearly different from the last selected (hash/histogram)
+           c. Reject if near-identical (hash/histogram)
+           d. Otherwise run SSIM on the thumbnails and accept if < threshold
+        4. If insufficient frames selected, fill with uniform sampling
+        5. Return selected frames with original indices
 
         Args:
-            frames: List of frames as RGB numpy arrays
+            frames: List of frames as RGB numpy arrays, or grayscale thumbnails
             timestamps_ms: List of timestamps in milliseconds for each frame
             target_count: Number of frames to select
             fps: Frames per second for timestamp calculation if timestamps_ms empty
@@ -317,19 +448,23 @@ class AdaptiveSampler:
             )
             return result
 
+        signatures = FrameSignatures.from_frames(frames)
+        hist_matrix = signatures.histogram_similarity()
+        hash_matrix = signatures.hash_distance()
+
         # Selected frames: (original_index, frame, timestamp_ms)
         selected: List[Tuple[int, np.ndarray, float]] = []
 
         # Always select first frame
         selected.append((0, frames[0], timestamps_ms[0]))
         last_selected_timestamp = timestamps_ms[0]
-        last_selected_frame = frames[0]
+        last_selected_index = 0
 
         # Track statistics for logging
         frames_evaluated = 0
         frames_skipped_temporal = 0
         frames_skipped_similar = 0
-        histogram_calls = 0
+        comparisons = 0
         ssim_calls = 0
 
         # Evaluate remaining frames
@@ -343,17 +478,21 @@ class AdaptiveSampler:
                 continue
 
             # Check if frame is different enough
-            is_different, hist_sim, ssim_sim = self._is_frame_different(
-                frames[i], last_selected_frame
+            is_different, hist_sim, ssim_sim = self._compare(
+                signatures,
+                float(hist_matrix[i, last_selected_index]),
+                int(hash_matrix[i, last_selected_index]),
+                i,
+                last_selected_index,
             )
-            histogram_calls += 1
+            comparisons += 1
             if ssim_sim > 0:
                 ssim_calls += 1
 
             if is_different:
                 selected.append((i, frames[i], timestamps_ms[i]))
                 last_selected_timestamp = timestamps_ms[i]
-                last_selected_frame = frames[i]
+                last_selected_index = i
 
                 # If we have enough frames, stop
                 if len(selected) >= target_count:
@@ -371,13 +510,14 @@ class AdaptiveSampler:
                 "frames_evaluated": frames_evaluated,
                 "skipped_temporal": frames_skipped_temporal,
                 "skipped_similar": frames_skipped_similar,
-                "histogram_calls": histogram_calls,
+                "comparisons": comparisons,
                 "ssim_calls": ssim_calls
             }
         )
 
         # If we don't have enough frames, fill with uniform sampling
-        if len(selected) < target_count:
+        used_fallback = len(selected) < target_count
+        if used_fallback:
             selected = self._fill_with_uniform(
                 frames, timestamps_ms, selected, target_count
             )
@@ -396,9 +536,9 @@ class AdaptiveSampler:
                 "selected_indices": selected_indices,
                 "selected_timestamps_ms": selected_timestamps,
                 "frames_evaluated": frames_evaluated,
-                "histogram_calls": histogram_calls,
+                "comparisons": comparisons,
                 "ssim_calls": ssim_calls,
-                "used_fallback": len(selected) > len([s for s in selected if s in selected])
+                "used_fallback": used_fallback
             }
         )
 
@@ -10,11 +10,21 @@ Responsibilities:
 - Record usage after every AI call (tokens, cost, provider, mode, camera, etc.)
 - Query usage statistics (totals, breakdowns, time ranges)
 - Support cost cap enforcement hooks
+
+Running cost totals and hourly rollups live in an in-process AICostLedger
+seeded once from ``ai_usage``, so cost cap checks and the usage dashboards never
+aggregate the table on the request path. Rows are inserted synchronously by
+default; ``start_write_behind()`` (called from the app lifespan) switches to
+batched inserts on a background thread.
 """
 
 import logging
-from datetime import datetime, timezone
-from typing import Optional, Dict, Any
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Dict, Any, Iterator, List
 
 from sqlalchemy import func, case
 from sqlalchemy.orm import Session
@@ -22,9 +32,45 @@ from sqlalchemy.orm import Session
 from app.core.decorators import singleton
 from app.core.database import get_db_session
 from app.models.ai_usage import AIUsage
+from app.services.ai_cost_ledger import (
+    AICostLedger,
+    build_rollups,
+    to_utc_naive,
+)
 
 logger = logging.getLogger(__name__)
 
+# Write-behind tuning: flush at least this often, or sooner once this many
+# rows are queued.
+FLUSH_INTERVAL_SECONDS = 1.0
+FLUSH_BATCH_SIZE = 50
+
+# Wait after a failed ledger seed before scanning ai_usage again
+SEED_RETRY_SECONDS = 30.0
+
+# Camera attributed to AI calls made inside usage_camera_scope()
+_usage_camera_id: ContextVar[Optional[str]] = ContextVar("ai_usage_camera_id", default=None)
+
+
+@contextmanager
+def usage_camera_scope(camera_id: Optional[str]) -> Iterator[None]:
+    """
+    Attribute usage recorded inside the block to a camera.
+
+    The AI providers only see the camera name, so callers that know the
+    camera ID wrap the AI call in this scope instead of threading it through
+    every provider signature.
+
+    Usage:
+        with usage_camera_scope(event.camera_id):
+            result = await ai_service.generate_description(...)
+    """
+    token = _usage_camera_id.set(camera_id)
+    try:
+        yield
+    finally:
+        _usage_camera_id.reset(token)
+
 
 @singleton
 class AICostAndUsageTracker:
@@ -36,7 +82,16 @@ class AICostAndUsageTracker:
     """
 
     def __init__(self):
-        pass
+        self._ledger = AICostLedger()
+        self._flush_lock = threading.Lock()
+        self._flush_wakeup = threading.Event()
+        self._stop_flusher = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        self._seed_failed_at: Optional[float] = None
+
+    @property
+    def ledger(self) -> AICostLedger:
+        return self._ledger
 
     def record_usage(
         self,
@@ -49,28 +104,42 @@ class AICostAndUsageTracker:
         analysis_mode: Optional[str] = None,
         is_estimated: bool = False,
         image_count: Optional[int] = None,
+        camera_id: Optional[str] = None,
     ) -> None:
         """
         Record a single AI API usage event.
 
-        This is the canonical place where usage is persisted.
+        This is the canonical place where usage is persisted. The ledger is
+        updated immediately; the row is inserted inline, or by the
+        write-behind thread when it is running.
+
+        Args:
+            camera_id: Camera that triggered the call. Defaults to the camera
+                of the enclosing usage_camera_scope(), if any.
         """
         try:
-            with get_db_session() as db:
-                usage_record = AIUsage(
-                    timestamp=datetime.now(timezone.utc),
-                    provider=provider,
-                    success=success,
-                    tokens_used=tokens_used,
-                    response_time_ms=response_time_ms,
-                    cost_estimate=cost_estimate,
-                    error=error,
-                    analysis_mode=analysis_mode,
-                    is_estimated=is_estimated,
-                    image_count=image_count,
-                )
-                db.add(usage_record)
-                db.commit()
+            if camera_id is None:
+                camera_id = _usage_camera_id.get()
+
+            self._ensure_seeded()
+            self._ledger.record({
+                "timestamp": datetime.now(timezone.utc),
+                "provider": provider,
+                "success": success,
+                "tokens_used": tokens_used,
+                "response_time_ms": response_time_ms,
+                "cost_estimate": cost_estimate,
+                "error": error,
+                "analysis_mode": analysis_mode,
+                "is_estimated": is_estimated,
+                "image_count": image_count,
+                "camera_id": camera_id,
+            })
+
+            if self._flusher is None:
+                self.flush()
+            elif self._ledger.pending_count >= FLUSH_BATCH_SIZE:
+                self._flush_wakeup.set()
 
             logger.debug(
                 f"Recorded usage: provider={provider}, success={success}, "
@@ -91,6 +160,248 @@ class AICostAndUsageTracker:
         except Exception as e:
             logger.error(f"Failed to record AI usage: {e}", exc_info=True)
 
+    # =====================================================================
+    # Ledger seeding and write-behind persistence
+    # =====================================================================
+
+    def flush(self) -> int:
+        """
+        Insert all queued usage rows in one batch.
+
+        Returns:
+            Number of rows written. Rows are re-queued if the insert fails.
+        """
+        with self._flush_lock:
+            return self._flush_locked()
+
+    def _flush_locked(self) -> int:
+        rows = self._ledger.drain_pending()
+        if not rows:
+            return 0
+        try:
+            with get_db_session() as db:
+                db.bulk_insert_mappings(AIUsage, rows)
+                db.commit()
+        except Exception as e:
+            self._ledger.requeue(rows)
+            logger.error(f"Failed to persist {len(rows)} AI usage rows: {e}", exc_info=True)
+            return 0
+        return len(rows)
+
+    def _ensure_seeded(self, db: Optional[Session] = None) -> bool:
+        """
+        Seed the ledger on first use and roll it forward at UTC day rollover.
+
+        Seeding flushes queued rows and scans the retention window. After a
+        failed seed, reads use the SQL fallback for SEED_RETRY_SECONDS before
+        the scan is tried again.
+
+        Args:
+            db: Optional session to scan with (defaults to get_db_session())
+
+        Returns:
+            True if the ledger is seeded and current.
+        """
+        if self._ledger.is_seeded:
+            self._ledger.roll_forward(datetime.now(timezone.utc))
+            return True
+        if (
+            self._seed_failed_at is not None
+            and time.monotonic() - self._seed_failed_at < SEED_RETRY_SECONDS
+        ):
+            return False
+
+        with self._flush_lock:
+            now = datetime.now(timezone.utc)
+            if self._ledger.is_seeded:
+                return True
+            try:
+                self._flush_locked()
+                since = self._ledger.seed_window_start(now)
+                if db is not None:
+                    rollups = self._scan_rollups(db, since)
+                else:
+                    with get_db_session() as session:
+                        rollups = self._scan_rollups(session, since)
+            except Exception as e:
+                logger.error(f"Failed to seed AI cost ledger: {e}", exc_info=True)
+                self._seed_failed_at = time.monotonic()
+                return False
+
+            self._ledger.replace(rollups, now)
+            self._seed_failed_at = None
+            logger.info(
+                "AI cost ledger seeded",
+                extra={
+                    "event_type": "ai_cost_ledger_seeded",
+                    "rollup_keys": len(rollups),
+                    "daily_cost": round(self._ledger.daily_cost(), 6),
+                    "monthly_cost": round(self._ledger.monthly_cost(), 6),
+                },
+            )
+            return True
+
+    @staticmethod
+    def _scan_rollups(
+        db: Session,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ):
+        """Stream the usage columns needed for rollups and fold them by hour."""
+        query = db.query(
+            AIUsage.timestamp,
+            AIUsage.provider,
+            AIUsage.analysis_mode,
+            AIUsage.camera_id,
+            AIUsage.success,
+            AIUsage.tokens_used,
+            AIUsage.cost_estimate,
+            AIUsage.response_time_ms,
+        )
+        if start_date:
+            query = query.filter(AIUsage.timestamp >= start_date)
+        if end_date:
+            query = query.filter(AIUsage.timestamp <= end_date)
+        return build_rollups(query.yield_per(5000))
+
+    def start_write_behind(self) -> None:
+        """Start batching usage inserts on a background thread."""
+        if self._flusher is not None:
+            return
+        self._stop_flusher.clear()
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name="ai-usage-writer", daemon=True
+        )
+        self._flusher.start()
+        logger.info(
+            "AI usage write-behind started",
+            extra={
+                "event_type": "ai_usage_write_behind_started",
+                "flush_interval_s": FLUSH_INTERVAL_SECONDS,
+                "batch_size": FLUSH_BATCH_SIZE,
+            },
+        )
+
+    def stop_write_behind(self) -> None:
+        """Stop the background writer and flush anything still queued."""
+        flusher = self._flusher
+        if flusher is not None:
+            self._stop_flusher.set()
+            self._flush_wakeup.set()
+            flusher.join(timeout=5.0)
+            self._flusher = None
+        self.flush()
+
+    def _flush_loop(self) -> None:
+        while not self._stop_flusher.is_set():
+            self._flush_wakeup.wait(FLUSH_INTERVAL_SECONDS)
+            self._flush_wakeup.clear()
+            self.flush()
+
+    # =====================================================================
+    # Rollup-backed views for /system/ai-usage and /system/ai-cost-trends
+    # =====================================================================
+
+    def _rollups_for(
+        self,
+        start_date: Optional[datetime],
+        end_date: Optional[datetime],
+        db: Optional[Session] = None,
+    ):
+        """Rollups for a range, scanning the table only if it predates the ledger window."""
+        if self._ensure_seeded(db):
+            window_start = self._ledger.window_start
+            if start_date is not None and to_utc_naive(start_date) >= window_start:
+                return self._ledger.query(start_date, end_date)
+
+        self.flush()
+        if db is not None:
+            return list(self._scan_rollups(db, start_date, end_date).items())
+        with get_db_session() as session:
+            return list(self._scan_rollups(session, start_date, end_date).items())
+
+    def get_usage_rollup(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        db: Optional[Session] = None,
+    ) -> Dict[str, Any]:
+        """
+        Usage totals with per-day, per-provider, per-mode and per-camera breakdowns.
+
+        Served from the ledger's hourly rollups (hour granularity at the range
+        edges).
+
+        Args:
+            start_date: Range start (inclusive)
+            end_date: Range end (inclusive)
+            db: Optional session used to seed the ledger or scan old ranges
+
+        Returns:
+            Dict with total_cost, total_requests and by_date/by_provider/
+            by_mode/by_camera dicts of {"cost": float, "requests": int}.
+            by_camera omits usage without camera attribution.
+        """
+        views: Dict[str, Dict[str, Dict[str, Any]]] = {
+            "by_date": {}, "by_provider": {}, "by_mode": {}, "by_camera": {},
+        }
+        total_cost = 0.0
+        total_requests = 0
+
+        for (hour, provider, mode, camera_id), rollup in self._rollups_for(start_date, end_date, db):
+            total_cost += rollup.cost
+            total_requests += rollup.calls
+            for view, key in (
+                ("by_date", hour.strftime("%Y-%m-%d")),
+                ("by_provider", provider or "unknown"),
+                ("by_mode", mode or "unknown"),
+                ("by_camera", camera_id),
+            ):
+                if key is None:
+                    continue
+                entry = views[view].setdefault(key, {"cost": 0.0, "requests": 0})
+                entry["cost"] += rollup.cost
+                entry["requests"] += rollup.calls
+
+        return {"total_cost": total_cost, "total_requests": total_requests, **views}
+
+    def get_cost_trends(self, days_back: int = 30, bucket: str = "day") -> List[Dict[str, Any]]:
+        """
+        Cost and token trends bucketed by day or hour, oldest first.
+
+        Returns:
+            List of {"bucket", "calls", "total_cost", "total_tokens",
+            "avg_response_time_ms"} dicts. Bucket labels are "YYYY-MM-DD" or
+            "YYYY-MM-DD HH:00".
+        """
+        end = datetime.now(timezone.utc)
+        start = end - timedelta(days=days_back)
+        fmt = "%Y-%m-%d %H:00" if bucket == "hour" else "%Y-%m-%d"
+
+        buckets: Dict[str, Dict[str, Any]] = {}
+        for (hour, _, _, _), rollup in self._rollups_for(start, end):
+            label = hour.strftime(fmt)
+            entry = buckets.setdefault(
+                label, {"calls": 0, "cost": 0.0, "tokens": 0, "response_time_ms": 0}
+            )
+            entry["calls"] += rollup.calls
+            entry["cost"] += rollup.cost
+            entry["tokens"] += rollup.tokens
+            entry["response_time_ms"] += rollup.response_time_ms
+
+        return [
+            {
+                "bucket": label,
+                "calls": entry["calls"],
+                "total_cost": round(entry["cost"], 6),
+                "total_tokens": entry["tokens"],
+                "avg_response_time_ms": (
+                    round(entry["response_time_ms"] / entry["calls"], 1) if entry["calls"] else None
+                ),
+            }
+            for label, entry in sorted(buckets.items())
+        ]
+
     def get_usage_stats(
         self,
         start_date: Optional[datetime] = None,
@@ -101,6 +412,7 @@ class AICostAndUsageTracker:
 
         Returns totals and per-provider breakdowns.
         """
+        self.flush()
         try:
             with get_db_session() as db:
                 query = db.query(AIUsage)
@@ -170,33 +482,48 @@ class AICostAndUsageTracker:
     # =====================================================================
 
     def get_daily_cost(self) -> float:
-        """Total successful AI cost for today (UTC)."""
-        today = datetime.now(timezone.utc).date()
-        try:
-            with get_db_session() as db:
-                result = db.query(func.sum(AIUsage.cost_estimate)).filter(
-                    func.date(AIUsage.timestamp) == today,
-                    AIUsage.success == True
-                ).scalar()
-                return float(result or 0.0)
-        except Exception as e:
-            logger.error(f"Failed to get daily cost: {e}")
-            return 0.0
+        """Total successful AI cost for today (UTC), from the ledger."""
+        if self._ensure_seeded():
+            return self._ledger.daily_cost()
+        today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+        return self._query_successful_cost_since(today, "daily")
 
     def get_monthly_cost(self) -> float:
-        """Total successful AI cost for current month (UTC)."""
+        """Total successful AI cost for current month (UTC), from the ledger."""
+        if self._ensure_seeded():
+            return self._ledger.monthly_cost()
         now = datetime.now(timezone.utc)
         start_of_month = now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        return self._query_successful_cost_since(start_of_month, "monthly")
+
+    def get_cluster_cost(self, period: str = "daily") -> float:
+        """
+        Total successful AI cost for the current period across all replicas.
 
+        The ledger only sees this process's calls. In cluster mode the total
+        comes from ai_usage, which every replica writes, plus this process's
+        rows still queued for the write-behind insert. Rows queued on other
+        replicas show up within FLUSH_INTERVAL_SECONDS.
+        """
+        now = datetime.now(timezone.utc)
+        since = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        if period == "monthly":
+            since = since.replace(day=1)
+        # Holding the flush lock keeps rows from being neither queued nor stored
+        with self._flush_lock:
+            return self._query_successful_cost_since(since, period) + self._ledger.pending_cost(since)
+
+    def _query_successful_cost_since(self, since: datetime, label: str) -> float:
+        """SQL fallback used when the ledger could not be seeded."""
         try:
             with get_db_session() as db:
                 result = db.query(func.sum(AIUsage.cost_estimate)).filter(
-                    AIUsage.timestamp >= start_of_month,
+                    AIUsage.timestamp >= since,
                     AIUsage.success == True
                 ).scalar()
                 return float(result or 0.0)
         except Exception as e:
-            logger.error(f"Failed to get monthly cost: {e}")
+            logger.error(f"Failed to get {label} cost: {e}")
             return 0.0
 
     def get_current_period_cost(self, period: str = "daily") -> float:
@@ -208,10 +535,21 @@ class AICostAndUsageTracker:
     def get_usage_by_camera(
         self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
     ) -> Dict[str, Dict[str, Any]]:
-        """Return usage broken down by camera_id."""
-        # This can be expanded later. For now we return a basic structure.
-        # Full implementation would require storing camera_id on AIUsage (future improvement).
-        return {}  # Placeholder — camera-level breakdown not yet persisted on AIUsage
+        """Return usage broken down by camera_id (calls, tokens, cost)."""
+        breakdown: Dict[str, Dict[str, Any]] = {}
+        try:
+            rollups = self._rollups_for(start_date, end_date)
+        except Exception as e:
+            logger.error(f"Failed to get usage by camera: {e}")
+            return {}
+        for (_, _, _, camera_id), rollup in rollups:
+            if camera_id is None:
+                continue
+            entry = breakdown.setdefault(camera_id, {"calls": 0, "tokens": 0, "cost": 0.0})
+            entry["calls"] += rollup.calls
+            entry["tokens"] += rollup.tokens
+            entry["cost"] += rollup.cost
+        return breakdown
 
     def get_provider_breakdown(
         self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
@@ -227,6 +565,7 @@ class AICostAndUsageTracker:
         Return daily aggregates for charts (date, calls, tokens, cost, success_rate).
         Useful for cost trend dashboards.
         """
+        self.flush()
         try:
             with get_db_session() as db:
                 query = db.query(
@@ -259,14 +598,8 @@ class AICostAndUsageTracker:
             return []
 
     def get_top_expensive_cameras(self, limit: int = 10, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None) -> list[Dict[str, Any]]:
-        """
-        Top cameras by cost.
-        Note: Requires camera_id on AIUsage records (not yet stored in current schema).
-        Returns empty list for now.
-        """
-        # TODO: Once camera_id is stored on AIUsage (or joined via events), implement real query.
-        logger.debug("get_top_expensive_cameras: camera_id not yet on AIUsage model — returning empty")
-        return []
+        """Top cameras by cost (alias of get_top_cameras_by_cost)."""
+        return self.get_top_cameras_by_cost(limit, start_date, end_date)
 
     def get_usage_summary_for_period(self, period: str = "daily") -> Dict[str, Any]:
         """Convenience for dashboards: current daily or monthly summary."""
@@ -293,6 +626,7 @@ class AICostAndUsageTracker:
         Hourly aggregates for fine-grained charts (e.g. intra-day cost spikes).
         Groups by hour.
         """
+        self.flush()
         try:
             with get_db_session() as db:
                 query = db.query(
@@ -332,16 +666,14 @@ class AICostAndUsageTracker:
         """
         Top N cameras by total cost.
 
-        NOTE: Requires `camera_id` column on AIUsage (not present in current schema).
-        Returns empty list with a clear message for now.
-        When camera_id is added to AIUsage (and passed in record_usage),
-        this method will become fully functional.
+        Only usage recorded with a camera_id (see usage_camera_scope) is counted.
         """
-        logger.info(
-            "get_top_cameras_by_cost called — camera_id is not yet stored on AIUsage. "
-            "Returning empty list. Add camera_id to the model + pass it from callers to enable this."
-        )
-        return []
+        breakdown = self.get_usage_by_camera(start_date, end_date)
+        ranked = sorted(breakdown.items(), key=lambda item: item[1]["cost"], reverse=True)
+        return [
+            {"camera_id": camera_id, **{**data, "cost": round(data["cost"], 6)}}
+            for camera_id, data in ranked[:limit]
+        ]
 
     def get_usage_trend(
         self, granularity: str = "daily", start_date: Optional[datetime] = None, end_date: Optional[datetime] = None
@@ -0,0 +1,260 @@
+"""
+In-memory AI cost ledger
+
+Keeps running AI spend totals and hourly usage rollups in process so cost cap
+checks and usage dashboards do not have to aggregate the ``ai_usage`` table
+on every request.
+
+The ledger is owned by AICostAndUsageTracker, which seeds it from the database
+once and then feeds it every row passed to ``record_usage``; UTC day rollover
+is handled in memory. The ledger also queues those rows so the tracker can
+batch-insert them off the hot path.
+
+Rollups are keyed by (UTC hour, provider, analysis_mode, camera_id); per-day,
+per-provider, per-mode and per-camera views are folded from them on demand.
+The number of keys is bounded by hours x providers x modes x cameras, so a
+year of history for a typical install stays in the tens of thousands.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# How much history the ledger keeps in memory. Covers the 365-day maximum of
+# /system/ai-cost-trends plus a month of slack for the monthly total.
+ROLLUP_RETENTION_DAYS = 400
+
+# (hour bucket as naive UTC datetime, provider, analysis_mode, camera_id)
+RollupKey = Tuple[datetime, str, Optional[str], Optional[str]]
+
+
+def to_utc_naive(ts: datetime) -> datetime:
+    """Normalize a timestamp to naive UTC (SQLite returns naive datetimes)."""
+    if ts.tzinfo is not None:
+        ts = ts.astimezone(timezone.utc).replace(tzinfo=None)
+    return ts
+
+
+def hour_bucket(ts: datetime) -> datetime:
+    """Truncate a timestamp to its naive UTC hour."""
+    return to_utc_naive(ts).replace(minute=0, second=0, microsecond=0)
+
+
+@dataclass
+class UsageRollup:
+    """Aggregated usage for one rollup key."""
+
+    calls: int = 0
+    successful: int = 0
+    tokens: int = 0
+    cost: float = 0.0
+    success_cost: float = 0.0
+    response_time_ms: int = 0
+
+    def add(self, success: bool, tokens: int, cost: float, response_time_ms: int) -> None:
+        self.calls += 1
+        self.tokens += tokens
+        self.cost += cost
+        self.response_time_ms += response_time_ms
+        if success:
+            self.successful += 1
+            self.success_cost += cost
+
+    def merge(self, other: "UsageRollup") -> None:
+        self.calls += other.calls
+        self.successful += other.successful
+        self.tokens += other.tokens
+        self.cost += other.cost
+        self.success_cost += other.success_cost
+        self.response_time_ms += other.response_time_ms
+
+
+def build_rollups(rows: Iterable[Tuple]) -> Dict[RollupKey, UsageRollup]:
+    """
+    Fold usage rows into hourly rollups.
+
+    Args:
+        rows: Iterable of (timestamp, provider, analysis_mode, camera_id,
+            success, tokens_used, cost_estimate, response_time_ms) tuples
+
+    Returns:
+        Dict mapping rollup key to UsageRollup
+    """
+    rollups: Dict[RollupKey, UsageRollup] = {}
+    for ts, provider, mode, camera_id, success, tokens, cost, response_time in rows:
+        key = (hour_bucket(ts), provider, mode, camera_id)
+        rollup = rollups.get(key)
+        if rollup is None:
+            rollup = rollups[key] = UsageRollup()
+        rollup.add(bool(success), tokens or 0, cost or 0.0, response_time or 0)
+    return rollups
+
+
+class AICostLedger:
+    """
+    Running AI cost totals and hourly usage rollups.
+
+    Thread Safety:
+        All state is guarded by a single lock. ``record`` is O(1); cost reads
+        are O(1); rollup queries are linear in the number of rollup keys.
+    """
+
+    def __init__(self, retention_days: int = ROLLUP_RETENTION_DAYS):
+        self.retention_days = retention_days
+        self._lock = threading.Lock()
+        self._seeded = False
+        self._period_day: Optional[date] = None
+        self._daily_cost = 0.0
+        self._monthly_cost = 0.0
+        self._window_start: Optional[datetime] = None
+        self._rollups: Dict[RollupKey, UsageRollup] = {}
+        self._pending: List[Dict[str, Any]] = []
+
+    @property
+    def is_seeded(self) -> bool:
+        return self._seeded
+
+    @property
+    def window_start(self) -> Optional[datetime]:
+        """Oldest hour (naive UTC) covered by the in-memory rollups."""
+        return self._window_start
+
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+
+    def seed_window_start(self, now: datetime) -> datetime:
+        """Start of the history window a seed scan should cover."""
+        return hour_bucket(now) - timedelta(days=self.retention_days)
+
+    def roll_forward(self, now: datetime) -> bool:
+        """Start a new UTC day from the rollups in memory; True if the day changed."""
+        day = to_utc_naive(now).date()
+        with self._lock:
+            if not self._seeded or day == self._period_day:
+                return False
+            window_start = self.seed_window_start(now)
+            self._rollups = {
+                key: rollup for key, rollup in self._rollups.items() if key[0] >= window_start
+            }
+            self._window_start = window_start
+            self._period_day = day
+            self._recompute_period_totals()
+            return True
+
+    def replace(self, rollups: Dict[RollupKey, UsageRollup], now: datetime) -> None:
+        """
+        Install freshly scanned rollups and recompute the period totals.
+
+        Rows still queued for insert were not part of the scan, so they are
+        re-applied on top of it.
+
+        Args:
+            rollups: Rollups built from the database scan
+            now: Time the scan was taken
+        """
+        with self._lock:
+            self._rollups = rollups
+            self._window_start = self.seed_window_start(now)
+            for row in self._pending:
+                self._apply(row)
+            self._period_day = to_utc_naive(now).date()
+            self._recompute_period_totals()
+            self._seeded = True
+
+    def record(self, row: Dict[str, Any]) -> None:
+        """
+        Apply a usage row to the totals and rollups and queue it for insert.
+
+        Args:
+            row: AIUsage column mapping (timestamp, provider, success, ...)
+        """
+        with self._lock:
+            self._apply(row)
+            self._pending.append(row)
+            if row["success"] and self._seeded:
+                ts = to_utc_naive(row["timestamp"])
+                if ts.date() == self._period_day:
+                    self._daily_cost += row["cost_estimate"]
+                if (ts.year, ts.month) == (self._period_day.year, self._period_day.month):
+                    self._monthly_cost += row["cost_estimate"]
+
+    def drain_pending(self) -> List[Dict[str, Any]]:
+        """Take all rows queued for insert."""
+        with self._lock:
+            rows, self._pending = self._pending, []
+        return rows
+
+    def requeue(self, rows: List[Dict[str, Any]]) -> None:
+        """Put rows back at the head of the queue after a failed insert."""
+        with self._lock:
+            self._pending[:0] = rows
+
+    def pending_cost(self, since: datetime) -> float:
+        """Successful cost of rows still queued for insert, recorded at or after since."""
+        since = to_utc_naive(since)
+        with self._lock:
+            return sum(
+                row["cost_estimate"] or 0.0
+                for row in self._pending
+                if row["success"] and to_utc_naive(row["timestamp"]) >= since
+            )
+
+    def daily_cost(self) -> float:
+        return self._daily_cost
+
+    def monthly_cost(self) -> float:
+        return self._monthly_cost
+
+    def query(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> List[Tuple[RollupKey, UsageRollup]]:
+        """
+        Return rollups whose hour falls within [start, end].
+
+        Hour granularity: a bucket is included when its hour overlaps the range.
+        """
+        start_hour = hour_bucket(start) if start else None
+        end_naive = to_utc_naive(end) if end else None
+        with self._lock:
+            return [
+                (key, UsageRollup(**vars(rollup)))
+                for key, rollup in self._rollups.items()
+                if (start_hour is None or key[0] >= start_hour)
+                and (end_naive is None or key[0] <= end_naive)
+            ]
+
+    def _apply(self, row: Dict[str, Any]) -> None:
+        key = (
+            hour_bucket(row["timestamp"]),
+            row["provider"],
+            row.get("analysis_mode"),
+            row.get("camera_id"),
+        )
+        rollup = self._rollups.get(key)
+        if rollup is None:
+            rollup = self._rollups[key] = UsageRollup()
+        rollup.add(
+            row["success"],
+            row.get("tokens_used") or 0,
+            row.get("cost_estimate") or 0.0,
+            row.get("response_time_ms") or 0,
+        )
+
+    def _recompute_period_totals(self) -> None:
+        day = self._period_day
+        daily = monthly = 0.0
+        for (hour, _, _, _), rollup in self._rollups.items():
+            if (hour.year, hour.month) != (day.year, day.month):
+                continue
+            monthly += rollup.success_cost
+            if hour.date() == day:
+                daily += rollup.success_cost
+        self._daily_cost = daily
+        self._monthly_cost = monthly
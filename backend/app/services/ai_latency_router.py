@@ -0,0 +1,312 @@
+"""
+Latency-aware provider routing for VisionAnalysisOrchestrator.
+
+The fallback chain used to be a fixed order, so a slow but healthy first
+provider set the time-to-description of every event. The router keeps a
+rolling window of single-image call outcomes per provider and model and
+reorders the chain by expected completion time:
+
+    expected_ms = p50 latency / success rate
+
+Only providers with at least ``AI_LATENCY_MIN_SAMPLES`` recent samples are
+reordered, and only among the positions they already occupy in the base
+order; providers without measurements (new, or whose samples aged out of
+``AI_LATENCY_WINDOW_SECONDS``) keep their configured slot so they get
+measured again. Providers whose mean cost per call exceeds
+``AI_ROUTING_MAX_COST_PER_CALL_USD`` sort after those within budget.
+
+With ``AI_HEDGING_ENABLED`` the orchestrator sends a second request to the
+next provider once the first has been running longer than its p95, keeps
+whichever succeeds first and cancels the other. The cancelled request is
+recorded as a censored sample: its elapsed time is a lower bound on its
+latency, and its outcome is unknown. Hedge outcomes and their extra cost
+are recorded here and served by ``GET /system/ai-providers``.
+"""
+import logging
+import math
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Deque, Dict, List, Optional, Sequence, Tuple
+
+from app.core.config import settings
+from app.core.decorators import singleton
+
+logger = logging.getLogger(__name__)
+
+# Samples kept per provider/model regardless of the time window
+MAX_SAMPLES = 200
+
+
+@dataclass
+class LatencySample:
+    """One single-image call; censored if it was cancelled before it answered."""
+    at: float  # time.monotonic()
+    latency_ms: float
+    success: bool
+    cost_usd: float
+    censored: bool = False
+
+
+def _percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending sequence."""
+    rank = math.ceil(pct / 100 * len(sorted_values))
+    return sorted_values[min(max(rank, 1), len(sorted_values)) - 1]
+
+
+@singleton
+class AILatencyRouter:
+    """
+    Rolling latency/error statistics per provider and model, used to order
+    the fallback chain and to decide when to hedge.
+
+    Attributes:
+        window_seconds: Age after which samples are discarded
+        min_samples: Samples needed before a provider is reordered or hedged
+        max_cost_per_call: Cost budget per call in USD (0 = no budget)
+        hedging_enabled: Whether the orchestrator may send hedged requests
+        hedge_min_delay_ms: Floor for the hedge delay
+    """
+
+    def __init__(
+        self,
+        window_seconds: Optional[float] = None,
+        min_samples: Optional[int] = None,
+        max_cost_per_call: Optional[float] = None,
+        hedging_enabled: Optional[bool] = None,
+        hedge_min_delay_ms: Optional[float] = None,
+    ):
+        self.enabled = settings.AI_LATENCY_ROUTING_ENABLED
+        self.window_seconds = (
+            settings.AI_LATENCY_WINDOW_SECONDS if window_seconds is None else window_seconds
+        )
+        self.min_samples = settings.AI_LATENCY_MIN_SAMPLES if min_samples is None else min_samples
+        self.max_cost_per_call = (
+            settings.AI_ROUTING_MAX_COST_PER_CALL_USD if max_cost_per_call is None else max_cost_per_call
+        )
+        self.hedging_enabled = settings.AI_HEDGING_ENABLED if hedging_enabled is None else hedging_enabled
+        self.hedge_min_delay_ms = (
+            settings.AI_HEDGE_MIN_DELAY_MS if hedge_min_delay_ms is None else hedge_min_delay_ms
+        )
+        self._samples: Dict[Tuple[str, Optional[str]], Deque[LatencySample]] = {}
+        self._lock = threading.Lock()
+        self._decisions: Deque[Dict[str, Any]] = deque(maxlen=20)
+        self._hedges = {"fired": 0, "primary_won": 0, "backup_won": 0, "both_failed": 0}
+        self._hedge_extra_cost = 0.0
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def record(
+        self,
+        provider: str,
+        model: Optional[str],
+        latency_ms: float,
+        success: bool,
+        cost_usd: float = 0.0,
+        censored: bool = False,
+    ) -> None:
+        """
+        Record the outcome of one call (including its backoff retries).
+
+        A censored call was cancelled after latency_ms without answering;
+        it counts towards the latency percentiles but not the error rate.
+        """
+        sample = LatencySample(time.monotonic(), latency_ms, success, cost_usd or 0.0, censored)
+        with self._lock:
+            samples = self._samples.get((provider, model))
+            if samples is None:
+                samples = deque(maxlen=MAX_SAMPLES)
+                self._samples[(provider, model)] = samples
+            samples.append(sample)
+
+    def record_hedge(self, primary: str, backup: str, winner: Optional[str], extra_cost_usd: float) -> None:
+        """
+        Record a hedged request.
+
+        Args:
+            primary: Provider that was slower than its p95
+            backup: Provider the hedge was sent to
+            winner: Provider whose result was used, None if both failed
+            extra_cost_usd: Cost of the request that was not used
+        """
+        from app.core import metrics as prom
+
+        outcome = "both_failed" if winner is None else ("primary_won" if winner == primary else "backup_won")
+        with self._lock:
+            self._hedges["fired"] += 1
+            self._hedges[outcome] += 1
+            self._hedge_extra_cost += extra_cost_usd
+            self._decisions.append({
+                "at": datetime.now(timezone.utc).isoformat(),
+                "type": "hedge",
+                "primary": primary,
+                "backup": backup,
+                "outcome": outcome,
+                "extra_cost_usd": round(extra_cost_usd, 6),
+            })
+        prom.ai_hedged_requests_total.labels(outcome=outcome).inc()
+        prom.ai_hedge_extra_cost_usd_total.inc(extra_cost_usd)
+        logger.info(
+            f"Hedged {primary} with {backup}: {outcome}",
+            extra={
+                "event_type": "ai_hedge_completed",
+                "primary": primary,
+                "backup": backup,
+                "outcome": outcome,
+                "extra_cost_usd": extra_cost_usd,
+            }
+        )
+
+    # ------------------------------------------------------------------
+    # Statistics
+    # ------------------------------------------------------------------
+
+    def _recent(self, provider: str, model: Optional[str]) -> List[LatencySample]:
+        cutoff = time.monotonic() - self.window_seconds
+        with self._lock:
+            samples = self._samples.get((provider, model))
+            if not samples:
+                return []
+            while samples and samples[0].at < cutoff:
+                samples.popleft()
+            return list(samples)
+
+    def stats(self, provider: str, model: Optional[str]) -> Optional[Dict[str, float]]:
+        """
+        Rolling statistics for a provider/model.
+
+        Returns:
+            Dict with samples, censored, p50_ms, p95_ms, error_rate,
+            mean_cost_usd and expected_ms, or None without enough recent samples
+        """
+        samples = self._recent(provider, model)
+        if len(samples) < max(1, self.min_samples):
+            return None
+        # Censored latencies are lower bounds; dropping them would make a
+        # provider that keeps losing hedges look faster than it is
+        latencies = sorted(s.latency_ms for s in samples)
+        completed = [s for s in samples if not s.censored]
+        successes = [s for s in completed if s.success]
+        success_rate = len(successes) / len(completed) if completed else 1.0
+        p50 = _percentile(latencies, 50)
+        return {
+            "samples": len(samples),
+            "censored": len(samples) - len(completed),
+            "p50_ms": round(p50, 1),
+            "p95_ms": round(_percentile(latencies, 95), 1),
+            "error_rate": round(1 - success_rate, 4),
+            "mean_cost_usd": (
+                round(sum(s.cost_usd for s in successes) / len(successes), 6) if successes else 0.0
+            ),
+            # Expected time to a description when failures are retried elsewhere
+            "expected_ms": round(p50 / max(success_rate, 0.05), 1),
+        }
+
+    # ------------------------------------------------------------------
+    # Decisions
+    # ------------------------------------------------------------------
+
+    def rank(self, order: Sequence[Any], models: Dict[Any, Optional[str]]) -> List[Any]:
+        """
+        Reorder a fallback chain by expected completion time.
+
+        Args:
+            order: Base provider order (AIProvider enums or names)
+            models: Model name per provider, for providers that are configured
+
+        Returns:
+            The reordered chain; unmeasured providers keep their position
+        """
+        if not self.enabled:
+            return list(order)
+
+        def name(provider: Any) -> str:
+            return getattr(provider, "value", provider)
+
+        measured: Dict[Any, Dict[str, float]] = {}
+        for provider in order:
+            if provider in models:
+                stats = self.stats(name(provider), models[provider])
+                if stats is not None:
+                    measured[provider] = stats
+        if len(measured) < 2:
+            return list(order)
+
+        def key(provider: Any) -> Tuple[bool, float]:
+            stats = measured[provider]
+            over_budget = self.max_cost_per_call > 0 and stats["mean_cost_usd"] > self.max_cost_per_call
+            return over_budget, stats["expected_ms"]
+
+        ranked = iter(sorted(measured, key=key))
+        result = [next(ranked) if provider in measured else provider for provider in order]
+        if result != list(order):
+            with self._lock:
+                self._decisions.append({
+                    "at": datetime.now(timezone.utc).isoformat(),
+                    "type": "order",
+                    "order": [name(p) for p in result],
+                    "expected_ms": {name(p): measured[p]["expected_ms"] for p in measured},
+                })
+        return result
+
+    def hedge_delay_ms(self, provider: str, model: Optional[str]) -> Optional[float]:
+        """Delay after which a hedge is sent (the provider's p95), None to not hedge."""
+        if not self.hedging_enabled:
+            return None
+        stats = self.stats(provider, model)
+        if stats is None:
+            return None
+        return max(stats["p95_ms"], self.hedge_min_delay_ms)
+
+    def within_budget(self, provider: str, model: Optional[str]) -> bool:
+        """Whether a provider's mean cost per call fits the cost budget."""
+        if self.max_cost_per_call <= 0:
+            return True
+        stats = self.stats(provider, model)
+        return stats is None or stats["mean_cost_usd"] <= self.max_cost_per_call
+
+    def estimated_cost(self, provider: str, model: Optional[str]) -> float:
+        """Mean cost of a successful call, 0.0 if unknown."""
+        stats = self.stats(provider, model)
+        return stats["mean_cost_usd"] if stats else 0.0
+
+    def get_status(self) -> Dict[str, Any]:
+        """Routing statistics, hedging outcomes and recent decisions."""
+        with self._lock:
+            keys = list(self._samples)
+            hedges = dict(self._hedges)
+            extra_cost = self._hedge_extra_cost
+            decisions = list(self._decisions)
+        providers = []
+        for provider, model in keys:
+            stats = self.stats(provider, model)
+            entry: Dict[str, Any] = {"provider": provider, "model": model}
+            if stats is None:
+                entry["samples"] = len(self._recent(provider, model))
+            else:
+                entry.update(stats)
+            providers.append(entry)
+        return {
+            "enabled": self.enabled,
+            "hedging_enabled": self.hedging_enabled,
+            "max_cost_per_call_usd": self.max_cost_per_call,
+            "window_seconds": self.window_seconds,
+            "min_samples": self.min_samples,
+            "providers": providers,
+            "hedging": {**hedges, "extra_cost_usd": round(extra_cost, 6)},
+            "recent_decisions": decisions,
+        }
+
+
+def get_ai_latency_router() -> AILatencyRouter:
+    """Get the global AILatencyRouter instance."""
+    return AILatencyRouter()
+
+
+def reset_ai_latency_router() -> None:
+    """Reset the global AILatencyRouter instance (for testing)."""
+    AILatencyRouter._reset_instance()
@@ -25,13 +25,28 @@ import logging
 import time
 import uuid
 from collections import deque
-from typing import Optional, TYPE_CHECKING, Callable, Awaitable, Any, Dict, List
+from typing import Optional, TYPE_CHECKING, Callable, Awaitable, Any, Dict, List, Sequence, Tuple
 
 import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
 
-from app.core.database import SessionLocal
+from app.core.config import settings
+from app.core.database import SessionLocal, get_async_db_session
 from app.core.decorators import singleton
+from app.models.camera import Camera
 from app.models.event import Event
+from app.services.description_cache_service import (
+    description_context_key,
+    frame_hash,
+    get_description_cache_service,
+)
+from app.services.post_processing import (
+    STATUS_OK,
+    EventUnitOfWork,
+    PostProcessingGraph,
+    PostProcessingStage,
+)
 
 if TYPE_CHECKING:
     from app.services.ai_service import AIService
@@ -66,6 +81,7 @@ class AIProcessingCoordinator:
         vehicle_embedding_service: Any = None,
         entity_service: Any = None,
         ai_semaphore: Optional[asyncio.Semaphore] = None,
+        store_event: Optional[Callable[..., Awaitable[Optional[str]]]] = None,
     ):
         self.ai_service = ai_service
         self.metrics = metrics
@@ -78,6 +94,8 @@ class AIProcessingCoordinator:
         self.vehicle_embedding_service = vehicle_embedding_service
         self.entity_service = entity_service
         self.ai_semaphore = ai_semaphore or asyncio.Semaphore(8)
+        # Persists an event payload and returns its id (EventProcessor._store_event_with_retry)
+        self.store_event = store_event
 
         # Lightweight in-memory counters for the debug/stats endpoint
         self._total_processed = 0
@@ -87,6 +105,7 @@ class AIProcessingCoordinator:
         self._ocr_used_count = 0
         self._low_confidence_count = 0
         self._regenerated_count = 0
+        self._description_cache_hit_count = 0
 
         # Ring buffer for recent activity
         self._recent_activity: deque[Dict] = deque(maxlen=50)
@@ -124,6 +143,8 @@ class AIProcessingCoordinator:
             "ocr_used_count": self._ocr_used_count,
             "low_confidence_count": self._low_confidence_count,
             "regenerated_count": self._regenerated_count,
+            "description_cache_hit_count": self._description_cache_hit_count,
+            "description_cache": get_description_cache_service().get_stats(),
             "current_in_flight": self.ai_semaphore._value if hasattr(self.ai_semaphore, "_value") else None,
         }
 
@@ -214,9 +235,9 @@ class AIProcessingCoordinator:
         """
         Returns aggregated AI cost & token usage trends.
 
-        This is the first small method for the new "AI Cost & Token Trends"
-        surface. It pulls from the events table (where the rich economics
-        fields live after the extraction).
+        Served from AICostAndUsageTracker's in-memory hourly rollups of
+        ``ai_usage`` (one row per provider call, including failures), so no
+        table scan happens per request.
 
         Args:
             days_back: How many days of history to include (default 30)
@@ -235,66 +256,12 @@ class AIProcessingCoordinator:
                 ...
             ]
         """
-        from datetime import datetime, timedelta, timezone
-        from sqlalchemy import func
-        from app.core.database import get_db_session
-        from app.models.event import Event as DBEvent
+        from app.services.ai_cost_and_usage_tracker import get_ai_cost_and_usage_tracker
 
         if bucket not in ("day", "hour"):
             bucket = "day"
 
-        end = datetime.now(timezone.utc)
-        start = end - timedelta(days=days_back)
-
-        with get_db_session() as db:
-            # Base query for events that actually had AI economics data
-            query = (
-                db.query(DBEvent)
-                .filter(DBEvent.timestamp >= start)
-                .filter(DBEvent.timestamp <= end)
-                .filter(DBEvent.ai_cost.isnot(None))
-            )
-
-            if bucket == "day":
-                # Group by date
-                rows = (
-                    query.with_entities(
-                        func.date(DBEvent.timestamp).label("bucket"),
-                        func.count(DBEvent.id).label("calls"),
-                        func.sum(DBEvent.ai_cost).label("total_cost"),
-                        func.sum(DBEvent.tokens_used).label("total_tokens"),
-                        func.avg(DBEvent.ai_response_time_ms).label("avg_response_time_ms"),
-                    )
-                    .group_by(func.date(DBEvent.timestamp))
-                    .order_by(func.date(DBEvent.timestamp))
-                    .all()
-                )
-            else:
-                # Group by hour (YYYY-MM-DD HH:00)
-                rows = (
-                    query.with_entities(
-                        func.strftime("%Y-%m-%d %H:00", DBEvent.timestamp).label("bucket"),
-                        func.count(DBEvent.id).label("calls"),
-                        func.sum(DBEvent.ai_cost).label("total_cost"),
-                        func.sum(DBEvent.tokens_used).label("total_tokens"),
-                        func.avg(DBEvent.ai_response_time_ms).label("avg_response_time_ms"),
-                    )
-                    .group_by(func.strftime("%Y-%m-%d %H:00", DBEvent.timestamp))
-                    .order_by(func.strftime("%Y-%m-%d %H:00", DBEvent.timestamp))
-                    .all()
-                )
-
-            result = []
-            for row in rows:
-                result.append({
-                    "bucket": str(row.bucket),
-                    "calls": int(row.calls or 0),
-                    "total_cost": round(float(row.total_cost or 0), 6),
-                    "total_tokens": int(row.total_tokens or 0),
-                    "avg_response_time_ms": round(float(row.avg_response_time_ms or 0), 1) if row.avg_response_time_ms else None,
-                })
-
-            return result
+        return get_ai_cost_and_usage_tracker().get_cost_trends(days_back=days_back, bucket=bucket)
 
     def get_context_usage_stats(self, days_back: int = 30) -> Dict:
         """Return basic aggregates about how often and how effectively context was used.
@@ -766,6 +733,9 @@ class AIProcessingCoordinator:
                 worker_id=worker_id,
                 context_enhanced_prompt=context_enhanced_prompt,
                 thumbnail_base64=thumbnail_base64,
+                embedding_vector=embedding_vector,
+                matched_entity_ids=[entity_result.entity_id] if getattr(entity_result, "entity_id", None) else [],
+                cache_context=context_result.cache_context if context_enhanced_prompt else None,
             )
 
             if ai_result is None:
@@ -822,101 +792,23 @@ class AIProcessingCoordinator:
             if not event_id:
                 return False
 
-            # Cost alerts
-            try:
-                cost_alert_service = self.cost_alert_service
-                with SessionLocal() as db:
-                    alerts = await cost_alert_service.check_and_notify(db)
-                    if alerts:
-                        logger.info(f"Cost alerts triggered: {len(alerts)} notifications sent")
-            except Exception as alert_error:
-                logger.warning(f"Failed to check cost alerts: {alert_error}")
-
-            # Push notifications
-            await self._send_push_notification(
-                event=event,
-                event_id=event_id,
-                ai_result=ai_result,
-                thumbnail_base64=thumbnail_base64,
-            )
-
-            # MQTT
-            await self._publish_mqtt_event(event=event, event_id=event_id)
-
-            # Camera status sensors
-            await self._publish_camera_status_sensors(event=event, event_id=event_id, ai_result=ai_result)
-
-            # Store embedding
-            await self._store_embedding(event_id=event_id, embedding_vector=embedding_vector, camera_id=event.camera_id)
-
             # Determine smart_detection_type and objects for post-processing helpers
             smart_detection_type = getattr(event, 'smart_detection_type', None) or \
                                    (event.detected_objects[0].lower() if event.detected_objects else None)
             objects_detected = event.detected_objects or []
-            objects_json = json.dumps(objects_detected) if objects_detected else None
-
-            # Build expected post-processing summary (what we will attempt)
-            # Post-processing helpers
-            homekit_result = await self._run_homekit_triggers(
-                event=event, event_id=event_id, smart_detection_type=smart_detection_type
-            )
 
-            post_processing_summary = {
-                "homekit": homekit_result,
-                "face_embedding_attempted": bool(thumbnail_base64),
-                "vehicle_embedding_attempted": bool(thumbnail_base64) and any("vehicle" in str(o).lower() for o in objects_detected),
-                "entity_alerts_attempted": any(o.lower() in ("person", "vehicle") for o in objects_detected),
-                "mqtt_attempted": True,
-                "push_attempted": True,
-                "camera_status_attempted": True,
-                "audio_enrichment_attempted": True,
-                "embedding_stored": bool(embedding_vector),
-            }
-            # Final entity link is now performed early (before the initial store) using the
-            # pre-generated event ID. The later call has been removed as it is redundant.
-            await self._process_face_embeddings(
-                event=event, event_id=event_id, thumbnail_base64=thumbnail_base64
-            )
-            await self._process_vehicle_embeddings(
-                event=event, event_id=event_id, objects_json=objects_json,
-                thumbnail_base64=thumbnail_base64, ai_result=ai_result,
-                smart_detection_type=smart_detection_type
-            )
-            await self._process_entity_alerts(
-                event=event, event_id=event_id, ai_result=ai_result, objects_detected=objects_detected
+            post_processing_summary = await self._run_post_processing(
+                event=event,
+                event_id=event_id,
+                ai_result=ai_result,
+                thumbnail_base64=thumbnail_base64,
+                embedding_vector=embedding_vector,
+                final_entity_link_result=final_entity_link_result,
+                smart_detection_type=smart_detection_type,
+                objects_detected=objects_detected,
+                started_at=start_time,
             )
 
-            # Audio enrichment (fire and forget)
-            try:
-                asyncio.create_task(
-                    self._enrich_event_with_audio(event_id, event.camera_id)
-                )
-            except Exception as audio_error:
-                logger.warning(f"Failed to create audio enrichment task: {audio_error}")
-                post_processing_summary["audio_enrichment_attempted"] = False
-
-            # Persist post-processing summary + final entity link details
-            if event_id:
-                try:
-                    with SessionLocal() as update_db:
-                        ev = update_db.query(Event).filter(Event.id == event_id).first()
-                        if ev:
-                            import json as json_lib
-                            if post_processing_summary:
-                                ev.post_processing_summary = json_lib.dumps(post_processing_summary)
-                            if final_entity_link_result:
-                                ev.final_entity_similarity_score = getattr(final_entity_link_result, 'similarity_score', None)
-                                ev.final_entity_occurrence_count = getattr(final_entity_link_result, 'occurrence_count', None)
-                                ev.final_entity_is_new = getattr(final_entity_link_result, 'is_new', None)
-                                ev.final_entity_id = getattr(final_entity_link_result, 'entity_id', None)
-                                ev.final_entity_type = getattr(final_entity_link_result, 'entity_type', None)
-                                ev.final_entity_name = getattr(final_entity_link_result, 'name', None)
-                            update_db.commit()
-                except Exception as summary_err:
-                    logger.warning(
-                        f"Failed to persist post-processing / final entity data for event {event_id}: {summary_err}"
-                    )
-
             logger.info(
                 f"Event processed successfully for camera {event.camera_name}",
                 extra={
@@ -962,6 +854,9 @@ class AIProcessingCoordinator:
                 self._low_confidence_count += 1
             if regen:
                 self._regenerated_count += 1
+            description_cache_hit = getattr(ai_result, "description_cache_hit", False)
+            if description_cache_hit:
+                self._description_cache_hit_count += 1
 
             # Record rich recent activity for live view / snapshot
             recent_item = {
@@ -981,6 +876,7 @@ class AIProcessingCoordinator:
                 "context_used": context_used,
                 "context_stats": context_stats,
                 "regenerated": regen,
+                "description_cache_hit": description_cache_hit,
                 "entity_early": {
                     "similarity_score": getattr(entity_result, "similarity_score", None) if entity_result else None,
                     "occurrence_count": getattr(entity_result, "occurrence_count", None) if entity_result else None,
@@ -1045,6 +941,148 @@ class AIProcessingCoordinator:
 
             return False
 
+    async def _run_post_processing(
+        self,
+        event: ProcessingEvent,
+        event_id: str,
+        ai_result: Any,
+        thumbnail_base64: Optional[str],
+        embedding_vector: Optional[bytes],
+        final_entity_link_result: Any,
+        smart_detection_type: Optional[str],
+        objects_detected: List[str],
+        started_at: float,
+    ) -> Dict[str, Any]:
+        """
+        Run the post-processing stages for a stored event.
+
+        Independent stages run concurrently (see PostProcessingGraph); the
+        push notification is declared first so it gets the concurrency
+        budget before anything else. DB writes (embedding row, audio and
+        entity alert columns, cost alert notifications, summary, final
+        entity link) are collected in one EventUnitOfWork and committed
+        together by the final ``persist`` stage. Face/vehicle matches are
+        written through the same unit of work as soon as they are made,
+        because entity alerts need them.
+
+        Returns:
+            The post_processing_summary dict, including per-stage timings
+        """
+        from app.core import metrics as prom
+
+        unit_of_work = EventUnitOfWork(event_id)
+
+        async def push() -> None:
+            await self._send_push_notification(
+                event=event, event_id=event_id, ai_result=ai_result, thumbnail_base64=thumbnail_base64,
+            )
+            prom.time_to_notification_seconds.observe(time.time() - started_at)
+
+        async def cost_alerts() -> None:
+            staged: List[Tuple[Any, Dict[str, Any]]] = []
+
+            def record(db: Session) -> None:
+                # Reassign rather than extend: a replayed write runs this again
+                staged[:] = self.cost_alert_service.stage_notifications(db)
+
+            async def broadcast() -> None:
+                for alert, notification in staged:
+                    await self.cost_alert_service.broadcast_alert(alert, notification)
+                if staged:
+                    logger.info(f"Cost alerts triggered: {len(staged)} notifications sent")
+
+            unit_of_work.stage(record)
+            unit_of_work.after_commit(broadcast)
+
+        async def audio_enrichment() -> bool:
+            return await self._enrich_event_with_audio(event_id, event.camera_id, unit_of_work=unit_of_work)
+
+        async def entity_alerts() -> None:
+            detections = graph.results.get("detections")
+            matched = detections.value if detections and detections.status == STATUS_OK else None
+            await self._process_entity_alerts(
+                event=event, event_id=event_id, ai_result=ai_result, objects_detected=objects_detected,
+                thumbnail_base64=thumbnail_base64,
+                matched_entity_ids=matched.get("matched_entity_ids", []) if isinstance(matched, dict) else [],
+                unit_of_work=unit_of_work,
+            )
+
+        stages = [
+            PostProcessingStage("push", push),
+            PostProcessingStage("mqtt", lambda: self._publish_mqtt_event(event=event, event_id=event_id)),
+            PostProcessingStage(
+                "camera_status",
+                lambda: self._publish_camera_status_sensors(event=event, event_id=event_id, ai_result=ai_result),
+            ),
+            PostProcessingStage(
+                "homekit",
+                lambda: self._run_homekit_triggers(
+                    event=event, event_id=event_id, smart_detection_type=smart_detection_type
+                ),
+            ),
+            PostProcessingStage(
+                "embedding",
+                lambda: self._store_embedding(
+                    event_id=event_id, embedding_vector=embedding_vector,
+                    camera_id=event.camera_id, unit_of_work=unit_of_work,
+                ),
+            ),
+            PostProcessingStage(
+                "detections",
+                lambda: self._process_detections(
+                    event=event, event_id=event_id, thumbnail_base64=thumbnail_base64, ai_result=ai_result,
+                    unit_of_work=unit_of_work,
+                ),
+            ),
+            # Matched face/vehicle entities feed recognition status and VIP alerts
+            PostProcessingStage("entity_alerts", entity_alerts, depends_on=("detections",)),
+            PostProcessingStage("cost_alerts", cost_alerts),
+            PostProcessingStage("audio_enrichment", audio_enrichment),
+        ]
+        post_processing_summary: Dict[str, Any] = {}
+
+        async def persist() -> None:
+            homekit = graph.results.get("homekit")
+            audio = graph.results.get("audio_enrichment")
+            detections = graph.results.get("detections")
+            scheduled = detections.value if detections and detections.status == STATUS_OK else None
+            post_processing_summary.update({
+                "homekit": homekit.value if homekit and homekit.status == STATUS_OK else None,
+                "face_embedding_attempted": bool(isinstance(scheduled, dict) and scheduled.get("faces")),
+                "vehicle_embedding_attempted": bool(isinstance(scheduled, dict) and scheduled.get("vehicles")),
+                "entity_alerts_attempted": any(o.lower() in ("person", "vehicle") for o in objects_detected),
+                "mqtt_attempted": True,
+                "push_attempted": True,
+                "camera_status_attempted": True,
+                "audio_enrichment_attempted": bool(audio and audio.status == STATUS_OK),
+                "embedding_stored": bool(embedding_vector),
+                "stages": graph.summary(),
+            })
+            unit_of_work.set(post_processing_summary=json.dumps(post_processing_summary))
+            if final_entity_link_result:
+                unit_of_work.set(
+                    final_entity_similarity_score=getattr(final_entity_link_result, 'similarity_score', None),
+                    final_entity_occurrence_count=getattr(final_entity_link_result, 'occurrence_count', None),
+                    final_entity_is_new=getattr(final_entity_link_result, 'is_new', None),
+                    final_entity_id=getattr(final_entity_link_result, 'entity_id', None),
+                    final_entity_type=getattr(final_entity_link_result, 'entity_type', None),
+                    final_entity_name=getattr(final_entity_link_result, 'name', None),
+                )
+            await unit_of_work.commit()
+
+        stages.append(PostProcessingStage(
+            "persist", persist, depends_on=tuple(stage.name for stage in stages)
+        ))
+        graph = PostProcessingGraph(stages)
+        results = await graph.run()
+
+        if results["persist"].status != STATUS_OK:
+            logger.warning(
+                f"Failed to persist post-processing / final entity data for event {event_id}: "
+                f"{results['persist'].error}"
+            )
+        return post_processing_summary
+
     async def _handle_cost_cap_skip(self, event: ProcessingEvent) -> bool:
         """
         Check cost caps before AI analysis.
@@ -1107,10 +1145,18 @@ class AIProcessingCoordinator:
         worker_id: int,
         context_enhanced_prompt: Optional[str],
         thumbnail_base64: Optional[str],
+        embedding_vector: Optional[List[float]] = None,
+        matched_entity_ids: Sequence[str] = (),
+        cache_context: Optional[str] = None,
     ) -> Optional[Any]:
         """
         Call the AI service to generate a description, with OCR and concurrency control.
 
+        A near-identical frame analyzed recently on the same camera, with the
+        same matched entities and stable prompt context (``cache_context``),
+        reuses that description instead (DescriptionCacheService). Frames with
+        OCR overlay text always go to the provider.
+
         Returns the AIResult on success, or None if all providers failed
         (in which case a retry event has already been stored).
         """
@@ -1120,33 +1166,69 @@ class AIProcessingCoordinator:
             from app.models.system_setting import SystemSetting
             from app.services.ocr_service import extract_overlay_text, is_ocr_available
 
-            with SessionLocal() as ocr_db:
-                setting = ocr_db.query(SystemSetting).filter(
-                    SystemSetting.key == 'settings_attempt_ocr_extraction'
-                ).first()
-                if setting and setting.value.lower() == 'true' and is_ocr_available():
-                    try:
-                        ocr_result = extract_overlay_text(event.frame)
-                    except Exception as ocr_err:
-                        logger.warning(f"OCR extraction failed: {ocr_err}")
+            async with get_async_db_session() as ocr_db:
+                ocr_enabled = await ocr_db.scalar(
+                    select(SystemSetting.value).where(
+                        SystemSetting.key == 'settings_attempt_ocr_extraction'
+                    )
+                )
+            if ocr_enabled and ocr_enabled.lower() == 'true' and is_ocr_available():
+                try:
+                    # Tesseract runs as a subprocess per region; keep it off the loop
+                    ocr_result = await asyncio.to_thread(
+                        extract_overlay_text, event.frame, camera_id=event.camera_id
+                    )
+                except Exception as ocr_err:
+                    logger.warning(f"OCR extraction failed: {ocr_err}")
         except Exception as ocr_setup_err:
             logger.debug(f"OCR setup failed (non-critical): {ocr_setup_err}")
 
+        context_key = description_context_key(
+            event.camera_id,
+            matched_entity_ids,
+            (cache_context or "") if context_enhanced_prompt else None,
+        )
+        frame_hash_value, cache_hit = None, None
+        if ocr_result is None:
+            frame_hash_value, cache_hit = await self._lookup_cached_description(
+                event, embedding_vector, context_key
+            )
+        if cache_hit is not None:
+            ai_result = cache_hit.result
+            setattr(ai_result, 'ocr_used', False)
+            setattr(ai_result, 'ai_fallback_used', False)
+            setattr(ai_result, 'description_cache_hit', True)
+            logger.info(
+                f"Reused AI description for camera {event.camera_name} (near-identical frame)",
+                extra={
+                    "event_type": "description_cache_hit",
+                    "camera_id": event.camera_id,
+                    "hash_distance": cache_hit.hash_distance,
+                    "similarity": cache_hit.similarity,
+                    "age_seconds": round(cache_hit.age_seconds, 1),
+                    "worker_id": worker_id,
+                }
+            )
+            return ai_result
+
         # Limit concurrent AI calls (Phase A.5)
         from app.core.metrics import ai_concurrent_in_flight
+        from app.services.ai_cost_and_usage_tracker import usage_camera_scope
 
         async with self.ai_semaphore:
             ai_concurrent_in_flight.inc()
             try:
-                ai_result = await self.ai_service.generate_description(
-                    frame=event.frame,
-                    camera_name=event.camera_name,
-                    timestamp=event.timestamp.isoformat(),
-                    detected_objects=event.detected_objects,
-                    sla_timeout_ms=5000,
-                    custom_prompt=context_enhanced_prompt,
-                    ocr_result=ocr_result,
-                )
+                with usage_camera_scope(event.camera_id):
+                    ai_result = await self.ai_service.generate_description(
+                        frame=event.frame,
+                        camera_name=event.camera_name,
+                        timestamp=event.timestamp.isoformat(),
+                        detected_objects=event.detected_objects,
+                        sla_timeout_ms=5000,
+                        custom_prompt=context_enhanced_prompt,
+                        ocr_result=ocr_result,
+                        regions=[event.metadata["motion_bbox"]] if event.metadata.get("motion_bbox") else None,
+                    )
             finally:
                 ai_concurrent_in_flight.dec()
 
@@ -1160,6 +1242,17 @@ class AIProcessingCoordinator:
             ai_fallback_used = ai_result.provider.lower() != "openai"
         setattr(ai_result, 'ai_fallback_used', ai_fallback_used)
 
+        if ai_result.success and frame_hash_value is not None:
+            get_description_cache_service().store(
+                camera_id=event.camera_id,
+                frame_hash_value=frame_hash_value,
+                embedding=embedding_vector,
+                objects=event.detected_objects,
+                timestamp=event.timestamp.timestamp(),
+                result=ai_result,
+                context_key=context_key,
+            )
+
         if not ai_result.success:
             logger.warning(
                 f"All AI providers failed for camera {event.camera_name}, storing event for retry",
@@ -1190,6 +1283,63 @@ class AIProcessingCoordinator:
 
         return ai_result
 
+    async def _lookup_cached_description(
+        self,
+        event: ProcessingEvent,
+        embedding_vector: Optional[List[float]],
+        context_key: str = "",
+    ) -> Tuple[Optional[int], Optional[Any]]:
+        """
+        Hash the frame and look for a reusable description.
+
+        Returns:
+            (frame_hash, cache_hit). frame_hash is None when the cache is off
+            for this camera, in which case the provider result is not cached
+            either.
+        """
+        if not settings.DESCRIPTION_CACHE_ENABLED or event.frame is None or embedding_vector is None:
+            return None, None
+
+        cache = get_description_cache_service()
+        try:
+            frame_hash_value = frame_hash(event.frame)
+            camera_enabled = cache.camera_enabled(event.camera_id)
+            if camera_enabled is None:
+                async with get_async_db_session() as db:
+                    camera_enabled = await db.scalar(
+                        select(Camera.description_cache_enabled).where(Camera.id == event.camera_id)
+                    )
+                camera_enabled = camera_enabled is not False
+                cache.set_camera_enabled(event.camera_id, camera_enabled)
+        except Exception as e:
+            logger.debug(f"Description cache lookup skipped: {e}", extra={"camera_id": event.camera_id})
+            return None, None
+
+        if not camera_enabled:
+            cache.record_disabled()
+            return None, None
+
+        hit = cache.lookup(
+            camera_id=event.camera_id,
+            frame_hash_value=frame_hash_value,
+            embedding=embedding_vector,
+            objects=event.detected_objects,
+            timestamp=event.timestamp.timestamp(),
+            context_key=context_key,
+        )
+        return frame_hash_value, hit
+
+    async def _store_event_with_retry(self, event_data: Dict, max_retries: int = 3) -> Optional[str]:
+        """Persist an event payload through the injected ``store_event`` callable."""
+        if self.store_event is None:
+            logger.error("AIProcessingCoordinator has no store_event callable; event not stored")
+            return None
+        return await self.store_event(event_data, max_retries=max_retries)
+
+    async def store_processed_event(self, event_data: Dict) -> Optional[str]:
+        """Persist a pre-built event payload (used for cost-cap skip placeholders)."""
+        return await self._store_event_with_retry(event_data, max_retries=3)
+
     async def _store_processed_event(
         self,
         event: ProcessingEvent,
@@ -1371,56 +1521,186 @@ class AIProcessingCoordinator:
                 extra={"error": str(push_error)}
             )
 
-    async def _process_vehicle_embeddings(
+    async def _process_detections(
         self,
         event: ProcessingEvent,
         event_id: str,
-        objects_json: Optional[str],
         thumbnail_base64: Optional[str],
         ai_result: Any,
-        smart_detection_type: Optional[str],
-    ) -> None:
-        """Privacy-gated vehicle embedding processing (fire-and-forget)."""
-        try:
-            if self.vehicle_embedding_service and thumbnail_base64:
-                asyncio.create_task(
-                    self.vehicle_embedding_service.process_vehicle_embedding(
-                        event_id=event_id,
-                        thumbnail_base64=thumbnail_base64,
-                        event_description=ai_result.description
-                    )
-                )
-                logger.debug(
-                    f"Vehicle embeddings task created for event {event_id}",
-                    extra={"event_id": event_id, "camera_id": event.camera_id}
+        unit_of_work: EventUnitOfWork,
+    ) -> Dict[str, Any]:
+        """Privacy-gated face/vehicle recognition.
+
+        Both detectors run in one DetectionService pass over the thumbnail.
+        Returns which of them ran, plus the entity ids the detections were
+        matched to (consumed by the entity_alerts stage).
+        """
+        from app.models.system_setting import SystemSetting
+        from app.services.ai_types import FACE_RECOGNITION_ENABLED, VEHICLE_RECOGNITION_ENABLED
+
+        scheduled: Dict[str, Any] = {"faces": False, "vehicles": False}
+        if not thumbnail_base64 or not (self.face_embedding_service or self.vehicle_embedding_service):
+            return scheduled
+
+        async with get_async_db_session() as settings_db:
+            rows = await settings_db.execute(
+                select(SystemSetting.key, SystemSetting.value).where(
+                    SystemSetting.key.in_([FACE_RECOGNITION_ENABLED, VEHICLE_RECOGNITION_ENABLED])
                 )
-        except Exception as vehicle_error:
-            logger.warning(
-                f"Failed to create vehicle embeddings task: {vehicle_error}",
-                extra={"error": str(vehicle_error), "event_id": event_id}
             )
+            enabled = {key: str(value).lower() == "true" for key, value in rows.all()}
 
-    async def _process_face_embeddings(
-        self, event: ProcessingEvent, event_id: str, thumbnail_base64: Optional[str]
-    ) -> None:
-        """Privacy-gated face processing (fire-and-forget)."""
+        scheduled["faces"] = bool(self.face_embedding_service) and enabled.get(FACE_RECOGNITION_ENABLED, False)
+        scheduled["vehicles"] = bool(self.vehicle_embedding_service) and enabled.get(VEHICLE_RECOGNITION_ENABLED, False)
+        if scheduled["faces"] or scheduled["vehicles"]:
+            matched_entity_ids = await self._run_detections(
+                event_id=event_id,
+                thumbnail_base64=thumbnail_base64,
+                event_description=ai_result.description,
+                faces=scheduled["faces"],
+                vehicles=scheduled["vehicles"],
+                unit_of_work=unit_of_work,
+            )
+            if matched_entity_ids:
+                scheduled["matched_entity_ids"] = matched_entity_ids
+        return scheduled
+
+    async def _run_detections(
+        self,
+        event_id: str,
+        thumbnail_base64: str,
+        event_description: Optional[str],
+        faces: bool,
+        vehicles: bool,
+        unit_of_work: EventUnitOfWork,
+    ) -> List[str]:
+        """
+        Detect, embed and match faces and vehicles for a stored event.
+
+        The thumbnail is decoded and run through both detectors once; the
+        embedding services then crop from the shared decoded frame. The
+        embedding rows and the person/vehicle matches are written in one
+        transaction through the event's unit of work.
+        Errors are logged but not propagated.
+
+        Returns:
+            Entity ids the detections were matched to (deduplicated, in order)
+        """
         try:
-            if self.face_embedding_service and thumbnail_base64:
-                asyncio.create_task(
-                    self.face_embedding_service.process_face_embedding(
-                        event_id=event_id,
-                        thumbnail_base64=thumbnail_base64
+            import base64 as b64
+
+            from app.models.system_setting import SystemSetting
+            from app.services.ai_types import (
+                AUTO_CREATE_PERSONS,
+                AUTO_CREATE_VEHICLES,
+                PERSON_MATCH_THRESHOLD,
+                UPDATE_APPEARANCE_ON_HIGH_MATCH,
+                VEHICLE_MATCH_THRESHOLD,
+            )
+            from app.services.detection_service import get_detection_service
+            from app.services.service_container import container
+
+            b64_str = thumbnail_base64
+            if b64_str.startswith("data:"):
+                b64_str = b64_str[b64_str.find(",") + 1:]
+            thumbnail_bytes = b64.b64decode(b64_str)
+
+            frame = (await get_detection_service().detect(
+                [thumbnail_bytes], faces=faces, vehicles=vehicles
+            ))[0]
+
+            async with get_async_db_session() as settings_db:
+                rows = await settings_db.execute(
+                    select(SystemSetting.key, SystemSetting.value).where(
+                        SystemSetting.key.in_([
+                            PERSON_MATCH_THRESHOLD, AUTO_CREATE_PERSONS, UPDATE_APPEARANCE_ON_HIGH_MATCH,
+                            VEHICLE_MATCH_THRESHOLD, AUTO_CREATE_VEHICLES,
+                        ])
                     )
                 )
-                logger.debug(
-                    f"Face processing task created for event {event_id}",
-                    extra={"event_id": event_id, "camera_id": event.camera_id}
+                values = dict(rows.all())
+
+            def flag(key: str) -> bool:
+                return str(values.get(key, "true")).lower() == "true"
+
+            face_rows = []
+            if faces and frame.faces:
+                face_rows = await self.face_embedding_service.build_event_face_embeddings(
+                    event_id=event_id, thumbnail_bytes=thumbnail_bytes, detections=frame,
+                )
+            vehicle_rows = []
+            if vehicles and frame.vehicles:
+                vehicle_rows = await self.vehicle_embedding_service.build_event_vehicle_embeddings(
+                    event_id=event_id, thumbnail_bytes=thumbnail_bytes, detections=frame,
                 )
-        except Exception as face_error:
+            if not face_rows and not vehicle_rows:
+                return []
+
+            person_matching = container.person_matching_service
+            vehicle_matching = container.vehicle_matching_service
+            attempts = 0
+
+            def store_and_match(db: Session) -> List[str]:
+                nonlocal attempts
+                if attempts:
+                    # A replayed batch: drop cache entries made by the rolled-back attempt
+                    person_matching._invalidate_cache()
+                    vehicle_matching._invalidate_cache()
+                attempts += 1
+
+                db.add_all(face_rows + vehicle_rows)
+                db.flush()
+                matched: List[str] = []
+                if face_rows:
+                    results = person_matching.match_faces_sync(
+                        db,
+                        [row.id for row in face_rows],
+                        auto_create=flag(AUTO_CREATE_PERSONS),
+                        threshold=float(values.get(PERSON_MATCH_THRESHOLD, 0.70)),
+                        update_appearance=flag(UPDATE_APPEARANCE_ON_HIGH_MATCH),
+                        commit=False,
+                    )
+                    matched.extend(r.person_id for r in results if r.person_id)
+                if vehicle_rows:
+                    results = vehicle_matching.match_vehicles_sync(
+                        db,
+                        [row.id for row in vehicle_rows],
+                        event_description=event_description,
+                        auto_create=flag(AUTO_CREATE_VEHICLES),
+                        threshold=float(values.get(VEHICLE_MATCH_THRESHOLD, 0.65)),
+                        commit=False,
+                    )
+                    matched.extend(r.vehicle_id for r in results if r.vehicle_id)
+                return list(dict.fromkeys(matched))
+
+            try:
+                matched_entity_ids = await unit_of_work.write(store_and_match)
+            except Exception:
+                person_matching._invalidate_cache()
+                vehicle_matching._invalidate_cache()
+                raise
+
+            logger.debug(
+                f"Detection complete for event {event_id}",
+                extra={
+                    "event_type": "detection_processing_complete",
+                    "event_id": event_id,
+                    "face_count": len(face_rows),
+                    "vehicle_count": len(vehicle_rows),
+                    "matched_entity_count": len(matched_entity_ids),
+                }
+            )
+            return matched_entity_ids
+        except Exception as e:
             logger.warning(
-                f"Failed to create face processing task: {face_error}",
-                extra={"error": str(face_error), "event_id": event_id}
+                f"Face/vehicle processing failed for event {event_id}: {e}",
+                extra={
+                    "event_type": "detection_processing_error",
+                    "event_id": event_id,
+                    "error": str(e),
+                }
             )
+            return []
 
     async def _process_entity_alerts(
         self,
@@ -1428,84 +1708,152 @@ class AIProcessingCoordinator:
         event_id: str,
         ai_result: Any,
         objects_detected: Optional[List[str]],
-    ) -> None:
-        """Privacy-gated entity alert processing (fire-and-forget)."""
+        unit_of_work: EventUnitOfWork,
+        thumbnail_base64: Optional[str] = None,
+        matched_entity_ids: Optional[List[str]] = None,
+    ) -> Optional[str]:
+        """Privacy-gated entity alert processing (Story P4-8.4).
+
+        Classifies the recognition status from the entities the detections
+        stage matched, stages the enriched description on the unit of work
+        and sends the VIP notification. Returns the recognition status, or
+        None when no alert processing ran.
+        """
+        if not self.entity_service or not objects_detected:
+            return None
+        if not any(o.lower() in ("person", "vehicle") for o in objects_detected):
+            return None
+
         try:
-            if self.entity_service:
-                has_person_or_vehicle = False
-                if objects_detected:
-                    has_person_or_vehicle = any(o.lower() in ("person", "vehicle") for o in objects_detected)
-
-                if has_person_or_vehicle:
-                    asyncio.create_task(
-                        self.entity_service.execute_entity_alerts(
-                            event_id=event_id,
-                            description=ai_result.description,
-                            has_person_or_vehicle=True
-                        )
-                    )
-                    logger.debug(
-                        f"Entity alert task created for event {event_id}",
-                        extra={"event_id": event_id, "camera_id": event.camera_id}
-                    )
+            from app.services.service_container import container
+
+            entity_alert_service = container.entity_alert_service
+            matched_entity_ids = list(matched_entity_ids or [])
+            with SessionLocal() as db:
+                result = await entity_alert_service.process_event_entities(
+                    db=db,
+                    event_id=event_id,
+                    matched_entity_ids=matched_entity_ids,
+                    original_description=ai_result.description,
+                    has_person_or_vehicle=True,
+                )
+
+            unit_of_work.set(
+                recognition_status=result.recognition_status,
+                enriched_description=result.enriched_description,
+                matched_entity_ids=json.dumps(result.matched_entity_ids) if result.matched_entity_ids else None,
+            )
+
+            # VIP notification; a blocked entity takes precedence
+            if result.has_vip and not result.should_suppress and result.entity_names:
+                from app.services.push_notification_service import send_event_notification
+
+                push_thumbnail_url = None
+                if thumbnail_base64:
+                    date_str = event.timestamp.strftime("%Y-%m-%d")
+                    push_thumbnail_url = f"/api/v1/thumbnails/{date_str}/{event_id}.jpg"
+
+                await send_event_notification(
+                    event_id=event_id,
+                    camera_name=event.camera_name,
+                    description=result.enriched_description or ai_result.description,
+                    thumbnail_url=push_thumbnail_url,
+                    camera_id=event.camera_id,
+                    smart_detection_type=event.metadata.get("smart_detection_type"),
+                    entity_names=result.entity_names,
+                    is_vip=True,
+                    recognition_status=result.recognition_status,
+                )
+                logger.info(
+                    f"VIP notification sent for event {event_id}: {result.entity_names}",
+                    extra={
+                        "event_type": "vip_notification_sent",
+                        "event_id": event_id,
+                        "entity_names": result.entity_names,
+                        "vip_count": len(result.vip_entity_ids),
+                    }
+                )
+
+            logger.debug(
+                f"Entity alert processing complete for event {event_id}: "
+                f"status={result.recognition_status}, entities={len(matched_entity_ids)}",
+                extra={
+                    "event_type": "entity_alert_complete",
+                    "event_id": event_id,
+                    "camera_id": event.camera_id,
+                    "recognition_status": result.recognition_status,
+                    "entity_count": len(matched_entity_ids),
+                }
+            )
+            return result.recognition_status
         except Exception as entity_alert_error:
             logger.warning(
-                f"Failed to create entity alert task: {entity_alert_error}",
+                f"Entity alert processing failed for event {event_id}: {entity_alert_error}",
                 extra={"error": str(entity_alert_error), "event_id": event_id}
             )
+            return None
 
     async def _enrich_event_with_audio(
         self,
         event_id: str,
         camera_id: str,
-    ) -> None:
+        unit_of_work: EventUnitOfWork,
+    ) -> bool:
         """
         Enrich a stored event with audio detection information (Story P6-3.2).
 
-        This is a fire-and-forget async task. Errors are logged but not propagated.
-        Uses its own database session since the caller's session may be closed.
+        The audio columns (and the annotated description) are staged on the
+        event's unit of work rather than committed here. Errors are logged
+        but not propagated.
+
+        Returns:
+            True if the event was enriched with an audio event
         """
         try:
             from app.services.audio_event_handler import get_audio_event_handler
-            from app.models.event import Event
 
             audio_handler = get_audio_event_handler()
 
-            # Use own session since caller's may be closed
-            with get_db_session() as db:
-                # Get the stored event
+            with SessionLocal() as db:
                 event = db.query(Event).filter(Event.id == event_id).first()
                 if event is None:
                     logger.warning(
                         f"Event {event_id} not found for audio enrichment",
                         extra={"event_id": event_id, "camera_id": camera_id}
                     )
-                    return
+                    return False
 
-                # Enrich event with audio information
                 enriched = await audio_handler.enrich_event_with_audio(
                     db=db,
                     event=event,
                     camera_id=camera_id,
                     audio_duration_seconds=2.0,
+                    commit=False,
                 )
-
-                if enriched:
-                    logger.info(
-                        f"Event {event_id} enriched with audio",
-                        extra={
-                            "event_type": "audio_enrichment_complete",
-                            "event_id": event_id,
-                            "camera_id": camera_id,
-                            "audio_event_type": event.audio_event_type,
-                            "audio_confidence": event.audio_confidence,
-                        }
-                    )
-                else:
+                if not enriched:
                     logger.debug(
                         f"No audio events detected for event {event_id}",
                         extra={"event_id": event_id, "camera_id": camera_id}
                     )
+                    return False
+
+                unit_of_work.set(
+                    audio_event_type=event.audio_event_type,
+                    audio_confidence=event.audio_confidence,
+                    audio_duration_ms=event.audio_duration_ms,
+                    description=event.description,
+                )
+                logger.info(
+                    f"Event {event_id} enriched with audio",
+                    extra={
+                        "event_type": "audio_enrichment_complete",
+                        "event_id": event_id,
+                        "camera_id": camera_id,
+                        "audio_event_type": event.audio_event_type,
+                        "audio_confidence": event.audio_confidence,
+                    }
+                )
+                return True
 
         except Exception as e:
             # Audio enrichment errors must not propagate
@@ -1518,6 +1866,7 @@ class AIProcessingCoordinator:
                     "error": str(e)
                 }
             )
+            return False
 
     async def _run_homekit_triggers(
         self, event: ProcessingEvent, event_id: str, smart_detection_type: Optional[str]
@@ -1784,8 +2133,8 @@ class AIProcessingCoordinator:
             if not mqtt_service or not mqtt_service.is_connected:
                 return
 
-            with SessionLocal() as sensor_db:
-                stored_event = sensor_db.query(Event).filter(Event.id == event_id).first()
+            async with get_async_db_session() as sensor_db:
+                stored_event = await sensor_db.get(Event, event_id)
                 if not stored_event:
                     return
 
@@ -1841,14 +2190,18 @@ class AIProcessingCoordinator:
             if not mqtt_service.is_connected:
                 return
 
-            with SessionLocal() as mqtt_db:
-                stored_event = mqtt_db.query(Event).filter(Event.id == event_id).first()
+            async with get_async_db_session() as mqtt_db:
+                stored_event = await mqtt_db.get(Event, event_id)
                 if not stored_event:
                     return
 
                 api_base_url = mqtt_service.get_api_base_url()
-                mqtt_payload = serialize_event_for_mqtt(
-                    stored_event, event.camera_name, api_base_url=api_base_url
+                # Serialization may touch deferred columns; run_sync lets
+                # those lazy loads go through the async driver
+                mqtt_payload = await mqtt_db.run_sync(
+                    lambda _: serialize_event_for_mqtt(
+                        stored_event, event.camera_name, api_base_url=api_base_url
+                    )
                 )
                 topic = mqtt_service.get_event_topic(event.camera_id)
 
@@ -1956,17 +2309,30 @@ class AIProcessingCoordinator:
             logger.debug(f"Entity matching for context failed: {e}")
             return embedding_vector, None
 
-    async def _store_embedding(self, event_id: str, embedding_vector: Optional[bytes], camera_id: str) -> None:
-        """Store the early embedding for the event (for future context and entity matching)."""
+    async def _store_embedding(
+        self,
+        event_id: str,
+        embedding_vector: Optional[bytes],
+        camera_id: str,
+        unit_of_work: Optional[EventUnitOfWork] = None,
+    ) -> None:
+        """Store the early embedding for the event (for future context and entity matching).
+
+        With a unit_of_work the row is only staged and written with the rest
+        of the event's post-processing writes.
+        """
         try:
             if embedding_vector:
                 embedding_service = self.embedding_service
-                with SessionLocal() as embed_db:
-                    await embedding_service.store_embedding(
-                        db=embed_db,
-                        event_id=event_id,
-                        embedding=embedding_vector,
-                    )
+                if unit_of_work is not None:
+                    unit_of_work.add(embedding_service.build_embedding(event_id, embedding_vector))
+                else:
+                    with SessionLocal() as embed_db:
+                        await embedding_service.store_embedding(
+                            db=embed_db,
+                            event_id=event_id,
+                            embedding=embedding_vector,
+                        )
 
                 logger.debug(
                     f"Embedding stored for event {event_id}",
@@ -6,6 +6,7 @@ Contains the concrete implementations for all supported vision AI providers:
 - xAI Grok
 - Anthropic Claude
 - Google Gemini
+- Local stand-in (no network; for load testing)
 
 This package was extracted from the original monolithic ai_service.py during
 Phase 3.3 of the ai_service decomposition (issue #444).
@@ -25,6 +26,7 @@ from .openai_provider import OpenAIProvider
 from .grok_provider import GrokProvider
 from .claude_provider import ClaudeProvider
 from .gemini_provider import GeminiProvider
+from .local_provider import LocalOpenAIServer, LocalProviderProfile, LocalVisionProvider
 
 __all__ = [
     "AIProviderBase",
@@ -32,6 +34,9 @@ __all__ = [
     "GrokProvider",
     "ClaudeProvider",
     "GeminiProvider",
+    "LocalVisionProvider",
+    "LocalProviderProfile",
+    "LocalOpenAIServer",
 ]
 
 # Provider registry for convenience
@@ -7,8 +7,6 @@ Extracted during Phase 3.3.
 import time
 from typing import List, Optional
 
-import anthropic
-
 from .base import AIProviderBase
 from app.services.ai_types import AIResult
 from app.services.ocr_service import OCRResult
@@ -19,6 +17,7 @@ class ClaudeProvider(AIProviderBase):
 
     def __init__(self, api_key: str, model: str = None):
         super().__init__(api_key)
+        import anthropic  # Loaded only once a Claude key is configured
         self.client = anthropic.AsyncAnthropic(api_key=api_key)
         from app.services.ai_providers.model_resolver import resolve_model
         self.model = resolve_model("claude", api_key, override=model)
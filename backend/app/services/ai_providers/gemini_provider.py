@@ -8,7 +8,6 @@ import time
 from pathlib import Path
 from typing import List, Optional
 
-import google.generativeai as genai
 import numpy as np
 
 from .base import AIProviderBase
@@ -21,6 +20,7 @@ class GeminiProvider(AIProviderBase):
 
     def __init__(self, api_key: str, model: str = None):
         super().__init__(api_key)
+        import google.generativeai as genai  # Loaded only once a Gemini key is configured
         genai.configure(api_key=api_key)
         from app.services.ai_providers.model_resolver import resolve_model
         self.model_name = resolve_model("gemini", api_key, override=model)
@@ -7,8 +7,6 @@ Extracted during Phase 3.3.
 import time
 from typing import List, Optional
 
-import openai
-
 from .base import AIProviderBase
 from app.services.ai_types import AIResult
 from app.services.ocr_service import OCRResult
@@ -20,6 +18,7 @@ class GrokProvider(AIProviderBase):
 
     def __init__(self, api_key: str, model: str = None):
         super().__init__(api_key)
+        import openai  # Loaded only once a Grok key is configured
         self.client = openai.AsyncOpenAI(
             api_key=api_key,
             base_url="https://api.x.ai/v1"
@@ -0,0 +1,305 @@
+"""
+Local vision-provider stand-ins for load testing.
+
+Neither stand-in calls a real model or needs a network connection.
+Measuring pipeline throughput does not require paying a provider for every
+synthetic event:
+
+- ``LocalVisionProvider`` is an ``AIProviderBase`` that VisionAnalysisOrchestrator
+  can use like any other provider.
+- ``LocalOpenAIServer`` is a tiny HTTP server speaking the OpenAI
+  ``/v1/chat/completions`` API. It is used for the OpenAI-compatible path
+  through ``LiteLLMProvider``, via ``openai_api_base`` or ``AI_OPENAI_API_BASE``.
+
+Both draw their behaviour from a ``LocalProviderProfile``: a log-normal
+latency distribution fitted to the given p50/p99, an error rate, and token
+counts per image. With a fixed seed, runs are repeatable.
+
+Run the HTTP stand-in on its own with:
+    python -m app.services.ai_providers.local_provider --port 8089 --p50-ms 1200 --p99-ms 3500
+"""
+import asyncio
+import json
+import logging
+import math
+import random
+import threading
+import time
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Optional, Tuple
+
+from app.services.ai_providers.base import AIProviderBase
+from app.services.ai_types import AIResult
+from app.services.ocr_service import OCRResult
+
+logger = logging.getLogger(__name__)
+
+# z-score of the 99th percentile of a standard normal distribution
+_Z99 = 2.3263
+
+
+@dataclass
+class LocalProviderProfile:
+    """
+    Simulated provider behaviour.
+
+    Attributes:
+        latency_p50_ms: Median response time
+        latency_p99_ms: 99th percentile response time (equal to p50 for a fixed latency)
+        error_rate: Fraction of calls that fail
+        prompt_tokens_per_image: Input tokens charged per image
+        completion_tokens: Output tokens per response
+        cost_per_1k_tokens: USD per 1000 tokens, for cost estimates
+        description: Text returned for successful calls
+        seed: Random seed (None for a different sequence each run)
+    """
+    latency_p50_ms: float = 1200.0
+    latency_p99_ms: float = 3500.0
+    error_rate: float = 0.0
+    prompt_tokens_per_image: int = 850
+    completion_tokens: int = 60
+    cost_per_1k_tokens: float = 0.00015
+    description: str = "A person in a dark jacket walks up the driveway toward the front door."
+    seed: Optional[int] = None
+
+    def sample(self, rng: random.Random, image_count: int = 1) -> Tuple[float, bool, int]:
+        """
+        Draw one response.
+
+        Returns:
+            (latency_ms, success, tokens_used)
+        """
+        sigma = 0.0
+        if self.latency_p99_ms > self.latency_p50_ms > 0:
+            sigma = math.log(self.latency_p99_ms / self.latency_p50_ms) / _Z99
+        latency_ms = self.latency_p50_ms * math.exp(sigma * rng.gauss(0.0, 1.0)) if sigma else self.latency_p50_ms
+        success = rng.random() >= self.error_rate
+        tokens = self.prompt_tokens_per_image * max(1, image_count) + (self.completion_tokens if success else 0)
+        return latency_ms, success, tokens
+
+    def cost(self, tokens: int) -> float:
+        return tokens / 1000 * self.cost_per_1k_tokens
+
+
+class LocalVisionProvider(AIProviderBase):
+    """
+    In-process provider that sleeps for a sampled latency and returns a canned
+    description.
+
+    Attributes:
+        profile: Behaviour being simulated
+        model: Reported model name
+        calls: Number of requests served
+    """
+
+    def __init__(self, profile: Optional[LocalProviderProfile] = None, model: str = "local-vision"):
+        super().__init__(api_key="local")
+        self.profile = profile or LocalProviderProfile()
+        self.model = model
+        self.calls = 0
+        self._rng = random.Random(self.profile.seed)
+
+    async def generate_description(
+        self,
+        image_base64: str,
+        camera_name: str,
+        timestamp: str,
+        detected_objects: List[str],
+        custom_prompt: Optional[str] = None,
+        audio_transcription: Optional[str] = None,
+        ocr_result: Optional[OCRResult] = None,
+    ) -> AIResult:
+        return await self._respond(1, detected_objects)
+
+    async def generate_multi_image_description(
+        self,
+        images_base64: List[str],
+        camera_name: str,
+        timestamp: str,
+        detected_objects: List[str],
+        custom_prompt: Optional[str] = None,
+        audio_transcription: Optional[str] = None,
+        ocr_result: Optional[OCRResult] = None,
+    ) -> AIResult:
+        return await self._respond(len(images_base64), detected_objects)
+
+    async def _respond(self, image_count: int, detected_objects: List[str]) -> AIResult:
+        self.calls += 1
+        latency_ms, success, tokens = self.profile.sample(self._rng, image_count)
+        await asyncio.sleep(latency_ms / 1000)
+        if not success:
+            return AIResult(
+                description="",
+                confidence=0,
+                objects_detected=detected_objects or ["unknown"],
+                provider="local",
+                tokens_used=tokens,
+                response_time_ms=int(latency_ms),
+                cost_estimate=self.profile.cost(tokens),
+                success=False,
+                error="Local stand-in: injected failure",
+            )
+        return AIResult(
+            description=self.profile.description,
+            confidence=80,
+            objects_detected=detected_objects or ["unknown"],
+            provider="local",
+            tokens_used=tokens,
+            response_time_ms=int(latency_ms),
+            cost_estimate=self.profile.cost(tokens),
+            success=True,
+        )
+
+
+class LocalOpenAIServer:
+    """
+    OpenAI-compatible HTTP stand-in (``POST /v1/chat/completions``).
+
+    Each request is served on its own thread, which sleeps for the sampled
+    latency. Failures are returned as HTTP 500 with an OpenAI-style error
+    body.
+
+    Usage:
+        with LocalOpenAIServer(LocalProviderProfile(seed=1)) as server:
+            provider = LiteLLMProvider(openai_key="local", openai_api_base=server.base_url)
+
+    Attributes:
+        profile: Behaviour being simulated
+        requests: Number of completion requests served
+    """
+
+    def __init__(self, profile: Optional[LocalProviderProfile] = None, host: str = "127.0.0.1", port: int = 0):
+        self.profile = profile or LocalProviderProfile()
+        self.requests = 0
+        self._rng = random.Random(self.profile.seed)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}/v1"
+
+    def start(self) -> "LocalOpenAIServer":
+        self._thread = threading.Thread(target=self._server.serve_forever, name="local-openai", daemon=True)
+        self._thread.start()
+        logger.info(f"Local OpenAI stand-in listening on {self.base_url}")
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def __enter__(self) -> "LocalOpenAIServer":
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
+
+    def _draw(self, image_count: int) -> Tuple[float, bool, int, int]:
+        with self._lock:
+            self.requests += 1
+            latency_ms, success, tokens = self.profile.sample(self._rng, image_count)
+            return latency_ms, success, tokens, self.requests
+
+    def _handler_class(self):
+        stand_in = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):  # noqa: A002 - BaseHTTPRequestHandler signature
+                pass
+
+            def _send(self, status: int, payload: dict) -> None:
+                body = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self):
+                if self.path.rstrip("/").endswith("/models"):
+                    self._send(200, {"object": "list", "data": [{"id": "local-vision", "object": "model"}]})
+                else:
+                    self._send(404, {"error": {"message": "Not found", "type": "invalid_request_error"}})
+
+            def do_POST(self):
+                if not self.path.rstrip("/").endswith("/chat/completions"):
+                    self._send(404, {"error": {"message": "Not found", "type": "invalid_request_error"}})
+                    return
+                length = int(self.headers.get("Content-Length") or 0)
+                try:
+                    request = json.loads(self.rfile.read(length) or b"{}")
+                except ValueError:
+                    self._send(400, {"error": {"message": "Invalid JSON", "type": "invalid_request_error"}})
+                    return
+
+                image_count = sum(
+                    1
+                    for message in request.get("messages", [])
+                    if isinstance(message.get("content"), list)
+                    for part in message["content"]
+                    if isinstance(part, dict) and part.get("type") == "image_url"
+                )
+                latency_ms, success, tokens, request_number = stand_in._draw(image_count)
+                time.sleep(latency_ms / 1000)
+
+                if not success:
+                    self._send(500, {"error": {"message": "Local stand-in: injected failure", "type": "server_error"}})
+                    return
+                completion_tokens = stand_in.profile.completion_tokens
+                self._send(200, {
+                    "id": f"chatcmpl-local-{request_number}",
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": request.get("model", "local-vision"),
+                    "choices": [{
+                        "index": 0,
+                        "message": {"role": "assistant", "content": stand_in.profile.description},
+                        "finish_reason": "stop",
+                    }],
+                    "usage": {
+                        "prompt_tokens": tokens - completion_tokens,
+                        "completion_tokens": completion_tokens,
+                        "total_tokens": tokens,
+                    },
+                })
+
+        return Handler
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="OpenAI-compatible local vision stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--p50-ms", type=float, default=LocalProviderProfile.latency_p50_ms)
+    parser.add_argument("--p99-ms", type=float, default=LocalProviderProfile.latency_p99_ms)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    server = LocalOpenAIServer(
+        LocalProviderProfile(
+            latency_p50_ms=args.p50_ms,
+            latency_p99_ms=args.p99_ms,
+            error_rate=args.error_rate,
+            seed=args.seed,
+        ),
+        host=args.host,
+        port=args.port,
+    )
+    print(f"Serving on {server.base_url} (set AI_OPENAI_API_BASE to use it)")
+    try:
+        server._server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server._server.server_close()
@@ -26,7 +26,7 @@ rather than going through AIService.
 import logging
 import time
 from datetime import datetime, timezone
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 
 import numpy as np
 from sqlalchemy.orm import Session
@@ -409,7 +409,8 @@ class AIService:
         custom_prompt: Optional[str] = None,
         audio_transcription: Optional[str] = None,
         camera_id: Optional[str] = None,
-        ocr_result: Optional[OCRResult] = None
+        ocr_result: Optional[OCRResult] = None,
+        regions: Optional[List[Tuple[int, int, int, int]]] = None,
     ) -> AIResult:
         """
         Generate natural language description from camera frame.
@@ -427,6 +428,7 @@ class AIService:
             audio_transcription: Optional transcribed speech from doorbell audio (Story P3-5.3)
             camera_id: Optional camera ID for camera-specific prompts/A/B testing (Story P4-5.4)
             ocr_result: Optional OCR extraction from frame overlay (Story P9-3.2)
+            regions: Optional (x, y, width, height) motion/detection boxes to crop to
 
         Returns:
             AIResult with description, confidence, objects, and usage stats
@@ -447,6 +449,7 @@ class AIService:
             audio_transcription=audio_transcription,
             camera_id=camera_id,
             ocr_result=ocr_result,
+            regions=regions,
         )
 
     async def describe_images(
@@ -15,6 +15,7 @@ Flow:
                                     |
                                     v
                     PatternService.get_patterns() -> baseline
+                    (in-memory; DB read only on a cold cache)
                                     |
                                     v
                     Calculate timing_score, day_score, object_score
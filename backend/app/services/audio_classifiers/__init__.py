@@ -6,6 +6,7 @@ for detecting audio events like glass breaking, gunshots, screams, etc.
 Available classifiers:
 - BaseAudioClassifier: Abstract base class for all classifiers
 - MockAudioClassifier: Testing/demo classifier with random results
+- DSPAudioClassifier: Lightweight spectral-feature classifier (default)
 """
 
 from app.services.audio_classifiers.base import (
@@ -14,10 +15,12 @@ from app.services.audio_classifiers.base import (
     BaseAudioClassifier,
 )
 from app.services.audio_classifiers.mock import MockAudioClassifier
+from app.services.audio_classifiers.dsp import DSPAudioClassifier
 
 __all__ = [
     "AudioEventType",
     "AudioClassificationResult",
     "BaseAudioClassifier",
     "MockAudioClassifier",
+    "DSPAudioClassifier",
 ]
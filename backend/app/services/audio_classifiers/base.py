@@ -8,13 +8,14 @@ Supported event types:
 - gunshot: Sound of gunfire
 - scream: Human screaming or distress call
 - doorbell: Doorbell ringing sound
+- alarm: Sustained or beeping alarm tone (smoke/CO alarm, siren)
 - other: Other significant audio event
 """
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import List, Optional
+from typing import Dict, List, Optional
 import numpy as np
 
 
@@ -24,6 +25,7 @@ class AudioEventType(str, Enum):
     GUNSHOT = "gunshot"
     SCREAM = "scream"
     DOORBELL = "doorbell"
+    ALARM = "alarm"
     OTHER = "other"
 
     @classmethod
@@ -122,6 +124,48 @@ class BaseAudioClassifier(ABC):
         """
         pass
 
+    def supports_streaming(self) -> bool:
+        """
+        Whether this classifier implements classify_stream().
+
+        Streaming classifiers keep per-stream state and read new samples
+        directly from an AudioRingBuffer instead of a fixed-length copy.
+        """
+        return False
+
+    def classify_stream(self, stream_id: str, buffer) -> List[AudioClassificationResult]:
+        """
+        Classify audio written to a ring buffer since the previous call.
+
+        The default reads the new samples and passes them to classify();
+        streaming classifiers override this to keep incremental state.
+
+        Args:
+            stream_id: Stream identifier (camera ID)
+            buffer: AudioRingBuffer for the stream
+
+        Returns:
+            List of AudioClassificationResult for newly detected events.
+        """
+        positions = self.__dict__.setdefault("_stream_positions", {})
+        samples, positions[stream_id] = buffer.read_since(positions.get(stream_id, 0))
+        if len(samples) == 0:
+            return []
+        return self.classify(samples, buffer.sample_rate)
+
+    def reset_stream(self, stream_id: str) -> None:
+        """Drop per-stream state kept by classify_stream() (e.g. camera stopped)."""
+        self.__dict__.get("_stream_positions", {}).pop(stream_id, None)
+
+    def configure_thresholds(self, thresholds: Dict[AudioEventType, float]) -> None:
+        """
+        Receive the detector's per-type confidence thresholds.
+
+        Called whenever thresholds are loaded or changed. Classifiers may use
+        them to tune internal sensitivity; the default ignores them.
+        """
+        pass
+
     def preprocess_audio(
         self,
         audio_samples: np.ndarray,
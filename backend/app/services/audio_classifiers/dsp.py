@@ -0,0 +1,617 @@
+"""DSP Audio Event Classifier
+
+A CPU-cheap, dependency-free (numpy only) audio event classifier built on
+classic signal features instead of a neural model:
+
+- Short-time Fourier transform with a Hann window (vectorized over frames)
+- Mel-band log energies and positive spectral flux (onset strength)
+- Zero-crossing rate, RMS level, spectral centroid and flatness
+- Dominant-peak frequency and tonality (energy fraction around the peak)
+
+Event rules:
+- glass_break: broadband, high-frequency onset that decays quickly, usually
+  followed by further high-frequency "tinkle" onsets
+- doorbell: one or more tonal strikes (300-2000 Hz) with decaying envelope,
+  typically two or three distinct pitches
+- scream: loud, sustained, voiced (harmonic) sound in the 400-3000 Hz range
+  with pitch movement
+- alarm: sustained or beeping pure tone at a stable frequency (1.8-4.5 kHz,
+  the range used by smoke/CO alarms)
+
+Features can be computed incrementally per stream with classify_stream(),
+which only transforms samples written to an AudioRingBuffer since the last
+call and keeps a short rolling window of per-frame features. A stream of
+16 kHz mono audio costs well under 1% of a core.
+"""
+
+import logging
+import threading
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from app.services.audio_classifiers.base import (
+    AudioEventType,
+    AudioClassificationResult,
+    BaseAudioClassifier,
+)
+
+logger = logging.getLogger(__name__)
+
+# Analysis framing (at 16 kHz: 512-sample / 32 ms frames with a 16 ms hop)
+FRAME_SECONDS = 0.032
+NUM_MEL_BANDS = 24
+MIN_MEL_FREQ_HZ = 60.0
+HIGH_FREQ_SPLIT_HZ = 3000.0
+
+# Level gates
+MIN_ACTIVE_RMS = 0.01  # ~-40 dBFS, quieter frames are never considered
+BACKGROUND_RATIO = 4.0  # Active frames must be this much above background RMS
+
+# Default rolling window for streaming classification
+DEFAULT_WINDOW_SECONDS = 2.0
+
+# Streaming: wait until an event has been quiet this long (or has lasted
+# SETTLE_MAX_SECONDS) before reporting it, so it is scored with full context
+SETTLE_SECONDS = 0.25
+SETTLE_MAX_SECONDS = 1.0
+
+# Confidence below which candidates are not reported, relative to the
+# detector threshold for that type (so near misses are still visible)
+REPORT_MARGIN = 0.2
+DEFAULT_REPORT_FLOOR = 0.5
+
+# Feature arrays kept per frame, in this order
+_FEATURE_NAMES = (
+    "rms", "zcr", "flux", "centroid", "flatness", "peak_freq", "tonality", "hf_ratio",
+)
+
+_EPS = 1e-10
+
+
+def _hz_to_mel(hz: np.ndarray) -> np.ndarray:
+    return 2595.0 * np.log10(1.0 + hz / 700.0)
+
+
+def _mel_to_hz(mel: np.ndarray) -> np.ndarray:
+    return 700.0 * (10.0 ** (mel / 2595.0) - 1.0)
+
+
+@dataclass
+class _Analysis:
+    """Precomputed transform tables for one sample rate."""
+    sample_rate: int
+    frame_length: int
+    hop_length: int
+    window: np.ndarray
+    freqs: np.ndarray
+    mel_filters: np.ndarray  # (bins, bands), applied as spec @ mel_filters
+    hf_mask: np.ndarray
+    flatness_mask: np.ndarray
+
+    @classmethod
+    def for_sample_rate(cls, sample_rate: int) -> "_Analysis":
+        frame_length = 1 << int(np.ceil(np.log2(max(sample_rate * FRAME_SECONDS, 64))))
+        hop_length = frame_length // 2
+        freqs = np.fft.rfftfreq(frame_length, d=1.0 / sample_rate)
+
+        # Triangular mel filterbank
+        mel_points = np.linspace(
+            _hz_to_mel(np.array(MIN_MEL_FREQ_HZ)),
+            _hz_to_mel(np.array(sample_rate / 2.0)),
+            NUM_MEL_BANDS + 2,
+        )
+        hz_points = _mel_to_hz(mel_points)
+        lower, center, upper = hz_points[:-2, None], hz_points[1:-1, None], hz_points[2:, None]
+        rising = (freqs[None, :] - lower) / np.maximum(center - lower, _EPS)
+        falling = (upper - freqs[None, :]) / np.maximum(upper - center, _EPS)
+        mel_filters = np.clip(np.minimum(rising, falling), 0.0, None).T.astype(np.float32)
+
+        return cls(
+            sample_rate=sample_rate,
+            frame_length=frame_length,
+            hop_length=hop_length,
+            window=np.hanning(frame_length).astype(np.float32),
+            freqs=freqs.astype(np.float32),
+            mel_filters=mel_filters,
+            hf_mask=freqs >= HIGH_FREQ_SPLIT_HZ,
+            flatness_mask=freqs >= 100.0,
+        )
+
+
+@dataclass
+class _StreamState:
+    """Per-stream incremental feature state for classify_stream()."""
+    position: int = 0  # Ring buffer position consumed so far
+    tail: np.ndarray = field(default_factory=lambda: np.zeros(0, dtype=np.float32))
+    prev_log_mel: Optional[np.ndarray] = None
+    frame_offset: int = 0  # Absolute index of features[...][0]
+    features: Optional[Dict[str, np.ndarray]] = None
+    reported_until: Dict[AudioEventType, int] = field(default_factory=dict)
+
+
+class DSPAudioClassifier(BaseAudioClassifier):
+    """
+    Rule-based audio event classifier using vectorized spectral features.
+
+    Stateless classify() analyses a complete buffer of samples, as required
+    by BaseAudioClassifier. classify_stream() keeps per-stream state so that
+    periodic checks only transform newly captured audio.
+    """
+
+    def __init__(
+        self,
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+        report_floor: float = DEFAULT_REPORT_FLOOR,
+    ):
+        """
+        Initialize DSPAudioClassifier.
+
+        Args:
+            window_seconds: Rolling analysis window for classify_stream()
+            report_floor: Minimum confidence reported for types without a
+                configured threshold
+        """
+        self.window_seconds = window_seconds
+        self._report_floors: Dict[AudioEventType, float] = {
+            event_type: report_floor for event_type in AudioEventType
+        }
+        self._analyses: Dict[int, _Analysis] = {}
+        self._streams: Dict[str, _StreamState] = {}
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # BaseAudioClassifier interface
+    # ------------------------------------------------------------------
+
+    def classify(
+        self,
+        audio_samples: np.ndarray,
+        sample_rate: int,
+        channels: int = 1,
+    ) -> List[AudioClassificationResult]:
+        """
+        Classify a complete buffer of audio samples.
+
+        Args:
+            audio_samples: Audio samples as numpy array (int16 or float32)
+            sample_rate: Sample rate of the audio in Hz
+            channels: Number of interleaved channels (downmixed to mono)
+
+        Returns:
+            List of AudioClassificationResult, at most one per event type
+        """
+        analysis = self._get_analysis(sample_rate)
+        samples = self._to_mono_float(audio_samples, sample_rate, channels)
+        if len(samples) < analysis.frame_length:
+            return []
+
+        features, _ = self._compute_features(samples, analysis, prev_log_mel=None)
+        return self._detect(features, analysis, frame_offset=0, reported_until=None)
+
+    def get_supported_event_types(self) -> List[AudioEventType]:
+        """DSP rules cover glass break, doorbell chimes, screams and alarm tones."""
+        return [
+            AudioEventType.GLASS_BREAK,
+            AudioEventType.DOORBELL,
+            AudioEventType.SCREAM,
+            AudioEventType.ALARM,
+        ]
+
+    def get_model_name(self) -> str:
+        """Return DSP classifier identifier."""
+        return "dsp_v1"
+
+    def supports_streaming(self) -> bool:
+        """DSP classifier maintains incremental per-stream features."""
+        return True
+
+    def configure_thresholds(self, thresholds: Dict[AudioEventType, float]) -> None:
+        """
+        Derive per-type reporting floors from the detector thresholds.
+
+        Candidates more than REPORT_MARGIN below their threshold are dropped
+        here instead of being returned only to be filtered by the detector.
+        """
+        with self._lock:
+            for event_type, threshold in thresholds.items():
+                self._report_floors[event_type] = max(0.0, threshold - REPORT_MARGIN)
+
+    # ------------------------------------------------------------------
+    # Streaming interface
+    # ------------------------------------------------------------------
+
+    def classify_stream(self, stream_id: str, buffer) -> List[AudioClassificationResult]:
+        """
+        Classify audio incrementally from a ring buffer.
+
+        Only samples written since the previous call for this stream are
+        transformed; features for the rolling window are kept in memory.
+        An event is reported once, even though it stays inside the window
+        for several calls.
+
+        Args:
+            stream_id: Stream identifier (camera ID)
+            buffer: AudioRingBuffer (anything with sample_rate and read_since())
+
+        Returns:
+            List of AudioClassificationResult for newly detected events
+        """
+        analysis = self._get_analysis(buffer.sample_rate)
+
+        with self._lock:
+            state = self._streams.get(stream_id)
+            if state is None:
+                state = _StreamState()
+                self._streams[stream_id] = state
+
+        new_samples, end_position = buffer.read_since(state.position)
+        if end_position - len(new_samples) > state.position or end_position < state.position:
+            # Fell behind the ring buffer or it was cleared; restart framing
+            state.tail = np.zeros(0, dtype=np.float32)
+            state.prev_log_mel = None
+        state.position = end_position
+
+        if len(new_samples) == 0:
+            return []
+
+        samples = np.concatenate([state.tail, self._to_mono_float(new_samples, buffer.sample_rate, 1)])
+        num_frames = 0
+        if len(samples) >= analysis.frame_length:
+            num_frames = 1 + (len(samples) - analysis.frame_length) // analysis.hop_length
+        if num_frames == 0:
+            state.tail = samples
+            return []
+
+        consumed = num_frames * analysis.hop_length
+        state.tail = samples[consumed:]
+        new_features, state.prev_log_mel = self._compute_features(
+            samples[:consumed + analysis.frame_length - analysis.hop_length],
+            analysis,
+            prev_log_mel=state.prev_log_mel,
+        )
+
+        # Append to the rolling window; every new frame is analysed at least
+        # once even if more than window_seconds arrived since the last call
+        if state.features is None:
+            state.features = new_features
+        else:
+            state.features = {
+                name: np.concatenate([state.features[name], new_features[name]])
+                for name in _FEATURE_NAMES
+            }
+
+        results = self._detect(
+            state.features,
+            analysis,
+            frame_offset=state.frame_offset,
+            reported_until=state.reported_until,
+        )
+
+        window_frames = max(1, int(self.window_seconds * analysis.sample_rate / analysis.hop_length))
+        excess = len(state.features["rms"]) - window_frames
+        if excess > 0:
+            state.features = {name: values[excess:] for name, values in state.features.items()}
+            state.frame_offset += excess
+
+        return results
+
+    def reset_stream(self, stream_id: str) -> None:
+        """Drop incremental state for a stream (e.g. camera stopped)."""
+        with self._lock:
+            self._streams.pop(stream_id, None)
+
+    # ------------------------------------------------------------------
+    # Feature extraction
+    # ------------------------------------------------------------------
+
+    def _get_analysis(self, sample_rate: int) -> _Analysis:
+        analysis = self._analyses.get(sample_rate)
+        if analysis is None:
+            analysis = _Analysis.for_sample_rate(sample_rate)
+            self._analyses[sample_rate] = analysis
+        return analysis
+
+    def _to_mono_float(self, audio_samples: np.ndarray, sample_rate: int, channels: int) -> np.ndarray:
+        samples = self.preprocess_audio(np.asarray(audio_samples), sample_rate)
+        if samples.ndim > 1:
+            samples = samples.mean(axis=1)
+        elif channels > 1:
+            usable = len(samples) - len(samples) % channels
+            samples = samples[:usable].reshape(-1, channels).mean(axis=1)
+        return samples.astype(np.float32, copy=False)
+
+    def _compute_features(
+        self,
+        samples: np.ndarray,
+        analysis: _Analysis,
+        prev_log_mel: Optional[np.ndarray],
+    ) -> Tuple[Dict[str, np.ndarray], np.ndarray]:
+        """
+        Compute per-frame features for all complete frames in samples.
+
+        Returns:
+            Tuple of (feature arrays keyed by name, last frame's log-mel energies)
+        """
+        frames = np.lib.stride_tricks.sliding_window_view(
+            samples, analysis.frame_length
+        )[::analysis.hop_length]
+
+        rms = np.sqrt(np.mean(frames * frames, axis=1))
+        signs = np.signbit(frames)
+        zcr = np.count_nonzero(signs[:, 1:] != signs[:, :-1], axis=1) / analysis.frame_length
+
+        power = np.abs(np.fft.rfft(frames * analysis.window, axis=1)) ** 2
+        total = power.sum(axis=1) + _EPS
+
+        log_mel = np.log10(power @ analysis.mel_filters + _EPS)
+        previous = np.vstack([
+            log_mel[:1] if prev_log_mel is None else prev_log_mel[None, :],
+            log_mel[:-1],
+        ])
+        flux = np.clip(log_mel - previous, 0.0, None).mean(axis=1)
+
+        centroid = (power @ analysis.freqs) / total
+
+        flat_power = power[:, analysis.flatness_mask] + _EPS
+        flatness = np.exp(np.mean(np.log(flat_power), axis=1)) / np.mean(flat_power, axis=1)
+
+        peak_bin = np.argmax(power, axis=1)
+        rows = np.arange(len(power))
+        peak_energy = power[rows, peak_bin]
+        peak_energy = peak_energy + power[rows, np.maximum(peak_bin - 1, 0)]
+        peak_energy = peak_energy + power[rows, np.minimum(peak_bin + 1, power.shape[1] - 1)]
+        tonality = peak_energy / total
+
+        hf_ratio = power[:, analysis.hf_mask].sum(axis=1) / total
+
+        features = {
+            "rms": rms,
+            "zcr": zcr,
+            "flux": flux,
+            "centroid": centroid,
+            "flatness": flatness,
+            "peak_freq": analysis.freqs[peak_bin],
+            "tonality": tonality,
+            "hf_ratio": hf_ratio,
+        }
+        return features, log_mel[-1]
+
+    # ------------------------------------------------------------------
+    # Event rules
+    # ------------------------------------------------------------------
+
+    def _detect(
+        self,
+        features: Dict[str, np.ndarray],
+        analysis: _Analysis,
+        frame_offset: int,
+        reported_until: Optional[Dict[AudioEventType, int]],
+    ) -> List[AudioClassificationResult]:
+        rms = features["rms"]
+        if len(rms) == 0:
+            return []
+
+        background = float(np.percentile(rms, 20))
+        active = rms > max(MIN_ACTIVE_RMS, background * BACKGROUND_RATIO)
+        if not active.any():
+            # Window may be entirely loud (sustained tone): fall back to absolute level
+            active = rms > MIN_ACTIVE_RMS
+            if not active.any():
+                return []
+
+        frame_ms = analysis.hop_length * 1000.0 / analysis.sample_rate
+        settle_frames = int(SETTLE_SECONDS * 1000.0 / frame_ms)
+        settle_max_frames = int(SETTLE_MAX_SECONDS * 1000.0 / frame_ms)
+        candidates = [
+            self._detect_alarm(features, active),
+            self._detect_doorbell(features, active),
+            self._detect_scream(features, active),
+            self._detect_glass_break(features, active, background),
+        ]
+
+        results = []
+        for candidate in candidates:
+            if candidate is None:
+                continue
+            event_type, confidence, start, end, metadata = candidate
+            if confidence < self._report_floors.get(event_type, DEFAULT_REPORT_FLOOR):
+                continue
+
+            if reported_until is not None:
+                # Same event still in view (or continuing): extend, don't re-report
+                if frame_offset + start <= reported_until.get(event_type, -1):
+                    reported_until[event_type] = max(reported_until[event_type], frame_offset + end)
+                    continue
+                # Still developing: score it once it has settled
+                if len(rms) - 1 - end < settle_frames and end - start < settle_max_frames:
+                    continue
+                reported_until[event_type] = frame_offset + end
+
+            metadata.update({
+                "classifier": "dsp",
+                "peak_rms": round(float(rms[start:end + 1].max()), 4),
+            })
+            results.append(AudioClassificationResult(
+                event_type=event_type,
+                confidence=round(float(np.clip(confidence, 0.0, 1.0)), 3),
+                duration_ms=int((end - start + 1) * frame_ms),
+                start_offset_ms=int(start * frame_ms),
+                metadata=metadata,
+            ))
+
+        return results
+
+    def _detect_alarm(self, features, active):
+        """Sustained/beeping pure tone at a stable frequency."""
+        tonal = (
+            active
+            & (features["tonality"] > 0.5)
+            & (features["peak_freq"] >= 1800.0)
+            & (features["peak_freq"] <= 4500.0)
+        )
+        count = int(tonal.sum())
+        if count < 10:
+            return None
+
+        freqs = features["peak_freq"][tonal]
+        median_freq = float(np.median(freqs))
+        stability = float(np.mean(np.abs(freqs - median_freq) <= median_freq * 0.03))
+        coverage = count / len(tonal)
+        sustain = min(1.0, coverage / 0.4)
+
+        confidence = 0.35 + 0.45 * sustain * stability + 0.2 * float(np.mean(features["tonality"][tonal]))
+        start, end = self._span(tonal)
+        return AudioEventType.ALARM, confidence, start, end, {
+            "tone_hz": round(median_freq, 1),
+            "tonal_fraction": round(coverage, 3),
+        }
+
+    def _detect_doorbell(self, features, active):
+        """Struck tonal chime(s) with decaying envelope."""
+        tonal = (
+            active
+            & (features["tonality"] > 0.45)
+            & (features["peak_freq"] >= 300.0)
+            & (features["peak_freq"] <= 2000.0)
+        )
+        count = int(tonal.sum())
+        if count < 6:
+            return None
+
+        rms = features["rms"]
+        flux = features["flux"]
+
+        # Chimes are struck: tonal segments should begin with an onset
+        onset = flux > max(0.15, float(np.percentile(flux, 90)))
+        segment_starts = np.flatnonzero(tonal & ~np.concatenate([[False], tonal[:-1]]))
+        struck = sum(
+            1 for s in segment_starts if onset[max(0, s - 2):s + 3].any()
+        )
+        if struck == 0:
+            return None
+
+        # Envelope decays: level near the end of tonal frames is well below the peak
+        tonal_rms = rms[tonal]
+        decay = float(np.clip(1.0 - tonal_rms[-3:].mean() / (tonal_rms.max() + _EPS), 0.0, 1.0))
+
+        # Chime partials ring at a fixed pitch; voices and sirens glide
+        peak_freq = features["peak_freq"]
+        consecutive = tonal[1:] & tonal[:-1]
+        if not consecutive.any():
+            return None
+        steps = np.abs(np.diff(peak_freq))[consecutive]
+        steadiness = float(np.mean(steps <= peak_freq[1:][consecutive] * 0.02))
+        if steadiness < 0.7:
+            return None
+
+        # Count distinct pitches (ding-dong, Westminster chimes, ...)
+        freqs = np.sort(peak_freq[tonal])
+        pitches = 1 + int(np.sum(np.diff(freqs) > freqs[:-1] * 0.06))
+        pitch_score = 1.0 if 2 <= pitches <= 4 else 0.6
+
+        duration_score = min(1.0, count / 15.0)
+        confidence = (
+            0.3 + 0.25 * decay + 0.25 * pitch_score * duration_score + 0.2 * min(1.0, struck / 2.0)
+        ) * (0.7 + 0.3 * steadiness)
+        start, end = self._span(tonal)
+        return AudioEventType.DOORBELL, confidence, start, end, {
+            "pitches": pitches,
+            "decay": round(decay, 3),
+        }
+
+    def _detect_scream(self, features, active):
+        """Loud, sustained, voiced sound with a moving pitch."""
+        voiced = (
+            active
+            & (features["rms"] > 0.05)
+            & (features["flatness"] < 0.2)
+            & (features["peak_freq"] >= 400.0)
+            & (features["peak_freq"] <= 3000.0)
+            & (features["centroid"] >= 600.0)
+            & (features["centroid"] <= 4000.0)
+        )
+        start, end, longest = self._longest_run(voiced)
+        if longest < 20:  # ~320 ms at 16 kHz
+            return None
+
+        freqs = features["peak_freq"][start:end + 1]
+        median_freq = float(np.median(freqs))
+        movement = float(np.std(freqs) / (median_freq + _EPS))
+        # Pure, perfectly stable tones are alarms, not voices
+        if movement < 0.02 and float(np.mean(features["tonality"][start:end + 1])) > 0.5:
+            return None
+
+        level = float(np.clip((features["rms"][start:end + 1].mean() - 0.05) / 0.15, 0.0, 1.0))
+        duration = min(1.0, longest / 50.0)
+        movement_score = float(np.clip(movement / 0.08, 0.0, 1.0))
+        confidence = 0.3 + 0.3 * duration + 0.2 * level + 0.2 * movement_score
+        return AudioEventType.SCREAM, confidence, start, end, {
+            "pitch_hz": round(median_freq, 1),
+            "pitch_movement": round(movement, 3),
+        }
+
+    def _detect_glass_break(self, features, active, background):
+        """Broadband high-frequency impact followed by fast decay and tinkling."""
+        rms = features["rms"]
+        flux = features["flux"]
+        hf_ratio = features["hf_ratio"]
+
+        impact = (
+            active
+            & (flux > 0.4)
+            & (hf_ratio > 0.35)
+            & (features["flatness"] > 0.1)
+            & (features["zcr"] > 0.15)
+        )
+        impacts = np.flatnonzero(impact)
+        if len(impacts) == 0:
+            return None
+
+        start = int(impacts[np.argmax(rms[impacts])])
+        tail_end = min(len(rms), start + 20)  # ~320 ms
+        tail = rms[start:tail_end]
+        if len(tail) < 10:
+            return None
+
+        # Impact energy falls off within ~100 ms; shard pings after it are brief,
+        # so the lower quartile of the remaining tail tracks the decay
+        peak = float(tail.max())
+        decay = float(np.clip(1.0 - np.percentile(tail[6:], 25) / (peak + _EPS), 0.0, 1.0))
+        if decay < 0.5:
+            # Sustained broadband sound (rain, running water), not an impact
+            return None
+        jump = float(np.clip(np.log10(peak / (background + MIN_ACTIVE_RMS * 0.1)) / 2.0, 0.0, 1.0))
+
+        # Secondary high-frequency onsets (shards) after the impact
+        shards = int(np.count_nonzero(
+            (flux[start + 2:start + 40] > 0.2) & (hf_ratio[start + 2:start + 40] > 0.5)
+        ))
+        shard_score = min(1.0, shards / 3.0)
+        hf_score = float(np.clip((hf_ratio[start:tail_end].mean() - 0.3) / 0.4, 0.0, 1.0))
+
+        confidence = 0.25 + 0.2 * jump + 0.2 * decay + 0.15 * hf_score + 0.2 * shard_score
+        end = start + int(np.argmax(tail < peak * 0.1)) if (tail < peak * 0.1).any() else tail_end - 1
+        return AudioEventType.GLASS_BREAK, confidence, start, max(start, end), {
+            "hf_ratio": round(float(hf_ratio[start]), 3),
+            "shards": shards,
+        }
+
+    @staticmethod
+    def _span(mask: np.ndarray) -> Tuple[int, int]:
+        """First and last index where mask is set."""
+        indices = np.flatnonzero(mask)
+        return int(indices[0]), int(indices[-1])
+
+    @staticmethod
+    def _longest_run(mask: np.ndarray) -> Tuple[int, int, int]:
+        """Start, end and length of the longest run of True values."""
+        if not mask.any():
+            return 0, 0, 0
+        padded = np.concatenate([[0], mask.astype(np.int8), [0]])
+        edges = np.flatnonzero(np.diff(padded))
+        starts, ends = edges[::2], edges[1::2]
+        lengths = ends - starts
+        best = int(np.argmax(lengths))
+        return int(starts[best]), int(ends[best] - 1), int(lengths[best])
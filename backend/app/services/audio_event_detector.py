@@ -26,6 +26,7 @@ from app.services.audio_classifiers import (
     AudioClassificationResult,
     BaseAudioClassifier,
     MockAudioClassifier,
+    DSPAudioClassifier,
 )
 from app.models.system_setting import SystemSetting
 
@@ -38,6 +39,7 @@ DEFAULT_THRESHOLDS: Dict[AudioEventType, float] = {
     AudioEventType.GUNSHOT: 0.70,
     AudioEventType.SCREAM: 0.70,
     AudioEventType.DOORBELL: 0.70,
+    AudioEventType.ALARM: 0.70,
     AudioEventType.OTHER: 0.70,
 }
 
@@ -76,7 +78,7 @@ class AudioEventDetector:
 
     Thread Safety:
         - Threshold updates are protected by lock
-        - Classifier is stateless after initialization
+        - Classifiers are stateless, or keep per-stream state keyed by camera
         - Safe for concurrent calls from multiple camera handlers
 
     Usage:
@@ -102,6 +104,7 @@ class AudioEventDetector:
         self._thresholds = DEFAULT_THRESHOLDS.copy()
         self._threshold_lock = Lock()
         self._thresholds_loaded = False
+        self._push_thresholds_to_classifier()
 
         logger.info(
             f"AudioEventDetector initialized with classifier: {self._classifier.get_model_name()}"
@@ -120,8 +123,20 @@ class AudioEventDetector:
             classifier: New classifier implementation
         """
         self._classifier = classifier
+        self._push_thresholds_to_classifier()
         logger.info(f"Classifier changed to: {classifier.get_model_name()}")
 
+    @property
+    def supports_streaming(self) -> bool:
+        """Whether the current classifier can classify directly from ring buffers."""
+        return self._classifier.supports_streaming()
+
+    def _push_thresholds_to_classifier(self) -> None:
+        """Share current thresholds with the classifier so it can tune sensitivity."""
+        with self._threshold_lock:
+            thresholds = dict(self._thresholds)
+        self._classifier.configure_thresholds(thresholds)
+
     def get_thresholds(self) -> Dict[str, float]:
         """
         Get current confidence thresholds for all event types.
@@ -162,6 +177,7 @@ class AudioEventDetector:
         with self._threshold_lock:
             self._thresholds[event_type] = threshold
 
+        self._push_thresholds_to_classifier()
         logger.info(f"Threshold for {event_type.value} set to {threshold}")
 
     def load_thresholds_from_db(self, db: Session) -> None:
@@ -196,6 +212,8 @@ class AudioEventDetector:
             self._thresholds_loaded = True
             logger.info(f"Audio thresholds loaded from database")
 
+        self._push_thresholds_to_classifier()
+
     def save_threshold_to_db(
         self,
         db: Session,
@@ -230,6 +248,7 @@ class AudioEventDetector:
         # Update in-memory threshold
         with self._threshold_lock:
             self._thresholds[event_type] = threshold
+        self._push_thresholds_to_classifier()
 
         logger.info(f"Saved threshold {event_type.value}={threshold} to database")
 
@@ -283,7 +302,48 @@ class AudioEventDetector:
             logger.error(f"Audio classification failed: {e}", exc_info=True)
             return []
 
-        # Process results with threshold filtering
+        return self._apply_thresholds(classification_results)
+
+    def detect_stream_events(
+        self,
+        stream_id: str,
+        buffer,
+        db: Optional[Session] = None,
+    ) -> List[AudioDetectionResult]:
+        """
+        Detect audio events incrementally from a camera's ring buffer.
+
+        Requires a streaming classifier (see supports_streaming). Only audio
+        captured since the previous call for this stream is analysed.
+
+        Args:
+            stream_id: Stream identifier (camera ID)
+            buffer: AudioRingBuffer for the camera
+            db: Optional database session to load thresholds from
+
+        Returns:
+            List of AudioDetectionResult with threshold filtering applied.
+        """
+        if db is not None and not self._thresholds_loaded:
+            self.load_thresholds_from_db(db)
+
+        try:
+            classification_results = self._classifier.classify_stream(stream_id, buffer)
+        except Exception as e:
+            logger.error(f"Streaming audio classification failed: {e}", exc_info=True)
+            return []
+
+        return self._apply_thresholds(classification_results)
+
+    def reset_stream(self, stream_id: str) -> None:
+        """Forget the classifier's incremental state for a stream whose audio stopped."""
+        self._classifier.reset_stream(stream_id)
+
+    def _apply_thresholds(
+        self,
+        classification_results: List[AudioClassificationResult],
+    ) -> List[AudioDetectionResult]:
+        """Convert classifier results to detection results with threshold flags."""
         detection_results: List[AudioDetectionResult] = []
 
         for result in classification_results:
@@ -330,13 +390,16 @@ def get_audio_event_detector() -> AudioEventDetector:
     """
     Get the global AudioEventDetector singleton.
 
+    The singleton uses the DSPAudioClassifier; construct AudioEventDetector
+    directly (or call initialize_audio_event_detector) to use another backend.
+
     Returns:
         AudioEventDetector instance (creates one if not exists)
     """
     global _audio_event_detector
 
     if _audio_event_detector is None:
-        _audio_event_detector = AudioEventDetector()
+        _audio_event_detector = AudioEventDetector(classifier=DSPAudioClassifier())
 
     return _audio_event_detector
 
@@ -157,28 +157,48 @@ class AudioEventHandler:
                 reason="audio_disabled"
             )
 
-        # Get audio from buffer
-        audio_chunk = self.audio_extractor.get_latest_audio(
-            camera_id,
-            duration_seconds=audio_duration_seconds
-        )
+        audio_chunk: Optional[AudioChunk] = None
 
-        if audio_chunk is None:
-            return AudioEventCreationResult(
-                event_id=None,
-                audio_event_type=None,
-                confidence=None,
-                created=False,
-                reason="no_audio_buffer"
+        if self.audio_detector.supports_streaming:
+            # Streaming classifiers read only new samples straight from the ring buffer
+            buffer = self.audio_extractor.get_buffer(camera_id)
+            if buffer is None or buffer.is_empty:
+                return AudioEventCreationResult(
+                    event_id=None,
+                    audio_event_type=None,
+                    confidence=None,
+                    created=False,
+                    reason="no_audio_buffer"
+                )
+
+            detection_results = self.audio_detector.detect_stream_events(
+                camera_id,
+                buffer,
+                db=db,
+            )
+        else:
+            # Get audio from buffer
+            audio_chunk = self.audio_extractor.get_latest_audio(
+                camera_id,
+                duration_seconds=audio_duration_seconds
             )
 
-        # Run audio detection
-        detection_results = self.audio_detector.detect_audio_events(
-            audio_chunk.samples,
-            audio_chunk.sample_rate,
-            db=db,
-            channels=audio_chunk.channels,
-        )
+            if audio_chunk is None:
+                return AudioEventCreationResult(
+                    event_id=None,
+                    audio_event_type=None,
+                    confidence=None,
+                    created=False,
+                    reason="no_audio_buffer"
+                )
+
+            # Run audio detection
+            detection_results = self.audio_detector.detect_audio_events(
+                audio_chunk.samples,
+                audio_chunk.sample_rate,
+                db=db,
+                channels=audio_chunk.channels,
+            )
 
         if not detection_results:
             return AudioEventCreationResult(
@@ -236,7 +256,7 @@ class AudioEventHandler:
         db: Session,
         camera_id: str,
         detection: AudioDetectionResult,
-        audio_chunk: AudioChunk,
+        audio_chunk: Optional[AudioChunk],
     ) -> str:
         """
         Create an Event record for an audio detection.
@@ -245,7 +265,7 @@ class AudioEventHandler:
             db: Database session
             camera_id: Camera UUID
             detection: Audio detection result
-            audio_chunk: Source audio chunk
+            audio_chunk: Source audio chunk (None when classified from the stream)
 
         Returns:
             Created event UUID
@@ -289,6 +309,7 @@ class AudioEventHandler:
         event: Event,
         camera_id: str,
         audio_duration_seconds: float = 2.0,
+        commit: bool = True,
     ) -> bool:
         """
         Enrich an existing event with audio detection information.
@@ -301,6 +322,8 @@ class AudioEventHandler:
             event: Event to enrich
             camera_id: Camera UUID
             audio_duration_seconds: Duration of audio to analyze
+            commit: Commit the updated event (False only sets the audio
+                fields on ``event`` and leaves persisting to the caller)
 
         Returns:
             True if audio info was added to event
@@ -352,7 +375,8 @@ class AudioEventHandler:
             if event.description and not audio_desc in event.description.lower():
                 event.description = f"{event.description} [Audio: {audio_desc} detected]"
 
-        db.commit()
+        if commit:
+            db.commit()
 
         logger.info(
             f"Enriched event {event.id} with audio: {passed_detection.event_type.value}",
@@ -20,14 +20,16 @@ import struct
 import time
 import wave
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import TYPE_CHECKING, Optional, Tuple
 
 import av
 import numpy as np
-import openai
 
 from app.core.decorators import singleton
 
+if TYPE_CHECKING:
+    import openai
+
 logger = logging.getLogger(__name__)
 
 # Audio extraction configuration (Story P3-5.1)
@@ -75,7 +77,7 @@ class AudioExtractor:
         self.sample_rate = AUDIO_SAMPLE_RATE
         self.channels = AUDIO_CHANNELS
         self.sample_width = AUDIO_SAMPLE_WIDTH
-        self._openai_client: Optional[openai.OpenAI] = None
+        self._openai_client: Optional["openai.OpenAI"] = None
 
         logger.info(
             "AudioExtractor initialized",
@@ -337,7 +339,7 @@ class AudioExtractor:
             return None
 
 
-    def _get_openai_client(self) -> Optional[openai.OpenAI]:
+    def _get_openai_client(self) -> Optional["openai.OpenAI"]:
         """
         Get or create OpenAI client for Whisper API.
 
@@ -373,6 +375,7 @@ class AudioExtractor:
                 if api_key.startswith("encrypted:"):
                     api_key = decrypt_password(api_key)
 
+                import openai  # Loaded only when audio transcription is used
                 self._openai_client = openai.OpenAI(api_key=api_key)
                 logger.info(
                     "OpenAI client initialized for Whisper",
@@ -478,37 +481,33 @@ class AudioExtractor:
         """
         try:
             # Import here to avoid circular imports
-            from app.core.database import get_db_session
-            from app.models.ai_usage import AIUsage
+            from app.services.ai_cost_and_usage_tracker import get_ai_cost_and_usage_tracker
 
             # Calculate cost: $0.006 per minute
             cost_estimate = (duration_seconds / 60.0) * WHISPER_COST_PER_MINUTE
 
-            with get_db_session() as db:
-                usage = AIUsage(
-                    timestamp=datetime.now(timezone.utc),
-                    provider="whisper",
-                    success=success,
-                    tokens_used=0,  # Whisper doesn't use tokens
-                    response_time_ms=response_time_ms,
-                    cost_estimate=cost_estimate,
-                    error=error[:500] if error else None,
-                    analysis_mode="transcription",
-                    is_estimated=False
-                )
-                db.add(usage)
-                db.commit()
+            # Route through the tracker so the cost ledger sees Whisper spend
+            get_ai_cost_and_usage_tracker().record_usage(
+                provider="whisper",
+                success=success,
+                tokens_used=0,  # Whisper doesn't use tokens
+                response_time_ms=response_time_ms,
+                cost_estimate=cost_estimate,
+                error=error[:500] if error else None,
+                analysis_mode="transcription",
+                is_estimated=False,
+            )
 
-                logger.info(
-                    "Whisper usage tracked",
-                    extra={
-                        "event_type": "whisper_usage_tracked",
-                        "duration_seconds": duration_seconds,
-                        "response_time_ms": response_time_ms,
-                        "cost_estimate": cost_estimate,
-                        "success": success
-                    }
-                )
+            logger.info(
+                "Whisper usage tracked",
+                extra={
+                    "event_type": "whisper_usage_tracked",
+                    "duration_seconds": duration_seconds,
+                    "response_time_ms": response_time_ms,
+                    "cost_estimate": cost_estimate,
+                    "success": success
+                }
+            )
 
         except Exception as e:
             # Don't fail transcription if usage tracking fails
@@ -587,6 +586,8 @@ class AudioExtractor:
             )
             return None
 
+        import openai
+
         try:
             # Create file-like object for OpenAI API
             audio_file = io.BytesIO(audio_bytes)
@@ -4,7 +4,7 @@ AudioStreamService for real-time audio extraction from RTSP streams (Story P6-3.
 Provides functionality to:
 - Extract audio streams from live RTSP feeds using PyAV
 - Detect and validate audio codecs (AAC, G.711/PCMU, Opus)
-- Maintain a thread-safe ring buffer for audio samples
+- Maintain a preallocated, lock-free-read ring buffer for audio samples
 - Support enable/disable per camera via configuration
 
 This is distinct from audio_extractor.py which extracts audio from video clips.
@@ -15,9 +15,8 @@ Architecture Reference: docs/epics-phase6.md#Story P6-3.1
 import logging
 import threading
 import time
-from collections import deque
 from dataclasses import dataclass
-from typing import Deque, Dict, Optional, Tuple
+from typing import Dict, Optional, Tuple
 
 import av
 import numpy as np
@@ -66,12 +65,22 @@ class AudioChunk:
 
 class AudioRingBuffer:
     """
-    Thread-safe ring buffer for audio samples.
+    Preallocated circular buffer for audio samples.
 
-    Maintains a fixed-duration buffer of audio data that can be
-    read asynchronously while being written to from the capture thread.
+    Samples live in a fixed-size int16 array allocated once per camera, so
+    writes are O(1) amortized (one or two slice copies) and reads of the last
+    N seconds cost at most one copy regardless of how many chunks were added.
+
+    Concurrency follows a single-writer/multi-reader pattern: writers are
+    serialized by a lock, while readers never take it. A reader snapshots the
+    published write position, copies the requested range and then checks the
+    writer's claimed position to detect whether the range was overwritten
+    mid-copy, retrying if so (a seqlock-style protocol).
     """
 
+    # Attempts a lock-free reader makes before falling back to the write lock
+    _MAX_READ_RETRIES = 4
+
     def __init__(self, buffer_seconds: float = DEFAULT_AUDIO_BUFFER_SECONDS, sample_rate: int = AUDIO_SAMPLE_RATE):
         """
         Initialize the audio ring buffer.
@@ -84,9 +93,15 @@ class AudioRingBuffer:
         self.sample_rate = sample_rate
         self.max_samples = int(buffer_seconds * sample_rate)
 
-        self._lock = threading.Lock()
-        self._buffer: Deque[np.ndarray] = deque()
-        self._total_samples = 0
+        self._capacity = max(self.max_samples, 1)
+        self._data = np.zeros(self._capacity, dtype=np.int16)
+
+        # Monotonic stream positions (total samples ever written). _claimed is
+        # advanced before the writer touches _data, _written after it is done.
+        self._write_lock = threading.Lock()
+        self._claimed = 0
+        self._written = 0
+        self._base = 0  # Position of the oldest valid sample after clear()
         self._last_timestamp = 0.0
 
         logger.debug(
@@ -103,19 +118,118 @@ class AudioRingBuffer:
         """
         Add audio samples to the buffer.
 
+        Oldest samples are overwritten once the buffer is full. A chunk larger
+        than the buffer keeps only its most recent samples.
+
         Args:
             samples: Audio samples as numpy array (int16)
             timestamp: Capture timestamp
         """
-        with self._lock:
-            self._buffer.append(samples)
-            self._total_samples += len(samples)
+        samples = np.asarray(samples, dtype=np.int16).reshape(-1)
+        count = len(samples)
+
+        with self._write_lock:
+            if count == 0:
+                self._last_timestamp = timestamp
+                return
+
+            end = self._written + count
+            if count > self._capacity:
+                samples = samples[-self._capacity:]
+            start = end - len(samples)
+
+            self._claimed = end
+            self._copy_in(start, samples)
             self._last_timestamp = timestamp
+            self._written = end
+
+    def _copy_in(self, start: int, samples: np.ndarray) -> None:
+        """Write samples at stream position start, wrapping at the end of the array."""
+        offset = start % self._capacity
+        first = min(len(samples), self._capacity - offset)
+        self._data[offset:offset + first] = samples[:first]
+        if first < len(samples):
+            self._data[:len(samples) - first] = samples[first:]
+
+    def _copy_out(self, start: int, count: int) -> np.ndarray:
+        """Copy count samples starting at stream position start into a new array."""
+        offset = start % self._capacity
+        first = min(count, self._capacity - offset)
+        if first == count:
+            return self._data[offset:offset + count].copy()
+
+        out = np.empty(count, dtype=np.int16)
+        out[:first] = self._data[offset:]
+        out[first:] = self._data[:count - first]
+        return out
+
+    def _read_latest(self, max_count: Optional[int]) -> Optional[Tuple[np.ndarray, float]]:
+        """
+        Read up to max_count of the most recent samples without taking the write lock.
+
+        Args:
+            max_count: Maximum number of samples to return, or None for all
+
+        Returns:
+            Tuple of (samples, timestamp) or None if the buffer is empty
+        """
+        for _ in range(self._MAX_READ_RETRIES):
+            end = self._written
+            timestamp = self._last_timestamp
+            available = min(end - self._base, self._capacity)
+            count = available if max_count is None else min(max_count, available)
+            if count <= 0:
+                return None
+
+            start = end - count
+            samples = self._copy_out(start, count)
+
+            # The copy is valid if the writer has not claimed any of its slots
+            if self._claimed - self._capacity <= start:
+                return samples, timestamp
+
+        # Reader kept losing the race against a fast writer; take the lock once
+        with self._write_lock:
+            end = self._written
+            available = min(end - self._base, self._capacity)
+            count = available if max_count is None else min(max_count, available)
+            if count <= 0:
+                return None
+            return self._copy_out(end - count, count), self._last_timestamp
+
+    @property
+    def position(self) -> int:
+        """Total number of samples written so far (monotonic stream position)."""
+        return self._written
 
-            # Trim buffer if it exceeds max duration
-            while self._total_samples > self.max_samples and len(self._buffer) > 1:
-                removed = self._buffer.popleft()
-                self._total_samples -= len(removed)
+    def read_since(self, position: int) -> Tuple[np.ndarray, int]:
+        """
+        Read samples written after a stream position, without taking the write lock.
+
+        Used by incremental consumers that remember how far they have read.
+        If position is older than the oldest retained sample, reading starts
+        at the oldest sample; callers detect the gap when
+        ``end_position - len(samples) > position``.
+
+        Args:
+            position: Stream position returned by a previous call (or 0)
+
+        Returns:
+            Tuple of (samples, end_position)
+        """
+        for _ in range(self._MAX_READ_RETRIES):
+            end = self._written
+            oldest = max(self._base, end - self._capacity)
+            start = min(max(position, oldest), end)
+            samples = self._copy_out(start, end - start)
+            if self._claimed - self._capacity <= start:
+                return samples, end
+
+        with self._write_lock:
+            end = self._written
+            oldest = max(self._base, end - self._capacity)
+            start = min(max(position, oldest), end)
+            return self._copy_out(start, end - start), end
 
     def get_latest(self, duration_seconds: float = 1.0) -> Optional[AudioChunk]:
         """
@@ -128,35 +242,20 @@ class AudioRingBuffer:
             AudioChunk with samples, or None if buffer is empty
         """
         samples_needed = int(duration_seconds * self.sample_rate)
+        if samples_needed <= 0:
+            return None
 
-        with self._lock:
-            if self._total_samples == 0:
-                return None
-
-            # Collect samples from recent chunks
-            collected = []
-            collected_count = 0
-
-            for chunk in reversed(self._buffer):
-                collected.insert(0, chunk)
-                collected_count += len(chunk)
-                if collected_count >= samples_needed:
-                    break
-
-            if not collected:
-                return None
-
-            # Concatenate and trim to exact duration
-            all_samples = np.concatenate(collected)
-            if len(all_samples) > samples_needed:
-                all_samples = all_samples[-samples_needed:]
+        result = self._read_latest(samples_needed)
+        if result is None:
+            return None
 
-            return AudioChunk(
-                samples=all_samples,
-                timestamp=self._last_timestamp,
-                sample_rate=self.sample_rate,
-                channels=AUDIO_CHANNELS
-            )
+        samples, timestamp = result
+        return AudioChunk(
+            samples=samples,
+            timestamp=timestamp,
+            sample_rate=self.sample_rate,
+            channels=AUDIO_CHANNELS
+        )
 
     def get_all(self) -> Optional[AudioChunk]:
         """
@@ -165,37 +264,38 @@ class AudioRingBuffer:
         Returns:
             AudioChunk with all samples, or None if buffer is empty
         """
-        with self._lock:
-            if self._total_samples == 0:
-                return None
-
-            all_samples = np.concatenate(list(self._buffer))
+        result = self._read_latest(None)
+        if result is None:
+            return None
 
-            return AudioChunk(
-                samples=all_samples,
-                timestamp=self._last_timestamp,
-                sample_rate=self.sample_rate,
-                channels=AUDIO_CHANNELS
-            )
+        samples, timestamp = result
+        return AudioChunk(
+            samples=samples,
+            timestamp=timestamp,
+            sample_rate=self.sample_rate,
+            channels=AUDIO_CHANNELS
+        )
 
     def clear(self) -> None:
         """Clear all samples from the buffer."""
-        with self._lock:
-            self._buffer.clear()
-            self._total_samples = 0
+        with self._write_lock:
+            self._base = self._written
             self._last_timestamp = 0.0
 
+    @property
+    def _available_samples(self) -> int:
+        """Number of valid samples currently held."""
+        return min(self._written - self._base, self._capacity)
+
     @property
     def duration_seconds(self) -> float:
         """Current duration of audio in buffer in seconds."""
-        with self._lock:
-            return self._total_samples / self.sample_rate if self.sample_rate > 0 else 0.0
+        return self._available_samples / self.sample_rate if self.sample_rate > 0 else 0.0
 
     @property
     def is_empty(self) -> bool:
         """Check if buffer is empty."""
-        with self._lock:
-            return self._total_samples == 0
+        return self._available_samples == 0
 
 
 class AudioStreamExtractor:
@@ -242,6 +342,19 @@ class AudioStreamExtractor:
                 )
             return self._buffers[camera_id]
 
+    def get_buffer(self, camera_id: str) -> Optional[AudioRingBuffer]:
+        """
+        Get a camera's audio buffer without creating one.
+
+        Args:
+            camera_id: Camera identifier
+
+        Returns:
+            AudioRingBuffer or None if the camera has no audio buffer
+        """
+        with self._lock:
+            return self._buffers.get(camera_id)
+
     def remove_buffer(self, camera_id: str) -> None:
         """
         Remove audio buffer for a camera.
@@ -380,12 +493,13 @@ class AudioStreamExtractor:
                         # Flatten if multi-dimensional
                         if samples.ndim > 1:
                             samples = samples.flatten()
+                        samples = samples.astype(np.int16, copy=False)
 
                         # Add to buffer
                         buffer = self.get_or_create_buffer(camera_id)
-                        buffer.add(samples.astype(np.int16), time.time())
+                        buffer.add(samples, time.time())
 
-                        return samples.astype(np.int16), resampler
+                        return samples, resampler
 
                 # Only process one frame per call to not block video capture
                 break
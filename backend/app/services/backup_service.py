@@ -36,6 +36,7 @@ from pathlib import Path
 from sqlalchemy.orm import Session
 from app.core.database import SessionLocal
 from app.models.system_setting import SystemSetting
+from app.services.media_store import get_media_store
 
 logger = logging.getLogger(__name__)
 
@@ -125,7 +126,7 @@ class BackupService:
 
     # Required files in a valid backup ZIP
     REQUIRED_FILES = ["database.db", "metadata.json"]
-    OPTIONAL_FILES = ["settings.json", "thumbnails/"]
+    OPTIONAL_FILES = ["settings.json", "thumbnails/", "media/"]
 
     def __init__(self, session_factory=None):
         """
@@ -143,6 +144,8 @@ class BackupService:
         self.backup_dir = self.data_dir / "backups"
         self.database_path = self.data_dir / "app.db"
         self.thumbnails_dir = self.data_dir / "thumbnails"
+        # Content-addressed thumbnails and key frames (see MediaStore)
+        self.media_dir = get_media_store().root
 
         # Ensure backup directory exists
         self.backup_dir.mkdir(parents=True, exist_ok=True)
@@ -152,7 +155,8 @@ class BackupService:
             extra={
                 "backup_dir": str(self.backup_dir),
                 "database_path": str(self.database_path),
-                "thumbnails_dir": str(self.thumbnails_dir)
+                "thumbnails_dir": str(self.thumbnails_dir),
+                "media_dir": str(self.media_dir)
             }
         )
 
@@ -170,6 +174,7 @@ class BackupService:
         - metadata.json: Backup metadata (timestamp, version, counts)
         - settings.json: System settings export (if include_settings=True)
         - thumbnails/: All event thumbnail images (if include_thumbnails=True)
+        - media/: Media store thumbnails and key frames (if include_thumbnails=True)
 
         Args:
             include_database: Include events, cameras, alert rules (default True)
@@ -306,10 +311,12 @@ class BackupService:
         if include_database and self.database_path.exists():
             size += self.database_path.stat().st_size
 
-        if include_thumbnails and self.thumbnails_dir.exists():
-            for f in self.thumbnails_dir.rglob("*"):
-                if f.is_file():
-                    size += f.stat().st_size
+        if include_thumbnails:
+            for directory in (self.thumbnails_dir, self.media_dir):
+                if directory.exists():
+                    for f in directory.rglob("*"):
+                        if f.is_file():
+                            size += f.stat().st_size
 
         return size
 
@@ -337,38 +344,39 @@ class BackupService:
 
     def _copy_thumbnails(self, temp_dir: Path) -> tuple[int, int]:
         """
-        Copy thumbnails directory to temp directory
+        Copy the thumbnails and media store directories to temp directory
 
         Returns:
-            Tuple of (file_count, total_size_bytes)
+            Tuple of (file_count, total_size_bytes) across both directories
         """
-        if not self.thumbnails_dir.exists():
-            logger.debug("No thumbnails directory to backup")
-            return 0, 0
-
-        dest_thumbnails = temp_dir / "thumbnails"
         file_count = 0
         total_size = 0
 
-        try:
-            # Use copytree with dirs_exist_ok for recursive copy
-            shutil.copytree(
-                self.thumbnails_dir,
-                dest_thumbnails,
-                dirs_exist_ok=True
-            )
+        for source, name in ((self.thumbnails_dir, "thumbnails"), (self.media_dir, "media")):
+            if not source.exists():
+                logger.debug(f"No {name} directory to backup")
+                continue
 
-            # Count files and size
-            for f in dest_thumbnails.rglob("*"):
-                if f.is_file():
-                    file_count += 1
-                    total_size += f.stat().st_size
+            dest = temp_dir / name
+            try:
+                # Use copytree with dirs_exist_ok for recursive copy
+                shutil.copytree(
+                    source,
+                    dest,
+                    dirs_exist_ok=True,
+                    ignore=shutil.ignore_patterns(".tmp-*")
+                )
 
-            logger.debug(f"Thumbnails copied: {file_count} files, {total_size} bytes")
+                # Count files and size
+                for f in dest.rglob("*"):
+                    if f.is_file():
+                        file_count += 1
+                        total_size += f.stat().st_size
 
-        except Exception as e:
-            logger.warning(f"Error copying thumbnails: {e}")
+            except Exception as e:
+                logger.warning(f"Error copying {name}: {e}")
 
+        logger.debug(f"Thumbnails and media copied: {file_count} files, {total_size} bytes")
         return file_count, total_size
 
     def _export_settings(self, temp_dir: Path) -> int:
@@ -487,7 +495,7 @@ class BackupService:
                 includes = metadata.get("includes", {})
                 # Check file list for backwards compatibility with old backups
                 has_database = "database.db" in file_list
-                has_thumbnails = any(f.startswith("thumbnails/") for f in file_list)
+                has_thumbnails = any(f.startswith(("thumbnails/", "media/")) for f in file_list)
                 has_settings = "settings.json" in file_list
 
                 # Override with metadata includes if present (new format)
@@ -626,22 +634,25 @@ class BackupService:
                     finally:
                         db.close()
 
-                # 6. Replace thumbnails (if selected)
+                # 6. Replace thumbnails and media store files (if selected)
                 thumbnails_restored = 0
-                if restore_thumbnails and (temp_dir / "thumbnails").exists():
-                    # Clear existing thumbnails
-                    if self.thumbnails_dir.exists():
-                        shutil.rmtree(self.thumbnails_dir)
+                for name, target in (("thumbnails", self.thumbnails_dir), ("media", self.media_dir)):
+                    if not restore_thumbnails or not (temp_dir / name).exists():
+                        continue
+                    # Clear existing files
+                    if target.exists():
+                        shutil.rmtree(target)
 
                     # Copy from backup
-                    shutil.copytree(temp_dir / "thumbnails", self.thumbnails_dir)
+                    shutil.copytree(temp_dir / name, target)
 
                     # Count restored files
-                    for f in self.thumbnails_dir.rglob("*"):
+                    for f in target.rglob("*"):
                         if f.is_file():
                             thumbnails_restored += 1
 
-                    logger.info(f"Thumbnails restored: {thumbnails_restored} files")
+                if restore_thumbnails:
+                    logger.info(f"Thumbnails and media restored: {thumbnails_restored} files")
 
                 # 7. Import settings (if selected, non-encrypted only)
                 settings_restored = 0
@@ -14,7 +14,7 @@ import time
 import logging
 import asyncio
 import queue
-from typing import Optional
+from typing import Optional, Tuple
 from datetime import datetime, timezone
 import numpy as np
 
@@ -78,6 +78,9 @@ class CameraCaptureWorker:
         # Valid statuses: starting, connecting, connected, reconnecting, error, dead, stopped
         self._valid_statuses = {"starting", "connecting", "connected", "reconnecting", "error", "dead", "stopped"}
         self._latest_frame: Optional[np.ndarray] = None
+        # Monotonic count of frames stored as latest. Never reset (not even on
+        # reconnect) so (camera_id, seq) always identifies one frame.
+        self._frame_seq = 0
         self._frame_lock = threading.Lock()
 
         # Active capture resources (managed for proper cleanup)
@@ -182,6 +185,18 @@ class CameraCaptureWorker:
 
         return status
 
+    def get_latest_frame_seq(self) -> int:
+        """Sequence number of the latest frame (0 if none is available)."""
+        with self._frame_lock:
+            return self._frame_seq if self._latest_frame is not None else 0
+
+    def get_latest_frame_with_seq(self) -> Tuple[Optional[np.ndarray], int]:
+        """Copy of the latest frame together with its sequence number."""
+        with self._frame_lock:
+            if self._latest_frame is None:
+                return None, 0
+            return self._latest_frame.copy(), self._frame_seq
+
     def get_latest_frame(self) -> Optional[np.ndarray]:
         """Returns the most recent frame (non-blocking, for quick access)."""
         with self._frame_lock:
@@ -265,23 +280,25 @@ class CameraCaptureWorker:
             use_pyav = False
 
             try:
-                connection_str = self._build_connection_string()
-
-                # Attempt connection (PyAV for rtsps, OpenCV otherwise)
-                if self.camera.type == "rtsp" and PYAV_AVAILABLE and connection_str.startswith("rtsps://"):
-                    try:
-                        self._av_container = av.open(connection_str, options={'rtsp_transport': 'tcp'}, timeout=15.0)
-                        use_pyav = True
-                    except Exception as e:
-                        logger.warning(f"PyAV failed for {camera_id}, falling back to OpenCV: {e}")
-                        if self._av_container:
-                            self._av_container.close()
-                        self._av_container = None
-
-                if not use_pyav:
-                    self._cap = cv2.VideoCapture(connection_str)
-                    if not self._cap.isOpened():
-                        raise ConnectionError("Failed to open camera with OpenCV")
+                # Attempt connection (PyAV for rtsps, OpenCV otherwise); an
+                # injected frame producer needs no connection at all
+                if self._frame_producer is None:
+                    connection_str = self._build_connection_string()
+
+                    if self.camera.type == "rtsp" and PYAV_AVAILABLE and connection_str.startswith("rtsps://"):
+                        try:
+                            self._av_container = av.open(connection_str, options={'rtsp_transport': 'tcp'}, timeout=15.0)
+                            use_pyav = True
+                        except Exception as e:
+                            logger.warning(f"PyAV failed for {camera_id}, falling back to OpenCV: {e}")
+                            if self._av_container:
+                                self._av_container.close()
+                            self._av_container = None
+
+                    if not use_pyav:
+                        self._cap = cv2.VideoCapture(connection_str)
+                        if not self._cap.isOpened():
+                            raise ConnectionError("Failed to open camera with OpenCV")
 
                 self._update_status("connected")
                 retry_count = 0
@@ -368,6 +385,7 @@ class CameraCaptureWorker:
         """
         with self._frame_lock:
             self._latest_frame = frame
+            self._frame_seq += 1
 
         self._update_heartbeat()
 
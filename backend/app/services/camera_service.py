@@ -12,7 +12,7 @@ import threading
 import time
 import logging
 import asyncio
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from datetime import datetime, timezone
 import numpy as np
 from app.core.decorators import singleton
@@ -26,6 +26,7 @@ except ImportError:
 from app.models.camera import Camera
 from app.services.motion_detection_service import motion_detection_service
 from app.services.audio_stream_service import get_audio_stream_extractor, AudioStreamExtractor
+from app.services.audio_event_detector import get_audio_event_detector
 from app.core.database import get_db
 from app.services.camera_capture_worker import CameraCaptureWorker
 # Note: event_processor imports are done locally to avoid circular imports
@@ -94,6 +95,15 @@ class CameraService:
             logger.warning(f"Camera {camera_id} already running")
             return False
 
+        # Cluster mode: RTSP cameras are sharded across replicas, so another
+        # replica may own this one (USB devices stay on their host)
+        if getattr(camera, 'type', None) != 'usb':
+            from app.services.cluster_service import get_cluster_service
+            cluster = get_cluster_service()
+            if not cluster.owns("camera", camera_id):
+                cluster.forward("start_camera", "camera", camera_id)
+                return True
+
         try:
             if self._main_event_loop is None:
                 try:
@@ -121,6 +131,12 @@ class CameraService:
         if worker:
             worker.stop(timeout)
         else:
+            from app.services.cluster_service import get_cluster_service
+            cluster = get_cluster_service()
+            if not cluster.owns("camera", camera_id):
+                # Cluster mode: the worker runs on the owning replica
+                cluster.forward("stop_camera", "camera", camera_id)
+                return
             logger.debug(f"stop_camera called for {camera_id} but no active worker found")
 
         # Always attempt secondary cleanups (motion, audio, MQTT status)
@@ -132,6 +148,7 @@ class CameraService:
         if self._audio_extractor is not None:
             try:
                 self._audio_extractor.remove_buffer(camera_id)
+                get_audio_event_detector().reset_stream(camera_id)
             except Exception as e:
                 logger.debug(f"Error cleaning up audio buffer for camera {camera_id}: {e}")
 
@@ -255,6 +272,16 @@ class CameraService:
         worker = self._workers.get(camera_id)
         return worker.get_latest_frame() if worker else None
 
+    def get_latest_frame_seq(self, camera_id: str) -> int:
+        """Sequence number of the camera's latest frame (0 if none)."""
+        worker = self._workers.get(camera_id)
+        return worker.get_latest_frame_seq() if worker else 0
+
+    def get_latest_frame_with_seq(self, camera_id: str) -> Tuple[Optional[np.ndarray], int]:
+        """Copy of the camera's latest frame and its sequence number."""
+        worker = self._workers.get(camera_id)
+        return worker.get_latest_frame_with_seq() if worker else (None, 0)
+
     def get_frame(self, camera_id: str, timeout: float = 0.1) -> Optional[np.ndarray]:
         """Get next frame from the worker's bounded queue (backpressure-aware)."""
         worker = self._workers.get(camera_id)
@@ -9,13 +9,16 @@ of EventProcessor.
 """
 
 import asyncio
+import json
 import logging
 import random
 import time
 from datetime import datetime, timezone
 from typing import Dict, Optional, Callable, Awaitable
 
+from app.core.database import get_db_session
 from app.models.camera import Camera
+from app.models.motion_event import MotionEvent
 from app.services.camera_service import CameraService
 from app.services.motion_detection_service import MotionDetectionService
 
@@ -198,6 +201,17 @@ class CameraTaskManager:
         self._camera_cooldowns.clear()
         # Note: we intentionally keep motion_task_stats for observability after shutdown
 
+    def _detect_motion(self, camera: Camera, frame) -> Optional[MotionEvent]:
+        """
+        Run MotionDetectionService on one frame (blocking; called off the loop).
+
+        Returns:
+            The stored MotionEvent when motion passed the schedule, zone and
+            cooldown checks, None otherwise
+        """
+        with get_db_session() as db:
+            return self.motion_service.process_frame(str(camera.id), frame, camera, db)
+
     async def _run_motion_detection_loop(self, camera: Camera):
         """
         Core per-camera motion detection loop (moved from EventProcessor).
@@ -240,25 +254,25 @@ class CameraTaskManager:
 
                 # === Run motion detection ===
                 try:
-                    motion_result = self.motion_service.process_frame(
-                        frame, camera_id=camera.id
-                    )
+                    motion_event = await asyncio.to_thread(self._detect_motion, camera, frame)
                 except Exception as e:
                     logger.warning(f"Motion detection failed for camera {camera.name}: {e}")
                     await asyncio.sleep(frame_interval)
                     continue
 
-                if motion_result and motion_result.get("motion_detected"):
+                if motion_event is not None:
                     from app.services.event_processor import ProcessingEvent  # local import to avoid cycles
 
                     processing_event = ProcessingEvent(
                         camera_id=str(camera.id),
                         camera_name=camera.name,
                         frame=frame,
-                        timestamp=datetime.now(timezone.utc),
-                        detected_objects=motion_result.get("detected_objects", ["unknown"]),
+                        timestamp=motion_event.timestamp or datetime.now(timezone.utc),
+                        detected_objects=["unknown"],
                         metadata={
-                            "motion_confidence": motion_result.get("confidence", 0.0),
+                            "motion_event_id": motion_event.id,
+                            "motion_confidence": motion_event.confidence,
+                            "motion_bbox": json.loads(motion_event.bounding_box) if motion_event.bounding_box else None,
                             "source": "camera_capture_worker",
                         },
                     )
@@ -28,6 +28,7 @@ from sqlalchemy import text
 from app.models.event import Event
 from app.core.database import SessionLocal
 from app.services.frame_storage_service import get_frame_storage_service
+from app.services.media_store import get_media_store
 
 logger = logging.getLogger(__name__)
 
@@ -88,6 +89,8 @@ class CleanupService:
                 "events_deleted": int,
                 "thumbnails_deleted": int,
                 "thumbnails_failed": int,
+                "frames_deleted": int,
+                "media_blobs_deleted": int,
                 "space_freed_mb": float,
                 "batches_processed": int
             }
@@ -181,12 +184,31 @@ class CleanupService:
             finally:
                 db.close()
 
+        # Bulk deletes bypass the Event mapper hooks that keep media store
+        # reference counts, so recount and drop blobs nothing points at
+        media_blobs_deleted = 0
+        if total_events_deleted:
+            db = self.session_factory()
+            try:
+                gc_stats = get_media_store().collect_garbage(db)
+                media_blobs_deleted = gc_stats["blobs_deleted"] + gc_stats["orphans_deleted"]
+                total_space_freed += gc_stats["bytes_freed"] / (1024 * 1024)
+            except Exception as e:
+                logger.warning(
+                    f"Media store garbage collection failed: {e}",
+                    extra={"event_type": "media_store_gc_error", "error": str(e)}
+                )
+                db.rollback()
+            finally:
+                db.close()
+
         # Final statistics
         stats = {
             "events_deleted": total_events_deleted,
             "thumbnails_deleted": total_thumbnails_deleted,
             "thumbnails_failed": total_thumbnails_failed,
             "frames_deleted": total_frames_deleted,  # Story P8-2.1 AC1.5
+            "media_blobs_deleted": media_blobs_deleted,
             "space_freed_mb": round(total_space_freed, 2),
             "batches_processed": batches_processed
         }
@@ -21,7 +21,7 @@ from app.core.decorators import singleton
 import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, TYPE_CHECKING
+from typing import Awaitable, Callable, Optional, TYPE_CHECKING
 
 from apscheduler.schedulers.background import BackgroundScheduler
 from tenacity import (
@@ -496,7 +496,8 @@ class ClipService:
         camera_id: str,
         event_start: datetime,
         event_end: datetime,
-        output_path: Path
+        output_path: Path,
+        iterator_callback: Optional[Callable[[int, Optional[bytes]], Awaitable[None]]] = None
     ) -> Path:
         """
         Internal method to attempt a single clip download.
@@ -510,6 +511,8 @@ class ClipService:
             event_start: Start time of the clip
             event_end: End time of the clip
             output_path: Path to save the clip file
+            iterator_callback: Optional uiprotect callback invoked with
+                (total, chunk) as each chunk is streamed to output_path
 
         Returns:
             Path to the downloaded clip file on success
@@ -520,12 +523,17 @@ class ClipService:
         """
         try:
             # Download with timeout (NFR1: 10 second limit per attempt)
+            # uiprotect streams the response to output_path chunk by chunk
+            extra_kwargs = {}
+            if iterator_callback is not None:
+                extra_kwargs["iterator_callback"] = iterator_callback
             async with asyncio.timeout(DOWNLOAD_TIMEOUT):
                 await client.get_camera_video(
                     camera_id=camera_id,
                     start=event_start,
                     end=event_end,
-                    output_file=output_path
+                    output_file=output_path,
+                    **extra_kwargs
                 )
 
             # Verify file was created and has content
@@ -596,7 +604,8 @@ class ClipService:
         camera_id: str,
         event_start: datetime,
         event_end: datetime,
-        event_id: str
+        event_id: str,
+        iterator_callback: Optional[Callable[[int, Optional[bytes]], Awaitable[None]]] = None
     ) -> Optional[Path]:
         """
         Download a motion clip from UniFi Protect with retry logic.
@@ -612,6 +621,8 @@ class ClipService:
             event_start: Start time of the clip
             event_end: End time of the clip
             event_id: Unique identifier for the event (used for filename)
+            iterator_callback: Optional callback notified of each streamed
+                chunk (used by the Protect prefetch pipeline)
 
         Returns:
             Path to the downloaded clip file on success, None on failure.
@@ -669,7 +680,8 @@ class ClipService:
                 camera_id=camera_id,
                 event_start=event_start,
                 event_end=event_end,
-                output_path=output_path
+                output_path=output_path,
+                iterator_callback=iterator_callback
             )
 
         try:
@@ -0,0 +1,276 @@
+"""
+Cross-replica publish/subscribe for cluster mode.
+
+Each backend carries JSON messages between the replicas of one deployment.
+``ClusterService`` uses them for WebSocket broadcasts, cache invalidation and
+forwarded camera/controller commands. Every message is an envelope
+``{"channel", "origin", "payload"}``, and a replica ignores its own messages.
+
+Backends:
+- ``PostgresPubSub``: ``LISTEN``/``NOTIFY`` on one channel over a dedicated
+  asyncpg connection. Envelopes above the NOTIFY payload limit are stored in
+  ``cluster_messages``, and only their id is notified.
+- ``DatabasePubSub``: appends to ``cluster_messages`` and polls for new rows.
+  It works on any database, including a SQLite file shared by several
+  processes on one machine, at the cost of ``CLUSTER_PUBSUB_POLL_SECONDS``
+  latency.
+- ``LocalPubSub``: in-process only, for a single replica.
+
+``create_pubsub`` picks a backend from ``CLUSTER_PUBSUB_BACKEND``. With
+``auto``, PostgreSQL uses LISTEN/NOTIFY and every other database uses polling.
+"""
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from sqlalchemy import func
+from sqlalchemy.engine import make_url
+
+from app.core.config import settings
+from app.models.cluster import ClusterMessage
+
+logger = logging.getLogger(__name__)
+
+MessageHandler = Callable[[str, str, Dict[str, Any]], Awaitable[None]]
+
+# PostgreSQL rejects NOTIFY payloads of 8000 bytes or more
+NOTIFY_MAX_BYTES = 7900
+NOTIFY_CHANNEL = "argus_cluster"
+
+
+class ClusterPubSub:
+    """
+    Transport interface.
+
+    ``start`` registers the handler called as ``handler(channel, origin,
+    payload)`` for every message published by another replica.
+    """
+
+    name = "base"
+
+    def __init__(self, instance_id: str):
+        self.instance_id = instance_id
+        self._handler: Optional[MessageHandler] = None
+        self.published = 0
+        self.received = 0
+
+    async def start(self, handler: MessageHandler) -> None:
+        self._handler = handler
+
+    async def stop(self) -> None:
+        self._handler = None
+
+    async def publish(self, channel: str, payload: Dict[str, Any]) -> None:
+        raise NotImplementedError
+
+    def cleanup(self, session_factory: Callable, max_age_seconds: float) -> int:
+        """Delete stored messages older than max_age_seconds (run by the leader)."""
+        return 0
+
+    async def _deliver(self, envelope: Dict[str, Any]) -> None:
+        if envelope.get("origin") == self.instance_id or self._handler is None:
+            return
+        self.received += 1
+        try:
+            await self._handler(envelope["channel"], envelope["origin"], envelope.get("payload") or {})
+        except Exception as e:
+            logger.warning(
+                f"Cluster message handler failed on {envelope.get('channel')}: {e}",
+                extra={"event_type": "cluster_message_error", "channel": envelope.get("channel"), "error": str(e)}
+            )
+
+
+class LocalPubSub(ClusterPubSub):
+    """Single replica: nothing to deliver to."""
+
+    name = "local"
+
+    async def publish(self, channel: str, payload: Dict[str, Any]) -> None:
+        self.published += 1
+
+
+class DatabasePubSub(ClusterPubSub):
+    """
+    Message log in ``cluster_messages``, polled by every replica.
+
+    Attributes:
+        poll_seconds: Interval between polls
+    """
+
+    name = "database"
+
+    def __init__(self, instance_id: str, session_factory: Callable, poll_seconds: Optional[float] = None):
+        super().__init__(instance_id)
+        self._session_factory = session_factory
+        self.poll_seconds = settings.CLUSTER_PUBSUB_POLL_SECONDS if poll_seconds is None else poll_seconds
+        self._last_id = 0
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self, handler: MessageHandler) -> None:
+        await super().start(handler)
+        self._last_id = await asyncio.to_thread(self._max_id)
+        self._task = asyncio.create_task(self._poll_loop())
+
+    async def stop(self) -> None:
+        if self._task:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        await super().stop()
+
+    async def publish(self, channel: str, payload: Dict[str, Any]) -> None:
+        await asyncio.to_thread(self._insert, channel, json.dumps(payload, default=str))
+        self.published += 1
+
+    def _max_id(self) -> int:
+        with self._session_factory() as db:
+            return db.query(func.max(ClusterMessage.id)).scalar() or 0
+
+    def _insert(self, channel: str, payload_json: str) -> int:
+        with self._session_factory() as db:
+            message = ClusterMessage(
+                channel=channel, origin=self.instance_id, payload=payload_json, created_at=time.time()
+            )
+            db.add(message)
+            db.commit()
+            return message.id
+
+    def _fetch(self):
+        with self._session_factory() as db:
+            rows = (
+                db.query(ClusterMessage)
+                .filter(ClusterMessage.id > self._last_id)
+                .order_by(ClusterMessage.id)
+                .limit(500)
+                .all()
+            )
+            return [(row.id, row.channel, row.origin, row.payload) for row in rows]
+
+    async def _poll_loop(self) -> None:
+        while True:
+            try:
+                for message_id, channel, origin, payload in await asyncio.to_thread(self._fetch):
+                    self._last_id = message_id
+                    await self._deliver({"channel": channel, "origin": origin, "payload": json.loads(payload)})
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(
+                    f"Cluster message poll failed: {e}",
+                    extra={"event_type": "cluster_pubsub_poll_error", "error": str(e)}
+                )
+            await asyncio.sleep(self.poll_seconds)
+
+    def cleanup(self, session_factory: Callable, max_age_seconds: float) -> int:
+        with session_factory() as db:
+            removed = db.query(ClusterMessage).filter(
+                ClusterMessage.created_at < time.time() - max_age_seconds
+            ).delete(synchronize_session=False)
+            db.commit()
+            return removed
+
+
+class PostgresPubSub(ClusterPubSub):
+    """
+    PostgreSQL LISTEN/NOTIFY over a dedicated asyncpg connection.
+
+    Requires asyncpg (in requirements.txt, also the PostgreSQL async driver).
+    """
+
+    name = "postgres"
+
+    def __init__(self, instance_id: str, database_url: str, session_factory: Callable):
+        super().__init__(instance_id)
+        url = make_url(database_url)
+        # asyncpg takes a plain postgresql:// DSN (no +driver suffix)
+        self._dsn = url.set(drivername="postgresql").render_as_string(hide_password=False)
+        self._session_factory = session_factory
+        self._listen_conn = None
+        self._publish_conn = None
+        self._publish_lock = asyncio.Lock()
+
+    async def start(self, handler: MessageHandler) -> None:
+        import asyncpg
+
+        await super().start(handler)
+        self._listen_conn = await asyncpg.connect(self._dsn)
+        self._publish_conn = await asyncpg.connect(self._dsn)
+        await self._listen_conn.add_listener(NOTIFY_CHANNEL, self._on_notify)
+
+    async def stop(self) -> None:
+        for conn in (self._listen_conn, self._publish_conn):
+            if conn is not None:
+                try:
+                    await conn.close()
+                except Exception:
+                    pass
+        self._listen_conn = self._publish_conn = None
+        await super().stop()
+
+    async def publish(self, channel: str, payload: Dict[str, Any]) -> None:
+        envelope = json.dumps({"channel": channel, "origin": self.instance_id, "payload": payload}, default=str)
+        if len(envelope.encode()) > NOTIFY_MAX_BYTES:
+            message_id = await asyncio.to_thread(self._store, channel, json.dumps(payload, default=str))
+            envelope = json.dumps({"channel": channel, "origin": self.instance_id, "ref": message_id})
+        async with self._publish_lock:
+            await self._publish_conn.execute("SELECT pg_notify($1, $2)", NOTIFY_CHANNEL, envelope)
+        self.published += 1
+
+    def _store(self, channel: str, payload_json: str) -> int:
+        with self._session_factory() as db:
+            message = ClusterMessage(
+                channel=channel, origin=self.instance_id, payload=payload_json, created_at=time.time()
+            )
+            db.add(message)
+            db.commit()
+            return message.id
+
+    def _load(self, message_id: int) -> Optional[Dict[str, Any]]:
+        with self._session_factory() as db:
+            row = db.get(ClusterMessage, message_id)
+            return json.loads(row.payload) if row else None
+
+    def _on_notify(self, connection, pid, channel, data) -> None:
+        asyncio.get_running_loop().create_task(self._handle_notify(data))
+
+    async def _handle_notify(self, data: str) -> None:
+        try:
+            envelope = json.loads(data)
+            if envelope.get("origin") == self.instance_id:
+                return
+            if "ref" in envelope:
+                envelope["payload"] = await asyncio.to_thread(self._load, envelope["ref"])
+                if envelope["payload"] is None:
+                    return
+            await self._deliver(envelope)
+        except ValueError as e:
+            logger.warning(f"Invalid cluster notification: {e}")
+
+    def cleanup(self, session_factory: Callable, max_age_seconds: float) -> int:
+        return DatabasePubSub.cleanup(self, session_factory, max_age_seconds)
+
+
+def create_pubsub(instance_id: str, session_factory: Callable, backend: Optional[str] = None) -> ClusterPubSub:
+    """
+    Build the pub/sub backend for this replica.
+
+    Args:
+        instance_id: This replica's id (its own messages are not delivered back)
+        session_factory: Session factory for the database backends
+        backend: "postgres", "database", "local" or "auto" (default CLUSTER_PUBSUB_BACKEND)
+    """
+    backend = (backend or settings.CLUSTER_PUBSUB_BACKEND).lower()
+    is_postgres = settings.DATABASE_URL.startswith("postgresql")
+    if backend == "auto":
+        backend = "postgres" if is_postgres else "database"
+    if backend == "postgres":
+        if not is_postgres:
+            raise ValueError("CLUSTER_PUBSUB_BACKEND=postgres requires a PostgreSQL DATABASE_URL")
+        return PostgresPubSub(instance_id, settings.DATABASE_URL, session_factory)
+    if backend == "database":
+        return DatabasePubSub(instance_id, session_factory)
+    if backend == "local":
+        return LocalPubSub(instance_id)
+    raise ValueError(f"Unknown CLUSTER_PUBSUB_BACKEND: {backend}")
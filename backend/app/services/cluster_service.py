@@ -0,0 +1,647 @@
+"""
+Cluster mode: several backend replicas sharing one database.
+
+Without cluster mode every process assumes it is alone. It starts every
+camera worker, connects to every Protect controller, runs every scheduled
+job and keeps its own caches and WebSocket clients. With
+``CLUSTER_MODE_ENABLED`` the replicas coordinate through the database:
+
+- Membership: each replica upserts its row in ``cluster_members`` every
+  ``CLUSTER_HEARTBEAT_SECONDS``. Rows not refreshed within
+  ``CLUSTER_MEMBER_TTL_SECONDS`` are dead.
+- Sharding: cameras and Protect controllers are assigned to live members by
+  a consistent-hash ring (``HashRing``). Membership changes only move the
+  keys of the member that joined or left. Every replica reconciles its
+  workers against the ring when membership changes, and periodically after
+  that.
+- Leader election: singleton jobs (cleanup, backup, patterns, digests) run
+  only on the holder of the ``scheduler`` lease in ``cluster_leases``. The
+  holder renews it with each heartbeat. If renewals stop, another replica
+  takes it over ``CLUSTER_LEASE_SECONDS`` after the last one. Leases compare
+  wall-clock timestamps, so replicas need roughly synchronized clocks (NTP).
+- Pub/sub (``cluster_pubsub``): WebSocket broadcasts, cache invalidations and
+  commands forwarded to the owner of a camera or controller.
+- Cost caps: checked against the ai_usage total of all replicas
+  (``AICostAndUsageTracker.get_cluster_cost``), not each process's ledger.
+
+Several processes on one machine can form a cluster over a shared SQLite
+file with the polling pub/sub backend. PostgreSQL is needed across hosts.
+"""
+import asyncio
+import bisect
+import contextvars
+import hashlib
+import inspect
+import logging
+import os
+import socket
+import time
+from functools import wraps
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Set
+
+from sqlalchemy import case, or_
+from sqlalchemy.exc import IntegrityError
+
+from app.core.config import settings
+from app.core.decorators import singleton
+from app.models.cluster import ClusterLease, ClusterMember
+from app.services.cluster_pubsub import ClusterPubSub, create_pubsub
+
+logger = logging.getLogger(__name__)
+
+SCHEDULER_LEASE = "scheduler"
+
+# Reconcile shard ownership every N heartbeats even without membership
+# changes, to pick up cameras added, enabled or lost since the last pass
+RECONCILE_EVERY_BEATS = 12
+
+# Stored pub/sub messages are kept this long (for replicas that poll)
+MESSAGE_RETENTION_SECONDS = 300.0
+
+# Set while a message from another replica is applied, so re-running the
+# local handler (e.g. invalidate_camera) does not publish it again
+_applying_remote = contextvars.ContextVar("cluster_applying_remote", default=False)
+
+
+def default_instance_id() -> str:
+    """<hostname>-<pid>: unique per process, readable in logs and the status endpoint."""
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode(), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """
+    Consistent-hash ring with virtual nodes.
+
+    Each member is placed at ``vnodes`` points on the ring. A key belongs to
+    the first point clockwise of its hash, so adding or removing a member
+    only moves about 1/N of the keys.
+    """
+
+    def __init__(self, members: Iterable[str], vnodes: int = 64):
+        self.members = sorted(set(members))
+        self.vnodes = vnodes
+        points = sorted(
+            (_hash(f"{member}#{i}"), member) for member in self.members for i in range(vnodes)
+        )
+        self._hashes = [point for point, _ in points]
+        self._owners = [member for _, member in points]
+
+    def owner(self, key: str) -> Optional[str]:
+        """Member owning key, or None on an empty ring."""
+        if not self._hashes:
+            return None
+        index = bisect.bisect(self._hashes, _hash(key)) % len(self._hashes)
+        return self._owners[index]
+
+
+class ClusterNode:
+    """
+    One replica's view of the cluster tables (synchronous, run off the loop).
+
+    Attributes:
+        instance_id: This replica's member id
+        members: Live member ids as of the last heartbeat
+        ring: Hash ring over members
+        lease_holders: Last seen holder of each wanted lease
+    """
+
+    def __init__(
+        self,
+        instance_id: str,
+        session_factory: Callable,
+        lease_seconds: Optional[float] = None,
+        member_ttl_seconds: Optional[float] = None,
+        vnodes: Optional[int] = None,
+        leases: Iterable[str] = (SCHEDULER_LEASE,),
+    ):
+        self.instance_id = instance_id
+        self._session_factory = session_factory
+        self.lease_seconds = settings.CLUSTER_LEASE_SECONDS if lease_seconds is None else lease_seconds
+        self.member_ttl_seconds = (
+            settings.CLUSTER_MEMBER_TTL_SECONDS if member_ttl_seconds is None else member_ttl_seconds
+        )
+        self.vnodes = settings.CLUSTER_SHARD_VNODES if vnodes is None else vnodes
+        self.wanted_leases = list(leases)
+        self.started_at = time.time()
+        self.members: List[str] = [instance_id]
+        self.ring = HashRing(self.members, self.vnodes)
+        self.lease_holders: Dict[str, Optional[str]] = {}
+        # Local expiry of each lease we hold; leadership lapses here first if
+        # renewals stop reaching the database
+        self._held_until: Dict[str, float] = {}
+
+    def heartbeat(self, now: Optional[float] = None) -> bool:
+        """
+        Refresh membership and leases.
+
+        Returns:
+            True when the set of live members changed
+        """
+        now = time.time() if now is None else now
+        with self._session_factory() as db:
+            member = db.get(ClusterMember, self.instance_id)
+            if member is None:
+                db.add(ClusterMember(
+                    instance_id=self.instance_id,
+                    hostname=socket.gethostname(),
+                    pid=os.getpid(),
+                    started_at=self.started_at,
+                    heartbeat_at=now,
+                ))
+            else:
+                member.heartbeat_at = now
+            db.commit()
+            live = sorted(
+                row[0] for row in db.query(ClusterMember.instance_id).filter(
+                    ClusterMember.heartbeat_at >= now - self.member_ttl_seconds
+                )
+            )
+
+        for name in self.wanted_leases:
+            self.try_acquire(name, now)
+
+        if live == self.members:
+            return False
+        self.members = live
+        self.ring = HashRing(live, self.vnodes)
+        return True
+
+    def try_acquire(self, name: str, now: Optional[float] = None) -> bool:
+        """Take or renew a lease; True if this replica holds it afterwards."""
+        now = time.time() if now is None else now
+        expires_at = now + self.lease_seconds
+        with self._session_factory() as db:
+            # One guarded UPDATE renews our own lease or takes over an expired one
+            updated = db.query(ClusterLease).filter(
+                ClusterLease.name == name,
+                or_(ClusterLease.holder == self.instance_id, ClusterLease.expires_at < now),
+            ).update({
+                ClusterLease.acquired_at: case(
+                    (ClusterLease.holder == self.instance_id, ClusterLease.acquired_at), else_=now
+                ),
+                ClusterLease.holder: self.instance_id,
+                ClusterLease.expires_at: expires_at,
+            }, synchronize_session=False)
+            db.commit()
+            acquired = updated > 0
+
+            if not acquired:
+                lease = db.get(ClusterLease, name)
+                if lease is None:
+                    db.add(ClusterLease(name=name, holder=self.instance_id, acquired_at=now, expires_at=expires_at))
+                    try:
+                        db.commit()
+                        acquired = True
+                    except IntegrityError:
+                        db.rollback()
+                        lease = db.get(ClusterLease, name)
+                if not acquired:
+                    self.lease_holders[name] = lease.holder if lease is not None else None
+
+        if acquired:
+            if name not in self._held_until:
+                logger.info(
+                    f"Acquired cluster lease '{name}'",
+                    extra={"event_type": "cluster_lease_acquired", "lease": name, "instance_id": self.instance_id}
+                )
+            self._held_until[name] = expires_at
+            self.lease_holders[name] = self.instance_id
+        elif self._held_until.pop(name, None) is not None:
+            logger.warning(
+                f"Lost cluster lease '{name}' to {self.lease_holders.get(name)}",
+                extra={"event_type": "cluster_lease_lost", "lease": name, "instance_id": self.instance_id}
+            )
+        return acquired
+
+    def holds(self, name: str = SCHEDULER_LEASE) -> bool:
+        """True while this replica holds an unexpired lease."""
+        return self._held_until.get(name, 0.0) > time.time()
+
+    def owner(self, key: str) -> Optional[str]:
+        return self.ring.owner(key)
+
+    def owns(self, key: str) -> bool:
+        return self.ring.owner(key) == self.instance_id
+
+    def prune_members(self, now: Optional[float] = None) -> int:
+        """Delete member rows dead for a while (run by the leader)."""
+        now = time.time() if now is None else now
+        with self._session_factory() as db:
+            removed = db.query(ClusterMember).filter(
+                ClusterMember.heartbeat_at < now - 3 * self.member_ttl_seconds
+            ).delete(synchronize_session=False)
+            db.commit()
+            return removed
+
+    def leave(self) -> None:
+        """Remove our member row and release our leases so others take over immediately."""
+        with self._session_factory() as db:
+            db.query(ClusterMember).filter(ClusterMember.instance_id == self.instance_id).delete(
+                synchronize_session=False
+            )
+            db.query(ClusterLease).filter(ClusterLease.holder == self.instance_id).delete(
+                synchronize_session=False
+            )
+            db.commit()
+        self._held_until.clear()
+
+
+CommandHandler = Callable[[Dict[str, Any], str], Awaitable[None]]
+
+
+@singleton
+class ClusterService:
+    """
+    Coordinates this replica with the others when cluster mode is enabled.
+
+    With cluster mode off, ``owns`` and ``is_leader`` are always True and
+    publishing is a no-op, so callers need no special casing.
+
+    Attributes:
+        enabled: CLUSTER_MODE_ENABLED at construction
+        instance_id: This replica's member id
+        node: Membership/lease state (None until started)
+        pubsub: Cross-replica transport (None until started)
+    """
+
+    def __init__(self):
+        self.enabled = settings.CLUSTER_MODE_ENABLED
+        self.instance_id = settings.CLUSTER_INSTANCE_ID or default_instance_id()
+        self.heartbeat_seconds = settings.CLUSTER_HEARTBEAT_SECONDS
+        self.node: Optional[ClusterNode] = None
+        self.pubsub: Optional[ClusterPubSub] = None
+        self._session_factory: Optional[Callable] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._pending: Set[asyncio.Future] = set()
+        self._beats = 0
+        self.rebalances = 0
+        self._rebalance_callbacks: List[Callable[[], Any]] = []
+        self._handlers: Dict[str, CommandHandler] = {
+            "cluster.command": self._handle_command,
+            "cluster.invalidate": self._handle_invalidate,
+            "websocket": self._handle_websocket,
+        }
+
+    @property
+    def running(self) -> bool:
+        return self.enabled and self.node is not None
+
+    async def start(self, session_factory: Optional[Callable] = None) -> None:
+        """Join the cluster: first heartbeat, pub/sub listener and heartbeat loop."""
+        if not self.enabled or self.node is not None:
+            return
+        if session_factory is None:
+            from app.core.database import SessionLocal
+            session_factory = SessionLocal
+        self._session_factory = session_factory
+        self._loop = asyncio.get_running_loop()
+        self.node = ClusterNode(self.instance_id, session_factory)
+        await asyncio.to_thread(self.node.heartbeat)
+        self.pubsub = create_pubsub(self.instance_id, session_factory)
+        await self.pubsub.start(self._dispatch)
+        self._task = asyncio.create_task(self._heartbeat_loop())
+        self._record_metrics()
+        logger.info(
+            f"Joined cluster as {self.instance_id} ({len(self.node.members)} members, "
+            f"leader={self.is_leader()}, pubsub={self.pubsub.name})",
+            extra={
+                "event_type": "cluster_joined",
+                "instance_id": self.instance_id,
+                "members": self.node.members,
+                "leader": self.is_leader(),
+                "pubsub": self.pubsub.name,
+            }
+        )
+
+    async def stop(self) -> None:
+        """Leave the cluster so other replicas take over our shards and leases."""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+        if self._pending:
+            await asyncio.gather(*self._pending, return_exceptions=True)
+        if self.pubsub is not None:
+            await self.pubsub.stop()
+        if self.node is not None:
+            try:
+                await asyncio.to_thread(self.node.leave)
+            except Exception as e:
+                logger.warning(f"Failed to leave cluster cleanly: {e}")
+            logger.info("Left cluster", extra={"event_type": "cluster_left", "instance_id": self.instance_id})
+        self.node = None
+        self.pubsub = None
+
+    # ------------------------------------------------------------------
+    # Ownership and leadership
+    # ------------------------------------------------------------------
+
+    def owner(self, kind: str, key: str) -> Optional[str]:
+        """Member that owns a shard key (this replica when not clustered)."""
+        if not self.running:
+            return self.instance_id
+        return self.node.owner(f"{kind}:{key}")
+
+    def owns(self, kind: str, key: str) -> bool:
+        """True if this replica should run the given camera/controller."""
+        return not self.running or self.node.owns(f"{kind}:{key}")
+
+    def is_leader(self) -> bool:
+        """True if this replica should run singleton scheduled jobs."""
+        return not self.running or self.node.holds(SCHEDULER_LEASE)
+
+    def leader_only(self, job: Callable, name: Optional[str] = None) -> Callable:
+        """
+        Wrap a scheduled job so it only runs on the leader.
+
+        Every replica schedules the job. Followers skip it at fire time, so
+        the leader can change between runs without re-registering jobs.
+        """
+        job_name = name or getattr(job, "__name__", "job")
+
+        @wraps(job)
+        async def wrapper(*args, **kwargs):
+            if not self.is_leader():
+                logger.debug(
+                    f"Skipping {job_name}: not the cluster leader",
+                    extra={"event_type": "cluster_job_skipped", "job": job_name}
+                )
+                return None
+            result = job(*args, **kwargs)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+
+        return wrapper
+
+    def on_rebalance(self, callback: Callable[[], Any]) -> None:
+        """Register a callback (sync or async) run after each shard reconciliation."""
+        self._rebalance_callbacks.append(callback)
+
+    # ------------------------------------------------------------------
+    # Messaging
+    # ------------------------------------------------------------------
+
+    def register_handler(self, channel: str, handler: CommandHandler) -> None:
+        """Handle messages from other replicas on a channel as handler(payload, origin)."""
+        self._handlers[channel] = handler
+
+    async def publish(self, channel: str, payload: Dict[str, Any]) -> None:
+        """Send a message to the other replicas (no-op when not clustered)."""
+        if not self.running or self.pubsub is None or _applying_remote.get():
+            return
+        try:
+            await self.pubsub.publish(channel, payload)
+        except Exception as e:
+            logger.warning(
+                f"Cluster publish failed on {channel}: {e}",
+                extra={"event_type": "cluster_publish_error", "channel": channel, "error": str(e)}
+            )
+
+    def publish_nowait(self, channel: str, payload: Dict[str, Any]) -> None:
+        """Schedule publish() from sync code on any thread."""
+        if not self.running or self._loop is None or _applying_remote.get():
+            return
+        try:
+            current = asyncio.get_running_loop()
+        except RuntimeError:
+            current = None
+        if current is self._loop:
+            future = self._loop.create_task(self.publish(channel, payload))
+        elif self._loop.is_running():
+            future = asyncio.run_coroutine_threadsafe(self.publish(channel, payload), self._loop)
+        else:
+            return
+        self._pending.add(future)
+        future.add_done_callback(self._pending.discard)
+
+    def invalidate(self, cache: str, key: Optional[str] = None) -> None:
+        """Tell the other replicas to drop a cache entry (see _apply_invalidation)."""
+        self.publish_nowait("cluster.invalidate", {"cache": cache, "key": key})
+
+    def forward(self, action: str, kind: str, key: str) -> Optional[str]:
+        """
+        Ask the owner of a camera/controller to perform an action on it.
+
+        Returns:
+            The target member id
+        """
+        target = self.owner(kind, key)
+        logger.info(
+            f"Forwarding {action} for {kind} {key} to {target}",
+            extra={"event_type": "cluster_forward", "action": action, "kind": kind, "key": key, "target": target}
+        )
+        self.publish_nowait("cluster.command", {"action": action, "kind": kind, "key": key, "target": target})
+        return target
+
+    async def _dispatch(self, channel: str, origin: str, payload: Dict[str, Any]) -> None:
+        handler = self._handlers.get(channel)
+        if handler is None:
+            return
+        token = _applying_remote.set(True)
+        try:
+            await handler(payload, origin)
+        finally:
+            _applying_remote.reset(token)
+
+    async def _handle_websocket(self, payload: Dict[str, Any], origin: str) -> None:
+        from app.services.websocket_manager import get_websocket_manager
+
+        await get_websocket_manager().broadcast_local(payload["message"])
+
+    async def _handle_invalidate(self, payload: Dict[str, Any], origin: str) -> None:
+        self._apply_invalidation(payload.get("cache"), payload.get("key"))
+
+    def _apply_invalidation(self, cache: Optional[str], key: Optional[str]) -> None:
+        if cache == "description_cache.camera":
+            from app.services.description_cache_service import get_description_cache_service
+            get_description_cache_service().invalidate_camera(key)
+        elif cache and cache.startswith("mcp."):
+            from app.services.mcp_context import get_mcp_context_provider
+            provider = get_mcp_context_provider()
+            scope = cache.split(".", 1)[1]
+            invalidator = getattr(provider, f"invalidate_{scope}", None)
+            if invalidator is not None:
+                invalidator(key)
+        elif cache == "smart_reanalyze.frames":
+            from app.services.smart_reanalyze_service import get_smart_reanalyze_service
+            get_smart_reanalyze_service().invalidate_frame_embeddings(key)
+        elif cache == "cost_caps":
+            from app.services.cost_cap_service import get_cost_cap_service
+            get_cost_cap_service()._invalidate_cache()
+        else:
+            logger.debug(f"Ignoring invalidation for unknown cache {cache}")
+
+    async def _handle_command(self, payload: Dict[str, Any], origin: str) -> None:
+        if payload.get("target") != self.instance_id:
+            return
+        action, key = payload.get("action"), str(payload.get("key"))
+        logger.info(
+            f"Running forwarded {action} for {key} from {origin}",
+            extra={"event_type": "cluster_forwarded_command", "action": action, "key": key, "origin": origin}
+        )
+        if action == "start_camera":
+            from app.models.camera import Camera
+            from app.services.camera_service import get_camera_service
+            with self._session_factory() as db:
+                camera = db.query(Camera).filter(Camera.id == key).first()
+                if camera is not None:
+                    db.expunge(camera)
+            if camera is not None:
+                get_camera_service().start_camera(camera)
+        elif action == "stop_camera":
+            from app.services.camera_service import get_camera_service
+            await asyncio.to_thread(get_camera_service().stop_camera, key)
+        elif action == "connect_controller":
+            from app.models.protect_controller import ProtectController
+            from app.services.protect_service import get_protect_service
+            with self._session_factory() as db:
+                controller = db.query(ProtectController).filter(ProtectController.id == key).first()
+                if controller is not None:
+                    db.expunge(controller)
+            if controller is not None:
+                await get_protect_service().connect(controller)
+        elif action == "disconnect_controller":
+            from app.services.protect_service import get_protect_service
+            await get_protect_service().disconnect(key)
+
+    # ------------------------------------------------------------------
+    # Heartbeat and rebalancing
+    # ------------------------------------------------------------------
+
+    async def _heartbeat_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.heartbeat_seconds)
+            try:
+                changed = await asyncio.to_thread(self.node.heartbeat)
+                self._beats += 1
+                if self.is_leader():
+                    await asyncio.to_thread(self._leader_housekeeping)
+                if changed:
+                    logger.info(
+                        f"Cluster membership changed: {self.node.members}",
+                        extra={"event_type": "cluster_membership_changed", "members": self.node.members}
+                    )
+                if changed or self._beats % RECONCILE_EVERY_BEATS == 0:
+                    await self.reconcile()
+                self._record_metrics()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(
+                    f"Cluster heartbeat failed: {e}",
+                    extra={"event_type": "cluster_heartbeat_error", "error": str(e)}
+                )
+
+    def _leader_housekeeping(self) -> None:
+        self.node.prune_members()
+        self.pubsub.cleanup(self._session_factory, MESSAGE_RETENTION_SECONDS)
+
+    async def reconcile(self) -> Dict[str, int]:
+        """
+        Start owned cameras/controllers that are not running here and stop
+        the ones that moved to another replica.
+
+        Returns:
+            Counts of started/stopped cameras and connected/disconnected controllers
+        """
+        from app.models.camera import Camera
+        from app.models.protect_controller import ProtectController
+        from app.services.camera_service import get_camera_service
+        from app.services.protect_service import get_protect_service
+
+        stats = {"cameras_started": 0, "cameras_stopped": 0, "controllers_connected": 0, "controllers_disconnected": 0}
+        camera_service = get_camera_service()
+        protect_service = get_protect_service()
+
+        with self._session_factory() as db:
+            cameras = db.query(Camera).filter(Camera.is_enabled == True).all()  # noqa: E712
+            controllers = db.query(ProtectController).all()
+            for row in cameras + controllers:
+                db.expunge(row)
+
+        for camera in cameras:
+            camera_id = str(camera.id)
+            # Protect cameras follow their controller; USB devices stay on their host
+            if camera.source_type == "protect" or camera.type == "usb":
+                continue
+            camera_status = camera_service.get_camera_status(camera_id)
+            running = camera_status.get("worker_alive", True)
+            if self.owns("camera", camera_id) and not running and not camera_status["capture_disabled"]:
+                if camera_service.start_camera(camera):
+                    stats["cameras_started"] += 1
+            elif not self.owns("camera", camera_id) and running:
+                await asyncio.to_thread(camera_service.stop_camera, camera_id)
+                stats["cameras_stopped"] += 1
+
+        for controller in controllers:
+            controller_id = str(controller.id)
+            connected = protect_service.get_connection_status(controller_id)["connected"]
+            try:
+                if self.owns("controller", controller_id) and not connected:
+                    if await protect_service.connect(controller):
+                        stats["controllers_connected"] += 1
+                elif not self.owns("controller", controller_id) and connected:
+                    await protect_service.disconnect(controller_id)
+                    stats["controllers_disconnected"] += 1
+            except Exception as e:
+                logger.warning(f"Failed to rebalance controller {controller_id}: {e}")
+
+        for callback in self._rebalance_callbacks:
+            try:
+                result = callback()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as e:
+                logger.warning(f"Rebalance callback failed: {e}")
+
+        if any(stats.values()):
+            self.rebalances += 1
+            logger.info(
+                "Cluster shards rebalanced",
+                extra={"event_type": "cluster_rebalanced", "instance_id": self.instance_id, **stats}
+            )
+        return stats
+
+    def _record_metrics(self) -> None:
+        from app.core import metrics as prom
+
+        prom.cluster_members.set(len(self.node.members) if self.node else 1)
+        prom.cluster_is_leader.set(1 if self.is_leader() else 0)
+
+    def get_status(self) -> Dict[str, Any]:
+        """Cluster state for the system status endpoint."""
+        status: Dict[str, Any] = {
+            "enabled": self.enabled,
+            "instance_id": self.instance_id,
+            "is_leader": self.is_leader(),
+            "leader_id": self.instance_id,
+            "members": [self.instance_id],
+            "pubsub_backend": None,
+            "messages_published": 0,
+            "messages_received": 0,
+            "rebalances": self.rebalances,
+        }
+        if self.running:
+            status["leader_id"] = self.node.lease_holders.get(SCHEDULER_LEASE)
+            status["members"] = list(self.node.members)
+        if self.running and self.pubsub is not None:
+            status["pubsub_backend"] = self.pubsub.name
+            status["messages_published"] = self.pubsub.published
+            status["messages_received"] = self.pubsub.received
+        return status
+
+
+def get_cluster_service() -> ClusterService:
+    """Get the global ClusterService instance."""
+    return ClusterService()
+
+
+def reset_cluster_service() -> None:
+    """Reset the global ClusterService instance (for testing)."""
+    ClusterService._reset_instance()
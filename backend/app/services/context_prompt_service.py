@@ -73,6 +73,9 @@ class ContextEnhancedPromptResult:
     mcp_camera_included: bool = False
     mcp_time_pattern_included: bool = False
     mcp_accuracy_rate: Optional[float] = None
+    # Context that stays the same from one event to the next on a camera
+    # (feedback and camera context); keys the description cache
+    cache_context: str = ""
 
 
 @singleton
@@ -185,6 +188,7 @@ class ContextEnhancedPromptService:
         mcp_camera_included = False
         mcp_time_pattern_included = False
         mcp_accuracy_rate = None
+        cache_context = ""
 
         threshold = self._get_similarity_threshold(db)
         time_window_days = self._get_time_window_days(db)
@@ -277,6 +281,10 @@ class ContextEnhancedPromptService:
                 if mcp_context.time_pattern:
                     mcp_time_pattern_included = True
 
+                cache_context = mcp_provider.format_for_prompt(
+                    AIContext(feedback=mcp_context.feedback, camera=mcp_context.camera)
+                )
+
                 logger.debug(
                     f"MCP context gathered for event {event_id}",
                     extra={
@@ -345,6 +353,7 @@ class ContextEnhancedPromptService:
             mcp_camera_included=mcp_camera_included,
             mcp_time_pattern_included=mcp_time_pattern_included,
             mcp_accuracy_rate=mcp_accuracy_rate,
+            cache_context=cache_context,
         )
 
     def _format_entity_context(self, entity: EntityMatchResult) -> Optional[str]:
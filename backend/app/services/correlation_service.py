@@ -5,14 +5,17 @@ Detects when multiple cameras capture the same real-world event by
 correlating events within a configurable time window.
 
 Correlation Algorithm:
-1. Event arrives → Add to 60-second buffer
-2. Scan buffer for candidates (O(n) where n = events in last 60s)
+1. Event arrives → Add to 60-second buffer (bucketed by time window,
+   indexed by detection type)
+2. Look up candidates in the event's bucket and its two neighbours, for
+   the event's detection type only (O(k) where k = plausible matches)
 3. If candidates found:
    - Check if any have correlation_group_id
    - If yes: join that group
    - If no: generate new group_id for all
-4. Update all correlated events in database
-5. Remove old events from buffer (>60 seconds old)
+4. Update all correlated events in database: one UPDATE per group,
+   coalescing every event of a burst that joins the group meanwhile
+5. Drop expired buckets from the buffer (>60 seconds old)
 
 Event Flow Integration:
     _store_protect_event() completes
@@ -31,13 +34,15 @@ Correlation Criteria (AC2):
 """
 
 import asyncio
+import bisect
 import json
 import logging
+import math
 import uuid
 from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+from typing import Deque, Dict, Iterator, List, Optional, Tuple, TYPE_CHECKING
 
 from sqlalchemy import update
 from sqlalchemy.orm import Session
@@ -53,6 +58,7 @@ logger = logging.getLogger(__name__)
 # Default configuration values
 DEFAULT_TIME_WINDOW_SECONDS = 10  # Correlation window (AC2)
 DEFAULT_BUFFER_MAX_AGE_SECONDS = 60  # Buffer retention period (AC5)
+DEFAULT_GROUP_FLUSH_DELAY_SECONDS = 0.05  # Lets a burst join a group before it is written
 
 
 @dataclass
@@ -71,6 +77,126 @@ class BufferedEvent:
     protect_controller_id: Optional[str] = None
 
 
+BufferEntry = Tuple[datetime, BufferedEvent]
+
+
+class CorrelationBuffer:
+    """
+    Recent events bucketed by time and indexed by detection type.
+
+    Buckets are ``bucket_seconds`` wide (the correlation window), so every
+    event within the window of time t sits in t's bucket or one of its two
+    neighbours. Inside a bucket, events are grouped by lower-cased
+    detection type, so a lookup only touches events that could match.
+    Expiry drops whole buckets and trims only the oldest surviving one,
+    which is O(1) amortized per event.
+
+    Iteration yields (buffer_time, BufferedEvent) pairs, oldest bucket
+    first, like the deque this replaced.
+    """
+
+    def __init__(self, bucket_seconds: float):
+        self.bucket_seconds = max(float(bucket_seconds), 0.001)
+        self._buckets: Dict[int, Dict[Optional[str], Deque[BufferEntry]]] = {}
+        self._keys: List[int] = []  # sorted bucket keys
+        self._by_id: Dict[str, BufferedEvent] = {}
+        self._size = 0
+        self._newest: Optional[datetime] = None
+
+    def _bucket_key(self, buffer_time: datetime) -> int:
+        return math.floor(buffer_time.timestamp() / self.bucket_seconds)
+
+    @staticmethod
+    def _type_key(detection_type: Optional[str]) -> Optional[str]:
+        return detection_type.lower() if detection_type else None
+
+    def append(self, entry: BufferEntry) -> None:
+        buffer_time, buffered = entry
+        key = self._bucket_key(buffer_time)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = {}
+            if not self._keys or key > self._keys[-1]:
+                self._keys.append(key)
+            else:
+                bisect.insort(self._keys, key)  # late arrival
+        bucket.setdefault(self._type_key(buffered.smart_detection_type), deque()).append(entry)
+        self._by_id[buffered.id] = buffered
+        self._size += 1
+        if self._newest is None or buffer_time > self._newest:
+            self._newest = buffer_time
+
+    def candidates(self, event_time: datetime, detection_type: Optional[str]) -> Iterator[BufferEntry]:
+        """Entries of the same detection type in the buckets around event_time."""
+        type_key = self._type_key(detection_type)
+        if type_key is None:
+            return
+        key = self._bucket_key(event_time)
+        for bucket_key in (key - 1, key, key + 1):
+            bucket = self._buckets.get(bucket_key)
+            if bucket and type_key in bucket:
+                yield from bucket[type_key]
+
+    def expire(self, cutoff: datetime) -> List[BufferedEvent]:
+        """Remove entries older than cutoff; returns the removed events."""
+        removed: List[BufferedEvent] = []
+        cutoff_key = self._bucket_key(cutoff)
+
+        while self._keys and self._keys[0] < cutoff_key:
+            bucket = self._buckets.pop(self._keys.pop(0))
+            for entries in bucket.values():
+                removed.extend(buffered for _, buffered in entries)
+
+        if self._keys and self._keys[0] == cutoff_key:
+            bucket = self._buckets[cutoff_key]
+            for type_key in list(bucket):
+                entries = bucket[type_key]
+                while entries and entries[0][0] < cutoff:
+                    removed.append(entries.popleft()[1])
+                if not entries:
+                    del bucket[type_key]
+            if not bucket:
+                del self._buckets[cutoff_key]
+                self._keys.pop(0)
+
+        for buffered in removed:
+            if self._by_id.get(buffered.id) is buffered:
+                del self._by_id[buffered.id]
+        self._size -= len(removed)
+        if not self._size:
+            self._newest = None
+        return removed
+
+    def get(self, event_id: str) -> Optional[BufferedEvent]:
+        return self._by_id.get(event_id)
+
+    def oldest_time(self) -> Optional[datetime]:
+        if not self._keys:
+            return None
+        return min(entries[0][0] for entries in self._buckets[self._keys[0]].values())
+
+    def newest_time(self) -> Optional[datetime]:
+        return self._newest
+
+    def clear(self) -> None:
+        self._buckets.clear()
+        self._keys.clear()
+        self._by_id.clear()
+        self._size = 0
+        self._newest = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[BufferEntry]:
+        for key in self._keys:
+            for entries in self._buckets[key].values():
+                yield from entries
+
+    def __getitem__(self, index: int) -> BufferEntry:
+        return list(self)[index]
+
+
 @singleton
 class CorrelationService:
     """
@@ -84,20 +210,25 @@ class CorrelationService:
         processed sequentially through the async event loop.
 
     Performance:
-        - Buffer cleanup: O(k) where k = expired events
-        - Candidate search: O(n) where n = events in buffer
+        - Buffer cleanup: O(1) amortized per expired event
+        - Candidate search: O(k) where k = same-type events within the
+          neighbouring time buckets
+        - Database: one UPDATE per correlation group per burst
         - Target: < 10ms for 1000 events in buffer (AC5)
 
     Attributes:
         time_window_seconds: Time window for correlation matching
         buffer_max_age_seconds: How long to keep events in buffer
-        _buffer: Deque of (timestamp, BufferedEvent) tuples
+        group_flush_delay_seconds: How long a group's DB write waits for
+            more events of the same burst
+        _buffer: CorrelationBuffer of (timestamp, BufferedEvent) entries
     """
 
     def __init__(
         self,
         time_window_seconds: int = DEFAULT_TIME_WINDOW_SECONDS,
-        buffer_max_age_seconds: int = DEFAULT_BUFFER_MAX_AGE_SECONDS
+        buffer_max_age_seconds: int = DEFAULT_BUFFER_MAX_AGE_SECONDS,
+        group_flush_delay_seconds: float = DEFAULT_GROUP_FLUSH_DELAY_SECONDS,
     ):
         """
         Initialize correlation service.
@@ -105,10 +236,17 @@ class CorrelationService:
         Args:
             time_window_seconds: Time window for correlation (default 10s, AC2)
             buffer_max_age_seconds: Buffer retention period (default 60s, AC5)
+            group_flush_delay_seconds: Coalescing delay for group DB writes
         """
         self.time_window_seconds = time_window_seconds
         self.buffer_max_age_seconds = buffer_max_age_seconds
-        self._buffer: deque[Tuple[datetime, BufferedEvent]] = deque()
+        self.group_flush_delay_seconds = group_flush_delay_seconds
+        self._buffer = CorrelationBuffer(time_window_seconds)
+        # group_id -> member event IDs (ordered), and how many members are
+        # still buffered; a group nobody buffered can join is forgotten
+        self._group_members: Dict[str, Dict[str, None]] = {}
+        self._group_refs: Dict[str, int] = {}
+        self._pending_flushes: Dict[str, asyncio.Future] = {}
 
         logger.info(
             f"CorrelationService initialized: time_window={time_window_seconds}s, "
@@ -124,18 +262,19 @@ class CorrelationService:
         """
         Remove expired events from buffer (AC5).
 
-        Events older than buffer_max_age_seconds are removed from the front
-        of the deque (oldest first).
+        Events older than buffer_max_age_seconds are removed, whole time
+        buckets at a time.
 
         Returns:
             Number of events removed
         """
         cutoff = datetime.now(timezone.utc) - timedelta(seconds=self.buffer_max_age_seconds)
-        removed = 0
+        expired = self._buffer.expire(cutoff)
+        removed = len(expired)
 
-        while self._buffer and self._buffer[0][0] < cutoff:
-            self._buffer.popleft()
-            removed += 1
+        for buffered in expired:
+            if buffered.correlation_group_id:
+                self._release_group(buffered.correlation_group_id)
 
         if removed > 0:
             logger.debug(
@@ -176,6 +315,8 @@ class CorrelationService:
         # Use event timestamp for buffer ordering, fallback to now
         buffer_time = event.timestamp if event.timestamp.tzinfo else event.timestamp.replace(tzinfo=timezone.utc)
         self._buffer.append((buffer_time, buffered))
+        if buffered.correlation_group_id:
+            self._retain_group(buffered.correlation_group_id, buffered.id)
 
         logger.debug(
             f"Event added to buffer: {event.id[:8]}...",
@@ -207,10 +348,10 @@ class CorrelationService:
             List of BufferedEvents that correlate with the input event
         """
         candidates = []
-        event_time = event.timestamp
-        window = timedelta(seconds=self.time_window_seconds)
+        event_time = event.timestamp if event.timestamp.tzinfo else event.timestamp.replace(tzinfo=timezone.utc)
 
-        for _, buffered in self._buffer:
+        # Only same-type events in the neighbouring time buckets can match
+        for buffer_time, buffered in self._buffer.candidates(event_time, event.smart_detection_type):
             # Skip self
             if buffered.id == event.id:
                 continue
@@ -220,7 +361,7 @@ class CorrelationService:
                 continue
 
             # AC2: Time window check
-            time_diff = abs((buffered.timestamp - event_time).total_seconds())
+            time_diff = abs((buffer_time - event_time).total_seconds())
             if time_diff > self.time_window_seconds:
                 continue
 
@@ -333,14 +474,14 @@ class CorrelationService:
             Number of events updated
         """
         from app.models.event import Event
+        from app.services.database_writer import get_database_writer
 
         # Build the correlated_event_ids JSON array
         correlated_ids_json = json.dumps(event_ids)
 
-        db: Session = SessionLocal()
-        try:
+        def apply(session: Session) -> int:
             # Update all events in the group (AC3, AC4)
-            result = db.execute(
+            result = session.execute(
                 update(Event)
                 .where(Event.id.in_(event_ids))
                 .values(
@@ -348,9 +489,16 @@ class CorrelationService:
                     correlated_event_ids=correlated_ids_json
                 )
             )
-            db.commit()
+            return result.rowcount
 
-            updated_count = result.rowcount
+        writer = get_database_writer()
+        db: Optional[Session] = None if writer.is_running else SessionLocal()
+        try:
+            if db is None:
+                updated_count = await writer.run(apply)
+            else:
+                updated_count = apply(db)
+                db.commit()
 
             logger.info(
                 f"Updated {updated_count} events with correlation group {group_id[:8]}...",
@@ -365,7 +513,8 @@ class CorrelationService:
             return updated_count
 
         except Exception as e:
-            db.rollback()
+            if db is not None:
+                db.rollback()
             logger.error(
                 f"Failed to update correlation in database: {e}",
                 extra={
@@ -378,7 +527,8 @@ class CorrelationService:
             )
             raise
         finally:
-            db.close()
+            if db is not None:
+                db.close()
 
     def update_buffer_with_correlation(self, event_id: str, group_id: str) -> None:
         """
@@ -391,10 +541,48 @@ class CorrelationService:
             event_id: Event ID to update
             group_id: Correlation group ID to set
         """
-        for _, buffered in self._buffer:
-            if buffered.id == event_id:
-                buffered.correlation_group_id = group_id
-                break
+        buffered = self._buffer.get(event_id)
+        if buffered is None:
+            self._group_members.setdefault(group_id, {})[event_id] = None
+            return
+        if buffered.correlation_group_id == group_id:
+            self._group_members.setdefault(group_id, {})[event_id] = None
+            return
+        if buffered.correlation_group_id:
+            self._release_group(buffered.correlation_group_id)
+        buffered.correlation_group_id = group_id
+        self._retain_group(group_id, event_id)
+
+    def _retain_group(self, group_id: str, event_id: str) -> None:
+        self._group_members.setdefault(group_id, {})[event_id] = None
+        self._group_refs[group_id] = self._group_refs.get(group_id, 0) + 1
+
+    def _release_group(self, group_id: str) -> None:
+        refs = self._group_refs.get(group_id, 0) - 1
+        if refs > 0:
+            self._group_refs[group_id] = refs
+            return
+        # No buffered member left, so no new event can join this group
+        self._group_refs.pop(group_id, None)
+        self._group_members.pop(group_id, None)
+
+    async def _flush_group(self, group_id: str) -> int:
+        """Write a group's membership once the current burst has joined."""
+        await asyncio.sleep(self.group_flush_delay_seconds)
+        self._pending_flushes.pop(group_id, None)
+        event_ids = list(self._group_members.get(group_id, ()))
+        if not event_ids:
+            return 0
+        return await self.update_correlation_in_db(event_ids, group_id)
+
+    async def _write_group(self, group_id: str) -> int:
+        """Join (or schedule) the pending DB write for a correlation group."""
+        flush = self._pending_flushes.get(group_id)
+        if flush is None:
+            flush = asyncio.ensure_future(self._flush_group(group_id))
+            self._pending_flushes[group_id] = flush
+        # Shielded so one cancelled caller does not cancel the shared write
+        return await asyncio.shield(flush)
 
     async def process_event(self, event: "Event") -> Optional[str]:
         """
@@ -440,8 +628,8 @@ class CorrelationService:
             for eid in all_event_ids:
                 self.update_buffer_with_correlation(eid, group_id)
 
-            # Update database asynchronously
-            await self.update_correlation_in_db(all_event_ids, group_id)
+            # One UPDATE per group, shared with the rest of the burst
+            await self._write_group(group_id)
 
             logger.info(
                 f"Event {event.id[:8]}... correlated with {len(candidates)} other events",
@@ -484,8 +672,8 @@ class CorrelationService:
             }
 
         now = datetime.now(timezone.utc)
-        oldest_time, _ = self._buffer[0]
-        newest_time, _ = self._buffer[-1]
+        oldest_time = self._buffer.oldest_time()
+        newest_time = self._buffer.newest_time()
 
         return {
             "buffer_size": len(self._buffer),
@@ -502,8 +690,10 @@ class CorrelationService:
         Returns:
             Number of events cleared
         """
+        self._group_members.clear()
+        self._group_refs.clear()
         if self._buffer is None:
-            self._buffer = deque()
+            self._buffer = CorrelationBuffer(self.time_window_seconds)
             return 0
         count = len(self._buffer)
         self._buffer.clear()
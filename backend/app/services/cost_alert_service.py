@@ -12,7 +12,7 @@ Integrates with CostCapService for cap status and WebSocket for real-time delive
 import logging
 from app.core.decorators import singleton
 from datetime import datetime, timezone
-from typing import Optional, Literal, List
+from typing import Any, Dict, Optional, Literal, List, Tuple
 from dataclasses import dataclass
 
 from sqlalchemy.orm import Session
@@ -101,7 +101,7 @@ class CostAlertService:
 
         return setting.value if setting and setting.value else None
 
-    def _set_alert_state(self, db: Session, key: str, value: str) -> None:
+    def _set_alert_state(self, db: Session, key: str, value: str, commit: bool = True) -> None:
         """
         Record when an alert was sent.
 
@@ -109,6 +109,7 @@ class CostAlertService:
             db: Database session
             key: Alert state key from ALERT_KEYS
             value: Date/month string to record
+            commit: Commit immediately (False leaves the change to the caller)
         """
         setting = db.query(SystemSetting).filter(
             SystemSetting.key == key
@@ -120,7 +121,10 @@ class CostAlertService:
             setting = SystemSetting(key=key, value=value)
             db.add(setting)
 
-        db.commit()
+        if commit:
+            db.commit()
+        else:
+            db.flush()
         logger.debug(f"Alert state set: {key} = {value}")
 
     def _clear_alert_state(self, db: Session, key: str) -> None:
@@ -174,15 +178,15 @@ class CostAlertService:
 
         return last_sent != current_month
 
-    def _mark_daily_alert_sent(self, db: Session, threshold: int) -> None:
+    def _mark_daily_alert_sent(self, db: Session, threshold: int, commit: bool = True) -> None:
         """Mark daily alert as sent for given threshold."""
         key = ALERT_KEYS[f"daily_{threshold}"]
-        self._set_alert_state(db, key, self._get_current_date_str())
+        self._set_alert_state(db, key, self._get_current_date_str(), commit=commit)
 
-    def _mark_monthly_alert_sent(self, db: Session, threshold: int) -> None:
+    def _mark_monthly_alert_sent(self, db: Session, threshold: int, commit: bool = True) -> None:
         """Mark monthly alert as sent for given threshold."""
         key = ALERT_KEYS[f"monthly_{threshold}"]
-        self._set_alert_state(db, key, self._get_current_month_str())
+        self._set_alert_state(db, key, self._get_current_month_str(), commit=commit)
 
     def reset_daily_alerts(self, db: Session) -> None:
         """
@@ -263,7 +267,7 @@ class CostAlertService:
             percent=percent
         )
 
-    def check_thresholds(self, db: Session) -> List[CostAlert]:
+    def check_thresholds(self, db: Session, commit: bool = True) -> List[CostAlert]:
         """
         Check all cost thresholds and return alerts that should be sent.
 
@@ -274,6 +278,8 @@ class CostAlertService:
 
         Args:
             db: Database session
+            commit: Commit the "alert sent" markers immediately (False only
+                flushes them, for callers that own the transaction)
 
         Returns:
             List of CostAlert objects for alerts to send
@@ -290,7 +296,7 @@ class CostAlertService:
                     if self._should_send_daily_alert(db, int(threshold)):
                         alert = self._create_alert(threshold, "daily", status)
                         alerts.append(alert)
-                        self._mark_daily_alert_sent(db, int(threshold))
+                        self._mark_daily_alert_sent(db, int(threshold), commit=commit)
                         logger.info(
                             f"Daily {int(threshold)}% alert triggered",
                             extra={
@@ -310,7 +316,7 @@ class CostAlertService:
                     if self._should_send_monthly_alert(db, int(threshold)):
                         alert = self._create_alert(threshold, "monthly", status)
                         alerts.append(alert)
-                        self._mark_monthly_alert_sent(db, int(threshold))
+                        self._mark_monthly_alert_sent(db, int(threshold), commit=commit)
                         logger.info(
                             f"Monthly {int(threshold)}% alert triggered",
                             extra={
@@ -338,63 +344,95 @@ class CostAlertService:
         Returns:
             List of CostAlert objects that were sent
         """
-        from app.models.system_notification import SystemNotification
-        from app.services.websocket_manager import get_websocket_manager
-
         alerts = self.check_thresholds(db)
 
-        if not alerts:
-            return []
+        for alert in alerts:
+            notification = self._build_notification(alert)
+            db.add(notification)
+            db.commit()
+            db.refresh(notification)
+            self._log_notification(alert, notification)
+            await self.broadcast_alert(alert, notification.to_dict())
+
+        return alerts
 
-        websocket_manager = get_websocket_manager()
+    def stage_notifications(self, db: Session) -> List[Tuple[CostAlert, Dict[str, Any]]]:
+        """
+        Check thresholds and stage notification rows without committing.
 
-        for alert in alerts:
-            # Create notification record
-            notification = SystemNotification(
-                notification_type="cost_alert",
-                severity=alert.severity,
-                title=alert.title,
-                message=alert.message,
-                action_url="/settings?tab=ai-usage",
-                extra_data={
+        Used when the caller owns the transaction (e.g. the post-processing
+        unit of work); broadcast the returned pairs with broadcast_alert once
+        the transaction has committed.
+
+        Args:
+            db: Database session
+
+        Returns:
+            List of (CostAlert, serialized notification) pairs
+        """
+        staged = []
+        for alert in self.check_thresholds(db, commit=False):
+            notification = self._build_notification(alert)
+            db.add(notification)
+            db.flush()
+            self._log_notification(alert, notification)
+            staged.append((alert, notification.to_dict()))
+        return staged
+
+    async def broadcast_alert(self, alert: CostAlert, notification: Dict[str, Any]) -> None:
+        """
+        Broadcast a cost alert notification via WebSocket.
+
+        Args:
+            alert: Alert that was recorded
+            notification: Serialized SystemNotification for the alert
+        """
+        from app.services.websocket_manager import get_websocket_manager
+
+        await get_websocket_manager().broadcast({
+            "type": "COST_ALERT",
+            "data": {
+                "notification": notification,
+                "alert": {
                     "threshold": alert.threshold,
                     "period": alert.period,
+                    "severity": alert.severity,
                     "current_cost": alert.current_cost,
                     "cap": alert.cap,
                     "percent": alert.percent
                 }
-            )
-            db.add(notification)
-            db.commit()
-            db.refresh(notification)
+            }
+        })
 
-            logger.info(
-                f"Cost alert notification created: {alert.title}",
-                extra={
-                    "notification_id": notification.id,
-                    "severity": alert.severity,
-                    "period": alert.period,
-                    "threshold": alert.threshold
-                }
-            )
-
-            # Broadcast via WebSocket
-            await websocket_manager.broadcast({
-                "type": "COST_ALERT",
-                "data": {
-                    "notification": notification.to_dict(),
-                    "alert": {
-                        "threshold": alert.threshold,
-                        "period": alert.period,
-                        "severity": alert.severity,
-                        "current_cost": alert.current_cost,
-                        "cap": alert.cap,
-                        "percent": alert.percent
-                    }
-                }
-            })
+    def _build_notification(self, alert: CostAlert):
+        """Create the SystemNotification row for an alert."""
+        from app.models.system_notification import SystemNotification
 
-        return alerts
+        return SystemNotification(
+            notification_type="cost_alert",
+            severity=alert.severity,
+            title=alert.title,
+            message=alert.message,
+            action_url="/settings?tab=ai-usage",
+            extra_data={
+                "threshold": alert.threshold,
+                "period": alert.period,
+                "current_cost": alert.current_cost,
+                "cap": alert.cap,
+                "percent": alert.percent
+            }
+        )
+
+    def _log_notification(self, alert: CostAlert, notification) -> None:
+        logger.info(
+            f"Cost alert notification created: {alert.title}",
+            extra={
+                "notification_id": notification.id,
+                "severity": alert.severity,
+                "period": alert.period,
+                "threshold": alert.threshold
+            }
+        )
 
 
 # Backward compatible thin getter (delegates to @singleton decorator)
@@ -6,6 +6,10 @@ Story P3-7.3: Implement Daily/Monthly Cost Caps
 Provides cap enforcement, status tracking, and automatic resume logic
 for managing AI analysis costs.
 
+Caps apply to the whole deployment: in cluster mode costs are summed over
+every replica's ai_usage rows, since each process's in-memory ledger only
+sees its own calls.
+
 # Migrated to @singleton as part of #450 (Lightweight DI Container).
 """
 
@@ -21,6 +25,7 @@ import time
 from sqlalchemy.orm import Session
 
 from app.services.ai_cost_and_usage_tracker import get_ai_cost_and_usage_tracker
+from app.services.cluster_service import get_cluster_service
 from app.models.system_setting import SystemSetting
 from app.core.database import SessionLocal
 
@@ -82,20 +87,30 @@ class CostCapService:
         """
         Get total AI cost for current day (UTC).
 
-        Delegates to AICostAndUsageTracker (#447).
+        Delegates to AICostAndUsageTracker (#447), which answers from its
+        in-memory cost ledger without querying ai_usage. In cluster mode the
+        total is summed over all replicas instead.
         """
         tracker = get_ai_cost_and_usage_tracker()
-        cost = tracker.get_daily_cost()
+        if get_cluster_service().enabled:
+            cost = tracker.get_cluster_cost("daily")
+        else:
+            cost = tracker.get_daily_cost()
         return Decimal(str(cost))
 
     def get_monthly_cost(self, db: Session = None) -> Decimal:
         """
         Get total AI cost for current month (UTC).
 
-        Delegates to AICostAndUsageTracker (#447).
+        Delegates to AICostAndUsageTracker (#447), which answers from its
+        in-memory cost ledger without querying ai_usage. In cluster mode the
+        total is summed over all replicas instead.
         """
         tracker = get_ai_cost_and_usage_tracker()
-        cost = tracker.get_monthly_cost()
+        if get_cluster_service().enabled:
+            cost = tracker.get_cluster_cost("monthly")
+        else:
+            cost = tracker.get_monthly_cost()
         return Decimal(str(cost))
 
     def get_daily_cap(self, db: Session) -> Optional[float]:
@@ -166,6 +181,7 @@ class CostCapService:
 
         db.commit()
         self._invalidate_cache()
+        get_cluster_service().invalidate("cost_caps")
         logger.info(f"Daily cost cap set to: {cap}")
 
     def set_monthly_cap(self, db: Session, cap: Optional[float]) -> None:
@@ -190,6 +206,7 @@ class CostCapService:
 
         db.commit()
         self._invalidate_cache()
+        get_cluster_service().invalidate("cost_caps")
         logger.info(f"Monthly cost cap set to: {cap}")
 
     def get_cap_status(self, db: Session, use_cache: bool = True) -> CostCapStatus:
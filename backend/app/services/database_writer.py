@@ -0,0 +1,265 @@
+"""
+Single-Writer Database Queue
+
+SQLite allows one writer at a time. Camera threads, asyncio workers,
+schedulers and API handlers used to open their own sessions and race for
+the write lock, which under event bursts surfaced as "database is locked"
+retries. DatabaseWriter funnels hot-path writes (event inserts, embeddings,
+motion events, device last-seen updates) through one thread that owns the
+only write connection and commits them in groups.
+
+Producers hand over a callable that receives the writer's Session and
+stages its changes. The writer collects up to ``max_batch`` items (waiting
+at most ``max_wait_ms`` for stragglers), stages them all, flushes once and
+commits the whole group with one fsync. If the group fails, it is rolled
+back and replayed with each item in its own SAVEPOINT so a failing item does
+not poison its neighbours; write callables may therefore run twice and
+should only stage changes. Each producer gets its own result or exception
+back.
+
+The writer is opt-in: it only runs once ``start()`` is called (done in the
+application lifespan for SQLite). Callers check ``is_running`` and fall
+back to their own session otherwise, so tests and PostgreSQL deployments
+keep the direct write path.
+
+Usage:
+    writer = get_database_writer()
+    if writer.is_running:
+        event_id = await writer.run(lambda db: _insert_event(db, payload))
+"""
+import asyncio
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, List, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.decorators import singleton
+
+logger = logging.getLogger(__name__)
+
+WriteFn = Callable[[Session], Any]
+Outcome = Tuple[Future, Any, Optional[BaseException]]
+
+_STOP = object()
+
+
+@singleton
+class DatabaseWriter:
+    """
+    Dedicated writer thread that serializes and group-commits writes.
+
+    Thread Safety:
+        ``submit`` may be called from any thread; ``run`` from any event
+        loop. Write callables execute on the writer thread and must not
+        touch other sessions or return attached ORM objects they expect to
+        lazy-load later (objects are expunged after commit).
+    """
+
+    def __init__(
+        self,
+        session_factory=None,
+        max_batch: Optional[int] = None,
+        max_wait_ms: Optional[float] = None,
+    ):
+        if session_factory is None:
+            from app.core.database import WriterSessionLocal
+            session_factory = WriterSessionLocal
+        self.session_factory = session_factory
+        self.max_batch = max_batch or settings.SQLITE_WRITER_BATCH_SIZE
+        self.max_wait_ms = settings.SQLITE_WRITER_BATCH_WAIT_MS if max_wait_ms is None else max_wait_ms
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._state_lock = threading.Lock()
+        self.batches_committed = 0
+        self.writes_committed = 0
+        self.writes_failed = 0
+        self.largest_batch = 0
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def queue_depth(self) -> int:
+        return self._queue.qsize()
+
+    def start(self) -> None:
+        """Start the writer thread (idempotent)."""
+        with self._state_lock:
+            if self.is_running:
+                return
+            self._thread = threading.Thread(
+                target=self._run_loop, name="db-writer", daemon=True
+            )
+            self._thread.start()
+        logger.info(
+            "Database writer started",
+            extra={
+                "event_type": "db_writer_started",
+                "max_batch": self.max_batch,
+                "max_wait_ms": self.max_wait_ms,
+            }
+        )
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Commit everything already queued, then stop the writer thread."""
+        with self._state_lock:
+            thread = self._thread
+            if thread is None:
+                return
+            self._queue.put(_STOP)
+        thread.join(timeout)
+        with self._state_lock:
+            self._thread = None
+        logger.info(
+            "Database writer stopped",
+            extra={"event_type": "db_writer_stopped", **self.get_stats()}
+        )
+
+    def cleanup(self) -> None:
+        """Stop the writer thread (called by the singleton reset)."""
+        self.stop()
+
+    def submit(self, fn: WriteFn) -> Future:
+        """
+        Queue a write for the next group commit.
+
+        Args:
+            fn: Callable receiving the writer Session; its return value
+                becomes the future's result once the group commits
+
+        Returns:
+            concurrent.futures.Future resolved after commit
+
+        Raises:
+            RuntimeError: If the writer is not running
+        """
+        if not self.is_running:
+            raise RuntimeError("Database writer is not running")
+        future: Future = Future()
+        self._queue.put((fn, future))
+        return future
+
+    async def run(self, fn: WriteFn) -> Any:
+        """Queue a write and await its committed result."""
+        return await asyncio.wrap_future(self.submit(fn))
+
+    def get_stats(self) -> dict:
+        return {
+            "running": self.is_running,
+            "queue_depth": self.queue_depth,
+            "batches_committed": self.batches_committed,
+            "writes_committed": self.writes_committed,
+            "writes_failed": self.writes_failed,
+            "largest_batch": self.largest_batch,
+        }
+
+    def _run_loop(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.max_wait_ms / 1000.0
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                try:
+                    item = self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            self._commit_batch(batch)
+
+        # Drain anything queued behind the stop marker
+        leftovers = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            if item is not _STOP:
+                leftovers.append(item)
+        if leftovers:
+            self._commit_batch(leftovers)
+
+    def _commit_batch(self, batch: List[Tuple[WriteFn, Future]]) -> None:
+        batch = [(fn, future) for fn, future in batch if future.set_running_or_notify_cancel()]
+        if not batch:
+            return
+
+        outcomes = self._apply_group(batch)
+        if outcomes is None:
+            # Something in the group failed: replay item by item so only the
+            # offending write is rejected
+            outcomes = self._apply_isolated(batch)
+
+        self.batches_committed += 1
+        self.largest_batch = max(self.largest_batch, len(batch))
+        for future, result, error in outcomes:
+            if error is None:
+                self.writes_committed += 1
+                future.set_result(result)
+            else:
+                self.writes_failed += 1
+                future.set_exception(error)
+
+    def _apply_group(self, batch: List[Tuple[WriteFn, Future]]) -> Optional[List[Outcome]]:
+        """Stage every write, flush once and commit. None if anything failed."""
+        session = self.session_factory()
+        try:
+            results = [fn(session) for fn, _ in batch]
+            session.flush()
+            session.commit()
+            session.expunge_all()
+            return [(future, result, None) for (_, future), result in zip(batch, results)]
+        except Exception:
+            session.rollback()
+            return None
+        finally:
+            session.close()
+
+    def _apply_isolated(self, batch: List[Tuple[WriteFn, Future]]) -> List[Outcome]:
+        """Re-run each write inside its own SAVEPOINT, then commit the survivors."""
+        outcomes: List[Outcome] = []
+        session = self.session_factory()
+        try:
+            for fn, future in batch:
+                try:
+                    with session.begin_nested():
+                        result = fn(session)
+                        session.flush()
+                    outcomes.append((future, result, None))
+                except Exception as e:
+                    outcomes.append((future, None, e))
+            session.commit()
+            session.expunge_all()
+        except Exception as e:
+            session.rollback()
+            logger.error(
+                f"Database writer group commit failed: {e}",
+                exc_info=True,
+                extra={"event_type": "db_writer_commit_failed", "batch_size": len(batch)}
+            )
+            outcomes = [(future, None, error or e) for future, _, error in outcomes]
+        finally:
+            session.close()
+        return outcomes
+
+
+def get_database_writer() -> DatabaseWriter:
+    """Get the global DatabaseWriter instance."""
+    return DatabaseWriter()
+
+
+def reset_database_writer() -> None:
+    """Reset the global DatabaseWriter instance (for testing)."""
+    DatabaseWriter._reset_instance()
@@ -0,0 +1,357 @@
+"""
+Perceptual-dedup cache for AI descriptions.
+
+A camera watching a swaying tree, a parked car or passing headlights
+produces a stream of motion events whose frames are essentially the same
+scene. Each of them used to cost a vision call. The cache remembers the last
+few analyzed frames per camera, keyed by:
+
+- a 64-bit difference hash of the full frame (cheap, catches near-identical
+  pixels), and
+- the CLIP embedding of the thumbnail that the coordinator already computes
+  for entity matching (catches "same scene" despite lighting/noise changes).
+
+A new frame reuses the earlier description when it is within
+``DESCRIPTION_CACHE_WINDOW_SECONDS`` of an analyzed frame, its hash is within
+``DESCRIPTION_CACHE_HASH_DISTANCE`` bits, its embedding has cosine similarity
+of at least ``DESCRIPTION_CACHE_MIN_SIMILARITY`` (frames without an embedding
+are never cached), motion detection reported the same objects, and the
+description was generated with the same context (``description_context_key``:
+the camera, the matched entities and the stable part of the prompt context;
+similar-event and time-pattern lines change with every event and are left
+out so bursts still hit). Entries age from the
+original analysis: hits do not extend the window, so a scene that keeps
+moving is re-described at least once per window.
+
+The cache is off by default (``DESCRIPTION_CACHE_ENABLED``) and can be
+disabled per camera with ``Camera.description_cache_enabled``.
+"""
+import hashlib
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass, replace
+from typing import Deque, Dict, Optional, Sequence
+
+import cv2
+import numpy as np
+
+from app.core.config import settings
+from app.core.decorators import singleton
+from app.services.ai_types import AIResult
+
+logger = logging.getLogger(__name__)
+
+
+def frame_hash(frame: np.ndarray) -> int:
+    """
+    64-bit difference hash of a frame.
+
+    The frame is reduced to 9x8 grayscale and each bit records whether a
+    pixel is brighter than its right neighbour, so global brightness shifts
+    and sensor noise barely move the hash while a new object does.
+
+    Args:
+        frame: BGR or grayscale image
+
+    Returns:
+        Hash as a 64-bit integer
+    """
+    gray = cv2.cvtColor(frame, cv2.COLOR_BGR2GRAY) if frame.ndim == 3 else frame
+    small = cv2.resize(gray, (9, 8), interpolation=cv2.INTER_AREA).astype(np.int16)
+    bits = (small[:, 1:] > small[:, :-1]).flatten()
+    return int(np.packbits(bits).view(">u8")[0])
+
+
+def description_context_key(
+    camera_id: str,
+    entity_ids: Sequence[str] = (),
+    context: Optional[str] = None,
+) -> str:
+    """
+    Key for the context a description was generated with.
+
+    Args:
+        camera_id: Camera the frame came from
+        entity_ids: Entities matched to the frame before analysis
+        context: Stable context components of the prompt (feedback and
+            camera context), or None when no context-enhanced prompt was sent
+
+    Returns:
+        Hex digest; equal keys mean the provider saw equivalent context
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(str(camera_id).encode("utf-8"))
+    if context is not None:
+        digest.update(b"\1" + context.encode("utf-8"))
+    for entity_id in sorted(entity_ids):
+        digest.update(b"\0" + str(entity_id).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _hash_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def _unit_vector(embedding: Optional[Sequence[float]]) -> Optional[np.ndarray]:
+    if embedding is None or len(embedding) == 0:
+        return None
+    vector = np.asarray(embedding, dtype=np.float32)
+    norm = float(np.linalg.norm(vector))
+    return vector / norm if norm > 0 else None
+
+
+@dataclass
+class CachedDescription:
+    """One analyzed frame and the description it received."""
+    timestamp: float  # event time (epoch seconds)
+    frame_hash: int
+    embedding: np.ndarray  # unit vector
+    objects: frozenset
+    context_key: str
+    result: AIResult
+    hits: int = 0
+
+
+@dataclass
+class DescriptionCacheHit:
+    """A reusable description and how close the new frame was."""
+    result: AIResult
+    hash_distance: int
+    similarity: Optional[float]
+    age_seconds: float
+
+
+@singleton
+class DescriptionCacheService:
+    """
+    Per-camera cache of recent AI descriptions keyed by frame similarity.
+
+    Attributes:
+        window_seconds: Maximum age of a reusable description
+        max_hash_distance: Maximum Hamming distance between frame hashes
+        min_similarity: Minimum cosine similarity between embeddings
+        max_entries: Analyzed frames remembered per camera
+    """
+
+    def __init__(
+        self,
+        window_seconds: Optional[float] = None,
+        max_hash_distance: Optional[int] = None,
+        min_similarity: Optional[float] = None,
+        max_entries: Optional[int] = None,
+    ):
+        self.window_seconds = (
+            settings.DESCRIPTION_CACHE_WINDOW_SECONDS if window_seconds is None else window_seconds
+        )
+        self.max_hash_distance = (
+            settings.DESCRIPTION_CACHE_HASH_DISTANCE if max_hash_distance is None else max_hash_distance
+        )
+        self.min_similarity = (
+            settings.DESCRIPTION_CACHE_MIN_SIMILARITY if min_similarity is None else min_similarity
+        )
+        self.max_entries = max_entries or settings.DESCRIPTION_CACHE_MAX_ENTRIES
+        self._entries: Dict[str, Deque[CachedDescription]] = {}
+        # Camera.description_cache_enabled, read once per camera; invalidate_camera forgets it
+        self._camera_enabled: Dict[str, bool] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._disabled = 0
+        self._cost_saved = 0.0
+        self._tokens_saved = 0
+        self._camera_stats: Dict[str, Dict[str, float]] = {}
+
+    def camera_enabled(self, camera_id: str) -> Optional[bool]:
+        """Cached per-camera switch, None if not loaded yet."""
+        return self._camera_enabled.get(camera_id)
+
+    def set_camera_enabled(self, camera_id: str, enabled: bool) -> None:
+        """Record the camera's switch (and drop its entries when turned off)."""
+        with self._lock:
+            self._camera_enabled[camera_id] = enabled
+            if not enabled:
+                self._entries.pop(camera_id, None)
+
+    def _camera_counters(self, camera_id: str) -> Dict[str, float]:
+        counters = self._camera_stats.get(camera_id)
+        if counters is None:
+            counters = {"hits": 0, "misses": 0, "cost_saved_usd": 0.0}
+            self._camera_stats[camera_id] = counters
+        return counters
+
+    def lookup(
+        self,
+        camera_id: str,
+        frame_hash_value: int,
+        embedding: Optional[Sequence[float]],
+        objects: Sequence[str],
+        timestamp: float,
+        context_key: str = "",
+    ) -> Optional[DescriptionCacheHit]:
+        """
+        Find a recent description for a near-identical frame.
+
+        Args:
+            camera_id: Camera UUID
+            frame_hash_value: ``frame_hash`` of the new frame
+            embedding: CLIP embedding of the new frame's thumbnail; without
+                one the lookup always misses
+            objects: Objects reported by motion/smart detection
+            timestamp: Event time (epoch seconds)
+            context_key: ``description_context_key`` of the new frame
+
+        Returns:
+            A DescriptionCacheHit whose result is a zero-cost copy of the
+            cached description, or None on a miss
+        """
+        from app.core import metrics as prom
+
+        vector = _unit_vector(embedding)
+        wanted_objects = frozenset(objects or ())
+        best: Optional[CachedDescription] = None
+        best_distance = best_similarity = None
+
+        with self._lock:
+            entries = self._entries.get(camera_id, ()) if vector is not None else ()
+            for entry in reversed(entries):
+                age = timestamp - entry.timestamp
+                if age < 0 or age > self.window_seconds:
+                    continue
+                if entry.objects != wanted_objects or entry.context_key != context_key:
+                    continue
+                distance = _hash_distance(frame_hash_value, entry.frame_hash)
+                if distance > self.max_hash_distance:
+                    continue
+                similarity = float(np.dot(vector, entry.embedding))
+                if similarity < self.min_similarity:
+                    continue
+                if best is None or distance < best_distance:
+                    best, best_distance, best_similarity = entry, distance, similarity
+
+            counters = self._camera_counters(camera_id)
+            if best is None:
+                self._misses += 1
+                counters["misses"] += 1
+            else:
+                best.hits += 1
+                self._hits += 1
+                self._cost_saved += best.result.cost_estimate or 0.0
+                self._tokens_saved += best.result.tokens_used or 0
+                counters["hits"] += 1
+                counters["cost_saved_usd"] += best.result.cost_estimate or 0.0
+
+        if best is None:
+            prom.description_cache_lookups_total.labels(result="miss").inc()
+            return None
+
+        prom.description_cache_lookups_total.labels(result="hit").inc()
+        prom.description_cache_cost_saved_usd_total.inc(best.result.cost_estimate or 0.0)
+        logger.debug(
+            "Reusing cached AI description",
+            extra={
+                "event_type": "description_cache_hit",
+                "camera_id": camera_id,
+                "hash_distance": best_distance,
+                "similarity": best_similarity,
+                "age_seconds": round(timestamp - best.timestamp, 2),
+            }
+        )
+        return DescriptionCacheHit(
+            result=replace(
+                best.result,
+                objects_detected=list(best.result.objects_detected),
+                bounding_boxes=list(best.result.bounding_boxes) if best.result.bounding_boxes else None,
+                tokens_used=0,
+                response_time_ms=0,
+                cost_estimate=0.0,
+            ),
+            hash_distance=best_distance,
+            similarity=best_similarity,
+            age_seconds=timestamp - best.timestamp,
+        )
+
+    def store(
+        self,
+        camera_id: str,
+        frame_hash_value: int,
+        embedding: Optional[Sequence[float]],
+        objects: Sequence[str],
+        timestamp: float,
+        result: AIResult,
+        context_key: str = "",
+    ) -> None:
+        """Remember a provider-generated description for later reuse."""
+        vector = _unit_vector(embedding)
+        if not result.success or vector is None:
+            return
+        entry = CachedDescription(
+            timestamp=timestamp,
+            frame_hash=frame_hash_value,
+            embedding=vector,
+            objects=frozenset(objects or ()),
+            context_key=context_key,
+            # Copy: the caller keeps annotating and using its own result object
+            result=replace(result),
+        )
+        with self._lock:
+            entries = self._entries.get(camera_id)
+            if entries is None:
+                entries = deque(maxlen=self.max_entries)
+                self._entries[camera_id] = entries
+            entries.append(entry)
+
+    def record_disabled(self) -> None:
+        """Count a lookup skipped because the cache is off for the camera."""
+        from app.core import metrics as prom
+
+        with self._lock:
+            self._disabled += 1
+        prom.description_cache_lookups_total.labels(result="disabled").inc()
+
+    def invalidate_camera(self, camera_id: str) -> None:
+        """Forget a camera's cached descriptions and switch (settings or prompt changed)."""
+        with self._lock:
+            self._entries.pop(camera_id, None)
+            self._camera_enabled.pop(camera_id, None)
+
+        from app.services.cluster_service import get_cluster_service
+        get_cluster_service().invalidate("description_cache.camera", camera_id)
+
+    def get_stats(self) -> Dict[str, object]:
+        """Return hit rate and savings for monitoring."""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "hits": self._hits,
+                "misses": self._misses,
+                "disabled_lookups": self._disabled,
+                "hit_rate": round(self._hits / lookups, 4) if lookups else 0.0,
+                "cost_saved_usd": round(self._cost_saved, 6),
+                "tokens_saved": self._tokens_saved,
+                "cached_entries": sum(len(entries) for entries in self._entries.values()),
+                "by_camera": {
+                    camera_id: {
+                        "hits": int(counters["hits"]),
+                        "misses": int(counters["misses"]),
+                        "cost_saved_usd": round(counters["cost_saved_usd"], 6),
+                    }
+                    for camera_id, counters in self._camera_stats.items()
+                },
+            }
+
+    def cleanup(self) -> None:
+        """Drop all cached descriptions (called by the singleton reset)."""
+        with self._lock:
+            self._entries.clear()
+            self._camera_enabled.clear()
+
+
+def get_description_cache_service() -> DescriptionCacheService:
+    """Get the global DescriptionCacheService instance."""
+    return DescriptionCacheService()
+
+
+def reset_description_cache_service() -> None:
+    """Reset the global DescriptionCacheService instance (for testing)."""
+    DescriptionCacheService._reset_instance()
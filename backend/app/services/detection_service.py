@@ -0,0 +1,272 @@
+"""
+Fused Face/Vehicle Detection Service
+
+FaceDetectionService and VehicleDetectionService each decode the event
+thumbnail, resize it to 300x300 and run their own SSD network, from two
+separate background tasks. DetectionService runs both detectors in one
+pass instead:
+
+- Each image is decoded once (cv2.imdecode, PIL fallback) and resized to
+  the shared 300x300 SSD input once; the per-model blobs differ only in
+  mean/scale, which are applied to the shared tensor.
+- Several frames go through each network in one forward call (up to
+  ``DETECTION_MAX_BATCH``); SSD output rows carry the frame index.
+- Inference runs on a dedicated bounded thread pool with OpenCV's own
+  thread count pinned, so detection cannot starve the default executor or
+  oversubscribe cores. Each network is guarded by a lock because cv2.dnn
+  nets are not safe for concurrent forward calls.
+
+Results come back per frame with the decoded image attached, so callers
+can crop faces/vehicles without decoding again. Per-step latencies are
+exported as ``argusai_detection_stage_duration_seconds{stage}``.
+
+Usage:
+    frames = await get_detection_service().detect([thumbnail_bytes])
+    faces, vehicles = frames[0].faces, frames[0].vehicles
+"""
+import asyncio
+import io
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional, Sequence
+
+import cv2
+import numpy as np
+from PIL import Image
+
+from app.core.config import settings
+from app.core.decorators import singleton
+from app.services.face_detection_service import FaceDetection, FaceDetectionService
+from app.services.vehicle_detection_service import VehicleDetection, VehicleDetectionService
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FrameDetections:
+    """Faces and vehicles found in one frame, with the decoded image."""
+    image: np.ndarray
+    faces: list[FaceDetection] = field(default_factory=list)
+    vehicles: list[VehicleDetection] = field(default_factory=list)
+
+
+def decode_image(image_bytes: bytes) -> np.ndarray:
+    """
+    Decode image bytes to an OpenCV BGR array.
+
+    Raises:
+        ValueError: If the bytes are empty or not a decodable image
+    """
+    if not image_bytes:
+        raise ValueError("image_bytes cannot be empty")
+    image = cv2.imdecode(np.frombuffer(image_bytes, dtype=np.uint8), cv2.IMREAD_COLOR)
+    if image is not None:
+        return image
+    # Formats OpenCV was built without (e.g. some WebP/GIF builds)
+    try:
+        pil_image = Image.open(io.BytesIO(image_bytes)).convert("RGB")
+    except Exception as e:
+        raise ValueError(f"Could not decode image: {e}") from e
+    return cv2.cvtColor(np.array(pil_image), cv2.COLOR_RGB2BGR)
+
+
+def _pin_opencv_threads(count: int) -> None:
+    cv2.setNumThreads(count)
+
+
+@singleton
+class DetectionService:
+    """
+    Single-pass face and vehicle detection over one or more frames.
+
+    Args:
+        face_detector: FaceDetectionService providing the face net and parser
+        vehicle_detector: VehicleDetectionService providing the vehicle net
+        max_workers: Size of the dedicated detection thread pool
+        opencv_threads: Value passed to cv2.setNumThreads
+        max_batch: Maximum frames per network call
+    """
+
+    def __init__(
+        self,
+        face_detector: Optional[FaceDetectionService] = None,
+        vehicle_detector: Optional[VehicleDetectionService] = None,
+        max_workers: Optional[int] = None,
+        opencv_threads: Optional[int] = None,
+        max_batch: Optional[int] = None,
+    ):
+        self._face_detector = face_detector or FaceDetectionService()
+        self._vehicle_detector = vehicle_detector or VehicleDetectionService()
+        self.max_workers = max_workers or settings.DETECTION_WORKERS
+        self.opencv_threads = opencv_threads or settings.DETECTION_OPENCV_THREADS
+        self.max_batch = max_batch or settings.DETECTION_MAX_BATCH
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+        self._face_lock = threading.Lock()
+        self._vehicle_lock = threading.Lock()
+        self._faces_unavailable = False
+
+        logger.info(
+            "DetectionService initialized",
+            extra={
+                "event_type": "detection_service_init",
+                "max_workers": self.max_workers,
+                "opencv_threads": self.opencv_threads,
+                "max_batch": self.max_batch,
+            }
+        )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix="detector",
+                    initializer=_pin_opencv_threads,
+                    initargs=(self.opencv_threads,),
+                )
+            return self._executor
+
+    def cleanup(self) -> None:
+        """Shut down the detection thread pool (called by the singleton reset)."""
+        with self._executor_lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+                self._executor = None
+
+    async def detect(
+        self,
+        images: Sequence[bytes],
+        faces: bool = True,
+        vehicles: bool = True,
+        face_threshold: Optional[float] = None,
+        vehicle_threshold: Optional[float] = None,
+    ) -> list[FrameDetections]:
+        """
+        Detect faces and/or vehicles in every image.
+
+        Args:
+            images: Raw image bytes (JPEG, PNG, ...), one entry per frame
+            faces: Run the face detector
+            vehicles: Run the vehicle detector
+            face_threshold: Face confidence threshold (detector default if None)
+            vehicle_threshold: Vehicle confidence threshold (detector default if None)
+
+        Returns:
+            One FrameDetections per input image, in input order
+
+        Raises:
+            ValueError: If an image is empty or cannot be decoded
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(),
+            lambda: self.detect_sync(images, faces, vehicles, face_threshold, vehicle_threshold),
+        )
+
+    def detect_sync(
+        self,
+        images: Sequence[bytes],
+        faces: bool = True,
+        vehicles: bool = True,
+        face_threshold: Optional[float] = None,
+        vehicle_threshold: Optional[float] = None,
+    ) -> list[FrameDetections]:
+        """Synchronous body of ``detect``; runs on the detection pool."""
+        from app.core import metrics as prom
+
+        t0 = time.perf_counter()
+        decoded = [decode_image(image_bytes) for image_bytes in images]
+        prom.detection_stage_duration_seconds.labels(stage="decode").observe(time.perf_counter() - t0)
+
+        results = [FrameDetections(image=image) for image in decoded]
+        run_faces = faces and self._ensure_face_model()
+        run_vehicles = vehicles and self._ensure_vehicle_model()
+        if not results or not (run_faces or run_vehicles):
+            return results
+
+        for start in range(0, len(decoded), self.max_batch):
+            chunk = decoded[start:start + self.max_batch]
+            prom.detection_batch_size.observe(len(chunk))
+
+            t0 = time.perf_counter()
+            batch = self._prepare_batch(chunk)
+            prom.detection_stage_duration_seconds.labels(stage="preprocess").observe(time.perf_counter() - t0)
+
+            if run_faces:
+                face = self._face_detector
+                blob = batch - np.array(face.INPUT_MEAN, dtype=np.float32).reshape(1, 3, 1, 1)
+                if face.INPUT_SCALE != 1.0:
+                    blob *= face.INPUT_SCALE
+                rows = self._forward(face._net, self._face_lock, blob, "face")
+                for index, frame in enumerate(results[start:start + len(chunk)]):
+                    frame.faces = face.parse_detections(
+                        rows[rows[:, 0] == index], frame.image.shape, face_threshold
+                    )
+
+            if run_vehicles:
+                vehicle = self._vehicle_detector
+                mean = np.array(vehicle.INPUT_MEAN, dtype=np.float32).reshape(1, 3, 1, 1)
+                blob = (batch - mean) * np.float32(vehicle.INPUT_SCALE)
+                rows = self._forward(vehicle._net, self._vehicle_lock, blob, "vehicle")
+                for index, frame in enumerate(results[start:start + len(chunk)]):
+                    found = vehicle.parse_detections(
+                        rows[rows[:, 0] == index], frame.image.shape, vehicle_threshold
+                    )
+                    found.sort(key=lambda v: v.confidence, reverse=True)
+                    frame.vehicles = found
+
+        return results
+
+    def _prepare_batch(self, images: Sequence[np.ndarray]) -> np.ndarray:
+        """Resize every frame to the shared SSD input once; returns float32 NCHW."""
+        width, height = self._face_detector.INPUT_SIZE
+        resized = np.stack([cv2.resize(image, (width, height)) for image in images])
+        return resized.transpose(0, 3, 1, 2).astype(np.float32)
+
+    def _forward(self, net, lock: threading.Lock, blob: np.ndarray, model: str) -> np.ndarray:
+        from app.core import metrics as prom
+
+        t0 = time.perf_counter()
+        with lock:
+            net.setInput(blob)
+            detections = net.forward()
+        prom.detection_stage_duration_seconds.labels(stage=model).observe(time.perf_counter() - t0)
+        return detections.reshape(-1, 7)
+
+    def _ensure_face_model(self) -> bool:
+        if self._faces_unavailable:
+            return False
+        if not self._face_detector.is_model_loaded():
+            with self._face_lock:
+                if not self._face_detector.is_model_loaded():
+                    try:
+                        self._face_detector._load_model()
+                    except (FileNotFoundError, cv2.error) as e:
+                        self._faces_unavailable = True
+                        logger.warning(
+                            f"Face detection model unavailable, skipping face detection: {e}",
+                            extra={"event_type": "detection_face_model_unavailable"}
+                        )
+                        return False
+        return True
+
+    def _ensure_vehicle_model(self) -> bool:
+        vehicle = self._vehicle_detector
+        if not vehicle.is_model_loaded():
+            with self._vehicle_lock:
+                vehicle._load_model()
+        return not vehicle.is_using_fallback()
+
+
+def get_detection_service() -> DetectionService:
+    """Get the global DetectionService instance."""
+    return DetectionService()
+
+
+def reset_detection_service() -> None:
+    """Reset the global DetectionService instance (for testing)."""
+    DetectionService._reset_instance()
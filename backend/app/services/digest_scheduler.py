@@ -164,6 +164,12 @@ class DigestScheduler:
 
     async def _run_scheduled_digest_wrapper(self) -> None:
         """Wrapper to run scheduled digest with error handling."""
+        from app.services.cluster_service import get_cluster_service
+
+        # Cluster mode: every replica schedules the digest, only the leader runs it
+        if not get_cluster_service().is_leader():
+            logger.debug("Scheduled digest skipped: not the cluster leader")
+            return
         try:
             await self.run_scheduled_digest()
         except Exception as e:
@@ -0,0 +1,472 @@
+"""
+Embedding Backfill Service
+
+Generates the missing CLIP embeddings of past events (events created before
+embeddings existed, or whose live embedding step failed) as a background job
+that can run alongside live traffic.
+
+Each batch:
+    anti-join select (events LEFT JOIN event_embeddings ... IS NULL), keyset
+    paginated by event id
+        → thumbnails read and decoded on a small thread pool
+        → one batched CLIP forward pass (EmbeddingService.generate_embeddings_batch)
+        → one executemany INSERT ... ON CONFLICT DO NOTHING (through the
+          single writer on SQLite)
+
+The next batch is fetched and decoded while the current one encodes and is
+stored, so the decode pool and the CLIP forward pass overlap.
+
+The job is paced to ``EMBEDDING_BACKFILL_MAX_EVENTS_PER_SECOND`` and reports
+progress over WebSocket (``embedding_backfill_progress`` /
+``embedding_backfill_complete``) and GET /context/embeddings/batch. It keeps
+no checkpoint of its own: the anti-join only returns events still missing an
+embedding, so a job started after a cancel or restart resumes where the last
+one stopped.
+"""
+import asyncio
+import io
+import json
+import logging
+import os
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from enum import Enum
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+from PIL import Image
+from sqlalchemy import insert, or_
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.database import get_db_session
+from app.core.decorators import singleton
+from app.models.event import Event
+from app.models.event_embedding import EventEmbedding
+from app.services.database_writer import get_database_writer
+from app.services.embedding_service import get_embedding_service
+from app.services.websocket_manager import get_websocket_manager
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_DIR = os.path.join(os.path.dirname(__file__), "..", "..", "data", "thumbnails")
+THUMBNAIL_URL_PREFIX = "/api/v1/thumbnails/"
+
+# CLIP sees 224x224; JPEG draft mode decodes at the smallest DCT scale that
+# still covers this, which is several times cheaper than a full decode
+DECODE_DRAFT_SIZE = (448, 448)
+
+MissingRow = Tuple[str, Optional[str], Optional[str]]  # (event_id, thumbnail_hash, thumbnail_path)
+
+
+class EmbeddingBackfillStatus(str, Enum):
+    """Status of an embedding backfill job."""
+    RUNNING = "running"
+    COMPLETED = "completed"
+    CANCELLED = "cancelled"
+    FAILED = "failed"
+
+
+@dataclass
+class EmbeddingBackfillJob:
+    """Represents an embedding backfill job with its progress."""
+    job_id: str
+    status: EmbeddingBackfillStatus
+    total_events: int
+    batch_size: int
+    max_events_per_second: float
+    processed: int = 0
+    embedded: int = 0
+    failed: int = 0
+    batches: int = 0
+    started_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+    error_message: Optional[str] = None
+    # Keyset cursor: last event id selected
+    last_event_id: Optional[str] = None
+    cancel_requested: bool = False
+
+    def to_dict(self) -> dict:
+        """Convert job to dictionary for API response."""
+        end = self.completed_at or datetime.now(timezone.utc)
+        elapsed = (end - self.started_at).total_seconds() if self.started_at else 0.0
+        return {
+            "job_id": self.job_id,
+            "status": self.status.value,
+            "total_events": self.total_events,
+            "processed": self.processed,
+            "embedded": self.embedded,
+            "failed": self.failed,
+            "remaining": max(self.total_events - self.processed, 0),
+            "batches": self.batches,
+            "percent_complete": round((self.processed / self.total_events * 100), 1) if self.total_events > 0 else 0,
+            "events_per_second": round(self.processed / elapsed, 2) if elapsed > 0 else 0.0,
+            "batch_size": self.batch_size,
+            "max_events_per_second": self.max_events_per_second,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "error_message": self.error_message,
+        }
+
+
+@singleton
+class EmbeddingBackfillService:
+    """
+    Background backfill of missing event embeddings.
+
+    Only one backfill job runs at a time.
+
+    Attributes:
+        PROGRESS_UPDATE_INTERVAL: Seconds between WebSocket updates (1.0)
+    """
+
+    PROGRESS_UPDATE_INTERVAL = 1.0  # seconds
+
+    def __init__(self):
+        """Initialize the backfill service."""
+        self._current_job: Optional[EmbeddingBackfillJob] = None
+        self._task: Optional[asyncio.Task] = None
+        self._lock = asyncio.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def current_job(self) -> Optional[EmbeddingBackfillJob]:
+        """Get the current or most recent backfill job."""
+        return self._current_job
+
+    @property
+    def is_running(self) -> bool:
+        """Check if a backfill job is currently running."""
+        return (
+            self._current_job is not None
+            and self._current_job.status == EmbeddingBackfillStatus.RUNNING
+        )
+
+    def _missing_query(self, db: Session):
+        """Events with a thumbnail and no embedding (LEFT JOIN anti-join)."""
+        return db.query(Event.id, Event.thumbnail_hash, Event.thumbnail_path).outerjoin(
+            EventEmbedding, EventEmbedding.event_id == Event.id
+        ).filter(
+            EventEmbedding.id.is_(None),
+            or_(Event.thumbnail_hash.isnot(None), Event.thumbnail_path.isnot(None)),
+        )
+
+    def count_missing(self, db: Session) -> int:
+        """Number of events with a thumbnail but no embedding."""
+        return self._missing_query(db).count()
+
+    def _fetch_missing(self, after_id: Optional[str], limit: int) -> List[MissingRow]:
+        with get_db_session() as db:
+            query = self._missing_query(db)
+            if after_id is not None:
+                query = query.filter(Event.id > after_id)
+            return [tuple(row) for row in query.order_by(Event.id).limit(limit).all()]
+
+    async def start_backfill(
+        self,
+        db: Session,
+        limit: Optional[int] = None,
+        batch_size: Optional[int] = None,
+        max_events_per_second: Optional[float] = None,
+    ) -> EmbeddingBackfillJob:
+        """
+        Start a backfill job.
+
+        Args:
+            db: SQLAlchemy database session
+            limit: Maximum events to process (None for all missing)
+            batch_size: Events per CLIP batch (default EMBEDDING_BACKFILL_BATCH_SIZE)
+            max_events_per_second: Pace limit, 0 for none
+                (default EMBEDDING_BACKFILL_MAX_EVENTS_PER_SECOND)
+
+        Returns:
+            Created EmbeddingBackfillJob
+
+        Raises:
+            ValueError: If a job is already running or no event needs an embedding
+        """
+        async with self._lock:
+            if self.is_running:
+                raise ValueError("An embedding backfill job is already running")
+
+            total_events = self.count_missing(db)
+            if limit is not None:
+                total_events = min(total_events, limit)
+            if total_events == 0:
+                raise ValueError("No events are missing embeddings")
+
+            job = EmbeddingBackfillJob(
+                job_id=str(uuid.uuid4()),
+                status=EmbeddingBackfillStatus.RUNNING,
+                total_events=total_events,
+                batch_size=batch_size or settings.EMBEDDING_BACKFILL_BATCH_SIZE,
+                max_events_per_second=(
+                    settings.EMBEDDING_BACKFILL_MAX_EVENTS_PER_SECOND
+                    if max_events_per_second is None else max_events_per_second
+                ),
+                started_at=datetime.now(timezone.utc),
+            )
+            self._current_job = job
+            self._task = asyncio.create_task(self._run(job))
+
+            logger.info(
+                f"Embedding backfill started: {job.job_id}",
+                extra={
+                    "event_type": "embedding_backfill_started",
+                    "job_id": job.job_id,
+                    "total_events": total_events,
+                    "batch_size": job.batch_size,
+                    "max_events_per_second": job.max_events_per_second,
+                }
+            )
+            return job
+
+    async def cancel_backfill(self) -> Optional[EmbeddingBackfillJob]:
+        """
+        Cancel the running job after its current batch.
+
+        Returns:
+            The cancelled job, or None if no job was running
+        """
+        async with self._lock:
+            if not self.is_running:
+                return None
+
+            self._current_job.cancel_requested = True
+            if self._task:
+                try:
+                    await asyncio.wait_for(asyncio.shield(self._task), timeout=30.0)
+                except asyncio.TimeoutError:
+                    logger.warning("Embedding backfill did not stop within timeout")
+            return self._current_job
+
+    async def wait(self) -> None:
+        """Wait for the current job to finish (used by tests and scripts)."""
+        if self._task:
+            await asyncio.shield(self._task)
+
+    async def _run(self, job: EmbeddingBackfillJob) -> None:
+        """Background task: process batches until done, cancelled or out of events."""
+        ws_manager = get_websocket_manager()
+        start = time.monotonic()
+        last_progress_update = start
+
+        fetched = 0
+        prefetch: Optional[asyncio.Task] = asyncio.create_task(
+            self._fetch_batch(job, min(job.batch_size, job.total_events))
+        )
+
+        try:
+            while prefetch is not None and not job.cancel_requested:
+                rows, images = await prefetch
+                prefetch = None
+                if not rows:
+                    break
+                fetched += len(rows)
+
+                # Decode batch n+1 on the pool while batch n encodes and is stored
+                if fetched < job.total_events:
+                    prefetch = asyncio.create_task(
+                        self._fetch_batch(job, min(job.batch_size, job.total_events - fetched))
+                    )
+
+                await self._process_batch(job, rows, images)
+
+                now = time.monotonic()
+                if now - last_progress_update >= self.PROGRESS_UPDATE_INTERVAL:
+                    await self._broadcast("embedding_backfill_progress", ws_manager, job)
+                    last_progress_update = now
+
+                await self._pace(job, start)
+
+            job.status = (
+                EmbeddingBackfillStatus.CANCELLED if job.cancel_requested else EmbeddingBackfillStatus.COMPLETED
+            )
+            job.completed_at = datetime.now(timezone.utc)
+            logger.info(
+                f"Embedding backfill {job.status.value}: {job.job_id}",
+                extra={"event_type": "embedding_backfill_finished", **job.to_dict()}
+            )
+
+        except Exception as e:
+            job.status = EmbeddingBackfillStatus.FAILED
+            job.error_message = str(e)
+            job.completed_at = datetime.now(timezone.utc)
+            logger.error(
+                f"Embedding backfill failed: {job.job_id}",
+                exc_info=True,
+                extra={"event_type": "embedding_backfill_failed", "job_id": job.job_id, "error": str(e)}
+            )
+
+        finally:
+            # A prefetched batch left over by a cancel or failure is simply
+            # dropped; the anti-join selects those events again next time
+            if prefetch is not None:
+                prefetch.cancel()
+                await asyncio.gather(prefetch, return_exceptions=True)
+
+        await self._broadcast("embedding_backfill_complete", ws_manager, job)
+
+    async def _fetch_batch(
+        self, job: EmbeddingBackfillJob, size: int
+    ) -> Tuple[List[MissingRow], List[Optional[Image.Image]]]:
+        """Select the next batch after the keyset cursor and decode its thumbnails."""
+        rows = await asyncio.to_thread(self._fetch_missing, job.last_event_id, size)
+        if not rows:
+            return rows, []
+        job.last_event_id = rows[-1][0]
+
+        loop = asyncio.get_running_loop()
+        executor = self._get_executor()
+        images = await asyncio.gather(*(
+            loop.run_in_executor(executor, self._load_image, thumbnail_hash, thumbnail_path)
+            for _, thumbnail_hash, thumbnail_path in rows
+        ))
+        return rows, list(images)
+
+    async def _process_batch(
+        self,
+        job: EmbeddingBackfillJob,
+        rows: Sequence[MissingRow],
+        images: Sequence[Optional[Image.Image]],
+    ) -> None:
+        ready = [(row[0], image) for row, image in zip(rows, images) if image is not None]
+        job.failed += len(rows) - len(ready)
+
+        if ready:
+            try:
+                vectors = await get_embedding_service().generate_embeddings_batch(
+                    [image for _, image in ready], batch_size=job.batch_size
+                )
+                await self._store([event_id for event_id, _ in ready], vectors)
+                job.embedded += len(ready)
+            except Exception as e:
+                job.failed += len(ready)
+                logger.warning(
+                    f"Embedding backfill batch failed: {e}",
+                    extra={"event_type": "embedding_backfill_batch_error", "job_id": job.job_id, "error": str(e)}
+                )
+
+        job.processed += len(rows)
+        job.batches += 1
+
+    async def _pace(self, job: EmbeddingBackfillJob, start: float) -> None:
+        """Sleep so the average rate stays at or below max_events_per_second."""
+        if job.max_events_per_second > 0:
+            ahead = job.processed / job.max_events_per_second - (time.monotonic() - start)
+            if ahead > 0:
+                await asyncio.sleep(ahead)
+                return
+        # Let live work run between batches even when unthrottled
+        await asyncio.sleep(0)
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=max(1, settings.EMBEDDING_BACKFILL_DECODE_WORKERS),
+                thread_name_prefix="embedding-backfill",
+            )
+        return self._executor
+
+    @staticmethod
+    def _read_thumbnail(thumbnail_hash: Optional[str], thumbnail_path: Optional[str]) -> Optional[bytes]:
+        if thumbnail_hash:
+            from app.services.service_container import container
+            return container.media_store.read(thumbnail_hash)
+        if not thumbnail_path:
+            return None
+        if thumbnail_path.startswith(THUMBNAIL_URL_PREFIX):
+            file_path = os.path.join(THUMBNAIL_DIR, thumbnail_path[len(THUMBNAIL_URL_PREFIX):])
+        elif os.path.isabs(thumbnail_path):
+            file_path = thumbnail_path
+        else:
+            file_path = os.path.join(THUMBNAIL_DIR, thumbnail_path)
+        try:
+            with open(file_path, "rb") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    @classmethod
+    def _load_image(cls, thumbnail_hash: Optional[str], thumbnail_path: Optional[str]) -> Optional[Image.Image]:
+        """Read and fully decode a thumbnail to RGB (runs on the decode pool)."""
+        data = cls._read_thumbnail(thumbnail_hash, thumbnail_path)
+        if not data:
+            return None
+        try:
+            image = Image.open(io.BytesIO(data))
+            image.draft("RGB", DECODE_DRAFT_SIZE)
+            image = image.convert("RGB")
+            image.load()
+            return image
+        except Exception as e:
+            logger.debug(f"Undecodable thumbnail skipped by backfill: {e}")
+            return None
+
+    @staticmethod
+    def _insert_statement(db: Session):
+        """INSERT that skips events embedded meanwhile by the live pipeline."""
+        table = EventEmbedding.__table__
+        dialect = db.get_bind().dialect.name
+        if dialect == "sqlite":
+            from sqlalchemy.dialects.sqlite import insert as dialect_insert
+        elif dialect == "postgresql":
+            from sqlalchemy.dialects.postgresql import insert as dialect_insert
+        else:
+            return insert(table)
+        return dialect_insert(table).on_conflict_do_nothing(index_elements=["event_id"])
+
+    def _stage_rows(self, db: Session, rows: List[dict]) -> None:
+        # A list of parameter sets makes this a single executemany
+        db.execute(self._insert_statement(db), rows)
+
+    async def _store(self, event_ids: Sequence[str], vectors: np.ndarray) -> None:
+        model_version = get_embedding_service().get_model_version()
+        created_at = datetime.now(timezone.utc)
+        rows = [
+            {
+                "id": str(uuid.uuid4()),
+                "event_id": event_id,
+                "embedding": json.dumps(vector.tolist()),
+                "model_version": model_version,
+                "created_at": created_at,
+            }
+            for event_id, vector in zip(event_ids, vectors)
+        ]
+
+        writer = get_database_writer()
+        if writer.is_running:
+            await writer.run(lambda session: self._stage_rows(session, rows))
+        else:
+            def write() -> None:
+                with get_db_session() as db:
+                    self._stage_rows(db, rows)
+                    db.commit()
+            await asyncio.to_thread(write)
+
+    async def _broadcast(self, message_type: str, ws_manager, job: EmbeddingBackfillJob) -> None:
+        try:
+            await ws_manager.broadcast({"type": message_type, "data": job.to_dict()})
+        except Exception as e:
+            logger.debug(f"Failed to broadcast embedding backfill progress: {e}")
+
+    def cleanup(self) -> None:
+        """Stop the decode pool (called by the singleton reset)."""
+        if self._current_job is not None:
+            self._current_job.cancel_requested = True
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+def get_embedding_backfill_service() -> EmbeddingBackfillService:
+    """Get the global EmbeddingBackfillService instance."""
+    return EmbeddingBackfillService()
+
+
+def reset_embedding_backfill_service() -> None:
+    """Reset the global EmbeddingBackfillService instance (for testing)."""
+    EmbeddingBackfillService._reset_instance()
@@ -31,10 +31,13 @@ import base64
 import io
 import json
 import logging
+from collections import OrderedDict
 from app.core.decorators import singleton
+from app.services.database_writer import get_database_writer
 import time
-from typing import Optional
+from typing import Optional, Sequence
 
+import numpy as np
 from PIL import Image
 from sqlalchemy.orm import Session
 
@@ -53,16 +56,20 @@ class EmbeddingService:
         MODEL_NAME: sentence-transformers model identifier
         MODEL_VERSION: Version string stored in database for compatibility
         EMBEDDING_DIM: Output embedding dimension (512 for CLIP ViT-B/32)
+        TEXT_CACHE_SIZE: Text embeddings kept in the encode_text() LRU
     """
 
     MODEL_NAME = "clip-ViT-B-32"
     MODEL_VERSION = "clip-ViT-B-32-v1"
     EMBEDDING_DIM = 512
+    TEXT_CACHE_SIZE = 512
 
     def __init__(self):
         """Initialize EmbeddingService with lazy model loading."""
         self._model = None
         self._model_lock = asyncio.Lock()
+        # encode_text() results keyed by the normalized, CLIP-formatted query
+        self._text_embeddings: OrderedDict[str, list[float]] = OrderedDict()
         logger.info(
             "EmbeddingService initialized",
             extra={
@@ -201,6 +208,47 @@ class EmbeddingService:
             )
             raise
 
+    async def generate_embeddings_batch(
+        self,
+        images: Sequence[Image.Image],
+        batch_size: int = 32,
+    ) -> np.ndarray:
+        """
+        Embed several decoded images with batched CLIP inference.
+
+        One forward pass per ``batch_size`` images instead of one per image,
+        which is what makes bulk backfills affordable.
+
+        Args:
+            images: RGB PIL images
+            batch_size: Images per forward pass
+
+        Returns:
+            float32 array of shape (len(images), 512)
+        """
+        if not images:
+            return np.empty((0, self.EMBEDDING_DIM), dtype=np.float32)
+
+        start_time = time.time()
+        await self._ensure_model_loaded()
+
+        loop = asyncio.get_running_loop()
+        embeddings = await loop.run_in_executor(
+            None,
+            lambda: self._model.encode(list(images), batch_size=batch_size, convert_to_numpy=True)
+        )
+        embeddings = np.asarray(embeddings, dtype=np.float32).reshape(len(images), -1)
+
+        logger.debug(
+            "Embedding batch generated",
+            extra={
+                "event_type": "embedding_batch_generated",
+                "batch_size": len(images),
+                "inference_time_ms": (time.time() - start_time) * 1000,
+            }
+        )
+        return embeddings
+
     async def generate_embedding_from_base64(self, base64_str: str) -> list[float]:
         """
         Generate embedding from a base64-encoded image string.
@@ -247,6 +295,9 @@ class EmbeddingService:
         queries into the same embedding space as images. The resulting embedding
         can be compared with image embeddings using cosine similarity.
 
+        Results are kept in an LRU of TEXT_CACHE_SIZE entries keyed by the
+        normalized query, so repeated questions skip CLIP entirely.
+
         Args:
             query: Natural language query (e.g., "package delivery", "Was there a dog?")
 
@@ -277,12 +328,24 @@ class EmbeddingService:
             }
         )
 
-        # Ensure model is loaded (AC-4.1.2)
-        await self._ensure_model_loaded()
-
         # Format query for CLIP (AC-4.1.5)
         formatted_query = self._format_query_for_clip(query)
 
+        cached = self._text_embeddings.get(formatted_query)
+        if cached is not None:
+            self._text_embeddings.move_to_end(formatted_query)
+            logger.debug(
+                "Text embedding cache hit",
+                extra={
+                    "event_type": "text_embedding_cache_hit",
+                    "query_length": len(query),
+                }
+            )
+            return list(cached)
+
+        # Ensure model is loaded (AC-4.1.2)
+        await self._ensure_model_loaded()
+
         try:
             # Generate embedding in thread pool (CPU-bound operation)
             loop = asyncio.get_event_loop()
@@ -294,6 +357,10 @@ class EmbeddingService:
             # Convert to list for JSON serialization (AC-4.1.3)
             embedding_list = embedding.tolist()
 
+            self._text_embeddings[formatted_query] = embedding_list
+            while len(self._text_embeddings) > self.TEXT_CACHE_SIZE:
+                self._text_embeddings.popitem(last=False)
+
             inference_time_ms = (time.time() - start_time) * 1000
             logger.debug(
                 "Text embedding generated",
@@ -305,7 +372,7 @@ class EmbeddingService:
                 }
             )
 
-            return embedding_list
+            return list(embedding_list)
 
         except Exception as e:
             inference_time_ms = (time.time() - start_time) * 1000
@@ -343,6 +410,28 @@ class EmbeddingService:
         # Longer queries are likely already descriptive
         return query
 
+    def build_embedding(self, event_id: str, embedding: list[float]):
+        """
+        Build an unsaved EventEmbedding row for an event.
+
+        Used when the caller commits the row as part of a larger
+        transaction (see EventUnitOfWork).
+
+        Args:
+            event_id: UUID of the associated event
+            embedding: List of 512 floats
+
+        Returns:
+            Transient EventEmbedding instance
+        """
+        from app.models.event_embedding import EventEmbedding
+
+        return EventEmbedding(
+            event_id=event_id,
+            embedding=json.dumps(embedding),
+            model_version=self.MODEL_VERSION,
+        )
+
     async def store_embedding(
         self,
         db: Session,
@@ -360,20 +449,16 @@ class EmbeddingService:
         Returns:
             ID of the created EventEmbedding record
         """
-        from app.models.event_embedding import EventEmbedding
+        event_embedding = self.build_embedding(event_id, embedding)
 
-        # Serialize embedding to JSON
-        embedding_json = json.dumps(embedding)
-
-        event_embedding = EventEmbedding(
-            event_id=event_id,
-            embedding=embedding_json,
-            model_version=self.MODEL_VERSION,
-        )
-
-        db.add(event_embedding)
-        db.commit()
-        db.refresh(event_embedding)
+        # Group-committed by the single writer on SQLite when it is running
+        writer = get_database_writer()
+        if writer.is_running:
+            await writer.run(lambda session: session.add(event_embedding))
+        else:
+            db.add(event_embedding)
+            db.commit()
+            db.refresh(event_embedding)
 
         logger.debug(
             "Embedding stored",
@@ -483,6 +568,7 @@ class EmbeddingService:
         db.add(frame_embedding)
         db.commit()
         db.refresh(frame_embedding)
+        self._invalidate_frame_matrix(event_id)
 
         logger.debug(
             "Frame embedding stored",
@@ -533,6 +619,7 @@ class EmbeddingService:
             frame_embedding_ids.append(frame_embedding.id)
 
         db.commit()
+        self._invalidate_frame_matrix(event_id)
 
         duration_ms = (time.time() - start_time) * 1000
         logger.debug(
@@ -579,6 +666,12 @@ class EmbeddingService:
             for emb in embeddings
         ]
 
+    def _invalidate_frame_matrix(self, event_id: str) -> None:
+        """Drop the re-ranking matrix and cached selections built from old frame embeddings."""
+        from app.services.smart_reanalyze_service import get_smart_reanalyze_service
+
+        get_smart_reanalyze_service().invalidate_frame_embeddings(event_id)
+
     async def delete_frame_embeddings(
         self,
         db: Session,
@@ -603,6 +696,7 @@ class EmbeddingService:
         ).delete()
 
         db.commit()
+        self._invalidate_frame_matrix(event_id)
 
         logger.debug(
             "Frame embeddings deleted",
@@ -49,6 +49,7 @@ from typing import Optional
 import uuid
 
 from app.core.decorators import singleton
+from app.services.mcp_context import get_mcp_context_provider
 
 from sqlalchemy import desc
 from sqlalchemy.orm import Session
@@ -998,6 +999,8 @@ class EntityService:
 
         db.commit()
         db.refresh(entity)
+        # Names and flags also appear in other entities' similar-entity context
+        get_mcp_context_provider().invalidate_entity()
 
         return {
             "id": entity.id,
@@ -1041,6 +1044,7 @@ class EntityService:
         # Remove from cache
         if entity_id in self._entity_cache:
             del self._entity_cache[entity_id]
+        get_mcp_context_provider().invalidate_entity()
 
         logger.info(
             f"Entity deleted: {entity_id}",
@@ -1247,6 +1251,7 @@ class EntityService:
             entity.updated_at = datetime.now(timezone.utc)
 
         db.commit()
+        get_mcp_context_provider().invalidate_entity(entity_id)
 
         logger.info(
             f"Event unlinked from entity: event={event_id}, entity={entity_id}",
@@ -1260,7 +1265,7 @@ class EntityService:
 
         return True
 
-    async def get_entity_for_event(
+    def get_entity_for_event(
         self,
         db: Session,
         event_id: str,
@@ -1444,6 +1449,10 @@ class EntityService:
         target_entity.updated_at = datetime.now(timezone.utc)
 
         db.commit()
+        mcp_context = get_mcp_context_provider()
+        mcp_context.invalidate_entity(entity_id)
+        if old_entity_id:
+            mcp_context.invalidate_entity(old_entity_id)
 
         entity_name = target_entity.name or f"{target_entity.entity_type.title()} entity"
         message = f"Event {'moved to' if action == 'move' else 'added to'} {entity_name}"
@@ -1557,6 +1566,7 @@ class EntityService:
         # Remove secondary from cache
         if secondary_id in self._entity_cache:
             del self._entity_cache[secondary_id]
+        get_mcp_context_provider().invalidate_entity()
 
         logger.info(
             f"Entities merged: {secondary_id} -> {primary_entity_id}",
@@ -63,6 +63,7 @@ from app.services.cost_alert_service import get_cost_alert_service
 from app.services.carrier_extractor import extract_carrier
 from app.core.database import get_db_session
 from app.services.camera_task_manager import CameraTaskManager
+from app.services.cluster_service import get_cluster_service
 
 if TYPE_CHECKING:
     from app.services.mqtt_service import MQTTService
@@ -219,6 +220,7 @@ class EventProcessor:
 
         # CameraTaskManager owns per-camera monitoring tasks, stats, cooldowns, recovery, and health monitor
         self.camera_task_manager: Optional[CameraTaskManager] = None
+        self._follows_rebalance = False
 
         # Services (can be injected for better testability and architecture)
         self.ai_service: Optional[AIService] = ai_service
@@ -310,6 +312,7 @@ class EventProcessor:
                 vehicle_embedding_service=_get_container().vehicle_embedding_service,
                 entity_service=_get_container().entity_service,
                 ai_semaphore=self.ai_worker_pool.ai_semaphore if self.ai_worker_pool else None,
+                store_event=self._store_event_with_retry,
             )
 
             self.ai_worker_pool = AIWorkerPool(
@@ -328,20 +331,17 @@ class EventProcessor:
         # Note: This will be called from FastAPI lifespan after camera service is initialized
         # For now, we'll load cameras from database
         try:
-            with get_db_session() as db:
-                enabled_cameras = db.query(Camera).filter(
-                    Camera.is_enabled == True,
-                    Camera.motion_enabled == True
-                ).all()
-
-                for camera in enabled_cameras:
-                    await self.start_camera_monitoring(camera)
+            stats = await self.reconcile_camera_monitoring()
+            logger.info(f"Started monitoring {stats['started']} enabled cameras")
 
-                logger.info(f"Started monitoring {len(enabled_cameras)} enabled cameras")
+            # Cluster mode: follow cameras as they move between replicas
+            if not self._follows_rebalance:
+                get_cluster_service().on_rebalance(self.reconcile_camera_monitoring)
+                self._follows_rebalance = True
 
-                # Start the camera health monitor for self-healing (now owned by CameraTaskManager)
-                if self.camera_task_manager:
-                    self.camera_task_manager.start_health_monitor()
+            # Start the camera health monitor for self-healing (now owned by CameraTaskManager)
+            if self.camera_task_manager:
+                self.camera_task_manager.start_health_monitor()
         except Exception as e:
             logger.error(f"Failed to load enabled cameras: {e}", exc_info=True)
 
@@ -405,11 +405,57 @@ class EventProcessor:
 
         logger.info("EventProcessor stopped")
 
+    @staticmethod
+    def _monitors_camera(camera: Camera) -> bool:
+        """
+        Whether motion detection for a camera runs on this replica.
+
+        The motion loop reads frames from the local capture worker, so it runs
+        where the worker runs: on the camera's owner in cluster mode (USB
+        devices stay on their host). Elsewhere the worker is never alive and
+        the loop would keep asking the owner to restart a healthy camera.
+        """
+        return camera.type == "usb" or get_cluster_service().owns("camera", str(camera.id))
+
+    async def reconcile_camera_monitoring(self) -> Dict[str, int]:
+        """
+        Monitor the enabled cameras this replica owns and stop the rest.
+
+        Called at startup and after each cluster rebalance.
+
+        Returns:
+            Counts of started and stopped motion tasks
+        """
+        stats = {"started": 0, "stopped": 0}
+        if not self.camera_task_manager:
+            return stats
+
+        with get_db_session() as db:
+            cameras = db.query(Camera).filter(
+                Camera.is_enabled == True,
+                Camera.motion_enabled == True
+            ).all()
+            for camera in cameras:
+                db.expunge(camera)
+
+        owned = {str(camera.id): camera for camera in cameras if self._monitors_camera(camera)}
+        for camera_id in self.camera_task_manager.get_monitored_cameras():
+            if str(camera_id) not in owned:
+                await self.camera_task_manager.stop_monitoring(camera_id)
+                stats["stopped"] += 1
+        for camera_id, camera in owned.items():
+            if not self.camera_task_manager.is_monitoring(camera_id):
+                await self.camera_task_manager.start_monitoring(camera)
+                stats["started"] += 1
+        return stats
+
     async def start_camera_monitoring(self, camera: Camera):
         """
         Start motion detection task for a specific camera (delegated to CameraTaskManager).
+
+        Skipped for cameras another replica owns in cluster mode.
         """
-        if self.camera_task_manager:
+        if self.camera_task_manager and self._monitors_camera(camera):
             await self.camera_task_manager.start_monitoring(camera)
 
     async def stop_camera_monitoring(self, camera_id: str):
@@ -987,8 +1033,13 @@ class EventProcessor:
                         bounding_boxes=bounding_boxes_json,
                     )
 
-                    db.add(event)
-                    db.commit()
+                    writer = _get_container().database_writer
+                    if writer.is_running:
+                        # Group-committed with concurrent writes on SQLite
+                        await writer.run(lambda session: session.add(event))
+                    else:
+                        db.add(event)
+                        db.commit()
 
                     logger.info(
                         f"Event {event_id} stored successfully",
@@ -92,6 +92,11 @@ class FaceDetectionService:
     TARGET_SIZE = (160, 160)  # Standard face recognition input size
     DEFAULT_PADDING = 0.2  # 20% padding around face
 
+    # SSD input preprocessing (also used by the fused DetectionService)
+    INPUT_SIZE = (300, 300)
+    INPUT_SCALE = 1.0
+    INPUT_MEAN = (104.0, 177.0, 123.0)
+
     # Model paths (relative to this file or absolute)
     MODEL_DIR = os.path.join(os.path.dirname(__file__), "..", "models", "opencv_face")
     PROTOTXT_FILE = "deploy.prototxt"
@@ -209,34 +214,53 @@ class FaceDetectionService:
         Returns:
             List of FaceDetection objects
         """
-        if confidence_threshold is None:
-            confidence_threshold = self.CONFIDENCE_THRESHOLD
-
-        (h, w) = image.shape[:2]
-
         # Create blob from image (resize to 300x300 for SSD)
         blob = cv2.dnn.blobFromImage(
-            cv2.resize(image, (300, 300)),
-            1.0,
-            (300, 300),
-            (104.0, 177.0, 123.0)
+            cv2.resize(image, self.INPUT_SIZE),
+            self.INPUT_SCALE,
+            self.INPUT_SIZE,
+            self.INPUT_MEAN
         )
 
         # Run inference
         self._net.setInput(blob)
         detections = self._net.forward()
 
+        return self.parse_detections(detections[0, 0], image.shape, confidence_threshold)
+
+    def parse_detections(
+        self,
+        rows: np.ndarray,
+        image_shape: tuple,
+        confidence_threshold: Optional[float] = None
+    ) -> list[FaceDetection]:
+        """
+        Convert SSD output rows into FaceDetection objects.
+
+        Args:
+            rows: Detection rows of shape (N, 7): image id, class id,
+                confidence, x1, y1, x2, y2 (relative coordinates)
+            image_shape: Shape of the original image (h, w, ...)
+            confidence_threshold: Minimum confidence (uses default if None)
+
+        Returns:
+            List of FaceDetection objects
+        """
+        if confidence_threshold is None:
+            confidence_threshold = self.CONFIDENCE_THRESHOLD
+
+        (h, w) = image_shape[:2]
         faces = []
 
         # Process detections
-        for i in range(0, detections.shape[2]):
-            confidence = detections[0, 0, i, 2]
+        for row in rows:
+            confidence = row[2]
 
             if confidence < confidence_threshold:
                 continue
 
             # Get bounding box (scaled to original image size)
-            box = detections[0, 0, i, 3:7] * np.array([w, h, w, h])
+            box = row[3:7] * np.array([w, h, w, h])
             (x1, y1, x2, y2) = box.astype("int")
 
             # Ensure coordinates are within image bounds
@@ -254,7 +278,7 @@ class FaceDetectionService:
                 continue
 
             faces.append(FaceDetection(
-                bbox=BoundingBox(x=x1, y=y1, width=width, height=height),
+                bbox=BoundingBox(x=int(x1), y=int(y1), width=int(width), height=int(height)),
                 confidence=float(confidence)
             ))
 
@@ -387,6 +411,10 @@ class FaceDetectionService:
 
         return face_bytes
 
+    def crop_face(self, image: np.ndarray, bbox: BoundingBox) -> bytes:
+        """Crop a face from an already decoded image (JPEG bytes, default padding/size)."""
+        return self._extract_face_sync(image, bbox)
+
     def is_model_loaded(self) -> bool:
         """Check if the face detection model is loaded."""
         return self._model_loaded
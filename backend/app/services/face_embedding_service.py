@@ -22,7 +22,7 @@ import asyncio
 import json
 import logging
 from app.core.decorators import singleton
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 from sqlalchemy.orm import Session
 
@@ -34,6 +34,9 @@ from app.services.face_detection_service import (
 )
 from app.services.embedding_service import EmbeddingService, get_embedding_service
 
+if TYPE_CHECKING:
+    from app.services.detection_service import FrameDetections
+
 logger = logging.getLogger(__name__)
 
 
@@ -81,6 +84,7 @@ class FaceEmbeddingService:
         event_id: str,
         thumbnail_bytes: bytes,
         confidence_threshold: Optional[float] = None,
+        detections: Optional["FrameDetections"] = None,
     ) -> list[str]:
         """
         Detect faces, generate embeddings, and store them.
@@ -90,10 +94,90 @@ class FaceEmbeddingService:
             event_id: UUID of the event
             thumbnail_bytes: Raw thumbnail image bytes
             confidence_threshold: Optional confidence threshold for face detection
+            detections: Result of a fused DetectionService pass over the
+                thumbnail; when given, detection and decoding are skipped
 
         Returns:
             List of created FaceEmbedding IDs
 
+        Raises:
+            ValueError: If thumbnail_bytes is empty
+        """
+        face_embeddings = await self.build_event_face_embeddings(
+            event_id, thumbnail_bytes,
+            confidence_threshold=confidence_threshold, detections=detections,
+        )
+        if not face_embeddings:
+            return []
+
+        face_embedding_ids = []
+
+        for i, face_embedding in enumerate(face_embeddings):
+            try:
+                db.add(face_embedding)
+                db.commit()
+                db.refresh(face_embedding)
+
+                face_embedding_ids.append(face_embedding.id)
+
+                logger.debug(
+                    f"Stored face embedding {i+1}/{len(face_embeddings)}",
+                    extra={
+                        "event_type": "face_embedding_stored",
+                        "event_id": event_id,
+                        "face_embedding_id": face_embedding.id,
+                        "confidence": face_embedding.confidence,
+                    }
+                )
+
+            except Exception as e:
+                logger.error(
+                    f"Failed to store face {i+1}/{len(face_embeddings)}: {e}",
+                    exc_info=True,
+                    extra={
+                        "event_type": "face_embedding_error",
+                        "event_id": event_id,
+                        "face_index": i,
+                        "error": str(e),
+                    }
+                )
+                # Continue storing remaining faces
+
+        logger.info(
+            f"Processed {len(face_embedding_ids)}/{len(face_embeddings)} face embeddings for event",
+            extra={
+                "event_type": "face_embeddings_complete",
+                "event_id": event_id,
+                "success_count": len(face_embedding_ids),
+                "total_faces": len(face_embeddings),
+            }
+        )
+
+        return face_embedding_ids
+
+    async def build_event_face_embeddings(
+        self,
+        event_id: str,
+        thumbnail_bytes: bytes,
+        confidence_threshold: Optional[float] = None,
+        detections: Optional["FrameDetections"] = None,
+    ) -> list[FaceEmbedding]:
+        """
+        Detect faces and generate their embeddings without touching the database.
+
+        Lets callers that own the transaction (e.g. the post-processing unit
+        of work) run inference first and store the rows in one write.
+
+        Args:
+            event_id: UUID of the event
+            thumbnail_bytes: Raw thumbnail image bytes
+            confidence_threshold: Optional confidence threshold for face detection
+            detections: Result of a fused DetectionService pass over the
+                thumbnail; when given, detection and decoding are skipped
+
+        Returns:
+            Unsaved FaceEmbedding rows, one per face that could be embedded
+
         Raises:
             ValueError: If thumbnail_bytes is empty
         """
@@ -101,10 +185,13 @@ class FaceEmbeddingService:
             raise ValueError("thumbnail_bytes cannot be empty")
 
         # Step 1: Detect faces
-        faces = await self._face_detector.detect_faces(
-            thumbnail_bytes,
-            confidence_threshold=confidence_threshold
-        )
+        if detections is not None:
+            faces = detections.faces
+        else:
+            faces = await self._face_detector.detect_faces(
+                thumbnail_bytes,
+                confidence_threshold=confidence_threshold
+            )
 
         if not faces:
             logger.debug(
@@ -123,46 +210,32 @@ class FaceEmbeddingService:
             }
         )
 
-        # Step 2: Process each face
-        face_embedding_ids = []
+        # Step 2: Embed each face
+        face_embeddings = []
 
         for i, face in enumerate(faces):
             try:
                 # Extract face region
-                face_bytes = await self._face_detector.extract_face_region(
-                    thumbnail_bytes,
-                    face.bbox
-                )
+                if detections is not None:
+                    face_bytes = self._face_detector.crop_face(detections.image, face.bbox)
+                else:
+                    face_bytes = await self._face_detector.extract_face_region(
+                        thumbnail_bytes,
+                        face.bbox
+                    )
 
                 # Generate embedding using CLIP on the cropped face
                 embedding_vector = await self._embedding_service.generate_embedding(
                     face_bytes
                 )
 
-                # Store face embedding
-                face_embedding = FaceEmbedding(
+                face_embeddings.append(FaceEmbedding(
                     event_id=event_id,
                     embedding=json.dumps(embedding_vector),
                     bounding_box=json.dumps(face.bbox.to_dict()),
                     confidence=face.confidence,
                     model_version=self.MODEL_VERSION,
-                )
-
-                db.add(face_embedding)
-                db.commit()
-                db.refresh(face_embedding)
-
-                face_embedding_ids.append(face_embedding.id)
-
-                logger.debug(
-                    f"Stored face embedding {i+1}/{len(faces)}",
-                    extra={
-                        "event_type": "face_embedding_stored",
-                        "event_id": event_id,
-                        "face_embedding_id": face_embedding.id,
-                        "confidence": face.confidence,
-                    }
-                )
+                ))
 
             except Exception as e:
                 logger.error(
@@ -177,17 +250,7 @@ class FaceEmbeddingService:
                 )
                 # Continue processing remaining faces
 
-        logger.info(
-            f"Processed {len(face_embedding_ids)}/{len(faces)} face embeddings for event",
-            extra={
-                "event_type": "face_embeddings_complete",
-                "event_id": event_id,
-                "success_count": len(face_embedding_ids),
-                "total_faces": len(faces),
-            }
-        )
-
-        return face_embedding_ids
+        return face_embeddings
 
     async def get_face_embeddings(
         self,
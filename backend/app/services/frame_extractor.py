@@ -157,6 +157,15 @@ class FrameExtractor:
         img.save(buffer, format='JPEG', quality=self.jpeg_quality)
         return buffer.getvalue()
 
+    def _to_extracted_frame(
+        self,
+        frame_index: int,
+        frame: "av.VideoFrame"
+    ) -> Tuple[int, float, np.ndarray, bytes]:
+        """Convert a decoded frame to (frame_index, quality_score, rgb_array, jpeg_bytes)."""
+        img_array = frame.to_ndarray(format='rgb24')
+        return frame_index, self._get_frame_quality_score(img_array), img_array, self._encode_frame(img_array)
+
     def _get_frame_quality_score(self, frame: np.ndarray) -> float:
         """
         Calculate quality score for a frame using Laplacian variance.
@@ -1047,18 +1056,19 @@ class FrameExtractor:
                 # Extract frames at calculated indices
                 # Store as tuples: (frame_index, quality_score, rgb_array, jpeg_bytes)
                 extracted_frames: List[Tuple[int, float, np.ndarray, bytes]] = []
+                # Adaptive candidates stay as decoded frames; only the selected
+                # ones are converted to full-size RGB and JPEG-encoded
+                candidate_frames: List[Tuple[int, "av.VideoFrame"]] = []
+                adaptive = sampling_strategy in ["adaptive", "hybrid"]
                 current_frame_index = 0
                 indices_set = set(indices)
 
                 for frame in container.decode(video=0):
                     if current_frame_index in indices_set:
-                        img_array = frame.to_ndarray(format='rgb24')
-                        quality_score = self._get_frame_quality_score(img_array)
-                        jpeg_bytes = self._encode_frame(img_array)
-
-                        extracted_frames.append(
-                            (current_frame_index, quality_score, img_array, jpeg_bytes)
-                        )
+                        if adaptive:
+                            candidate_frames.append((current_frame_index, frame))
+                        else:
+                            extracted_frames.append(self._to_extracted_frame(current_frame_index, frame))
 
                         indices_set.remove(current_frame_index)
                         if not indices_set:
@@ -1067,36 +1077,31 @@ class FrameExtractor:
                     current_frame_index += 1
 
                 # Story P8-2.4: Apply adaptive sampling if enabled
-                if sampling_strategy in ["adaptive", "hybrid"] and len(extracted_frames) > frame_count:
-                    from app.services.adaptive_sampler import get_adaptive_sampler
+                if adaptive and len(candidate_frames) > frame_count:
+                    from app.services.adaptive_sampler import get_adaptive_sampler, thumbnail_size
 
                     adaptive_sampler = get_adaptive_sampler()
 
-                    # Prepare frames and timestamps for adaptive selection
-                    candidate_frames = [f[2] for f in extracted_frames]  # rgb arrays
-                    candidate_timestamps_ms = [f[0] * (1000.0 / fps) for f in extracted_frames]
+                    # The sampler only needs small grayscale thumbnails; let the
+                    # decoder's scaler produce them instead of full RGB frames
+                    thumbnails = []
+                    for _, frame in candidate_frames:
+                        width, height = thumbnail_size(frame.width, frame.height)
+                        thumbnails.append(frame.to_ndarray(width=width, height=height, format='gray'))
+                    candidate_timestamps_ms = [idx * (1000.0 / fps) for idx, _ in candidate_frames]
 
                     # Select diverse frames
                     selected = await adaptive_sampler.select_diverse_frames(
-                        frames=candidate_frames,
+                        frames=thumbnails,
                         timestamps_ms=candidate_timestamps_ms,
                         target_count=frame_count,
                         fps=fps
                     )
 
-                    # Build final frames list from selection
-                    # Map selected indices back to extracted_frames
-                    selected_indices = set()
-                    final_extracted = []
-                    for idx, _, ts_ms in selected:
-                        # Find the extracted frame with matching original index
-                        for ef in extracted_frames:
-                            ef_ts_ms = ef[0] * (1000.0 / fps)
-                            if abs(ef_ts_ms - ts_ms) < 1.0:  # Within 1ms tolerance
-                                final_extracted.append(ef)
-                                break
-
-                    extracted_frames = final_extracted
+                    extracted_frames = [
+                        self._to_extracted_frame(*candidate_frames[idx])
+                        for idx, _, _ in selected
+                    ]
 
                     logger.info(
                         f"Adaptive sampling selected {len(extracted_frames)} diverse frames from {len(candidate_frames)} candidates",
@@ -1107,6 +1112,10 @@ class FrameExtractor:
                             "sampling_strategy": sampling_strategy
                         }
                     )
+                elif adaptive:
+                    extracted_frames = [
+                        self._to_extracted_frame(idx, frame) for idx, frame in candidate_frames
+                    ]
 
                 # Apply blur filtering if enabled
                 if filter_blur:
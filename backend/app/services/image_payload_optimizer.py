@@ -0,0 +1,448 @@
+"""
+Per-provider image payloads for vision requests.
+
+Every frame used to be resized to 2048px with PIL LANCZOS and encoded at JPEG
+quality 85, whichever provider received it. Providers bill images by their
+own rules and downscale large images server-side anyway, so most of those
+bytes were uploaded only to be thrown away, and up to 20 of them went out
+with each multi-frame request.
+
+``ImagePayloadOptimizer`` prepares a frame once per request (``ImagePayload``)
+and encodes it per provider:
+
+- Target size comes from the provider's image rules (``PROVIDER_IMAGE_RULES``).
+  The frame is never sent larger than the size the provider would scale it
+  to. For tiled providers, the image shrinks to the next tile boundary when
+  that costs at most ``AI_IMAGE_TILE_SNAP_TOLERANCE`` of its scale.
+  ``AI_IMAGE_MAX_TOKENS_PER_IMAGE`` caps the estimated tokens per image.
+- With ``AI_IMAGE_ROI_CROP_ENABLED`` (off by default) and motion boxes, the
+  frame is cropped to their union plus ``AI_IMAGE_ROI_PADDING`` context.
+  Boxes the model returns are mapped back to full-frame coordinates. Only
+  RTSP/USB motion events carry boxes; Protect events are never cropped.
+- Resizing uses ``cv2.resize(INTER_AREA)`` and ``cv2.imencode`` on the BGR
+  array, with no PIL round-trip.
+- Encoded variants are memoized on the payload by target size, so retries,
+  fallbacks and hedged requests to providers with the same target reuse one
+  encoding.
+
+Token counts are estimates from the published rules. They are reported with
+bytes per request through Prometheus and ``get_stats()``.
+"""
+import base64
+import logging
+import math
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import cv2
+import numpy as np
+
+from app.core.config import settings
+from app.core.decorators import singleton
+
+logger = logging.getLogger(__name__)
+
+# Payloads above this are re-encoded at FALLBACK_JPEG_QUALITY
+MAX_IMAGE_BYTES = 5 * 1024 * 1024
+FALLBACK_JPEG_QUALITY = 70
+# Smallest short edge a budget or tile snap may shrink an image to
+MIN_SHORT_EDGE = 256
+
+
+@dataclass(frozen=True)
+class ImageTokenRules:
+    """
+    How a provider sizes and bills an image.
+
+    Attributes:
+        max_long_edge: Long edge the provider scales images down to
+        max_short_edge: Short edge the provider scales images down to (None = no limit)
+        max_pixels: Pixel count the provider scales images down to (None = no limit)
+        tile_size: Edge of the square tiles images are billed by (None = billed by area)
+        tokens_per_tile: Tokens per tile
+        base_tokens: Tokens added to every image
+        small_image_edge: Images within this edge cost only base_tokens
+        pixels_per_token: Pixels per token for area-billed providers
+    """
+    max_long_edge: int
+    max_short_edge: Optional[int] = None
+    max_pixels: Optional[int] = None
+    tile_size: Optional[int] = None
+    tokens_per_tile: int = 0
+    base_tokens: int = 0
+    small_image_edge: Optional[int] = None
+    pixels_per_token: Optional[float] = None
+
+    def fit_scale(self, width: int, height: int) -> float:
+        """Scale (<= 1) at which the provider would process the image."""
+        scale = min(1.0, self.max_long_edge / max(width, height))
+        if self.max_short_edge:
+            scale = min(scale, self.max_short_edge / min(width, height))
+        if self.max_pixels:
+            scale = min(scale, math.sqrt(self.max_pixels / (width * height)))
+        return scale
+
+    def estimate_tokens(self, width: int, height: int) -> int:
+        """Estimated input tokens for an image of this size."""
+        scale = self.fit_scale(width, height)
+        width, height = max(1, int(width * scale)), max(1, int(height * scale))
+        if self.small_image_edge and width <= self.small_image_edge and height <= self.small_image_edge:
+            return self.base_tokens
+        if self.tile_size:
+            tiles = math.ceil(width / self.tile_size) * math.ceil(height / self.tile_size)
+            return self.base_tokens + tiles * self.tokens_per_tile
+        if self.pixels_per_token:
+            return self.base_tokens + math.ceil(width * height / self.pixels_per_token)
+        return self.base_tokens
+
+
+# Published image rules per provider (high-detail mode where there is a choice)
+PROVIDER_IMAGE_RULES: Dict[str, ImageTokenRules] = {
+    # Fit in 2048x2048, short side to 768, then 512px tiles
+    "openai": ImageTokenRules(
+        max_long_edge=2048, max_short_edge=768, tile_size=512, tokens_per_tile=170, base_tokens=85,
+    ),
+    # 448px tiles plus one tile's worth of overhead
+    "grok": ImageTokenRules(
+        max_long_edge=2048, tile_size=448, tokens_per_tile=256, base_tokens=256,
+    ),
+    # Long edge 1568 / ~1.15 megapixels, about 750 pixels per token
+    "claude": ImageTokenRules(max_long_edge=1568, max_pixels=1_150_000, pixels_per_token=750),
+    # Up to 384x384 is 258 tokens, larger images are cut into 768px tiles
+    "gemini": ImageTokenRules(
+        max_long_edge=3072, tile_size=768, tokens_per_tile=258, base_tokens=0, small_image_edge=384,
+    ),
+}
+
+# Providers without rules (LiteLLM path, stand-ins) get the previous 2048px cap
+DEFAULT_IMAGE_RULES = ImageTokenRules(
+    max_long_edge=2048, tile_size=512, tokens_per_tile=170, base_tokens=85,
+)
+
+
+@dataclass
+class EncodedImage:
+    """One encoded variant of a payload."""
+    base64: str
+    width: int
+    height: int
+    size_bytes: int
+    estimated_tokens: int
+    quality: int
+
+
+@dataclass
+class ImagePayload:
+    """
+    A source frame prepared for one request, with its encoded variants.
+
+    Attributes:
+        frame: BGR image, already cropped to the region of interest
+        source_size: (width, height) of the frame before cropping
+        crop: (x, y, width, height) of the crop in the source frame, None if uncropped
+    """
+    frame: np.ndarray
+    source_size: Tuple[int, int]
+    crop: Optional[Tuple[int, int, int, int]] = None
+    optimizer: Optional["ImagePayloadOptimizer"] = field(default=None, repr=False)
+    _variants: Dict[Tuple[int, int], EncodedImage] = field(default_factory=dict, repr=False)
+
+    def for_provider(self, provider: Optional[str]) -> EncodedImage:
+        """Encoded image sized for a provider (memoized by target size)."""
+        optimizer = self.optimizer or get_image_payload_optimizer()
+        height, width = self.frame.shape[:2]
+        rules = optimizer.rules_for(provider)
+        target = optimizer.target_size(rules, width, height)
+        variant = self._variants.get(target)
+        if variant is not None:
+            optimizer._count_encode(reused=True)
+            return variant
+
+        resized = self.frame
+        if target != (width, height):
+            resized = cv2.resize(self.frame, target, interpolation=cv2.INTER_AREA)
+        quality = optimizer.jpeg_quality
+        ok, buffer = cv2.imencode(".jpg", resized, [cv2.IMWRITE_JPEG_QUALITY, quality])
+        if ok and len(buffer) > MAX_IMAGE_BYTES:
+            logger.warning(f"Image too large ({len(buffer) / 1024 / 1024:.2f}MB), re-encoding at {FALLBACK_JPEG_QUALITY}% quality")
+            quality = FALLBACK_JPEG_QUALITY
+            ok, buffer = cv2.imencode(".jpg", resized, [cv2.IMWRITE_JPEG_QUALITY, quality])
+        if not ok:
+            raise ValueError("JPEG encoding failed")
+
+        jpeg_bytes = buffer.tobytes()
+        variant = EncodedImage(
+            base64=base64.b64encode(jpeg_bytes).decode("utf-8"),
+            width=target[0],
+            height=target[1],
+            size_bytes=len(jpeg_bytes),
+            estimated_tokens=rules.estimate_tokens(*target),
+            quality=quality,
+        )
+        self._variants[target] = variant
+        optimizer._count_encode(reused=False)
+        return variant
+
+    def map_boxes(self, boxes: Optional[List[Dict[str, Any]]]) -> Optional[List[Dict[str, Any]]]:
+        """Convert normalized boxes on the cropped image to normalized full-frame boxes."""
+        if not boxes or self.crop is None:
+            return boxes
+        crop_x, crop_y, crop_w, crop_h = self.crop
+        source_w, source_h = self.source_size
+        mapped = []
+        for box in boxes:
+            mapped.append({
+                **box,
+                "x": (crop_x + box.get("x", 0) * crop_w) / source_w,
+                "y": (crop_y + box.get("y", 0) * crop_h) / source_h,
+                "width": box.get("width", 0) * crop_w / source_w,
+                "height": box.get("height", 0) * crop_h / source_h,
+            })
+        return mapped
+
+
+@singleton
+class ImagePayloadOptimizer:
+    """
+    Builds provider-sized image payloads and accounts for what was sent.
+
+    Attributes:
+        enabled: Use provider rules (False = previous 2048px cap for every provider)
+        crop_enabled: Crop to the union of motion/detection boxes
+        roi_padding: Context added around the boxes, as a fraction of their size per side
+        min_crop_fraction: Smallest crop, as a fraction of each frame dimension
+        snap_tolerance: Largest downscale accepted to drop a row/column of tiles
+        max_tokens_per_image: Estimated token cap per image (0 = none)
+        jpeg_quality: JPEG quality for encoded images
+    """
+
+    def __init__(
+        self,
+        enabled: Optional[bool] = None,
+        crop_enabled: Optional[bool] = None,
+        roi_padding: Optional[float] = None,
+        snap_tolerance: Optional[float] = None,
+        max_tokens_per_image: Optional[int] = None,
+        jpeg_quality: Optional[int] = None,
+    ):
+        self.enabled = settings.AI_IMAGE_OPTIMIZATION_ENABLED if enabled is None else enabled
+        self.crop_enabled = settings.AI_IMAGE_ROI_CROP_ENABLED if crop_enabled is None else crop_enabled
+        self.roi_padding = settings.AI_IMAGE_ROI_PADDING if roi_padding is None else roi_padding
+        self.min_crop_fraction = 0.4
+        self.snap_tolerance = (
+            settings.AI_IMAGE_TILE_SNAP_TOLERANCE if snap_tolerance is None else snap_tolerance
+        )
+        self.max_tokens_per_image = (
+            settings.AI_IMAGE_MAX_TOKENS_PER_IMAGE if max_tokens_per_image is None else max_tokens_per_image
+        )
+        self.jpeg_quality = settings.AI_IMAGE_JPEG_QUALITY if jpeg_quality is None else jpeg_quality
+        self._lock = threading.Lock()
+        self._encodes = 0
+        self._reuses = 0
+        self._crops = 0
+        self._by_provider: Dict[str, Dict[str, int]] = {}
+
+    # ------------------------------------------------------------------
+    # Payload preparation
+    # ------------------------------------------------------------------
+
+    def prepare(
+        self,
+        frame: np.ndarray,
+        regions: Optional[Sequence[Sequence[float]]] = None,
+    ) -> ImagePayload:
+        """
+        Prepare a BGR frame for a request.
+
+        Args:
+            frame: BGR (or grayscale) image
+            regions: (x, y, width, height) pixel boxes of motion or detections
+
+        Returns:
+            ImagePayload, cropped to the padded union of the regions when that
+            removes a meaningful part of the frame
+        """
+        if frame.ndim == 2:
+            frame = cv2.cvtColor(frame, cv2.COLOR_GRAY2BGR)
+        elif frame.shape[2] == 4:
+            frame = cv2.cvtColor(frame, cv2.COLOR_BGRA2BGR)
+        height, width = frame.shape[:2]
+        crop = self._crop_box(width, height, regions) if self.crop_enabled and regions else None
+        if crop is None:
+            return ImagePayload(frame=frame, source_size=(width, height), optimizer=self)
+        x, y, crop_w, crop_h = crop
+        with self._lock:
+            self._crops += 1
+        return ImagePayload(
+            frame=frame[y:y + crop_h, x:x + crop_w],
+            source_size=(width, height),
+            crop=crop,
+            optimizer=self,
+        )
+
+    def prepare_bytes(self, image_bytes: bytes) -> ImagePayload:
+        """Prepare an encoded image (e.g. a JPEG from FrameExtractor)."""
+        frame = cv2.imdecode(np.frombuffer(image_bytes, dtype=np.uint8), cv2.IMREAD_COLOR)
+        if frame is None:
+            raise ValueError("Could not decode image bytes")
+        return self.prepare(frame)
+
+    def _crop_box(
+        self,
+        width: int,
+        height: int,
+        regions: Sequence[Sequence[float]],
+    ) -> Optional[Tuple[int, int, int, int]]:
+        boxes = [r for r in regions if r is not None and len(r) == 4 and r[2] > 0 and r[3] > 0]
+        if not boxes:
+            return None
+        left = min(r[0] for r in boxes)
+        top = min(r[1] for r in boxes)
+        right = max(r[0] + r[2] for r in boxes)
+        bottom = max(r[1] + r[3] for r in boxes)
+
+        # Pad for context, then grow to the minimum crop size around the centre
+        pad_x = (right - left) * self.roi_padding
+        pad_y = (bottom - top) * self.roi_padding
+        crop_w = min(width, max(right - left + 2 * pad_x, width * self.min_crop_fraction))
+        crop_h = min(height, max(bottom - top + 2 * pad_y, height * self.min_crop_fraction))
+        centre_x, centre_y = (left + right) / 2, (top + bottom) / 2
+        x = int(min(max(centre_x - crop_w / 2, 0), width - crop_w))
+        y = int(min(max(centre_y - crop_h / 2, 0), height - crop_h))
+        crop_w, crop_h = int(crop_w), int(crop_h)
+
+        # Not worth losing context for a small saving
+        if crop_w * crop_h > 0.7 * width * height:
+            return None
+        return x, y, crop_w, crop_h
+
+    # ------------------------------------------------------------------
+    # Sizing
+    # ------------------------------------------------------------------
+
+    def rules_for(self, provider: Optional[str]) -> ImageTokenRules:
+        if not self.enabled or provider is None:
+            return DEFAULT_IMAGE_RULES
+        return PROVIDER_IMAGE_RULES.get(provider, DEFAULT_IMAGE_RULES)
+
+    def target_size(self, rules: ImageTokenRules, width: int, height: int) -> Tuple[int, int]:
+        """
+        Size to send an image at.
+
+        Starts from the size the provider would scale the image to. Smaller
+        scales are tried at tile boundaries (within snap_tolerance) and, with a
+        token cap, until the estimate fits; the largest scale with the fewest
+        tokens wins.
+        """
+        fit = rules.fit_scale(width, height)
+        if not self.enabled:
+            return self._scaled(width, height, fit)
+
+        floor = min(fit, max(MIN_SHORT_EDGE / min(width, height), 0.0))
+        candidates = {fit}
+        if rules.tile_size:
+            for edge in (width, height):
+                tiles = math.ceil(edge * fit / rules.tile_size)
+                for count in range(tiles - 1, 0, -1):
+                    scale = count * rules.tile_size / edge
+                    if scale < floor:
+                        break
+                    candidates.add(scale)
+        if self.max_tokens_per_image > 0:
+            step = fit
+            while step > floor:
+                step *= 0.9
+                candidates.add(max(step, floor))
+
+        def tokens(scale: float) -> int:
+            return rules.estimate_tokens(*self._scaled(width, height, scale))
+
+        within_tolerance = [s for s in candidates if s >= fit * (1 - self.snap_tolerance)]
+        best = min(within_tolerance, key=lambda s: (tokens(s), -s))
+        if self.max_tokens_per_image > 0 and tokens(best) > self.max_tokens_per_image:
+            fitting = [s for s in candidates if tokens(s) <= self.max_tokens_per_image]
+            best = max(fitting) if fitting else min(candidates)
+        return self._scaled(width, height, best)
+
+    @staticmethod
+    def _scaled(width: int, height: int, scale: float) -> Tuple[int, int]:
+        if scale >= 1.0:
+            return width, height
+        return max(1, int(width * scale)), max(1, int(height * scale))
+
+    # ------------------------------------------------------------------
+    # Accounting
+    # ------------------------------------------------------------------
+
+    def _count_encode(self, reused: bool) -> None:
+        from app.core import metrics as prom
+
+        with self._lock:
+            if reused:
+                self._reuses += 1
+            else:
+                self._encodes += 1
+        prom.ai_image_encodes_total.labels(result="reused" if reused else "encoded").inc()
+
+    def record_request(self, provider: str, images: Sequence[EncodedImage], analysis_mode: str) -> None:
+        """Account for the images sent in one provider request."""
+        from app.core import metrics as prom
+
+        size_bytes = sum(image.size_bytes for image in images)
+        tokens = sum(image.estimated_tokens for image in images)
+        with self._lock:
+            counters = self._by_provider.get(provider)
+            if counters is None:
+                counters = {"requests": 0, "images": 0, "bytes": 0, "estimated_tokens": 0}
+                self._by_provider[provider] = counters
+            counters["requests"] += 1
+            counters["images"] += len(images)
+            counters["bytes"] += size_bytes
+            counters["estimated_tokens"] += tokens
+        prom.ai_image_payload_bytes_total.labels(provider=provider).inc(size_bytes)
+        prom.ai_image_payload_tokens_total.labels(provider=provider).inc(tokens)
+        logger.debug(
+            f"Sending {len(images)} image(s) to {provider}: {size_bytes} bytes, ~{tokens} image tokens",
+            extra={
+                "event_type": "ai_image_payload",
+                "provider": provider,
+                "analysis_mode": analysis_mode,
+                "image_count": len(images),
+                "payload_bytes": size_bytes,
+                "estimated_image_tokens": tokens,
+                "sizes": [f"{image.width}x{image.height}" for image in images[:3]],
+            }
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Bytes and estimated image tokens sent per provider, and encode reuse."""
+        with self._lock:
+            by_provider = {}
+            for provider, counters in self._by_provider.items():
+                requests = counters["requests"]
+                by_provider[provider] = {
+                    **counters,
+                    "bytes_per_request": round(counters["bytes"] / requests) if requests else 0,
+                    "estimated_tokens_per_request": (
+                        round(counters["estimated_tokens"] / requests) if requests else 0
+                    ),
+                }
+            return {
+                "enabled": self.enabled,
+                "crop_enabled": self.crop_enabled,
+                "encodes": self._encodes,
+                "reused_encodes": self._reuses,
+                "cropped_frames": self._crops,
+                "by_provider": by_provider,
+            }
+
+
+def get_image_payload_optimizer() -> ImagePayloadOptimizer:
+    """Get the global ImagePayloadOptimizer instance."""
+    return ImagePayloadOptimizer()
+
+
+def reset_image_payload_optimizer() -> None:
+    """Reset the global ImagePayloadOptimizer instance (for testing)."""
+    ImagePayloadOptimizer._reset_instance()
@@ -0,0 +1,268 @@
+"""
+Shared JPEG Cache
+
+Size-bounded LRU of encoded JPEGs behind the binary camera preview and event
+thumbnail endpoints. Entries are keyed by (source, version, size) tuples -
+for live previews that is (camera_id, frame_sequence, width) - so every
+viewer polling the same frame shares one encode. Concurrent misses for the
+same key wait on a single in-flight encode instead of encoding in parallel.
+
+Also provides the conditional-GET helpers (ETag / Last-Modified / 304) used
+by those endpoints.
+"""
+
+import asyncio
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from fastapi import Request, Response
+
+from app.core.decorators import singleton
+
+logger = logging.getLogger(__name__)
+
+# Enough for a few hundred 640px previews (~40-80 KB each)
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+CacheKey = Tuple[Hashable, ...]
+
+
+@dataclass(frozen=True)
+class CachedJPEG:
+    """An encoded JPEG plus its HTTP validators."""
+
+    data: bytes
+    etag: str
+    last_modified: datetime
+
+
+def content_etag(data: bytes) -> str:
+    """Strong ETag derived from the JPEG bytes."""
+    return f'"{hashlib.blake2b(data, digest_size=12).hexdigest()}"'
+
+
+@singleton
+class JPEGCache:
+    """
+    Byte-bounded LRU of encoded JPEGs with single-flight encoding.
+
+    Thread Safety:
+        The LRU itself is guarded by a lock. In-flight encodes are tracked per
+        event loop and should only be awaited from async endpoints.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[CacheKey, CachedJPEG]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._inflight: Dict[CacheKey, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: CacheKey) -> Optional[CachedJPEG]:
+        """Return the cached entry for key (marking it recently used), or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return entry
+
+    def put(
+        self,
+        key: CacheKey,
+        data: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[datetime] = None,
+    ) -> CachedJPEG:
+        """
+        Store an encoded JPEG, evicting least recently used entries as needed.
+
+        Entries larger than the whole cache are returned but not stored.
+        """
+        entry = CachedJPEG(
+            data=data,
+            etag=etag or content_etag(data),
+            last_modified=last_modified or datetime.now(timezone.utc),
+        )
+        if len(data) > self.max_bytes:
+            return entry
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous.data)
+            self._entries[key] = entry
+            self._size += len(data)
+            while self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.data)
+                self.evictions += 1
+        return entry
+
+    def invalidate(self, source: Hashable) -> int:
+        """Drop every entry whose key starts with source. Returns the count removed."""
+        with self._lock:
+            stale = [key for key in self._entries if key[0] == source]
+            for key in stale:
+                self._size -= len(self._entries.pop(key).data)
+        return len(stale)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    async def get_or_encode(
+        self,
+        key: CacheKey,
+        encode: Callable[[], Awaitable[Optional[bytes]]],
+        etag: Optional[str] = None,
+        last_modified: Optional[datetime] = None,
+    ) -> Optional[CachedJPEG]:
+        """
+        Return the cached JPEG for key, producing it with encode() on a miss.
+
+        Concurrent callers missing on the same key share one encode() call.
+        A None result from encode() is returned to every waiter but not cached.
+
+        Args:
+            key: Cache key, conventionally (source, version, size)
+            encode: Coroutine factory returning JPEG bytes (or None)
+            etag: ETag to store (defaults to a hash of the bytes)
+            last_modified: Last-Modified to store (defaults to now)
+
+        Returns:
+            CachedJPEG, or None if encode() produced nothing
+        """
+        entry = self.get(key)
+        if entry is not None:
+            return entry
+
+        pending = self._inflight.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+
+        self.misses += 1
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            data = await encode()
+            entry = self.put(key, data, etag, last_modified) if data else None
+            future.set_result(entry)
+            return entry
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # mark retrieved when nobody else was waiting
+            raise
+        finally:
+            if not future.done():
+                future.cancel()  # encoder was cancelled; waiters see CancelledError
+            self._inflight.pop(key, None)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "size_bytes": self._size,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+def is_not_modified(
+    request: Request,
+    etag: str,
+    last_modified: Optional[datetime] = None,
+) -> bool:
+    """
+    Evaluate If-None-Match / If-Modified-Since against a representation.
+
+    If-None-Match takes precedence; If-Modified-Since is only consulted when
+    the client sent no entity tags (RFC 9110 section 13.2.2).
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return etag in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+        return last_modified.replace(microsecond=0) <= since
+    return False
+
+
+def _validator_headers(etag: str, last_modified: Optional[datetime], cache_control: str) -> Dict[str, str]:
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if last_modified is not None:
+        if last_modified.tzinfo is None:
+            last_modified = last_modified.replace(tzinfo=timezone.utc)
+        headers["Last-Modified"] = format_datetime(last_modified.astimezone(timezone.utc), usegmt=True)
+    return headers
+
+
+def not_modified_response(
+    etag: str,
+    last_modified: Optional[datetime] = None,
+    cache_control: str = "no-cache",
+) -> Response:
+    """Empty 304 carrying the representation's validators."""
+    return Response(status_code=304, headers=_validator_headers(etag, last_modified, cache_control))
+
+
+def jpeg_response(
+    request: Request,
+    entry: CachedJPEG,
+    cache_control: str = "no-cache",
+) -> Response:
+    """
+    Serve a cached JPEG as image/jpeg, or 304 if the client copy is current.
+
+    Args:
+        request: Incoming request (for conditional headers)
+        entry: Cached JPEG to serve
+        cache_control: Cache-Control header value
+    """
+    if is_not_modified(request, entry.etag, entry.last_modified):
+        return not_modified_response(entry.etag, entry.last_modified, cache_control)
+    return Response(
+        content=entry.data,
+        media_type="image/jpeg",
+        headers=_validator_headers(entry.etag, entry.last_modified, cache_control),
+    )
+
+
+def get_jpeg_cache() -> JPEGCache:
+    """Get the global JPEGCache instance."""
+    return JPEGCache()
+
+
+def reset_jpeg_cache() -> None:
+    """Reset the global JPEGCache instance (for testing)."""
+    JPEGCache._reset_instance()
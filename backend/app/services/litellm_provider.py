@@ -17,11 +17,16 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 
-from litellm import Router, completion_cost
-import litellm
+from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+
+def completion_cost(*args, **kwargs) -> float:
+    """LiteLLM's cost calculator; litellm itself is only imported once a Router exists."""
+    from litellm import completion_cost as litellm_completion_cost
+    return litellm_completion_cost(*args, **kwargs)
+
 # LiteLLM model mappings for ArgusAI providers
 # Format: provider/model-name
 MODEL_MAPPINGS = {
@@ -70,6 +75,7 @@ class LiteLLMProvider:
         provider_order: Optional[List[str]] = None,
         timeout: int = 30,
         num_retries: int = 2,
+        openai_api_base: Optional[str] = None,
     ):
         """
         Initialize LiteLLM provider with API keys.
@@ -83,6 +89,8 @@ class LiteLLMProvider:
             provider_order: Order of providers to try (default: openai, grok, claude, gemini)
             timeout: Request timeout in seconds
             num_retries: Number of retries per provider
+            openai_api_base: OpenAI-compatible endpoint to use instead of
+                api.openai.com (default: AI_OPENAI_API_BASE)
         """
         self.timeout = timeout
         self.num_retries = num_retries
@@ -94,12 +102,16 @@ class LiteLLMProvider:
         self.configured_providers = set()
 
         if openai_key:
+            openai_params = {
+                "model": MODEL_MAPPINGS["openai"],
+                "api_key": openai_key,
+            }
+            openai_api_base = openai_api_base or settings.AI_OPENAI_API_BASE
+            if openai_api_base:
+                openai_params["api_base"] = openai_api_base
             self.model_list.append({
                 "model_name": "vision",
-                "litellm_params": {
-                    "model": MODEL_MAPPINGS["openai"],
-                    "api_key": openai_key,
-                }
+                "litellm_params": openai_params,
             })
             self.configured_providers.add("openai")
             logger.info("LiteLLM: OpenAI provider configured")
@@ -144,6 +156,8 @@ class LiteLLMProvider:
         # Initialize Router if any providers configured
         self.router = None
         if self.model_list:
+            # Importing litellm takes seconds; only pay it when a provider is configured
+            from litellm import Router
             self.router = Router(
                 model_list=self.model_list,
                 num_retries=num_retries,
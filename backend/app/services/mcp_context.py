@@ -12,6 +12,8 @@ Architecture:
     - Queries Camera and Event for camera patterns (P11-3.3)
     - Calculates time-of-day activity patterns (P11-3.3)
     - Caches context with 60-second TTL for performance (P11-3.4)
+    - Layered cache: long-lived per-camera/per-entity components with
+      explicit invalidation, plus a bounded LRU of assembled contexts
     - Calculates camera-specific accuracy rates
     - Extracts common correction patterns using TF-IDF (P14-6.6)
     - Formats context for AI prompt injection
@@ -27,6 +29,17 @@ Phase 14 Enhancements (Epic P14-6):
     - P14-6.7: VIP/blocked entity context for prioritization
     - P14-6.8: Context metrics API endpoint for dashboard
 
+Layered cache:
+    - Components (feedback, camera, time pattern per camera/hour, entity)
+      live for COMPONENT_TTL_SECONDS and are dropped explicitly when their
+      source data changes: invalidate_feedback() from the feedback API,
+      invalidate_entity() from EntityService adjustments/edits,
+      invalidate_patterns() from pattern recalculation, invalidate_camera()
+      from camera edits.
+    - Assembled contexts sit in an LRU bounded by CACHE_MAX_SIZE with the
+      short CACHE_TTL_SECONDS; on expiry they are rebuilt from components,
+      so a busy camera only touches the database when something changed.
+
 Flow:
     Event → MCPContextProvider.get_context(camera_id, event_time, entity_id)
                                     ↓
@@ -34,7 +47,8 @@ Flow:
                                     ↓
                       If cached and not expired → return cached
                                     ↓
-                      Parallel query execution (P14-6.2):
+                      Component cache lookups; misses run in
+                      parallel query execution (P14-6.2):
                         - Feedback context
                         - Entity context + adjustments (P14-6.1, P14-6.7)
                         - Camera context
@@ -51,12 +65,13 @@ import concurrent.futures
 import logging
 import math
 import re
+import threading
 import time
-from collections import Counter
+from collections import Counter, OrderedDict, deque
 from dataclasses import dataclass, field
 from datetime import datetime, timezone, timedelta
 from functools import partial
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Tuple, Hashable, Callable, Awaitable
 
 from prometheus_client import Counter as PromCounter, Histogram, Gauge
 from sqlalchemy import desc, select, func, extract
@@ -64,6 +79,7 @@ from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.metrics import REGISTRY
+from app.services.cluster_service import get_cluster_service
 
 logger = logging.getLogger(__name__)
 
@@ -105,6 +121,13 @@ MCP_CACHE_HIT_RATE = Gauge(
     'Current cache hit rate (0.0-1.0)',
     registry=REGISTRY
 )
+# Per-component cache lookups (hit/miss) for the layered cache
+MCP_COMPONENT_CACHE_LOOKUPS = PromCounter(
+    'argusai_mcp_component_cache_lookups_total',
+    'MCP context component cache lookups',
+    ['component', 'result'],
+    registry=REGISTRY
+)
 
 
 @dataclass
@@ -176,6 +199,80 @@ class CachedContext:
         return (now - created).total_seconds() > ttl_seconds
 
 
+class ComponentCache:
+    """
+    TTL + LRU bounded cache for one context component.
+
+    Entries expire after ``ttl_seconds`` and the least recently used entry is
+    evicted beyond ``max_size``. A generation counter is bumped on every
+    invalidation so a load that started before the invalidation cannot store
+    its (now stale) result afterwards.
+    """
+
+    def __init__(self, name: str, ttl_seconds: float, max_size: int):
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.max_size = max_size
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return (found, value), marking the entry recently used."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] <= self.ttl_seconds:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                MCP_COMPONENT_CACHE_LOOKUPS.labels(component=self.name, result="hit").inc()
+                return True, entry[1]
+            if entry is not None:
+                del self._entries[key]
+            self.misses += 1
+        MCP_COMPONENT_CACHE_LOOKUPS.labels(component=self.name, result="miss").inc()
+        return False, None
+
+    def put(self, key: Hashable, value: Any, generation: Optional[int] = None) -> None:
+        """Store value unless the cache was invalidated since ``generation``."""
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, match: Optional[Callable[[Hashable], bool]] = None) -> int:
+        """Drop entries whose key satisfies ``match`` (all if None). Returns the count removed."""
+        with self._lock:
+            self.generation += 1
+            if match is None:
+                removed = len(self._entries)
+                self._entries.clear()
+                return removed
+            stale = [key for key in self._entries if match(key)]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "evictions": self.evictions,
+        }
+
+
 class MCPContextProvider:
     """
     Provides context for AI prompts based on accumulated feedback, entities, and patterns.
@@ -187,6 +284,7 @@ class MCPContextProvider:
     - Camera context (P11-3.3): location hints and typical objects
     - Time pattern context (P11-3.3): activity levels and unusual timing flags
     - Context caching (P11-3.4, P14-6.5): optimized TTL cache
+    - Layered cache: invalidated component caches + bounded assembled LRU
     - Parallel queries (P14-6.2): asyncio.gather for concurrent execution
     - Async-safe queries (P14-6.3): run_in_executor for sync DB calls
     - Query timeout (P14-6.4): 80ms hard timeout with fail-open
@@ -201,6 +299,9 @@ class MCPContextProvider:
         MAX_TYPICAL_OBJECTS: Maximum typical objects to include (3)
         MAX_FALSE_POSITIVES: Maximum false positive patterns to include (3)
         CACHE_TTL_SECONDS: Cache TTL in seconds (30 - reduced for better freshness P14-6.5)
+        CACHE_MAX_SIZE: Maximum assembled contexts kept in the LRU (256)
+        COMPONENT_TTL_SECONDS: TTL of component caches, which are also invalidated explicitly (600)
+        COMPONENT_CACHE_MAX_SIZE: Maximum entries per component cache (1024)
         SLOW_QUERY_THRESHOLD_MS: Threshold for slow query warning (50)
         CONTEXT_TIMEOUT_SECONDS: Hard timeout for context gathering (0.08 - 80ms P14-6.4)
         MAX_ADJUSTMENTS: Maximum recent adjustments per entity (10 P14-6.1)
@@ -218,6 +319,10 @@ class MCPContextProvider:
     CONTEXT_TIMEOUT_SECONDS = 0.08  # P14-6.4: 80ms hard timeout
     MAX_ADJUSTMENTS = 10  # P14-6.1: Max adjustments per entity
     MIN_PATTERN_FREQUENCY = 3  # P14-6.6: Minimum frequency for patterns
+    CACHE_MAX_SIZE = 256
+    COMPONENT_TTL_SECONDS = 600  # Backstop; writes invalidate explicitly
+    COMPONENT_CACHE_MAX_SIZE = 1024
+    GATHER_TIME_SAMPLES = 256  # Recent gather times kept for get_metrics percentiles
 
     # P14-6.6: Domain-specific stop words for security camera context
     STOP_WORDS = {
@@ -245,18 +350,33 @@ class MCPContextProvider:
             db: Optional SQLAlchemy session. If None, must be provided to get_context().
         """
         self._db = db
-        self._cache: Dict[str, CachedContext] = {}
+        # Assembled contexts (without entity), LRU bounded by CACHE_MAX_SIZE
+        self._cache: "OrderedDict[str, CachedContext]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Long-lived components, invalidated explicitly when their source data changes
+        self._feedback_cache = ComponentCache("feedback", self.COMPONENT_TTL_SECONDS, self.COMPONENT_CACHE_MAX_SIZE)
+        self._camera_cache = ComponentCache("camera", self.COMPONENT_TTL_SECONDS, self.COMPONENT_CACHE_MAX_SIZE)
+        self._time_pattern_cache = ComponentCache(
+            "time_pattern", self.COMPONENT_TTL_SECONDS, self.COMPONENT_CACHE_MAX_SIZE
+        )
+        self._entity_cache = ComponentCache("entity", self.COMPONENT_TTL_SECONDS, self.COMPONENT_CACHE_MAX_SIZE)
         # P14-6.3: Thread pool executor for running sync DB queries
         self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="mcp_ctx")
         # P14-6.8: Metrics tracking for dashboard
         self._total_requests = 0
         self._cache_hits = 0
+        self._cache_evictions = 0
         self._timeouts = 0
+        self._gather_times_ms: deque = deque(maxlen=self.GATHER_TIME_SAMPLES)
         logger.info(
             "MCPContextProvider initialized",
             extra={"event_type": "mcp_context_provider_init"}
         )
 
+    @property
+    def _component_caches(self) -> Tuple[ComponentCache, ...]:
+        return (self._feedback_cache, self._camera_cache, self._time_pattern_cache, self._entity_cache)
+
     def _get_cache_key(self, camera_id: str, event_time: datetime) -> str:
         """
         Generate cache key from camera ID (P14-6.5 optimization).
@@ -280,14 +400,97 @@ class MCPContextProvider:
         """
         Clear the context cache (Story P11-3.4).
 
-        Useful for testing and manual cache invalidation.
+        Drops assembled contexts and every component cache. Useful for
+        testing and manual cache invalidation.
         """
-        self._cache.clear()
+        with self._cache_lock:
+            self._cache.clear()
+        for cache in self._component_caches:
+            cache.invalidate()
         logger.debug(
             "MCP context cache cleared",
             extra={"event_type": "mcp.cache_cleared"}
         )
 
+    def invalidate_feedback(self, camera_id: Optional[str] = None) -> None:
+        """
+        Drop cached context derived from a camera's feedback.
+
+        Call after feedback is created, updated or deleted. Both the feedback
+        and camera components are dropped, since the camera component carries
+        false positive patterns mined from negative feedback.
+
+        Args:
+            camera_id: Camera whose feedback changed, or None for all cameras
+        """
+        self._invalidate_camera_components(camera_id, "feedback", self._feedback_cache, self._camera_cache)
+
+    def invalidate_patterns(self, camera_id: Optional[str] = None) -> None:
+        """
+        Drop cached time-of-day pattern context for a camera.
+
+        Call after activity patterns are recalculated.
+
+        Args:
+            camera_id: Camera whose patterns changed, or None for all cameras
+        """
+        self._invalidate_camera_components(camera_id, "patterns", self._time_pattern_cache)
+
+    def invalidate_camera(self, camera_id: Optional[str] = None) -> None:
+        """
+        Drop every cached component for a camera (e.g. after it is renamed or deleted).
+
+        Args:
+            camera_id: Camera that changed, or None for all cameras
+        """
+        self._invalidate_camera_components(
+            camera_id, "camera", self._feedback_cache, self._camera_cache, self._time_pattern_cache
+        )
+
+    def invalidate_entity(self, entity_id: Optional[str] = None) -> None:
+        """
+        Drop cached entity context.
+
+        Call after an entity is edited, merged or deleted, or an event is
+        moved between entities (which records an EntityAdjustment).
+
+        Args:
+            entity_id: Entity that changed, or None for all entities (similar-entity
+                suggestions embed other entities' names, so renames should pass None)
+        """
+        removed = self._entity_cache.invalidate(None if entity_id is None else (lambda key: key == entity_id))
+        logger.debug(
+            "MCP entity context invalidated",
+            extra={"event_type": "mcp.cache_invalidated", "scope": "entity", "entity_id": entity_id, "removed": removed}
+        )
+        get_cluster_service().invalidate("mcp.entity", entity_id)
+
+    def _invalidate_camera_components(
+        self,
+        camera_id: Optional[str],
+        scope: str,
+        *caches: ComponentCache,
+    ) -> None:
+        if camera_id is None:
+            match = None
+        else:
+            def match(key: Hashable) -> bool:
+                return key == camera_id or (isinstance(key, tuple) and key[0] == camera_id)
+
+        removed = sum(cache.invalidate(match) for cache in caches)
+        with self._cache_lock:
+            if camera_id is None:
+                removed += len(self._cache)
+                self._cache.clear()
+            elif self._cache.pop(camera_id, None) is not None:
+                removed += 1
+
+        logger.debug(
+            f"MCP context invalidated ({scope})",
+            extra={"event_type": "mcp.cache_invalidated", "scope": scope, "camera_id": camera_id, "removed": removed}
+        )
+        get_cluster_service().invalidate(f"mcp.{scope}", camera_id)
+
     def get_metrics(self) -> Dict[str, Any]:
         """
         Get MCP context metrics for dashboard (P14-6.8).
@@ -297,12 +500,24 @@ class MCPContextProvider:
 
         Returns:
             Dict with cache_hit_rate, total_requests, cache_hits, timeouts,
-            avg_latency_ms, and component availability info.
+            cache size/evictions, per-component cache stats, and gather times
+            (milliseconds, over the last GATHER_TIME_SAMPLES assembled-cache misses).
         """
         hit_rate = self._cache_hits / self._total_requests if self._total_requests > 0 else 0.0
         # Update Prometheus gauge for dashboard
         MCP_CACHE_HIT_RATE.set(hit_rate)
 
+        components = {cache.name: cache.stats() for cache in self._component_caches}
+        component_hits = sum(c["hits"] for c in components.values())
+        component_lookups = component_hits + sum(c["misses"] for c in components.values())
+
+        gather_times = sorted(self._gather_times_ms)
+        if gather_times:
+            avg_gather = sum(gather_times) / len(gather_times)
+            p95_gather = gather_times[min(len(gather_times) - 1, int(len(gather_times) * 0.95))]
+        else:
+            avg_gather = p95_gather = 0.0
+
         return {
             "cache_hit_rate": round(hit_rate, 4),
             "total_requests": self._total_requests,
@@ -312,6 +527,14 @@ class MCPContextProvider:
             "cache_ttl_seconds": self.CACHE_TTL_SECONDS,
             "timeout_threshold_ms": int(self.CONTEXT_TIMEOUT_SECONDS * 1000),
             "cache_size": len(self._cache),
+            "cache_max_size": self.CACHE_MAX_SIZE,
+            "cache_evictions": self._cache_evictions,
+            "component_ttl_seconds": self.COMPONENT_TTL_SECONDS,
+            "component_hit_rate": round(component_hits / component_lookups, 4) if component_lookups else 0.0,
+            "components": components,
+            "gather_count": len(gather_times),
+            "avg_gather_time_ms": round(avg_gather, 2),
+            "p95_gather_time_ms": round(p95_gather, 2),
         }
 
     async def get_context(
@@ -331,6 +554,10 @@ class MCPContextProvider:
         Uses fail-open design: if any context component fails, returns
         partial context with None for failed components.
 
+        Assembled contexts are rebuilt from the component caches when they
+        expire, so only components invalidated since the last build hit the
+        database.
+
         Args:
             camera_id: UUID of the camera
             event_time: When the event occurred
@@ -353,13 +580,26 @@ class MCPContextProvider:
 
         # Check cache first (P14-6.5: optimized key strategy)
         cache_key = self._get_cache_key(camera_id, event_time)
-        cached = self._cache.get(cache_key)
+        with self._cache_lock:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                self._cache.move_to_end(cache_key)
 
         if cached and not cached.is_expired(self.CACHE_TTL_SECONDS):
             # Cache hit
             self._cache_hits += 1
-            context_gather_time_ms = (time.time() - start_time) * 1000
             MCP_CACHE_HITS.inc()
+
+            context = cached.context
+            time_ctx = context.time_pattern
+            if time_ctx is not None and time_ctx.hour != event_time.hour:
+                # The key is camera-only (P14-6.5); take this hour's pattern from its component
+                time_ctx = await self._get_cached_time_pattern_context(session, camera_id, event_time)
+
+            # Entity context is request-specific; it comes from the entity component cache
+            entity_ctx = await self._get_cached_entity_context(session, entity_id) if entity_id else None
+
+            context_gather_time_ms = (time.time() - start_time) * 1000
             MCP_CONTEXT_LATENCY.labels(cached="true").observe(context_gather_time_ms / 1000)
 
             logger.debug(
@@ -372,17 +612,15 @@ class MCPContextProvider:
                 }
             )
 
-            # Entity context is not cached (depends on entity_id), fetch if needed
-            if entity_id:
-                entity_ctx = await self._safe_get_entity_context(session, entity_id)
+            if entity_id or time_ctx is not context.time_pattern:
                 return AIContext(
-                    feedback=cached.context.feedback,
+                    feedback=context.feedback,
                     entity=entity_ctx,
-                    camera=cached.context.camera,
-                    time_pattern=cached.context.time_pattern,
+                    camera=context.camera,
+                    time_pattern=time_ctx,
                 )
 
-            return cached.context
+            return context
 
         # Cache miss - gather all context components
         MCP_CACHE_MISSES.inc()
@@ -420,6 +658,7 @@ class MCPContextProvider:
             return AIContext()
 
         context_gather_time_ms = (time.time() - start_time) * 1000
+        self._gather_times_ms.append(context_gather_time_ms)
 
         # Record metrics (Story P11-3.4 AC-3.4.4)
         MCP_CONTEXT_LATENCY.labels(cached="false").observe(context_gather_time_ms / 1000)
@@ -447,14 +686,19 @@ class MCPContextProvider:
         # Cache context (without entity, which is request-specific)
         cached_context = AIContext(
             feedback=feedback_ctx,
-            entity=None,  # Entity is not cached
+            entity=None,  # Entity is cached per entity_id in its own component cache
             camera=camera_ctx,
             time_pattern=time_ctx,
         )
-        self._cache[cache_key] = CachedContext(
-            context=cached_context,
-            created_at=datetime.now(timezone.utc),
-        )
+        with self._cache_lock:
+            self._cache[cache_key] = CachedContext(
+                context=cached_context,
+                created_at=datetime.now(timezone.utc),
+            )
+            self._cache.move_to_end(cache_key)
+            while len(self._cache) > self.CACHE_MAX_SIZE:
+                self._cache.popitem(last=False)
+                self._cache_evictions += 1
 
         # P14-6.8: Update component availability metrics
         MCP_COMPONENT_AVAILABILITY.labels(component="feedback").set(1 if feedback_ctx else 0)
@@ -489,6 +733,9 @@ class MCPContextProvider:
         """
         Gather all context components in parallel (P14-6.2).
 
+        Each component is served from its component cache when present; only
+        misses query the database.
+
         Uses asyncio.gather with return_exceptions=True for fail-open behavior.
         Each query is wrapped in run_in_executor for async-safe execution (P14-6.3).
 
@@ -507,10 +754,14 @@ class MCPContextProvider:
             return None
 
         tasks = [
-            self._safe_get_feedback_context(db, camera_id),
-            self._safe_get_entity_context(db, entity_id) if entity_id else no_entity(),
-            self._safe_get_camera_context(db, camera_id),
-            self._safe_get_time_pattern_context(db, camera_id, event_time),
+            self._get_cached_component(
+                self._feedback_cache, camera_id, lambda: self._safe_get_feedback_context(db, camera_id)
+            ),
+            self._get_cached_entity_context(db, entity_id) if entity_id else no_entity(),
+            self._get_cached_component(
+                self._camera_cache, camera_id, lambda: self._safe_get_camera_context(db, camera_id)
+            ),
+            self._get_cached_time_pattern_context(db, camera_id, event_time),
         ]
 
         # P14-6.2: Execute all tasks in parallel with exception handling
@@ -536,6 +787,44 @@ class MCPContextProvider:
 
         return tuple(processed)  # type: ignore
 
+    async def _get_cached_component(
+        self,
+        cache: ComponentCache,
+        key: Hashable,
+        load: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Return a component from its cache, loading and caching it on a miss.
+
+        None results (failed queries, unknown camera/entity) are not cached so
+        they are retried on the next request.
+        """
+        found, value = cache.get(key)
+        if found:
+            return value
+        generation = cache.generation
+        value = await load()
+        if value is not None:
+            cache.put(key, value, generation=generation)
+        return value
+
+    async def _get_cached_entity_context(self, db: Session, entity_id: str) -> Optional[EntityContext]:
+        return await self._get_cached_component(
+            self._entity_cache, entity_id, lambda: self._safe_get_entity_context(db, entity_id)
+        )
+
+    async def _get_cached_time_pattern_context(
+        self,
+        db: Session,
+        camera_id: str,
+        event_time: datetime,
+    ) -> Optional[TimePatternContext]:
+        return await self._get_cached_component(
+            self._time_pattern_cache,
+            (camera_id, event_time.hour),
+            lambda: self._safe_get_time_pattern_context(db, camera_id, event_time),
+        )
+
     async def _safe_get_feedback_context(
         self,
         db: Session,
@@ -0,0 +1,355 @@
+"""
+Content-Addressed Media Store
+
+Holds the bulky binary payloads that used to live inline on the ``events``
+table (base64 thumbnails and key-frame galleries). Each blob is written once
+to ``data/media/<aa>/<digest>`` where ``digest`` is the SHA-256 of its bytes,
+so identical frames shared by several events are stored a single time.
+
+Reference counts live in the ``media_blobs`` table and are maintained by the
+Event mapper hooks in the same transaction as the row that gains or drops a
+reference. Bulk deletes (retention cleanup, camera cascade) bypass those
+hooks, so ``collect_garbage`` recounts references from the events table
+before removing unreferenced blobs.
+
+A blob's file mtime records its last use: ``put`` and ``add_refs`` touch an
+existing file instead of rewriting it. Garbage collection only removes
+unreferenced blobs whose last use is older than its grace period, so an
+event that re-inserts a digest while a pass is running keeps its file.
+
+Writes are atomic (temp file + rename) and idempotent: writing a digest that
+already exists is a no-op, so a rolled-back transaction can at worst leave an
+unreferenced file behind for the next garbage collection pass.
+"""
+import base64
+import binascii
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional
+
+from sqlalchemy import select, update, delete
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from app.core.decorators import singleton
+from app.models.media_blob import MediaBlob
+
+logger = logging.getLogger(__name__)
+
+MEDIA_STORE_BASE_DIR = "data/media"
+STREAM_CHUNK_SIZE = 64 * 1024
+# Unreferenced blobs used more recently than this may belong to a transaction
+# that has not committed yet, so garbage collection leaves them alone.
+ORPHAN_GRACE_SECONDS = 3600
+
+_HEX_DIGITS = frozenset("0123456789abcdef")
+
+
+def is_digest(value: Optional[str]) -> bool:
+    """True if value looks like a hex SHA-256 digest."""
+    return bool(value) and len(value) == 64 and set(value) <= _HEX_DIGITS
+
+
+def decode_base64_payload(value: str) -> bytes:
+    """
+    Decode a base64 image payload, tolerating a ``data:`` URI prefix.
+
+    Raises:
+        ValueError: If the payload is not valid base64
+    """
+    if value.startswith("data:"):
+        comma_idx = value.find(",")
+        if comma_idx != -1:
+            value = value[comma_idx + 1:]
+    try:
+        return base64.b64decode(value)
+    except (binascii.Error, ValueError) as e:
+        raise ValueError(f"Invalid base64 media payload: {e}") from e
+
+
+def content_digest(data: bytes) -> str:
+    """Digest naming a blob (hex SHA-256 of its bytes)."""
+    return hashlib.sha256(data).hexdigest()
+
+
+def parse_digest_list(value: Optional[str]) -> List[str]:
+    """Parse a JSON array of digests as stored in Event.key_frame_hashes."""
+    if not value:
+        return []
+    try:
+        digests = json.loads(value)
+    except (TypeError, ValueError):
+        return []
+    return [d for d in digests if isinstance(d, str)] if isinstance(digests, list) else []
+
+
+@singleton
+class MediaStore:
+    """
+    Hash-named blob files on disk plus reference counting in ``media_blobs``.
+
+    Attributes:
+        root: Directory holding the blob files
+    """
+
+    def __init__(self, root: Optional[Path] = None):
+        self.root = Path(root) if root else Path(
+            os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+        ) / MEDIA_STORE_BASE_DIR
+
+    # ------------------------------------------------------------------
+    # Blob files
+    # ------------------------------------------------------------------
+
+    def path_for(self, digest: str) -> Path:
+        """
+        Location of a blob on disk.
+
+        Raises:
+            ValueError: If digest is not a hex SHA-256 (guards against traversal)
+        """
+        if not is_digest(digest):
+            raise ValueError(f"Invalid media digest: {digest!r}")
+        return self.root / digest[:2] / digest
+
+    def put(self, data: bytes) -> str:
+        """
+        Store bytes and return their digest. Existing blobs are not rewritten.
+
+        Args:
+            data: Blob contents
+
+        Returns:
+            Hex SHA-256 digest naming the blob
+        """
+        digest = content_digest(data)
+        path = self.path_for(digest)
+        if self._touch(path):
+            return digest
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        return digest
+
+    @staticmethod
+    def _touch(path: Path) -> bool:
+        """Mark an existing blob as just used. Returns False if it does not exist."""
+        try:
+            os.utime(path)
+            return True
+        except OSError:
+            return False
+
+    def _last_used(self, digest: str) -> float:
+        """Modification time of a blob file (0 if missing)."""
+        try:
+            return self.path_for(digest).stat().st_mtime
+        except OSError:
+            return 0.0
+
+    def put_base64(self, value: str) -> str:
+        """Decode a base64 payload (data URI prefix allowed) and store it."""
+        return self.put(decode_base64_payload(value))
+
+    def exists(self, digest: str) -> bool:
+        return is_digest(digest) and self.path_for(digest).exists()
+
+    def size_of(self, digest: str) -> int:
+        """Size of a stored blob in bytes (0 if missing)."""
+        try:
+            return self.path_for(digest).stat().st_size
+        except (OSError, ValueError):
+            return 0
+
+    def read(self, digest: str) -> Optional[bytes]:
+        """Read a whole blob, or None if it is missing."""
+        try:
+            return self.path_for(digest).read_bytes()
+        except (OSError, ValueError):
+            return None
+
+    def read_base64(self, digest: str) -> Optional[str]:
+        """Read a blob as a base64 string, or None if it is missing."""
+        data = self.read(digest)
+        return base64.b64encode(data).decode("ascii") if data is not None else None
+
+    def iter_chunks(self, digest: str, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Stream a blob in chunks without loading it into memory.
+
+        Raises:
+            FileNotFoundError: If the blob is missing
+        """
+        with open(self.path_for(digest), "rb") as f:
+            while True:
+                chunk = f.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+
+    def delete(self, digest: str) -> bool:
+        """Remove a blob file. Returns True if a file was deleted."""
+        try:
+            self.path_for(digest).unlink()
+            return True
+        except (OSError, ValueError):
+            return False
+
+    # ------------------------------------------------------------------
+    # Reference counting
+    # ------------------------------------------------------------------
+
+    def add_refs(self, connection: Connection, digests: Iterable[str]) -> None:
+        """
+        Increment reference counts, creating ``media_blobs`` rows as needed.
+
+        Runs on the caller's connection so the counts commit or roll back
+        together with the event row that references the blobs.
+        """
+        table = MediaBlob.__table__
+        for digest, count in _count(digests).items():
+            if is_digest(digest):
+                self._touch(self.path_for(digest))
+            result = connection.execute(
+                update(table)
+                .where(table.c.digest == digest)
+                .values(ref_count=table.c.ref_count + count)
+            )
+            if result.rowcount == 0:
+                connection.execute(
+                    table.insert().values(
+                        digest=digest,
+                        size_bytes=self.size_of(digest),
+                        ref_count=count,
+                        created_at=datetime.now(timezone.utc),
+                    )
+                )
+
+    def release_refs(self, connection: Connection, digests: Iterable[str]) -> None:
+        """
+        Decrement reference counts. Blobs reaching zero are removed by the
+        next ``collect_garbage`` pass rather than immediately, so a rollback
+        never leaves a row pointing at a deleted file.
+        """
+        table = MediaBlob.__table__
+        for digest, count in _count(digests).items():
+            connection.execute(
+                update(table)
+                .where(table.c.digest == digest)
+                .values(ref_count=table.c.ref_count - count)
+            )
+
+    def collect_garbage(self, db: Session, grace_seconds: int = ORPHAN_GRACE_SECONDS) -> Dict[str, int]:
+        """
+        Recount references from the events table and delete unused blobs.
+
+        Unreferenced blobs, tracked or not, are only removed once their file
+        has not been used for ``grace_seconds``. Recently used ones may be
+        referenced by a transaction that has not committed yet.
+
+        Args:
+            db: Database session (committed by this method)
+            grace_seconds: Minimum time since a blob's last use before removal
+
+        Returns:
+            Dict with blobs_deleted, orphans_deleted and bytes_freed
+        """
+        from app.models.event import Event
+
+        references: Dict[str, int] = {}
+        rows = db.query(Event.thumbnail_hash, Event.key_frame_hashes).filter(
+            (Event.thumbnail_hash.isnot(None)) | (Event.key_frame_hashes.isnot(None))
+        ).yield_per(1000)
+        for thumbnail_hash, key_frame_hashes in rows:
+            for digest in ([thumbnail_hash] if thumbnail_hash else []) + parse_digest_list(key_frame_hashes):
+                references[digest] = references.get(digest, 0) + 1
+
+        table = MediaBlob.__table__
+        tracked = dict(db.execute(select(table.c.digest, table.c.ref_count)).all())
+        for digest, count in references.items():
+            if tracked.get(digest) != count:
+                if digest in tracked:
+                    db.execute(update(table).where(table.c.digest == digest).values(ref_count=count))
+                else:
+                    db.execute(table.insert().values(
+                        digest=digest,
+                        size_bytes=self.size_of(digest),
+                        ref_count=count,
+                        created_at=datetime.now(timezone.utc),
+                    ))
+
+        cutoff = time.time() - grace_seconds
+        unreferenced = [digest for digest in tracked if digest not in references]
+        expired = {digest for digest in unreferenced if self._last_used(digest) < cutoff}
+        recent = [digest for digest in unreferenced if digest not in expired and tracked[digest] != 0]
+        if expired:
+            db.execute(delete(table).where(table.c.digest.in_(expired)))
+        if recent:
+            db.execute(update(table).where(table.c.digest.in_(recent)).values(ref_count=0))
+        db.commit()
+
+        blobs_deleted = orphans_deleted = bytes_freed = 0
+        for digest in expired:
+            # Re-check: add_refs touches the file before re-inserting its row
+            size = self.size_of(digest)
+            if self._last_used(digest) < cutoff and self.delete(digest):
+                blobs_deleted += 1
+                bytes_freed += size
+
+        if self.root.exists():
+            for path in self.root.glob("*/*"):
+                if path.name in references or path.name in tracked:
+                    continue
+                try:
+                    stat = path.stat()
+                    if stat.st_mtime < cutoff:
+                        path.unlink()
+                        orphans_deleted += 1
+                        bytes_freed += stat.st_size
+                except OSError:
+                    continue
+
+        stats = {
+            "blobs_deleted": blobs_deleted,
+            "orphans_deleted": orphans_deleted,
+            "bytes_freed": bytes_freed,
+        }
+        logger.info(
+            f"Media store garbage collection removed {blobs_deleted} blobs and {orphans_deleted} orphans",
+            extra={"event_type": "media_store_gc", **stats}
+        )
+        return stats
+
+
+def _count(digests: Iterable[str]) -> Dict[str, int]:
+    counts: Dict[str, int] = {}
+    for digest in digests:
+        if digest:
+            counts[digest] = counts.get(digest, 0) + 1
+    return counts
+
+
+def get_media_store() -> MediaStore:
+    """Get the global MediaStore instance."""
+    return MediaStore()
+
+
+def reset_media_store() -> None:
+    """Reset the global MediaStore instance (for testing)."""
+    MediaStore._reset_instance()
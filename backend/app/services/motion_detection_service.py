@@ -25,9 +25,13 @@ from app.models.motion_event import MotionEvent
 from app.models.camera import Camera
 from app.core.database import get_db
 from app.core.decorators import singleton
+from app.services.database_writer import get_database_writer
 
 logger = logging.getLogger(__name__)
 
+# Seconds a camera thread waits for its motion event to be group-committed
+MOTION_EVENT_WRITE_TIMEOUT = 10.0
+
 
 @singleton
 class MotionDetectionService:
@@ -156,9 +160,14 @@ class MotionDetectionService:
 
         # Save to database
         try:
-            db.add(motion_event)
-            db.commit()
-            db.refresh(motion_event)
+            writer = get_database_writer()
+            if writer.is_running:
+                # Camera threads block only until the next group commit
+                writer.submit(lambda session: session.add(motion_event)).result(timeout=MOTION_EVENT_WRITE_TIMEOUT)
+            else:
+                db.add(motion_event)
+                db.commit()
+                db.refresh(motion_event)
             logger.info(f"Motion event {motion_event.id} created for camera {camera_id}")
         except Exception as e:
             db.rollback()
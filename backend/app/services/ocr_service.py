@@ -5,16 +5,28 @@ Story P9-3.2: Attempt Frame Overlay Text Extraction
 
 This service attempts to read timestamp and camera name text embedded
 in video frame overlays (commonly added by security cameras).
+
+A camera's overlay does not move, so the first corner region that yields
+text is remembered per camera (OverlayProfile) and later frames only OCR
+that region. A perceptual hash of the last overlay crop is kept as well:
+when the crop is unchanged, the previous result is returned without
+running tesseract at all. Corner probing (no profile yet, or the profile
+stopped matching) OCRs the regions in parallel on a small thread pool.
 """
 
+import hashlib
 import logging
 import re
-from typing import Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 import cv2
 import numpy as np
 
+from app.core.config import settings
+
 logger = logging.getLogger(__name__)
 
 # Check if pytesseract is available
@@ -40,6 +52,26 @@ class OCRResult:
     raw_text: str  # Raw OCR output for debugging
 
 
+@dataclass
+class OverlayProfile:
+    """Where a camera's overlay was last read, and what it said."""
+    region: str
+    bbox: Tuple[int, int, int, int]  # x, y, width, height in frame pixels
+    frame_shape: Tuple[int, int]  # (height, width) the bbox applies to
+    overlay_hash: int
+    overlay_digest: bytes  # exact crop content, guards reuse of a read timestamp
+    last_result: OCRResult
+    misses: int = 0
+
+
+# camera_id -> OverlayProfile
+_overlay_profiles: Dict[str, OverlayProfile] = {}
+_profiles_lock = threading.Lock()
+
+_probe_executor: Optional[ThreadPoolExecutor] = None
+_probe_executor_lock = threading.Lock()
+
+
 # Timestamp patterns commonly found in security camera overlays
 # Order matters - check more specific patterns first
 TIMESTAMP_PATTERNS = [
@@ -121,7 +153,180 @@ def preprocess_region(region: np.ndarray) -> np.ndarray:
     return dilated
 
 
-def extract_overlay_text(frame: np.ndarray) -> Optional[OCRResult]:
+def overlay_hash(region: np.ndarray, width: int = 64, height: int = 16) -> int:
+    """
+    Perceptual hash of an overlay crop.
+
+    The crop is binarized (Otsu) before downsampling so that sensor/JPEG
+    noise in the background does not flip bits, while a changed character
+    does. A plain difference hash is too noisy on flat overlay backgrounds.
+
+    Args:
+        region: BGR or grayscale image region
+
+    Returns:
+        Hash as an integer of ``width * height`` bits
+    """
+    gray = cv2.cvtColor(region, cv2.COLOR_BGR2GRAY) if region.ndim == 3 else region
+    _, mask = cv2.threshold(gray, 0, 255, cv2.THRESH_BINARY + cv2.THRESH_OTSU)
+    small = cv2.resize(mask, (width, height), interpolation=cv2.INTER_AREA)
+    bits = (small > 64).flatten()
+    return int("".join("1" if bit else "0" for bit in bits), 2)
+
+
+def _hash_distance(a: int, b: int) -> int:
+    return bin(a ^ b).count("1")
+
+
+def _corner_regions(height: int, width: int) -> List[Tuple[str, Tuple[int, int, int, int]]]:
+    """Corner regions to check (typical overlay positions) as (name, bbox)."""
+    # Using relative positions for different frame sizes
+    region_height = min(60, height // 10)
+    region_width = min(350, width // 3)
+
+    return [
+        ("top_left", (0, 0, region_width, region_height)),
+        ("top_right", (width - region_width, 0, region_width, region_height)),
+        ("bottom_left", (0, height - region_height, region_width, region_height)),
+        ("bottom_right", (width - region_width, height - region_height, region_width, region_height)),
+    ]
+
+
+def _crop(frame: np.ndarray, bbox: Tuple[int, int, int, int]) -> np.ndarray:
+    x, y, w, h = bbox
+    return frame[y:y + h, x:x + w]
+
+
+def _crop_digest(crop: np.ndarray) -> bytes:
+    return hashlib.blake2b(crop.tobytes(), digest_size=16).digest()
+
+
+def _ocr_region(region_name: str, region: np.ndarray) -> Optional[OCRResult]:
+    """OCR one region; returns a result only if a timestamp or camera name was found."""
+    try:
+        # Preprocess for better OCR
+        processed = preprocess_region(region)
+
+        # Run OCR
+        text = pytesseract.image_to_string(
+            processed,
+            config='--psm 7 --oem 3'  # Single line mode, best OCR engine
+        ).strip()
+
+        if not text:
+            return None
+
+        # Try to extract timestamp and camera name
+        timestamp = parse_timestamp(text)
+        camera_name = parse_camera_name(text)
+
+        if timestamp or camera_name:
+            logger.debug(
+                f"OCR extraction from {region_name}: timestamp={timestamp}, "
+                f"camera_name={camera_name}, raw='{text}'"
+            )
+            return OCRResult(
+                region=region_name,
+                timestamp=timestamp,
+                camera_name=camera_name,
+                raw_text=text
+            )
+    except Exception as e:
+        logger.warning(f"OCR failed for {region_name}: {e}")
+    return None
+
+
+def _get_probe_executor() -> ThreadPoolExecutor:
+    global _probe_executor
+    with _probe_executor_lock:
+        if _probe_executor is None:
+            _probe_executor = ThreadPoolExecutor(
+                max_workers=settings.OCR_PROBE_WORKERS,
+                thread_name_prefix="ocr-probe",
+            )
+        return _probe_executor
+
+
+def _probe_regions(
+    frame: np.ndarray,
+) -> Tuple[Optional[OCRResult], Optional[Tuple[int, int, int, int]]]:
+    """OCR all corner regions in parallel; first match in corner order wins."""
+    from app.core import metrics as prom
+
+    height, width = frame.shape[:2]
+    regions = _corner_regions(height, width)
+    prom.ocr_region_runs_total.labels(mode="probe").inc(len(regions))
+
+    executor = _get_probe_executor()
+    futures = [
+        executor.submit(_ocr_region, name, _crop(frame, bbox))
+        for name, bbox in regions
+    ]
+    for (_, bbox), future in zip(regions, futures):
+        result = future.result()
+        if result is not None:
+            return result, bbox
+    return None, None
+
+
+def get_overlay_profile(camera_id: str) -> Optional[OverlayProfile]:
+    """Learned overlay profile for a camera, if any."""
+    with _profiles_lock:
+        return _overlay_profiles.get(camera_id)
+
+
+def reset_overlay_profiles() -> None:
+    """Forget every learned overlay profile (for testing)."""
+    with _profiles_lock:
+        _overlay_profiles.clear()
+
+
+def _read_profile_region(
+    camera_id: str, profile: OverlayProfile, frame: np.ndarray
+) -> Tuple[Optional[OCRResult], bool]:
+    """
+    Read the overlay from a camera's learned region.
+
+    Returns:
+        (result, reprobe): reprobe is True once the profile has missed
+        OCR_PROFILE_MAX_MISSES times in a row and was forgotten
+    """
+    from app.core import metrics as prom
+
+    crop = _crop(frame, profile.bbox)
+    crop_hash = overlay_hash(crop)
+    crop_digest = _crop_digest(crop)
+    # A timestamp overlay changes every second, often by a single glyph that
+    # stays within the perceptual hash distance, so a read timestamp is only
+    # reused for a byte-identical crop
+    if profile.last_result.timestamp:
+        unchanged = crop_digest == profile.overlay_digest
+    else:
+        unchanged = _hash_distance(crop_hash, profile.overlay_hash) <= settings.OCR_OVERLAY_HASH_DISTANCE
+    if unchanged:
+        prom.ocr_region_runs_total.labels(mode="unchanged").inc()
+        return profile.last_result, False
+
+    prom.ocr_region_runs_total.labels(mode="profile").inc()
+    result = _ocr_region(profile.region, crop)
+    if result is not None:
+        profile.overlay_hash = crop_hash
+        profile.overlay_digest = crop_digest
+        profile.last_result = result
+        profile.misses = 0
+        return result, False
+
+    profile.misses += 1
+    if profile.misses < settings.OCR_PROFILE_MAX_MISSES:
+        return None, False
+
+    logger.debug(f"Overlay profile for camera {camera_id} stopped matching, re-probing")
+    with _profiles_lock:
+        _overlay_profiles.pop(camera_id, None)
+    return None, True
+
+
+def extract_overlay_text(frame: np.ndarray, camera_id: Optional[str] = None) -> Optional[OCRResult]:
     """
     Extract timestamp and camera name from frame overlay.
 
@@ -131,6 +336,8 @@ def extract_overlay_text(frame: np.ndarray) -> Optional[OCRResult]:
 
     Args:
         frame: BGR image (numpy array) from video frame
+        camera_id: Camera the frame came from; enables the learned overlay
+            region and unchanged-overlay skip for that camera
 
     Returns:
         OCRResult with extracted data, or None if OCR unavailable or nothing found
@@ -145,53 +352,29 @@ def extract_overlay_text(frame: np.ndarray) -> Optional[OCRResult]:
 
     height, width = frame.shape[:2]
 
-    # Define corner regions to check (typical overlay positions)
-    # Using relative positions for different frame sizes
-    region_height = min(60, height // 10)
-    region_width = min(350, width // 3)
+    profile = get_overlay_profile(camera_id) if camera_id else None
+    if profile is not None and profile.frame_shape == (height, width):
+        result, reprobe = _read_profile_region(camera_id, profile, frame)
+        if result is not None or not reprobe:
+            return result
 
-    regions = [
-        ("top_left", frame[0:region_height, 0:region_width]),
-        ("top_right", frame[0:region_height, width-region_width:width]),
-        ("bottom_left", frame[height-region_height:height, 0:region_width]),
-        ("bottom_right", frame[height-region_height:height, width-region_width:width]),
-    ]
+    result, bbox = _probe_regions(frame)
+    if result is None:
+        logger.debug("No overlay text found in any region")
+        return None
 
-    for region_name, region in regions:
-        try:
-            # Preprocess for better OCR
-            processed = preprocess_region(region)
-
-            # Run OCR
-            text = pytesseract.image_to_string(
-                processed,
-                config='--psm 7 --oem 3'  # Single line mode, best OCR engine
-            ).strip()
-
-            if not text:
-                continue
-
-            # Try to extract timestamp and camera name
-            timestamp = parse_timestamp(text)
-            camera_name = parse_camera_name(text)
-
-            if timestamp or camera_name:
-                logger.debug(
-                    f"OCR extraction from {region_name}: timestamp={timestamp}, "
-                    f"camera_name={camera_name}, raw='{text}'"
-                )
-                return OCRResult(
-                    region=region_name,
-                    timestamp=timestamp,
-                    camera_name=camera_name,
-                    raw_text=text
-                )
-        except Exception as e:
-            logger.warning(f"OCR failed for {region_name}: {e}")
-            continue
-
-    logger.debug("No overlay text found in any region")
-    return None
+    if camera_id:
+        crop = _crop(frame, bbox)
+        with _profiles_lock:
+            _overlay_profiles[camera_id] = OverlayProfile(
+                region=result.region,
+                bbox=bbox,
+                frame_shape=(height, width),
+                overlay_hash=overlay_hash(crop),
+                overlay_digest=_crop_digest(crop),
+                last_result=result,
+            )
+    return result
 
 
 def is_ocr_available() -> bool:
@@ -6,9 +6,13 @@ Patterns are pre-calculated periodically and persisted for fast lookup (<50ms)
 during event processing.
 
 Architecture:
-    - Calculates hourly and daily event distributions per camera
+    - Calculates hourly and daily event distributions per camera with grouped
+      SQL (hour-of-day x day-of-week, and per distinct objects_detected value),
+      so recalculation never loads Event rows
     - Identifies peak hours (above-average activity) and quiet hours (minimal activity)
     - Persists patterns to camera_activity_patterns table
+    - Keeps an in-memory baseline per camera, refreshed by recalculation and
+      by every incremental update, so anomaly scoring reads from memory
     - Provides timing analysis for AI context enhancement
 
 Flow:
@@ -28,15 +32,16 @@ from app.core.decorators import singleton
 import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Dict, Iterable, Optional, Tuple
 import statistics
 
-from sqlalchemy import func
+from sqlalchemy import extract, func
 from sqlalchemy.orm import Session
 
 from app.models.camera_activity_pattern import CameraActivityPattern
 from app.models.event import Event
 from app.models.camera import Camera
+from app.services.mcp_context import get_mcp_context_provider
 
 logger = logging.getLogger(__name__)
 
@@ -77,14 +82,19 @@ class PatternService:
         MIN_EVENTS_FOR_PATTERNS: Minimum events required for meaningful patterns (10)
         MIN_DAYS_FOR_PATTERNS: Minimum days of history for meaningful patterns (7)
         DEFAULT_WINDOW_DAYS: Default time window for pattern calculation (30 days)
+        BASELINE_CACHE_TTL_SECONDS: How long an in-memory baseline is served
+            before it is re-read (bounds staleness across worker processes)
     """
 
     MIN_EVENTS_FOR_PATTERNS = 10
     MIN_DAYS_FOR_PATTERNS = 7
     DEFAULT_WINDOW_DAYS = 30
+    BASELINE_CACHE_TTL_SECONDS = 300
 
     def __init__(self):
         """Initialize PatternService."""
+        # camera_id -> (monotonic time cached, PatternData)
+        self._baselines: Dict[str, Tuple[float, PatternData]] = {}
         logger.info(
             "PatternService initialized",
             extra={"event_type": "pattern_service_init"}
@@ -96,9 +106,10 @@ class PatternService:
         """
         Get activity patterns for a camera.
 
-        Retrieves pre-calculated patterns from the database. Returns None if
-        no patterns exist (camera has insufficient history or patterns haven't
-        been calculated yet).
+        Served from the in-memory baseline when it is fresh; otherwise reads
+        the pre-calculated patterns from the database and caches them.
+        Returns None if no patterns exist (camera has insufficient history or
+        patterns haven't been calculated yet).
 
         Args:
             db: SQLAlchemy database session
@@ -107,6 +118,10 @@ class PatternService:
         Returns:
             PatternData with activity patterns, or None if no patterns exist
         """
+        cached = self.get_cached_patterns(camera_id)
+        if cached is not None:
+            return cached
+
         start_time = time.time()
 
         pattern = db.query(CameraActivityPattern).filter_by(
@@ -134,6 +149,40 @@ class PatternService:
             }
         )
 
+        return self._cache_baseline(self._to_pattern_data(camera_id, pattern))
+
+    def get_cached_patterns(self, camera_id: str) -> Optional[PatternData]:
+        """
+        In-memory baseline for a camera, without touching the database.
+
+        Args:
+            camera_id: UUID of the camera
+
+        Returns:
+            PatternData if a fresh baseline is cached, None otherwise
+        """
+        entry = self._baselines.get(camera_id)
+        if entry is None:
+            return None
+        cached_at, data = entry
+        if time.monotonic() - cached_at > self.BASELINE_CACHE_TTL_SECONDS:
+            self._baselines.pop(camera_id, None)
+            return None
+        return data
+
+    def invalidate_baseline(self, camera_id: Optional[str] = None) -> None:
+        """Drop the in-memory baseline for one camera, or for all cameras."""
+        if camera_id is None:
+            self._baselines.clear()
+        else:
+            self._baselines.pop(camera_id, None)
+
+    def _cache_baseline(self, data: PatternData) -> PatternData:
+        self._baselines[data.camera_id] = (time.monotonic(), data)
+        return data
+
+    def _to_pattern_data(self, camera_id: str, pattern: CameraActivityPattern) -> PatternData:
+        """Decode a persisted pattern row."""
         # Parse object type distribution and compute dominant type
         object_type_dist = None
         dominant_type = None
@@ -233,8 +282,10 @@ class PatternService:
         """
         Recalculate and persist activity patterns for a camera.
 
-        Analyzes historical events within the time window and calculates
-        hourly/daily distributions, peak hours, and quiet hours.
+        Aggregates historical events within the time window in SQL (grouped
+        by hour-of-day and day-of-week, and by distinct objects_detected
+        value) and folds the buckets into hourly/daily distributions, peak
+        hours, and quiet hours.
 
         Args:
             db: SQLAlchemy database session
@@ -274,29 +325,29 @@ class PatternService:
                 )
                 return existing_pattern
 
-        # Query events within time window
+        # Aggregate events within time window (no Event rows are loaded)
         cutoff = datetime.now(timezone.utc) - timedelta(days=window_days)
-        events = db.query(Event).filter(
-            Event.camera_id == camera_id,
-            Event.timestamp >= cutoff
-        ).all()
+        in_window = (Event.camera_id == camera_id, Event.timestamp >= cutoff)
+
+        event_count, first_timestamp = db.query(
+            func.count(Event.id), func.min(Event.timestamp)
+        ).filter(*in_window).one()
 
         # Check minimum thresholds
-        if len(events) < self.MIN_EVENTS_FOR_PATTERNS:
+        if event_count < self.MIN_EVENTS_FOR_PATTERNS:
             logger.info(
-                f"Insufficient events for pattern calculation: {len(events)} events for camera {camera_id}",
+                f"Insufficient events for pattern calculation: {event_count} events for camera {camera_id}",
                 extra={
                     "camera_id": camera_id,
-                    "event_count": len(events),
+                    "event_count": event_count,
                     "min_required": self.MIN_EVENTS_FOR_PATTERNS
                 }
             )
             return None
 
         # Check if we have enough days of history
-        if events:
-            first_event = min(events, key=lambda e: e.timestamp)
-            days_of_history = (datetime.now(timezone.utc) - first_event.timestamp.replace(tzinfo=timezone.utc)).days
+        if first_timestamp is not None:
+            days_of_history = (datetime.now(timezone.utc) - first_timestamp.replace(tzinfo=timezone.utc)).days
             if days_of_history < self.MIN_DAYS_FOR_PATTERNS:
                 logger.info(
                     f"Insufficient history for pattern calculation: {days_of_history} days for camera {camera_id}",
@@ -308,13 +359,21 @@ class PatternService:
                 )
                 return None
 
-        # Calculate distributions
-        hourly = self._calculate_hourly_distribution(events)
-        daily = self._calculate_daily_distribution(events)
+        # Calculate distributions from grouped counts
+        hour_col = extract("hour", Event.timestamp)
+        dow_col = extract("dow", Event.timestamp)  # 0=Sunday on SQLite and PostgreSQL
+        time_buckets = db.query(hour_col, dow_col, func.count(Event.id)).filter(
+            *in_window
+        ).group_by(hour_col, dow_col).all()
+        object_buckets = db.query(Event.objects_detected, func.count(Event.id)).filter(
+            *in_window, Event.objects_detected.isnot(None)
+        ).group_by(Event.objects_detected).all()
+
+        hourly, daily = self._fold_time_buckets(time_buckets)
         peak = self._calculate_peak_hours(hourly)
         quiet = self._calculate_quiet_hours(hourly)
-        object_types = self._calculate_object_type_distribution(events)
-        avg_per_day = len(events) / window_days
+        object_types = self._fold_object_buckets(object_buckets)
+        avg_per_day = event_count / window_days
 
         # Upsert pattern record
         now = datetime.now(timezone.utc)
@@ -348,6 +407,8 @@ class PatternService:
 
         db.commit()
         db.refresh(pattern)
+        self._cache_baseline(self._to_pattern_data(camera_id, pattern))
+        get_mcp_context_provider().invalidate_patterns(camera_id)
 
         calc_time_ms = (time.time() - start_time) * 1000
 
@@ -356,7 +417,7 @@ class PatternService:
             extra={
                 "event_type": "pattern_calculation_complete",
                 "camera_id": camera_id,
-                "event_count": len(events),
+                "event_count": event_count,
                 "window_days": window_days,
                 "avg_events_per_day": round(avg_per_day, 2),
                 "peak_hours_count": len(peak),
@@ -436,41 +497,56 @@ class PatternService:
             "elapsed_ms": round(elapsed_ms, 2),
         }
 
-    def _calculate_hourly_distribution(self, events: list[Event]) -> dict[str, int]:
+    def _fold_time_buckets(
+        self, buckets: Iterable[Tuple[int, int, int]]
+    ) -> Tuple[dict[str, int], dict[str, int]]:
         """
-        Calculate events per hour (0-23) across all days.
+        Fold (hour, day-of-week, count) rows into hourly and daily distributions.
 
         Args:
-            events: List of events to analyze
+            buckets: Rows of hour (0-23), SQL day-of-week (0=Sunday) and count
 
         Returns:
-            Dictionary mapping hour (zero-padded string) to event count
+            (hourly, daily): counts keyed by zero-padded hour and by
+            day-of-week string (Monday=0)
         """
         hourly = {str(h).zfill(2): 0 for h in range(24)}
+        daily = {str(d): 0 for d in range(7)}
 
-        for event in events:
-            hour = str(event.timestamp.hour).zfill(2)
-            hourly[hour] = hourly.get(hour, 0) + 1
+        for hour, dow, count in buckets:
+            hour_key = str(int(hour)).zfill(2)
+            day_key = str((int(dow) + 6) % 7)  # Sunday=0 -> Monday=0
+            hourly[hour_key] += count
+            daily[day_key] += count
 
-        return hourly
+        return hourly, daily
 
-    def _calculate_daily_distribution(self, events: list[Event]) -> dict[str, int]:
+    def _fold_object_buckets(self, buckets: Iterable[Tuple[Optional[str], int]]) -> dict[str, int]:
         """
-        Calculate events per day-of-week (0-6, Monday=0).
+        Fold (objects_detected JSON, count) rows into an object type distribution.
+
+        Only distinct objects_detected values are decoded, so the cost does
+        not grow with the number of events.
 
         Args:
-            events: List of events to analyze
+            buckets: Rows of objects_detected JSON text and event count
 
         Returns:
-            Dictionary mapping day-of-week (string) to event count
+            Dictionary mapping object type to count
         """
-        daily = {str(d): 0 for d in range(7)}
+        object_types: dict[str, int] = {}
 
-        for event in events:
-            day = str(event.timestamp.weekday())
-            daily[day] = daily.get(day, 0) + 1
+        for objects_json, count in buckets:
+            try:
+                objects = json.loads(objects_json) if objects_json else None
+            except (json.JSONDecodeError, TypeError):
+                continue
+            if isinstance(objects, list):
+                for obj_type in objects:
+                    if obj_type and isinstance(obj_type, str):
+                        object_types[obj_type] = object_types.get(obj_type, 0) + count
 
-        return daily
+        return object_types
 
     def _calculate_peak_hours(self, hourly_distribution: dict[str, int]) -> list[str]:
         """
@@ -533,32 +609,6 @@ class PatternService:
 
         return sorted(quiet_hours)
 
-    def _calculate_object_type_distribution(self, events: list[Event]) -> dict[str, int]:
-        """
-        Calculate frequency of each detected object type.
-
-        Args:
-            events: List of events to analyze
-
-        Returns:
-            Dictionary mapping object type to count, e.g., {"person": 150, "vehicle": 45}
-        """
-        object_types: dict[str, int] = {}
-
-        for event in events:
-            if event.objects_detected:
-                try:
-                    objects = json.loads(event.objects_detected)
-                    if isinstance(objects, list):
-                        for obj_type in objects:
-                            if obj_type and isinstance(obj_type, str):
-                                object_types[obj_type] = object_types.get(obj_type, 0) + 1
-                except (json.JSONDecodeError, TypeError):
-                    # Skip events with invalid JSON
-                    continue
-
-        return object_types
-
     async def update_baseline_incremental(
         self,
         db: Session,
@@ -635,6 +685,7 @@ class PatternService:
 
             db.commit()
             db.refresh(pattern)
+            self._cache_baseline(self._to_pattern_data(camera_id, pattern))
 
             update_time_ms = (time.time() - start_time) * 1000
 
@@ -672,14 +723,3 @@ def get_pattern_service() -> PatternService:
 def reset_pattern_service() -> None:
     """Reset the global PatternService instance (for testing)."""
     PatternService._reset_instance()
-
-    return _pattern_service
-
-
-def reset_pattern_service() -> None:
-    """
-    Reset the global PatternService instance.
-
-    Useful for testing to ensure a fresh instance.
-    """
-    PatternService._reset_instance()
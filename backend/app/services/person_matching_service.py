@@ -145,6 +145,42 @@ class PersonMatchingService:
             threshold: Minimum similarity score for matching
             update_appearance: If True, update reference embedding on high-confidence match
 
+        Returns:
+            List of PersonMatchResult, one per face embedding (same order)
+        """
+        return self.match_faces_sync(
+            db,
+            face_embedding_ids,
+            auto_create=auto_create,
+            threshold=threshold,
+            update_appearance=update_appearance,
+        )
+
+    def match_faces_sync(
+        self,
+        db: Session,
+        face_embedding_ids: list[str],
+        auto_create: bool = True,
+        threshold: float = DEFAULT_THRESHOLD,
+        update_appearance: bool = True,
+        commit: bool = True,
+    ) -> list[PersonMatchResult]:
+        """
+        Synchronous core of match_faces_to_persons.
+
+        With ``commit=False`` changes are only flushed, so the matches can be
+        staged inside a caller's transaction (e.g. a DatabaseWriter callable).
+        The person cache is updated as matches are made; callers that may
+        roll back must invalidate it on failure.
+
+        Args:
+            db: SQLAlchemy database session
+            face_embedding_ids: List of FaceEmbedding IDs to match
+            auto_create: If True, create new person when no match found
+            threshold: Minimum similarity score for matching
+            update_appearance: If True, update reference embedding on high-confidence match
+            commit: Commit after each match (False only flushes)
+
         Returns:
             List of PersonMatchResult, one per face embedding (same order)
         """
@@ -154,12 +190,13 @@ class PersonMatchingService:
         results = []
         for face_id in face_embedding_ids:
             try:
-                result = await self.match_single_face(
+                result = self._match_single_face(
                     db,
                     face_id,
                     threshold=threshold,
                     auto_create=auto_create,
                     update_appearance=update_appearance,
+                    commit=commit,
                 )
                 results.append(result)
             except Exception as e:
@@ -210,6 +247,24 @@ class PersonMatchingService:
         Raises:
             ValueError: If face embedding not found
         """
+        return self._match_single_face(
+            db,
+            face_embedding_id,
+            threshold=threshold,
+            auto_create=auto_create,
+            update_appearance=update_appearance,
+        )
+
+    def _match_single_face(
+        self,
+        db: Session,
+        face_embedding_id: str,
+        threshold: float,
+        auto_create: bool,
+        update_appearance: bool,
+        commit: bool = True,
+    ) -> PersonMatchResult:
+        """Synchronous core of match_single_face (see match_faces_sync)."""
         from app.models.face_embedding import FaceEmbedding
         from app.models.recognized_entity import RecognizedEntity, EntityEvent
 
@@ -233,8 +288,8 @@ class PersonMatchingService:
         # If no persons exist, create first one (if auto_create enabled)
         if not self._person_cache:
             if auto_create:
-                result = await self._create_new_person(
-                    db, face_embedding, embedding_vector, bounding_box
+                result = self._create_new_person(
+                    db, face_embedding, embedding_vector, bounding_box, commit=commit
                 )
                 match_time_ms = (time.time() - start_time) * 1000
                 logger.info(
@@ -277,7 +332,7 @@ class PersonMatchingService:
         if best_idx >= 0:
             # Match found
             matched_person_id = person_ids[best_idx]
-            result = await self._update_existing_person(
+            result = self._update_existing_person(
                 db,
                 face_embedding,
                 matched_person_id,
@@ -285,6 +340,7 @@ class PersonMatchingService:
                 embedding_vector,
                 bounding_box,
                 update_appearance,
+                commit=commit,
             )
             logger.info(
                 f"Face {face_embedding_id} matched to person {matched_person_id}",
@@ -301,8 +357,8 @@ class PersonMatchingService:
         else:
             # No match found
             if auto_create:
-                result = await self._create_new_person(
-                    db, face_embedding, embedding_vector, bounding_box
+                result = self._create_new_person(
+                    db, face_embedding, embedding_vector, bounding_box, commit=commit
                 )
                 logger.info(
                     f"New person created from face {face_embedding_id}",
@@ -336,12 +392,13 @@ class PersonMatchingService:
                     bounding_box=bounding_box,
                 )
 
-    async def _create_new_person(
+    def _create_new_person(
         self,
         db: Session,
         face_embedding,  # FaceEmbedding model
         embedding_vector: list[float],
         bounding_box: dict,
+        commit: bool = True,
     ) -> PersonMatchResult:
         """Create a new person entity from a face embedding."""
         from app.models.recognized_entity import RecognizedEntity, EntityEvent
@@ -381,7 +438,10 @@ class PersonMatchingService:
         )
         db.add(entity_event)
 
-        db.commit()
+        if commit:
+            db.commit()
+        else:
+            db.flush()
 
         # Update cache
         self._person_cache[person_id] = embedding_vector
@@ -396,7 +456,7 @@ class PersonMatchingService:
             bounding_box=bounding_box,
         )
 
-    async def _update_existing_person(
+    def _update_existing_person(
         self,
         db: Session,
         face_embedding,  # FaceEmbedding model
@@ -405,6 +465,7 @@ class PersonMatchingService:
         embedding_vector: list[float],
         bounding_box: dict,
         update_appearance: bool,
+        commit: bool = True,
     ) -> PersonMatchResult:
         """Update an existing person with new face occurrence."""
         from app.models.recognized_entity import RecognizedEntity, EntityEvent
@@ -477,8 +538,11 @@ class PersonMatchingService:
             )
             db.add(entity_event)
 
-        db.commit()
-        db.refresh(person)
+        if commit:
+            db.commit()
+            db.refresh(person)
+        else:
+            db.flush()
 
         return PersonMatchResult(
             face_embedding_id=face_embedding.id,
@@ -0,0 +1,685 @@
+"""
+End-to-end pipeline throughput benchmark.
+
+Measures how many events per second this instance can take from camera frame
+to stored event to notification, without a real AI provider:
+
+- Synthetic cameras: one ``CameraCaptureWorker`` per camera with an injected
+  frame producer. The producer renders a static textured scene and a moving
+  object for the first second of every ``motion_period_seconds``.
+- Motion: frames are pulled from each worker and run through
+  ``MotionDetector``. Detections outside the per-camera cooldown become
+  ``ProcessingEvent``s.
+- ``EventProcessor``: its real queue (drop-oldest when full) and
+  ``AIWorkerPool``, whose workers run ``AIProcessingCoordinator.process_event``
+  as in production: cost caps, thumbnail, context prompt, vision analysis,
+  store and the post-processing graph (push, MQTT, cost alerts, ...). The
+  coordinator's stage methods are timed in place.
+- Synthetic Protect events: native smart detections delivered to
+  ``ProtectEventHandler.handle_event`` at ``protect_events_per_second``. A
+  ``SyntheticProtectClient`` registered as the controller connection serves
+  the snapshots; analysis, storage and broadcast are the handler's own.
+- Every vision call, on either path, is answered by a ``LocalVisionProvider``.
+
+Embeddings and entity matching need local ML models and are not part of the
+run (the coordinator gets no embedding service and skips them).
+
+Pass ``engine`` to run against a scratch database: for the duration of the
+run the app's session factories are bound to it, so cameras, events, usage
+rows and notification lookups all go there instead of the configured
+database.
+
+The report lists, per stage, throughput, p50/p99 latency and sampled queue
+depths. It also records the git commit and configuration so runs can be
+compared (``compare_reports``). ``scripts/benchmark_pipeline.py`` is the
+command-line entry point.
+"""
+import asyncio
+import logging
+import math
+import os
+import platform
+import subprocess
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, Iterator, List, Optional, Set
+
+import cv2
+import numpy as np
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import sessionmaker
+from uiprotect.data.types import EventType as ProtectEventType, SmartDetectObjectType
+
+from app.core.config import settings
+from app.core import database
+from app.models.ai_usage import AIUsage
+from app.models.camera import Camera
+from app.models.event import Event
+from app.services.ai_processing_coordinator import AIProcessingCoordinator
+from app.services.ai_providers.local_provider import LocalProviderProfile, LocalVisionProvider
+from app.services.ai_types import AIProvider
+from app.services.ai_worker_pool import AIWorkerPool
+from app.services.camera_capture_worker import CameraCaptureWorker
+from app.services.event_processor import EventProcessor, ProcessingEvent
+from app.services.motion_detector import MotionDetector
+from app.services.protect_event_handler import ProtectEventHandler, get_protect_event_handler
+from app.services.protect_service import get_protect_service
+from app.services.vision_analysis_orchestrator import (
+    VisionAnalysisOrchestrator,
+    reset_vision_analysis_orchestrator,
+)
+
+logger = logging.getLogger(__name__)
+
+REPORT_SCHEMA_VERSION = 2
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+PROTECT_CONTROLLER_ID = "benchmark-controller"
+
+# Stages in pipeline order. "protect" is a Protect event from delivery to the
+# handler's return; "end_to_end" runs from detection to a fully processed
+# event on either path.
+STAGES = (
+    "capture", "motion", "queue_wait", "thumbnail", "ai", "store", "post_processing",
+    "protect", "end_to_end",
+)
+
+
+@dataclass
+class PipelineBenchmarkConfig:
+    """
+    Load to generate.
+
+    Attributes:
+        cameras: Synthetic RTSP cameras
+        camera_fps: Frame rate of each synthetic camera
+        motion_period_seconds: Each camera shows one second of motion per period
+        motion_cooldown_seconds: Minimum time between motion events per camera
+        protect_events_per_second: Rate of synthetic Protect smart detections
+            (analyzed single-frame from the controller snapshot)
+        duration_seconds: Load generation time (queued events are then drained)
+        drain_timeout_seconds: Maximum time to wait for queued events afterwards
+        workers: EventProcessor AI workers
+        queue_maxsize: EventProcessor queue size
+        frame_width: Width of generated frames
+        frame_height: Height of generated frames
+        provider: Simulated vision provider
+        seed: Seed for frame noise and camera phases
+    """
+    cameras: int = 4
+    camera_fps: int = 10
+    motion_period_seconds: float = 3.0
+    motion_cooldown_seconds: float = 2.0
+    protect_events_per_second: float = 1.0
+    duration_seconds: float = 20.0
+    drain_timeout_seconds: float = 30.0
+    workers: int = 2
+    queue_maxsize: int = 50
+    frame_width: int = 640
+    frame_height: int = 360
+    provider: LocalProviderProfile = field(default_factory=lambda: LocalProviderProfile(seed=0))
+    seed: int = 0
+
+
+class StageRecorder:
+    """Thread-safe latency samples and counts for one stage."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.latencies_ms: List[float] = []
+        self.count = 0
+        self.errors = 0
+
+    def add(self, latency_ms: Optional[float] = None, ok: bool = True) -> None:
+        with self._lock:
+            self.count += 1
+            if not ok:
+                self.errors += 1
+            if latency_ms is not None:
+                self.latencies_ms.append(latency_ms)
+
+    def summary(self, elapsed_seconds: float) -> Dict[str, Any]:
+        with self._lock:
+            latencies = sorted(self.latencies_ms)
+            count, errors = self.count, self.errors
+        result: Dict[str, Any] = {
+            "count": count,
+            "errors": errors,
+            "throughput_per_second": round(count / elapsed_seconds, 3) if elapsed_seconds > 0 else 0.0,
+        }
+        if latencies:
+            result.update({
+                "p50_ms": round(_percentile(latencies, 50), 2),
+                "p99_ms": round(_percentile(latencies, 99), 2),
+                "max_ms": round(latencies[-1], 2),
+            })
+        return result
+
+
+class DepthSampler:
+    """Periodic samples of a queue size."""
+
+    def __init__(self, read: Callable[[], int]):
+        self._read = read
+        self.samples: List[int] = []
+
+    def sample(self) -> None:
+        try:
+            self.samples.append(int(self._read()))
+        except Exception:
+            pass
+
+    def summary(self) -> Dict[str, Any]:
+        if not self.samples:
+            return {"max": 0, "mean": 0.0, "p99": 0}
+        ordered = sorted(self.samples)
+        return {
+            "max": ordered[-1],
+            "mean": round(sum(ordered) / len(ordered), 2),
+            "p99": _percentile(ordered, 99),
+        }
+
+
+def _percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    rank = math.ceil(pct / 100 * len(sorted_values))
+    return sorted_values[min(max(rank, 1), len(sorted_values)) - 1]
+
+
+class SyntheticScene:
+    """Frame producer for one camera: static texture plus periodic motion."""
+
+    def __init__(self, config: PipelineBenchmarkConfig, phase_seconds: float, seed: int):
+        self.config = config
+        self.phase = phase_seconds
+        rng = np.random.default_rng(seed)
+        coarse = rng.integers(40, 215, (9, 16, 3), dtype=np.uint8)
+        self.background = cv2.resize(
+            coarse, (config.frame_width, config.frame_height), interpolation=cv2.INTER_CUBIC
+        )
+        self.started = time.monotonic()
+
+    def __call__(self) -> np.ndarray:
+        frame = self.background.copy()
+        t = (time.monotonic() - self.started + self.phase) % self.config.motion_period_seconds
+        if t < 1.0:
+            width, height = self.config.frame_width, self.config.frame_height
+            x = int(t * (width - width // 5))
+            cv2.rectangle(frame, (x, height // 4), (x + width // 5, height - 10), (25, 25, 25), -1)
+        return frame
+
+
+class SyntheticProtectClient:
+    """ProtectApiClient stand-in that serves one synthetic snapshot."""
+
+    def __init__(self, snapshot: np.ndarray):
+        ok, encoded = cv2.imencode(".jpg", snapshot)
+        self.snapshot_jpeg = encoded.tobytes() if ok else b""
+
+    async def get_camera_snapshot(self, camera_id: str, width=None, height=None) -> bytes:
+        return self.snapshot_jpeg
+
+
+# handle_event dispatches on the class name of the uiprotect model
+_ProtectEvent = type("Event", (SimpleNamespace,), {})
+
+
+class PipelineBenchmark:
+    """
+    Drives synthetic load through EventProcessor and reports per-stage numbers.
+
+    Usage:
+        report = await PipelineBenchmark(PipelineBenchmarkConfig(duration_seconds=10)).run()
+        report = await PipelineBenchmark(config, engine=create_engine("sqlite:///bench.db")).run()
+    """
+
+    def __init__(self, config: Optional[PipelineBenchmarkConfig] = None, engine: Optional[Engine] = None):
+        """
+        Args:
+            config: Load to generate (defaults to PipelineBenchmarkConfig())
+            engine: Database to run against, with tables created; None uses
+                    the app's configured database
+        """
+        self.config = config or PipelineBenchmarkConfig()
+        self.engine = engine or database.engine
+        self._session_factory = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        self.stages: Dict[str, StageRecorder] = {name: StageRecorder() for name in STAGES}
+        self.motion_events = 0
+        self.protect_events = 0
+        self.protect_failures = 0
+        self._camera_ids: List[str] = []
+        self._stop = asyncio.Event()
+        self._last_event_at: Dict[str, float] = {}
+        self._in_flight = 0
+        self._protect_tasks: Set[asyncio.Task] = set()
+
+    # ------------------------------------------------------------------
+    # Setup / teardown
+    # ------------------------------------------------------------------
+
+    def _create_cameras(self) -> List[Camera]:
+        cameras = []
+        with self._session_factory() as db:
+            for index in range(self.config.cameras + 1):
+                protect = index == self.config.cameras
+                camera = Camera(
+                    id=str(uuid.uuid4()),
+                    name="Benchmark Protect" if protect else f"Benchmark {index + 1}",
+                    type="rtsp",
+                    rtsp_url="rtsp://127.0.0.1:554/benchmark",
+                    source_type="protect" if protect else "rtsp",
+                    frame_rate=max(1, min(30, self.config.camera_fps)),
+                    motion_cooldown=0,
+                    is_enabled=True,
+                )
+                if protect:
+                    camera.protect_camera_id = f"benchmark-{uuid.uuid4().hex[:12]}"
+                    camera.smart_detection_types = '["person"]'
+                    camera.analysis_mode = "single_frame"
+                db.add(camera)
+                cameras.append(camera)
+            db.commit()
+            for camera in cameras:
+                db.refresh(camera)
+                db.expunge(camera)
+        self._camera_ids = [camera.id for camera in cameras]
+        return cameras
+
+    def _cleanup(self) -> None:
+        """Delete everything the run wrote (events, thumbnails, usage rows, cameras)."""
+        thumbnails_dir = BACKEND_DIR / "data" / "thumbnails"
+        try:
+            with self._session_factory() as db:
+                events = db.query(Event).filter(Event.camera_id.in_(self._camera_ids)).all()
+                for event in events:
+                    if event.thumbnail_path:
+                        date_str, filename = event.thumbnail_path.rsplit("/", 2)[-2:]
+                        (thumbnails_dir / date_str / filename).unlink(missing_ok=True)
+                    db.delete(event)
+                db.query(AIUsage).filter(AIUsage.provider == "local").delete(synchronize_session=False)
+                db.query(Camera).filter(Camera.id.in_(self._camera_ids)).delete(synchronize_session=False)
+                db.commit()
+        except Exception as e:
+            logger.warning(f"Benchmark cleanup failed: {e}")
+
+    @contextmanager
+    def _bind_sessions(self) -> Iterator[None]:
+        """Point the app's session factories at self.engine for the run."""
+        if self.engine is database.engine:
+            yield
+            return
+        writer_engine = self.engine
+        if self.engine.url.get_backend_name() == "sqlite" and self.engine.url.database not in (None, "", ":memory:"):
+            writer_engine = database.create_sqlite_writer_engine(self.engine.url.render_as_string(hide_password=False))
+        factories = (
+            (database.SessionLocal, self.engine),
+            (database.ReadSessionLocal, self.engine),
+            (database.WriterSessionLocal, writer_engine),
+        )
+        previous = [factory.kw["bind"] for factory, _ in factories]
+        for factory, bind in factories:
+            factory.configure(bind=bind)
+        try:
+            yield
+        finally:
+            for (factory, _), bind in zip(factories, previous):
+                factory.configure(bind=bind)
+            if writer_engine is not self.engine:
+                writer_engine.dispose()
+
+    @contextmanager
+    def _bind_provider(self, provider: LocalVisionProvider) -> Iterator[VisionAnalysisOrchestrator]:
+        """Answer every vision call of the run from the local provider."""
+        from app.services.ai_service import ai_service
+
+        async def keep_local_provider(db) -> None:
+            return None
+
+        reset_vision_analysis_orchestrator()
+        orchestrator = VisionAnalysisOrchestrator(providers={AIProvider.OPENAI: provider})
+        previous = (ai_service.providers, ai_service.vision_orchestrator)
+        ai_service.providers = {AIProvider.OPENAI: provider}
+        ai_service.vision_orchestrator = orchestrator
+        # The Protect pipeline reloads provider keys before every analysis,
+        # which would replace the stand-in with the database's providers
+        ai_service.load_api_keys_from_db = keep_local_provider
+        try:
+            yield orchestrator
+        finally:
+            del ai_service.load_api_keys_from_db
+            ai_service.providers, ai_service.vision_orchestrator = previous
+            reset_vision_analysis_orchestrator()
+
+    @contextmanager
+    def _bind_protect(self) -> Iterator[ProtectEventHandler]:
+        """Connect the synthetic controller and lift the handler's per-camera cooldown."""
+        protect_service = get_protect_service()
+        snapshot = SyntheticScene(self.config, phase_seconds=0.5, seed=self.config.seed + 1000)()
+        protect_service._connections[PROTECT_CONTROLLER_ID] = SyntheticProtectClient(snapshot)
+        handler = get_protect_event_handler()
+        previous_cooldown = handler.event_filter.cooldown_seconds
+        handler.event_filter.cooldown_seconds = 0
+        try:
+            yield handler
+        finally:
+            handler.event_filter.cooldown_seconds = previous_cooldown
+            for camera_id in self._camera_ids:
+                handler.clear_event_tracking(camera_id)
+            protect_service._connections.pop(PROTECT_CONTROLLER_ID, None)
+
+    def _timed(self, stage: str, func: Callable, ok: Callable[[Any], bool] = bool) -> Callable:
+        """Wrap a coordinator method so each call is recorded under ``stage``."""
+        recorder = self.stages[stage]
+        if asyncio.iscoroutinefunction(func):
+            async def timed_async(*args, **kwargs):
+                started = time.perf_counter()
+                try:
+                    result = await func(*args, **kwargs)
+                except BaseException:
+                    recorder.add((time.perf_counter() - started) * 1000, ok=False)
+                    raise
+                recorder.add((time.perf_counter() - started) * 1000, ok=ok(result))
+                return result
+            return timed_async
+
+        def timed(*args, **kwargs):
+            started = time.perf_counter()
+            try:
+                result = func(*args, **kwargs)
+            except BaseException:
+                recorder.add((time.perf_counter() - started) * 1000, ok=False)
+                raise
+            recorder.add((time.perf_counter() - started) * 1000, ok=ok(result))
+            return result
+        return timed
+
+    def _create_coordinator(self, processor: EventProcessor) -> AIProcessingCoordinator:
+        """Build the coordinator as EventProcessor.start does, minus the ML-model services."""
+        from app.services.ai_service import ai_service
+        from app.services.service_container import container
+
+        coordinator = AIProcessingCoordinator(
+            ai_service=ai_service,
+            metrics=processor.metrics,
+            context_prompt_service=container.context_prompt_service,
+            cost_alert_service=container.cost_alert_service,
+            embedding_service=None,
+            mqtt_service=container.mqtt_service,
+            store_event=processor._store_event_with_retry,
+        )
+        coordinator._generate_thumbnail = self._timed("thumbnail", coordinator._generate_thumbnail)
+        coordinator._generate_ai_description = self._timed(
+            "ai", coordinator._generate_ai_description, ok=lambda result: bool(result and result.success)
+        )
+        coordinator._store_processed_event = self._timed("store", coordinator._store_processed_event)
+        coordinator._run_post_processing = self._timed(
+            "post_processing", coordinator._run_post_processing, ok=lambda summary: True
+        )
+        return coordinator
+
+    # ------------------------------------------------------------------
+    # Load generators
+    # ------------------------------------------------------------------
+
+    async def _motion_loop(self, camera: Camera, worker: CameraCaptureWorker, processor: EventProcessor) -> None:
+        """Pull frames like CameraTaskManager and queue motion events."""
+        detector = MotionDetector(algorithm=camera.motion_algorithm or "mog2")
+        interval = 1.0 / max(1, self.config.camera_fps)
+        while not self._stop.is_set():
+            frame = await asyncio.to_thread(worker.get_frame, interval)
+            if frame is None:
+                continue
+            started = time.perf_counter()
+            detected, confidence, bbox = detector.detect_motion(frame, sensitivity=camera.motion_sensitivity)
+            self.stages["motion"].add((time.perf_counter() - started) * 1000)
+            if not detected:
+                continue
+            now = time.monotonic()
+            if now - self._last_event_at.get(camera.id, 0.0) < self.config.motion_cooldown_seconds:
+                continue
+            self._last_event_at[camera.id] = now
+            self.motion_events += 1
+            await self._queue(processor, ProcessingEvent(
+                camera_id=camera.id,
+                camera_name=camera.name,
+                frame=frame,
+                timestamp=datetime.now(timezone.utc),
+                detected_objects=["unknown"],
+                metadata={"source": "camera_capture_worker", "motion_confidence": confidence, "motion_bbox": bbox},
+            ), detected_at=started)
+
+    async def _protect_loop(self, camera: Camera, handler: ProtectEventHandler) -> None:
+        """Deliver synthetic Protect smart detections at a fixed rate."""
+        if self.config.protect_events_per_second <= 0:
+            return
+        interval = 1.0 / self.config.protect_events_per_second
+        next_at = time.perf_counter()
+        while not self._stop.is_set():
+            next_at += interval
+            self.protect_events += 1
+            # Like the uiprotect websocket callback, each message is handled concurrently
+            task = asyncio.create_task(self._handle_protect_event(camera, handler))
+            self._protect_tasks.add(task)
+            task.add_done_callback(self._protect_tasks.discard)
+            await asyncio.sleep(max(0.0, next_at - time.perf_counter()))
+
+    async def _handle_protect_event(self, camera: Camera, handler: ProtectEventHandler) -> None:
+        self._in_flight += 1
+        started = time.perf_counter()
+        try:
+            event = _ProtectEvent(
+                id=uuid.uuid4().hex,
+                type=ProtectEventType.SMART_DETECT,
+                camera_id=camera.protect_camera_id,
+                smart_detect_types=[SmartDetectObjectType.PERSON],
+                start=datetime.now(timezone.utc),
+            )
+            ok = await handler.handle_event(PROTECT_CONTROLLER_ID, SimpleNamespace(new_obj=event))
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self.stages["protect"].add(elapsed_ms, ok=ok)
+            if ok:
+                self.stages["end_to_end"].add(elapsed_ms)
+            else:
+                self.protect_failures += 1
+        finally:
+            self._in_flight -= 1
+
+    async def _queue(self, processor: EventProcessor, event: ProcessingEvent, detected_at: float) -> None:
+        event.metadata["benchmark_detected_at"] = detected_at
+        event.metadata["benchmark_queued_at"] = time.perf_counter()
+        await processor.queue_event(event)
+
+    # ------------------------------------------------------------------
+    # Per-event pipeline (runs on the EventProcessor workers)
+    # ------------------------------------------------------------------
+
+    async def _process_event(self, event: ProcessingEvent, worker_id: int) -> bool:
+        self._in_flight += 1
+        try:
+            self.stages["queue_wait"].add((time.perf_counter() - event.metadata["benchmark_queued_at"]) * 1000)
+            ok = await self._coordinator.process_event(event, worker_id)
+            if ok:
+                self.stages["end_to_end"].add(
+                    (time.perf_counter() - event.metadata["benchmark_detected_at"]) * 1000
+                )
+            return ok
+        finally:
+            self._in_flight -= 1
+
+    async def _sample_depths(self, samplers: Dict[str, DepthSampler]) -> None:
+        while True:
+            for sampler in samplers.values():
+                sampler.sample()
+            await asyncio.sleep(0.1)
+
+    # ------------------------------------------------------------------
+    # Run
+    # ------------------------------------------------------------------
+
+    async def run(self) -> Dict[str, Any]:
+        """Generate load for duration_seconds, drain the queue and return the report."""
+        provider = LocalVisionProvider(self.config.provider)
+        with self._bind_sessions(), self._bind_provider(provider), self._bind_protect() as handler:
+            return await self._run(provider, handler)
+
+    async def _run(self, provider: LocalVisionProvider, handler: ProtectEventHandler) -> Dict[str, Any]:
+        from app.services.service_container import container
+
+        config = self.config
+        cameras = self._create_cameras()
+        rtsp_cameras, protect_camera = cameras[:-1], cameras[-1]
+
+        writer = container.database_writer
+        started_writer = False
+        is_sqlite = self.engine.url.get_backend_name() == "sqlite"
+        if is_sqlite and settings.SQLITE_SINGLE_WRITER and not writer.is_running:
+            writer.start()
+            started_writer = True
+
+        processor = EventProcessor(worker_count=config.workers, queue_maxsize=config.queue_maxsize)
+        self._coordinator = self._create_coordinator(processor)
+        processor.ai_processing_coordinator = self._coordinator
+        processor.running = True
+        processor.ai_worker_pool = AIWorkerPool(
+            worker_count=processor.worker_count,
+            event_queue=processor.event_queue,
+            process_event=self._process_event,
+            metrics=processor.metrics,
+            is_running=lambda: processor.running,
+        )
+
+        loop = asyncio.get_running_loop()
+        workers = []
+        for index, camera in enumerate(rtsp_cameras):
+            scene = SyntheticScene(
+                config,
+                phase_seconds=index * config.motion_period_seconds / max(1, len(rtsp_cameras)),
+                seed=config.seed + index,
+            )
+            workers.append(CameraCaptureWorker(camera, loop, frame_producer=scene))
+
+        depth_samplers = {
+            "event_queue": DepthSampler(processor.event_queue.qsize),
+            "capture_queues": DepthSampler(lambda: sum(w.get_queue_size() for w in workers)),
+            "database_writer": DepthSampler(lambda: writer.queue_depth),
+        }
+
+        run_started = time.perf_counter()
+        tasks: List[asyncio.Task] = []
+        drained = True
+        frames_captured = frames_dropped = 0
+        capture_elapsed = float(config.duration_seconds)
+        try:
+            await processor.ai_worker_pool.start()
+            for worker in workers:
+                worker.start()
+            for camera, worker in zip(rtsp_cameras, workers):
+                tasks.append(asyncio.create_task(self._motion_loop(camera, worker, processor)))
+            tasks.append(asyncio.create_task(self._protect_loop(protect_camera, handler)))
+
+            sampler_task = asyncio.create_task(self._sample_depths(depth_samplers))
+            await asyncio.sleep(config.duration_seconds)
+
+            self._stop.set()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            tasks.append(sampler_task)
+            for worker in workers:
+                status = worker.get_status()
+                frames_captured += status.get("frames_captured", 0)
+                frames_dropped += status.get("frames_dropped", 0)
+                worker.stop()
+            capture_elapsed = time.perf_counter() - run_started
+
+            # Queue.join() would wait forever: events dropped on overflow are never task_done()
+            drain_ends = time.perf_counter() + config.drain_timeout_seconds
+            while not processor.event_queue.empty() or self._in_flight:
+                if time.perf_counter() >= drain_ends:
+                    drained = False
+                    break
+                await asyncio.sleep(0.05)
+        finally:
+            self._stop.set()
+            for task in [*tasks, *self._protect_tasks]:
+                task.cancel()
+            for worker in workers:
+                worker.stop()
+            processor.running = False
+            await processor.ai_worker_pool.stop()
+            # Let fire-and-forget tasks spawned by the store stage finish
+            await asyncio.sleep(0.2)
+            if started_writer:
+                writer.stop()
+            self._cleanup()
+
+        elapsed = time.perf_counter() - run_started
+        self.stages["capture"].count = frames_captured
+
+        stages = {name: self.stages[name].summary(elapsed) for name in STAGES}
+        stages["capture"]["throughput_per_second"] = round(frames_captured / capture_elapsed, 3)
+        stages["capture"]["frames_dropped"] = frames_dropped
+
+        completed = self.stages["end_to_end"].count
+        failed = processor.metrics.events_processed_failure + self.protect_failures
+        return {
+            "schema": REPORT_SCHEMA_VERSION,
+            "started_at": datetime.now(timezone.utc).isoformat(),
+            "commit": _git_commit(),
+            "environment": {
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "cpus": os.cpu_count(),
+                "database": self.engine.url.get_backend_name(),
+            },
+            "config": asdict(config),
+            "elapsed_seconds": round(elapsed, 3),
+            "events": {
+                "motion": self.motion_events,
+                "protect": self.protect_events,
+                "completed": completed,
+                "failed": failed,
+                "dropped": self.motion_events + self.protect_events - completed - failed,
+                "drained": drained,
+            },
+            "events_per_second": round(completed / elapsed, 3) if elapsed > 0 else 0.0,
+            "provider_calls": provider.calls,
+            "stages": stages,
+            "queue_depths": {name: sampler.summary() for name, sampler in depth_samplers.items()},
+        }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=BACKEND_DIR, capture_output=True, text=True, timeout=5,
+        ).stdout.strip() or None
+    except Exception:
+        return None
+
+
+def compare_reports(baseline: Dict[str, Any], current: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Per-stage differences between two reports.
+
+    Returns:
+        One row per stage and metric with baseline, current and the change in
+        percent (positive = higher in current)
+    """
+    rows = []
+    pairs = [("pipeline", "events_per_second", baseline.get("events_per_second"), current.get("events_per_second"))]
+    for stage in STAGES:
+        before = baseline.get("stages", {}).get(stage, {})
+        after = current.get("stages", {}).get(stage, {})
+        for metric in ("throughput_per_second", "p50_ms", "p99_ms"):
+            pairs.append((stage, metric, before.get(metric), after.get(metric)))
+    for stage, metric, before, after in pairs:
+        if before is None or after is None:
+            continue
+        change = round((after - before) / before * 100, 1) if before else None
+        rows.append({"stage": stage, "metric": metric, "baseline": before, "current": after, "change_pct": change})
+    return rows
@@ -0,0 +1,302 @@
+"""
+Post-Processing Graph
+
+Once an event is stored, AIProcessingCoordinator fans out to a set of side
+effects: push notification, MQTT, camera status sensors, HomeKit triggers,
+cost alerts, embedding storage, face/vehicle/entity follow-ups. These used
+to run one after the other, so the push notification waited behind every
+step declared before it.
+
+PostProcessingGraph runs them as declared stages instead:
+
+- A stage starts as soon as every stage in its ``depends_on`` has finished
+  (whatever their outcome); stages without dependencies start immediately.
+- At most ``max_concurrency`` stages run at once, in declaration order, so
+  latency-sensitive stages (push) should be declared first.
+- Each stage runs under its own timeout: the stage's ``timeout``, else its
+  entry in POST_PROCESSING_STAGE_TIMEOUTS, else the graph default. A stage
+  that raises or times out is recorded and logged; it never fails the event
+  or its siblings.
+- Every stage's status and duration is kept in ``results`` for
+  ``post_processing_summary`` and observed in Prometheus.
+
+EventUnitOfWork collects the DB writes stages want to make for the event
+(Event column updates, new rows such as the embedding, and staged write
+callables such as cost alert notifications) and commits them in one
+transaction at the end. Stages whose results later stages need (face and
+vehicle matches) write immediately with ``write``. Either way the write
+goes through the single writer when it is running and a sync session in a
+worker thread otherwise, never through a private session.
+
+Usage:
+    uow = EventUnitOfWork(event_id)
+    graph = PostProcessingGraph([
+        PostProcessingStage("push", send_push),
+        PostProcessingStage("embedding", lambda: stage_embedding(uow)),
+        PostProcessingStage("persist", persist, depends_on=("push", "embedding")),
+    ])
+    results = await graph.run()
+"""
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+StageFn = Callable[[], Awaitable[Any]]
+
+STATUS_OK = "ok"
+STATUS_ERROR = "error"
+STATUS_TIMEOUT = "timeout"
+
+
+@dataclass(frozen=True)
+class PostProcessingStage:
+    """One node of the post-processing graph."""
+    name: str
+    run: StageFn
+    depends_on: Tuple[str, ...] = ()
+    timeout: Optional[float] = None  # seconds; None uses the configured/graph default
+
+
+@dataclass
+class StageResult:
+    """Outcome of one stage."""
+    status: str
+    duration_ms: float
+    value: Any = None
+    error: Optional[str] = None
+
+    def to_summary(self) -> Dict[str, Any]:
+        summary = {"status": self.status, "duration_ms": round(self.duration_ms, 2)}
+        if self.error:
+            summary["error"] = self.error[:200]
+        return summary
+
+
+class PostProcessingGraph:
+    """
+    Runs post-processing stages concurrently along their dependencies.
+
+    Args:
+        stages: Stages in priority order (earlier stages get the
+            concurrency budget first)
+        max_concurrency: Maximum number of stages running at once
+        default_timeout: Per-stage timeout in seconds when a stage does
+            not set its own and has no POST_PROCESSING_STAGE_TIMEOUTS entry
+        stage_timeouts: Per-stage timeouts by stage name (defaults to
+            POST_PROCESSING_STAGE_TIMEOUTS)
+
+    Raises:
+        ValueError: If stage names repeat, a dependency is unknown or the
+            dependencies form a cycle
+    """
+
+    def __init__(
+        self,
+        stages: Sequence[PostProcessingStage],
+        max_concurrency: Optional[int] = None,
+        default_timeout: Optional[float] = None,
+        stage_timeouts: Optional[Dict[str, float]] = None,
+    ):
+        self.stages: List[PostProcessingStage] = list(stages)
+        self.max_concurrency = max_concurrency or settings.POST_PROCESSING_MAX_CONCURRENCY
+        self.default_timeout = (
+            settings.POST_PROCESSING_STAGE_TIMEOUT_SECONDS if default_timeout is None else default_timeout
+        )
+        self.stage_timeouts = (
+            settings.post_processing_stage_timeouts if stage_timeouts is None else stage_timeouts
+        )
+        self.results: Dict[str, StageResult] = {}
+        self._validate()
+
+    def _validate(self) -> None:
+        names = [stage.name for stage in self.stages]
+        if len(names) != len(set(names)):
+            raise ValueError(f"Duplicate post-processing stage names: {names}")
+        by_name = {stage.name: stage for stage in self.stages}
+        for stage in self.stages:
+            unknown = [dep for dep in stage.depends_on if dep not in by_name]
+            if unknown:
+                raise ValueError(f"Stage {stage.name!r} depends on unknown stages {unknown}")
+
+        # Depth-first search for cycles
+        visiting, done = set(), set()
+
+        def visit(name: str) -> None:
+            if name in done:
+                return
+            if name in visiting:
+                raise ValueError(f"Post-processing stages form a cycle through {name!r}")
+            visiting.add(name)
+            for dep in by_name[name].depends_on:
+                visit(dep)
+            visiting.discard(name)
+            done.add(name)
+
+        for name in names:
+            visit(name)
+
+    async def run(self) -> Dict[str, StageResult]:
+        """Run every stage and return their results keyed by stage name."""
+        from app.core import metrics as prom
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        finished = {stage.name: asyncio.Event() for stage in self.stages}
+        started_at = time.perf_counter()
+
+        async def run_stage(stage: PostProcessingStage) -> None:
+            try:
+                for dep in stage.depends_on:
+                    await finished[dep].wait()
+                async with semaphore:
+                    self.results[stage.name] = await self._run_one(stage)
+            finally:
+                finished[stage.name].set()
+
+        await asyncio.gather(*(run_stage(stage) for stage in self.stages))
+
+        for name, result in self.results.items():
+            prom.post_processing_stage_duration_seconds.labels(
+                stage=name, status=result.status
+            ).observe(result.duration_ms / 1000.0)
+        prom.post_processing_duration_seconds.observe(time.perf_counter() - started_at)
+        return self.results
+
+    def timeout_for(self, stage: PostProcessingStage) -> float:
+        """Timeout in seconds that applies to a stage."""
+        if stage.timeout is not None:
+            return stage.timeout
+        return self.stage_timeouts.get(stage.name, self.default_timeout)
+
+    async def _run_one(self, stage: PostProcessingStage) -> StageResult:
+        timeout = self.timeout_for(stage)
+        t0 = time.perf_counter()
+        try:
+            value = await asyncio.wait_for(stage.run(), timeout=timeout)
+            return StageResult(STATUS_OK, (time.perf_counter() - t0) * 1000, value=value)
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"Post-processing stage {stage.name} timed out after {timeout}s",
+                extra={"event_type": "post_processing_stage_timeout", "stage": stage.name, "timeout": timeout}
+            )
+            return StageResult(STATUS_TIMEOUT, (time.perf_counter() - t0) * 1000, error=f"timed out after {timeout}s")
+        except Exception as e:
+            logger.warning(
+                f"Post-processing stage {stage.name} failed: {e}",
+                extra={"event_type": "post_processing_stage_error", "stage": stage.name, "error": str(e)}
+            )
+            return StageResult(STATUS_ERROR, (time.perf_counter() - t0) * 1000, error=str(e))
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """Per-stage status and timing, in declaration order."""
+        return {
+            stage.name: self.results[stage.name].to_summary()
+            for stage in self.stages
+            if stage.name in self.results
+        }
+
+
+class EventUnitOfWork:
+    """
+    Collects post-processing writes for one event and commits them together.
+
+    Stages call ``set`` for columns on the event row, ``add`` for new rows
+    and ``stage`` for write callables; nothing touches the database until
+    ``commit``. Callbacks registered with ``after_commit`` run once the
+    transaction is durable (e.g. WebSocket broadcasts of new rows).
+
+    Write callables follow the DatabaseWriter contract: they receive the
+    Session, may flush but must not commit, and may run more than once if
+    the writer replays a failed group.
+    """
+
+    def __init__(self, event_id: str):
+        self.event_id = event_id
+        self.values: Dict[str, Any] = {}
+        self.new_rows: List[Any] = []
+        self.write_fns: List[Callable[[Session], Any]] = []
+        self.commit_callbacks: List[StageFn] = []
+
+    @property
+    def is_empty(self) -> bool:
+        return not self.values and not self.new_rows and not self.write_fns
+
+    def set(self, **values: Any) -> None:
+        self.values.update(values)
+
+    def add(self, row: Any) -> None:
+        self.new_rows.append(row)
+
+    def stage(self, fn: Callable[[Session], Any]) -> None:
+        self.write_fns.append(fn)
+
+    def after_commit(self, callback: StageFn) -> None:
+        self.commit_callbacks.append(callback)
+
+    def _apply(self, session: Session) -> None:
+        from app.models.event import Event
+
+        session.add_all(self.new_rows)
+        for fn in self.write_fns:
+            # A failing staged write must not take the event's columns with it
+            try:
+                with session.begin_nested():
+                    fn(session)
+            except Exception as e:
+                logger.warning(
+                    f"Staged write failed for event {self.event_id}: {e}",
+                    extra={"event_type": "post_processing_staged_write_error", "event_id": self.event_id}
+                )
+        if self.values:
+            # Plain UPDATE: none of these columns carry media references,
+            # so the ORM flush hooks on Event are not needed
+            session.execute(update(Event).where(Event.id == self.event_id).values(**self.values))
+
+    async def commit(self) -> None:
+        """Write everything collected so far in a single transaction."""
+        if not self.is_empty:
+            await self.write(self._apply)
+
+        for callback in self.commit_callbacks:
+            try:
+                await callback()
+            except Exception as e:
+                logger.warning(
+                    f"Post-commit callback failed for event {self.event_id}: {e}",
+                    extra={"event_type": "post_processing_commit_callback_error", "event_id": self.event_id}
+                )
+
+    async def write(self, fn: Callable[[Session], Any]) -> Any:
+        """
+        Run a write callable in its own transaction right away.
+
+        For stages whose results later stages depend on; the write takes
+        the same path as ``commit``.
+
+        Returns:
+            Whatever ``fn`` returns
+        """
+        from app.services.database_writer import get_database_writer
+
+        writer = get_database_writer()
+        if writer.is_running:
+            return await writer.run(fn)
+        return await asyncio.to_thread(self._write_direct, fn)
+
+    @staticmethod
+    def _write_direct(fn: Callable[[Session], Any]) -> Any:
+        """Direct write path when the single writer is not running."""
+        from app.core.database import get_db_session
+
+        with get_db_session() as db:
+            result = fn(db)
+            db.commit()
+            return result
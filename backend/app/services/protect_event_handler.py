@@ -786,6 +786,23 @@ class ProtectEventHandler:
                 # Generate event ID for clip filename
                 generated_event_id = str(uuid.uuid4())
 
+                # Start pulling snapshot and clip now that the event is known to
+                # qualify, before any other processing. The job is keyed by the
+                # Protect event id; if one already exists for this event, its
+                # event id (which names the clip file) is adopted.
+                prefetch_job = self.media_service.start_prefetch(
+                    controller_id=controller_id,
+                    protect_camera_id=camera.protect_camera_id,
+                    camera_id=camera.id,
+                    camera_name=camera.name,
+                    event_id=generated_event_id,
+                    event_timestamp=event_timestamp,
+                    analysis_mode=camera.analysis_mode,
+                    protect_event_id=str(protect_event_id) if protect_event_id else None,
+                )
+                if prefetch_job is not None:
+                    generated_event_id = prefetch_job.event_id
+
                 # Get primary filter type for AI
                 primary_event_type = matching_types[0] if matching_types else "motion"
                 filter_type = EVENT_TYPE_MAPPING.get(primary_event_type, "motion")
@@ -814,6 +831,7 @@ class ProtectEventHandler:
                     event_timestamp=event_timestamp,
                     is_doorbell_ring=is_doorbell_ring,
                     analysis_mode=camera.analysis_mode,
+                    protect_event_id=str(protect_event_id) if protect_event_id else None,
                 )
                 snapshot_result = media.snapshot_result
                 clip_path = media.clip_path
@@ -855,13 +873,10 @@ class ProtectEventHandler:
                 # is per-event and must be read before any further awaits).
                 persist_tracking = self._persist_tracking_kwargs(fallback_reason)
 
-                # Cleanup clip after AI processing
+                # Cleanup clip after AI processing (cancels a prefetch download
+                # that is still streaming after a partial handoff)
                 if clip_path:
-                    try:
-                        clip_service = get_clip_service()
-                        clip_service.cleanup_clip(generated_event_id)
-                    except Exception as e:
-                        logger.warning(f"Clip cleanup error: {e}")
+                    self.media_service.cleanup_clip(generated_event_id)
 
                 if not ai_result or not ai_result.success:
                     # Store event without AI description
@@ -7,6 +7,8 @@ for a qualifying Protect event.
 Handles:
 - Deciding whether a clip should be downloaded for an event
 - Coordinating with SnapshotService and ClipService
+- Using the prefetch pipeline for native events (snapshot and clip fetched
+  concurrently, started when the Protect event opens)
 - Returning a clean MediaBundle for the AI pipeline
 - Cleanup of temporary media
 
@@ -20,8 +22,10 @@ from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Optional, Tuple
 
+from app.core.config import settings
 from app.services.snapshot_service import get_snapshot_service, SnapshotResult
 from app.services.clip_service import get_clip_service
+from app.services.protect_prefetch_service import PrefetchJob, get_protect_prefetch_service
 from app.core.decorators import singleton
 
 logger = logging.getLogger(__name__)
@@ -67,6 +71,7 @@ class ProtectMediaService:
         event_timestamp: datetime,
         is_doorbell_ring: bool = False,
         analysis_mode: Optional[str] = None,
+        protect_event_id: Optional[str] = None,
     ) -> MediaBundle:
         """
         Retrieve the best available media for AI analysis of this event.
@@ -78,7 +83,34 @@ class ProtectMediaService:
           skip the clip entirely to avoid the bandwidth/latency cost of a clip the
           pipeline will never use. An unset mode defaults to ``multi_frame``.
         - Return a MediaBundle the AI pipeline can use
+
+        When ``protect_event_id`` is given (native Protect events) and prefetch
+        is enabled, the job started by ``start_prefetch`` when the event opened
+        is reused (or started now). ``multi_frame`` may take a partial clip if
+        PROTECT_PREFETCH_PARTIAL_SECONDS is set; ``video_native`` always waits
+        for the complete clip.
         """
+        # The configured mode is authoritative for clip retrieval. A clip is only
+        # useful for multi_frame (frames extracted from it) and video_native (sent
+        # whole). single_frame never needs one. Default unset -> multi_frame.
+        effective_mode = analysis_mode or "multi_frame"
+        should_attempt_clip = effective_mode in ("multi_frame", "video_native")
+
+        job = self.start_prefetch(
+            controller_id,
+            protect_camera_id,
+            camera_id,
+            camera_name,
+            event_id,
+            event_timestamp,
+            analysis_mode=analysis_mode,
+            protect_event_id=protect_event_id,
+        )
+        if job is not None:
+            return await self._get_prefetched_media(
+                job, camera_name, partial_ok=effective_mode == "multi_frame"
+            )
+
         bundle = MediaBundle()
 
         # Always get a snapshot (required for thumbnail and single-frame fallback)
@@ -90,12 +122,6 @@ class ProtectMediaService:
             bundle.fallback_reason = "snapshot_retrieval_failed"
             return bundle
 
-        # The configured mode is authoritative for clip retrieval. A clip is only
-        # useful for multi_frame (frames extracted from it) and video_native (sent
-        # whole). single_frame never needs one. Default unset -> multi_frame.
-        effective_mode = analysis_mode or "multi_frame"
-        should_attempt_clip = effective_mode in ("multi_frame", "video_native")
-
         if should_attempt_clip:
             clip_path, clip_fallback = await self._download_clip(
                 controller_id,
@@ -111,6 +137,68 @@ class ProtectMediaService:
 
         return bundle
 
+    def start_prefetch(
+        self,
+        controller_id: str,
+        protect_camera_id: str,
+        camera_id: str,
+        camera_name: str,
+        event_id: str,
+        event_timestamp: datetime,
+        analysis_mode: Optional[str] = None,
+        protect_event_id: Optional[str] = None,
+    ) -> Optional[PrefetchJob]:
+        """
+        Start prefetching an event's snapshot (and clip, if the mode needs one).
+
+        Called when a native Protect event opens. Idempotent per Protect event
+        id, so a job started earlier for the same event is returned.
+
+        Returns:
+            The PrefetchJob, or None when prefetch is disabled or the event has
+            no Protect event id
+        """
+        if not protect_event_id or not settings.PROTECT_PREFETCH_ENABLED:
+            return None
+        return get_protect_prefetch_service().start(
+            controller_id=controller_id,
+            protect_camera_id=protect_camera_id,
+            camera_id=camera_id,
+            camera_name=camera_name,
+            event_id=event_id,
+            clip_start=event_timestamp - timedelta(seconds=15),
+            clip_end=event_timestamp + timedelta(seconds=15),
+            fetch_clip=(analysis_mode or "multi_frame") in ("multi_frame", "video_native"),
+            protect_event_id=protect_event_id,
+        )
+
+    async def _get_prefetched_media(
+        self,
+        job: PrefetchJob,
+        camera_name: str,
+        partial_ok: bool,
+    ) -> MediaBundle:
+        prefetch = get_protect_prefetch_service()
+        event_id = job.event_id
+        bundle = MediaBundle()
+        try:
+            bundle.snapshot_result = await job.snapshot_task
+        except Exception as e:
+            logger.warning(f"Snapshot retrieval failed for camera '{camera_name}': {e}")
+
+        if not bundle.snapshot_result:
+            prefetch.discard(event_id)
+            bundle.fallback_reason = "snapshot_retrieval_failed"
+            return bundle
+
+        if job.clip_task is not None:
+            min_seconds = prefetch.partial_seconds if partial_ok and prefetch.partial_seconds > 0 else None
+            bundle.clip_path = await prefetch.wait_for_clip(job, min_seconds=min_seconds)
+            if not bundle.clip_path:
+                bundle.fallback_reason = "clip_download_failed"
+
+        return bundle
+
     async def _retrieve_snapshot(
         self,
         controller_id: str,
@@ -186,8 +274,15 @@ class ProtectMediaService:
             return None, "clip_download_exception"
 
     def cleanup_clip(self, event_id: str) -> bool:
-        """Best-effort cleanup of a downloaded clip."""
+        """
+        Best-effort cleanup of a downloaded clip.
+
+        A prefetch download still streaming (after a partial handoff) is
+        cancelled first and its file removed once the download lets go of it.
+        """
         try:
+            if get_protect_prefetch_service().discard(event_id):
+                return True
             clip_service = get_clip_service()
             return clip_service.cleanup_clip(event_id)
         except Exception as e:
@@ -0,0 +1,382 @@
+"""
+Protect media prefetch pipeline.
+
+ProtectMediaService used to fetch an event's snapshot and then its motion
+clip one after the other, and the AI pipeline waited for the whole clip
+(including retries) before extracting a single frame. For native Protect
+events the prefetch pipeline starts both as soon as the event opens
+(ProtectEventHandler._handle_native_event), keyed by the Protect event id:
+
+- The snapshot and the clip are fetched concurrently over the controller's
+  existing authenticated ProtectApiClient (no new sessions are opened).
+- Clip downloads are bounded per controller (``PROTECT_PREFETCH_MAX_CONCURRENCY``)
+  so a burst of events on one NVR cannot saturate its export endpoint.
+- The clip export is requested right away for the part of the window the
+  NVR has already recorded, so analysis does not wait for the window to end.
+- Clip bytes are streamed straight to data/clips/{event_id}.mp4 by uiprotect;
+  each chunk wakes anyone waiting on the clip.
+- Waiters may opt into the partial file as soon as its demuxable frames cover
+  a number of seconds (``PROTECT_PREFETCH_PARTIAL_SECONDS``). Frames are then
+  only taken from that prefix, so this is off by default. Protect exports
+  fragmented MP4, so a prefix is a playable file; a file that is not (moov
+  atom at the end) is simply handed over on completion.
+
+Jobs are keyed by our event id and indexed by the Protect event id. ``discard``
+cancels an in-flight download and removes the clip once the download task has
+released the file.
+
+Usage:
+    prefetch = get_protect_prefetch_service()
+    job = prefetch.start(controller_id, protect_camera_id, camera_id, camera_name,
+                         event_id, clip_start, clip_end, protect_event_id=protect_event_id)
+    snapshot = await job.snapshot_task
+    clip_path = await prefetch.wait_for_clip(job)
+"""
+import asyncio
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, Optional
+
+from app.core.config import settings
+from app.core.decorators import singleton
+from app.services.clip_service import get_clip_service
+from app.services.snapshot_service import SnapshotResult, get_snapshot_service
+
+logger = logging.getLogger(__name__)
+
+# Finished jobs kept for late waiters before the oldest are forgotten
+MAX_FINISHED_JOBS = 64
+
+
+def clip_coverage_seconds(clip_path: Path) -> float:
+    """
+    Seconds of video that can be demuxed from a (possibly partial) clip.
+
+    Only packet headers are read; nothing is decoded. A truncated final
+    packet ends the scan rather than failing it.
+
+    Returns:
+        Seconds between the first and last video packet, 0.0 if the file is
+        missing or not yet playable
+    """
+    import av
+
+    try:
+        container = av.open(str(clip_path))
+    except (av.FFmpegError, OSError):
+        return 0.0
+    try:
+        if not container.streams.video:
+            return 0.0
+        stream = container.streams.video[0]
+        first = last = None
+        try:
+            for packet in container.demux(stream):
+                if packet.pts is None:
+                    continue
+                if first is None or packet.pts < first:
+                    first = packet.pts
+                if last is None or packet.pts > last:
+                    last = packet.pts
+        except av.FFmpegError:
+            pass
+        if first is None or stream.time_base is None:
+            return 0.0
+        return float((last - first) * stream.time_base)
+    finally:
+        container.close()
+
+
+@dataclass
+class PrefetchJob:
+    """In-flight snapshot and clip retrieval for one event."""
+    event_id: str
+    controller_id: str
+    protect_camera_id: str
+    clip_path: Path
+    snapshot_task: "asyncio.Task[Optional[SnapshotResult]]"
+    protect_event_id: Optional[str] = None
+    clip_task: "Optional[asyncio.Task[Optional[Path]]]" = None
+    chunks_received: int = 0
+    partial_handoff: bool = False
+    progress: asyncio.Event = field(default_factory=asyncio.Event)
+
+    @property
+    def done(self) -> bool:
+        return self.snapshot_task.done() and (self.clip_task is None or self.clip_task.done())
+
+    async def on_chunk(self, total: int, chunk: Optional[bytes]) -> None:
+        """uiprotect iterator callback; runs just before each chunk is written."""
+        if chunk is not None:
+            self.chunks_received += 1
+        self.progress.set()
+
+
+@singleton
+class ProtectPrefetchService:
+    """
+    Starts and tracks snapshot/clip prefetch jobs for native Protect events.
+
+    Attributes:
+        max_concurrency: Concurrent clip downloads allowed per controller
+        partial_seconds: Default clip coverage that allows a partial handoff
+        probe_bytes: Minimum growth of the clip file between coverage probes
+    """
+
+    def __init__(
+        self,
+        max_concurrency: Optional[int] = None,
+        partial_seconds: Optional[float] = None,
+        probe_bytes: Optional[int] = None,
+    ):
+        self.max_concurrency = max_concurrency or settings.PROTECT_PREFETCH_MAX_CONCURRENCY
+        self.partial_seconds = (
+            settings.PROTECT_PREFETCH_PARTIAL_SECONDS if partial_seconds is None else partial_seconds
+        )
+        self.probe_bytes = probe_bytes or settings.PROTECT_PREFETCH_PROBE_BYTES
+        self._controller_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._jobs: "OrderedDict[str, PrefetchJob]" = OrderedDict()
+        self._protect_event_index: Dict[str, str] = {}  # protect event id -> event id
+        self._started_total = 0
+        self._partial_handoffs_total = 0
+        self._complete_handoffs_total = 0
+        self._failed_total = 0
+
+    def _get_controller_semaphore(self, controller_id: str) -> asyncio.Semaphore:
+        if controller_id not in self._controller_semaphores:
+            self._controller_semaphores[controller_id] = asyncio.Semaphore(self.max_concurrency)
+        return self._controller_semaphores[controller_id]
+
+    def get_job(self, event_id: str) -> Optional[PrefetchJob]:
+        """Return the job for an event, if one was started."""
+        return self._jobs.get(event_id)
+
+    def get_job_for_protect_event(self, protect_event_id: str) -> Optional[PrefetchJob]:
+        """Return the job started for a Protect event id, if any."""
+        event_id = self._protect_event_index.get(protect_event_id)
+        return self._jobs.get(event_id) if event_id else None
+
+    def start(
+        self,
+        controller_id: str,
+        protect_camera_id: str,
+        camera_id: str,
+        camera_name: str,
+        event_id: str,
+        clip_start: datetime,
+        clip_end: datetime,
+        fetch_clip: bool = True,
+        protect_event_id: Optional[str] = None,
+    ) -> PrefetchJob:
+        """
+        Start fetching the snapshot (and optionally the clip) for an event.
+
+        Idempotent per event id and per Protect event id: a second call
+        returns the existing job.
+
+        Args:
+            controller_id: Controller UUID
+            protect_camera_id: Native Protect camera ID
+            camera_id: Internal camera UUID
+            camera_name: Camera name for logging
+            event_id: Our event id (also the clip filename)
+            clip_start: Start of the clip window
+            clip_end: End of the clip window
+            fetch_clip: False to fetch only the snapshot
+            protect_event_id: Native Protect event id
+
+        Returns:
+            The PrefetchJob tracking both tasks
+        """
+        existing = self._jobs.get(event_id)
+        if existing is None and protect_event_id:
+            existing = self.get_job_for_protect_event(protect_event_id)
+        if existing is not None:
+            return existing
+
+        snapshot_task = asyncio.create_task(
+            get_snapshot_service().get_snapshot(
+                controller_id=controller_id,
+                protect_camera_id=protect_camera_id,
+                camera_id=camera_id,
+                camera_name=camera_name,
+                # MUST be UTC: becomes Event.timestamp (see ProtectMediaService)
+                timestamp=datetime.now(timezone.utc),
+            )
+        )
+        clip_service = get_clip_service()
+        job = PrefetchJob(
+            event_id=event_id,
+            controller_id=controller_id,
+            protect_camera_id=protect_camera_id,
+            clip_path=clip_service._get_clip_path(event_id),
+            snapshot_task=snapshot_task,
+            protect_event_id=protect_event_id,
+        )
+        if fetch_clip:
+            job.clip_task = asyncio.create_task(
+                self._download_clip(job, clip_start, clip_end)
+            )
+
+        self._jobs[event_id] = job
+        if protect_event_id:
+            self._protect_event_index[protect_event_id] = event_id
+        self._started_total += 1
+        self._forget_finished_jobs()
+
+        logger.debug(
+            f"Prefetch started for camera '{camera_name}'",
+            extra={
+                "event_type": "protect_prefetch_start",
+                "controller_id": controller_id,
+                "camera_id": camera_id,
+                "event_id": event_id,
+                "protect_event_id": protect_event_id,
+                "fetch_clip": fetch_clip,
+            }
+        )
+        return job
+
+    async def _download_clip(
+        self, job: PrefetchJob, clip_start: datetime, clip_end: datetime
+    ) -> Optional[Path]:
+        try:
+            async with self._get_controller_semaphore(job.controller_id):
+                # Footage past this point has not been recorded yet
+                event_end = min(clip_end, datetime.now(timezone.utc))
+                clip_path = await get_clip_service().download_clip(
+                    controller_id=job.controller_id,
+                    camera_id=job.protect_camera_id,
+                    event_start=clip_start,
+                    event_end=event_end,
+                    event_id=job.event_id,
+                    iterator_callback=job.on_chunk,
+                )
+            if clip_path is None:
+                self._failed_total += 1
+            return clip_path
+        finally:
+            job.progress.set()
+
+    async def wait_for_clip(
+        self, job: PrefetchJob, min_seconds: Optional[float] = None
+    ) -> Optional[Path]:
+        """
+        Wait until the job's clip is usable.
+
+        Args:
+            job: Job returned by ``start``
+            min_seconds: Seconds of video that are enough for the caller. None
+                waits for the complete download.
+
+        Returns:
+            Path to the clip (possibly still downloading when ``min_seconds``
+            was given), or None if the download failed or was not requested
+        """
+        if job.clip_task is None:
+            return None
+
+        probed_size = 0
+        while True:
+            job.progress.clear()
+            if job.clip_task.done():
+                if job.clip_task.cancelled():
+                    return None
+                clip_path = job.clip_task.result()
+                if clip_path is not None:
+                    self._complete_handoffs_total += 1
+                return clip_path
+
+            if min_seconds is not None:
+                try:
+                    size = job.clip_path.stat().st_size
+                except OSError:
+                    size = 0
+                # A retry truncates the file, so a shrink also triggers a probe
+                if size >= probed_size + self.probe_bytes or size < probed_size:
+                    probed_size = size
+                    covered = await asyncio.to_thread(clip_coverage_seconds, job.clip_path)
+                    if covered >= min_seconds and not job.clip_task.done():
+                        job.partial_handoff = True
+                        self._partial_handoffs_total += 1
+                        logger.info(
+                            f"Handing off partial clip ({covered:.1f}s available)",
+                            extra={
+                                "event_type": "protect_prefetch_partial_handoff",
+                                "event_id": job.event_id,
+                                "covered_seconds": covered,
+                                "file_size_bytes": size,
+                            }
+                        )
+                        return job.clip_path
+
+            progress = asyncio.create_task(job.progress.wait())
+            try:
+                await asyncio.wait({job.clip_task, progress}, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                progress.cancel()
+
+    def discard(self, event_id: str) -> bool:
+        """
+        Forget an event's job, cancelling any download still in flight.
+
+        The clip file is removed once the cancelled download has closed it.
+
+        Returns:
+            True if a running download was cancelled (its clip is deleted
+            asynchronously), False if there was nothing to cancel
+        """
+        job = self._jobs.pop(event_id, None)
+        if job is None:
+            return False
+        self._unindex(job)
+        if not job.snapshot_task.done():
+            job.snapshot_task.cancel()
+        if job.clip_task is None or job.clip_task.done():
+            return False
+        job.clip_task.cancel()
+        job.clip_task.add_done_callback(
+            lambda _task: get_clip_service().cleanup_clip(event_id)
+        )
+        return True
+
+    def _forget_finished_jobs(self) -> None:
+        finished = [event_id for event_id, job in self._jobs.items() if job.done]
+        for event_id in finished[:max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            self._unindex(self._jobs.pop(event_id))
+
+    def _unindex(self, job: PrefetchJob) -> None:
+        if job.protect_event_id and self._protect_event_index.get(job.protect_event_id) == job.event_id:
+            del self._protect_event_index[job.protect_event_id]
+
+    def get_metrics(self) -> Dict[str, int]:
+        """Return prefetch counters for monitoring."""
+        return {
+            "active_jobs": sum(1 for job in self._jobs.values() if not job.done),
+            "started_total": self._started_total,
+            "partial_handoffs_total": self._partial_handoffs_total,
+            "complete_handoffs_total": self._complete_handoffs_total,
+            "failed_total": self._failed_total,
+        }
+
+    def cleanup(self) -> None:
+        """Cancel in-flight jobs (called by the singleton reset)."""
+        for job in self._jobs.values():
+            for task in (job.snapshot_task, job.clip_task):
+                if task is not None and not task.done():
+                    task.cancel()
+        self._jobs.clear()
+        self._protect_event_index.clear()
+
+
+def get_protect_prefetch_service() -> ProtectPrefetchService:
+    """Get the global ProtectPrefetchService instance."""
+    return ProtectPrefetchService()
+
+
+def reset_protect_prefetch_service() -> None:
+    """Reset the global ProtectPrefetchService instance (for testing)."""
+    ProtectPrefetchService._reset_instance()
@@ -157,7 +157,13 @@ class ProtectService:
                 ProtectController.is_connected == True
             ).all()
             
+            from app.services.cluster_service import get_cluster_service
+            cluster = get_cluster_service()
+
             for controller in stale_controllers:
+                # Cluster mode: other replicas' connections are not stale
+                if not cluster.owns("controller", str(controller.id)):
+                    continue
                 controller.is_connected = False
                 # Keep last_error for debugging, but add context
                 if controller.last_error:
@@ -399,6 +405,13 @@ class ProtectService:
         """
         controller_id = str(controller.id)
 
+        # Cluster mode: controllers are sharded across replicas
+        from app.services.cluster_service import get_cluster_service
+        cluster = get_cluster_service()
+        if not cluster.owns("controller", controller_id):
+            cluster.forward("connect_controller", "controller", controller_id)
+            return True
+
         # Check if already connected
         if controller_id in self._connections:
             logger.info(
@@ -539,6 +552,17 @@ class ProtectService:
             Updates is_connected to False in database.
             Broadcasts disconnected status to frontend.
         """
+        from app.services.cluster_service import get_cluster_service
+        cluster = get_cluster_service()
+        if (
+            controller_id not in self._connections
+            and controller_id not in self._listener_tasks
+            and not cluster.owns("controller", controller_id)
+        ):
+            # Cluster mode: the connection lives on the owning replica
+            cluster.forward("disconnect_controller", "controller", controller_id)
+            return
+
         logger.info(
             "Disconnecting from Protect controller",
             extra={
@@ -5,11 +5,13 @@ This module provides enhanced query-adaptive frame selection functionality:
 - BatchEmbedder: Batch processing for ~40% faster embedding generation
 - DiversityFilter: Prevents selection of near-duplicate frames
 - QueryCache: In-memory caching with 5-minute TTL
+- FrameMatrixCache: Per-event frame embedding matrices for re-ranking
 - QuerySuggester: Smart suggestions based on event type
 """
 
 from app.services.query_adaptive.batch_embedder import BatchEmbedder, get_batch_embedder
 from app.services.query_adaptive.diversity_filter import DiversityFilter
+from app.services.query_adaptive.frame_matrix import FrameEmbeddingMatrix, FrameMatrixCache
 from app.services.query_adaptive.query_cache import QueryCache, CachedQueryResult
 from app.services.query_adaptive.query_suggester import QuerySuggester
 
@@ -17,6 +19,8 @@ __all__ = [
     "BatchEmbedder",
     "get_batch_embedder",
     "DiversityFilter",
+    "FrameEmbeddingMatrix",
+    "FrameMatrixCache",
     "QueryCache",
     "CachedQueryResult",
     "QuerySuggester",
@@ -6,22 +6,26 @@ selection. Uses greedy selection with cosine similarity threshold.
 
 Algorithm:
     1. Sort frames by relevance score (descending)
-    2. For each frame, check similarity to already selected frames
+    2. For each frame, check its highest similarity to the selected frames
     3. Skip if similarity > threshold (0.92 by default)
     4. Continue until top_k diverse frames selected
 
 Performance:
-    - Adds <10ms overhead to frame selection
-    - O(n*k) where n = total frames, k = selected frames
+    - Embeddings are normalized once into a float32 matrix
+    - Each selected frame costs one matrix-vector product that updates every
+      frame's highest similarity to the selection, so no pairwise calls
+    - Well under 1ms for typical frame counts (10-20 frames)
 """
 
 import logging
 import time
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Sequence, Union
 
 import numpy as np
 
+from app.services.query_adaptive.frame_matrix import normalize_rows
+
 logger = logging.getLogger(__name__)
 
 
@@ -69,9 +73,48 @@ class DiversityFilter:
             }
         )
 
+    def select_diverse(
+        self,
+        vectors: np.ndarray,
+        order: Sequence[int],
+        top_k: int,
+    ) -> tuple[list[int], np.ndarray]:
+        """
+        Greedy diverse selection over a matrix of unit-length embeddings.
+
+        Keeps, for every frame, its highest cosine similarity to any frame
+        selected so far; picking a frame updates that vector with one
+        matrix-vector product.
+
+        Args:
+            vectors: (n_frames, dim) float32 matrix with unit-length rows
+            order: Row positions to consider, best first
+            top_k: Maximum number of frames to select
+
+        Returns:
+            Tuple of (selected row positions, boolean mask of filtered rows)
+        """
+        selected: list[int] = []
+        filtered = np.zeros(len(vectors), dtype=bool)
+        if top_k <= 0:
+            return selected, filtered
+
+        max_similarity = np.full(len(vectors), -np.inf, dtype=np.float32)
+        for idx in order:
+            idx = int(idx)
+            if max_similarity[idx] > self.similarity_threshold:
+                filtered[idx] = True
+                continue
+            selected.append(idx)
+            if len(selected) >= top_k:
+                break
+            np.maximum(max_similarity, vectors @ vectors[idx], out=max_similarity)
+
+        return selected, filtered
+
     def filter_diverse_frames(
         self,
-        embeddings: list[list[float]],
+        embeddings: Union[list[list[float]], np.ndarray],
         relevance_scores: list[float],
         quality_scores: Optional[list[float]] = None,
         top_k: int = 5,
@@ -83,7 +126,7 @@ class DiversityFilter:
         similar frames before picking the next.
 
         Args:
-            embeddings: List of frame embeddings (512-dim each)
+            embeddings: Frame embeddings (512-dim each), as lists or a matrix
             relevance_scores: Relevance scores (0-100) for each frame
             quality_scores: Optional quality scores (0-100) for each frame.
                           If None, combined score = relevance score.
@@ -93,7 +136,7 @@ class DiversityFilter:
             List of selected frame indices (sorted by combined score)
 
         Note:
-            Adds <10ms overhead for typical frame counts (10-20 frames).
+            Adds well under 1ms for typical frame counts (10-20 frames).
         """
         start_time = time.time()
 
@@ -106,36 +149,13 @@ class DiversityFilter:
             relevance_scores, quality_scores
         )
 
-        # Convert to numpy for efficient similarity computation
-        embeddings_np = [np.array(e, dtype=np.float32) for e in embeddings]
-
-        # Sort by combined score descending
-        scored_indices = sorted(
-            range(len(combined_scores)),
-            key=lambda i: combined_scores[i],
-            reverse=True,
-        )
-
-        selected = []
-        selected_embeddings = []
-        filtered_count = 0
+        vectors = normalize_rows(np.array(embeddings, dtype=np.float32))
 
-        for idx in scored_indices:
-            if len(selected) >= top_k:
-                break
-
-            # Check similarity to already selected frames
-            is_diverse = True
-            for sel_emb in selected_embeddings:
-                similarity = self._cosine_similarity(embeddings_np[idx], sel_emb)
-                if similarity > self.similarity_threshold:
-                    is_diverse = False
-                    filtered_count += 1
-                    break
+        # Sort by combined score descending (stable, like sorted())
+        order = np.argsort(-np.asarray(combined_scores, dtype=np.float64), kind="stable")
 
-            if is_diverse:
-                selected.append(idx)
-                selected_embeddings.append(embeddings_np[idx])
+        selected, filtered = self.select_diverse(vectors, order, top_k)
+        filtered_count = int(filtered.sum())
 
         duration_ms = (time.time() - start_time) * 1000
         logger.debug(
@@ -182,28 +202,9 @@ class DiversityFilter:
             )
         return combined
 
-    def _cosine_similarity(self, a: np.ndarray, b: np.ndarray) -> float:
-        """
-        Calculate cosine similarity between two vectors.
-
-        Args:
-            a: First vector (numpy array)
-            b: Second vector (numpy array)
-
-        Returns:
-            Cosine similarity in range [-1, 1]
-        """
-        norm_a = np.linalg.norm(a)
-        norm_b = np.linalg.norm(b)
-
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-
-        return float(np.dot(a, b) / (norm_a * norm_b))
-
     def get_filtered_frames_with_details(
         self,
-        embeddings: list[list[float]],
+        embeddings: Union[list[list[float]], np.ndarray],
         relevance_scores: list[float],
         quality_scores: Optional[list[float]] = None,
         top_k: int = 5,
@@ -226,7 +227,9 @@ class DiversityFilter:
             relevance_scores, quality_scores
         )
 
-        embeddings_np = [np.array(e, dtype=np.float32) for e in embeddings]
+        vectors = normalize_rows(np.array(embeddings, dtype=np.float32))
+        order = np.argsort(-np.asarray(combined_scores, dtype=np.float64), kind="stable")
+        selected_indices, filtered = self.select_diverse(vectors, order, top_k)
 
         # All frames with details
         all_frames = [
@@ -235,33 +238,9 @@ class DiversityFilter:
                 relevance_score=relevance_scores[i],
                 quality_score=quality_scores[i] if quality_scores and i < len(quality_scores) else 50.0,
                 combined_score=combined_scores[i],
-                was_filtered=False,
+                was_filtered=bool(filtered[i]),
             )
             for i in range(len(embeddings))
         ]
 
-        # Sort by combined score
-        sorted_frames = sorted(all_frames, key=lambda f: f.combined_score, reverse=True)
-
-        selected_indices = []
-        selected_embeddings = []
-
-        for frame in sorted_frames:
-            if len(selected_indices) >= top_k:
-                break
-
-            is_diverse = True
-            for sel_emb in selected_embeddings:
-                similarity = self._cosine_similarity(
-                    embeddings_np[frame.frame_index], sel_emb
-                )
-                if similarity > self.similarity_threshold:
-                    frame.was_filtered = True
-                    is_diverse = False
-                    break
-
-            if is_diverse:
-                selected_indices.append(frame.frame_index)
-                selected_embeddings.append(embeddings_np[frame.frame_index])
-
         return selected_indices, all_frames
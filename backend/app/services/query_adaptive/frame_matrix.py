@@ -0,0 +1,200 @@
+"""
+Frame Embedding Matrix Cache
+
+Keeps the stored FrameEmbedding rows of recently queried events as one
+unit-normalized float32 matrix per event, so query-adaptive re-ranking is a
+single matrix-vector product instead of decoding JSON and scoring frames one
+by one on every query.
+
+Features:
+    - Rows decoded from the database once per event, then reused
+    - Cached matrices are read-only and handed out without copying
+    - LRU bound on the number of events kept in memory
+    - Thread-safe operations
+
+Usage:
+    cache = FrameMatrixCache()
+    matrix = cache.get(event_id)
+    if matrix is None:
+        rows = await embedding_service.get_frame_embeddings(db, event_id)
+        matrix = cache.put(FrameEmbeddingMatrix.from_rows(event_id, rows))
+    scores = matrix.scores(query_vector)
+"""
+
+import logging
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    """
+    L2-normalize the rows of a float matrix in place.
+
+    Zero rows are left as zeros, so their cosine similarity to anything is 0.
+
+    Args:
+        matrix: (n, dim) float32 array owned by the caller
+
+    Returns:
+        The same array, rows scaled to unit length
+    """
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    np.divide(matrix, norms, out=matrix, where=norms > 0)
+    return matrix
+
+
+@dataclass(frozen=True)
+class FrameEmbeddingMatrix:
+    """
+    All frame embeddings of one event as a single matrix.
+
+    Attributes:
+        event_id: Event UUID
+        frame_indices: Frame index of each row (int32)
+        embedding_ids: FrameEmbedding id of each row
+        vectors: (n_frames, dim) float32 matrix with unit-length rows (read-only)
+    """
+    event_id: str
+    frame_indices: np.ndarray
+    embedding_ids: tuple
+    vectors: np.ndarray
+
+    @classmethod
+    def from_rows(cls, event_id: str, rows: Sequence[dict]) -> "FrameEmbeddingMatrix":
+        """
+        Build the matrix from EmbeddingService.get_frame_embeddings() rows.
+
+        Args:
+            event_id: Event UUID
+            rows: Dicts with frame_index, embedding and (optionally) id
+
+        Returns:
+            FrameEmbeddingMatrix with read-only arrays
+        """
+        vectors = normalize_rows(np.array([row["embedding"] for row in rows], dtype=np.float32))
+        frame_indices = np.array([row["frame_index"] for row in rows], dtype=np.int32)
+        vectors.setflags(write=False)
+        frame_indices.setflags(write=False)
+        return cls(
+            event_id=event_id,
+            frame_indices=frame_indices,
+            embedding_ids=tuple(row.get("id", "") for row in rows),
+            vectors=vectors,
+        )
+
+    def __len__(self) -> int:
+        return len(self.frame_indices)
+
+    def scores(self, query_vector: np.ndarray) -> np.ndarray:
+        """
+        Cosine similarity of every frame to a unit-length query vector.
+
+        Args:
+            query_vector: (dim,) float32 unit vector
+
+        Returns:
+            (n_frames,) float32 similarities in [-1, 1]
+        """
+        return self.vectors @ query_vector
+
+
+class FrameMatrixCache:
+    """
+    LRU cache of FrameEmbeddingMatrix objects keyed by event id.
+
+    Entries never expire on their own: EmbeddingService invalidates an event
+    whenever its frame embeddings are stored or deleted.
+
+    Attributes:
+        DEFAULT_MAX_EVENTS: Events kept in memory (10 frames of 512 floats
+                            is ~20KB per event)
+    """
+
+    DEFAULT_MAX_EVENTS = 256
+
+    def __init__(self, max_events: int = DEFAULT_MAX_EVENTS):
+        """
+        Initialize FrameMatrixCache.
+
+        Args:
+            max_events: Maximum number of events to keep (default: 256)
+        """
+        self._matrices: OrderedDict[str, FrameEmbeddingMatrix] = OrderedDict()
+        self._lock = threading.Lock()
+        self.max_events = max_events
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, event_id: str) -> Optional[FrameEmbeddingMatrix]:
+        """
+        Get the cached matrix for an event.
+
+        Args:
+            event_id: Event UUID
+
+        Returns:
+            FrameEmbeddingMatrix if cached, None otherwise
+        """
+        with self._lock:
+            matrix = self._matrices.get(event_id)
+            if matrix is None:
+                self._misses += 1
+                return None
+            self._matrices.move_to_end(event_id)
+            self._hits += 1
+            return matrix
+
+    def put(self, matrix: FrameEmbeddingMatrix) -> FrameEmbeddingMatrix:
+        """
+        Cache a matrix, evicting the least recently used event if full.
+
+        Args:
+            matrix: Matrix to cache
+
+        Returns:
+            The cached matrix
+        """
+        with self._lock:
+            self._matrices[matrix.event_id] = matrix
+            self._matrices.move_to_end(matrix.event_id)
+            while len(self._matrices) > self.max_events:
+                self._matrices.popitem(last=False)
+        return matrix
+
+    def invalidate(self, event_id: Optional[str] = None) -> int:
+        """
+        Drop cached matrices.
+
+        Args:
+            event_id: Event to drop, or None to drop every event
+
+        Returns:
+            Number of entries removed
+        """
+        with self._lock:
+            if event_id is None:
+                count = len(self._matrices)
+                self._matrices.clear()
+                return count
+            return 1 if self._matrices.pop(event_id, None) is not None else 0
+
+    def stats(self) -> dict:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dict with size, hits and misses
+        """
+        with self._lock:
+            return {
+                "size": len(self._matrices),
+                "max_events": self.max_events,
+                "hits": self._hits,
+                "misses": self._misses,
+            }
@@ -73,6 +73,11 @@ from app.services.ai_processing_coordinator import get_ai_processing_coordinator
 from app.services.protect_event_handler import get_protect_event_handler, reset_protect_event_handler
 from app.services.motion_detection_service import motion_detection_service, reset_motion_detection_service
 from app.services.clip_service import get_clip_service, reset_clip_service
+from app.services.protect_prefetch_service import get_protect_prefetch_service, reset_protect_prefetch_service
+from app.services.description_cache_service import get_description_cache_service, reset_description_cache_service
+from app.services.ai_latency_router import get_ai_latency_router, reset_ai_latency_router
+from app.services.image_payload_optimizer import get_image_payload_optimizer, reset_image_payload_optimizer
+from app.services.cluster_service import get_cluster_service, reset_cluster_service
 from app.services.frame_storage_service import get_frame_storage_service, reset_frame_storage_service
 from app.services.video_storage_service import get_video_storage_service, reset_video_storage_service
 from app.services.voice_query_service import get_voice_query_service, reset_voice_query_service
@@ -83,13 +88,19 @@ from app.services.stream_proxy_service import get_stream_proxy_service, reset_st
 from app.services.vehicle_embedding_service import get_vehicle_embedding_service, reset_vehicle_embedding_service
 from app.services.embedding_service import get_embedding_service, reset_embedding_service
 from app.services.face_embedding_service import get_face_embedding_service, reset_face_embedding_service
+from app.services.detection_service import get_detection_service, reset_detection_service
 from app.services.person_matching_service import get_person_matching_service, reset_person_matching_service
 from app.services.entity_alert_service import get_entity_alert_service, reset_entity_alert_service
 from app.services.audio_stream_service import get_audio_stream_extractor, reset_audio_stream_extractor
 from app.services.reprocessing_service import get_reprocessing_service, reset_reprocessing_service
+from app.services.embedding_backfill_service import get_embedding_backfill_service, reset_embedding_backfill_service
 from app.services.smart_reanalyze_service import get_smart_reanalyze_service, reset_smart_reanalyze_service
 from app.services.signed_url_service import get_signed_url_service, reset_signed_url_service
+from app.services.jpeg_cache import get_jpeg_cache, reset_jpeg_cache
+from app.services.media_store import get_media_store, reset_media_store
+from app.services.database_writer import get_database_writer, reset_database_writer
 from app.services.context_prompt_service import get_context_prompt_service, reset_context_prompt_service
+from app.services.mcp_context import get_mcp_context_provider, reset_mcp_context_provider
 from app.services.frame_annotation_service import get_frame_annotation_service, reset_frame_annotation_service
 from app.services.anomaly_scoring_service import get_anomaly_scoring_service, reset_anomaly_scoring_service
 from app.services.entity_service import get_entity_service, reset_entity_service
@@ -222,6 +233,26 @@ class ServiceContainer:
     def clip_service(self):
         return get_clip_service()
 
+    @property
+    def protect_prefetch_service(self):
+        return get_protect_prefetch_service()
+
+    @property
+    def description_cache_service(self):
+        return get_description_cache_service()
+
+    @property
+    def ai_latency_router(self):
+        return get_ai_latency_router()
+
+    @property
+    def image_payload_optimizer(self):
+        return get_image_payload_optimizer()
+
+    @property
+    def cluster_service(self):
+        return get_cluster_service()
+
     @property
     def frame_storage_service(self):
         return get_frame_storage_service()
@@ -262,6 +293,10 @@ class ServiceContainer:
     def face_embedding_service(self):
         return get_face_embedding_service()
 
+    @property
+    def detection_service(self):
+        return get_detection_service()
+
     @property
     def person_matching_service(self):
         return get_person_matching_service()
@@ -278,6 +313,10 @@ class ServiceContainer:
     def reprocessing_service(self):
         return get_reprocessing_service()
 
+    @property
+    def embedding_backfill_service(self):
+        return get_embedding_backfill_service()
+
     @property
     def smart_reanalyze_service(self):
         return get_smart_reanalyze_service()
@@ -286,10 +325,26 @@ class ServiceContainer:
     def signed_url_service(self):
         return get_signed_url_service()
 
+    @property
+    def jpeg_cache(self):
+        return get_jpeg_cache()
+
+    @property
+    def media_store(self):
+        return get_media_store()
+
+    @property
+    def database_writer(self):
+        return get_database_writer()
+
     @property
     def context_prompt_service(self):
         return get_context_prompt_service()
 
+    @property
+    def mcp_context_provider(self):
+        return get_mcp_context_provider()
+
     @property
     def frame_annotation_service(self):
         return get_frame_annotation_service()
@@ -326,6 +381,11 @@ class ServiceContainer:
         reset_protect_event_handler,
         reset_motion_detection_service,
         reset_clip_service,
+        reset_protect_prefetch_service,
+        reset_description_cache_service,
+        reset_ai_latency_router,
+        reset_image_payload_optimizer,
+        reset_cluster_service,
         reset_frame_storage_service,
         reset_video_storage_service,
         reset_voice_query_service,
@@ -337,16 +397,22 @@ class ServiceContainer:
         reset_backup_service,
         reset_embedding_service,
         reset_face_embedding_service,
+        reset_detection_service,
         reset_person_matching_service,
         reset_entity_alert_service,
         reset_audio_stream_extractor,
         reset_context_prompt_service,
+        reset_mcp_context_provider,
         reset_frame_annotation_service,
         reset_anomaly_scoring_service,
         reset_entity_service,
         reset_reprocessing_service,
+        reset_embedding_backfill_service,
         reset_smart_reanalyze_service,
         reset_signed_url_service,
+        reset_jpeg_cache,
+        reset_media_store,
+        reset_database_writer,
         reset_api_key_service,
         reset_discovery_service,
         reset_onvif_discovery_service,
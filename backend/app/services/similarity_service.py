@@ -236,7 +236,7 @@ class SimilarityService:
             Event.description,
             Event.timestamp,
             Event.thumbnail_path,
-            Event.thumbnail_base64,
+            Event.thumbnail_hash,
             Event.camera_id,
             Camera.name.label("camera_name"),
         ).join(
@@ -282,10 +282,9 @@ class SimilarityService:
                 thumbnail_url = None
                 if candidate.thumbnail_path:
                     thumbnail_url = candidate.thumbnail_path
-                elif candidate.thumbnail_base64:
-                    # For base64, we'd typically return the full data URI
-                    # but for API responses, just indicate it exists
-                    thumbnail_url = f"/api/v1/events/{candidate.event_id}/thumbnail"
+                elif candidate.thumbnail_hash:
+                    # Media store thumbnails are served by the binary endpoint
+                    thumbnail_url = f"/api/v1/events/{candidate.event_id}/thumbnail.jpg"
 
                 results.append(SimilarEvent(
                     event_id=candidate.event_id,
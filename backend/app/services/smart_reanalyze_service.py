@@ -7,8 +7,9 @@ service selects the most relevant frames based on semantic similarity to the
 query before sending them to AI for analysis.
 
 Architecture:
-    - Text queries encoded via EmbeddingService.encode_text()
-    - Frame embeddings scored via batch_cosine_similarity()
+    - Text queries encoded via EmbeddingService.encode_text() (LRU cached)
+    - Stored frame embeddings held per event as one normalized float32 matrix
+    - Frames scored with a single matrix-vector product
     - Top-K relevant frames selected for AI analysis
     - Query context passed to AI for focused analysis
     - Query caching with 5-minute TTL (Story P12-4.4)
@@ -18,11 +19,11 @@ Flow:
                                        ↓
                         encode_text() → Query Embedding
                                        ↓
-              get_frame_embeddings() → Frame Embeddings
+        FrameMatrixCache / get_frame_embeddings() → Frame Matrix
                                        ↓
-                  batch_cosine_similarity() → Scores
+                  matrix @ query vector → Scores
                                        ↓
-              DiversityFilter → select_top_k() → Selected Frames
+              DiversityFilter → select_diverse() → Selected Frames
                                        ↓
                   Cache Result → AI Analysis → New Description
 """
@@ -31,10 +32,12 @@ import time
 from dataclasses import dataclass
 from typing import Optional
 
+import numpy as np
 from sqlalchemy.orm import Session
 
 from app.services.embedding_service import EmbeddingService, get_embedding_service
-from app.services.similarity_service import batch_cosine_similarity
+from app.services.query_adaptive.diversity_filter import DiversityFilter
+from app.services.query_adaptive.frame_matrix import FrameEmbeddingMatrix, FrameMatrixCache
 
 from app.core.decorators import singleton
 
@@ -99,6 +102,8 @@ class SmartReanalyzeService:
         """
         self._embedding_service = embedding_service or get_embedding_service()
         self._query_cache = query_cache
+        self._frame_matrices = FrameMatrixCache()
+        self._diversity_filter = DiversityFilter(self.DIVERSITY_THRESHOLD)
         logger.info(
             "SmartReanalyzeService initialized",
             extra={"event_type": "smart_reanalyze_service_init"}
@@ -112,6 +117,32 @@ class SmartReanalyzeService:
             self._query_cache = get_query_cache()
         return self._query_cache
 
+    def invalidate_frame_embeddings(self, event_id: str) -> None:
+        """
+        Forget an event's frame matrix and cached selections.
+
+        Called when the event's frame embeddings are stored or deleted.
+
+        Args:
+            event_id: UUID of the event
+        """
+        self._frame_matrices.invalidate(event_id)
+        self.query_cache.invalidate(event_id)
+
+        from app.services.cluster_service import get_cluster_service
+        get_cluster_service().invalidate("smart_reanalyze.frames", event_id)
+
+    async def _get_frame_matrix(self, db: Session, event_id: str) -> Optional[FrameEmbeddingMatrix]:
+        """Get the event's frame matrix, decoding the stored rows on first use."""
+        matrix = self._frame_matrices.get(event_id)
+        if matrix is not None:
+            return matrix
+
+        frame_embeddings = await self._embedding_service.get_frame_embeddings(db, event_id)
+        if not frame_embeddings:
+            return None
+        return self._frame_matrices.put(FrameEmbeddingMatrix.from_rows(event_id, frame_embeddings))
+
     async def select_relevant_frames(
         self,
         db: Session,
@@ -181,12 +212,10 @@ class SmartReanalyzeService:
         query_embedding = await self._embedding_service.encode_text(formatted_query)
         query_time_ms = (time.time() - query_start) * 1000
 
-        # Step 3: Get frame embeddings for the event
-        frame_embeddings = await self._embedding_service.get_frame_embeddings(
-            db, event_id
-        )
+        # Step 3: Get the event's frame embedding matrix (cached after first use)
+        matrix = await self._get_frame_matrix(db, event_id)
 
-        if not frame_embeddings:
+        if matrix is None:
             logger.warning(
                 f"No frame embeddings found for event {event_id}",
                 extra={
@@ -204,70 +233,53 @@ class SmartReanalyzeService:
                 cached=False,
             )
 
-        # Step 4: Score frames against query
+        # Step 4: Score all frames against the query in one product
         scoring_start = time.time()
-        embeddings = [f["embedding"] for f in frame_embeddings]
-        similarities = batch_cosine_similarity(query_embedding, embeddings)
-
-        # Scale similarities to 0-100 for relevance scores
-        relevance_scores = [round(s * 100, 2) for s in similarities]
-
-        # Build scored frames list with combined scores (AC3)
-        scored_frames = []
-        for i in range(len(frame_embeddings)):
-            relevance = relevance_scores[i]
-            quality = 50.0  # Default quality - could be enhanced with frame quality data
-            combined = (relevance * self.RELEVANCE_WEIGHT) + (quality * self.QUALITY_WEIGHT)
-
-            scored_frames.append(
-                ScoredFrame(
-                    frame_index=frame_embeddings[i]["frame_index"],
-                    similarity_score=round(similarities[i], 4),
-                    embedding_id=frame_embeddings[i]["id"],
-                    quality_score=quality,
-                    combined_score=round(combined, 2),
-                )
-            )
+        query_vector = np.asarray(query_embedding, dtype=np.float32)
+        query_norm = np.linalg.norm(query_vector)
+        if query_norm > 0:
+            query_vector = query_vector / query_norm
+        similarities = np.round(matrix.scores(query_vector).astype(np.float64), 4)
+
+        # Combined score from relevance (0-100) and quality (AC3)
+        quality = 50.0  # Default quality - could be enhanced with frame quality data
+        relevance_scores = np.round(similarities * 100, 2)
+        combined_scores = np.round(
+            relevance_scores * self.RELEVANCE_WEIGHT + quality * self.QUALITY_WEIGHT, 2
+        )
 
         # Sort by combined score (highest first)
-        scored_frames.sort(key=lambda x: x.combined_score, reverse=True)
+        order = np.argsort(-combined_scores, kind="stable")
+        scored_frames = [
+            ScoredFrame(
+                frame_index=int(matrix.frame_indices[i]),
+                similarity_score=float(similarities[i]),
+                embedding_id=matrix.embedding_ids[i],
+                quality_score=quality,
+                combined_score=float(combined_scores[i]),
+            )
+            for i in order
+        ]
 
         scoring_time_ms = (time.time() - scoring_start) * 1000
 
         # Step 5: Select top-K frames with diversity filtering (AC2)
-        selected_frames = self._select_diverse_frames(
-            scored_frames=scored_frames,
-            frame_embeddings=frame_embeddings,
-            top_k=top_k,
-            min_similarity=min_similarity,
-        )
+        below = np.flatnonzero(similarities[order] < min_similarity)
+        candidates = order[:below[0]] if below.size else order
+        rows, _ = self._diversity_filter.select_diverse(matrix.vectors, candidates, top_k)
+        selected_frames = [int(matrix.frame_indices[i]) for i in rows]
 
         total_time_ms = (time.time() - start_time) * 1000
 
         # Step 6: Cache the result (AC5 - 5-minute TTL)
         if use_cache and selected_frames:
-            selected_relevance = [
-                next(
-                    (sf.similarity_score * 100 for sf in scored_frames if sf.frame_index == idx),
-                    0.0
-                )
-                for idx in selected_frames
-            ]
-            selected_quality = [50.0] * len(selected_frames)
-            selected_combined = [
-                next(
-                    (sf.combined_score for sf in scored_frames if sf.frame_index == idx),
-                    0.0
-                )
-                for idx in selected_frames
-            ]
             self.query_cache.set(
                 event_id=event_id,
                 query=query,
                 frame_indices=selected_frames,
-                relevance_scores=selected_relevance,
-                quality_scores=selected_quality,
-                combined_scores=selected_combined,
+                relevance_scores=[float(similarities[i]) * 100 for i in rows],
+                quality_scores=[quality] * len(selected_frames),
+                combined_scores=[float(combined_scores[i]) for i in rows],
             )
 
         logger.info(
@@ -277,7 +289,7 @@ class SmartReanalyzeService:
                 "event_id": event_id,
                 "query_length": len(query),
                 "formatted_query": formatted_query,
-                "frames_scored": len(frame_embeddings),
+                "frames_scored": len(matrix),
                 "frames_selected": len(selected_frames),
                 "top_score": scored_frames[0].similarity_score if scored_frames else 0,
                 "query_time_ms": round(query_time_ms, 2),
@@ -295,78 +307,6 @@ class SmartReanalyzeService:
             cached=False,
         )
 
-    def _select_diverse_frames(
-        self,
-        scored_frames: list[ScoredFrame],
-        frame_embeddings: list[dict],
-        top_k: int,
-        min_similarity: float,
-    ) -> list[int]:
-        """
-        Select top-K frames with diversity filtering.
-
-        Avoids selecting near-duplicate frames that might contain
-        the same visual information.
-
-        Args:
-            scored_frames: Frames sorted by similarity score
-            frame_embeddings: Original embeddings data for diversity check
-            top_k: Maximum number of frames to select
-            min_similarity: Minimum similarity threshold
-
-        Returns:
-            List of selected frame indices
-        """
-        selected = []
-        selected_embeddings = []
-
-        # Build lookup for frame embeddings by index
-        embedding_by_index = {
-            f["frame_index"]: f["embedding"]
-            for f in frame_embeddings
-        }
-
-        for scored in scored_frames:
-            # Skip below threshold
-            if scored.similarity_score < min_similarity:
-                break
-
-            # Check diversity (skip near-duplicates)
-            frame_emb = embedding_by_index[scored.frame_index]
-            is_diverse = True
-
-            for sel_emb in selected_embeddings:
-                similarity = self._cosine_similarity_single(frame_emb, sel_emb)
-                if similarity > self.DIVERSITY_THRESHOLD:
-                    is_diverse = False
-                    break
-
-            if is_diverse:
-                selected.append(scored.frame_index)
-                selected_embeddings.append(frame_emb)
-
-            if len(selected) >= top_k:
-                break
-
-        return selected
-
-    def _cosine_similarity_single(
-        self, vec1: list[float], vec2: list[float]
-    ) -> float:
-        """Calculate cosine similarity between two vectors."""
-        import numpy as np
-
-        a = np.array(vec1, dtype=np.float32)
-        b = np.array(vec2, dtype=np.float32)
-
-        norm_a = np.linalg.norm(a)
-        norm_b = np.linalg.norm(b)
-
-        if norm_a == 0 or norm_b == 0:
-            return 0.0
-
-        return float(np.dot(a, b) / (norm_a * norm_b))
-
 
 # Backward compatible thin getter (delegates to @singleton decorator)
 def get_smart_reanalyze_service() -> SmartReanalyzeService:
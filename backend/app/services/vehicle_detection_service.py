@@ -119,6 +119,12 @@ class VehicleDetectionService:
     TARGET_SIZE = (224, 224)  # Standard size for CLIP
     DEFAULT_PADDING = 0.1  # 10% padding
 
+    # SSD input preprocessing (also used by the fused DetectionService)
+    INPUT_SIZE = (300, 300)
+    INPUT_SCALE = 0.007843
+    # Per channel: a bare 127.5 is read by OpenCV as Scalar(127.5, 0, 0)
+    INPUT_MEAN = (127.5, 127.5, 127.5)
+
     def __init__(self):
         """Initialize VehicleDetectionService."""
         self._net: Optional[cv2.dnn.Net] = None
@@ -220,38 +226,57 @@ class VehicleDetectionService:
         Returns:
             List of VehicleDetection results
         """
-        if confidence_threshold is None:
-            confidence_threshold = self.CONFIDENCE_THRESHOLD
-
         if self._use_fallback:
             # Fallback: return empty list (vehicles will be detected by AI description)
             return []
 
-        (h, w) = image.shape[:2]
-
         # Create blob from image
         blob = cv2.dnn.blobFromImage(
-            cv2.resize(image, (300, 300)),
-            0.007843,
-            (300, 300),
-            127.5
+            cv2.resize(image, self.INPUT_SIZE),
+            self.INPUT_SCALE,
+            self.INPUT_SIZE,
+            self.INPUT_MEAN
         )
 
         # Run inference
         self._net.setInput(blob)
         detections = self._net.forward()
 
+        return self.parse_detections(detections[0, 0], image.shape, confidence_threshold)
+
+    def parse_detections(
+        self,
+        rows: np.ndarray,
+        image_shape: tuple,
+        confidence_threshold: Optional[float] = None
+    ) -> list[VehicleDetection]:
+        """
+        Convert SSD output rows into VehicleDetection results.
+
+        Args:
+            rows: Detection rows of shape (N, 7): image id, class id,
+                confidence, x1, y1, x2, y2 (relative coordinates)
+            image_shape: Shape of the original image (h, w, ...)
+            confidence_threshold: Minimum confidence (defaults to CONFIDENCE_THRESHOLD)
+
+        Returns:
+            List of VehicleDetection results (vehicle classes only)
+        """
+        if confidence_threshold is None:
+            confidence_threshold = self.CONFIDENCE_THRESHOLD
+
+        (h, w) = image_shape[:2]
         vehicles = []
 
         # Process detections
-        for i in range(detections.shape[2]):
-            confidence = detections[0, 0, i, 2]
+        for row in rows:
+            confidence = row[2]
 
             if confidence < confidence_threshold:
                 continue
 
             # Get class ID
-            class_id = int(detections[0, 0, i, 1])
+            class_id = int(row[1])
 
             # Check if it's a vehicle class
             if class_id not in VOC_VEHICLE_INDICES:
@@ -260,7 +285,7 @@ class VehicleDetectionService:
             vehicle_type = VOC_VEHICLE_INDICES[class_id]
 
             # Get bounding box (scaled to original image size)
-            box = detections[0, 0, i, 3:7] * np.array([w, h, w, h])
+            box = row[3:7] * np.array([w, h, w, h])
             (x1, y1, x2, y2) = box.astype("int")
 
             # Ensure coordinates are within image bounds
@@ -276,7 +301,7 @@ class VehicleDetectionService:
             if width <= 0 or height <= 0:
                 continue
 
-            bbox = BoundingBox(x=x1, y=y1, width=width, height=height)
+            bbox = BoundingBox(x=int(x1), y=int(y1), width=int(width), height=int(height))
             vehicles.append(VehicleDetection(
                 bbox=bbox,
                 confidence=float(confidence),
@@ -344,14 +369,31 @@ class VehicleDetectionService:
             bbox: Bounding box of the vehicle
             padding: Padding around vehicle as fraction (default: DEFAULT_PADDING)
 
+        Returns:
+            Cropped and resized vehicle image as JPEG bytes
+        """
+        return self.crop_vehicle_image(self._bytes_to_cv2(image_bytes), bbox, padding)
+
+    def crop_vehicle_image(
+        self,
+        image: np.ndarray,
+        bbox: BoundingBox,
+        padding: Optional[float] = None
+    ) -> bytes:
+        """
+        Crop a vehicle region from an already decoded image.
+
+        Args:
+            image: OpenCV image (BGR format)
+            bbox: Bounding box of the vehicle
+            padding: Padding around vehicle as fraction (default: DEFAULT_PADDING)
+
         Returns:
             Cropped and resized vehicle image as JPEG bytes
         """
         if padding is None:
             padding = self.DEFAULT_PADDING
 
-        # Convert to OpenCV format
-        image = self._bytes_to_cv2(image_bytes)
         (h, w) = image.shape[:2]
 
         # Calculate padded bounding box
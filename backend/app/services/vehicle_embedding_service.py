@@ -22,7 +22,7 @@ import asyncio
 import json
 import logging
 from app.core.decorators import singleton
-from typing import Optional
+from typing import Optional, TYPE_CHECKING
 
 from sqlalchemy.orm import Session
 
@@ -34,6 +34,9 @@ from app.services.vehicle_detection_service import (
 )
 from app.services.embedding_service import EmbeddingService, get_embedding_service
 
+if TYPE_CHECKING:
+    from app.services.detection_service import FrameDetections
+
 logger = logging.getLogger(__name__)
 
 
@@ -81,6 +84,7 @@ class VehicleEmbeddingService:
         event_id: str,
         thumbnail_bytes: bytes,
         confidence_threshold: Optional[float] = None,
+        detections: Optional["FrameDetections"] = None,
     ) -> list[str]:
         """
         Detect vehicles, generate embeddings, and store them.
@@ -90,10 +94,91 @@ class VehicleEmbeddingService:
             event_id: UUID of the event
             thumbnail_bytes: Raw thumbnail image bytes
             confidence_threshold: Optional confidence threshold for vehicle detection
+            detections: Result of a fused DetectionService pass over the
+                thumbnail; when given, detection and decoding are skipped
 
         Returns:
             List of created VehicleEmbedding IDs
 
+        Raises:
+            ValueError: If thumbnail_bytes is empty
+        """
+        vehicle_embeddings = await self.build_event_vehicle_embeddings(
+            event_id, thumbnail_bytes,
+            confidence_threshold=confidence_threshold, detections=detections,
+        )
+        if not vehicle_embeddings:
+            return []
+
+        vehicle_embedding_ids = []
+
+        for i, vehicle_embedding in enumerate(vehicle_embeddings):
+            try:
+                db.add(vehicle_embedding)
+                db.commit()
+                db.refresh(vehicle_embedding)
+
+                vehicle_embedding_ids.append(vehicle_embedding.id)
+
+                logger.debug(
+                    f"Stored vehicle embedding {i+1}/{len(vehicle_embeddings)}",
+                    extra={
+                        "event_type": "vehicle_embedding_stored",
+                        "event_id": event_id,
+                        "vehicle_embedding_id": vehicle_embedding.id,
+                        "confidence": vehicle_embedding.confidence,
+                        "vehicle_type": vehicle_embedding.vehicle_type,
+                    }
+                )
+
+            except Exception as e:
+                logger.error(
+                    f"Failed to store vehicle {i+1}/{len(vehicle_embeddings)}: {e}",
+                    exc_info=True,
+                    extra={
+                        "event_type": "vehicle_embedding_error",
+                        "event_id": event_id,
+                        "vehicle_index": i,
+                        "error": str(e),
+                    }
+                )
+                # Continue storing remaining vehicles
+
+        logger.info(
+            f"Processed {len(vehicle_embedding_ids)}/{len(vehicle_embeddings)} vehicle embeddings for event",
+            extra={
+                "event_type": "vehicle_embeddings_complete",
+                "event_id": event_id,
+                "success_count": len(vehicle_embedding_ids),
+                "total_vehicles": len(vehicle_embeddings),
+            }
+        )
+
+        return vehicle_embedding_ids
+
+    async def build_event_vehicle_embeddings(
+        self,
+        event_id: str,
+        thumbnail_bytes: bytes,
+        confidence_threshold: Optional[float] = None,
+        detections: Optional["FrameDetections"] = None,
+    ) -> list[VehicleEmbedding]:
+        """
+        Detect vehicles and generate their embeddings without touching the database.
+
+        Lets callers that own the transaction (e.g. the post-processing unit
+        of work) run inference first and store the rows in one write.
+
+        Args:
+            event_id: UUID of the event
+            thumbnail_bytes: Raw thumbnail image bytes
+            confidence_threshold: Optional confidence threshold for vehicle detection
+            detections: Result of a fused DetectionService pass over the
+                thumbnail; when given, detection and decoding are skipped
+
+        Returns:
+            Unsaved VehicleEmbedding rows, one per vehicle that could be embedded
+
         Raises:
             ValueError: If thumbnail_bytes is empty
         """
@@ -101,10 +186,13 @@ class VehicleEmbeddingService:
             raise ValueError("thumbnail_bytes cannot be empty")
 
         # Step 1: Detect vehicles
-        vehicles = await self._vehicle_detector.detect_vehicles(
-            thumbnail_bytes,
-            confidence_threshold=confidence_threshold
-        )
+        if detections is not None:
+            vehicles = detections.vehicles
+        else:
+            vehicles = await self._vehicle_detector.detect_vehicles(
+                thumbnail_bytes,
+                confidence_threshold=confidence_threshold
+            )
 
         if not vehicles:
             logger.debug(
@@ -124,48 +212,36 @@ class VehicleEmbeddingService:
             }
         )
 
-        # Step 2: Process each vehicle
-        vehicle_embedding_ids = []
+        # Step 2: Embed each vehicle
+        vehicle_embeddings = []
 
         for i, vehicle in enumerate(vehicles):
             try:
                 # Extract vehicle region
-                vehicle_bytes = self._vehicle_detector.crop_vehicle(
-                    thumbnail_bytes,
-                    vehicle.bbox
-                )
+                if detections is not None:
+                    vehicle_bytes = self._vehicle_detector.crop_vehicle_image(
+                        detections.image,
+                        vehicle.bbox
+                    )
+                else:
+                    vehicle_bytes = self._vehicle_detector.crop_vehicle(
+                        thumbnail_bytes,
+                        vehicle.bbox
+                    )
 
                 # Generate embedding using CLIP on the cropped vehicle
                 embedding_vector = await self._embedding_service.generate_embedding(
                     vehicle_bytes
                 )
 
-                # Store vehicle embedding
-                vehicle_embedding = VehicleEmbedding(
+                vehicle_embeddings.append(VehicleEmbedding(
                     event_id=event_id,
                     embedding=json.dumps(embedding_vector),
                     bounding_box=json.dumps(vehicle.bbox.to_dict()),
                     confidence=vehicle.confidence,
                     vehicle_type=vehicle.vehicle_type,
                     model_version=self.MODEL_VERSION,
-                )
-
-                db.add(vehicle_embedding)
-                db.commit()
-                db.refresh(vehicle_embedding)
-
-                vehicle_embedding_ids.append(vehicle_embedding.id)
-
-                logger.debug(
-                    f"Stored vehicle embedding {i+1}/{len(vehicles)}",
-                    extra={
-                        "event_type": "vehicle_embedding_stored",
-                        "event_id": event_id,
-                        "vehicle_embedding_id": vehicle_embedding.id,
-                        "confidence": vehicle.confidence,
-                        "vehicle_type": vehicle.vehicle_type,
-                    }
-                )
+                ))
 
             except Exception as e:
                 logger.error(
@@ -180,17 +256,7 @@ class VehicleEmbeddingService:
                 )
                 # Continue processing remaining vehicles
 
-        logger.info(
-            f"Processed {len(vehicle_embedding_ids)}/{len(vehicles)} vehicle embeddings for event",
-            extra={
-                "event_type": "vehicle_embeddings_complete",
-                "event_id": event_id,
-                "success_count": len(vehicle_embedding_ids),
-                "total_vehicles": len(vehicles),
-            }
-        )
-
-        return vehicle_embedding_ids
+        return vehicle_embeddings
 
     async def get_vehicle_embeddings(
         self,
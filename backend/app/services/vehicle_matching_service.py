@@ -411,6 +411,45 @@ class VehicleMatchingService:
             threshold: Minimum similarity score for matching
             update_appearance: If True, update reference embedding on high-confidence match
 
+        Returns:
+            List of VehicleMatchResult, one per vehicle embedding (same order)
+        """
+        return self.match_vehicles_sync(
+            db,
+            vehicle_embedding_ids,
+            event_description=event_description,
+            auto_create=auto_create,
+            threshold=threshold,
+            update_appearance=update_appearance,
+        )
+
+    def match_vehicles_sync(
+        self,
+        db: Session,
+        vehicle_embedding_ids: list[str],
+        event_description: Optional[str] = None,
+        auto_create: bool = True,
+        threshold: float = DEFAULT_THRESHOLD,
+        update_appearance: bool = True,
+        commit: bool = True,
+    ) -> list[VehicleMatchResult]:
+        """
+        Synchronous core of match_vehicles_to_entities.
+
+        With ``commit=False`` changes are only flushed, so the matches can be
+        staged inside a caller's transaction (e.g. a DatabaseWriter callable).
+        The vehicle cache is updated as matches are made; callers that may
+        roll back must invalidate it on failure.
+
+        Args:
+            db: SQLAlchemy database session
+            vehicle_embedding_ids: List of VehicleEmbedding IDs to match
+            event_description: AI description for characteristics extraction
+            auto_create: If True, create new vehicle when no match found
+            threshold: Minimum similarity score for matching
+            update_appearance: If True, update reference embedding on high-confidence match
+            commit: Commit after each match (False only flushes)
+
         Returns:
             List of VehicleMatchResult, one per vehicle embedding (same order)
         """
@@ -420,13 +459,14 @@ class VehicleMatchingService:
         results = []
         for vehicle_id in vehicle_embedding_ids:
             try:
-                result = await self.match_single_vehicle(
+                result = self._match_single_vehicle(
                     db,
                     vehicle_id,
                     event_description=event_description,
                     threshold=threshold,
                     auto_create=auto_create,
                     update_appearance=update_appearance,
+                    commit=commit,
                 )
                 results.append(result)
             except Exception as e:
@@ -479,6 +519,26 @@ class VehicleMatchingService:
         Raises:
             ValueError: If vehicle embedding not found
         """
+        return self._match_single_vehicle(
+            db,
+            vehicle_embedding_id,
+            event_description=event_description,
+            threshold=threshold,
+            auto_create=auto_create,
+            update_appearance=update_appearance,
+        )
+
+    def _match_single_vehicle(
+        self,
+        db: Session,
+        vehicle_embedding_id: str,
+        event_description: Optional[str],
+        threshold: float,
+        auto_create: bool,
+        update_appearance: bool,
+        commit: bool = True,
+    ) -> VehicleMatchResult:
+        """Synchronous core of match_single_vehicle (see match_vehicles_sync)."""
         from app.models.vehicle_embedding import VehicleEmbedding
         from app.models.recognized_entity import RecognizedEntity, EntityEvent
 
@@ -515,7 +575,7 @@ class VehicleMatchingService:
             if signature_match_id:
                 # Found vehicle with matching signature - use it
                 match_time_ms = (time.time() - start_time) * 1000
-                result = await self._update_existing_vehicle(
+                result = self._update_existing_vehicle(
                     db,
                     vehicle_embedding,
                     signature_match_id,
@@ -525,6 +585,7 @@ class VehicleMatchingService:
                     vehicle_type,
                     characteristics,
                     update_appearance,
+                    commit=commit,
                 )
                 logger.info(
                     f"Vehicle matched by signature: {vehicle_signature} -> {signature_match_id}",
@@ -541,9 +602,9 @@ class VehicleMatchingService:
         # If no vehicles exist, create first one (if auto_create enabled)
         if not self._vehicle_cache:
             if auto_create:
-                result = await self._create_new_vehicle(
+                result = self._create_new_vehicle(
                     db, vehicle_embedding, embedding_vector, bounding_box,
-                    vehicle_type, characteristics
+                    vehicle_type, characteristics, commit=commit
                 )
                 match_time_ms = (time.time() - start_time) * 1000
                 logger.info(
@@ -588,7 +649,7 @@ class VehicleMatchingService:
         if best_idx >= 0:
             # Match found
             matched_vehicle_id = vehicle_ids[best_idx]
-            result = await self._update_existing_vehicle(
+            result = self._update_existing_vehicle(
                 db,
                 vehicle_embedding,
                 matched_vehicle_id,
@@ -598,6 +659,7 @@ class VehicleMatchingService:
                 vehicle_type,
                 characteristics,
                 update_appearance,
+                commit=commit,
             )
             logger.info(
                 f"Vehicle embedding {vehicle_embedding_id} matched to vehicle {matched_vehicle_id}",
@@ -614,9 +676,9 @@ class VehicleMatchingService:
         else:
             # No match found
             if auto_create:
-                result = await self._create_new_vehicle(
+                result = self._create_new_vehicle(
                     db, vehicle_embedding, embedding_vector, bounding_box,
-                    vehicle_type, characteristics
+                    vehicle_type, characteristics, commit=commit
                 )
                 logger.info(
                     f"New vehicle created from embedding {vehicle_embedding_id}",
@@ -652,7 +714,7 @@ class VehicleMatchingService:
                     extracted_characteristics=characteristics,
                 )
 
-    async def _create_new_vehicle(
+    def _create_new_vehicle(
         self,
         db: Session,
         vehicle_embedding,  # VehicleEmbedding model
@@ -660,6 +722,7 @@ class VehicleMatchingService:
         bounding_box: dict,
         vehicle_type: Optional[str],
         characteristics: dict,
+        commit: bool = True,
     ) -> VehicleMatchResult:
         """Create a new vehicle entity from a vehicle embedding."""
         from app.models.recognized_entity import RecognizedEntity, EntityEvent
@@ -707,7 +770,10 @@ class VehicleMatchingService:
         )
         db.add(entity_event)
 
-        db.commit()
+        if commit:
+            db.commit()
+        else:
+            db.flush()
 
         # Update cache
         self._vehicle_cache[vehicle_id] = embedding_vector
@@ -724,7 +790,7 @@ class VehicleMatchingService:
             extracted_characteristics=characteristics,
         )
 
-    async def _update_existing_vehicle(
+    def _update_existing_vehicle(
         self,
         db: Session,
         vehicle_embedding,  # VehicleEmbedding model
@@ -735,6 +801,7 @@ class VehicleMatchingService:
         vehicle_type: Optional[str],
         characteristics: dict,
         update_appearance: bool,
+        commit: bool = True,
     ) -> VehicleMatchResult:
         """Update an existing vehicle with new occurrence."""
         from app.models.recognized_entity import RecognizedEntity, EntityEvent
@@ -821,8 +888,11 @@ class VehicleMatchingService:
             )
             db.add(entity_event)
 
-        db.commit()
-        db.refresh(vehicle)
+        if commit:
+            db.commit()
+            db.refresh(vehicle)
+        else:
+            db.flush()
 
         return VehicleMatchResult(
             vehicle_embedding_id=vehicle_embedding.id,
@@ -5,7 +5,9 @@ Central orchestrator for all AI vision analysis (single-frame and multi-frame).
 
 This service owns the complex logic that used to live in AIService:
 
-- Provider fallback chain (configurable order from DB)
+- Provider fallback chain (configurable order from DB), reordered by measured
+  latency and optionally hedged (AILatencyRouter)
+- Image payloads sized per provider and cropped to motion (ImagePayloadOptimizer)
 - SLA timeout enforcement (<5s p95 target for single image, 10s for multi)
 - Circuit breaker integration (via AIResilienceService)
 - Rate-limit backoff with provider-specific policies
@@ -26,15 +28,12 @@ Story / Issue: Part of #444 + #446 + #450
 """
 
 import asyncio
-import base64
-import io
 import logging
 import time
 from datetime import datetime, timezone
-from typing import Dict, List, Optional, Any
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 import numpy as np
-from PIL import Image
 
 from app.services.ai_prompt_service import AIPromptService
 from app.services.ai_resilience_service import AIResilienceService
@@ -43,6 +42,8 @@ from app.services.ai_providers.base import AIProviderBase
 from app.services.ocr_service import OCRResult
 from app.core.database import get_db_session
 from app.services.ai_cost_and_usage_tracker import get_ai_cost_and_usage_tracker
+from app.services.ai_latency_router import get_ai_latency_router
+from app.services.image_payload_optimizer import get_image_payload_optimizer
 from app.core.decorators import singleton
 
 logger = logging.getLogger(__name__)
@@ -105,12 +106,17 @@ class VisionAnalysisOrchestrator:
         camera_id: Optional[str] = None,
         ocr_result: Optional[OCRResult] = None,
         analysis_mode: str = "single_image",
+        regions: Optional[List[Tuple[int, int, int, int]]] = None,
     ) -> AIResult:
         """
         Main entry point for single-frame analysis (Phase 3.2).
 
         This is the extracted version of the old AIService.generate_description.
         Owns SLA enforcement, provider fallback, resilience checks, and backoff.
+
+        ``regions`` are (x, y, width, height) pixel boxes of motion/detections;
+        the frame sent to providers is cropped to them (with context) and
+        returned bounding boxes are mapped back to the full frame.
         """
         if sla_timeout_ms is None:
             sla_timeout_ms = self.default_single_image_sla_ms
@@ -139,11 +145,14 @@ class VisionAnalysisOrchestrator:
         if effective_prompt:
             logger.debug(f"Using selected prompt: '{effective_prompt[:50]}...', variant={prompt_variant}")
 
-        # Preprocess image (now owned here)
-        image_base64 = self._preprocess_image(frame)
+        # Prepare the image once; each provider gets a variant sized for it
+        optimizer = get_image_payload_optimizer()
+        payload = optimizer.prepare(frame, regions)
 
-        # Get provider order
-        provider_order = self._get_provider_order()
+        # Get provider order, fastest measured providers first
+        router = get_ai_latency_router()
+        provider_order = router.rank(self._get_provider_order(), self._provider_models())
+        attempted: Set[AIProvider] = set()
         last_error = None
 
         # Check configured providers
@@ -162,7 +171,25 @@ class VisionAnalysisOrchestrator:
                 error="No AI providers configured. Please add an API key in Settings."
             )
 
-        for provider_enum in provider_order:
+        async def call(provider_type: AIProvider) -> AIResult:
+            image = payload.for_provider(provider_type.value)
+            optimizer.record_request(provider_type.value, [image], analysis_mode)
+            return await self._try_with_backoff(
+                self.providers[provider_type],
+                image.base64,
+                camera_name,
+                timestamp,
+                detected_objects,
+                custom_prompt=effective_prompt,
+                provider_type=provider_type,
+                audio_transcription=audio_transcription,
+                ocr_result=ocr_result
+            )
+
+        for index, provider_enum in enumerate(provider_order):
+            if provider_enum in attempted:
+                continue  # already raced as a hedge
+
             # SLA check
             elapsed_ms = int((time.time() - start_time) * 1000)
             if elapsed_ms >= sla_timeout_ms:
@@ -204,27 +231,24 @@ class VisionAnalysisOrchestrator:
 
             logger.info(f"Attempting {provider_name}... (elapsed: {elapsed_ms}ms)")
 
-            # Backoff + call (now owned by orchestrator)
-            result = await self._try_with_backoff(
-                provider,
-                image_base64,
-                camera_name,
-                timestamp,
-                detected_objects,
-                custom_prompt=effective_prompt,
-                provider_type=provider_enum,
-                audio_transcription=audio_transcription,
-                ocr_result=ocr_result
-            )
-
-            # Track usage (now owned here)
-            self._track_usage(result, analysis_mode="single_image", image_count=1)
-
-            # Record resilience result
-            if self.resilience_service and result is not None:
-                self.resilience_service.record_result(provider_name, result.success)
+            # Backoff + call, raced against the next provider once it runs past its p95
+            attempted.add(provider_enum)
+            hedge_delay_ms = router.hedge_delay_ms(provider_name, self._provider_model(provider))
+            backup_enum = None
+            if hedge_delay_ms is not None:
+                backup_enum = self._hedge_backup(provider_order[index + 1:], attempted)
+            if backup_enum is None:
+                started = time.monotonic()
+                result = await call(provider_enum)
+                self._record_attempt(provider_enum, result, (time.monotonic() - started) * 1000)
+            else:
+                attempted.add(backup_enum)
+                provider_enum, result = await self._hedged_attempt(
+                    provider_enum, backup_enum, hedge_delay_ms, call
+                )
 
             if result.success:
+                result.bounding_boxes = payload.map_boxes(result.bounding_boxes)
                 total_elapsed_ms = int((time.time() - start_time) * 1000)
                 logger.info(
                     f"Success with {result.provider}: '{result.description[:50]}...' "
@@ -292,17 +316,17 @@ class VisionAnalysisOrchestrator:
                 error="Empty image list provided"
             )
 
-        # Preprocess all images
-        images_base64 = []
+        # Decode all images once; each provider gets variants sized for it
+        optimizer = get_image_payload_optimizer()
+        payloads = []
         for i, img_bytes in enumerate(images):
             try:
-                base64_img = self._preprocess_image_bytes(img_bytes)
-                images_base64.append(base64_img)
+                payloads.append(optimizer.prepare_bytes(img_bytes))
             except Exception as e:
                 logger.warning(f"Failed to preprocess image {i+1}/{len(images)}: {e}")
                 continue
 
-        if not images_base64:
+        if not payloads:
             return AIResult(
                 description="Failed to preprocess images for analysis",
                 confidence=0,
@@ -379,9 +403,11 @@ class VisionAnalysisOrchestrator:
 
             logger.info(f"Attempting multi-image with {provider_name}...")
 
+            encoded = [payload.for_provider(provider_name) for payload in payloads]
+            optimizer.record_request(provider_name, encoded, "multi_frame")
             result = await self._try_multi_image_with_backoff(
                 provider,
-                images_base64,
+                [image.base64 for image in encoded],
                 camera_name,
                 timestamp,
                 detected_objects,
@@ -391,7 +417,7 @@ class VisionAnalysisOrchestrator:
                 ocr_result=ocr_result
             )
 
-            self._track_usage(result, analysis_mode="multi_frame", image_count=len(images_base64))
+            self._track_usage(result, analysis_mode="multi_frame", image_count=len(encoded))
 
             if self.resilience_service and result is not None:
                 self.resilience_service.record_result(provider_name, result.success)
@@ -418,6 +444,130 @@ class VisionAnalysisOrchestrator:
     # Internal Orchestration Helpers (will be moved/adapted)
     # =====================================================================
 
+    def _provider_model(self, provider: AIProviderBase) -> Optional[str]:
+        """Model name a provider is configured with (Gemini keeps it in model_name)."""
+        model = getattr(provider, "model_name", None) or getattr(provider, "model", None)
+        return model if isinstance(model, str) else None
+
+    def _provider_models(self) -> Dict[AIProvider, Optional[str]]:
+        return {
+            provider_enum: self._provider_model(provider)
+            for provider_enum, provider in self.providers.items()
+            if provider is not None
+        }
+
+    def _record_attempt(self, provider_enum: AIProvider, result: AIResult, latency_ms: float) -> None:
+        """Track usage, latency and circuit breaker outcome of one single-image call."""
+        self._track_usage(result, analysis_mode="single_image", image_count=1)
+        get_ai_latency_router().record(
+            provider_enum.value,
+            self._provider_model(self.providers.get(provider_enum)),
+            latency_ms,
+            result.success,
+            result.cost_estimate,
+        )
+        if self.resilience_service and result is not None:
+            self.resilience_service.record_result(provider_enum.value, result.success)
+
+    def _hedge_backup(
+        self, candidates: List[AIProvider], attempted: Set[AIProvider]
+    ) -> Optional[AIProvider]:
+        """First later provider that is configured, closed-circuit and within the cost budget."""
+        router = get_ai_latency_router()
+        for provider_enum in candidates:
+            provider = self.providers.get(provider_enum)
+            if provider is None or provider_enum in attempted:
+                continue
+            if self.resilience_service and not self.resilience_service.can_use_provider(provider_enum.value):
+                continue
+            if router.within_budget(provider_enum.value, self._provider_model(provider)):
+                return provider_enum
+        return None
+
+    async def _hedged_attempt(
+        self,
+        primary_enum: AIProvider,
+        backup_enum: AIProvider,
+        delay_ms: float,
+        call: Callable[[AIProvider], Awaitable[AIResult]],
+    ) -> Tuple[AIProvider, AIResult]:
+        """
+        Call the primary provider and, if it has not answered within delay_ms,
+        race it against the backup.
+
+        The first successful result wins and the other request is cancelled.
+        The cancelled request is recorded with the router as a censored
+        sample of its elapsed time. It may still be billed, so its extra
+        cost is estimated from the provider's mean cost.
+
+        Returns:
+            (provider that produced the result, result); the primary's failed
+            result if neither succeeded
+        """
+        router = get_ai_latency_router()
+        started = time.monotonic()
+        primary = asyncio.ensure_future(call(primary_enum))
+        done, _ = await asyncio.wait({primary}, timeout=delay_ms / 1000)
+        if done:
+            result = primary.result()
+            self._record_attempt(primary_enum, result, (time.monotonic() - started) * 1000)
+            return primary_enum, result
+
+        logger.info(
+            f"{primary_enum.value} still running after {delay_ms:.0f}ms (p95), hedging with {backup_enum.value}",
+            extra={
+                "event_type": "ai_hedge_sent",
+                "primary": primary_enum.value,
+                "backup": backup_enum.value,
+                "delay_ms": delay_ms,
+            }
+        )
+        backup = asyncio.ensure_future(call(backup_enum))
+        tasks = {primary: (primary_enum, started), backup: (backup_enum, time.monotonic())}
+        finished: Dict[AIProvider, AIResult] = {}
+        winner: Optional[AIProvider] = None
+        pending = set(tasks)
+        try:
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    provider_enum, task_started = tasks[task]
+                    result = task.result()
+                    self._record_attempt(provider_enum, result, (time.monotonic() - task_started) * 1000)
+                    finished[provider_enum] = result
+                    if result.success and winner is None:
+                        winner = provider_enum
+        finally:
+            for task in pending:
+                provider_enum, task_started = tasks[task]
+                router.record(
+                    provider_enum.value,
+                    self._provider_model(self.providers.get(provider_enum)),
+                    (time.monotonic() - task_started) * 1000,
+                    False,
+                    censored=True,
+                )
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        extra_cost = 0.0
+        if winner is not None:
+            loser = backup_enum if winner == primary_enum else primary_enum
+            if loser in finished:
+                extra_cost = finished[loser].cost_estimate or 0.0
+            else:
+                extra_cost = router.estimated_cost(loser.value, self._provider_model(self.providers[loser]))
+        router.record_hedge(
+            primary_enum.value,
+            backup_enum.value,
+            winner.value if winner is not None else None,
+            extra_cost,
+        )
+        if winner is None:
+            return primary_enum, finished[primary_enum]
+        return winner, finished[winner]
+
     def _get_provider_order(self) -> List[AIProvider]:
         """
         Get the current provider fallback order (from DB settings or default).
@@ -431,85 +581,19 @@ class VisionAnalysisOrchestrator:
         """
         Preprocess frame for AI API transmission.
 
-        - Resize to max 2048x2048
-        - Convert to JPEG (85% quality)
-        - Base64 encode
-        - Ensure <5MB payload
+        Provider-independent variant (max 2048px, JPEG 85%, <5MB, base64) for
+        callers outside the provider loop; analyze_image sizes per provider.
         """
-        # Convert BGR (OpenCV) to RGB (PIL)
-        if len(frame.shape) == 3 and frame.shape[2] == 3:
-            frame_rgb = frame[:, :, ::-1]  # BGR to RGB
-        else:
-            frame_rgb = frame
-
-        # Create PIL image
-        image = Image.fromarray(frame_rgb)
-
-        # Resize if necessary
-        max_dim = 2048
-        if max(image.size) > max_dim:
-            ratio = max_dim / max(image.size)
-            new_size = tuple(int(dim * ratio) for dim in image.size)
-            image = image.resize(new_size, Image.Resampling.LANCZOS)
-            logger.debug(f"Resized image to {new_size}")
-
-        # Convert to JPEG with 85% quality
-        buffer = io.BytesIO()
-        image.convert('RGB').save(buffer, format='JPEG', quality=85)
-        jpeg_bytes = buffer.getvalue()
-
-        # Check size
-        size_mb = len(jpeg_bytes) / (1024 * 1024)
-        if size_mb > 5:
-            # Re-encode with lower quality
-            buffer = io.BytesIO()
-            image.convert('RGB').save(buffer, format='JPEG', quality=70)
-            jpeg_bytes = buffer.getvalue()
-            logger.warning(f"Image too large ({size_mb:.2f}MB), re-encoded at 70% quality")
-
-        # Base64 encode
-        image_base64 = base64.b64encode(jpeg_bytes).decode('utf-8')
-
-        logger.debug(f"Preprocessed image: {len(image_base64)} chars base64, {size_mb:.2f}MB")
-        return image_base64
+        return get_image_payload_optimizer().prepare(frame).for_provider(None).base64
 
     def _preprocess_image_bytes(self, image_bytes: bytes) -> str:
         """
         Preprocess raw image bytes for AI API transmission (Story P3-2.3).
 
         Similar to _preprocess_image but accepts raw bytes instead of numpy array.
-        Used for multi-image analysis with frames from FrameExtractor.
+        Used by the LiteLLM multi-image path with frames from FrameExtractor.
         """
-        # Load image from bytes
-        image = Image.open(io.BytesIO(image_bytes))
-
-        # Resize if necessary
-        max_dim = 2048
-        if max(image.size) > max_dim:
-            ratio = max_dim / max(image.size)
-            new_size = tuple(int(dim * ratio) for dim in image.size)
-            image = image.resize(new_size, Image.Resampling.LANCZOS)
-            logger.debug(f"Resized image from bytes to {new_size}")
-
-        # Convert to JPEG with 85% quality
-        buffer = io.BytesIO()
-        image.convert('RGB').save(buffer, format='JPEG', quality=85)
-        jpeg_bytes = buffer.getvalue()
-
-        # Check size
-        size_mb = len(jpeg_bytes) / (1024 * 1024)
-        if size_mb > 5:
-            # Re-encode with lower quality
-            buffer = io.BytesIO()
-            image.convert('RGB').save(buffer, format='JPEG', quality=70)
-            jpeg_bytes = buffer.getvalue()
-            logger.warning(f"Image bytes too large ({size_mb:.2f}MB), re-encoded at 70% quality")
-
-        # Base64 encode
-        image_base64 = base64.b64encode(jpeg_bytes).decode('utf-8')
-
-        logger.debug(f"Preprocessed image bytes: {len(image_base64)} chars base64, {size_mb:.2f}MB")
-        return image_base64
+        return get_image_payload_optimizer().prepare_bytes(image_bytes).for_provider(None).base64
 
     async def _try_with_backoff(
         self,
@@ -83,6 +83,26 @@ class WebSocketManager:
         """
         Broadcast a message to all connected WebSocket clients.
 
+        In cluster mode the message is also published to the other replicas,
+        which send it to their own clients.
+
+        Args:
+            message: Dictionary to serialize and send as JSON
+
+        Returns:
+            Number of clients on this replica that successfully received the message
+        """
+        from app.services.cluster_service import get_cluster_service
+
+        cluster = get_cluster_service()
+        if cluster.running:
+            await cluster.publish("websocket", {"message": message})
+        return await self.broadcast_local(message)
+
+    async def broadcast_local(self, message: Dict[str, Any]) -> int:
+        """
+        Send a message to the clients connected to this replica.
+
         Adds timestamp to message and handles individual connection errors
         without affecting other connections.
 
@@ -16,6 +16,11 @@ import certifi as _certifi
 os.environ.setdefault("SSL_CERT_FILE", _certifi.where())
 os.environ.setdefault("REQUESTS_CA_BUNDLE", _certifi.where())
 
+# Time every module main.py pulls in (served at /api/v1/system/debug/startup-profile)
+from app.core.startup_profiler import startup_profiler
+startup_profiler.start_import_tracking()
+
+import asyncio
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
@@ -24,9 +29,9 @@ from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 
 from app.core.config import settings
-from app.core.database import engine, Base
+from app.core.database import engine, Base, dispose_async_engine
 from app.core.logging_config import setup_logging, get_logger
-from app.core.metrics import init_metrics, get_metrics, get_content_type, update_system_metrics
+from app.core.metrics import init_metrics, get_metrics, get_content_type, update_system_metrics, monitor_event_loop_lag
 from app.core.json_encoding import install_utc_datetime_encoder
 from app.middleware.logging_middleware import RequestLoggingMiddleware
 from app.middleware.auth_middleware import AuthMiddleware
@@ -75,6 +80,8 @@ from app.services.homekit_service import get_homekit_service, initialize_homekit
 from app.services.motion_detection_service import motion_detection_service  # For DI into EventProcessor
 from app.services.ai_service import AIService  # For DI into EventProcessor
 
+startup_profiler.stop_import_tracking()
+
 # Application version
 APP_VERSION = "1.0.0"
 
@@ -258,6 +265,7 @@ async def lifespan(app: FastAPI):
         }
     )
 
+    startup_profiler.begin_phase("database")
     # Create database tables
     Base.metadata.create_all(bind=engine)
     logger.info(
@@ -265,6 +273,18 @@ async def lifespan(app: FastAPI):
         extra={"event_type": "database_init", "status": "success"}
     )
 
+    # Serialize hot-path SQLite writes through one group-committing writer
+    # thread; must be up before cameras and the event processor produce writes
+    if settings.DATABASE_URL.startswith("sqlite") and settings.SQLITE_SINGLE_WRITER:
+        try:
+            container.database_writer.start()
+        except Exception as e:
+            logger.error(
+                f"Failed to start database writer: {e}",
+                extra={"event_type": "db_writer_start_failed", "error": str(e)}
+            )
+
+    startup_profiler.begin_phase("admin_setup")
     # Ensure admin user exists (Story 6.3)
     from app.core.database import get_db
     setup_db = next(get_db())
@@ -296,6 +316,7 @@ async def lifespan(app: FastAPI):
         extra={"event_type": "directory_init", "path": thumbnail_dir}
     )
 
+    startup_profiler.begin_phase("event_processor")
     # Initialize Event Processor (Story 3.3)
     # Pass already-initialized services for better DI and startup ordering
     await initialize_event_processor(
@@ -308,10 +329,19 @@ async def lifespan(app: FastAPI):
         extra={"event_type": "event_processor_init", "status": "running"}
     )
 
+    startup_profiler.begin_phase("cluster")
+    # Join the cluster before scheduling jobs and starting cameras, so the
+    # lease and shard ring are known. No-op unless CLUSTER_MODE_ENABLED.
+    cluster = container.cluster_service
+    await cluster.start()
+
+    startup_profiler.begin_phase("scheduler")
     # Initialize APScheduler for daily cleanup (Story 3.4)
+    # Singleton jobs are wrapped with cluster.leader_only; system metrics and
+    # the hot activity flush cover this process's own state and run everywhere.
     scheduler = AsyncIOScheduler()
     scheduler.add_job(
-        scheduled_cleanup_job,
+        cluster.leader_only(scheduled_cleanup_job),
         trigger=CronTrigger(hour=2, minute=0),  # Daily at 2:00 AM
         id="daily_cleanup",
         name="Daily event cleanup based on retention policy",
@@ -329,7 +359,7 @@ async def lifespan(app: FastAPI):
 
     # Add automatic backup job (Story 6.4) - Daily at 3:00 AM
     scheduler.add_job(
-        scheduled_backup_job,
+        cluster.leader_only(scheduled_backup_job),
         trigger=CronTrigger(hour=3, minute=0),  # Daily at 3:00 AM
         id="daily_backup",
         name="Daily automatic backup (if enabled)",
@@ -338,7 +368,7 @@ async def lifespan(app: FastAPI):
 
     # Add pattern calculation job (Story P4-3.5) - Hourly
     scheduler.add_job(
-        scheduled_pattern_calculation_job,
+        cluster.leader_only(scheduled_pattern_calculation_job),
         trigger=CronTrigger(minute=0),  # Every hour at :00
         id="hourly_pattern_calculation",
         name="Hourly activity pattern calculation",
@@ -347,7 +377,7 @@ async def lifespan(app: FastAPI):
 
     # Add session cleanup job (Story P15-2.8) - Hourly
     scheduler.add_job(
-        scheduled_session_cleanup_job,
+        cluster.leader_only(scheduled_session_cleanup_job),
         trigger=CronTrigger(minute=30),  # Every hour at :30
         id="hourly_session_cleanup",
         name="Hourly session cleanup",
@@ -371,6 +401,10 @@ async def lifespan(app: FastAPI):
     )
 
     scheduler.start()
+
+    # Sample event-loop lag so blocking calls on the loop show up in /metrics
+    loop_lag_task = asyncio.create_task(monitor_event_loop_lag())
+
     logger.info(
         "Scheduler started",
         extra={
@@ -379,11 +413,11 @@ async def lifespan(app: FastAPI):
         }
     )
 
+    startup_profiler.begin_phase("cameras")
     # Start enabled cameras on startup (Story 4.3)
     from app.core.database import get_db
     from app.models.camera import Camera
     from app.core.metrics import record_camera_status
-    import asyncio
 
     # Set the main event loop for camera service (needed for thread-safe async calls)
     camera_service.set_event_loop(asyncio.get_running_loop())
@@ -392,6 +426,11 @@ async def lifespan(app: FastAPI):
     try:
         enabled_cameras = db.query(Camera).filter(Camera.is_enabled == True).all()
         total_cameras = db.query(Camera).count()
+        # Cluster mode: start only this replica's shard (USB devices stay local)
+        enabled_cameras = [
+            camera for camera in enabled_cameras
+            if camera.type == "usb" or cluster.owns("camera", str(camera.id))
+        ]
         started_count = 0
 
         logger.info(
@@ -404,8 +443,9 @@ async def lifespan(app: FastAPI):
         )
 
         # Small delay to ensure network stack is ready (helps with immediate RTSP connections)
-        import time
-        time.sleep(1)
+        if enabled_cameras:
+            import time
+            time.sleep(1)
 
         for camera in enabled_cameras:
             success = camera_service.start_camera(camera)
@@ -435,6 +475,7 @@ async def lifespan(app: FastAPI):
     finally:
         db.close()
 
+    startup_profiler.begin_phase("protect_controllers")
     # Connect to Protect controllers on startup (Story P2-1.4, AC1)
     from app.models.protect_controller import ProtectController
     protect_service = ProtectService()  # @singleton pattern (#450)
@@ -447,7 +488,10 @@ async def lifespan(app: FastAPI):
         # Initialize app.state.protect_connections (AC9)
         # Note: app is not in scope here yet, so we store in service
 
-        protect_controllers = db.query(ProtectController).all()
+        protect_controllers = [
+            controller for controller in db.query(ProtectController).all()
+            if cluster.owns("controller", str(controller.id))
+        ]
         protect_started_count = 0
 
         if protect_controllers:
@@ -503,6 +547,7 @@ async def lifespan(app: FastAPI):
     finally:
         db.close()
 
+    startup_profiler.begin_phase("mqtt")
     # Initialize MQTT service (Story P4-2.1, AC1, AC2)
     try:
         await initialize_mqtt_service()
@@ -533,6 +578,7 @@ async def lifespan(app: FastAPI):
             extra={"event_type": "mqtt_init_failed", "error": str(e)}
         )
 
+    startup_profiler.begin_phase("digest_scheduler")
     # Initialize Digest Scheduler (Story P4-4.2)
     try:
         await initialize_digest_scheduler()
@@ -547,6 +593,7 @@ async def lifespan(app: FastAPI):
             extra={"event_type": "digest_scheduler_init_failed", "error": str(e)}
         )
 
+    startup_profiler.begin_phase("homekit")
     # Initialize HomeKit service (Story P4-6.1)
     # Only starts if HOMEKIT_ENABLED=true or homekit_enabled setting is true
     try:
@@ -601,6 +648,7 @@ async def lifespan(app: FastAPI):
             extra={"event_type": "homekit_init_failed", "error": str(e)}
         )
 
+    startup_profiler.begin_phase("tunnel")
     # Initialize Cloudflare Tunnel (Story P11-1.1)
     # Only starts if tunnel_enabled setting is true and token is saved
     try:
@@ -671,12 +719,30 @@ async def lifespan(app: FastAPI):
             extra={"event_type": "tunnel_init_failed", "error": str(e)}
         )
 
+    startup_profiler.begin_phase("ai_cost_ledger")
+    # Seed the AI cost ledger and batch usage inserts off the request path
+    try:
+        ai_cost_tracker = container.ai_cost_tracker
+        ai_cost_tracker.get_monthly_cost()
+        ai_cost_tracker.start_write_behind()
+    except Exception as e:
+        logger.warning(
+            f"AI cost ledger initialization failed (non-fatal): {e}",
+            extra={"event_type": "ai_cost_ledger_init_failed", "error": str(e)}
+        )
+
+    startup_profiler.finish_startup()
+    startup_report = startup_profiler.get_report(top=10)
     logger.info(
         "Application startup complete",
         extra={
             "event_type": "app_startup_complete",
             "version": APP_VERSION,
-            "cameras_started": started_count if 'started_count' in dir() else 0
+            "cameras_started": started_count if 'started_count' in dir() else 0,
+            "startup_ms": startup_report["startup_ms"],
+            "import_ms": startup_report["imports"]["total_ms"],
+            "phases": {phase["name"]: phase["duration_ms"] for phase in startup_report["phases"]},
+            "slowest_imports": [t["module"] for t in startup_report["imports"]["slowest"][:5]],
         }
     )
 
@@ -773,6 +839,8 @@ async def lifespan(app: FastAPI):
             extra={"event_type": "hot_activity_shutdown_error", "error": str(e)}
         )
 
+    loop_lag_task.cancel()
+
     # Stop scheduler
     if scheduler and scheduler.running:
         scheduler.shutdown(wait=False)
@@ -788,6 +856,19 @@ async def lifespan(app: FastAPI):
         extra={"event_type": "event_processor_shutdown"}
     )
 
+    # Persist AI usage rows still queued by the write-behind thread
+    try:
+        container.ai_cost_tracker.stop_write_behind()
+        logger.info(
+            "AI usage write-behind flushed",
+            extra={"event_type": "ai_usage_shutdown_flush"}
+        )
+    except Exception as e:
+        logger.error(
+            f"Error flushing AI usage on shutdown: {e}",
+            extra={"event_type": "ai_usage_shutdown_error", "error": str(e)}
+        )
+
     # Stop all camera threads
     camera_service.stop_all_cameras(timeout=5.0)
     logger.info(
@@ -795,6 +876,26 @@ async def lifespan(app: FastAPI):
         extra={"event_type": "cameras_shutdown"}
     )
 
+    # Leave the cluster so the other replicas take over our shards and leases
+    try:
+        await container.cluster_service.stop()
+    except Exception as e:
+        logger.error(
+            f"Error leaving cluster: {e}",
+            extra={"event_type": "cluster_shutdown_error", "error": str(e)}
+        )
+
+    # Commit writes still queued for the single writer thread
+    try:
+        container.database_writer.stop()
+    except Exception as e:
+        logger.error(
+            f"Error stopping database writer: {e}",
+            extra={"event_type": "db_writer_shutdown_error", "error": str(e)}
+        )
+
+    await dispose_async_engine()
+
     logger.info(
         "Application shutdown complete",
         extra={"event_type": "app_shutdown_complete", "version": APP_VERSION}
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Event pipeline throughput benchmark.
+
+Drives synthetic cameras and Protect events through EventProcessor with a
+simulated vision provider and reports events/second, per-stage p50/p99
+latency and queue depths (see app/services/pipeline_benchmark.py).
+
+The run uses a throwaway SQLite database unless --database-url is given, so
+no notifications reach real subscribers and nothing is left behind.
+
+Usage:
+    cd backend
+    python scripts/benchmark_pipeline.py --duration 30 --cameras 8 --output bench.json
+    python scripts/benchmark_pipeline.py --duration 30 --compare bench.json
+
+Output:
+    JSON report on stdout (or --output), and a comparison table on stderr
+    when --compare is given
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add backend directory to path for imports
+backend_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(backend_dir))
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Benchmark the event pipeline end to end")
+    parser.add_argument("--duration", type=float, default=20.0, help="Seconds of load (default 20)")
+    parser.add_argument("--cameras", type=int, default=4, help="Synthetic RTSP cameras (default 4)")
+    parser.add_argument("--fps", type=int, default=10, help="Frames per second per camera (default 10)")
+    parser.add_argument("--motion-period", type=float, default=3.0, help="Seconds between motion bursts")
+    parser.add_argument("--cooldown", type=float, default=2.0, help="Motion cooldown per camera in seconds")
+    parser.add_argument("--protect-rate", type=float, default=1.0, help="Protect events per second")
+    parser.add_argument("--workers", type=int, default=2, help="EventProcessor AI workers (2-5)")
+    parser.add_argument("--queue-size", type=int, default=50, help="EventProcessor queue size")
+    parser.add_argument("--p50-ms", type=float, default=1200.0, help="Simulated provider median latency")
+    parser.add_argument("--p99-ms", type=float, default=3500.0, help="Simulated provider p99 latency")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Simulated provider error rate")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--database-url", help="Database to use instead of a temporary SQLite file")
+    parser.add_argument("--output", type=Path, help="Write the JSON report to this file")
+    parser.add_argument("--compare", type=Path, help="Baseline report to compare against")
+    return parser.parse_args()
+
+
+def main() -> int:
+    args = parse_args()
+
+    temp_dir = None
+    if not args.database_url:
+        temp_dir = tempfile.TemporaryDirectory(prefix="argus-bench-")
+        args.database_url = f"sqlite:///{temp_dir.name}/bench.db"
+    # Must be set before the app modules read settings
+    os.environ["DATABASE_URL"] = args.database_url
+
+    logging.basicConfig(level=logging.WARNING)
+
+    from app.core.database import Base, engine
+    import app.models  # noqa: F401 - register all tables
+    from app.services.ai_providers.local_provider import LocalProviderProfile
+    from app.services.pipeline_benchmark import (
+        PipelineBenchmark,
+        PipelineBenchmarkConfig,
+        compare_reports,
+    )
+
+    Base.metadata.create_all(engine)
+
+    config = PipelineBenchmarkConfig(
+        cameras=args.cameras,
+        camera_fps=args.fps,
+        motion_period_seconds=args.motion_period,
+        motion_cooldown_seconds=args.cooldown,
+        protect_events_per_second=args.protect_rate,
+        duration_seconds=args.duration,
+        workers=args.workers,
+        queue_maxsize=args.queue_size,
+        provider=LocalProviderProfile(
+            latency_p50_ms=args.p50_ms,
+            latency_p99_ms=args.p99_ms,
+            error_rate=args.error_rate,
+            seed=args.seed,
+        ),
+        seed=args.seed,
+    )
+    try:
+        report = asyncio.run(PipelineBenchmark(config).run())
+    finally:
+        engine.dispose()
+        if temp_dir is not None:
+            temp_dir.cleanup()
+
+    output = json.dumps(report, indent=2, default=str)
+    if args.output:
+        args.output.write_text(output)
+        print(f"Report written to {args.output}", file=sys.stderr)
+    else:
+        print(output)
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        print(f"\nbaseline {baseline.get('commit')} -> current {report.get('commit')}", file=sys.stderr)
+        print(f"{'stage':<12} {'metric':<22} {'baseline':>10} {'current':>10} {'change':>8}", file=sys.stderr)
+        for row in compare_reports(baseline, report):
+            change = "" if row["change_pct"] is None else f"{row['change_pct']:+.1f}%"
+            print(
+                f"{row['stage']:<12} {row['metric']:<22} {row['baseline']:>10} {row['current']:>10} {change:>8}",
+                file=sys.stderr,
+            )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
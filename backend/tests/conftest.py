@@ -13,6 +13,7 @@ Factory Functions:
 
 Each factory accepts an optional db_session parameter to persist objects.
 """
+import inspect
 import json
 import pytest
 import uuid
@@ -47,6 +48,18 @@ def _reset_all_singletons():
     reset_all_singletons()
 
 
+@pytest.fixture(autouse=True)
+def _isolated_media_store(_reset_all_singletons, tmp_path):
+    """Root the media store singleton in a per-test temp directory.
+
+    Event thumbnails and key frames are externalized to the media store on
+    insert, so without this any test that creates an Event with image data
+    would write blobs into the real ``data/media`` directory.
+    """
+    from app.services.media_store import MediaStore
+    return MediaStore(root=tmp_path / "media")
+
+
 # =============================================================================
 # Factory Functions for Test Objects
 # =============================================================================
@@ -366,6 +379,32 @@ def clear_app_overrides():
     app.dependency_overrides.clear()
 
 
+@pytest.fixture(autouse=True)
+def _route_read_db_to_db_override():
+    """
+    Serve get_read_db from whatever get_db resolves to in the current test.
+
+    Test modules override get_db with their own engine; read-only routes use
+    get_read_db (a separate read pool in production), which would otherwise
+    bypass those overrides and hit the real database file.
+    """
+    from main import app
+    from app.core.database import get_read_db
+
+    def _read_db():
+        provider = app.dependency_overrides.get(get_db, get_db)
+        result = provider()
+        if inspect.isgenerator(result):
+            try:
+                yield next(result)
+            finally:
+                result.close()
+        else:
+            yield result
+
+    app.dependency_overrides[get_read_db] = _read_db
+    yield
+    app.dependency_overrides.pop(get_read_db, None)
 
 
 @pytest.fixture(scope="function")
@@ -1,6 +1,7 @@
 """Integration tests for camera API endpoints"""
 import pytest
 import json
+import base64
 import tempfile
 import os
 from fastapi.testclient import TestClient
@@ -11,6 +12,7 @@ from sqlalchemy.orm import sessionmaker
 from main import app
 from app.core.database import Base, get_db
 from app.models.camera import Camera
+from app.services.service_container import container
 
 
 # Create module-level temp database
@@ -1580,3 +1582,100 @@ class TestCameraCaptureAdminActions:
         assert "restart_attempts" in detail
         assert "worker_status" in detail
         assert "worker_alive" in detail
+
+
+class TestCameraPreviewImage:
+    """Tests for GET /cameras/{id}/preview.jpg (binary preview, ETag/304)."""
+
+    @pytest.fixture(autouse=True)
+    def module_database(self):
+        # api_client-based tests above remove the module-level override
+        app.dependency_overrides[get_db] = _override_get_db
+        yield
+
+    @pytest.fixture
+    def camera_id(self):
+        db = TestingSessionLocal()
+        try:
+            camera = Camera(name="Preview Cam", type="rtsp", rtsp_url="rtsp://example.com/stream")
+            db.add(camera)
+            db.commit()
+            return camera.id
+        finally:
+            db.close()
+
+    @pytest.fixture
+    def mock_camera_service(self):
+        import numpy as np
+
+        service = MagicMock()
+        service.get_camera_status.return_value = {"status": "connected"}
+        service.get_latest_frame_seq.return_value = 7
+        service.get_latest_frame_with_seq.return_value = (
+            np.full((480, 640, 3), 128, dtype=np.uint8), 7
+        )
+        with patch("app.api.v1.cameras.camera_service", service):
+            yield service
+
+    def test_returns_raw_jpeg(self, camera_id, mock_camera_service):
+        response = client.get(f"/api/v1/cameras/{camera_id}/preview.jpg?width=320")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/jpeg"
+        assert response.content[:2] == b"\xff\xd8"
+        assert response.headers["etag"] == f'"{camera_id}-7-320"'
+
+    def test_same_frame_is_encoded_once(self, camera_id, mock_camera_service):
+        for _ in range(3):
+            assert client.get(f"/api/v1/cameras/{camera_id}/preview.jpg").status_code == 200
+
+        assert mock_camera_service.get_latest_frame_with_seq.call_count == 1
+
+        # A new frame produces a new encode and ETag
+        mock_camera_service.get_latest_frame_seq.return_value = 8
+        mock_camera_service.get_latest_frame_with_seq.return_value = (
+            mock_camera_service.get_latest_frame_with_seq.return_value[0], 8
+        )
+        response = client.get(f"/api/v1/cameras/{camera_id}/preview.jpg")
+        assert response.headers["etag"] == f'"{camera_id}-8-640"'
+        assert mock_camera_service.get_latest_frame_with_seq.call_count == 2
+
+    def test_frame_arriving_mid_request_uses_its_own_seq(self, camera_id, mock_camera_service):
+        # The sequence check sees frame 7, but frame 8 is what gets encoded
+        frame = mock_camera_service.get_latest_frame_with_seq.return_value[0]
+        mock_camera_service.get_latest_frame_with_seq.return_value = (frame, 8)
+
+        response = client.get(f"/api/v1/cameras/{camera_id}/preview.jpg")
+
+        assert response.headers["etag"] == f'"{camera_id}-8-640"'
+        assert container.jpeg_cache.get((camera_id, 8, 640)) is not None
+        assert container.jpeg_cache.get((camera_id, 7, 640)) is None
+
+    def test_if_none_match_returns_304_without_encoding(self, camera_id, mock_camera_service):
+        response = client.get(
+            f"/api/v1/cameras/{camera_id}/preview.jpg",
+            headers={"If-None-Match": f'"{camera_id}-7-640"'},
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+        mock_camera_service.get_latest_frame_with_seq.assert_not_called()
+
+    def test_json_preview_shares_the_cache(self, camera_id, mock_camera_service):
+        image = client.get(f"/api/v1/cameras/{camera_id}/preview.jpg")
+        preview = client.get(f"/api/v1/cameras/{camera_id}/preview")
+
+        assert preview.status_code == 200
+        assert base64.b64decode(preview.json()["thumbnail_base64"]) == image.content
+        assert mock_camera_service.get_latest_frame_with_seq.call_count == 1
+
+    def test_camera_not_running(self, camera_id, mock_camera_service):
+        mock_camera_service.get_camera_status.return_value = {"status": "stopped"}
+
+        response = client.get(f"/api/v1/cameras/{camera_id}/preview.jpg")
+
+        assert response.status_code == 400
+
+    def test_camera_not_found(self):
+        response = client.get("/api/v1/cameras/00000000-0000-0000-0000-000000000000/preview.jpg")
+        assert response.status_code == 404
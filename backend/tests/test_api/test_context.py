@@ -3,7 +3,7 @@ API tests for Context endpoints (Story P4-3.1)
 
 Tests:
 - AC8: Batch processing endpoint
-- AC9: Rate limiting (max 100 events per request)
+- AC9: Backfill job limits and pacing
 - AC12: Embedding status endpoint
 
 Note: These tests use a simplified approach that validates the endpoint
@@ -22,7 +22,7 @@ from fastapi import FastAPI
 from fastapi.testclient import TestClient
 from PIL import Image
 
-from app.api.v1.context import router, BatchEmbeddingResponse, EmbeddingStatusResponse, EmbeddingStatsResponse
+from app.api.v1.context import router, BatchEmbeddingJobResponse, EmbeddingStatusResponse, EmbeddingStatsResponse
 from app.services.embedding_service import get_embedding_service, EmbeddingService
 
 
@@ -38,25 +38,31 @@ def mock_embedding_service():
 class TestBatchEndpointValidation:
     """Tests for batch endpoint request validation (AC9)."""
 
-    def test_batch_limit_max_100(self):
-        """Test that batch request model validates limit <= 100 (AC9)."""
-        from pydantic import ValidationError
+    def test_batch_limit_not_capped(self):
+        """Test that a backfill job limit is not capped at 100 events."""
         from app.api.v1.context import BatchEmbeddingRequest
 
-        # Valid limit
         req = BatchEmbeddingRequest(limit=50)
         assert req.limit == 50
 
-        # Max limit
-        req = BatchEmbeddingRequest(limit=100)
-        assert req.limit == 100
+        req = BatchEmbeddingRequest(limit=5000)
+        assert req.limit == 5000
+
+    def test_batch_size_bounds(self):
+        """Test that batch_size must be between 1 and 256."""
+        from pydantic import ValidationError
+        from app.api.v1.context import BatchEmbeddingRequest
+
+        assert BatchEmbeddingRequest(batch_size=256).batch_size == 256
 
-        # Exceeds limit - should raise validation error
         with pytest.raises(ValidationError):
-            BatchEmbeddingRequest(limit=101)
+            BatchEmbeddingRequest(batch_size=0)
 
         with pytest.raises(ValidationError):
-            BatchEmbeddingRequest(limit=200)
+            BatchEmbeddingRequest(batch_size=257)
+
+        with pytest.raises(ValidationError):
+            BatchEmbeddingRequest(max_events_per_second=-1)
 
     def test_batch_limit_min_1(self):
         """Test that batch limit must be at least 1."""
@@ -69,30 +75,41 @@ class TestBatchEndpointValidation:
         with pytest.raises(ValidationError):
             BatchEmbeddingRequest(limit=-1)
 
-    def test_batch_default_limit(self):
-        """Test batch request has default limit of 100."""
+    def test_batch_defaults(self):
+        """Test batch request defaults to every missing event and configured pacing."""
         from app.api.v1.context import BatchEmbeddingRequest
 
         req = BatchEmbeddingRequest()
-        assert req.limit == 100
+        assert req.limit is None
+        assert req.batch_size is None
+        assert req.max_events_per_second is None
 
 
 class TestResponseModels:
     """Tests for API response model structures."""
 
-    def test_batch_response_model(self):
-        """Test BatchEmbeddingResponse model structure (AC8)."""
-        response = BatchEmbeddingResponse(
-            processed=10,
+    def test_batch_job_response_model(self):
+        """Test BatchEmbeddingJobResponse matches the backfill job (AC8)."""
+        from app.services.embedding_backfill_service import EmbeddingBackfillJob, EmbeddingBackfillStatus
+
+        job = EmbeddingBackfillJob(
+            job_id="job-1",
+            status=EmbeddingBackfillStatus.RUNNING,
+            total_events=100,
+            batch_size=32,
+            max_events_per_second=20.0,
+            processed=12,
+            embedded=10,
             failed=2,
-            total=12,
-            remaining=88,
         )
+        response = BatchEmbeddingJobResponse(**job.to_dict())
 
-        assert response.processed == 10
+        assert response.status == "running"
+        assert response.processed == 12
+        assert response.embedded == 10
         assert response.failed == 2
-        assert response.total == 12
         assert response.remaining == 88
+        assert response.percent_complete == 12.0
 
     def test_embedding_status_response_model(self):
         """Test EmbeddingStatusResponse model structure (AC12)."""
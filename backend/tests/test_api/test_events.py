@@ -2336,3 +2336,138 @@ class TestSignedThumbnailEndpoint:
             assert response.status_code == 200
             cache_control = response.headers.get("cache-control", "")
             assert "private" in cache_control or "no-store" in cache_control
+
+
+class TestThumbnailImageEndpoint:
+    """Tests for GET /events/{event_id}/thumbnail.jpg (binary, ETag/304)."""
+
+    JPEG_BYTES = b"\xff\xd8\xff\xe0thumbnail-bytes\xff\xd9"
+
+    @pytest.fixture
+    def event_id(self, test_camera):
+        db = TestingSessionLocal()
+        try:
+            event = Event(
+                id="event-thumbnail-image",
+                camera_id=test_camera.id,
+                timestamp=datetime.now(timezone.utc),
+                description="Test event with thumbnail",
+                confidence=90,
+                objects_detected=json.dumps(["person"]),
+                alert_triggered=False,
+                thumbnail_base64=base64.b64encode(self.JPEG_BYTES).decode("utf-8"),
+            )
+            db.add(event)
+            db.commit()
+            return event.id
+        finally:
+            db.close()
+
+    def test_returns_raw_jpeg_with_validators(self, event_id):
+        response = client.get(f"/api/v1/events/{event_id}/thumbnail.jpg")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/jpeg"
+        assert response.content == self.JPEG_BYTES
+        assert response.headers["etag"]
+        assert response.headers["last-modified"]
+
+    def test_if_none_match_returns_304(self, event_id):
+        first = client.get(f"/api/v1/events/{event_id}/thumbnail.jpg")
+
+        response = client.get(
+            f"/api/v1/events/{event_id}/thumbnail.jpg",
+            headers={"If-None-Match": first.headers["etag"]},
+        )
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == first.headers["etag"]
+
+    def test_if_modified_since_returns_304(self, event_id):
+        first = client.get(f"/api/v1/events/{event_id}/thumbnail.jpg")
+
+        response = client.get(
+            f"/api/v1/events/{event_id}/thumbnail.jpg",
+            headers={"If-Modified-Since": first.headers["last-modified"]},
+        )
+
+        assert response.status_code == 304
+
+    def test_event_not_found(self, test_camera):
+        response = client.get("/api/v1/events/nonexistent-event-id/thumbnail.jpg")
+        assert response.status_code == 404
+
+
+class TestEventMediaStoreEndpoints:
+    """Media store thumbnails and key frames are linked, not inlined, and streamed on request."""
+
+    FRAME_A = b"\xff\xd8\xff\xe0frame-a\xff\xd9"
+    FRAME_B = b"\xff\xd8\xff\xe0frame-b\xff\xd9"
+
+    @pytest.fixture
+    def event_id(self, test_camera):
+        db = TestingSessionLocal()
+        try:
+            event = Event(
+                id="event-media-store",
+                camera_id=test_camera.id,
+                timestamp=datetime.now(timezone.utc),
+                description="Test event with key frames",
+                confidence=90,
+                objects_detected=json.dumps(["person"]),
+                alert_triggered=False,
+                thumbnail_base64=base64.b64encode(self.FRAME_A).decode("utf-8"),
+                key_frames_base64=[
+                    base64.b64encode(self.FRAME_A).decode("utf-8"),
+                    base64.b64encode(self.FRAME_B).decode("utf-8"),
+                ],
+                frame_timestamps=json.dumps([0.5, 1.5]),
+            )
+            db.add(event)
+            db.commit()
+            return event.id
+        finally:
+            db.close()
+
+    def test_list_links_thumbnail_instead_of_inlining(self, event_id):
+        response = client.get("/api/v1/events")
+
+        assert response.status_code == 200
+        item = next(e for e in response.json()["events"] if e["id"] == event_id)
+        assert item["thumbnail_base64"] is None
+        assert item["thumbnail_path"] == f"/api/v1/events/{event_id}/thumbnail.jpg"
+
+    def test_detail_lists_key_frame_urls(self, event_id):
+        response = client.get(f"/api/v1/events/{event_id}")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["key_frame_urls"] == [
+            f"/api/v1/events/{event_id}/key-frames/0.jpg",
+            f"/api/v1/events/{event_id}/key-frames/1.jpg",
+        ]
+        assert data["frame_timestamps"] == [0.5, 1.5]
+
+    def test_thumbnail_served_from_media_store(self, event_id):
+        response = client.get(f"/api/v1/events/{event_id}/thumbnail.jpg")
+
+        assert response.status_code == 200
+        assert response.content == self.FRAME_A
+
+    def test_key_frame_streams_with_digest_etag(self, event_id):
+        response = client.get(f"/api/v1/events/{event_id}/key-frames/1.jpg")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "image/jpeg"
+        assert response.content == self.FRAME_B
+
+        revalidate = client.get(
+            f"/api/v1/events/{event_id}/key-frames/1.jpg",
+            headers={"If-None-Match": response.headers["etag"]},
+        )
+        assert revalidate.status_code == 304
+
+    def test_key_frame_index_out_of_range(self, event_id):
+        response = client.get(f"/api/v1/events/{event_id}/key-frames/2.jpg")
+        assert response.status_code == 404
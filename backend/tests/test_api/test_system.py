@@ -584,6 +584,30 @@ class TestAIProvidersStatusEndpoint:
         finally:
             db.close()
 
+    def test_get_providers_status_includes_routing(self):
+        """Routing statistics and hedge outcomes are reported alongside the order"""
+        from app.services.ai_latency_router import get_ai_latency_router, reset_ai_latency_router
+
+        reset_ai_latency_router()
+        try:
+            router = get_ai_latency_router()
+            for latency in (900, 1000, 1100, 1200, 4000):
+                router.record("openai", "gpt-4o-mini", latency, True, 0.001)
+            router.record_hedge("openai", "grok", "grok", 0.001)
+
+            response = client.get("/api/v1/system/ai-providers")
+        finally:
+            reset_ai_latency_router()
+
+        assert response.status_code == 200
+        routing = response.json()["routing"]
+        assert routing["providers"][0]["provider"] == "openai"
+        assert routing["providers"][0]["p95_ms"] == 4000.0
+        assert routing["hedging"]["backup_won"] == 1
+        assert routing["hedging"]["extra_cost_usd"] == 0.001
+        assert routing["recent_decisions"][-1]["type"] == "hedge"
+        assert "by_provider" in response.json()["image_payload"]
+
     def test_get_providers_status_empty(self):
         """Test GET /ai-providers with no providers configured"""
         response = client.get("/api/v1/system/ai-providers")
@@ -670,6 +694,19 @@ class TestAIProvidersStatusEndpoint:
 # ============================================================================
 
 
+class TestClusterStatusEndpoint:
+    """Test GET /api/v1/system/cluster"""
+
+    def test_single_replica_when_cluster_mode_disabled(self):
+        response = client.get("/api/v1/system/cluster")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["enabled"] is False
+        assert data["is_leader"] is True
+        assert data["members"] == [data["instance_id"]]
+
+
 class TestAIProviderStatsEndpoint:
     """Tests for GET /api/v1/system/ai-stats endpoint (Story P2-5.3)"""
 
@@ -1125,6 +1162,12 @@ class TestDebugEndpointSecurity:
         # Should return 404 (endpoint not registered) when disabled
         assert response.status_code == 404
 
+    def test_debug_startup_profile_returns_404_by_default(self):
+        """Test GET /debug/startup-profile returns 404 when DEBUG_ENDPOINTS_ENABLED=false."""
+        response = client.get("/api/v1/system/debug/startup-profile")
+
+        assert response.status_code == 404
+
     def test_debug_endpoints_not_in_openapi_schema(self):
         """Test debug endpoints are not visible in OpenAPI schema when disabled."""
         response = client.get("/openapi.json")
@@ -0,0 +1,272 @@
+"""
+Tests for the indexed, newest-first log query engine.
+
+Results are compared against a reference that does what /api/v1/logs used
+to do: parse every line of every file, filter, reverse and slice.
+"""
+import json
+import logging
+import os
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from app.core.log_index import (
+    IndexedRotatingFileHandler,
+    LogFilter,
+    LogIndexWriter,
+    index_path,
+    log_files_newest_first,
+    parse_log_line,
+    query_log_entries,
+)
+from app.core.logging_config import CustomJsonFormatter
+
+MODULES = ["event_processor", "ai_service", "protect_service", "camera_service"]
+LEVELS = ["DEBUG", "INFO", "INFO", "INFO", "WARNING"]
+DAY_ONE = datetime(2025, 11, 20, 8, 0, tzinfo=timezone.utc)
+
+
+def write_log(path: str, count: int, start_index: int = 0, block_lines: int = 64, indexed: bool = True):
+    """Write JSON log lines like CustomJsonFormatter's, indexing them as the handler would."""
+    writer = LogIndexWriter(index_path(path), block_lines) if indexed else None
+    with open(path, "ab") as f:
+        for i in range(start_index, start_index + count):
+            created = DAY_ONE + timedelta(minutes=i)
+            level = "ERROR" if i % 97 == 0 else LEVELS[i % len(LEVELS)]
+            module = MODULES[i % len(MODULES)]
+            entry = {
+                "timestamp": created.isoformat(),
+                "level": level,
+                "message": f"message {i} camera-{i % 7} processed",
+                "module": module,
+                "logger": f"app.services.{module}",
+                "request_id": "-",
+                "seq": i,
+            }
+            start = f.tell()
+            f.write((json.dumps(entry) + "\n").encode())
+            if writer:
+                writer.add(start, f.tell(), created.timestamp(), level, module)
+    if writer:
+        writer.close()
+
+
+def write_rotated_logs(log_dir, per_file: int = 400, files: int = 3, **kwargs):
+    """app.log.{files-1} (oldest) ... app.log (newest), sequence numbers increasing."""
+    names = [f"app.log.{n}" for n in range(files - 1, 0, -1)] + ["app.log"]
+    for position, name in enumerate(names):
+        write_log(str(log_dir / name), per_file, start_index=position * per_file, **kwargs)
+
+
+def reference_query(log_dir, log_filter: LogFilter, limit: int, offset: int):
+    matches = []
+    for path in reversed(log_files_newest_first(str(log_dir))):
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                entry = parse_log_line(line)
+                if entry and log_filter.matches(entry):
+                    matches.append(entry)
+    matches.reverse()
+    return matches[offset:offset + limit], len(matches)
+
+
+FILTERS = [
+    LogFilter(),
+    LogFilter(level="error"),
+    LogFilter(module="AI_SERV"),
+    LogFilter(search="CAMERA-3"),
+    LogFilter(level="INFO", module="protect"),
+    LogFilter(start_date=date(2025, 11, 20), end_date=date(2025, 11, 20)),
+    LogFilter(start_date=date(2025, 11, 21), level="WARNING"),
+    LogFilter(module="no_such_module"),
+]
+
+
+class TestQueryLogEntries:
+    @pytest.mark.parametrize("log_filter", FILTERS)
+    @pytest.mark.parametrize("offset", [0, 35, 990])
+    def test_matches_full_scan_reference(self, tmp_path, log_filter, offset):
+        write_rotated_logs(tmp_path)
+
+        expected, expected_total = reference_query(tmp_path, log_filter, limit=25, offset=offset)
+        result = query_log_entries(str(tmp_path), log_filter, limit=25, offset=offset, exact_total=True)
+
+        assert [e["seq"] for e in result.entries] == [e["seq"] for e in expected]
+        assert result.total == expected_total and result.total_exact
+        assert result.has_more == (offset + 25 < expected_total)
+
+    def test_stops_after_the_page(self, tmp_path):
+        write_rotated_logs(tmp_path)
+
+        result = query_log_entries(str(tmp_path), limit=10, offset=5)
+
+        assert [e["seq"] for e in result.entries] == list(range(1194, 1184, -1))
+        assert result.has_more is True
+        assert result.total_exact is False
+        assert result.total == 16
+
+    def test_index_skips_blocks_that_cannot_match(self, tmp_path):
+        write_rotated_logs(tmp_path, block_lines=16)
+
+        errors = query_log_entries(str(tmp_path), LogFilter(level="ERROR"), limit=100, exact_total=True)
+        dated = query_log_entries(
+            str(tmp_path), LogFilter(start_date=date(2025, 11, 20), end_date=date(2025, 11, 20)), limit=1
+        )
+
+        assert errors.total == 13
+        assert errors.blocks_skipped > 50
+        # Newest blocks are after the end date and are skipped without reading
+        assert dated.entries[0]["timestamp"].startswith("2025-11-20T23:59")
+        assert dated.blocks_skipped > 0
+
+    def test_unindexed_and_partially_indexed_files(self, tmp_path):
+        write_log(str(tmp_path / "app.log.1"), 300, indexed=False)
+        write_log(str(tmp_path / "app.log"), 200, start_index=300, block_lines=64)
+        # Lines after the last flushed block (and no sidecar at all) are scanned
+        write_log(str(tmp_path / "app.log"), 10, start_index=500, indexed=False)
+
+        for log_filter in (LogFilter(), LogFilter(level="ERROR"), LogFilter(module="ai_service")):
+            expected, total = reference_query(tmp_path, log_filter, limit=50, offset=0)
+            result = query_log_entries(str(tmp_path), log_filter, limit=50, exact_total=True)
+            assert [e["seq"] for e in result.entries] == [e["seq"] for e in expected]
+            assert result.total == total
+
+    def test_stale_index_is_ignored(self, tmp_path):
+        path = str(tmp_path / "app.log")
+        write_log(path, 200)
+        with open(path, "wb"):
+            pass  # log truncated, sidecar left behind
+        write_log(path, 20, start_index=1000, indexed=False)
+
+        result = query_log_entries(str(tmp_path), LogFilter(level="INFO"), limit=100, exact_total=True)
+
+        assert result.total == 12
+        assert all(e["seq"] >= 1000 for e in result.entries)
+
+    def test_escaped_search_text(self, tmp_path):
+        path = tmp_path / "app.log"
+        lines = [
+            {"timestamp": DAY_ONE.isoformat(), "level": "INFO", "message": 'Café "front" door', "module": "m"},
+            {"timestamp": DAY_ONE.isoformat(), "level": "info", "message": "lowercase level", "module": "m"},
+            "not json",
+        ]
+        path.write_text("\n".join(json.dumps(l) if isinstance(l, dict) else l for l in lines) + "\n")
+
+        assert len(query_log_entries(str(tmp_path), LogFilter(search="café")).entries) == 1
+        assert len(query_log_entries(str(tmp_path), LogFilter(search='"front"')).entries) == 1
+        assert len(query_log_entries(str(tmp_path), LogFilter(level="INFO")).entries) == 2
+
+    def test_missing_directory(self, tmp_path):
+        result = query_log_entries(str(tmp_path / "missing"))
+        assert result.entries == [] and result.total == 0 and not result.has_more
+
+
+class TestIndexedRotatingFileHandler:
+    @pytest.fixture
+    def make_logger(self, tmp_path):
+        handlers = []
+
+        def make(max_bytes=0, backup_count=3):
+            handler = IndexedRotatingFileHandler(
+                str(tmp_path / "app.log"),
+                maxBytes=max_bytes,
+                backupCount=backup_count,
+                encoding="utf-8",
+                index_block_lines=8,
+            )
+            handler.setFormatter(CustomJsonFormatter("%(timestamp)s %(level)s %(name)s %(message)s"))
+            test_logger = logging.getLogger(f"test_log_index.{len(handlers)}")
+            test_logger.propagate = False
+            test_logger.setLevel(logging.DEBUG)
+            test_logger.addHandler(handler)
+            handlers.append((test_logger, handler))
+            return test_logger, handler
+
+        yield make
+        for test_logger, handler in handlers:
+            test_logger.removeHandler(handler)
+            handler.close()
+
+    def test_writes_sidecar_blocks(self, tmp_path, make_logger):
+        test_logger, handler = make_logger()
+        for i in range(20):
+            (test_logger.error if i == 5 else test_logger.info)(f"line {i}")
+        handler.close()
+
+        sidecar = [json.loads(l) for l in open(index_path(str(tmp_path / "app.log")))]
+        blocks = [r for r in sidecar if "start" in r]
+        assert [b["lines"] for b in blocks] == [8, 8, 4]
+        assert blocks[0]["start"] == 0
+        assert blocks[-1]["end"] == os.path.getsize(tmp_path / "app.log")
+        assert blocks[0]["levels"] == 2 | 8 and blocks[1]["levels"] == 2
+        assert {"module": "test_log_index", "bit": 0} in sidecar
+
+        result = query_log_entries(str(tmp_path), LogFilter(level="ERROR"), exact_total=True)
+        assert [e["message"] for e in result.entries] == ["line 5"]
+        assert result.blocks_skipped == 2
+
+    def test_sidecars_rotate_with_log_files(self, tmp_path, make_logger):
+        test_logger, handler = make_logger(max_bytes=4000, backup_count=3)
+        for i in range(60):
+            test_logger.warning(f"rotating line {i:03d}")
+        handler.close()
+
+        names = sorted(os.listdir(tmp_path))
+        assert "app.log.1" in names and "app.log.1.idx" in names
+        for path in log_files_newest_first(str(tmp_path)):
+            blocks = [json.loads(l) for l in open(index_path(path)) if '"start"' in l]
+            assert blocks[-1]["end"] == os.path.getsize(path)
+
+        result = query_log_entries(str(tmp_path), LogFilter(search="rotating"), limit=1000, exact_total=True)
+        messages = [e["message"] for e in result.entries]
+        assert messages == sorted(messages, reverse=True)
+        assert messages[0] == "rotating line 059"
+
+    def test_extra_timestamp_is_indexed(self, tmp_path, make_logger):
+        test_logger, handler = make_logger()
+        test_logger.info("old event", extra={"timestamp": "2020-01-01T00:00:00+00:00"})
+        test_logger.info("opaque timestamp", extra={"timestamp": 12345})
+        handler.close()
+
+        block = [json.loads(l) for l in open(index_path(str(tmp_path / "app.log"))) if '"start"' in l][0]
+        assert block["first"] == datetime(2020, 1, 1, tzinfo=timezone.utc).timestamp()
+        assert block["untimed"] is True
+
+        result = query_log_entries(
+            str(tmp_path), LogFilter(start_date=date(2020, 1, 1), end_date=date(2020, 1, 1))
+        )
+        assert [e["message"] for e in result.entries] == ["opaque timestamp", "old event"]
+
+
+class TestLogsEndpoint:
+    @pytest.mark.asyncio
+    async def test_get_logs_pages_newest_first(self, tmp_path, monkeypatch):
+        from app.api.v1 import logs
+
+        write_rotated_logs(tmp_path, per_file=100)
+        monkeypatch.setattr(logs, "LOG_DIR", str(tmp_path))
+
+        page = await logs.get_logs(
+            level=None, module="ai_service", search=None, start_date=None,
+            end_date=None, limit=5, offset=0, exact_total=False,
+        )
+        counted = await logs.get_logs(
+            level=None, module="ai_service", search=None, start_date=None,
+            end_date=None, limit=5, offset=0, exact_total=True,
+        )
+
+        assert [e.extra["seq"] for e in page.entries] == [297, 293, 289, 285, 281]
+        assert page.has_more and not page.total_exact
+        assert counted.total == 75 and counted.total_exact
+
+    @pytest.mark.asyncio
+    async def test_list_log_files_hides_sidecars(self, tmp_path, monkeypatch):
+        from app.api.v1 import logs
+
+        write_rotated_logs(tmp_path, per_file=10, files=2)
+        monkeypatch.setattr(logs, "LOG_DIR", str(tmp_path))
+
+        response = await logs.list_log_files()
+
+        assert response.files == ["app.log", "app.log.1"]
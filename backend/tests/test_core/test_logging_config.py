@@ -3,19 +3,25 @@ Unit tests for logging configuration (Story 6.2, AC: #1)
 """
 import json
 import logging
+import queue
+import threading
 import pytest
 import uuid
 from io import StringIO
 
 from app.core.logging_config import (
     setup_logging,
+    shutdown_logging,
     get_logger,
+    get_logging_stats,
     set_request_id,
     get_request_id,
     clear_request_id,
     sanitize_log_value,
     CustomJsonFormatter,
+    DroppingQueueHandler,
     RequestIdFilter,
+    SamplingFilter,
     SanitizingFilter,
 )
 
@@ -281,3 +287,150 @@ class TestGetLogger:
 
         assert isinstance(logger, logging.Logger)
         assert logger.name == "test.module"
+
+
+def make_record(msg="hot path", level=logging.DEBUG, lineno=10, pathname="motion.py", args=()):
+    return logging.LogRecord(
+        name="test", level=level, pathname=pathname, lineno=lineno,
+        msg=msg, args=args, exc_info=None
+    )
+
+
+class TestSamplingFilter:
+    """Per-call-site rate limiting of DEBUG/INFO records"""
+
+    def test_burst_then_rate_per_site(self, monkeypatch):
+        now = [1000.0]
+        monkeypatch.setattr("app.core.logging_config.time.monotonic", lambda: now[0])
+        sampler = SamplingFilter(rate_per_second=2.0, burst=3)
+
+        passed = [sampler.filter(make_record()) for _ in range(10)]
+        # A different call site has its own bucket
+        other = sampler.filter(make_record(lineno=11))
+
+        assert passed == [True] * 3 + [False] * 7
+        assert other is True
+        assert sampler.dropped == 7
+
+        now[0] += 1.0  # two tokens refilled
+        first = make_record()
+        assert sampler.filter(first) is True
+        assert first.sampled_suppressed == 7
+        assert sampler.filter(make_record()) is True
+        assert sampler.filter(make_record()) is False
+
+    def test_warnings_are_never_sampled(self):
+        sampler = SamplingFilter(rate_per_second=0.0, burst=1)
+
+        assert sampler.filter(make_record(level=logging.INFO)) is True
+        assert sampler.filter(make_record(level=logging.INFO)) is False
+        assert all(sampler.filter(make_record(level=logging.WARNING)) for _ in range(5))
+
+
+class TestDroppingQueueHandler:
+    """Bounded, non-blocking enqueue"""
+
+    def test_full_queue_drops_and_counts(self):
+        handler = DroppingQueueHandler(queue.Queue(maxsize=2))
+
+        for i in range(5):
+            handler.handle(make_record(msg=f"record {i}"))
+
+        assert handler.queue.qsize() == 2
+        assert handler.dropped == 3
+
+    def test_prepare_merges_args_and_keeps_traceback_separate(self):
+        handler = DroppingQueueHandler(queue.Queue())
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            import sys
+            record = make_record(msg="failed %s", args=("job-1",), level=logging.ERROR)
+            record.exc_info = sys.exc_info()
+
+        prepared = handler.prepare(record)
+
+        assert prepared.msg == "failed job-1" and prepared.args is None
+        assert prepared.exc_info is None
+        assert "ValueError: boom" in prepared.exc_text
+        parsed = json.loads(CustomJsonFormatter().format(prepared))
+        assert parsed["message"] == "failed job-1"
+        assert "ValueError: boom" in parsed["exc_info"]
+
+
+class TestQueuedLoggingPipeline:
+    """setup_logging routes records through the queue listener"""
+
+    @pytest.fixture
+    def log_dir(self, tmp_path):
+        yield tmp_path
+        setup_logging(log_level="INFO")
+
+    def test_records_written_by_listener_with_request_id(self, log_dir):
+        setup_logging(log_level="INFO", log_dir=str(log_dir))
+        root = logging.getLogger()
+        assert [type(h) for h in root.handlers] == [DroppingQueueHandler]
+
+        test_logger = logging.getLogger("app.test.queued")
+        token = set_request_id("req-123")
+        try:
+            test_logger.info("inside request", extra={"event_type": "queued_test"})
+        finally:
+            clear_request_id(token)
+        thread = threading.Thread(target=lambda: test_logger.error("from capture thread"))
+        thread.start()
+        thread.join()
+        try:
+            raise RuntimeError("bad frame")
+        except RuntimeError:
+            test_logger.exception("with traceback")
+        shutdown_logging()
+
+        lines = [json.loads(l) for l in (log_dir / "app.log").read_text().splitlines()]
+        by_message = {line["message"]: line for line in lines}
+        assert by_message["inside request"]["request_id"] == "req-123"
+        assert by_message["inside request"]["event_type"] == "queued_test"
+        assert by_message["from capture thread"]["request_id"] == "-"
+        assert "RuntimeError: bad frame" in by_message["with traceback"]["exc_info"]
+        errors = (log_dir / "error.log").read_text()
+        assert "from capture thread" in errors and "inside request" not in errors
+
+    def test_hot_site_is_sampled_and_counted(self, log_dir):
+        dropped_before = get_logging_stats()["dropped_sampled"]
+        setup_logging(log_level="DEBUG", log_dir=str(log_dir))
+        test_logger = logging.getLogger("app.test.sampled")
+
+        for i in range(500):
+            test_logger.debug("motion check %d", i)
+        stats = get_logging_stats()
+        shutdown_logging()
+
+        lines = (log_dir / "app.log").read_text().splitlines()
+        assert 100 <= len(lines) < 500
+        assert stats["dropped_sampled"] - dropped_before == 500 - len(lines)
+        assert stats["queue_capacity"] > 0
+
+    def test_drops_are_exported_as_a_counter(self, log_dir):
+        from app.core import metrics
+
+        def exported():
+            return metrics.REGISTRY.get_sample_value(
+                "argusai_log_records_dropped_total", {"reason": "sampled"}
+            ) or 0.0
+
+        metrics.update_system_metrics()
+        before, dropped_before = exported(), get_logging_stats()["dropped_sampled"]
+        test_logger = logging.getLogger("app.test.counted")
+        # Drops from a pipeline that setup_logging later replaces still count
+        for _ in range(2):
+            setup_logging(log_level="DEBUG", log_dir=str(log_dir))
+            for i in range(500):
+                test_logger.debug("motion check %d", i)
+        dropped = get_logging_stats()["dropped_sampled"] - dropped_before
+        shutdown_logging()
+
+        metrics.update_system_metrics()
+        metrics.update_system_metrics()
+
+        assert dropped > 500
+        assert exported() - before == dropped
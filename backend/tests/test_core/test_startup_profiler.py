@@ -0,0 +1,129 @@
+"""
+Tests for the startup timing report and lazy loading of heavy dependencies.
+"""
+import builtins
+import importlib
+import json
+import subprocess
+import sys
+import textwrap
+import threading
+from pathlib import Path
+
+import pytest
+
+from app.core.startup_profiler import HEAVY_MODULES, StartupProfiler
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+
+@pytest.fixture
+def fake_package(tmp_path, monkeypatch):
+    """Package whose modules sleep so their import times are known."""
+    package = tmp_path / "slowpkg"
+    package.mkdir()
+    (package / "__init__.py").write_text("")
+    (package / "leaf.py").write_text("import time\ntime.sleep(0.03)\nVALUE = 1\n")
+    (package / "parent.py").write_text(textwrap.dedent("""
+        import time
+        from . import leaf
+        time.sleep(0.02)
+    """))
+    (package / "sibling.py").write_text("X = 2\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield "slowpkg"
+    for name in [n for n in sys.modules if n == "slowpkg" or n.startswith("slowpkg.")]:
+        del sys.modules[name]
+
+
+class TestImportTracking:
+    def test_cumulative_and_self_times(self, fake_package):
+        profiler = StartupProfiler()
+        profiler.start_import_tracking()
+        try:
+            import slowpkg.parent  # noqa: F401
+            from slowpkg import sibling  # noqa: F401
+            import slowpkg.parent  # noqa: F401,F811  (already loaded: not recorded again)
+        finally:
+            profiler.stop_import_tracking()
+
+        report = profiler.get_report()
+        timings = {t["module"]: t for t in report["imports"]["slowest"]}
+
+        assert set(timings) == {"slowpkg.parent", "slowpkg.leaf", "slowpkg.sibling"}
+        assert timings["slowpkg.leaf"]["cumulative_ms"] >= 30
+        assert timings["slowpkg.parent"]["cumulative_ms"] >= 50
+        assert 20 <= timings["slowpkg.parent"]["self_ms"] < timings["slowpkg.parent"]["cumulative_ms"]
+        top_level = [t["module"] for t in report["imports"]["top_level"]]
+        assert top_level == ["slowpkg.parent", "slowpkg.sibling"]
+        assert report["imports"]["total_ms"] >= 50
+
+    def test_stop_restores_import_and_ignores_other_threads(self, fake_package):
+        original = builtins.__import__
+        profiler = StartupProfiler()
+        profiler.start_import_tracking()
+        try:
+            thread = threading.Thread(target=lambda: importlib.import_module("slowpkg.leaf"))
+            thread.start()
+            thread.join()
+            exec("import slowpkg.sibling")
+        finally:
+            profiler.stop_import_tracking()
+
+        assert builtins.__import__ is original
+        assert [t["module"] for t in profiler.get_report()["imports"]["slowest"]] == ["slowpkg.sibling"]
+
+
+class TestPhases:
+    def test_phases_are_timed_checkpoint_to_checkpoint(self, monkeypatch):
+        now = [100.0]
+        monkeypatch.setattr("app.core.startup_profiler.time.perf_counter", lambda: now[0])
+        profiler = StartupProfiler()
+
+        now[0] += 1.0
+        profiler.begin_phase("database")
+        now[0] += 0.25
+        profiler.begin_phase("cameras")
+        now[0] += 2.0
+        assert profiler.get_report()["startup_complete"] is False
+        profiler.finish_startup()
+
+        report = profiler.get_report()
+        assert report["phases"] == [
+            {"name": "database", "duration_ms": 250.0},
+            {"name": "cameras", "duration_ms": 2000.0},
+        ]
+        assert report["startup_ms"] == 3250.0
+        assert report["startup_complete"] is True
+
+
+class TestColdStartImports:
+    """Importing main must not load provider SDKs; guards against eager imports creeping back."""
+
+    def test_main_import_skips_provider_sdks(self):
+        script = textwrap.dedent("""
+            import json, sys
+            import main
+            from app.core.startup_profiler import startup_profiler
+            report = startup_profiler.get_report(top=5)
+            print("REPORT" + json.dumps({
+                "loaded": [m for m in ("litellm", "openai", "anthropic", "google.generativeai") if m in sys.modules],
+                "report": report,
+            }))
+        """)
+        result = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=BACKEND_DIR, capture_output=True, text=True, timeout=120,
+        )
+        assert result.returncode == 0, result.stderr[-2000:]
+        line = next(l for l in result.stdout.splitlines() if l.startswith("REPORT"))
+        payload = json.loads(line[len("REPORT"):])
+        report = payload["report"]
+
+        assert payload["loaded"] == []
+        assert set(report["heavy_modules_loaded"]) <= set(HEAVY_MODULES) - {
+            "litellm", "openai", "anthropic", "google.generativeai"
+        }
+        top_level = {t["module"] for t in report["imports"]["top_level"]}
+        assert "app.api.v1.cameras" in top_level
+        assert report["imports"]["modules_loaded"] > 50
@@ -0,0 +1,83 @@
+"""
+Adaptive frame selection: tiered thumbnail prefilter vs. the previous
+full-resolution histogram + SSIM loop, on a synthetic 30 s clip.
+"""
+import time
+
+import cv2
+import numpy as np
+import pytest
+
+from app.services.adaptive_sampler import AdaptiveSampler, make_thumbnail, reset_adaptive_sampler
+
+pytestmark = pytest.mark.performance
+
+
+@pytest.fixture(autouse=True)
+def reset_sampler_singleton():
+    reset_adaptive_sampler()
+    yield
+    reset_adaptive_sampler()
+
+
+def _clip_frames(count: int, width: int = 1280, height: int = 720, seed: int = 0):
+    """Candidate frames spread over a 30 s clip: textured scene, a car crossing, a light change."""
+    rng = np.random.default_rng(seed)
+    background = cv2.GaussianBlur(rng.integers(0, 255, (height, width, 3), dtype=np.uint8), (9, 9), 3)
+    frames = []
+    for i in range(count):
+        t = i / max(count - 1, 1)
+        frame = background.copy()
+        x = int(t * (width - 200))
+        cv2.rectangle(frame, (x, height // 2), (x + 200, height // 2 + 120), (200, 30, 30), -1)
+        if t > 0.6:
+            frame = cv2.convertScaleAbs(frame, alpha=0.6)
+        frames.append(frame)
+    return frames, [t * 30000.0 / max(count - 1, 1) for t in range(count)]
+
+
+class TestAdaptiveSelectionBenchmark:
+    """Tiered selection vs. the previous full-resolution histogram + SSIM loop."""
+
+    def _legacy_select(self, sampler, frames, timestamps_ms, target_count):
+        selected = [0]
+        for i in range(1, len(frames)):
+            if timestamps_ms[i] - timestamps_ms[selected[-1]] < sampler.min_spacing_ms:
+                continue
+            reference = frames[selected[-1]]
+            if sampler.calculate_histogram_similarity(frames[i], reference) < sampler.histogram_threshold \
+                    or sampler.calculate_ssim_similarity(frames[i], reference) < sampler.ssim_threshold:
+                selected.append(i)
+                if len(selected) >= target_count:
+                    break
+        return selected
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("target_count", [10, 15, 20])
+    async def test_tiered_selection_beats_full_resolution(self, target_count, capsys):
+        sampler = AdaptiveSampler()
+        # FrameExtractor decodes 3x the target as candidates
+        frames, timestamps_ms = _clip_frames(target_count * 3, seed=target_count)
+
+        t0 = time.perf_counter()
+        self._legacy_select(sampler, frames, timestamps_ms, target_count)
+        legacy = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        selected = await sampler.select_diverse_frames(frames, timestamps_ms, target_count)
+        tiered = time.perf_counter() - t0
+
+        thumbnails = [make_thumbnail(frame) for frame in frames]
+        t0 = time.perf_counter()
+        await sampler.select_diverse_frames(thumbnails, timestamps_ms, target_count)
+        decoder_thumbs = time.perf_counter() - t0
+
+        with capsys.disabled():
+            print(
+                f"\n[adaptive] {len(frames)} candidates -> {target_count}: full-res {legacy * 1000:.1f}ms, "
+                f"tiered {tiered * 1000:.1f}ms, tiered on decoder thumbnails {decoder_thumbs * 1000:.1f}ms"
+            )
+
+        assert len(selected) == target_count
+        assert tiered < legacy
+        assert decoder_thumbs < tiered
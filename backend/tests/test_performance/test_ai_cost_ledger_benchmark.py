@@ -0,0 +1,70 @@
+"""
+Daily cost reads from the in-memory ledger vs. the SUM(cost_estimate) query
+they replaced on the cost-cap check path.
+"""
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from app.models.ai_usage import AIUsage
+from app.services.ai_cost_and_usage_tracker import (
+    AICostAndUsageTracker,
+    reset_ai_cost_and_usage_tracker,
+)
+from tests.test_services.test_ai_cost_ledger import _row
+
+pytestmark = pytest.mark.performance
+
+
+class TestCostLedgerBenchmark:
+
+    @pytest.fixture(autouse=True)
+    def reset_tracker(self):
+        reset_ai_cost_and_usage_tracker()
+        yield
+        reset_ai_cost_and_usage_tracker()
+
+    @pytest.fixture
+    def tracker_db(self, db_session):
+        @contextmanager
+        def _fake_get_db_session():
+            yield db_session
+
+        with patch(
+            "app.services.ai_cost_and_usage_tracker.get_db_session",
+            _fake_get_db_session,
+        ):
+            yield db_session
+
+    def test_cap_check_benchmark(self, tracker_db, capsys):
+        """Ledger cost reads should be far cheaper than the SUM query they replace."""
+        tracker = AICostAndUsageTracker()
+        now = datetime.now(timezone.utc)
+        tracker_db.bulk_insert_mappings(
+            AIUsage, [_row(now - timedelta(minutes=i)) for i in range(2000)]
+        )
+        tracker_db.commit()
+        tracker.get_daily_cost()  # seed
+
+        iterations = 200
+        t0 = time.perf_counter()
+        for _ in range(iterations):
+            tracker.get_daily_cost()
+        ledger_time = time.perf_counter() - t0
+
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        t0 = time.perf_counter()
+        for _ in range(iterations):
+            tracker._query_successful_cost_since(today, "daily")
+        sql_time = time.perf_counter() - t0
+
+        with capsys.disabled():
+            print(
+                f"\n[benchmark] daily cost x{iterations}: ledger {ledger_time * 1000:.2f} ms, "
+                f"SUM query {sql_time * 1000:.2f} ms"
+            )
+
+        assert ledger_time < sql_time
@@ -0,0 +1,73 @@
+"""
+Micro-benchmark: preallocated AudioRingBuffer vs. the deque-of-chunks buffer
+it replaced (add + get_latest + get_all on a full 5 s buffer).
+"""
+import time
+
+import numpy as np
+import pytest
+
+from app.services.audio_stream_service import AudioRingBuffer
+
+pytestmark = pytest.mark.performance
+
+
+class TestAudioRingBufferBenchmark:
+    def test_benchmark_against_chunk_deque(self, capsys):
+        """Micro-benchmark: preallocated ring vs. the previous deque-of-chunks buffer"""
+        from collections import deque
+
+        class DequeAudioRingBuffer:
+            """Previous implementation, kept here as the benchmark baseline"""
+
+            def __init__(self, buffer_seconds, sample_rate):
+                self.sample_rate = sample_rate
+                self.max_samples = int(buffer_seconds * sample_rate)
+                self._buffer = deque()
+                self._total_samples = 0
+
+            def add(self, samples, timestamp):
+                self._buffer.append(samples)
+                self._total_samples += len(samples)
+                while self._total_samples > self.max_samples and len(self._buffer) > 1:
+                    self._total_samples -= len(self._buffer.popleft())
+
+            def get_latest(self, duration_seconds):
+                samples_needed = int(duration_seconds * self.sample_rate)
+                collected = []
+                collected_count = 0
+                for chunk in reversed(self._buffer):
+                    collected.insert(0, chunk)
+                    collected_count += len(chunk)
+                    if collected_count >= samples_needed:
+                        break
+                return np.concatenate(collected)[-samples_needed:]
+
+            def get_all(self):
+                return np.concatenate(list(self._buffer))
+
+        # 20ms AAC-sized frames, 5 s buffer -> 250 chunks resident
+        frame = np.zeros(320, dtype=np.int16)
+        iterations = 300
+
+        def run(buffer):
+            for _ in range(300):
+                buffer.add(frame, 0.0)
+            start = time.perf_counter()
+            for _ in range(iterations):
+                buffer.add(frame, 0.0)
+                buffer.get_latest(2.0)
+                buffer.get_all()
+            return (time.perf_counter() - start) / iterations * 1e6
+
+        legacy_us = run(DequeAudioRingBuffer(5.0, 16000))
+        ring_us = run(AudioRingBuffer(buffer_seconds=5.0, sample_rate=16000))
+
+        with capsys.disabled():
+            print(
+                f"\nAudioRingBuffer add+get_latest(2s)+get_all: "
+                f"deque={legacy_us:.1f}us ring={ring_us:.1f}us "
+                f"({legacy_us / ring_us:.1f}x)"
+            )
+
+        assert ring_us < legacy_us
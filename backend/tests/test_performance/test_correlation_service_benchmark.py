@@ -0,0 +1,68 @@
+"""
+Multi-camera burst against the correlation buffer: time-bucketed candidate
+lookup vs. the full-buffer linear scan it replaced.
+"""
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from tests.test_services.test_correlation_service import (  # noqa: F401
+    correlation_service,
+    linear_candidates,
+    make_buffered_event,
+    reset_singleton,
+)
+
+pytestmark = pytest.mark.performance
+
+
+class TestCorrelationBurstBenchmark:
+
+    def test_burst_benchmark_against_linear_scan(self, correlation_service, capsys):
+        """Synthetic multi-camera burst: bucketed lookup vs. full-buffer scan."""
+        import random
+
+        rng = random.Random(3)
+        now = datetime.now(timezone.utc)
+        types = ["person", "vehicle", "package", "animal"]
+        entries = []
+        # 60s of background activity across 32 cameras
+        for i in range(4000):
+            ts = now - timedelta(seconds=rng.uniform(0, 59))
+            event = make_buffered_event(
+                camera_id=f"cam{i % 32}",
+                smart_detection_type=rng.choice(types),
+                timestamp=ts,
+                event_id=f"bg-{i}",
+            )
+            entries.append((ts, event))
+            correlation_service._buffer.append((ts, event))
+
+        # Burst: every camera fires within one second
+        burst = [
+            make_buffered_event(
+                camera_id=f"cam{i}",
+                smart_detection_type=rng.choice(types),
+                timestamp=now + timedelta(milliseconds=rng.uniform(0, 1000)),
+            )
+            for i in range(32)
+        ]
+
+        start = time.perf_counter()
+        for event in burst:
+            linear_candidates(entries, event, correlation_service.time_window_seconds)
+        linear_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        for event in burst:
+            correlation_service.find_correlation_candidates(event)
+        bucketed_ms = (time.perf_counter() - start) * 1000
+
+        with capsys.disabled():
+            print(
+                f"\n[correlation] burst of {len(burst)} over {len(entries)} buffered: "
+                f"linear {linear_ms:.1f}ms, bucketed {bucketed_ms:.1f}ms"
+            )
+
+        assert bucketed_ms < linear_ms
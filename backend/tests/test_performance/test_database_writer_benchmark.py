@@ -0,0 +1,152 @@
+"""Write throughput and read latency of the SQLite production profile under load."""
+import threading
+import time
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import (
+    Base,
+    create_sqlite_read_engine,
+    create_sqlite_writer_engine,
+)
+from app.models.camera import Camera
+from app.models.motion_event import MotionEvent
+from app.services.database_writer import DatabaseWriter
+
+pytestmark = pytest.mark.performance
+
+
+class TestWriteLoadBenchmark:
+    """
+    Motion-event burst from several camera threads while API-style reads run.
+
+    "before" is the legacy setup: default rollback journal, one session and
+    commit per write. "after" is WAL + the single group-committing writer,
+    with reads on the query_only pool.
+    """
+
+    PRODUCERS = 8
+    WRITES_PER_PRODUCER = 60
+    READERS = 2
+
+    def _motion_event(self, camera_id):
+        return MotionEvent(
+            id=str(uuid.uuid4()),
+            camera_id=camera_id,
+            timestamp=datetime.now(timezone.utc),
+            confidence=0.9,
+            algorithm_used="mog2",
+        )
+
+    def _run_load(self, write_one, read_engine):
+        stop_reading = threading.Event()
+        latencies = []
+        errors = []
+
+        def read_loop():
+            while not stop_reading.is_set():
+                t0 = time.perf_counter()
+                try:
+                    with read_engine.connect() as conn:
+                        conn.execute(text(
+                            "SELECT id, timestamp FROM motion_events ORDER BY timestamp DESC LIMIT 50"
+                        )).all()
+                except Exception as e:
+                    errors.append(e)
+                latencies.append(time.perf_counter() - t0)
+
+        def produce():
+            for _ in range(self.WRITES_PER_PRODUCER):
+                try:
+                    write_one()
+                except Exception as e:
+                    errors.append(e)
+
+        readers = [threading.Thread(target=read_loop) for _ in range(self.READERS)]
+        producers = [threading.Thread(target=produce) for _ in range(self.PRODUCERS)]
+        for t in readers:
+            t.start()
+        t0 = time.perf_counter()
+        for t in producers:
+            t.start()
+        for t in producers:
+            t.join()
+        elapsed = time.perf_counter() - t0
+        stop_reading.set()
+        for t in readers:
+            t.join()
+
+        latencies.sort()
+        p99 = latencies[int(len(latencies) * 0.99) - 1] if latencies else 0.0
+        total = self.PRODUCERS * self.WRITES_PER_PRODUCER
+        return total / elapsed, p99, errors
+
+    def _seed_camera(self, engine):
+        session = sessionmaker(bind=engine)()
+        camera = Camera(name="bench", type="rtsp", rtsp_url="rtsp://example/stream")
+        session.add(camera)
+        session.commit()
+        camera_id = camera.id
+        session.close()
+        return camera_id
+
+    def test_single_writer_throughput_and_read_latency(self, tmp_path, capsys):
+        # Before: default journal, every producer commits on its own
+        legacy_url = f"sqlite:///{tmp_path / 'legacy.db'}"
+        legacy_engine = create_engine(legacy_url, connect_args={"check_same_thread": False, "timeout": 30})
+        Base.metadata.create_all(bind=legacy_engine)
+        camera_id = self._seed_camera(legacy_engine)
+        LegacySession = sessionmaker(bind=legacy_engine)
+
+        def direct_write():
+            session = LegacySession()
+            try:
+                session.add(self._motion_event(camera_id))
+                session.commit()
+            finally:
+                session.close()
+
+        before_rate, before_p99, before_errors = self._run_load(direct_write, legacy_engine)
+        legacy_engine.dispose()
+
+        # After: WAL profile, group commits, query_only read pool
+        url = f"sqlite:///{tmp_path / 'profile.db'}"
+        writer_engine = create_sqlite_writer_engine(url)
+        Base.metadata.create_all(bind=writer_engine)
+        camera_id = self._seed_camera(writer_engine)
+        read_engine = create_sqlite_read_engine(url, pool_size=self.READERS)
+        writer = DatabaseWriter(
+            session_factory=sessionmaker(bind=writer_engine, autoflush=False, expire_on_commit=False),
+            max_batch=64,
+            max_wait_ms=5,
+        )
+        writer.start()
+
+        def queued_write():
+            event = self._motion_event(camera_id)
+            writer.submit(lambda session: session.add(event)).result(timeout=30)
+
+        try:
+            after_rate, after_p99, after_errors = self._run_load(queued_write, read_engine)
+            stats = writer.get_stats()
+        finally:
+            writer.stop()
+            read_engine.dispose()
+            writer_engine.dispose()
+
+        with capsys.disabled():
+            print(
+                f"\n[benchmark] {self.PRODUCERS} producers x {self.WRITES_PER_PRODUCER} motion events, "
+                f"{self.READERS} readers: before {before_rate:.0f} events/s, read p99 "
+                f"{before_p99 * 1000:.2f} ms ({len(before_errors)} errors); after "
+                f"{after_rate:.0f} events/s, read p99 {after_p99 * 1000:.2f} ms "
+                f"({stats['batches_committed']} group commits)"
+            )
+
+        assert after_errors == []
+        assert stats["writes_committed"] == self.PRODUCERS * self.WRITES_PER_PRODUCER
+        assert after_rate > before_rate
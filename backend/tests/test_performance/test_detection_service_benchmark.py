@@ -0,0 +1,41 @@
+"""
+Wall-clock comparison of the fused DetectionService pass against running the
+face and vehicle services separately (stand-in nets, real JPEG decode).
+"""
+import time
+
+import pytest
+
+from app.services.detection_service import DetectionService
+from tests.test_services.test_detection_service import detectors, make_jpeg  # noqa: F401
+
+pytestmark = pytest.mark.performance
+
+
+class TestFusedDetectionBenchmark:
+
+    FRAMES = 16
+    MAX_BATCH = 8
+
+    def test_fused_pass_beats_separate_services(self, detectors, capsys):
+        face, vehicle = detectors
+        images = [make_jpeg(1280, 720, seed=i) for i in range(self.FRAMES)]
+
+        t0 = time.perf_counter()
+        for image_bytes in images:
+            face._detect_faces_sync(face._bytes_to_cv2(image_bytes))
+            vehicle._detect_vehicles_sync(vehicle._bytes_to_cv2(image_bytes))
+        separate = time.perf_counter() - t0
+
+        service = DetectionService(max_batch=self.MAX_BATCH)
+        t0 = time.perf_counter()
+        service.detect_sync(images)
+        fused = time.perf_counter() - t0
+
+        with capsys.disabled():
+            print(
+                f"\n[detection] {self.FRAMES} frames: separate {separate * 1000:.1f}ms, "
+                f"fused {fused * 1000:.1f}ms"
+            )
+
+        assert fused < separate
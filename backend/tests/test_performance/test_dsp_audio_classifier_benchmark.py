@@ -0,0 +1,39 @@
+"""
+CPU budget of streaming DSPAudioClassifier: one camera stream must stay
+under 1% of a core. Reuses the synthetic corpus from the unit tests.
+"""
+import time
+
+import numpy as np
+import pytest
+
+from app.services.audio_classifiers import DSPAudioClassifier
+from tests.test_services.test_dsp_audio_classifier import (
+    SR,
+    _stream,
+    doorbell,
+    glass_break,
+    scream,
+    silence,
+    smoke_alarm,
+)
+
+pytestmark = pytest.mark.performance
+
+
+class TestDSPStreamingBenchmark:
+    def test_cpu_budget_per_stream(self, capsys):
+        """Benchmark: streaming classification must stay under 1% of one core"""
+        classifier = DSPAudioClassifier()
+        signal = np.concatenate([scream(), doorbell(), smoke_alarm(), glass_break(), silence()] * 6)
+        audio_seconds = len(signal) / SR
+
+        start = time.process_time()
+        _stream(classifier, "bench", signal)
+        cpu_seconds = time.process_time() - start
+
+        load_pct = 100.0 * cpu_seconds / audio_seconds
+        with capsys.disabled():
+            print(f"\nDSPAudioClassifier: {audio_seconds:.0f}s audio in {cpu_seconds * 1000:.0f}ms CPU ({load_pct:.2f}% of a core)")
+
+        assert load_pct < 1.0
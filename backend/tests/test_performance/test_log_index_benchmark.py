@@ -0,0 +1,46 @@
+"""
+Newest page of a multi-file log: indexed reverse scan vs. parsing every line.
+"""
+import os
+import time
+
+import pytest
+
+from app.core.log_index import LogFilter, log_files_newest_first, query_log_entries
+from tests.test_core.test_log_index import reference_query, write_rotated_logs
+
+pytestmark = pytest.mark.performance
+
+
+class TestLogQueryBenchmark:
+    """Newest page from a multi-file log: indexed reverse scan vs. full parse."""
+
+    LINES_PER_FILE = 40_000
+
+    def test_newest_page_beats_full_scan(self, tmp_path, capsys):
+        write_rotated_logs(tmp_path, per_file=self.LINES_PER_FILE, files=3, block_lines=256)
+        size_mb = sum(os.path.getsize(p) for p in log_files_newest_first(str(tmp_path))) / 1e6
+
+        timings = {}
+        for label, log_filter in (("newest", LogFilter()), ("errors", LogFilter(level="ERROR"))):
+            t0 = time.perf_counter()
+            expected, _ = reference_query(tmp_path, log_filter, limit=100, offset=0)
+            full = time.perf_counter() - t0
+
+            t0 = time.perf_counter()
+            result = query_log_entries(str(tmp_path), log_filter, limit=100)
+            indexed = time.perf_counter() - t0
+
+            assert [e["seq"] for e in result.entries] == [e["seq"] for e in expected]
+            timings[label] = (full, indexed)
+
+        with capsys.disabled():
+            print(f"\n[logs] {size_mb:.1f}MB in 3 files, limit=100:")
+            for label, (full, indexed) in timings.items():
+                print(
+                    f"  {label}: full parse {full * 1000:.0f}ms, "
+                    f"indexed {indexed * 1000:.1f}ms ({full / indexed:.0f}x)"
+                )
+
+        for full, indexed in timings.values():
+            assert indexed * 5 < full
@@ -0,0 +1,93 @@
+"""
+Request throughput through RequestLoggingMiddleware with logging off,
+with synchronous handlers, and with the queued/sampled pipeline.
+"""
+import logging
+import time
+from io import StringIO
+
+import pytest
+
+from app.core.logging_config import (
+    CustomJsonFormatter,
+    RequestIdFilter,
+    SanitizingFilter,
+    get_logging_stats,
+    setup_logging,
+    shutdown_logging,
+)
+
+pytestmark = pytest.mark.performance
+
+
+class TestRequestLoggingThroughputBenchmark:
+    """Requests/second through RequestLoggingMiddleware: logging off, synchronous, queued."""
+
+    REQUESTS = 600
+
+    def _run(self, client) -> float:
+        client.get("/ping")  # warm up
+        t0 = time.perf_counter()
+        for _ in range(self.REQUESTS):
+            assert client.get("/ping").status_code == 200
+        return self.REQUESTS / (time.perf_counter() - t0)
+
+    def test_queued_logging_throughput(self, tmp_path, capsys):
+        import logging.handlers
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from app.core.log_index import IndexedRotatingFileHandler
+        from app.middleware.logging_middleware import RequestLoggingMiddleware
+
+        app = FastAPI()
+        app.add_middleware(RequestLoggingMiddleware)
+
+        @app.get("/ping")
+        async def ping():
+            logging.getLogger("app.test.bench").info("handled ping", extra={"event_type": "ping"})
+            return {"ok": True}
+
+        root = logging.getLogger()
+        client = TestClient(app)
+        try:
+            # Logging off
+            setup_logging(log_level="INFO", log_dir=str(tmp_path / "off"))
+            shutdown_logging()
+            root.handlers.clear()
+            root.setLevel(logging.CRITICAL)
+            off = self._run(client)
+
+            # Synchronous handlers on the calling thread (previous setup)
+            root.setLevel(logging.INFO)
+            (tmp_path / "sync").mkdir()
+            formatter = CustomJsonFormatter('%(timestamp)s %(level)s %(name)s %(message)s')
+            for handler in (
+                logging.StreamHandler(StringIO()),
+                IndexedRotatingFileHandler(str(tmp_path / "sync" / "app.log"), encoding="utf-8"),
+            ):
+                handler.setFormatter(formatter)
+                handler.addFilter(RequestIdFilter())
+                handler.addFilter(SanitizingFilter())
+                root.addHandler(handler)
+            sync = self._run(client)
+            for handler in list(root.handlers):
+                root.removeHandler(handler)
+                handler.close()
+
+            # Queued pipeline with per-site sampling
+            setup_logging(log_level="INFO", log_dir=str(tmp_path / "queued"))
+            queued = self._run(client)
+            stats = get_logging_stats()
+        finally:
+            client.close()
+            setup_logging(log_level="INFO")
+
+        with capsys.disabled():
+            print(
+                f"\n[logging] {self.REQUESTS} requests: off {off:.0f} req/s, "
+                f"sync {sync:.0f} req/s, queued {queued:.0f} req/s "
+                f"(sampled {stats['dropped_sampled']}, queue drops {stats['dropped_queue_full']})"
+            )
+
+        # Loose bound: wall-clock throughput on shared CI runners is noisy
+        assert queued > sync * 0.9
@@ -0,0 +1,47 @@
+"""
+Activity pattern recalculation: grouped SQL aggregation vs. loading every
+Event row in the window and folding it in Python.
+"""
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.models.event import Event
+from app.services.pattern_service import PatternService, reset_pattern_service
+from tests.test_services.test_pattern_service import _seed_events, python_distributions
+
+pytestmark = pytest.mark.performance
+
+
+class TestPatternRecalculationBenchmark:
+
+    def setup_method(self):
+        reset_pattern_service()
+        self.service = PatternService()
+
+    @pytest.mark.asyncio
+    async def test_recalculation_benchmark(self, db_session, capsys):
+        """Grouped SQL vs. loading every Event row and folding in Python."""
+        import time as time_module
+        from tests.conftest import make_camera
+
+        camera = make_camera(db_session=db_session)
+        _seed_events(db_session, camera.id, 5000)
+        cutoff = datetime.now(timezone.utc) - timedelta(days=30)
+
+        start = time_module.perf_counter()
+        events = db_session.query(Event).filter(
+            Event.camera_id == camera.id, Event.timestamp >= cutoff
+        ).all()
+        python_distributions(events)
+        orm_ms = (time_module.perf_counter() - start) * 1000
+        db_session.expunge_all()
+
+        start = time_module.perf_counter()
+        await self.service.recalculate_patterns(db_session, camera.id, force=True)
+        sql_ms = (time_module.perf_counter() - start) * 1000
+
+        with capsys.disabled():
+            print(f"\n[patterns] 5000 events: ORM load + fold {orm_ms:.1f}ms, grouped SQL {sql_ms:.1f}ms")
+
+        assert sql_ms < orm_ms
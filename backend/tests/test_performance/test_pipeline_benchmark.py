@@ -0,0 +1,78 @@
+"""
+Short run of the end-to-end pipeline benchmark (app/services/pipeline_benchmark.py).
+
+Asserts only that load flows through every stage and the report is complete;
+the printed numbers are for reading, not for gating.
+"""
+import json
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.models.ai_usage import AIUsage
+from app.models.camera import Camera
+from app.models.event import Event
+from app.services.ai_providers import LocalProviderProfile
+from app.services.pipeline_benchmark import (
+    STAGES,
+    PipelineBenchmark,
+    PipelineBenchmarkConfig,
+    compare_reports,
+)
+
+
+@pytest.fixture
+def bench_engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'bench.db'}", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_pipeline_benchmark_short_run(capsys, bench_engine):
+    config = PipelineBenchmarkConfig(
+        cameras=2,
+        camera_fps=10,
+        motion_period_seconds=1.5,
+        motion_cooldown_seconds=1.0,
+        protect_events_per_second=2.0,
+        duration_seconds=3.0,
+        drain_timeout_seconds=10.0,
+        frame_width=320,
+        frame_height=180,
+        provider=LocalProviderProfile(latency_p50_ms=20, latency_p99_ms=60, seed=0),
+    )
+    benchmark = PipelineBenchmark(config, engine=bench_engine)
+    report = await benchmark.run()
+
+    with capsys.disabled():
+        print("\n[pipeline benchmark] " + json.dumps({
+            "events_per_second": report["events_per_second"],
+            "events": report["events"],
+            "p99_ms": {name: stage.get("p99_ms") for name, stage in report["stages"].items()},
+        }))
+
+    assert report["events"]["protect"] > 0
+    assert report["events"]["completed"] > 0
+    assert report["events"]["drained"]
+    assert report["stages"]["capture"]["count"] > 0
+    assert report["stages"]["motion"]["count"] > 0
+    for stage in ("queue_wait", "thumbnail", "ai", "store", "post_processing", "protect", "end_to_end"):
+        assert report["stages"][stage]["count"] > 0, stage
+        assert report["stages"][stage]["p50_ms"] <= report["stages"][stage]["p99_ms"]
+    assert set(report["queue_depths"]) == {"event_queue", "capture_queues", "database_writer"}
+
+    assert report["environment"]["database"] == "sqlite"
+
+    # The run wrote to the scratch database and cleaned up after itself
+    with sessionmaker(bind=bench_engine)() as db:
+        assert db.query(Camera).filter(Camera.name.like("Benchmark%")).count() == 0
+        assert db.query(Event).count() == 0
+        assert db.query(AIUsage).filter(AIUsage.provider == "local").count() == 0
+
+    rows = compare_reports(report, report)
+    assert {row["stage"] for row in rows} >= {"pipeline", *STAGES} - {"capture"} - {"motion"}
+    assert all(row["change_pct"] in (0.0, None) for row in rows)
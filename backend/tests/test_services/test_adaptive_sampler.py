@@ -3,16 +3,23 @@ Tests for AdaptiveSampler service (Story P8-2.4)
 
 Tests content-aware frame selection using histogram and SSIM comparison.
 """
+from unittest.mock import patch
+
+import cv2
 import numpy as np
 import pytest
 
 from app.services.adaptive_sampler import (
     AdaptiveSampler,
+    FrameSignatures,
     get_adaptive_sampler,
     reset_adaptive_sampler,
+    thumbnail_size,
+    _ssim_gray,
     HISTOGRAM_SIMILARITY_THRESHOLD,
     SSIM_SIMILARITY_THRESHOLD,
-    MIN_TEMPORAL_SPACING_MS
+    MIN_TEMPORAL_SPACING_MS,
+    THUMBNAIL_WIDTH,
 )
 
 
@@ -331,3 +338,69 @@ class TestFrameSelectionWithSceneChanges:
         has_scene2 = any(i >= 5 for i in indices)
 
         assert has_scene1 and has_scene2, f"Should select from both scenes, got indices {indices}"
+
+
+class TestTieredPrefilter:
+    """Tests for thumbnail signatures and the tiered comparison."""
+
+    def setup_method(self):
+        self.sampler = AdaptiveSampler()
+
+    def test_thumbnail_size_preserves_aspect_and_never_upscales(self):
+        assert thumbnail_size(1920, 1080) == (THUMBNAIL_WIDTH, 90)
+        assert thumbnail_size(100, 80) == (100, 80)
+
+    def test_thumbnails_are_small_grayscale(self):
+        rgb = np.random.randint(0, 255, (720, 1280, 3), dtype=np.uint8)
+        gray = np.random.randint(0, 255, (90, 160), dtype=np.uint8)
+
+        signatures = FrameSignatures.from_frames([rgb, gray])
+
+        assert signatures.thumbnails[0].shape == (90, 160)
+        assert signatures.thumbnails[1] is gray
+        assert signatures.histograms.shape == (2, 64)
+        assert signatures.hashes.shape == (2, 256)
+
+    def test_histogram_matrix_matches_pairwise_correlation(self):
+        frames = [np.random.randint(i * 20, 120 + i * 20, (90, 160), dtype=np.uint8) for i in range(4)]
+        signatures = FrameSignatures.from_frames(frames)
+
+        matrix = signatures.histogram_similarity()
+
+        hist = [h.reshape(-1, 1) for h in signatures.histograms]
+        expected = (cv2.compareHist(hist[1], hist[3], cv2.HISTCMP_CORREL) + 1) / 2
+        assert matrix[1, 3] == pytest.approx(expected, abs=1e-5)
+        assert np.allclose(np.diag(matrix), 1.0)
+
+    def test_hash_distance_matrix(self):
+        left = np.zeros((90, 160), dtype=np.uint8)
+        left[:, :80] = 255
+        right = np.fliplr(left).copy()
+
+        distance = FrameSignatures.from_frames([left, left.copy(), right]).hash_distance()
+
+        assert distance[0, 1] == 0
+        assert distance[0, 2] == 256
+        assert (distance == distance.T).all()
+
+    @pytest.mark.asyncio
+    async def test_ssim_only_for_ambiguous_pairs(self):
+        scene = [np.full((90, 160), 30 if i < 5 else 220, dtype=np.uint8) for i in range(10)]
+        timestamps_ms = [i * 1000.0 for i in range(10)]
+
+        with patch("app.services.adaptive_sampler._ssim_gray", wraps=_ssim_gray) as ssim:
+            await self.sampler.select_diverse_frames(scene, timestamps_ms, target_count=4)
+        assert ssim.call_count == 0
+
+        # A small moving object leaves hash and histogram ambiguous
+        base = np.random.default_rng(1).integers(0, 255, (90, 160), dtype=np.uint8)
+        moving = []
+        for i in range(10):
+            frame = base.copy()
+            frame[30:50, i * 12:i * 12 + 16] = 255
+            moving.append(frame)
+
+        with patch("app.services.adaptive_sampler._ssim_gray", wraps=_ssim_gray) as ssim:
+            selected = await self.sampler.select_diverse_frames(moving, timestamps_ms, target_count=4)
+        assert ssim.call_count > 0
+        assert len(selected) == 4
@@ -107,10 +107,30 @@ class TestAICostAndUsageTracker:
         # Just ensure it runs without error and returns list
         assert isinstance(breakdown, list)
 
-    def test_get_top_cameras_placeholder(self):
+    def test_get_top_cameras_empty(self, tracker_db):
         tracker = AICostAndUsageTracker()
         result = tracker.get_top_cameras_by_cost()
-        assert result == []  # Known limitation until camera_id is on AIUsage
+        assert result == []  # No camera-attributed usage recorded
+
+    def test_cluster_cost_includes_other_replicas_and_queued_rows(self, tracker_db):
+        tracker = AICostAndUsageTracker()
+        tracker.record_usage(provider="openai", success=True, cost_estimate=0.5)
+
+        # Written by another replica after this one seeded its ledger
+        now = datetime.now(timezone.utc)
+        tracker_db.add(AIUsage(timestamp=now, provider="claude", success=True, cost_estimate=2.0))
+        tracker_db.add(AIUsage(timestamp=now, provider="claude", success=False, cost_estimate=9.0))
+        tracker_db.commit()
+        # Recorded here but still waiting for the write-behind insert
+        tracker.ledger.record({
+            "timestamp": now, "provider": "openai", "success": True, "tokens_used": 0,
+            "response_time_ms": 0, "cost_estimate": 0.25, "error": None, "analysis_mode": None,
+            "is_estimated": False, "image_count": None, "camera_id": None,
+        })
+
+        assert tracker.get_daily_cost() == pytest.approx(0.75)
+        assert tracker.get_cluster_cost("daily") == pytest.approx(2.75)
+        assert tracker.get_cluster_cost("monthly") == pytest.approx(2.75)
 
     def test_cost_cap_integration_hook(self, db_session):
         """Verify that record_usage invalidates CostCapService cache."""
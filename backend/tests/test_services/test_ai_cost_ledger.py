@@ -0,0 +1,269 @@
+"""
+Tests for the in-memory AI cost ledger and its tracker integration
+"""
+
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from app.models.ai_usage import AIUsage
+from app.services.ai_cost_ledger import AICostLedger, build_rollups, hour_bucket
+from app.services.ai_cost_and_usage_tracker import (
+    AICostAndUsageTracker,
+    reset_ai_cost_and_usage_tracker,
+    usage_camera_scope,
+)
+
+
+def _row(ts, provider="openai", success=True, cost=0.01, camera_id=None, mode="single_image"):
+    return {
+        "timestamp": ts,
+        "provider": provider,
+        "success": success,
+        "tokens_used": 100,
+        "response_time_ms": 200,
+        "cost_estimate": cost,
+        "error": None,
+        "analysis_mode": mode,
+        "is_estimated": False,
+        "image_count": 1,
+        "camera_id": camera_id,
+    }
+
+
+class TestAICostLedger:
+    """Unit tests for AICostLedger bookkeeping."""
+
+    def test_record_before_seed_is_reapplied(self):
+        ledger = AICostLedger()
+        now = datetime.now(timezone.utc)
+
+        ledger.record(_row(now, cost=0.5))
+        assert ledger.daily_cost() == 0.0  # not seeded yet
+
+        ledger.replace({}, now)
+
+        assert ledger.daily_cost() == pytest.approx(0.5)
+        assert ledger.monthly_cost() == pytest.approx(0.5)
+        assert ledger.pending_count == 1
+
+    def test_period_totals_only_count_successful_calls(self):
+        ledger = AICostLedger()
+        now = datetime.now(timezone.utc)
+        ledger.replace({}, now)
+
+        ledger.record(_row(now, cost=0.25))
+        ledger.record(_row(now, cost=0.75, success=False))
+
+        assert ledger.daily_cost() == pytest.approx(0.25)
+        rollups = ledger.query(now - timedelta(hours=1), now)
+        assert sum(r.calls for _, r in rollups) == 2
+        assert sum(r.cost for _, r in rollups) == pytest.approx(1.0)
+
+    def test_seed_splits_day_and_month(self):
+        now = datetime(2026, 3, 15, 12, 30, tzinfo=timezone.utc)
+        rows = [
+            (now - timedelta(hours=1), "openai", "single_image", None, True, 10, 1.0, 100),
+            (now - timedelta(days=3), "openai", "single_image", None, True, 10, 2.0, 100),
+            (now - timedelta(days=20), "claude", "multi_frame", "cam-1", True, 10, 4.0, 100),
+            (now - timedelta(hours=2), "claude", "multi_frame", "cam-1", False, 10, 8.0, 100),
+        ]
+        ledger = AICostLedger()
+        ledger.replace(build_rollups(rows), now)
+
+        assert ledger.daily_cost() == pytest.approx(1.0)
+        assert ledger.monthly_cost() == pytest.approx(3.0)
+
+    def test_roll_forward_on_day_rollover(self):
+        ledger = AICostLedger(retention_days=30)
+        now = datetime(2026, 3, 31, 23, 59, tzinfo=timezone.utc)
+        rows = [
+            (now - timedelta(days=30), "openai", "single_image", None, True, 10, 2.0, 100),
+            (now - timedelta(hours=1), "openai", "single_image", None, True, 10, 1.0, 100),
+        ]
+        ledger.replace(build_rollups(rows), now)
+        assert not ledger.roll_forward(now)
+
+        assert ledger.roll_forward(now + timedelta(minutes=2))
+
+        # New day and new month: totals restart, history is kept in the window
+        assert ledger.daily_cost() == 0.0
+        assert ledger.monthly_cost() == 0.0
+        assert len(ledger.query()) == 1  # the 30-day-old bucket aged out
+
+        ledger.record(_row(now + timedelta(minutes=3), cost=0.5))
+        assert ledger.daily_cost() == pytest.approx(0.5)
+
+    def test_query_filters_by_hour(self):
+        now = datetime.now(timezone.utc)
+        ledger = AICostLedger()
+        ledger.replace({}, now)
+        ledger.record(_row(now))
+        ledger.record(_row(now - timedelta(days=2)))
+
+        recent = ledger.query(now - timedelta(hours=1), now)
+
+        assert len(recent) == 1
+        assert recent[0][0][0] == hour_bucket(now)
+
+    def test_drain_and_requeue(self):
+        ledger = AICostLedger()
+        now = datetime.now(timezone.utc)
+        ledger.record(_row(now))
+        ledger.record(_row(now))
+
+        rows = ledger.drain_pending()
+        assert len(rows) == 2
+        assert ledger.pending_count == 0
+
+        ledger.requeue(rows)
+        assert ledger.pending_count == 2
+
+
+class TestTrackerLedgerIntegration:
+    """AICostAndUsageTracker backed by the ledger."""
+
+    @pytest.fixture(autouse=True)
+    def reset_tracker(self):
+        reset_ai_cost_and_usage_tracker()
+        yield
+        reset_ai_cost_and_usage_tracker()
+
+    @pytest.fixture
+    def tracker_db(self, db_session):
+        @contextmanager
+        def _fake_get_db_session():
+            yield db_session
+
+        with patch(
+            "app.services.ai_cost_and_usage_tracker.get_db_session",
+            _fake_get_db_session,
+        ):
+            yield db_session
+
+    def test_seeds_from_existing_rows(self, tracker_db):
+        now = datetime.now(timezone.utc)
+        tracker_db.add(AIUsage(
+            timestamp=now, provider="openai", success=True,
+            tokens_used=10, response_time_ms=100, cost_estimate=1.25,
+        ))
+        tracker_db.commit()
+
+        tracker = AICostAndUsageTracker()
+
+        assert tracker.get_daily_cost() == pytest.approx(1.25)
+        assert tracker.get_monthly_cost() == pytest.approx(1.25)
+
+    def test_day_rollover_does_not_rescan(self, tracker_db):
+        tracker = AICostAndUsageTracker()
+        tracker.record_usage(provider="openai", success=True, cost_estimate=0.5)
+        tomorrow = datetime.now(timezone.utc) + timedelta(days=1)
+
+        with patch.object(
+            AICostAndUsageTracker, "_scan_rollups",
+            side_effect=AssertionError("rollover rescanned ai_usage"),
+        ), patch("app.services.ai_cost_and_usage_tracker.datetime") as mock_datetime:
+            mock_datetime.now.return_value = tomorrow
+            assert tracker.get_daily_cost() == 0.0
+            assert tracker.ledger.window_start == tracker.ledger.seed_window_start(tomorrow)
+
+    def test_failed_seed_is_not_retried_on_every_read(self, tracker_db):
+        tracker = AICostAndUsageTracker()
+
+        with patch.object(
+            AICostAndUsageTracker, "_scan_rollups", side_effect=RuntimeError("db down"),
+        ) as scan:
+            tracker.get_daily_cost()
+            tracker.get_daily_cost()
+            assert scan.call_count == 1
+
+        with patch(
+            "app.services.ai_cost_and_usage_tracker.time.monotonic",
+            return_value=time.monotonic() + 3600,
+        ):
+            tracker.get_daily_cost()
+        assert tracker.ledger.is_seeded
+
+    def test_cost_reads_do_not_query_after_seed(self, tracker_db):
+        tracker = AICostAndUsageTracker()
+        tracker.record_usage(provider="openai", success=True, cost_estimate=0.5)
+
+        with patch(
+            "app.services.ai_cost_and_usage_tracker.get_db_session",
+            side_effect=AssertionError("cost read hit the database"),
+        ):
+            assert tracker.get_daily_cost() == pytest.approx(0.5)
+            assert tracker.get_monthly_cost() == pytest.approx(0.5)
+
+    def test_camera_scope_attributes_usage(self, tracker_db):
+        tracker = AICostAndUsageTracker()
+
+        with usage_camera_scope("cam-front"):
+            tracker.record_usage(provider="openai", success=True, cost_estimate=0.2)
+        tracker.record_usage(provider="openai", success=True, cost_estimate=0.1)
+
+        stored = tracker_db.query(AIUsage).order_by(AIUsage.id).all()
+        assert [r.camera_id for r in stored] == ["cam-front", None]
+
+        top = tracker.get_top_cameras_by_cost()
+        assert top == [{"camera_id": "cam-front", "calls": 1, "tokens": 0, "cost": 0.2}]
+
+    def test_usage_rollup_breakdowns(self, tracker_db):
+        tracker = AICostAndUsageTracker()
+        tracker.record_usage(provider="openai", success=True, cost_estimate=0.2,
+                             analysis_mode="single_image", camera_id="cam-1")
+        tracker.record_usage(provider="claude", success=True, cost_estimate=0.3,
+                             analysis_mode="multi_frame")
+
+        now = datetime.now(timezone.utc)
+        usage = tracker.get_usage_rollup(now - timedelta(days=1), now)
+
+        assert usage["total_requests"] == 2
+        assert usage["total_cost"] == pytest.approx(0.5)
+        assert set(usage["by_provider"]) == {"openai", "claude"}
+        assert set(usage["by_mode"]) == {"single_image", "multi_frame"}
+        assert usage["by_camera"] == {"cam-1": {"cost": pytest.approx(0.2), "requests": 1}}
+
+    def test_cost_trends_buckets(self, tracker_db):
+        tracker = AICostAndUsageTracker()
+        tracker.record_usage(provider="openai", success=True, tokens_used=100,
+                             response_time_ms=400, cost_estimate=0.2)
+        tracker.record_usage(provider="openai", success=False, tokens_used=0,
+                             response_time_ms=200, cost_estimate=0.0)
+
+        trends = tracker.get_cost_trends(days_back=1, bucket="hour")
+
+        assert len(trends) == 1
+        assert trends[0]["calls"] == 2
+        assert trends[0]["total_tokens"] == 100
+        assert trends[0]["avg_response_time_ms"] == 300.0
+
+    def test_write_behind_batches_inserts(self, tracker_db):
+        tracker = AICostAndUsageTracker()
+        tracker.get_daily_cost()  # seed
+        tracker.start_write_behind()
+        try:
+            for _ in range(5):
+                tracker.record_usage(provider="openai", success=True, cost_estimate=0.1)
+
+            # Ledger is current before the rows reach the database
+            assert tracker.get_daily_cost() == pytest.approx(0.5)
+        finally:
+            tracker.stop_write_behind()
+
+        assert tracker.ledger.pending_count == 0
+        assert tracker_db.query(AIUsage).count() == 5
+
+    def test_failed_flush_requeues_rows(self, tracker_db):
+        tracker = AICostAndUsageTracker()
+        tracker.get_daily_cost()  # seed
+
+        with patch.object(tracker_db, "bulk_insert_mappings", side_effect=RuntimeError("db down")):
+            tracker.record_usage(provider="openai", success=True, cost_estimate=0.1)
+
+        assert tracker.ledger.pending_count == 1
+        assert tracker.flush() == 1
+        assert tracker_db.query(AIUsage).count() == 1
@@ -0,0 +1,187 @@
+"""
+Tests for latency-aware provider routing and hedged requests in
+VisionAnalysisOrchestrator.
+"""
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from app.services.ai_latency_router import (
+    AILatencyRouter,
+    get_ai_latency_router,
+    reset_ai_latency_router,
+)
+from app.services.ai_types import AIProvider, AIResult
+from app.services.vision_analysis_orchestrator import (
+    VisionAnalysisOrchestrator,
+    reset_vision_analysis_orchestrator,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_router():
+    reset_ai_latency_router()
+    reset_vision_analysis_orchestrator()
+    yield
+    reset_ai_latency_router()
+    reset_vision_analysis_orchestrator()
+
+
+def seed(router, provider, latencies, model=None, success=True, cost=0.001):
+    for latency in latencies:
+        router.record(provider, model, latency, success, cost)
+
+
+class TestRanking:
+    def test_orders_measured_providers_by_expected_time(self):
+        router = AILatencyRouter(min_samples=3)
+        seed(router, "openai", [4000, 4200, 4400])
+        seed(router, "grok", [900, 1000, 1100])
+        order = ["openai", "grok", "anthropic"]
+
+        assert router.rank(order, {"openai": None, "grok": None}) == ["grok", "openai", "anthropic"]
+        assert router.get_status()["recent_decisions"][-1]["order"] == ["grok", "openai", "anthropic"]
+
+    def test_error_rate_and_cost_budget_push_providers_back(self):
+        router = AILatencyRouter(min_samples=4, max_cost_per_call=0.002)
+        seed(router, "openai", [1000] * 4)
+        seed(router, "grok", [800] * 2)
+        seed(router, "grok", [800] * 2, success=False)  # 50% errors: expected 1600ms
+        seed(router, "anthropic", [500] * 4, cost=0.01)  # fastest but over budget
+        models = {"openai": None, "grok": None, "anthropic": None}
+
+        assert router.rank(["anthropic", "grok", "openai"], models) == ["openai", "grok", "anthropic"]
+
+    def test_unmeasured_providers_keep_their_slot(self):
+        router = AILatencyRouter(min_samples=3)
+        seed(router, "grok", [3000] * 3)
+        seed(router, "anthropic", [1000] * 3)
+        seed(router, "openai", [200] * 2)  # not enough samples
+        models = {"openai": None, "grok": None, "anthropic": None}
+
+        assert router.rank(["openai", "grok", "anthropic"], models) == ["openai", "anthropic", "grok"]
+
+    def test_stats_are_per_model_and_expire(self):
+        router = AILatencyRouter(min_samples=2, window_seconds=60)
+        seed(router, "openai", [1000, 3000], model="gpt-4o")
+        seed(router, "openai", [100, 200], model="gpt-4o-mini")
+
+        assert router.stats("openai", "gpt-4o")["p95_ms"] == 3000
+        assert router.stats("openai", "gpt-4o-mini")["p50_ms"] == 100
+
+        with patch("app.services.ai_latency_router.time.monotonic", return_value=10 ** 9):
+            assert router.stats("openai", "gpt-4o") is None
+
+    def test_censored_samples_raise_latency_without_counting_as_errors(self):
+        router = AILatencyRouter(min_samples=4)
+        seed(router, "openai", [100, 100])
+        router.record("openai", None, 5000, False, censored=True)
+        router.record("openai", None, 5000, False, censored=True)
+
+        stats = router.stats("openai", None)
+        assert stats["censored"] == 2
+        assert stats["error_rate"] == 0
+        assert stats["p95_ms"] == 5000
+
+
+class FakeProvider:
+    """Provider answering after a fixed delay."""
+
+    def __init__(self, name, delay, model, success=True, cost=0.002):
+        self.name, self.delay, self.model = name, delay, model
+        self.success, self.cost = success, cost
+        self.calls = 0
+        self.cancelled = False
+
+    async def generate_description(self, *args, **kwargs):
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled = True
+            raise
+        return AIResult(
+            description=f"{self.name} saw a person",
+            confidence=80,
+            objects_detected=["person"],
+            provider=self.name,
+            tokens_used=100,
+            response_time_ms=int(self.delay * 1000),
+            cost_estimate=self.cost,
+            success=self.success,
+            error=None if self.success else "boom",
+        )
+
+
+class TestHedging:
+    def orchestrator(self, *providers):
+        resilience = MagicMock()
+        resilience.can_use_provider.return_value = True
+        orchestrator = VisionAnalysisOrchestrator(
+            providers={enum: provider for enum, provider in providers},
+            resilience_service=resilience,
+        )
+        orchestrator._get_provider_order = lambda: [enum for enum, _ in providers]
+        return orchestrator
+
+    @pytest.fixture
+    def router(self):
+        router = get_ai_latency_router()
+        router.min_samples = 3
+        router.hedging_enabled = True
+        router.hedge_min_delay_ms = 0
+        return router
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged_and_cancelled(self, router):
+        slow = FakeProvider("openai", delay=1.0, model="gpt-4o-mini")
+        fast = FakeProvider("grok", delay=0.01, model="grok-2-vision")
+        seed(router, "openai", [40, 50, 60], model="gpt-4o-mini", cost=0.003)
+        orchestrator = self.orchestrator((AIProvider.OPENAI, slow), (AIProvider.GROK, fast))
+
+        with patch("app.services.vision_analysis_orchestrator.get_ai_cost_and_usage_tracker"):
+            result = await orchestrator.analyze_image(np.zeros((32, 32, 3), dtype=np.uint8), "Yard")
+
+        assert result.success and result.provider == "grok"
+        assert slow.cancelled and fast.calls == 1
+        hedging = router.get_status()["hedging"]
+        assert hedging["fired"] == 1 and hedging["backup_won"] == 1
+        # The cancelled request is assumed billed at the primary's mean cost
+        assert hedging["extra_cost_usd"] == pytest.approx(0.003)
+        # ...and counts as a censored latency sample, not as an error
+        stats = router.stats("openai", "gpt-4o-mini")
+        assert stats["samples"] == 4 and stats["censored"] == 1
+        assert stats["error_rate"] == 0
+        assert stats["p95_ms"] >= 60  # cancelled after the 60ms hedge delay
+
+    @pytest.mark.asyncio
+    async def test_primary_within_p95_is_not_hedged(self, router):
+        primary = FakeProvider("openai", delay=0.01, model="gpt-4o-mini")
+        backup = FakeProvider("grok", delay=0.01, model="grok-2-vision")
+        seed(router, "openai", [400, 500, 600], model="gpt-4o-mini")
+        orchestrator = self.orchestrator((AIProvider.OPENAI, primary), (AIProvider.GROK, backup))
+
+        with patch("app.services.vision_analysis_orchestrator.get_ai_cost_and_usage_tracker"):
+            result = await orchestrator.analyze_image(np.zeros((32, 32, 3), dtype=np.uint8), "Yard")
+
+        assert result.provider == "openai"
+        assert backup.calls == 0
+        assert router.get_status()["hedging"]["fired"] == 0
+        assert router.stats("openai", "gpt-4o-mini")["samples"] == 4
+
+    @pytest.mark.asyncio
+    async def test_failed_backup_falls_back_to_primary_and_skips_it_later(self, router):
+        slow = FakeProvider("openai", delay=0.1, model="gpt-4o-mini")
+        failing = FakeProvider("grok", delay=0.01, model="grok-2-vision", success=False)
+        seed(router, "openai", [10, 10, 10], model="gpt-4o-mini")
+        orchestrator = self.orchestrator((AIProvider.OPENAI, slow), (AIProvider.GROK, failing))
+
+        with patch("app.services.vision_analysis_orchestrator.get_ai_cost_and_usage_tracker"):
+            result = await orchestrator.analyze_image(np.zeros((32, 32, 3), dtype=np.uint8), "Yard")
+
+        assert result.success and result.provider == "openai"
+        assert failing.calls == 1  # raced once, not retried by the fallback loop
+        hedging = router.get_status()["hedging"]
+        assert hedging["primary_won"] == 1 and hedging["extra_cost_usd"] == pytest.approx(0.002)
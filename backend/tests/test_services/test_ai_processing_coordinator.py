@@ -3,8 +3,11 @@ import pytest
 from unittest.mock import Mock, AsyncMock, MagicMock, patch
 import asyncio
 
+import numpy as np
+
 from app.services.ai_processing_coordinator import AIProcessingCoordinator
 from app.services.event_processor import ProcessingEvent
+from app.services.post_processing import EventUnitOfWork
 
 
 class TestAIProcessingCoordinator:
@@ -52,6 +55,17 @@ class TestAIProcessingCoordinator:
         event.delivery_carrier = None
         return event
 
+    @pytest.fixture(autouse=True)
+    def async_settings_db(self):
+        """Settings lookups through get_async_db_session find nothing (tests patch it to override)."""
+        session = AsyncMock()
+        session.scalar.return_value = None
+        session.execute.return_value = MagicMock(all=Mock(return_value=[]))
+        session_cm = MagicMock()
+        session_cm.__aenter__.return_value = session
+        with patch("app.services.ai_processing_coordinator.get_async_db_session", return_value=session_cm):
+            yield session
+
     @pytest.fixture
     def coordinator(self, mock_ai_service, mock_metrics, mock_services):
         """Create coordinator with direct services only (current production shape)"""
@@ -90,8 +104,7 @@ class TestAIProcessingCoordinator:
         coordinator._publish_camera_status_sensors = AsyncMock()
         coordinator._run_homekit_triggers = AsyncMock()
         coordinator._link_entity_to_event = AsyncMock()
-        coordinator._process_face_embeddings = AsyncMock()
-        coordinator._process_vehicle_embeddings = AsyncMock()
+        coordinator._process_detections = AsyncMock()
         coordinator._process_entity_alerts = AsyncMock()
         coordinator._enrich_event_with_audio = AsyncMock()
         coordinator._publish_mqtt_event = AsyncMock()
@@ -201,71 +214,165 @@ class TestAIProcessingCoordinator:
         hk.trigger_motion.assert_not_called()
         hk.trigger_occupancy.assert_not_called()
 
-    @pytest.mark.asyncio
-    async def test_process_face_embeddings_creates_task_when_service_present(self, coordinator, mock_services, sample_event):
-        face = mock_services["face_embedding_service"]
+    @staticmethod
+    def _settings_session(rows):
+        """Async session context manager whose execute() returns SystemSetting rows."""
+        result = Mock()
+        result.all.return_value = rows
+        session = AsyncMock()
+        session.execute.return_value = result
+        session_cm = MagicMock()
+        session_cm.__aenter__.return_value = session
+        return session_cm
+
+    @pytest.mark.asyncio
+    async def test_process_detections_awaits_one_fused_pass(self, coordinator, sample_event):
+        coordinator._run_detections = AsyncMock(return_value=["ent-1"])
+        rows = [("face_recognition_enabled", "true"), ("vehicle_recognition_enabled", "true")]
+        unit_of_work = EventUnitOfWork("evt-det")
+
+        with patch("app.services.ai_processing_coordinator.get_async_db_session",
+                   return_value=self._settings_session(rows)):
+            scheduled = await coordinator._process_detections(
+                event=sample_event, event_id="evt-det", thumbnail_base64="thumb",
+                ai_result=Mock(description="a car"), unit_of_work=unit_of_work,
+            )
 
-        await coordinator._process_face_embeddings(
-            event=sample_event, event_id="evt-face", thumbnail_base64="thumb123"
+        assert scheduled == {"faces": True, "vehicles": True, "matched_entity_ids": ["ent-1"]}
+        coordinator._run_detections.assert_awaited_once_with(
+            event_id="evt-det", thumbnail_base64="thumb", event_description="a car",
+            faces=True, vehicles=True, unit_of_work=unit_of_work,
         )
 
-        # fire-and-forget via create_task; we mainly verify the branch without crashing
-        assert True
+    @pytest.mark.asyncio
+    async def test_process_detections_respects_privacy_settings(self, coordinator, sample_event):
+        coordinator._run_detections = AsyncMock(return_value=[])
+        rows = [("face_recognition_enabled", "false"), ("vehicle_recognition_enabled", "true")]
+
+        with patch("app.services.ai_processing_coordinator.get_async_db_session",
+                   return_value=self._settings_session(rows)):
+            scheduled = await coordinator._process_detections(
+                event=sample_event, event_id="evt-det", thumbnail_base64="thumb",
+                ai_result=Mock(description="a car"), unit_of_work=EventUnitOfWork("evt-det"),
+            )
+
+        assert scheduled == {"faces": False, "vehicles": True}
 
     @pytest.mark.asyncio
-    async def test_process_face_embeddings_skips_when_no_thumbnail_or_service(self, coordinator, mock_services, sample_event):
-        mock_services["face_embedding_service"] = None
+    async def test_process_detections_skips_without_thumbnail(self, coordinator, sample_event):
+        coordinator._run_detections = AsyncMock()
 
-        # Should not raise
-        await coordinator._process_face_embeddings(
-            event=sample_event, event_id="evt-face2", thumbnail_base64=None
+        scheduled = await coordinator._process_detections(
+            event=sample_event, event_id="evt-det", thumbnail_base64=None, ai_result=Mock(),
+            unit_of_work=EventUnitOfWork("evt-det"),
         )
 
+        assert scheduled == {"faces": False, "vehicles": False}
+        coordinator._run_detections.assert_not_called()
+
     @pytest.mark.asyncio
-    async def test_process_vehicle_embeddings_creates_task(self, coordinator, mock_services, sample_event):
-        veh = mock_services["vehicle_embedding_service"]
-        ai_result = Mock(description="a vehicle")
+    async def test_run_detections_shares_one_detection_pass(self, coordinator, mock_services):
+        from app.services.detection_service import FrameDetections
 
-        await coordinator._process_vehicle_embeddings(
-            event=sample_event,
-            event_id="evt-veh",
-            objects_json="[]",
-            thumbnail_base64="thumb",
-            ai_result=ai_result,
-            smart_detection_type="vehicle",
-        )
+        frame = FrameDetections(image=np.zeros((8, 8, 3), dtype=np.uint8), faces=[Mock()], vehicles=[Mock()])
+        detector = Mock()
+        detector.detect = AsyncMock(return_value=[frame])
+        face = mock_services["face_embedding_service"]
+        face.build_event_face_embeddings = AsyncMock(return_value=[])
+        vehicle = mock_services["vehicle_embedding_service"]
+        vehicle.build_event_vehicle_embeddings = AsyncMock(return_value=[])
+
+        with patch("app.services.detection_service.get_detection_service", return_value=detector), \
+                patch("app.services.ai_processing_coordinator.get_async_db_session",
+                      return_value=self._settings_session([])):
+            matched = await coordinator._run_detections(
+                event_id="evt-det", thumbnail_base64="data:image/jpeg;base64,aGVsbG8=",
+                event_description="a car", faces=True, vehicles=True,
+                unit_of_work=EventUnitOfWork("evt-det"),
+            )
 
-        # fire-and-forget; we mainly verify no crash and branch taken
-        assert True
+        assert matched == []
+        detector.detect.assert_awaited_once_with([b"hello"], faces=True, vehicles=True)
+        assert face.build_event_face_embeddings.await_args.kwargs["detections"] is frame
+        assert vehicle.build_event_vehicle_embeddings.await_args.kwargs["detections"] is frame
+
+    @pytest.mark.asyncio
+    async def test_run_detections_writes_embeddings_and_matches_through_unit_of_work(
+        self, coordinator, mock_services
+    ):
+        from app.services.detection_service import FrameDetections
+
+        frame = FrameDetections(image=np.zeros((8, 8, 3), dtype=np.uint8), faces=[Mock()], vehicles=[])
+        detector = Mock()
+        detector.detect = AsyncMock(return_value=[frame])
+        face_row = Mock(id="face-1")
+        mock_services["face_embedding_service"].build_event_face_embeddings = AsyncMock(return_value=[face_row])
+        person_matching = Mock()
+        person_matching.match_faces_sync.return_value = [Mock(person_id="person-1")]
+        session = Mock()
+        unit_of_work = EventUnitOfWork("evt-det")
+        unit_of_work.write = AsyncMock(side_effect=lambda fn: fn(session))
+
+        with patch("app.services.detection_service.get_detection_service", return_value=detector), \
+                patch("app.services.ai_processing_coordinator.get_async_db_session",
+                      return_value=self._settings_session([])), \
+                patch("app.services.service_container.container") as container:
+            container.person_matching_service = person_matching
+            matched = await coordinator._run_detections(
+                event_id="evt-det", thumbnail_base64="aGVsbG8=",
+                event_description=None, faces=True, vehicles=False, unit_of_work=unit_of_work,
+            )
+
+        assert matched == ["person-1"]
+        session.add_all.assert_called_once_with([face_row])
+        session.commit.assert_not_called()
+        assert person_matching.match_faces_sync.call_args.kwargs["commit"] is False
 
     @pytest.mark.asyncio
-    async def test_process_entity_alerts_creates_task_for_person_or_vehicle(self, coordinator, mock_services, sample_event):
-        ent = mock_services["entity_service"]
-        ai_result = Mock(description="person detected")
+    async def test_process_entity_alerts_stages_recognition_on_unit_of_work(self, coordinator, mock_services, sample_event):
+        alert_service = Mock()
+        alert_service.process_event_entities = AsyncMock(return_value=Mock(
+            recognition_status="known", enriched_description="Alice at the door",
+            matched_entity_ids=["ent-1"], has_vip=False,
+        ))
+        unit_of_work = EventUnitOfWork("evt-ent")
 
-        await coordinator._process_entity_alerts(
-            event=sample_event,
-            event_id="evt-ent",
-            ai_result=ai_result,
-            objects_detected=["person"],
-        )
+        with patch("app.services.service_container.container") as container, \
+                patch("app.services.ai_processing_coordinator.SessionLocal"):
+            container.entity_alert_service = alert_service
+            status = await coordinator._process_entity_alerts(
+                event=sample_event,
+                event_id="evt-ent",
+                ai_result=Mock(description="person detected"),
+                objects_detected=["person"],
+                unit_of_work=unit_of_work,
+                matched_entity_ids=["ent-1"],
+            )
 
-        # The task is created via asyncio.create_task; we just ensure the method ran
-        assert True
+        assert status == "known"
+        assert alert_service.process_event_entities.await_args.kwargs["matched_entity_ids"] == ["ent-1"]
+        assert unit_of_work.values == {
+            "recognition_status": "known",
+            "enriched_description": "Alice at the door",
+            "matched_entity_ids": '["ent-1"]',
+        }
 
     @pytest.mark.asyncio
     async def test_process_entity_alerts_skips_for_other_objects(self, coordinator, mock_services, sample_event):
         ent = mock_services["entity_service"]
 
-        await coordinator._process_entity_alerts(
+        unit_of_work = EventUnitOfWork("evt-ent2")
+
+        status = await coordinator._process_entity_alerts(
             event=sample_event,
             event_id="evt-ent2",
             ai_result=Mock(description="cat"),
             objects_detected=["animal"],
+            unit_of_work=unit_of_work,
         )
 
-        # No person/vehicle → no call path exercised for execute_entity_alerts
-        assert True
+        assert status is None
+        assert unit_of_work.is_empty
 
     @pytest.mark.asyncio
     async def test_publish_mqtt_event_uses_mqtt_service(self, coordinator, mock_services, sample_event):
@@ -289,8 +396,15 @@ class TestAIProcessingCoordinator:
 
     @pytest.mark.asyncio
     async def test_enrich_event_with_audio_does_not_crash(self, coordinator, sample_event):
-        await coordinator._enrich_event_with_audio(event_id="evt-audio", camera_id="cam-123")
-        assert True
+        unit_of_work = EventUnitOfWork("evt-audio")
+        with patch("app.services.ai_processing_coordinator.SessionLocal") as session_local:
+            session_local.return_value.__enter__.return_value.query.return_value \
+                .filter.return_value.first.return_value = None
+            enriched = await coordinator._enrich_event_with_audio(
+                event_id="evt-audio", camera_id="cam-123", unit_of_work=unit_of_work
+            )
+        assert enriched is False
+        assert unit_of_work.is_empty
 
     @pytest.mark.asyncio
     async def test_post_processing_is_isolated_from_individual_failures(self, coordinator, mock_services, sample_event):
@@ -432,6 +546,21 @@ class TestAIProcessingCoordinator:
         assert event_id is None
         coordinator.metrics.increment_error.assert_called_with("event_storage_failed")
 
+    @pytest.mark.asyncio
+    async def test_store_event_with_retry_delegates_to_injected_store(self, coordinator):
+        """Storage goes through the store_event callable the owner injects"""
+        coordinator.store_event = AsyncMock(return_value="stored-evt-1")
+
+        event_id = await coordinator._store_event_with_retry({"camera_id": "cam-1"}, max_retries=2)
+
+        assert event_id == "stored-evt-1"
+        coordinator.store_event.assert_awaited_once_with({"camera_id": "cam-1"}, max_retries=2)
+
+    @pytest.mark.asyncio
+    async def test_store_event_with_retry_without_store_returns_none(self, coordinator):
+        """A coordinator built without a store_event callable reports failure instead of raising"""
+        assert await coordinator.store_processed_event({"camera_id": "cam-1"}) is None
+
     @pytest.mark.asyncio
     async def test_generate_and_match_entity_uses_embedding_service(self, coordinator, mock_services, sample_event):
         """_generate_and_match_entity calls the embedding service for early context"""
@@ -449,7 +578,7 @@ class TestAIProcessingCoordinator:
         """The injected context_prompt_service is used when building enhanced prompts"""
         ctx = mock_services["context_prompt_service"]
         ctx.build_context_enhanced_prompt = AsyncMock(return_value=Mock(
-            context_included=True, prompt="contextual prompt", entity_context_included=True
+            context_included=True, prompt="contextual prompt", entity_context_included=True, cache_context=""
         ))
 
         coordinator._handle_cost_cap_skip = AsyncMock(return_value=False)
@@ -464,8 +593,7 @@ class TestAIProcessingCoordinator:
         coordinator._publish_camera_status_sensors = AsyncMock()
         coordinator._run_homekit_triggers = AsyncMock()
         coordinator._link_entity_to_event = AsyncMock()
-        coordinator._process_face_embeddings = AsyncMock()
-        coordinator._process_vehicle_embeddings = AsyncMock()
+        coordinator._process_detections = AsyncMock()
         coordinator._process_entity_alerts = AsyncMock()
         coordinator._enrich_event_with_audio = AsyncMock()
         coordinator._publish_mqtt_event = AsyncMock()
@@ -494,8 +622,7 @@ class TestAIProcessingCoordinator:
         coordinator._publish_camera_status_sensors = AsyncMock()
         coordinator._run_homekit_triggers = AsyncMock()
         coordinator._link_entity_to_event = AsyncMock()
-        coordinator._process_face_embeddings = AsyncMock()
-        coordinator._process_vehicle_embeddings = AsyncMock()
+        coordinator._process_detections = AsyncMock()
         coordinator._process_entity_alerts = AsyncMock()
         coordinator._enrich_event_with_audio = AsyncMock()
         coordinator._publish_mqtt_event = AsyncMock()
@@ -684,8 +811,7 @@ class TestAIProcessingCoordinator:
         coordinator._publish_camera_status_sensors = AsyncMock()
         coordinator._run_homekit_triggers = AsyncMock()
         coordinator._link_entity_to_event = AsyncMock()
-        coordinator._process_face_embeddings = AsyncMock()
-        coordinator._process_vehicle_embeddings = AsyncMock()
+        coordinator._process_detections = AsyncMock()
         coordinator._process_entity_alerts = AsyncMock()
         coordinator._enrich_event_with_audio = AsyncMock()
         coordinator._publish_mqtt_event = AsyncMock()
@@ -714,8 +840,7 @@ class TestAIProcessingCoordinator:
         coordinator._publish_camera_status_sensors = AsyncMock()
         coordinator._run_homekit_triggers = AsyncMock()
         coordinator._link_entity_to_event = AsyncMock()
-        coordinator._process_face_embeddings = AsyncMock()
-        coordinator._process_vehicle_embeddings = AsyncMock()
+        coordinator._process_detections = AsyncMock()
         coordinator._process_entity_alerts = AsyncMock()
         coordinator._enrich_event_with_audio = AsyncMock()
         coordinator._publish_mqtt_event = AsyncMock()
@@ -730,9 +855,10 @@ class TestAIProcessingCoordinator:
 
     @pytest.mark.asyncio
     async def test_cost_alert_service_called_on_success_path(self, coordinator, mock_services, sample_event):
-        """cost_alert_service.check_and_notify is invoked after successful storage"""
+        """Cost alert notifications are staged on the event's unit of work after successful storage"""
         cost_service = mock_services["cost_alert_service"]
-        cost_service.check_and_notify = AsyncMock(return_value=[])
+        cost_service.stage_notifications = Mock(return_value=[])
+        cost_service.broadcast_alert = AsyncMock()
 
         coordinator._handle_cost_cap_skip = AsyncMock(return_value=False)
         coordinator._generate_thumbnail = Mock(return_value="thumb")
@@ -744,17 +870,17 @@ class TestAIProcessingCoordinator:
         coordinator._store_processed_event = AsyncMock(return_value="evt-cost2")
         coordinator._send_push_notification = AsyncMock()
         coordinator._publish_camera_status_sensors = AsyncMock()
-        coordinator._run_homekit_triggers = AsyncMock()
+        coordinator._run_homekit_triggers = AsyncMock(return_value={})
         coordinator._link_entity_to_event = AsyncMock()
-        coordinator._process_face_embeddings = AsyncMock()
-        coordinator._process_vehicle_embeddings = AsyncMock()
+        coordinator._process_detections = AsyncMock()
         coordinator._process_entity_alerts = AsyncMock()
         coordinator._enrich_event_with_audio = AsyncMock()
         coordinator._publish_mqtt_event = AsyncMock()
 
         await coordinator.process_event(sample_event, worker_id=0)
 
-        cost_service.check_and_notify.assert_awaited_once()
+        cost_service.stage_notifications.assert_called_once()
+        cost_service.broadcast_alert.assert_not_awaited()
 
     @pytest.mark.asyncio
     async def test_ai_semaphore_limits_concurrency(self, coordinator, mock_ai_service, sample_event):
@@ -805,8 +931,7 @@ class TestAIProcessingCoordinator:
         coordinator._publish_camera_status_sensors = AsyncMock()
         coordinator._run_homekit_triggers = AsyncMock()
         coordinator._link_entity_to_event = AsyncMock()
-        coordinator._process_face_embeddings = AsyncMock()
-        coordinator._process_vehicle_embeddings = AsyncMock()
+        coordinator._process_detections = AsyncMock()
         coordinator._process_entity_alerts = AsyncMock()
         coordinator._enrich_event_with_audio = AsyncMock()
         coordinator._publish_mqtt_event = AsyncMock()
@@ -864,8 +989,7 @@ class TestAIProcessingCoordinator:
         coordinator._publish_camera_status_sensors = AsyncMock()
         coordinator._run_homekit_triggers = AsyncMock()
         coordinator._link_entity_to_event = AsyncMock()
-        coordinator._process_face_embeddings = AsyncMock()
-        coordinator._process_vehicle_embeddings = AsyncMock()
+        coordinator._process_detections = AsyncMock()
         coordinator._process_entity_alerts = AsyncMock()
         coordinator._enrich_event_with_audio = AsyncMock()
         coordinator._publish_mqtt_event = AsyncMock()
@@ -901,8 +1025,7 @@ class TestAIProcessingCoordinator:
         coordinator._publish_camera_status_sensors = AsyncMock()
         coordinator._run_homekit_triggers = AsyncMock()
         coordinator._link_entity_to_event = AsyncMock()
-        coordinator._process_face_embeddings = AsyncMock()
-        coordinator._process_vehicle_embeddings = AsyncMock()
+        coordinator._process_detections = AsyncMock()
         coordinator._process_entity_alerts = AsyncMock()
         coordinator._enrich_event_with_audio = AsyncMock()
         coordinator._publish_mqtt_event = AsyncMock()
@@ -942,9 +1065,11 @@ class TestAIProcessingCoordinator:
 
         # These should all be no-ops or safe
         await coord._run_homekit_triggers(sample_event, "e1", "person")
-        await coord._process_face_embeddings(sample_event, "e1", "thumb")
-        await coord._process_vehicle_embeddings(sample_event, "e1", "[]", "thumb", Mock(description="x"), "vehicle")
-        await coord._process_entity_alerts(sample_event, "e1", Mock(description="x"), ["person"])
+        unit_of_work = EventUnitOfWork("e1")
+        assert await coord._process_detections(sample_event, "e1", "thumb", Mock(description="x"), unit_of_work) == {
+            "faces": False, "vehicles": False,
+        }
+        await coord._process_entity_alerts(sample_event, "e1", Mock(description="x"), ["person"], unit_of_work)
         await coord._publish_mqtt_event(sample_event, "e1")
         await coord._store_embedding("e1", b"vec", "cam-123")
 
@@ -969,8 +1094,7 @@ class TestAIProcessingCoordinator:
         coordinator._publish_camera_status_sensors = AsyncMock()
         coordinator._run_homekit_triggers = AsyncMock()
         coordinator._link_entity_to_event = AsyncMock()
-        coordinator._process_face_embeddings = AsyncMock()
-        coordinator._process_vehicle_embeddings = AsyncMock()
+        coordinator._process_detections = AsyncMock()
         coordinator._process_entity_alerts = AsyncMock()
         coordinator._enrich_event_with_audio = AsyncMock()
         coordinator._publish_mqtt_event = AsyncMock()
@@ -1065,8 +1189,7 @@ class TestAIProcessingCoordinator:
         coordinator._publish_camera_status_sensors = AsyncMock()
         coordinator._run_homekit_triggers = AsyncMock()
         coordinator._link_entity_to_event = AsyncMock()
-        coordinator._process_face_embeddings = AsyncMock()
-        coordinator._process_vehicle_embeddings = AsyncMock()
+        coordinator._process_detections = AsyncMock()
         coordinator._process_entity_alerts = AsyncMock()
         coordinator._enrich_event_with_audio = AsyncMock()
         coordinator._publish_mqtt_event = AsyncMock()
@@ -1098,8 +1221,7 @@ class TestAIProcessingCoordinator:
         coordinator._publish_camera_status_sensors = AsyncMock()
         coordinator._run_homekit_triggers = AsyncMock()
         coordinator._link_entity_to_event = AsyncMock()
-        coordinator._process_face_embeddings = AsyncMock()
-        coordinator._process_vehicle_embeddings = AsyncMock()
+        coordinator._process_detections = AsyncMock()
         coordinator._process_entity_alerts = AsyncMock()
         coordinator._enrich_event_with_audio = AsyncMock()
         coordinator._publish_mqtt_event = AsyncMock()
@@ -1152,8 +1274,7 @@ class TestAIProcessingCoordinator:
         coordinator._publish_camera_status_sensors = AsyncMock()
         coordinator._run_homekit_triggers = AsyncMock()
         coordinator._link_entity_to_event = AsyncMock()
-        coordinator._process_face_embeddings = AsyncMock()
-        coordinator._process_vehicle_embeddings = AsyncMock()
+        coordinator._process_detections = AsyncMock()
         coordinator._process_entity_alerts = AsyncMock()
         coordinator._enrich_event_with_audio = AsyncMock()
         coordinator._publish_mqtt_event = AsyncMock()
@@ -1301,9 +1422,11 @@ class TestAIProcessingCoordinator:
 
     @pytest.mark.asyncio
     async def test_cost_alert_service_runs_after_successful_storage(self, coordinator, mock_services, sample_event):
-        """After a successful store, the cost_alert_service is actually invoked"""
+        """Staged cost alerts are broadcast once the unit of work has committed"""
         cost = mock_services["cost_alert_service"]
-        cost.check_and_notify = AsyncMock(return_value=[{"alert": "budget"}])
+        alert = Mock()
+        cost.stage_notifications = Mock(return_value=[(alert, {"alert": "budget"})])
+        cost.broadcast_alert = AsyncMock()
 
         coordinator._handle_cost_cap_skip = AsyncMock(return_value=False)
         coordinator._generate_thumbnail = Mock(return_value="t")
@@ -1315,17 +1438,17 @@ class TestAIProcessingCoordinator:
         coordinator._store_processed_event = AsyncMock(return_value="evt-cost-alert")
         coordinator._send_push_notification = AsyncMock()
         coordinator._publish_camera_status_sensors = AsyncMock()
-        coordinator._run_homekit_triggers = AsyncMock()
+        coordinator._run_homekit_triggers = AsyncMock(return_value={})
         coordinator._link_entity_to_event = AsyncMock()
-        coordinator._process_face_embeddings = AsyncMock()
-        coordinator._process_vehicle_embeddings = AsyncMock()
+        coordinator._process_detections = AsyncMock()
         coordinator._process_entity_alerts = AsyncMock()
         coordinator._enrich_event_with_audio = AsyncMock()
         coordinator._publish_mqtt_event = AsyncMock()
 
         await coordinator.process_event(sample_event, worker_id=0)
 
-        cost.check_and_notify.assert_awaited_once()
+        cost.stage_notifications.assert_called_once()
+        cost.broadcast_alert.assert_awaited_once_with(alert, {"alert": "budget"})
 
     @pytest.mark.asyncio
     async def test_generate_and_match_entity_returns_embedding_even_if_no_entity_match(self, coordinator, mock_services, sample_event):
@@ -1358,8 +1481,7 @@ class TestAIProcessingCoordinator:
         coordinator._publish_camera_status_sensors = AsyncMock()
         coordinator._run_homekit_triggers = AsyncMock()
         coordinator._link_entity_to_event = AsyncMock()
-        coordinator._process_face_embeddings = AsyncMock()
-        coordinator._process_vehicle_embeddings = AsyncMock()
+        coordinator._process_detections = AsyncMock()
         coordinator._process_entity_alerts = AsyncMock()
         coordinator._enrich_event_with_audio = AsyncMock()
         coordinator._publish_mqtt_event = AsyncMock()
@@ -1385,13 +1507,16 @@ class TestAIProcessingCoordinator:
         # The method looks up the stored Event row before serializing; provide a
         # fake session so the lookup returns an event and the serialize path runs.
         fake_event = Mock()
-        fake_session = MagicMock()
-        fake_session.__enter__.return_value.query.return_value.filter.return_value.first.return_value = fake_event
+        fake_session = AsyncMock()
+        fake_session.get.return_value = fake_event
+        fake_session.run_sync.side_effect = lambda fn: fn(None)
+        fake_session_cm = MagicMock()
+        fake_session_cm.__aenter__.return_value = fake_session
 
         # publish_event_to_mqtt is scheduled as a fire-and-forget task; stub it.
         coordinator.publish_event_to_mqtt = AsyncMock()
 
-        with patch("app.services.ai_processing_coordinator.SessionLocal", return_value=fake_session), \
+        with patch("app.services.ai_processing_coordinator.get_async_db_session", return_value=fake_session_cm), \
              patch("app.services.mqtt_service.serialize_event_for_mqtt") as mock_serialize:
             mock_serialize.return_value = {"event": "data"}
 
@@ -1434,8 +1559,7 @@ class TestAIProcessingCoordinator:
         coordinator._publish_camera_status_sensors = AsyncMock()
         coordinator._run_homekit_triggers = AsyncMock()
         coordinator._link_entity_to_event = AsyncMock()
-        coordinator._process_face_embeddings = AsyncMock()
-        coordinator._process_vehicle_embeddings = AsyncMock()
+        coordinator._process_detections = AsyncMock()
         coordinator._process_entity_alerts = AsyncMock()
         coordinator._enrich_event_with_audio = AsyncMock()
         coordinator._publish_mqtt_event = AsyncMock()
@@ -1445,7 +1569,7 @@ class TestAIProcessingCoordinator:
         assert result is True
         coordinator._publish_camera_status_sensors.assert_awaited_once()
         coordinator._run_homekit_triggers.assert_awaited_once()
-        coordinator._process_face_embeddings.assert_awaited_once()
+        coordinator._process_detections.assert_awaited_once()
 
     @pytest.mark.asyncio
     async def test_store_processed_event_accepts_none_thumbnail(self, coordinator, sample_event):
@@ -1628,6 +1752,7 @@ class TestAIProcessingCoordinator:
                 time_pattern_included=False,
                 # Numeric: the coordinator calls round() on this when building context_stats.
                 context_gather_time_ms=12.5,
+                cache_context="",
             )
         )
 
@@ -1685,6 +1810,49 @@ class TestAIProcessingCoordinator:
 
             mock_push.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_post_processing_runs_stages_concurrently_and_commits_once(self, coordinator, mock_services, sample_event):
+        """A slow stage does not hold back the push; every write lands in one unit of work"""
+        order = []
+
+        async def slow_homekit(**kwargs):
+            await asyncio.sleep(0.05)
+            order.append("homekit")
+            return {"motion": True}
+
+        async def push(**kwargs):
+            order.append("push")
+
+        coordinator._run_homekit_triggers = slow_homekit
+        coordinator._send_push_notification = push
+        coordinator._publish_mqtt_event = AsyncMock()
+        coordinator._publish_camera_status_sensors = AsyncMock()
+        coordinator._enrich_event_with_audio = AsyncMock()
+        mock_services["cost_alert_service"].check_and_notify = AsyncMock(return_value=[])
+        mock_services["embedding_service"].build_embedding.return_value = "embedding-row"
+
+        with patch("app.services.post_processing.EventUnitOfWork.commit", autospec=True) as commit:
+            summary = await coordinator._run_post_processing(
+                event=sample_event,
+                event_id="evt-dag",
+                ai_result=Mock(description="A person"),
+                thumbnail_base64="t",
+                embedding_vector=b"vec",
+                final_entity_link_result=None,
+                smart_detection_type="person",
+                objects_detected=["person"],
+                started_at=0.0,
+            )
+
+        assert order == ["push", "homekit"]
+        assert summary["homekit"] == {"motion": True}
+        assert set(summary["stages"]) >= {"push", "mqtt", "homekit", "embedding", "cost_alerts"}
+        assert all(stage["status"] == "ok" for stage in summary["stages"].values())
+        commit.assert_awaited_once()
+        unit_of_work = commit.await_args.args[0]
+        assert unit_of_work.new_rows == ["embedding-row"]
+        assert "post_processing_summary" in unit_of_work.values
+
     # =====================================================================
     # End of comprehensive post-processing + orchestration tests for the fully decoupled coordinator
 
@@ -37,6 +37,7 @@ class TestAudioEventType:
         assert hasattr(AudioEventType, 'GUNSHOT')
         assert hasattr(AudioEventType, 'SCREAM')
         assert hasattr(AudioEventType, 'DOORBELL')
+        assert hasattr(AudioEventType, 'ALARM')
         assert hasattr(AudioEventType, 'OTHER')
 
     def test_event_type_values(self):
@@ -45,6 +46,7 @@ class TestAudioEventType:
         assert AudioEventType.GUNSHOT.value == "gunshot"
         assert AudioEventType.SCREAM.value == "scream"
         assert AudioEventType.DOORBELL.value == "doorbell"
+        assert AudioEventType.ALARM.value == "alarm"
         assert AudioEventType.OTHER.value == "other"
 
     def test_from_string_valid(self):
@@ -190,6 +192,23 @@ class TestMockAudioClassifier:
         assert stats["total_detections"] == 2
         assert stats["detection_rate"] == 1.0
 
+    def test_default_classify_stream_classifies_only_new_samples(self):
+        """Non-streaming classifiers fall back to classify() on audio added since the last call"""
+        from app.services.audio_stream_service import AudioRingBuffer
+
+        classifier = MockAudioClassifier(detection_probability=1.0)
+        buffer = AudioRingBuffer(buffer_seconds=5.0, sample_rate=16000)
+        buffer.add(np.zeros(16000, dtype=np.int16), 0.0)
+
+        assert len(classifier.classify_stream("cam-1", buffer)) == 1
+        assert classifier.classify_stream("cam-1", buffer) == []
+        assert classifier.classify_call_count == 1
+
+        classifier.reset_stream("cam-1")
+
+        # After a reset the stream is read from the oldest retained sample again
+        assert len(classifier.classify_stream("cam-1", buffer)) == 1
+
 
 class TestDeterministicMockClassifier:
     """Tests for DeterministicMockClassifier"""
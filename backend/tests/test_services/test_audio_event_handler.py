@@ -69,6 +69,7 @@ class TestAudioEventHandler:
     def mock_audio_detector(self):
         """Create mock audio event detector"""
         detector = MagicMock(spec=AudioEventDetector)
+        detector.supports_streaming = False
         return detector
 
     @pytest.fixture
@@ -225,6 +226,30 @@ class TestAudioEventHandler:
         mock_db.add.assert_called_once()
         mock_db.commit.assert_called()
 
+    @pytest.mark.asyncio
+    async def test_process_camera_audio_streaming_classifier(self, mock_audio_extractor, mock_audio_detector, mock_db, detection_result):
+        """Streaming classifiers read the ring buffer directly instead of a copied chunk"""
+        handler = AudioEventHandler(
+            audio_extractor=mock_audio_extractor,
+            audio_detector=mock_audio_detector,
+        )
+
+        mock_camera = MagicMock()
+        mock_camera.audio_enabled = True
+        mock_db.query.return_value.filter.return_value.first.return_value = mock_camera
+
+        buffer = MagicMock()
+        buffer.is_empty = False
+        mock_audio_extractor.get_buffer.return_value = buffer
+        mock_audio_detector.supports_streaming = True
+        mock_audio_detector.detect_stream_events.return_value = [detection_result]
+
+        result = await handler.process_camera_audio(mock_db, "camera-123", create_event=True)
+
+        assert result.created is True
+        mock_audio_detector.detect_stream_events.assert_called_once_with("camera-123", buffer, db=mock_db)
+        mock_audio_extractor.get_latest_audio.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_process_camera_audio_no_event_creation(self, mock_audio_extractor, mock_audio_detector, mock_db, audio_chunk, detection_result):
         """Test processing with create_event=False"""
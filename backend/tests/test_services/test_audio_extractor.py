@@ -756,10 +756,9 @@ class TestTrackWhisperUsage:
     @pytest.mark.asyncio
     async def test_track_usage_success(self):
         """P3-5.2 AC5: Tracks successful transcription"""
-        with patch("app.core.database.SessionLocal") as mock_session_class:
-            mock_db = MagicMock()
-            mock_session_class.return_value = mock_db
-
+        with patch(
+            "app.services.ai_cost_and_usage_tracker.get_ai_cost_and_usage_tracker"
+        ) as mock_get_tracker:
             await self.extractor._track_whisper_usage(
                 duration_seconds=10.0,
                 response_time_ms=500,
@@ -767,17 +766,19 @@ class TestTrackWhisperUsage:
                 error=None
             )
 
-            # Verify db.add was called
-            mock_db.add.assert_called_once()
-            mock_db.commit.assert_called_once()
+            mock_tracker = mock_get_tracker.return_value
+            mock_tracker.record_usage.assert_called_once()
+            kwargs = mock_tracker.record_usage.call_args.kwargs
+            assert kwargs["provider"] == "whisper"
+            assert kwargs["success"] is True
+            assert kwargs["analysis_mode"] == "transcription"
 
     @pytest.mark.asyncio
     async def test_track_usage_failure(self):
         """P3-5.2 AC5: Tracks failed transcription"""
-        with patch("app.core.database.SessionLocal") as mock_session_class:
-            mock_db = MagicMock()
-            mock_session_class.return_value = mock_db
-
+        with patch(
+            "app.services.ai_cost_and_usage_tracker.get_ai_cost_and_usage_tracker"
+        ) as mock_get_tracker:
             await self.extractor._track_whisper_usage(
                 duration_seconds=10.0,
                 response_time_ms=500,
@@ -785,16 +786,16 @@ class TestTrackWhisperUsage:
                 error="API error"
             )
 
-            mock_db.add.assert_called_once()
-            mock_db.commit.assert_called_once()
+            kwargs = mock_get_tracker.return_value.record_usage.call_args.kwargs
+            assert kwargs["success"] is False
+            assert kwargs["error"] == "API error"
 
     @pytest.mark.asyncio
     async def test_track_usage_cost_calculation(self):
         """P3-5.2 AC5: Cost is calculated correctly ($0.006/minute)"""
-        with patch("app.core.database.SessionLocal") as mock_session_class:
-            mock_db = MagicMock()
-            mock_session_class.return_value = mock_db
-
+        with patch(
+            "app.services.ai_cost_and_usage_tracker.get_ai_cost_and_usage_tracker"
+        ) as mock_get_tracker:
             # 60 seconds = 1 minute = $0.006
             await self.extractor._track_whisper_usage(
                 duration_seconds=60.0,
@@ -803,11 +804,8 @@ class TestTrackWhisperUsage:
                 error=None
             )
 
-            # Get the AIUsage object that was added
-            call_args = mock_db.add.call_args
-            usage_obj = call_args[0][0]
-
-            assert abs(usage_obj.cost_estimate - 0.006) < 0.0001
+            kwargs = mock_get_tracker.return_value.record_usage.call_args.kwargs
+            assert abs(kwargs["cost_estimate"] - 0.006) < 0.0001
 
 
 class TestTranscribe:
@@ -115,6 +115,114 @@ class TestAudioRingBuffer:
         assert buffer.is_empty
         assert buffer.duration_seconds == 0.0
 
+    def test_wraparound_preserves_order(self):
+        """Test reads across the wrap point return samples in write order"""
+        buffer = AudioRingBuffer(buffer_seconds=1.0, sample_rate=1000)
+
+        # 2.5 buffers worth of a monotonically increasing signal in odd-sized chunks
+        written = np.arange(2500, dtype=np.int16)
+        for start in range(0, 2500, 333):
+            buffer.add(written[start:start + 333], time.time())
+
+        chunk = buffer.get_all()
+        assert len(chunk.samples) == 1000
+        np.testing.assert_array_equal(chunk.samples, written[-1000:])
+
+        latest = buffer.get_latest(duration_seconds=0.25)
+        np.testing.assert_array_equal(latest.samples, written[-250:])
+
+    def test_oversized_chunk_keeps_most_recent_samples(self):
+        """Test a single chunk larger than the buffer keeps only its tail"""
+        buffer = AudioRingBuffer(buffer_seconds=1.0, sample_rate=1000)
+
+        samples = np.arange(1500, dtype=np.int16)
+        buffer.add(samples, time.time())
+
+        assert buffer.duration_seconds == pytest.approx(1.0)
+        np.testing.assert_array_equal(buffer.get_all().samples, samples[-1000:])
+
+    def test_returned_samples_are_not_overwritten(self):
+        """Test chunks returned to callers are independent of later writes"""
+        buffer = AudioRingBuffer(buffer_seconds=1.0, sample_rate=1000)
+        buffer.add(np.full(1000, 7, dtype=np.int16), time.time())
+
+        chunk = buffer.get_latest(duration_seconds=0.5)
+        buffer.add(np.full(1000, -1, dtype=np.int16), time.time())
+
+        assert np.all(chunk.samples == 7)
+
+    def test_clear_then_add_only_returns_new_samples(self):
+        """Test samples written before clear() are not returned afterwards"""
+        buffer = AudioRingBuffer(buffer_seconds=1.0, sample_rate=1000)
+        buffer.add(np.full(800, 1, dtype=np.int16), time.time())
+        buffer.clear()
+        buffer.add(np.full(100, 2, dtype=np.int16), time.time())
+
+        chunk = buffer.get_all()
+        assert len(chunk.samples) == 100
+        assert np.all(chunk.samples == 2)
+
+    def test_read_since_returns_only_new_samples(self):
+        """Test incremental reads resume from the returned position"""
+        buffer = AudioRingBuffer(buffer_seconds=1.0, sample_rate=1000)
+        buffer.add(np.arange(300, dtype=np.int16), time.time())
+
+        samples, position = buffer.read_since(0)
+        assert position == buffer.position == 300
+        np.testing.assert_array_equal(samples, np.arange(300))
+
+        buffer.add(np.arange(300, 400, dtype=np.int16), time.time())
+        samples, position = buffer.read_since(position)
+        assert position == 400
+        np.testing.assert_array_equal(samples, np.arange(300, 400))
+
+    def test_read_since_reports_gap_when_overrun(self):
+        """Test a reader that fell behind gets the oldest retained samples"""
+        buffer = AudioRingBuffer(buffer_seconds=1.0, sample_rate=1000)
+        buffer.add(np.arange(2500, dtype=np.int16), time.time())
+
+        samples, position = buffer.read_since(100)
+
+        assert position == 2500
+        assert len(samples) == 1000
+        assert position - len(samples) > 100  # Caller can detect the gap
+
+    def test_concurrent_readers_see_contiguous_samples(self):
+        """Test lock-free readers never observe torn data from the single writer"""
+        import threading
+
+        buffer = AudioRingBuffer(buffer_seconds=0.1, sample_rate=1000)
+        stop = threading.Event()
+        errors = []
+
+        def writer():
+            value = 0
+            while not stop.is_set():
+                chunk = (np.arange(value, value + 37) % 30000).astype(np.int16)
+                buffer.add(chunk, time.time())
+                value = (value + 37) % 30000
+
+        def reader():
+            for _ in range(2000):
+                chunk = buffer.get_latest(duration_seconds=0.05)
+                if chunk is None:
+                    continue
+                diffs = np.diff(chunk.samples.astype(np.int32)) % 30000
+                if not np.all(diffs == 1):
+                    errors.append(chunk.samples)
+
+        writer_thread = threading.Thread(target=writer)
+        readers = [threading.Thread(target=reader) for _ in range(3)]
+        writer_thread.start()
+        for t in readers:
+            t.start()
+        for t in readers:
+            t.join()
+        stop.set()
+        writer_thread.join()
+
+        assert not errors
+
 
 class TestAudioStreamExtractor:
     """Tests for AudioStreamExtractor class"""
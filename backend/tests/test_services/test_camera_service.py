@@ -3,6 +3,7 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 import time
 import threading
+import numpy as np
 
 from app.services.camera_service import CameraService
 from app.models.camera import Camera
@@ -123,6 +124,19 @@ class TestCameraService:
         # Should remove the worker from tracking
         assert camera_id not in camera_service._workers
 
+    def test_stop_camera_resets_audio_classifier_stream(self, camera_service):
+        """Stopping a camera drops its audio buffer and the classifier's per-stream state"""
+        camera_id = "test-camera-123"
+        camera_service._workers[camera_id] = Mock()
+        camera_service._audio_extractor = Mock()
+        detector = Mock()
+
+        with patch("app.services.camera_service.get_audio_event_detector", return_value=detector):
+            camera_service.stop_camera(camera_id)
+
+        camera_service._audio_extractor.remove_buffer.assert_called_once_with(camera_id)
+        detector.reset_stream.assert_called_once_with(camera_id)
+
     def test_stop_camera_not_running(self, camera_service):
         """Stopping non-running camera should not raise error"""
         # Should not raise exception
@@ -205,6 +219,29 @@ class TestCameraService:
         assert status["error"] == "Connection failed"
         assert status["last_frame_time"] is None
 
+    def test_latest_frame_sequence(self):
+        """Each stored frame advances the sequence; clearing the frame keeps it."""
+        from app.services.camera_capture_worker import CameraCaptureWorker
+
+        camera = Mock(spec=Camera)
+        camera.id = "test-camera"
+        camera.type = "rtsp"
+        worker = CameraCaptureWorker(camera)
+
+        assert worker.get_latest_frame_seq() == 0
+
+        worker._process_frame(np.zeros((4, 4, 3), dtype=np.uint8))
+        worker._process_frame(np.ones((4, 4, 3), dtype=np.uint8))
+        frame, seq = worker.get_latest_frame_with_seq()
+
+        assert seq == 2 == worker.get_latest_frame_seq()
+        assert frame[0, 0, 0] == 1
+
+        worker._release_resources()
+        assert worker.get_latest_frame_seq() == 0
+        worker._process_frame(np.zeros((4, 4, 3), dtype=np.uint8))
+        assert worker.get_latest_frame_seq() == 3
+
     def test_get_camera_status_not_found(self, camera_service):
         """get_camera_status returns a 'stopped' status dict for an unknown camera.
 
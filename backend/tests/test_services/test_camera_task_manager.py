@@ -2,10 +2,13 @@
 import pytest
 import asyncio
 from unittest.mock import Mock, AsyncMock, patch
+import threading
 import time
+from datetime import datetime, timezone
 
 from app.services.camera_task_manager import CameraTaskManager
 from app.models.camera import Camera
+from app.models.motion_event import MotionEvent
 
 
 class TestCameraTaskManager:
@@ -24,7 +27,7 @@ class TestCameraTaskManager:
     def mock_motion_service(self):
         """Mock MotionDetectionService"""
         service = Mock()
-        service.process_frame.return_value = {"motion_detected": False}
+        service.process_frame.return_value = None
         return service
 
     @pytest.fixture
@@ -151,6 +154,59 @@ class TestCameraTaskManager:
 
         await task_manager.stop_all()
 
+    @pytest.mark.asyncio
+    async def test_motion_event_is_queued_with_its_bounding_box(
+        self, task_manager, sample_camera, mock_motion_service, mock_queue_event
+    ):
+        """A stored MotionEvent becomes a ProcessingEvent carrying its box as motion_bbox"""
+        motion_event = MotionEvent(
+            id="motion-1",
+            camera_id="cam-123",
+            timestamp=datetime(2026, 1, 1, tzinfo=timezone.utc),
+            confidence=0.42,
+            algorithm_used="mog2",
+            bounding_box="[10, 20, 30, 40]",
+        )
+        mock_motion_service.process_frame.side_effect = [motion_event, None, None, None, None]
+
+        await task_manager.start_monitoring(sample_camera)
+        for _ in range(50):
+            if mock_queue_event.await_count:
+                break
+            await asyncio.sleep(0.02)
+        await task_manager.stop_all()
+
+        camera_id, frame, camera, db = mock_motion_service.process_frame.call_args_list[0].args
+        assert (camera_id, frame, camera) == ("cam-123", b"fake-frame-data", sample_camera)
+        assert db is not None
+        queued = mock_queue_event.await_args.args[0]
+        assert queued.camera_id == "cam-123"
+        assert queued.timestamp == motion_event.timestamp
+        assert queued.metadata["motion_bbox"] == [10, 20, 30, 40]
+        assert queued.metadata["motion_confidence"] == 0.42
+        assert queued.metadata["motion_event_id"] == "motion-1"
+
+    @pytest.mark.asyncio
+    async def test_motion_detection_runs_off_the_event_loop(
+        self, task_manager, sample_camera, mock_motion_service
+    ):
+        """process_frame does blocking CV and DB work, so it must not run on the loop thread"""
+        loop_thread = threading.get_ident()
+        detection_threads = []
+        mock_motion_service.process_frame.side_effect = (
+            lambda *args: detection_threads.append(threading.get_ident())
+        )
+
+        await task_manager.start_monitoring(sample_camera)
+        for _ in range(50):
+            if detection_threads:
+                break
+            await asyncio.sleep(0.02)
+        await task_manager.stop_all()
+
+        assert detection_threads
+        assert loop_thread not in detection_threads
+
     @pytest.mark.asyncio
     async def test_cooldown_tracking(self, task_manager, sample_camera):
         """Cooldown helpers should work"""
@@ -0,0 +1,286 @@
+"""
+Tests for cluster mode: hash-ring sharding, database leases, the database
+pub/sub backend, ClusterService messaging and a multi-process cluster on a
+shared SQLite file.
+"""
+import asyncio
+import json
+import os
+import subprocess
+import sys
+import textwrap
+import time
+from collections import Counter
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.models.cluster import ClusterLease, ClusterMember, ClusterMessage
+from app.services.cluster_pubsub import DatabasePubSub, LocalPubSub
+from app.services.cluster_service import ClusterNode, ClusterService, HashRing
+from app.services.description_cache_service import get_description_cache_service
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+CLUSTER_TABLES = [ClusterMember.__table__, ClusterLease.__table__, ClusterMessage.__table__]
+
+
+@pytest.fixture
+def cluster_db(tmp_path):
+    url = f"sqlite:///{tmp_path}/cluster.db"
+    engine = create_engine(url, connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine, tables=CLUSTER_TABLES)
+    yield url, sessionmaker(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture
+def cluster_service():
+    service = ClusterService()
+    saved = (service.enabled, service.node, service.pubsub, service._loop, service._session_factory)
+    yield service
+    service.enabled, service.node, service.pubsub, service._loop, service._session_factory = saved
+
+
+class TestHashRing:
+    def test_keys_spread_across_members(self):
+        ring = HashRing(["a", "b", "c"], vnodes=64)
+        owners = Counter(ring.owner(f"camera:{i}") for i in range(3000))
+
+        assert set(owners) == {"a", "b", "c"}
+        assert all(600 < count < 1400 for count in owners.values())
+
+    def test_join_only_moves_keys_to_new_member(self):
+        keys = [f"camera:{i}" for i in range(2000)]
+        before = HashRing(["a", "b", "c"])
+        after = HashRing(["a", "b", "c", "d"])
+
+        moved = [key for key in keys if before.owner(key) != after.owner(key)]
+
+        assert all(after.owner(key) == "d" for key in moved)
+        assert 0.15 < len(moved) / len(keys) < 0.35
+
+    def test_empty_ring(self):
+        assert HashRing([]).owner("camera:1") is None
+
+
+class TestClusterNode:
+    def test_heartbeat_tracks_membership(self, cluster_db):
+        _, sessions = cluster_db
+        a = ClusterNode("a", sessions, member_ttl_seconds=10)
+        b = ClusterNode("b", sessions, member_ttl_seconds=10)
+        now = time.time()
+
+        a.heartbeat(now)
+        assert b.heartbeat(now) is True
+        assert a.heartbeat(now + 1) is True
+        assert a.members == b.members == ["a", "b"]
+
+        keys = [f"camera:{i}" for i in range(100)]
+        owned_a = {key for key in keys if a.owns(key)}
+        owned_b = {key for key in keys if b.owns(key)}
+        assert owned_a and owned_b
+        assert owned_a.isdisjoint(owned_b) and owned_a | owned_b == set(keys)
+
+        # b stops heartbeating: a takes over all keys once b's row is stale
+        assert a.heartbeat(now + 12) is True
+        assert a.members == ["a"]
+        assert all(a.owns(key) for key in keys)
+
+    def test_single_leader_and_failover(self, cluster_db):
+        _, sessions = cluster_db
+        a = ClusterNode("a", sessions, lease_seconds=30)
+        b = ClusterNode("b", sessions, lease_seconds=30)
+        now = time.time()
+
+        assert a.try_acquire("scheduler", now) is True
+        assert b.try_acquire("scheduler", now) is False
+        assert b.lease_holders["scheduler"] == "a"
+        assert a.try_acquire("scheduler", now + 10) is True  # renewal
+        assert a.holds("scheduler") and not b.holds("scheduler")
+
+        # a stops renewing; b takes over after the lease expires
+        assert b.try_acquire("scheduler", now + 41) is True
+        assert a.try_acquire("scheduler", now + 42) is False
+        assert not a.holds("scheduler") and b.holds("scheduler")
+        with sessions() as db:
+            lease = db.get(ClusterLease, "scheduler")
+            assert lease.holder == "b" and lease.acquired_at == now + 41
+
+    def test_leave_releases_lease(self, cluster_db):
+        _, sessions = cluster_db
+        a = ClusterNode("a", sessions)
+        b = ClusterNode("b", sessions)
+        a.heartbeat()
+        b.heartbeat()
+        assert a.holds() and not b.holds()
+
+        a.leave()
+        b.heartbeat()
+
+        assert b.holds()
+        assert b.members == ["b"]
+
+
+class TestDatabasePubSub:
+    @pytest.mark.asyncio
+    async def test_delivers_to_other_instances_only(self, cluster_db):
+        _, sessions = cluster_db
+        received = {"a": [], "b": []}
+
+        def handler(name):
+            async def handle(channel, origin, payload):
+                received[name].append((channel, origin, payload))
+            return handle
+
+        a = DatabasePubSub("a", sessions, poll_seconds=0.02)
+        b = DatabasePubSub("b", sessions, poll_seconds=0.02)
+        await a.start(handler("a"))
+        await b.start(handler("b"))
+        try:
+            await a.publish("websocket", {"message": {"type": "PING"}})
+            for _ in range(100):
+                if received["b"]:
+                    break
+                await asyncio.sleep(0.02)
+        finally:
+            await a.stop()
+            await b.stop()
+
+        assert received["b"] == [("websocket", "a", {"message": {"type": "PING"}})]
+        assert received["a"] == []
+        assert a.cleanup(sessions, max_age_seconds=-1) == 1
+
+
+class TestClusterService:
+    @pytest.mark.asyncio
+    async def test_disabled_is_a_single_replica(self, cluster_service):
+        cluster_service.enabled = False
+        cluster_service.node = None
+        calls = []
+
+        async def job():
+            calls.append(1)
+
+        await cluster_service.leader_only(job)()
+
+        assert cluster_service.owns("camera", "any")
+        assert cluster_service.is_leader()
+        assert calls == [1]
+        assert cluster_service.get_status()["members"] == [cluster_service.instance_id]
+
+    @pytest.mark.asyncio
+    async def test_follower_skips_leader_jobs(self, cluster_db, cluster_service):
+        _, sessions = cluster_db
+        ClusterNode("other", sessions).heartbeat()
+        cluster_service.enabled = True
+        cluster_service.node = ClusterNode(cluster_service.instance_id, sessions)
+        cluster_service.node.heartbeat()
+        calls = []
+
+        async def job():
+            calls.append(1)
+
+        await cluster_service.leader_only(job)()
+
+        assert not cluster_service.is_leader()
+        assert calls == []
+        assert cluster_service.get_status()["leader_id"] == "other"
+
+    @pytest.mark.asyncio
+    async def test_invalidation_published_but_not_echoed(self, cluster_db, cluster_service):
+        _, sessions = cluster_db
+        cluster_service.enabled = True
+        cluster_service.node = ClusterNode(cluster_service.instance_id, sessions)
+        cluster_service.pubsub = LocalPubSub(cluster_service.instance_id)
+        cluster_service._loop = asyncio.get_running_loop()
+        cache = get_description_cache_service()
+        cache._camera_enabled["cam-1"] = True
+
+        cache.invalidate_camera("cam-1")
+        await asyncio.sleep(0)
+        assert cluster_service.pubsub.published == 1
+
+        # Applying another replica's invalidation must not publish it again
+        cache._camera_enabled["cam-1"] = True
+        await cluster_service._dispatch(
+            "cluster.invalidate", "other", {"cache": "description_cache.camera", "key": "cam-1"}
+        )
+        await asyncio.sleep(0)
+
+        assert "cam-1" not in cache._camera_enabled
+        assert cluster_service.pubsub.published == 1
+
+
+NODE_SCRIPT = textwrap.dedent("""
+    import asyncio, json, sys, time
+
+    from app.core.database import SessionLocal
+    from app.services.cluster_pubsub import DatabasePubSub
+    from app.services.cluster_service import ClusterNode
+
+    instance_id, expected, output = sys.argv[1], int(sys.argv[2]), sys.argv[3]
+
+    async def main():
+        received = []
+
+        async def handle(channel, origin, payload):
+            received.append(origin)
+
+        pubsub = DatabasePubSub(instance_id, SessionLocal, poll_seconds=0.05)
+        await pubsub.start(handle)
+        node = ClusterNode(instance_id, SessionLocal, lease_seconds=10, member_ttl_seconds=10)
+        deadline = time.time() + 60
+        published = False
+        while time.time() < deadline:
+            await asyncio.to_thread(node.heartbeat)
+            if len(node.members) == expected and not published:
+                await pubsub.publish("hello", {"from": instance_id})
+                published = True
+            if published and len(set(received)) == expected - 1:
+                break
+            await asyncio.sleep(0.1)
+        # Let late joiners settle the leader lease before reporting
+        await asyncio.sleep(0.5)
+        await asyncio.to_thread(node.heartbeat)
+        await pubsub.stop()
+        keys = [f"camera:{i}" for i in range(60)]
+        with open(output, "w") as f:
+            json.dump({
+                "members": node.members,
+                "leader": node.holds(),
+                "owned": [key for key in keys if node.owns(key)],
+                "received": sorted(set(received)),
+            }, f)
+
+    asyncio.run(main())
+""")
+
+
+class TestMultiProcessCluster:
+    def test_processes_share_one_leader_and_disjoint_shards(self, cluster_db, tmp_path):
+        url, _ = cluster_db
+        names = ["node-a", "node-b", "node-c"]
+        env = {**os.environ, "DATABASE_URL": url, "PYTHONPATH": str(BACKEND_DIR)}
+        procs = [
+            subprocess.Popen(
+                [sys.executable, "-c", NODE_SCRIPT, name, str(len(names)), str(tmp_path / f"{name}.json")],
+                cwd=BACKEND_DIR, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+            )
+            for name in names
+        ]
+        for proc in procs:
+            _, stderr = proc.communicate(timeout=120)
+            assert proc.returncode == 0, stderr.decode()[-2000:]
+
+        results = {name: json.loads((tmp_path / f"{name}.json").read_text()) for name in names}
+
+        assert all(result["members"] == names for result in results.values())
+        assert sum(result["leader"] for result in results.values()) == 1
+        owned = [set(result["owned"]) for result in results.values()]
+        assert all(owned)
+        assert sum(len(keys) for keys in owned) == len(set().union(*owned)) == 60
+        for name, result in results.items():
+            assert result["received"] == sorted(set(names) - {name})
@@ -720,3 +720,55 @@ class TestBuildContextEnhancedPrompt:
         assert "incorporate this context naturally" in result.prompt
         # Base prompt should come first
         assert result.prompt.index(base_prompt) < result.prompt.index("HISTORICAL CONTEXT:")
+
+
+class TestCacheContext:
+    """cache_context carries only the context that is stable between events."""
+
+    @pytest.mark.asyncio
+    async def test_excludes_similar_events_and_time_pattern(self):
+        from app.services.mcp_context import (
+            AIContext, CameraContext, FeedbackContext, MCPContextProvider, TimePatternContext,
+        )
+
+        mock_db = MagicMock()
+        mock_db.query.return_value.filter.return_value.first.return_value = None
+        mock_db.query.return_value.filter.return_value.scalar.return_value = 0
+        now = datetime.now(timezone.utc)
+
+        mcp_provider = MCPContextProvider()
+        mcp_provider.get_context = AsyncMock(return_value=AIContext(
+            feedback=FeedbackContext(
+                accuracy_rate=0.9, total_feedback=10, common_corrections=[], recent_negative_reasons=[]
+            ),
+            camera=CameraContext(
+                camera_id="cam1", location_hint="Front Door", typical_objects=[], false_positive_patterns=[]
+            ),
+            time_pattern=TimePatternContext(hour=now.hour, typical_activity_level="low", is_unusual=True, typical_event_count=0.5),
+        ))
+        similarity_service = MagicMock()
+        similarity_service.find_similar_events = AsyncMock(return_value=[
+            SimilarEvent(
+                event_id="e1", similarity_score=0.88, timestamp=now - timedelta(hours=5),
+                description="Person at door", camera_id="cam1", thumbnail_url=None, camera_name="Front Door",
+            ),
+        ])
+        service = ContextEnhancedPromptService(
+            entity_service=MagicMock(),
+            similarity_service=similarity_service,
+            mcp_context_provider=mcp_provider,
+        )
+
+        result = await service.build_context_enhanced_prompt(
+            db=mock_db,
+            event_id=str(uuid.uuid4()),
+            base_prompt="Describe the image",
+            camera_id="cam1",
+            event_time=now,
+        )
+
+        assert "Similar events" in result.prompt
+        assert "Front Door" in result.cache_context
+        assert "accuracy" in result.cache_context
+        assert "Similar events" not in result.cache_context
+        assert "Time of day" not in result.cache_context
@@ -24,6 +24,7 @@ import pytest
 
 from app.services.correlation_service import (
     BufferedEvent,
+    CorrelationBuffer,
     CorrelationService,
     DEFAULT_BUFFER_MAX_AGE_SECONDS,
     DEFAULT_TIME_WINDOW_SECONDS,
@@ -440,6 +441,140 @@ class TestProcessEvent:
         assert result is None
 
 
+# ============================================================================
+# Unit Tests: Time-Bucketed Buffer
+# ============================================================================
+
+def linear_candidates(entries, event, window_seconds):
+    """Reference implementation: the original full-buffer scan."""
+    return [
+        buffered for buffer_time, buffered in entries
+        if buffered.id != event.id
+        and buffered.camera_id != event.camera_id
+        and abs((buffer_time - event.timestamp).total_seconds()) <= window_seconds
+        and buffered.smart_detection_type
+        and event.smart_detection_type
+        and buffered.smart_detection_type.lower() == event.smart_detection_type.lower()
+    ]
+
+
+class TestCorrelationBuffer:
+    """Tests for the time-bucketed, type-indexed buffer."""
+
+    def test_lookup_matches_linear_scan(self, correlation_service):
+        """Bucketed lookup returns exactly what a full scan would."""
+        import random
+
+        rng = random.Random(7)
+        now = datetime.now(timezone.utc)
+        types = ["person", "Person", "vehicle", "package", None]
+        entries = []
+        for i in range(600):
+            ts = now - timedelta(seconds=rng.uniform(0, 55))
+            event = make_buffered_event(
+                camera_id=f"cam{rng.randrange(12)}",
+                smart_detection_type=rng.choice(types),
+                timestamp=ts,
+                event_id=f"event-{i}",
+            )
+            entries.append((ts, event))
+            correlation_service._buffer.append((ts, event))
+
+        for i in range(50):
+            probe = make_buffered_event(
+                camera_id=f"cam{rng.randrange(12)}",
+                smart_detection_type=rng.choice(types),
+                timestamp=now - timedelta(seconds=rng.uniform(0, 55)),
+            )
+            found = correlation_service.find_correlation_candidates(probe)
+            expected = linear_candidates(entries, probe, correlation_service.time_window_seconds)
+            assert sorted(e.id for e in found) == sorted(e.id for e in expected)
+
+    def test_expire_drops_whole_buckets_and_trims_the_oldest(self):
+        buffer = CorrelationBuffer(bucket_seconds=10)
+        base = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        for offset in (0, 5, 12, 18, 31):
+            ts = base + timedelta(seconds=offset)
+            buffer.append((ts, make_buffered_event(timestamp=ts, event_id=f"e{offset}")))
+
+        removed = buffer.expire(base + timedelta(seconds=15))
+
+        assert sorted(e.id for e in removed) == ["e0", "e12", "e5"]
+        assert len(buffer) == 2
+        assert buffer.get("e5") is None
+        assert buffer.oldest_time() == base + timedelta(seconds=18)
+        assert buffer.newest_time() == base + timedelta(seconds=31)
+
+    def test_group_is_forgotten_when_its_members_expire(self, correlation_service):
+        old = datetime.now(timezone.utc) - timedelta(seconds=120)
+        event = make_buffered_event(timestamp=old, event_id="old-event")
+        correlation_service._buffer.append((old, event))
+        correlation_service.update_buffer_with_correlation("old-event", "group-1")
+        assert "group-1" in correlation_service._group_members
+
+        correlation_service._cleanup_buffer()
+
+        assert "group-1" not in correlation_service._group_members
+
+
+class TestGroupWriteBatching:
+    """A burst that forms one group is written with one UPDATE."""
+
+    @pytest.mark.asyncio
+    async def test_burst_is_written_once_per_group(self, correlation_service):
+        now = datetime.now(timezone.utc)
+        events = [
+            make_mock_event(camera_id=f"cam{i}", timestamp=now + timedelta(milliseconds=100 * i))
+            for i in range(6)
+        ]
+
+        with patch.object(correlation_service, "update_correlation_in_db", new_callable=AsyncMock) as mock_update:
+            mock_update.return_value = 6
+            groups = await asyncio.gather(*(correlation_service.process_event(e) for e in events))
+
+        assert groups[0] is None  # first event had nothing to correlate with
+        assert len(set(groups[1:])) == 1
+        mock_update.assert_awaited_once()
+        event_ids, group_id = mock_update.await_args.args
+        assert group_id == groups[1]
+        assert sorted(event_ids) == sorted(e.id for e in events)
+
+    @pytest.mark.asyncio
+    async def test_group_update_goes_through_single_writer(self, tmp_path):
+        from sqlalchemy.orm import sessionmaker
+
+        from app.core.database import Base, create_sqlite_writer_engine
+        from app.models.event import Event
+        from app.services.database_writer import DatabaseWriter
+        from tests.conftest import make_camera, make_event
+
+        engine = create_sqlite_writer_engine(f"sqlite:///{tmp_path / 'correlation.db'}")
+        Base.metadata.create_all(bind=engine)
+        session = sessionmaker(bind=engine)()
+        camera = make_camera(db_session=session)
+        event_ids = [make_event(db_session=session, camera_id=camera.id).id for _ in range(3)]
+        session.close()
+
+        writer = DatabaseWriter(session_factory=sessionmaker(bind=engine, autoflush=False, expire_on_commit=False))
+        writer.start()
+        try:
+            updated = await CorrelationService().update_correlation_in_db(event_ids, "group-1")
+            stats = writer.get_stats()
+        finally:
+            writer.stop()
+
+        session = sessionmaker(bind=engine)()
+        try:
+            rows = session.query(Event).filter(Event.id.in_(event_ids)).all()
+            assert {row.correlation_group_id for row in rows} == {"group-1"}
+            assert json.loads(rows[0].correlated_event_ids) == event_ids
+        finally:
+            session.close()
+            engine.dispose()
+        assert updated == 3
+        assert stats["writes_committed"] == 1
+
+
 # ============================================================================
 # Performance Tests (AC5)
 # ============================================================================
@@ -398,6 +398,23 @@ class TestCostAlertService:
 
         assert len(alerts) == 0
 
+    def test_stage_notifications_flushes_without_committing(self, service, mock_db, mock_cap_status_80_percent):
+        """Test stage_notifications leaves the commit to the caller's transaction."""
+        mock_db.query.return_value.filter.return_value.first.return_value = None
+
+        mock_notification = Mock()
+        mock_notification.to_dict.return_value = {"id": "test-notification-id"}
+
+        with patch.object(service._cost_cap_service, 'get_cap_status', return_value=mock_cap_status_80_percent):
+            with patch('app.models.system_notification.SystemNotification', return_value=mock_notification):
+                staged = service.stage_notifications(mock_db)
+
+        assert len(staged) >= 1
+        assert staged[0][1] == {"id": "test-notification-id"}
+        mock_db.add.assert_any_call(mock_notification)
+        mock_db.flush.assert_called()
+        mock_db.commit.assert_not_called()
+
     # =========================================================================
     # Singleton Tests
     # =========================================================================
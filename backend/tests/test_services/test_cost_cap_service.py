@@ -90,6 +90,23 @@ class TestCostCapService:
 
         assert cost == Decimal("0")
 
+    def test_cluster_mode_uses_cost_across_replicas(self, service, mock_db, mock_tracker):
+        """In cluster mode caps are checked against every replica's spend."""
+        mock_tracker.get_daily_cost.return_value = 1.0
+        mock_tracker.get_cluster_cost.side_effect = lambda period: {"daily": 3.0, "monthly": 30.0}[period]
+        mock_db.query.return_value.filter.return_value.first.return_value = SystemSetting(
+            key=SETTING_DAILY_CAP, value="2.00"
+        )
+
+        with patch("app.services.cost_cap_service.get_cluster_service") as mock_cluster:
+            mock_cluster.return_value.enabled = True
+            status = service.get_cap_status(mock_db, use_cache=False)
+
+        assert status.daily_cost == 3.0
+        assert status.monthly_cost == 30.0
+        assert status.is_paused and status.pause_reason == "cost_cap_daily"
+        mock_tracker.get_daily_cost.assert_not_called()
+
     # =========================================================================
     # Get/Set Cap Settings Tests
     # =========================================================================
@@ -0,0 +1,142 @@
+"""Tests for the SQLite production profile and the single-writer queue."""
+import threading
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import (
+    Base,
+    create_sqlite_read_engine,
+    create_sqlite_writer_engine,
+)
+from app.models.camera import Camera
+from app.services.database_writer import DatabaseWriter, get_database_writer
+
+
+@pytest.fixture
+def db_url(tmp_path):
+    url = f"sqlite:///{tmp_path / 'writer.db'}"
+    engine = create_sqlite_writer_engine(url)
+    Base.metadata.create_all(bind=engine)
+    engine.dispose()
+    return url
+
+
+@pytest.fixture
+def writer_engine(db_url):
+    engine = create_sqlite_writer_engine(db_url)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def read_engine(db_url):
+    engine = create_sqlite_read_engine(db_url, pool_size=2)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def writer(writer_engine):
+    """Started writer with a generous batch window so tests can fill a group."""
+    session_factory = sessionmaker(bind=writer_engine, autoflush=False, expire_on_commit=False)
+    writer = DatabaseWriter(session_factory=session_factory, max_batch=16, max_wait_ms=50)
+    writer.start()
+    yield writer
+    writer.stop()
+
+
+def _add_camera(name):
+    def write(session):
+        camera = Camera(name=name, type="rtsp", rtsp_url="rtsp://example/stream")
+        session.add(camera)
+        return name
+    return write
+
+
+def _camera_names(read_engine):
+    with read_engine.connect() as conn:
+        return sorted(row[0] for row in conn.execute(text("SELECT name FROM cameras")))
+
+
+class TestSqlitePragmas:
+    def test_writer_connection_uses_production_profile(self, writer_engine):
+        with writer_engine.connect() as conn:
+            assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+            assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1  # NORMAL
+            assert conn.exec_driver_sql("PRAGMA busy_timeout").scalar() == 5000
+            assert conn.exec_driver_sql("PRAGMA cache_size").scalar() == -65536
+
+    def test_read_pool_rejects_writes(self, read_engine):
+        with read_engine.connect() as conn:
+            with pytest.raises(OperationalError):
+                conn.execute(text("DELETE FROM cameras"))
+
+
+class TestDatabaseWriter:
+    def test_submit_requires_running_writer(self, writer_engine):
+        writer = DatabaseWriter(session_factory=sessionmaker(bind=writer_engine))
+
+        assert not writer.is_running
+        with pytest.raises(RuntimeError):
+            writer.submit(_add_camera("cam"))
+
+    def test_concurrent_writes_are_group_committed(self, writer, read_engine):
+        barrier = threading.Barrier(8)
+        futures = []
+        lock = threading.Lock()
+
+        def produce(i):
+            barrier.wait()
+            future = writer.submit(_add_camera(f"cam-{i}"))
+            with lock:
+                futures.append(future)
+
+        threads = [threading.Thread(target=produce, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        results = sorted(f.result(timeout=5) for f in futures)
+
+        assert results == sorted(f"cam-{i}" for i in range(8))
+        assert _camera_names(read_engine) == results
+        stats = writer.get_stats()
+        assert stats["writes_committed"] == 8
+        assert stats["batches_committed"] < 8
+        assert stats["largest_batch"] > 1
+
+    def test_failing_item_does_not_poison_its_batch(self, writer, read_engine):
+        def broken(session):
+            session.add(Camera(name=None, type="rtsp"))
+
+        ok_before = writer.submit(_add_camera("before"))
+        bad = writer.submit(broken)
+        ok_after = writer.submit(_add_camera("after"))
+
+        assert ok_before.result(timeout=5) == "before"
+        assert ok_after.result(timeout=5) == "after"
+        with pytest.raises(Exception):
+            bad.result(timeout=5)
+        assert _camera_names(read_engine) == ["after", "before"]
+        assert writer.get_stats()["writes_failed"] == 1
+
+    @pytest.mark.asyncio
+    async def test_run_awaits_committed_result(self, writer, read_engine):
+        assert await writer.run(_add_camera("async-cam")) == "async-cam"
+        assert _camera_names(read_engine) == ["async-cam"]
+
+    def test_stop_commits_queued_writes(self, writer, read_engine):
+        futures = [writer.submit(_add_camera(f"cam-{i}")) for i in range(20)]
+
+        writer.stop()
+
+        assert all(f.done() and f.exception() is None for f in futures)
+        assert len(_camera_names(read_engine)) == 20
+        assert not writer.is_running
+
+    def test_singleton_accessor(self, writer):
+        assert get_database_writer() is writer
@@ -0,0 +1,299 @@
+"""
+Tests for the perceptual-dedup AI description cache and its use in
+AIProcessingCoordinator.
+"""
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import cv2
+import numpy as np
+import pytest
+
+from app.services.ai_processing_coordinator import AIProcessingCoordinator
+from app.services.ai_types import AIResult
+from app.services.description_cache_service import (
+    DescriptionCacheService,
+    _hash_distance,
+    description_context_key,
+    frame_hash,
+    get_description_cache_service,
+    reset_description_cache_service,
+)
+from app.services.event_processor import ProcessingEvent
+
+T0 = datetime(2026, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+EMBEDDING = np.ones(512, dtype=np.float32)
+
+
+def scene(seed: int = 0, noise: int = 0, with_person: bool = False) -> np.ndarray:
+    """A textured 'yard' frame; noise simulates sensor/JPEG jitter."""
+    rng = np.random.default_rng(seed)
+    base = np.random.default_rng(42).integers(0, 255, (9, 16, 3), dtype=np.uint8)
+    frame = cv2.resize(base, (640, 360), interpolation=cv2.INTER_CUBIC).astype(np.int16)
+    if noise:
+        frame += rng.integers(-noise, noise + 1, frame.shape, dtype=np.int16)
+    frame = np.clip(frame, 0, 255).astype(np.uint8)
+    if with_person:
+        cv2.rectangle(frame, (200, 60), (330, 350), (20, 20, 20), -1)
+    return frame
+
+
+def provider_result(description: str = "A tree sways in the front yard.", cost: float = 0.002) -> AIResult:
+    return AIResult(
+        description=description,
+        confidence=80,
+        objects_detected=["unknown"],
+        provider="openai",
+        tokens_used=400,
+        response_time_ms=1800,
+        cost_estimate=cost,
+        success=True,
+    )
+
+
+@pytest.fixture(autouse=True)
+def fresh_cache():
+    reset_description_cache_service()
+    yield
+    reset_description_cache_service()
+
+
+class TestFrameHash:
+    def test_noise_moves_few_bits_and_new_object_many(self):
+        reference = frame_hash(scene())
+
+        assert _hash_distance(reference, frame_hash(scene(seed=1, noise=6))) <= 4
+        assert _hash_distance(reference, frame_hash(scene(with_person=True))) > 6
+        assert frame_hash(cv2.cvtColor(scene(), cv2.COLOR_BGR2GRAY)) == reference
+
+
+class TestDescriptionCacheService:
+    def lookup(self, cache, frame, at, embedding=EMBEDDING, objects=("unknown",), camera_id="cam-1", context_key=""):
+        return cache.lookup(
+            camera_id, frame_hash(frame), embedding, list(objects), at.timestamp(), context_key=context_key
+        )
+
+    def test_near_identical_frame_within_window_reuses_description(self):
+        cache = DescriptionCacheService(window_seconds=60)
+        cache.store("cam-1", frame_hash(scene()), EMBEDDING, ["unknown"], T0.timestamp(), provider_result())
+
+        hit = self.lookup(cache, scene(seed=2, noise=5), T0 + timedelta(seconds=20))
+
+        assert hit is not None
+        assert hit.result.description == "A tree sways in the front yard."
+        assert hit.result.cost_estimate == 0.0 and hit.result.tokens_used == 0
+        assert hit.age_seconds == pytest.approx(20)
+        stats = cache.get_stats()
+        assert stats["hits"] == 1 and stats["hit_rate"] == 1.0
+        assert stats["cost_saved_usd"] == pytest.approx(0.002)
+        assert stats["tokens_saved"] == 400
+        assert stats["by_camera"]["cam-1"]["hits"] == 1
+
+    def test_misses_on_age_objects_scene_camera_and_embedding(self):
+        cache = DescriptionCacheService(window_seconds=60, min_similarity=0.97)
+        embedding = np.ones(512, dtype=np.float32)
+        cache.store("cam-1", frame_hash(scene()), embedding, ["unknown"], T0.timestamp(), provider_result())
+        other = np.ones(512, dtype=np.float32)
+        other[:256] = -1.0
+
+        assert self.lookup(cache, scene(), T0 + timedelta(seconds=61)) is None
+        assert self.lookup(cache, scene(), T0 + timedelta(seconds=5), objects=("person",)) is None
+        assert self.lookup(cache, scene(with_person=True), T0 + timedelta(seconds=5)) is None
+        assert self.lookup(cache, scene(), T0 + timedelta(seconds=5), camera_id="cam-2") is None
+        assert self.lookup(cache, scene(), T0 + timedelta(seconds=5), embedding=other) is None
+        assert self.lookup(cache, scene(), T0 + timedelta(seconds=5), embedding=embedding * 3) is not None
+
+        stats = cache.get_stats()
+        assert (stats["hits"], stats["misses"]) == (1, 5)
+
+    def test_hits_do_not_extend_window_and_invalidate_clears_camera(self):
+        cache = DescriptionCacheService(window_seconds=60)
+        cache.store("cam-1", frame_hash(scene()), EMBEDDING, ["unknown"], T0.timestamp(), provider_result())
+
+        assert self.lookup(cache, scene(), T0 + timedelta(seconds=50)) is not None
+        assert self.lookup(cache, scene(), T0 + timedelta(seconds=70)) is None
+
+        cache.store("cam-1", frame_hash(scene()), EMBEDDING, ["unknown"], T0.timestamp(), provider_result())
+        cache.invalidate_camera("cam-1")
+        assert self.lookup(cache, scene(), T0 + timedelta(seconds=1)) is None
+        assert cache.get_stats()["cached_entries"] == 0
+
+    def test_misses_without_embedding_or_on_different_context(self):
+        cache = DescriptionCacheService(window_seconds=60)
+        context = description_context_key("cam-1", ["ent-1"], "Camera location: porch")
+        cache.store(
+            "cam-1", frame_hash(scene()), EMBEDDING, ["unknown"], T0.timestamp(), provider_result(),
+            context_key=context,
+        )
+        cache.store("cam-1", frame_hash(scene()), None, ["unknown"], T0.timestamp(), provider_result())
+
+        at = T0 + timedelta(seconds=5)
+        assert self.lookup(cache, scene(), at, context_key=context) is not None
+        assert self.lookup(cache, scene(), at, embedding=None, context_key=context) is None
+        assert self.lookup(cache, scene(), at) is None
+        assert self.lookup(
+            cache, scene(), at, context_key=description_context_key("cam-1", ["ent-2"], "Camera location: porch")
+        ) is None
+        assert self.lookup(
+            cache, scene(), at, context_key=description_context_key("cam-1", ["ent-1"], "Camera location: yard")
+        ) is None
+        assert self.lookup(cache, scene(), at, context_key=description_context_key("cam-1", ["ent-1"])) is None
+        assert cache.get_stats()["cached_entries"] == 1
+
+    def test_failed_results_are_not_cached(self):
+        cache = DescriptionCacheService()
+        failed = provider_result()
+        failed.success = False
+
+        cache.store("cam-1", frame_hash(scene()), EMBEDDING, ["unknown"], T0.timestamp(), failed)
+
+        assert self.lookup(cache, scene(), T0) is None
+
+
+class TestCoordinatorDescriptionCache:
+    """The coordinator skips the provider call for near-identical frames."""
+
+    @pytest.fixture(autouse=True)
+    def cache_enabled(self, monkeypatch):
+        monkeypatch.setattr("app.services.ai_processing_coordinator.settings.DESCRIPTION_CACHE_ENABLED", True)
+
+    @pytest.fixture
+    def ai_service(self):
+        service = Mock()
+        service.generate_description = AsyncMock(side_effect=lambda **kwargs: provider_result())
+        return service
+
+    @pytest.fixture
+    def coordinator(self, ai_service):
+        with patch.object(AIProcessingCoordinator, "_load_activity_caches"):
+            yield AIProcessingCoordinator(
+                ai_service=ai_service,
+                metrics=Mock(),
+                context_prompt_service=Mock(),
+                cost_alert_service=Mock(),
+                embedding_service=Mock(),
+                mqtt_service=Mock(),
+                ai_semaphore=asyncio.Semaphore(8),
+            )
+
+    def patch_camera_setting(self, enabled):
+        """Serve Camera.description_cache_enabled (and the OCR setting lookup) from a stub session."""
+        session = MagicMock()
+        session.scalar = AsyncMock(return_value=enabled)
+
+        @asynccontextmanager
+        async def fake_session():
+            yield session
+
+        return patch("app.services.ai_processing_coordinator.get_async_db_session", fake_session)
+
+    def event(self, frame, seconds):
+        return ProcessingEvent(
+            camera_id="cam-1",
+            camera_name="Yard",
+            frame=frame,
+            timestamp=T0 + timedelta(seconds=seconds),
+            detected_objects=["unknown"],
+        )
+
+    async def describe(
+        self, coordinator, frame, seconds, prompt=None, entity_ids=(), embedding=(1.0,) * 8, cache_context=None
+    ):
+        return await coordinator._generate_ai_description(
+            event=self.event(frame, seconds),
+            worker_id=0,
+            context_enhanced_prompt=prompt,
+            thumbnail_base64=None,
+            embedding_vector=list(embedding) if embedding is not None else None,
+            matched_entity_ids=entity_ids,
+            cache_context=cache_context,
+        )
+
+    @pytest.mark.asyncio
+    async def test_swaying_tree_burst_costs_one_provider_call(self, coordinator, ai_service):
+        with self.patch_camera_setting(None):
+            results = [
+                await self.describe(coordinator, scene(seed=i, noise=6), seconds=i * 3)
+                for i in range(10)
+            ]
+            person = await self.describe(coordinator, scene(with_person=True), seconds=31)
+
+        assert ai_service.generate_description.await_count == 2
+        assert not getattr(results[0], "description_cache_hit", False)
+        assert all(getattr(r, "description_cache_hit", False) for r in results[1:])
+        assert all(r.description == results[0].description for r in results)
+        assert not getattr(person, "description_cache_hit", False)
+        stats = coordinator.get_processing_stats()
+        assert stats["description_cache"]["hits"] == 9
+        assert stats["description_cache"]["cost_saved_usd"] == pytest.approx(9 * 0.002)
+
+    @pytest.mark.asyncio
+    async def test_burst_with_context_hits_despite_changing_similar_events(self, coordinator, ai_service):
+        """Similar-event counts grow with every event; only stable context keys the cache."""
+        camera_context = "Camera location: front yard\nPrevious accuracy for this camera: 90%"
+        with self.patch_camera_setting(None):
+            results = [
+                await self.describe(
+                    coordinator, scene(seed=i, noise=6), seconds=i * 3,
+                    prompt=f"Describe.\n\nHISTORICAL CONTEXT:\n- Similar events: {i + 3} occurrences in last 30 days",
+                    cache_context=camera_context,
+                )
+                for i in range(6)
+            ]
+            relocated = await self.describe(
+                coordinator, scene(), seconds=20, prompt="Describe.", cache_context="Camera location: driveway"
+            )
+
+        assert ai_service.generate_description.await_count == 2
+        assert all(getattr(r, "description_cache_hit", False) for r in results[1:])
+        assert not getattr(relocated, "description_cache_hit", False)
+
+    @pytest.mark.asyncio
+    async def test_context_entities_and_missing_embedding_bypass_cache(self, coordinator, ai_service):
+        with self.patch_camera_setting(None):
+            await self.describe(coordinator, scene(), seconds=0, prompt="Alice usually visits at noon", entity_ids=["ent-1"])
+            await self.describe(coordinator, scene(), seconds=1, prompt="Alice usually visits at noon", entity_ids=["ent-2"])
+            await self.describe(coordinator, scene(), seconds=2, prompt=None, entity_ids=["ent-1"])
+            await self.describe(coordinator, scene(), seconds=3, embedding=None)
+            hit = await self.describe(
+                coordinator, scene(), seconds=4, prompt="Alice usually visits at noon", entity_ids=["ent-1"]
+            )
+
+        assert ai_service.generate_description.await_count == 4
+        assert getattr(hit, "description_cache_hit", False)
+
+    @pytest.mark.asyncio
+    async def test_ocr_overlay_frames_always_call_provider(self, coordinator, ai_service):
+        from app.services.ocr_service import OCRResult
+
+        ocr = OCRResult(region="bottom_left", timestamp="12:00:00", camera_name=None, raw_text="12:00:00")
+        with self.patch_camera_setting("true"), \
+                patch("app.services.ocr_service.is_ocr_available", return_value=True), \
+                patch("app.services.ocr_service.extract_overlay_text", return_value=ocr):
+            for i in range(3):
+                await self.describe(coordinator, scene(), seconds=i)
+
+        assert ai_service.generate_description.await_count == 3
+        assert get_description_cache_service().get_stats()["cached_entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_camera_opt_out_always_calls_provider(self, coordinator, ai_service):
+        with self.patch_camera_setting(False):
+            for i in range(3):
+                await self.describe(coordinator, scene(), seconds=i)
+
+        assert ai_service.generate_description.await_count == 3
+        stats = get_description_cache_service().get_stats()
+        assert stats["disabled_lookups"] == 3 and stats["cached_entries"] == 0
+
+    @pytest.mark.asyncio
+    async def test_global_switch_disables_cache(self, coordinator, ai_service, monkeypatch):
+        monkeypatch.setattr("app.services.ai_processing_coordinator.settings.DESCRIPTION_CACHE_ENABLED", False)
+        with self.patch_camera_setting(None):
+            for i in range(3):
+                await self.describe(coordinator, scene(), seconds=i)
+
+        assert ai_service.generate_description.await_count == 3
+        assert get_description_cache_service().get_stats()["misses"] == 0
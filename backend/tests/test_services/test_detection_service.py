@@ -0,0 +1,225 @@
+"""
+Tests for the fused face/vehicle DetectionService.
+
+The SSD networks are replaced with stand-ins that record their input blobs
+and return fixed detections for every frame in the batch, so these tests
+cover decode, shared preprocessing, batching and result splitting without
+the model files.
+"""
+import io
+import threading
+import time
+from unittest.mock import patch
+
+import cv2
+import numpy as np
+import pytest
+from PIL import Image
+
+from app.services.detection_service import (
+    DetectionService,
+    decode_image,
+    get_detection_service,
+    reset_detection_service,
+)
+from app.services.face_detection_service import FaceDetectionService, reset_face_detection_service
+from app.services.vehicle_detection_service import VehicleDetectionService, reset_vehicle_detection_service
+
+
+def make_jpeg(width: int = 640, height: int = 360, seed: int = 0) -> bytes:
+    """Noisy JPEG so decode cost resembles a real camera frame."""
+    rng = np.random.default_rng(seed)
+    pixels = rng.integers(0, 255, size=(height, width, 3), dtype=np.uint8)
+    buffer = io.BytesIO()
+    Image.fromarray(pixels).save(buffer, format="JPEG", quality=85)
+    return buffer.getvalue()
+
+
+class FakeNet:
+    """cv2.dnn.Net stand-in returning ``rows`` for every frame of the batch."""
+
+    def __init__(self, rows, cost_seconds: float = 0.0):
+        self.rows = [list(row) for row in rows]
+        self.cost_seconds = cost_seconds
+        self.blobs = []
+        self.threads = []
+        self._blob = None
+
+    def setInput(self, blob):
+        self._blob = blob
+
+    def forward(self):
+        self.blobs.append(self._blob)
+        self.threads.append(threading.current_thread().name)
+        if self.cost_seconds:
+            time.sleep(self.cost_seconds)
+        out = [
+            [float(index)] + row
+            for index in range(self._blob.shape[0])
+            for row in self.rows
+        ]
+        return np.array(out, dtype=np.float32).reshape(1, 1, -1, 7)
+
+
+FACE_ROWS = [
+    (1, 0.95, 0.1, 0.1, 0.3, 0.4),
+    (1, 0.30, 0.5, 0.5, 0.6, 0.6),  # below the face threshold
+]
+VEHICLE_ROWS = [
+    (7, 0.60, 0.5, 0.5, 0.9, 0.9),   # car
+    (6, 0.90, 0.0, 0.0, 0.4, 0.5),   # bus, higher confidence
+    (15, 0.99, 0.2, 0.2, 0.3, 0.3),  # person, not a vehicle class
+]
+
+
+@pytest.fixture
+def detectors():
+    """Face and vehicle detectors with stand-in nets, plus a fresh DetectionService."""
+    reset_face_detection_service()
+    reset_vehicle_detection_service()
+    reset_detection_service()
+
+    face = FaceDetectionService()
+    face._net = FakeNet(FACE_ROWS)
+    face._model_loaded = True
+
+    vehicle = VehicleDetectionService()
+    vehicle._net = FakeNet(VEHICLE_ROWS)
+    vehicle._model_loaded = True
+    vehicle._use_fallback = False
+
+    yield face, vehicle
+
+    reset_detection_service()
+    reset_face_detection_service()
+    reset_vehicle_detection_service()
+
+
+class TestDecodeImage:
+    def test_decodes_jpeg_to_bgr(self):
+        image = decode_image(make_jpeg(64, 32))
+        assert image.shape == (32, 64, 3)
+
+    def test_rejects_empty_and_garbage(self):
+        with pytest.raises(ValueError):
+            decode_image(b"")
+        with pytest.raises(ValueError):
+            decode_image(b"not an image")
+
+
+class TestDetectionService:
+    def test_one_forward_per_model_for_a_batch(self, detectors):
+        face, vehicle = detectors
+        service = DetectionService(max_batch=8)
+
+        frames = service.detect_sync([make_jpeg(seed=i) for i in range(3)])
+
+        assert len(face._net.blobs) == 1
+        assert len(vehicle._net.blobs) == 1
+        assert face._net.blobs[0].shape == (3, 3, 300, 300)
+        assert len(frames) == 3
+        for frame in frames:
+            assert frame.image.shape == (360, 640, 3)
+            assert len(frame.faces) == 1
+            assert frame.faces[0].bbox.x == 64
+            assert frame.faces[0].bbox.height == 108
+            # Vehicles only, highest confidence first
+            assert [v.vehicle_type for v in frame.vehicles] == ["bus", "car"]
+
+    def test_blobs_match_per_service_preprocessing(self, detectors):
+        face, vehicle = detectors
+        image_bytes = make_jpeg(seed=7)
+        image = decode_image(image_bytes)
+
+        DetectionService().detect_sync([image_bytes])
+
+        resized = cv2.resize(image, face.INPUT_SIZE)
+        expected_face = cv2.dnn.blobFromImage(resized, face.INPUT_SCALE, face.INPUT_SIZE, face.INPUT_MEAN)
+        expected_vehicle = cv2.dnn.blobFromImage(
+            resized, vehicle.INPUT_SCALE, vehicle.INPUT_SIZE, vehicle.INPUT_MEAN
+        )
+        np.testing.assert_allclose(face._net.blobs[0], expected_face, atol=1e-3)
+        np.testing.assert_allclose(vehicle._net.blobs[0], expected_vehicle, atol=1e-4)
+
+    def test_large_inputs_are_split_by_max_batch(self, detectors):
+        face, _ = detectors
+        service = DetectionService(max_batch=2)
+
+        frames = service.detect_sync([make_jpeg(seed=i) for i in range(5)], vehicles=False)
+
+        assert [blob.shape[0] for blob in face._net.blobs] == [2, 2, 1]
+        assert all(len(frame.faces) == 1 for frame in frames)
+        assert all(frame.vehicles == [] for frame in frames)
+
+    def test_vehicle_fallback_skips_vehicle_net(self, detectors):
+        face, vehicle = detectors
+        vehicle._use_fallback = True
+
+        frames = DetectionService().detect_sync([make_jpeg()])
+
+        assert vehicle._net.blobs == []
+        assert len(frames[0].faces) == 1
+
+    def test_missing_face_model_skips_faces(self, detectors):
+        _, vehicle = detectors
+        face = FaceDetectionService()
+        face._model_loaded = False
+        face._load_model = lambda: (_ for _ in ()).throw(FileNotFoundError("no prototxt"))
+
+        frames = DetectionService().detect_sync([make_jpeg()])
+
+        assert frames[0].faces == []
+        assert len(frames[0].vehicles) == 2
+        assert len(vehicle._net.blobs) == 1
+
+    @pytest.mark.asyncio
+    async def test_detect_runs_on_dedicated_pool(self, detectors):
+        face, _ = detectors
+        service = DetectionService(max_workers=1, opencv_threads=1)
+        previous_threads = cv2.getNumThreads()
+
+        try:
+            frames = await service.detect([make_jpeg()])
+        finally:
+            service.cleanup()
+            cv2.setNumThreads(previous_threads)
+
+        assert len(frames) == 1
+        assert face._net.threads[0].startswith("detector")
+
+    def test_accessor_returns_singleton(self, detectors):
+        assert get_detection_service() is get_detection_service()
+
+
+class TestFusedDetectionWork:
+    """Fused pass vs. separate face and vehicle services on the same frames.
+
+    Compares the work each path does (one decode per frame, network forward
+    calls); wall-clock timing lives in tests/test_performance.
+    """
+
+    FRAMES = 16
+    MAX_BATCH = 8
+
+    def test_fused_pass_decodes_once_and_batches_forwards(self, detectors):
+        face, vehicle = detectors
+        images = [make_jpeg(1280, 720, seed=i) for i in range(self.FRAMES)]
+
+        # Separate path: each service decodes, preprocesses and runs its net per frame
+        for image_bytes in images:
+            face._detect_faces_sync(face._bytes_to_cv2(image_bytes))
+            vehicle._detect_vehicles_sync(vehicle._bytes_to_cv2(image_bytes))
+        separate_forwards = len(face._net.blobs) + len(vehicle._net.blobs)
+        face._net.blobs.clear()
+        vehicle._net.blobs.clear()
+
+        service = DetectionService(max_batch=self.MAX_BATCH)
+        with patch("cv2.imdecode", wraps=cv2.imdecode) as imdecode:
+            frames = service.detect_sync(images)
+            fused_decodes = imdecode.call_count
+        fused_forwards = len(face._net.blobs) + len(vehicle._net.blobs)
+
+        assert all(len(frame.faces) == 1 for frame in frames)
+        assert fused_decodes == self.FRAMES
+        assert separate_forwards == 2 * self.FRAMES
+        assert fused_forwards == 2 * (self.FRAMES // self.MAX_BATCH)
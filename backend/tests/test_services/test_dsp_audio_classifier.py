@@ -0,0 +1,274 @@
+"""Tests for DSPAudioClassifier
+
+Uses a synthetic signal corpus (generated in-process, no fixture files) for:
+- Detection of glass break, doorbell chime, scream and alarm tones
+- Rejection of silence, noise, low-frequency impacts, speech and mains hum
+- Incremental classification from AudioRingBuffer (each event reported once)
+- Threshold propagation from AudioEventDetector
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from app.services.audio_classifiers import (
+    AudioEventType,
+    DSPAudioClassifier,
+)
+from app.services.audio_event_detector import AudioEventDetector
+from app.services.audio_stream_service import AudioRingBuffer
+
+SR = 16000
+
+
+# ---------------------------------------------------------------------------
+# Synthetic corpus
+# ---------------------------------------------------------------------------
+
+def _pcm(signal: np.ndarray) -> np.ndarray:
+    return (np.clip(signal, -1.0, 1.0) * 32767).astype(np.int16)
+
+
+def _background(seconds: float, seed: int, level: float = 0.003) -> np.ndarray:
+    return np.random.default_rng(seed).normal(0, level, int(seconds * SR))
+
+
+def glass_break(seed: int = 1) -> np.ndarray:
+    """Broadband high-frequency impact with fast decay plus shard pings."""
+    rng = np.random.default_rng(seed)
+    signal = _background(2.0, seed)
+    start, length = int(0.5 * SR), int(0.4 * SR)
+    noise = np.diff(rng.normal(0, 1, length), prepend=0.0)  # first difference = high-pass
+    envelope = np.exp(-np.arange(length) / (0.04 * SR))
+    signal[start:start + length] += 0.6 * noise / np.abs(noise).max() * envelope
+    for k in range(5):
+        shard = start + int((0.08 + 0.07 * k) * SR)
+        n = int(0.05 * SR)
+        t = np.arange(n) / SR
+        signal[shard:shard + n] += 0.25 * np.sin(2 * np.pi * rng.uniform(4000, 7000) * t) * np.exp(-t / 0.01)
+    return _pcm(signal)
+
+
+def doorbell(seed: int = 2) -> np.ndarray:
+    """Two-tone "ding-dong" chime (E5 then C5) with exponential decay."""
+    signal = _background(2.0, seed)
+    for onset, freq in ((0.2, 659.3), (0.9, 523.3)):
+        start, n = int(onset * SR), int(0.7 * SR)
+        t = np.arange(n) / SR
+        tone = np.sin(2 * np.pi * freq * t) + 0.2 * np.sin(4 * np.pi * freq * t)
+        signal[start:start + n] += 0.4 * tone * np.exp(-t / 0.25)
+    return _pcm(signal)
+
+
+def scream(seed: int = 3) -> np.ndarray:
+    """Loud harmonic voice with gliding pitch and vibrato."""
+    signal = _background(2.0, seed)
+    start, n = int(0.3 * SR), int(1.2 * SR)
+    t = np.arange(n) / SR
+    f0 = 900 + 250 * np.sin(2 * np.pi * 0.8 * t) + 40 * np.sin(2 * np.pi * 6 * t)
+    phase = 2 * np.pi * np.cumsum(f0) / SR
+    voice = sum(a * np.sin(k * phase) for k, a in ((1, 1.0), (2, 0.6), (3, 0.4), (4, 0.25)))
+    envelope = np.minimum(1, t / 0.05) * np.minimum(1, (t[-1] - t) / 0.1)
+    signal[start:start + n] += 0.25 * voice * envelope
+    return _pcm(signal)
+
+
+def smoke_alarm(seed: int = 4) -> np.ndarray:
+    """3.15 kHz beeping tone, 0.5 s on / 0.5 s off."""
+    t = np.arange(2 * SR) / SR
+    gate = ((t % 1.0) < 0.5).astype(float)
+    return _pcm(_background(2.0, seed) + 0.3 * np.sin(2 * np.pi * 3150 * t) * gate)
+
+
+def silence(seed: int = 5) -> np.ndarray:
+    return _pcm(_background(2.0, seed))
+
+
+def white_noise(seed: int = 6) -> np.ndarray:
+    return _pcm(np.random.default_rng(seed).normal(0, 0.1, 2 * SR))
+
+
+def door_slam(seed: int = 7) -> np.ndarray:
+    """Low-frequency thump: loud onset but no high-frequency content."""
+    rng = np.random.default_rng(seed)
+    signal = _background(2.0, seed)
+    start, n = int(0.6 * SR), int(0.3 * SR)
+    thump = np.convolve(rng.normal(0, 1, n), np.ones(40) / 40, mode="same")
+    signal[start:start + n] += 0.8 * thump / np.abs(thump).max() * np.exp(-np.arange(n) / (0.05 * SR))
+    return _pcm(signal)
+
+
+def speech(seed: int = 8) -> np.ndarray:
+    """Low-pitched harmonic voice at conversational level with syllable gating."""
+    t = np.arange(2 * SR) / SR
+    phase = 2 * np.pi * np.cumsum(140 + 20 * np.sin(2 * np.pi * 2 * t)) / SR
+    voiced = sum((0.5 / k) * np.sin(k * phase) for k in range(1, 12))
+    syllables = (np.sin(2 * np.pi * 3 * t) > 0).astype(float)
+    return _pcm(_background(2.0, seed) + 0.05 * voiced * syllables)
+
+
+def mains_hum(seed: int = 9) -> np.ndarray:
+    t = np.arange(2 * SR) / SR
+    return _pcm(_background(2.0, seed) + 0.05 * np.sin(2 * np.pi * 60 * t) + 0.03 * np.sin(2 * np.pi * 120 * t))
+
+
+POSITIVES = [
+    (glass_break, AudioEventType.GLASS_BREAK),
+    (doorbell, AudioEventType.DOORBELL),
+    (scream, AudioEventType.SCREAM),
+    (smoke_alarm, AudioEventType.ALARM),
+]
+NEGATIVES = [silence, white_noise, door_slam, speech, mains_hum]
+
+
+def _stream(classifier, stream_id, signal, chunk=320, check_every=12):
+    """Feed signal to a ring buffer in 20 ms chunks, classifying every ~240 ms."""
+    buffer = AudioRingBuffer(buffer_seconds=5.0, sample_rate=SR)
+    results = []
+    for i, offset in enumerate(range(0, len(signal), chunk)):
+        buffer.add(signal[offset:offset + chunk], time.time())
+        if i % check_every == check_every - 1:
+            results.extend(classifier.classify_stream(stream_id, buffer))
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+class TestDSPAudioClassifier:
+    """Stateless classify() on the synthetic corpus"""
+
+    def test_model_metadata(self):
+        classifier = DSPAudioClassifier()
+
+        assert classifier.get_model_name() == "dsp_v1"
+        assert classifier.supports_streaming() is True
+        assert set(classifier.get_supported_event_types()) == {
+            AudioEventType.GLASS_BREAK,
+            AudioEventType.DOORBELL,
+            AudioEventType.SCREAM,
+            AudioEventType.ALARM,
+        }
+
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    @pytest.mark.parametrize("generator,expected", POSITIVES, ids=[g.__name__ for g, _ in POSITIVES])
+    def test_detects_event(self, generator, expected, seed):
+        results = DSPAudioClassifier().classify(generator(seed=seed), SR)
+
+        assert [r.event_type for r in results] == [expected]
+        assert results[0].confidence >= 0.70
+        assert results[0].duration_ms > 0
+        assert results[0].metadata["classifier"] == "dsp"
+
+    @pytest.mark.parametrize("generator", NEGATIVES, ids=[g.__name__ for g in NEGATIVES])
+    def test_rejects_non_events(self, generator):
+        classifier = DSPAudioClassifier(report_floor=0.0)
+
+        assert classifier.classify(generator(), SR) == []
+
+    def test_accepts_float32_and_stereo(self):
+        mono = smoke_alarm().astype(np.float32) / 32768.0
+        stereo = np.stack([mono, mono], axis=1)
+
+        results = DSPAudioClassifier().classify(stereo, SR, channels=2)
+
+        assert [r.event_type for r in results] == [AudioEventType.ALARM]
+
+    def test_narrowband_sample_rate(self):
+        """G.711 cameras deliver 8 kHz audio"""
+        t = np.arange(2 * 8000) / 8000
+        gate = ((t % 1.0) < 0.5).astype(float)
+        alarm = _pcm(0.3 * np.sin(2 * np.pi * 3150 * t) * gate)
+
+        results = DSPAudioClassifier().classify(alarm, 8000)
+
+        assert [r.event_type for r in results] == [AudioEventType.ALARM]
+
+    def test_too_short_input_returns_empty(self):
+        assert DSPAudioClassifier().classify(np.zeros(100, dtype=np.int16), SR) == []
+
+
+class TestDSPStreaming:
+    """Incremental classify_stream() over AudioRingBuffer"""
+
+    @pytest.mark.parametrize("generator,expected", POSITIVES, ids=[g.__name__ for g, _ in POSITIVES])
+    def test_event_reported_once(self, generator, expected):
+        signal = np.concatenate([silence(seed=50), generator(), silence(seed=51)])
+
+        results = _stream(DSPAudioClassifier(), "cam-1", signal)
+
+        assert [r.event_type for r in results] == [expected]
+        assert results[0].confidence >= 0.70
+
+    @pytest.mark.parametrize("generator", NEGATIVES, ids=[g.__name__ for g in NEGATIVES])
+    def test_no_events_for_negatives(self, generator):
+        signal = np.concatenate([silence(seed=50), generator(), silence(seed=51)])
+
+        assert _stream(DSPAudioClassifier(), "cam-1", signal) == []
+
+    def test_streams_are_independent(self):
+        classifier = DSPAudioClassifier()
+
+        doorbell_results = _stream(classifier, "front", np.concatenate([doorbell(), silence()]))
+        quiet_results = _stream(classifier, "back", np.concatenate([silence(), silence(seed=7)]))
+
+        assert [r.event_type for r in doorbell_results] == [AudioEventType.DOORBELL]
+        assert quiet_results == []
+
+    def test_only_new_samples_are_transformed(self):
+        classifier = DSPAudioClassifier()
+        buffer = AudioRingBuffer(buffer_seconds=5.0, sample_rate=SR)
+        buffer.add(silence(), time.time())
+
+        classifier.classify_stream("cam-1", buffer)
+        position = classifier._streams["cam-1"].position
+        assert position == buffer.position
+
+        # No new audio -> nothing to do
+        assert classifier.classify_stream("cam-1", buffer) == []
+        assert classifier._streams["cam-1"].position == position
+
+    def test_reset_stream_drops_state(self):
+        classifier = DSPAudioClassifier()
+        buffer = AudioRingBuffer(buffer_seconds=5.0, sample_rate=SR)
+        buffer.add(silence(), time.time())
+        classifier.classify_stream("cam-1", buffer)
+
+        classifier.reset_stream("cam-1")
+
+        assert "cam-1" not in classifier._streams
+
+
+class TestDSPWithDetector:
+    """Integration with AudioEventDetector thresholds"""
+
+    def test_thresholds_set_report_floor(self):
+        classifier = DSPAudioClassifier()
+        detector = AudioEventDetector(classifier=classifier)
+
+        detector.set_threshold(AudioEventType.DOORBELL, 0.95)
+
+        assert classifier._report_floors[AudioEventType.DOORBELL] == pytest.approx(0.75)
+
+    def test_detect_audio_events_applies_thresholds(self):
+        detector = AudioEventDetector(classifier=DSPAudioClassifier())
+
+        results = detector.detect_audio_events(glass_break(), SR)
+
+        assert len(results) == 1
+        assert results[0].event_type == AudioEventType.GLASS_BREAK
+        assert results[0].passed_threshold is True
+        assert results[0].classifier_name == "dsp_v1"
+
+    def test_detect_stream_events(self):
+        detector = AudioEventDetector(classifier=DSPAudioClassifier())
+        buffer = AudioRingBuffer(buffer_seconds=5.0, sample_rate=SR)
+        buffer.add(np.concatenate([smoke_alarm(), silence()]), time.time())
+
+        assert detector.supports_streaming is True
+        results = detector.detect_stream_events("cam-1", buffer)
+
+        assert [r.event_type for r in results] == [AudioEventType.ALARM]
+        assert results[0].passed_threshold is True
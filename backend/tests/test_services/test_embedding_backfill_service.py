@@ -0,0 +1,203 @@
+"""
+Tests for EmbeddingBackfillService: anti-join selection, batched inference,
+bulk inserts, resumability, pacing and WebSocket progress.
+"""
+import asyncio
+import json
+import time
+from contextlib import contextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import numpy as np
+import pytest
+from PIL import Image
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base
+from app.models.event_embedding import EventEmbedding
+from app.services.embedding_backfill_service import (
+    EmbeddingBackfillStatus,
+    EmbeddingBackfillService,
+)
+from app.services.embedding_service import get_embedding_service
+from tests.conftest import make_camera, make_event
+
+
+@pytest.fixture
+def sessions(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path}/backfill.db", connect_args={"check_same_thread": False})
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine)
+
+    @contextmanager
+    def get_db_session():
+        db = factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    with patch("app.services.embedding_backfill_service.get_db_session", get_db_session):
+        yield factory
+    engine.dispose()
+
+
+@pytest.fixture
+def websocket_manager():
+    with patch("app.services.embedding_backfill_service.get_websocket_manager") as mock:
+        manager = MagicMock()
+        manager.broadcast = AsyncMock()
+        mock.return_value = manager
+        yield manager
+
+
+@pytest.fixture
+def clip_model():
+    """Fake CLIP model: embedding is the image's mean red value repeated."""
+    model = MagicMock()
+    model.encode.side_effect = lambda images, batch_size, convert_to_numpy: np.array(
+        [[np.asarray(image)[..., 0].mean() / 255.0] * 512 for image in images], dtype=np.float32
+    )
+    get_embedding_service()._model = model
+    return model
+
+
+def _thumbnail(tmp_path, name, red):
+    path = tmp_path / f"{name}.jpg"
+    Image.new("RGB", (640, 360), (red, 0, 0)).save(path, "JPEG")
+    return str(path)
+
+
+def _seed(sessions, tmp_path, count, embedded=(), broken=()):
+    db = sessions()
+    make_camera(db, id="cam-1")
+    ids = []
+    for i in range(count):
+        event_id = f"event-{i:03d}"
+        if i in broken:
+            path = str(tmp_path / "missing.jpg")
+        else:
+            path = _thumbnail(tmp_path, event_id, 10 * i)
+        make_event(db, id=event_id, camera_id="cam-1", thumbnail_path=path)
+        if i in embedded:
+            db.add(EventEmbedding(event_id=event_id, embedding="[]", model_version="old"))
+        ids.append(event_id)
+    db.commit()
+    db.close()
+    return ids
+
+
+async def _run(service, db, **kwargs):
+    job = await service.start_backfill(db, **kwargs)
+    await service.wait()
+    return job
+
+
+class TestEmbeddingBackfill:
+    @pytest.mark.asyncio
+    async def test_embeds_missing_events_in_batches(self, sessions, tmp_path, websocket_manager, clip_model):
+        _seed(sessions, tmp_path, 10, embedded={0, 1}, broken={5})
+        service = EmbeddingBackfillService()
+
+        with sessions() as db:
+            assert service.count_missing(db) == 8
+            job = await _run(service, db, batch_size=4, max_events_per_second=0)
+
+        assert job.status == EmbeddingBackfillStatus.COMPLETED
+        assert (job.total_events, job.processed, job.embedded, job.failed) == (8, 8, 7, 1)
+        assert job.batches == 2
+        # One CLIP call per batch, not per image
+        assert [len(call.args[0]) for call in clip_model.encode.call_args_list] == [3, 4]
+
+        with sessions() as db:
+            rows = {row.event_id: row for row in db.query(EventEmbedding).all()}
+            assert service.count_missing(db) == 1
+        assert rows["event-000"].model_version == "old"
+        assert rows["event-003"].model_version == get_embedding_service().get_model_version()
+        assert json.loads(rows["event-003"].embedding)[0] == pytest.approx(30 / 255, abs=0.02)
+
+        messages = [call.args[0] for call in websocket_manager.broadcast.call_args_list]
+        assert messages[-1]["type"] == "embedding_backfill_complete"
+        assert messages[-1]["data"]["embedded"] == 7
+
+    @pytest.mark.asyncio
+    async def test_limited_job_then_resume(self, sessions, tmp_path, websocket_manager, clip_model):
+        _seed(sessions, tmp_path, 6)
+        service = EmbeddingBackfillService()
+
+        with sessions() as db:
+            first = await _run(service, db, limit=4, batch_size=3, max_events_per_second=0)
+            second = await _run(service, db, batch_size=3, max_events_per_second=0)
+            remaining = service.count_missing(db)
+
+        assert first.embedded == 4
+        assert second.total_events == 2 and second.embedded == 2
+        assert remaining == 0
+        with pytest.raises(ValueError, match="No events"):
+            with sessions() as db:
+                await service.start_backfill(db)
+
+    @pytest.mark.asyncio
+    async def test_paced_to_rate_limit(self, sessions, tmp_path, websocket_manager, clip_model):
+        _seed(sessions, tmp_path, 10)
+        service = EmbeddingBackfillService()
+
+        start = time.monotonic()
+        with sessions() as db:
+            job = await _run(service, db, batch_size=5, max_events_per_second=50)
+
+        assert job.embedded == 10
+        assert time.monotonic() - start >= 0.18
+
+    @pytest.mark.asyncio
+    async def test_cancel_and_single_job(self, sessions, tmp_path, websocket_manager, clip_model):
+        _seed(sessions, tmp_path, 10)
+        service = EmbeddingBackfillService()
+
+        with sessions() as db:
+            await service.start_backfill(db, batch_size=2, max_events_per_second=10)
+            with pytest.raises(ValueError, match="already running"):
+                await service.start_backfill(db)
+            await asyncio.sleep(0.05)
+            job = await service.cancel_backfill()
+
+        assert job.status == EmbeddingBackfillStatus.CANCELLED
+        assert 0 < job.embedded < 10
+
+    @pytest.mark.asyncio
+    async def test_next_batch_decoded_while_current_is_stored(self, sessions, tmp_path, websocket_manager, clip_model):
+        _seed(sessions, tmp_path, 4)
+        service = EmbeddingBackfillService()
+        decoded = []
+        decoded_before_store = []
+        load_image, store = service._load_image, service._store
+
+        def tracking_load_image(thumbnail_hash, thumbnail_path):
+            decoded.append(thumbnail_path)
+            return load_image(thumbnail_hash, thumbnail_path)
+
+        async def slow_store(event_ids, vectors):
+            await asyncio.sleep(0.05)
+            decoded_before_store.append(len(decoded))
+            await store(event_ids, vectors)
+
+        with patch.object(service, "_load_image", tracking_load_image), \
+                patch.object(service, "_store", slow_store):
+            with sessions() as db:
+                job = await _run(service, db, batch_size=2, max_events_per_second=0)
+
+        assert job.embedded == 4
+        # Batch 2 was decoded before batch 1 finished storing
+        assert decoded_before_store == [4, 4]
+
+    @pytest.mark.asyncio
+    async def test_store_skips_events_embedded_meanwhile(self, sessions, tmp_path):
+        _seed(sessions, tmp_path, 2, embedded={0})
+        service = EmbeddingBackfillService()
+
+        await service._store(["event-000", "event-001"], np.zeros((2, 512), dtype=np.float32))
+
+        with sessions() as db:
+            rows = {row.event_id: row.model_version for row in db.query(EventEmbedding).all()}
+        assert rows == {"event-000": "old", "event-001": get_embedding_service().get_model_version()}
@@ -474,6 +474,32 @@ class TestTextEncoding:
         with pytest.raises(RuntimeError, match="Encoding failed"):
             await service.encode_text("package")
 
+    @pytest.mark.asyncio
+    async def test_encode_text_cached_by_normalized_query(self, service_with_mock, mock_model):
+        """Test that repeated queries reuse the cached text embedding."""
+        first = await service_with_mock.encode_text("Package Delivery")
+        second = await service_with_mock.encode_text("  package delivery ")
+
+        mock_model.encode.assert_called_once()
+        assert second == first
+        # Callers get their own copy of the cached vector
+        second[0] = 99.0
+        assert (await service_with_mock.encode_text("package delivery"))[0] == first[0]
+
+    @pytest.mark.asyncio
+    async def test_encode_text_cache_evicts_least_recent(self, service_with_mock, mock_model):
+        """Test that the text embedding LRU is bounded."""
+        service_with_mock.TEXT_CACHE_SIZE = 2
+
+        await service_with_mock.encode_text("dog")
+        await service_with_mock.encode_text("cat")
+        await service_with_mock.encode_text("dog")
+        await service_with_mock.encode_text("car")  # evicts "cat"
+        await service_with_mock.encode_text("dog")
+        await service_with_mock.encode_text("cat")
+
+        assert mock_model.encode.call_count == 4
+
 
 class TestQueryFormatting:
     """Tests for _format_query_for_clip helper method."""
@@ -600,8 +600,7 @@ class TestGetEntityForEvent:
         """Clean up after tests."""
         reset_entity_service()
 
-    @pytest.mark.asyncio
-    async def test_returns_entity_summary_for_linked_event(self):
+    def test_returns_entity_summary_for_linked_event(self):
         """AC12: Event response includes matched_entity data."""
         mock_db = MagicMock()
 
@@ -618,7 +617,7 @@ class TestGetEntityForEvent:
         mock_query.join.return_value.filter.return_value.first.return_value = mock_result
         mock_db.query.return_value = mock_query
 
-        entity = await self.service.get_entity_for_event(
+        entity = self.service.get_entity_for_event(
             db=mock_db,
             event_id="event-1",
         )
@@ -629,8 +628,7 @@ class TestGetEntityForEvent:
         assert entity["occurrence_count"] == 10
         assert entity["similarity_score"] == 0.92
 
-    @pytest.mark.asyncio
-    async def test_returns_none_for_unlinked_event(self):
+    def test_returns_none_for_unlinked_event(self):
         """Test that get_entity_for_event returns None for unlinked events."""
         mock_db = MagicMock()
 
@@ -638,7 +636,7 @@ class TestGetEntityForEvent:
         mock_query.join.return_value.filter.return_value.first.return_value = None
         mock_db.query.return_value = mock_query
 
-        entity = await self.service.get_entity_for_event(
+        entity = self.service.get_entity_for_event(
             db=mock_db,
             event_id="unlinked-event",
         )
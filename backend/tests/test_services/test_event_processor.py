@@ -14,6 +14,7 @@ Tests:
 import pytest
 import asyncio
 import numpy as np
+from contextlib import contextmanager
 from datetime import datetime, timezone
 from unittest.mock import Mock, AsyncMock, patch, MagicMock
 
@@ -22,8 +23,10 @@ from app.services.event_processor import (
     ProcessingMetrics,
     EventProcessor
 )
+from app.models.camera import Camera
 from app.services.ai_worker_pool import AIWorkerPool
 from app.services.camera_task_manager import CameraTaskManager
+from app.services.cluster_service import HashRing
 
 
 def _make_camera_task_manager(processor: EventProcessor) -> CameraTaskManager:
@@ -476,6 +479,78 @@ class TestEventProcessor:
         assert event_processor.event_queue.qsize() == 0
 
 
+class TestClusterCameraMonitoring:
+    """Motion loops run only on the replica that owns the camera"""
+
+    @pytest.fixture
+    def cameras(self, db_session):
+        rows = [
+            Camera(id=f"cam-{i}", name=f"Cam {i}", type="rtsp", rtsp_url=f"rtsp://10.0.0.{i}/s", is_enabled=True)
+            for i in range(12)
+        ]
+        rows.append(Camera(id="cam-usb", name="USB", type="usb", device_index=0, is_enabled=True))
+        rows.append(Camera(id="cam-off", name="Off", type="rtsp", rtsp_url="rtsp://10.0.0.99/s", is_enabled=False))
+        db_session.add_all(rows)
+        db_session.commit()
+        return rows
+
+    @staticmethod
+    def _replica(member, ring, db_session):
+        processor = EventProcessor(worker_count=2, queue_maxsize=10)
+        processor.camera_task_manager = _make_camera_task_manager(processor)
+        cluster = Mock()
+        cluster.owns.side_effect = lambda kind, key: ring[0].owner(f"{kind}:{key}") == member
+
+        @contextmanager
+        def session():
+            yield db_session
+
+        return processor, cluster, session
+
+    @pytest.mark.asyncio
+    async def test_two_members_split_cameras_and_follow_rebalance(self, db_session, cameras):
+        ring = [HashRing(["a", "b"])]
+        replicas = {member: self._replica(member, ring, db_session) for member in ("a", "b")}
+
+        async def idle_loop(camera):
+            await asyncio.Event().wait()
+
+        monitored = {}
+        with patch.object(CameraTaskManager, "_run_motion_detection_loop", side_effect=idle_loop):
+            for member, (processor, cluster, session) in replicas.items():
+                with patch("app.services.event_processor.get_cluster_service", return_value=cluster), \
+                        patch("app.services.event_processor.get_db_session", session):
+                    await processor.reconcile_camera_monitoring()
+                monitored[member] = set(processor.camera_task_manager.get_monitored_cameras())
+
+            rtsp = {f"cam-{i}" for i in range(12)}
+            assert monitored["a"] - {"cam-usb"} and monitored["b"] - {"cam-usb"}
+            assert (monitored["a"] & monitored["b"]) == {"cam-usb"}
+            assert (monitored["a"] | monitored["b"]) == rtsp | {"cam-usb"}
+
+            # "b" leaves: "a" picks up its cameras on the next rebalance
+            ring[0] = HashRing(["a"])
+            processor, cluster, session = replicas["a"]
+            with patch("app.services.event_processor.get_cluster_service", return_value=cluster), \
+                    patch("app.services.event_processor.get_db_session", session):
+                stats = await processor.reconcile_camera_monitoring()
+
+            assert stats == {"started": len(monitored["b"] - {"cam-usb"}), "stopped": 0}
+            assert set(processor.camera_task_manager.get_monitored_cameras()) == rtsp | {"cam-usb"}
+
+            # "b" rejoins: "a" hands its cameras back
+            ring[0] = HashRing(["a", "b"])
+            with patch("app.services.event_processor.get_cluster_service", return_value=cluster), \
+                    patch("app.services.event_processor.get_db_session", session):
+                stats = await processor.reconcile_camera_monitoring()
+
+            assert stats == {"started": 0, "stopped": len(monitored["b"] - {"cam-usb"})}
+            assert set(processor.camera_task_manager.get_monitored_cameras()) == monitored["a"]
+
+            for processor, _, _ in replicas.values():
+                await processor.camera_task_manager.stop_all()
+
+
 @pytest.mark.asyncio
 class TestEventProcessorIntegration:
     """Integration tests for EventProcessor with real asyncio"""
@@ -1023,6 +1023,65 @@ class TestExtractFramesWithTimestamps:
             assert timestamps == [], "Should return empty timestamps on error"
 
 
+    @pytest.mark.asyncio
+    async def test_adaptive_converts_only_selected_frames_to_rgb(self):
+        """Adaptive candidates are thumbnailed by the decoder; only selections become RGB/JPEG"""
+        mock_container = self._create_mock_container(total_frames=150, fps=30.0)
+        mock_frames = list(mock_container.decode.return_value)
+        mock_container.decode.return_value = iter(mock_frames)
+        rgb_calls = []
+
+        for index, mock_frame in enumerate(mock_frames):
+            mock_frame.width, mock_frame.height = 1280, 720
+            rgb = np.full((72, 128, 3), (index * 37) % 256, dtype=np.uint8)
+
+            def to_ndarray(format, width=None, height=None, rgb=rgb, index=index):
+                if format == 'gray':
+                    assert (width, height) == (160, 90)
+                    return np.full((height, width), (index * 37) % 256, dtype=np.uint8)
+                rgb_calls.append(index)
+                return rgb
+
+            mock_frame.to_ndarray.side_effect = to_ndarray
+
+        with patch("av.open", return_value=mock_container):
+            frames, timestamps = await self.extractor.extract_frames_with_timestamps(
+                Path("/test/video.mp4"),
+                frame_count=5,
+                filter_blur=False,
+                sampling_strategy="adaptive",
+            )
+
+        assert len(frames) == 5
+        assert len(rgb_calls) == 5
+        assert timestamps == sorted(timestamps)
+
+    @pytest.mark.asyncio
+    async def test_adaptive_on_encoded_clip(self, tmp_path):
+        """Adaptive sampling decodes a real clip with decoder-scaled thumbnails"""
+        import av
+
+        clip = tmp_path / "clip.mp4"
+        with av.open(str(clip), "w") as container:
+            stream = container.add_stream("mpeg4", rate=10)
+            stream.width, stream.height, stream.pix_fmt = 320, 180, "yuv420p"
+            for i in range(60):
+                image = np.full((180, 320, 3), 40, dtype=np.uint8)
+                image[60:120, i * 4:i * 4 + 60] = 230
+                for packet in stream.encode(av.VideoFrame.from_ndarray(image, format="rgb24")):
+                    container.mux(packet)
+            for packet in stream.encode():
+                container.mux(packet)
+
+        frames, timestamps = await self.extractor.extract_frames_with_timestamps(
+            clip, frame_count=5, filter_blur=False, sampling_strategy="adaptive"
+        )
+
+        assert len(frames) == 5
+        assert all(frame[:2] == b'\xff\xd8' for frame in frames)
+        assert timestamps[0] == 0.0
+
+
 class TestEncodeFrameForStorage:
     """Test encode_frame_for_storage method (Story P3-7.5)"""
 
@@ -0,0 +1,186 @@
+"""
+Tests for per-provider image payloads (ImagePayloadOptimizer) and their use in
+VisionAnalysisOrchestrator.
+"""
+import base64
+from unittest.mock import MagicMock, patch
+
+import cv2
+import numpy as np
+import pytest
+
+from app.services.ai_types import AIProvider, AIResult
+from app.services.image_payload_optimizer import (
+    PROVIDER_IMAGE_RULES,
+    ImagePayloadOptimizer,
+    get_image_payload_optimizer,
+    reset_image_payload_optimizer,
+)
+from app.services.vision_analysis_orchestrator import (
+    VisionAnalysisOrchestrator,
+    reset_vision_analysis_orchestrator,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_optimizer():
+    reset_image_payload_optimizer()
+    reset_vision_analysis_orchestrator()
+    yield
+    reset_image_payload_optimizer()
+    reset_vision_analysis_orchestrator()
+
+
+def frame(width, height):
+    rng = np.random.default_rng(0)
+    return rng.integers(0, 255, (height, width, 3), dtype=np.uint8)
+
+
+def decoded_size(encoded):
+    image = cv2.imdecode(np.frombuffer(base64.b64decode(encoded.base64), np.uint8), cv2.IMREAD_COLOR)
+    return image.shape[1], image.shape[0]
+
+
+class TestTargetSize:
+    def test_openai_never_exceeds_its_processing_size(self):
+        optimizer = ImagePayloadOptimizer(snap_tolerance=0.0, crop_enabled=False)
+        image = optimizer.prepare(frame(1920, 1080)).for_provider("openai")
+
+        assert (image.width, image.height) == (1365, 768)
+        assert decoded_size(image) == (1365, 768)
+        assert image.estimated_tokens == 85 + 170 * 6
+
+    def test_snaps_to_tile_boundary_within_tolerance(self):
+        optimizer = ImagePayloadOptimizer(snap_tolerance=0.2)
+        rules = PROVIDER_IMAGE_RULES["openai"]
+
+        # 640px wide needs two 512px tiles; 512x288 needs one
+        assert optimizer.target_size(rules, 640, 360) == (512, 288)
+        optimizer.snap_tolerance = 0.1
+        assert optimizer.target_size(rules, 640, 360) == (640, 360)
+
+    def test_claude_fits_pixel_budget(self):
+        optimizer = ImagePayloadOptimizer()
+        width, height = optimizer.target_size(PROVIDER_IMAGE_RULES["claude"], 4000, 3000)
+
+        assert width * height <= 1_150_000
+        assert max(width, height) <= 1568
+
+    def test_token_cap(self):
+        optimizer = ImagePayloadOptimizer(max_tokens_per_image=500)
+        rules = PROVIDER_IMAGE_RULES["openai"]
+        width, height = optimizer.target_size(rules, 1920, 1080)
+
+        assert rules.estimate_tokens(width, height) <= 500
+        assert min(width, height) >= 256
+
+    def test_disabled_keeps_previous_2048_cap(self):
+        optimizer = ImagePayloadOptimizer(enabled=False)
+
+        assert optimizer.prepare(frame(3000, 1500)).for_provider("openai").width == 2048
+
+
+class TestCropping:
+    def test_crops_to_padded_region_and_maps_boxes_back(self):
+        optimizer = ImagePayloadOptimizer(crop_enabled=True, roi_padding=0.5)
+        payload = optimizer.prepare(frame(1280, 720), regions=[(800, 300, 200, 200)])
+
+        x, y, width, height = payload.crop
+        assert x <= 800 and y <= 300 and x + width >= 1000 and y + height >= 500
+        assert width * height < 0.7 * 1280 * 720
+
+        mapped = payload.map_boxes([{"x": 0.0, "y": 0.0, "width": 1.0, "height": 1.0, "label": "person"}])
+        assert mapped[0]["x"] == pytest.approx(x / 1280)
+        assert mapped[0]["width"] == pytest.approx(width / 1280)
+        assert mapped[0]["label"] == "person"
+
+    def test_large_regions_keep_full_frame(self):
+        payload = ImagePayloadOptimizer(crop_enabled=True).prepare(frame(640, 360), regions=[(0, 0, 600, 340)])
+
+        assert payload.crop is None
+        assert payload.map_boxes([{"x": 0.5}]) == [{"x": 0.5}]
+
+    def test_regions_ignored_unless_enabled(self):
+        payload = ImagePayloadOptimizer().prepare(frame(1280, 720), regions=[(800, 300, 200, 200)])
+
+        assert payload.crop is None
+
+
+class FailingThenOk:
+    def __init__(self, name, success):
+        self.name, self.success = name, success
+        self.images = []
+
+    async def generate_description(self, image_base64, *args, **kwargs):
+        self.images.append(image_base64)
+        return AIResult(
+            description="A person at the gate",
+            confidence=80,
+            objects_detected=["person"],
+            provider=self.name,
+            tokens_used=100,
+            response_time_ms=10,
+            cost_estimate=0.001,
+            success=self.success,
+            error=None if self.success else "bad request",
+            bounding_boxes=[{"x": 0.0, "y": 0.0, "width": 1.0, "height": 1.0}] if self.success else None,
+        )
+
+    async def generate_multi_image_description(self, images_base64, *args, **kwargs):
+        self.images.append(images_base64)
+        return await self.generate_description("", *args, **kwargs)
+
+
+class TestOrchestrator:
+    def orchestrator(self, providers):
+        resilience = MagicMock()
+        resilience.can_use_provider.return_value = True
+        orchestrator = VisionAnalysisOrchestrator(providers=providers, resilience_service=resilience)
+        orchestrator._get_provider_order = lambda: list(providers)
+        return orchestrator
+
+    @pytest.mark.asyncio
+    async def test_fallback_reuses_encoded_variant(self):
+        first = FailingThenOk("openai", success=False)
+        second = FailingThenOk("grok", success=True)
+        orchestrator = self.orchestrator({AIProvider.OPENAI: first, AIProvider.GROK: second})
+
+        with patch("app.services.vision_analysis_orchestrator.get_ai_cost_and_usage_tracker"):
+            result = await orchestrator.analyze_image(frame(400, 300), "Gate")
+
+        assert result.success and result.provider == "grok"
+        # Same target size for both providers: encoded once, sent twice
+        assert first.images == second.images
+        stats = get_image_payload_optimizer().get_stats()
+        assert stats["encodes"] == 1 and stats["reused_encodes"] == 1
+        assert stats["by_provider"]["openai"]["requests"] == 1
+        assert stats["by_provider"]["grok"]["bytes"] > 0
+
+    @pytest.mark.asyncio
+    async def test_regions_crop_frame_and_boxes_are_full_frame(self):
+        provider = FailingThenOk("openai", success=True)
+        orchestrator = self.orchestrator({AIProvider.OPENAI: provider})
+
+        with patch("app.services.vision_analysis_orchestrator.get_ai_cost_and_usage_tracker"), \
+                patch.object(get_image_payload_optimizer(), "crop_enabled", True):
+            result = await orchestrator.analyze_image(frame(1280, 720), "Gate", regions=[(100, 100, 100, 100)])
+
+        sent = cv2.imdecode(np.frombuffer(base64.b64decode(provider.images[0]), np.uint8), cv2.IMREAD_COLOR)
+        assert sent.shape[1] < 1280
+        box = result.bounding_boxes[0]
+        assert box["width"] < 1.0 and box["height"] < 1.0
+
+    @pytest.mark.asyncio
+    async def test_multi_frame_payloads_are_sized_per_provider(self):
+        provider = FailingThenOk("claude", success=True)
+        orchestrator = self.orchestrator({AIProvider.CLAUDE: provider})
+        jpeg = cv2.imencode(".jpg", frame(3000, 2000))[1].tobytes()
+
+        with patch("app.services.vision_analysis_orchestrator.get_ai_cost_and_usage_tracker"):
+            result = await orchestrator.analyze_images([jpeg, jpeg, b"not an image"], "Gate")
+
+        assert result.success
+        assert len(provider.images[0]) == 2
+        stats = get_image_payload_optimizer().get_stats()
+        assert stats["by_provider"]["claude"]["images"] == 2
+        assert stats["reused_encodes"] == 0  # distinct frames are encoded separately
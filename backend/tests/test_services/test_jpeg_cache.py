@@ -0,0 +1,167 @@
+"""
+Tests for the shared JPEG cache and conditional-GET helpers
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.services.jpeg_cache import (
+    JPEGCache,
+    content_etag,
+    get_jpeg_cache,
+    is_not_modified,
+    jpeg_response,
+    reset_jpeg_cache,
+)
+
+
+def _request(headers=None):
+    request = MagicMock()
+    request.headers = {k.lower(): v for k, v in (headers or {}).items()}
+    return request
+
+
+class TestJPEGCacheLRU:
+
+    def test_put_and_get(self):
+        cache = JPEGCache(max_bytes=1024)
+        entry = cache.put(("cam", 1, 640), b"abc")
+
+        assert cache.get(("cam", 1, 640)) is entry
+        assert entry.etag == content_etag(b"abc")
+        assert cache.size_bytes == 3
+
+    def test_evicts_least_recently_used(self):
+        cache = JPEGCache(max_bytes=10)
+        cache.put(("a",), b"1234")
+        cache.put(("b",), b"1234")
+        cache.get(("a",))  # a becomes most recently used
+        cache.put(("c",), b"1234")
+
+        assert cache.get(("b",)) is None
+        assert cache.get(("a",)) is not None
+        assert cache.get(("c",)) is not None
+        assert cache.size_bytes == 8
+        assert cache.evictions == 1
+
+    def test_oversized_entry_not_stored(self):
+        cache = JPEGCache(max_bytes=4)
+        entry = cache.put(("big",), b"12345")
+
+        assert entry.data == b"12345"
+        assert len(cache) == 0
+
+    def test_invalidate_by_source(self):
+        cache = JPEGCache(max_bytes=1024)
+        cache.put(("cam-1", 1, 640), b"a")
+        cache.put(("cam-1", 2, 320), b"b")
+        cache.put(("cam-2", 1, 640), b"c")
+
+        assert cache.invalidate("cam-1") == 2
+        assert len(cache) == 1
+        assert cache.size_bytes == 1
+
+    def test_singleton_reset(self):
+        first = get_jpeg_cache()
+        assert get_jpeg_cache() is first
+        reset_jpeg_cache()
+        assert get_jpeg_cache() is not first
+
+
+class TestJPEGCacheSingleFlight:
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_share_one_encode(self):
+        cache = JPEGCache(max_bytes=1024)
+        calls = 0
+
+        async def encode():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return b"jpeg"
+
+        results = await asyncio.gather(
+            *(cache.get_or_encode(("cam", 1, 640), encode) for _ in range(16))
+        )
+
+        assert calls == 1
+        assert all(r is results[0] for r in results)
+        assert cache.misses == 1
+
+    @pytest.mark.asyncio
+    async def test_none_result_is_not_cached(self):
+        cache = JPEGCache(max_bytes=1024)
+
+        async def encode():
+            return None
+
+        assert await cache.get_or_encode(("cam", 1, 640), encode) is None
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_encode_error_reaches_waiters_and_clears_inflight(self):
+        cache = JPEGCache(max_bytes=1024)
+
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            cache.get_or_encode(("cam", 1, 640), failing),
+            cache.get_or_encode(("cam", 1, 640), failing),
+            return_exceptions=True,
+        )
+
+        assert all(isinstance(r, ValueError) for r in results)
+
+        async def ok():
+            return b"jpeg"
+
+        entry = await cache.get_or_encode(("cam", 1, 640), ok)
+        assert entry.data == b"jpeg"
+
+
+class TestConditionalHelpers:
+
+    def test_if_none_match(self):
+        assert is_not_modified(_request({"If-None-Match": '"x", "y"'}), '"y"')
+        assert is_not_modified(_request({"If-None-Match": 'W/"y"'}), '"y"')
+        assert is_not_modified(_request({"If-None-Match": "*"}), '"y"')
+        assert not is_not_modified(_request({"If-None-Match": '"x"'}), '"y"')
+
+    def test_if_none_match_takes_precedence(self):
+        modified = datetime.now(timezone.utc) - timedelta(days=1)
+        request = _request({
+            "If-None-Match": '"other"',
+            "If-Modified-Since": format_datetime(datetime.now(timezone.utc), usegmt=True),
+        })
+        assert not is_not_modified(request, '"y"', modified)
+
+    def test_if_modified_since(self):
+        modified = datetime(2026, 1, 1, 12, 0, 0, 500000, tzinfo=timezone.utc)
+        same = _request({"If-Modified-Since": "Thu, 01 Jan 2026 12:00:00 GMT"})
+        older = _request({"If-Modified-Since": "Thu, 01 Jan 2026 11:00:00 GMT"})
+
+        assert is_not_modified(same, '"y"', modified)
+        assert not is_not_modified(older, '"y"', modified)
+        # Naive DB timestamps are treated as UTC
+        assert is_not_modified(same, '"y"', modified.replace(tzinfo=None))
+
+    def test_jpeg_response(self):
+        cache = JPEGCache(max_bytes=1024)
+        entry = cache.put(("cam", 1, 640), b"jpeg")
+
+        full = jpeg_response(_request(), entry)
+        assert full.status_code == 200
+        assert full.body == b"jpeg"
+        assert full.headers["etag"] == entry.etag
+        assert full.headers["content-type"] == "image/jpeg"
+
+        cached = jpeg_response(_request({"If-None-Match": entry.etag}), entry)
+        assert cached.status_code == 304
+        assert cached.body == b""
@@ -0,0 +1,94 @@
+"""
+Tests for the local vision-provider stand-ins and the OpenAI-compatible
+endpoint option of LiteLLMProvider.
+"""
+import random
+import statistics
+
+import httpx
+import pytest
+
+from app.services.ai_providers import LocalOpenAIServer, LocalProviderProfile, LocalVisionProvider
+from app.services.litellm_provider import LiteLLMProvider
+
+
+class TestLocalProviderProfile:
+    def test_latency_distribution_matches_percentiles(self):
+        profile = LocalProviderProfile(latency_p50_ms=1000, latency_p99_ms=4000)
+        rng = random.Random(7)
+        latencies = sorted(profile.sample(rng)[0] for _ in range(20000))
+
+        assert statistics.median(latencies) == pytest.approx(1000, rel=0.05)
+        assert latencies[int(len(latencies) * 0.99)] == pytest.approx(4000, rel=0.1)
+
+    def test_fixed_latency_and_error_rate(self):
+        profile = LocalProviderProfile(latency_p50_ms=50, latency_p99_ms=50, error_rate=0.25)
+        rng = random.Random(1)
+        draws = [profile.sample(rng, image_count=2) for _ in range(4000)]
+
+        assert {latency for latency, _, _ in draws} == {50}
+        assert sum(not ok for _, ok, _ in draws) / len(draws) == pytest.approx(0.25, abs=0.03)
+        assert draws[0][2] in (2 * 850, 2 * 850 + 60)
+
+    @pytest.mark.asyncio
+    async def test_vision_provider_is_repeatable_with_seed(self):
+        profile = LocalProviderProfile(latency_p50_ms=1, latency_p99_ms=5, error_rate=0.5, seed=3)
+        first, second = LocalVisionProvider(profile), LocalVisionProvider(profile)
+
+        results_a = [await first.generate_description("", "Cam", "now", ["person"]) for _ in range(10)]
+        results_b = [await second.generate_description("", "Cam", "now", ["person"]) for _ in range(10)]
+
+        assert [r.success for r in results_a] == [r.success for r in results_b]
+        assert first.calls == 10
+        failed = next(r for r in results_a if not r.success)
+        assert failed.provider == "local" and failed.error
+
+
+class TestLocalOpenAIServer:
+    def test_chat_completion_shape(self):
+        profile = LocalProviderProfile(latency_p50_ms=1, latency_p99_ms=1, seed=0)
+        with LocalOpenAIServer(profile) as server:
+            response = httpx.post(f"{server.base_url}/chat/completions", json={
+                "model": "gpt-4o-mini",
+                "messages": [{"role": "user", "content": [
+                    {"type": "text", "text": "describe"},
+                    {"type": "image_url", "image_url": {"url": "data:image/jpeg;base64,AAAA"}},
+                ]}],
+            })
+
+        body = response.json()
+        assert response.status_code == 200
+        assert body["choices"][0]["message"]["content"] == profile.description
+        assert body["usage"]["total_tokens"] == 850 + 60
+        assert server.requests == 1
+
+    def test_injected_failure_is_a_server_error(self):
+        profile = LocalProviderProfile(latency_p50_ms=1, latency_p99_ms=1, error_rate=1.0)
+        with LocalOpenAIServer(profile) as server:
+            response = httpx.post(f"{server.base_url}/chat/completions", json={"messages": []})
+
+        assert response.status_code == 500
+        assert response.json()["error"]["type"] == "server_error"
+
+
+class TestLiteLLMApiBase:
+    def test_openai_api_base_is_passed_to_router(self):
+        provider = LiteLLMProvider(openai_key="sk-test", openai_api_base="http://127.0.0.1:9/v1")
+
+        assert provider.model_list[0]["litellm_params"]["api_base"] == "http://127.0.0.1:9/v1"
+
+    def test_no_api_base_by_default(self):
+        provider = LiteLLMProvider(openai_key="sk-test")
+
+        assert "api_base" not in provider.model_list[0]["litellm_params"]
+
+    @pytest.mark.asyncio
+    async def test_describe_image_against_local_server(self):
+        profile = LocalProviderProfile(latency_p50_ms=1, latency_p99_ms=1, seed=0)
+        with LocalOpenAIServer(profile) as server:
+            provider = LiteLLMProvider(openai_key="local", openai_api_base=server.base_url, num_retries=0)
+            result = await provider.describe_image("AAAA", "system", "describe")
+
+        assert result.success, result.error
+        assert result.description.startswith("A person")
+        assert result.tokens_used == 910
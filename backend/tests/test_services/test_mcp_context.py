@@ -8,6 +8,8 @@ caching, performance metrics, prompt formatting, and fail-open behavior.
 """
 
 import pytest
+import time
+from collections import Counter
 from datetime import datetime, timezone, timedelta
 from unittest.mock import MagicMock, patch, PropertyMock
 import uuid
@@ -1969,3 +1971,159 @@ class TestContextCachingWithEntity:
 
         # Entity should still be in result
         assert result2.entity is not None
+
+
+class TestLayeredContextCache:
+    """Tests for component caches, explicit invalidation and the assembled LRU."""
+
+    @pytest.fixture
+    def provider(self):
+        """Provider whose component loaders are counting stubs."""
+        provider = MCPContextProvider()
+        provider.calls = Counter()
+
+        def stub(name, value):
+            async def load(*args):
+                provider.calls[name] += 1
+                return value(*args) if callable(value) else value
+            return load
+
+        provider._get_feedback_context = stub(
+            "feedback", FeedbackContext(accuracy_rate=0.9, total_feedback=10, common_corrections=[], recent_negative_reasons=[])
+        )
+        provider._get_camera_context = stub(
+            "camera", lambda db, camera_id: CameraContext(camera_id, "Front Door", ["person"], [])
+        )
+        provider._get_time_pattern_context = stub(
+            "time_pattern", lambda db, camera_id, event_time: TimePatternContext(event_time.hour, "low", False, 0.2)
+        )
+        provider._get_entity_context = stub(
+            "entity", lambda db, entity_id: EntityContext(entity_id, "Mail carrier", "person", {}, None, 4)
+        )
+        return provider
+
+    @pytest.fixture
+    def event_time(self):
+        return datetime(2024, 1, 15, 14, 0, 0, tzinfo=timezone.utc)
+
+    def _expire_assembled(self, provider):
+        for cached in provider._cache.values():
+            cached.created_at = datetime.now(timezone.utc) - timedelta(seconds=provider.CACHE_TTL_SECONDS + 1)
+
+    @pytest.mark.asyncio
+    async def test_expired_context_is_rebuilt_from_components(self, provider, event_time):
+        db = MagicMock()
+        await provider.get_context("cam-1", event_time, entity_id="ent-1", db=db)
+        self._expire_assembled(provider)
+
+        context = await provider.get_context("cam-1", event_time, entity_id="ent-1", db=db)
+
+        assert context.camera.location_hint == "Front Door"
+        assert context.entity.name == "Mail carrier"
+        assert provider.calls == {"feedback": 1, "camera": 1, "time_pattern": 1, "entity": 1}
+
+    @pytest.mark.asyncio
+    async def test_invalidate_feedback_reloads_feedback_and_camera_only(self, provider, event_time):
+        db = MagicMock()
+        await provider.get_context("cam-1", event_time, db=db)
+        await provider.get_context("cam-2", event_time, db=db)
+
+        provider.invalidate_feedback("cam-1")
+        assert "cam-1" not in provider._cache
+        assert "cam-2" in provider._cache
+        await provider.get_context("cam-1", event_time, db=db)
+
+        assert provider.calls == {"feedback": 3, "camera": 3, "time_pattern": 2}
+
+    @pytest.mark.asyncio
+    async def test_invalidate_patterns_and_entity(self, provider, event_time):
+        db = MagicMock()
+        await provider.get_context("cam-1", event_time, entity_id="ent-1", db=db)
+
+        provider.invalidate_patterns("cam-1")
+        provider.invalidate_entity("ent-1")
+        await provider.get_context("cam-1", event_time, entity_id="ent-1", db=db)
+
+        assert provider.calls == {"feedback": 1, "camera": 1, "time_pattern": 2, "entity": 2}
+
+    @pytest.mark.asyncio
+    async def test_hour_change_uses_time_pattern_for_new_hour(self, provider, event_time):
+        db = MagicMock()
+        await provider.get_context("cam-1", event_time, db=db)
+
+        context = await provider.get_context("cam-1", event_time.replace(hour=3), db=db)
+
+        assert context.time_pattern.hour == 3
+        assert provider._cache["cam-1"].context.time_pattern.hour == 14
+        assert provider.calls["time_pattern"] == 2
+
+    @pytest.mark.asyncio
+    async def test_assembled_cache_is_lru_bounded(self, provider, event_time):
+        provider.CACHE_MAX_SIZE = 2
+        db = MagicMock()
+        await provider.get_context("cam-1", event_time, db=db)
+        await provider.get_context("cam-2", event_time, db=db)
+        await provider.get_context("cam-1", event_time, db=db)  # cam-1 becomes most recent
+        await provider.get_context("cam-3", event_time, db=db)
+
+        assert list(provider._cache) == ["cam-1", "cam-3"]
+        assert provider.get_metrics()["cache_evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_failed_components_are_not_cached(self, provider, event_time):
+        async def broken(db, camera_id):
+            provider.calls["camera"] += 1
+            raise RuntimeError("db gone")
+
+        provider._get_camera_context = broken
+        db = MagicMock()
+        await provider.get_context("cam-1", event_time, db=db)
+        self._expire_assembled(provider)
+        context = await provider.get_context("cam-1", event_time, db=db)
+
+        assert context.camera is None
+        assert provider.calls["camera"] == 2
+        assert provider.calls["feedback"] == 1
+
+    @pytest.mark.asyncio
+    async def test_load_racing_an_invalidation_is_not_stored(self, provider):
+        cache = provider._feedback_cache
+
+        async def load():
+            provider.invalidate_feedback("cam-1")
+            return "stale"
+
+        assert await provider._get_cached_component(cache, "cam-1", load) == "stale"
+        assert cache.get("cam-1") == (False, None)
+
+    def test_component_cache_expires_and_evicts(self):
+        from app.services.mcp_context import ComponentCache
+
+        cache = ComponentCache("test", ttl_seconds=60, max_size=2)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+
+        assert cache.get("b") == (False, None)
+        with patch("app.services.mcp_context.time.monotonic", return_value=time.monotonic() + 61):
+            assert cache.get("a") == (False, None)
+        assert cache.stats()["evictions"] == 1
+
+    @pytest.mark.asyncio
+    async def test_metrics_report_layers_and_gather_times(self, provider, event_time):
+        db = MagicMock()
+        await provider.get_context("cam-1", event_time, db=db)
+        await provider.get_context("cam-1", event_time, db=db)
+        self._expire_assembled(provider)
+        await provider.get_context("cam-1", event_time, db=db)
+
+        metrics = provider.get_metrics()
+
+        assert metrics["cache_hits"] == 1
+        assert metrics["gather_count"] == 2
+        assert metrics["avg_gather_time_ms"] >= 0
+        assert metrics["components"]["feedback"] == {
+            "size": 1, "hits": 1, "misses": 1, "hit_rate": 0.5, "evictions": 0,
+        }
+        assert metrics["component_hit_rate"] == 0.5
@@ -0,0 +1,220 @@
+"""Tests for the content-addressed media store and Event blob externalization."""
+import base64
+import json
+import os
+import time
+
+import pytest
+
+from app.models.event import Event
+from app.models.media_blob import MediaBlob
+from app.services.media_store import (
+    MediaStore,
+    decode_base64_payload,
+    get_media_store,
+    parse_digest_list,
+)
+from tests.conftest import make_camera, make_event
+
+JPEG_A = b"\xff\xd8\xff\xe0" + b"A" * 64
+JPEG_B = b"\xff\xd8\xff\xe0" + b"B" * 64
+
+
+def _b64(data: bytes) -> str:
+    return base64.b64encode(data).decode("ascii")
+
+
+@pytest.fixture
+def store(_isolated_media_store, tmp_path):
+    """Media store singleton rooted in a temp directory (see conftest)."""
+    assert _isolated_media_store.root.is_relative_to(tmp_path)
+    return _isolated_media_store
+
+
+@pytest.fixture
+def camera(db_session):
+    return make_camera(db_session=db_session)
+
+
+def _ref_count(db_session, digest):
+    blob = db_session.get(MediaBlob, digest)
+    return blob.ref_count if blob else None
+
+
+class TestMediaStoreFiles:
+    def test_put_is_content_addressed_and_idempotent(self, store):
+        digest = store.put(JPEG_A)
+
+        assert store.put(JPEG_A) == digest
+        assert store.path_for(digest) == store.root / digest[:2] / digest
+        assert store.read(digest) == JPEG_A
+        assert store.size_of(digest) == len(JPEG_A)
+        assert len(list(store.root.glob("*/*"))) == 1
+
+    def test_put_base64_accepts_data_uri(self, store):
+        digest = store.put_base64(f"data:image/jpeg;base64,{_b64(JPEG_A)}")
+
+        assert store.read_base64(digest) == _b64(JPEG_A)
+
+    def test_iter_chunks_streams_whole_blob(self, store):
+        data = os.urandom(200_000)
+        digest = store.put(data)
+
+        chunks = list(store.iter_chunks(digest, chunk_size=64 * 1024))
+
+        assert len(chunks) == 4
+        assert b"".join(chunks) == data
+
+    def test_rejects_non_digest_names(self, store):
+        with pytest.raises(ValueError):
+            store.path_for("../../etc/passwd")
+        assert store.read("not-a-digest") is None
+        assert not store.exists("0" * 63)
+
+    def test_invalid_base64_raises_value_error(self):
+        with pytest.raises(ValueError):
+            decode_base64_payload("abc")
+
+    def test_parse_digest_list_tolerates_garbage(self):
+        assert parse_digest_list(None) == []
+        assert parse_digest_list("not json") == []
+        assert parse_digest_list('{"a": 1}') == []
+        assert parse_digest_list('["x", 3]') == ["x"]
+
+
+class TestEventMediaFields:
+    def test_thumbnail_is_stored_out_of_row(self, store, db_session, camera):
+        event = make_event(db_session=db_session, camera_id=camera.id, thumbnail_base64=_b64(JPEG_A))
+        db_session.expire_all()
+
+        event = db_session.get(Event, event.id)
+        assert event.thumbnail_hash == store.put(JPEG_A)
+        assert event.thumbnail_base64 == _b64(JPEG_A)
+        assert _ref_count(db_session, event.thumbnail_hash) == 1
+
+    def test_blob_is_written_on_flush_not_on_assignment(self, store, db_session, camera):
+        event = make_event(camera_id=camera.id, thumbnail_base64=_b64(JPEG_A))
+
+        assert event.thumbnail_base64 == _b64(JPEG_A)
+        assert list(store.root.glob("*/*")) == []
+
+        db_session.add(event)
+        db_session.flush()
+
+        assert store.read(event.thumbnail_hash) == JPEG_A
+
+    def test_hybrid_expression_filters_on_digest(self, store, db_session, camera):
+        with_thumb = make_event(db_session=db_session, camera_id=camera.id, thumbnail_base64=_b64(JPEG_A))
+        make_event(db_session=db_session, camera_id=camera.id)
+
+        ids = [e.id for e in db_session.query(Event).filter(Event.thumbnail_base64.isnot(None))]
+
+        assert ids == [with_thumb.id]
+
+    def test_key_frames_accept_list_and_json(self, store, db_session, camera):
+        from_list = make_event(
+            db_session=db_session, camera_id=camera.id,
+            key_frames_base64=[_b64(JPEG_A), _b64(JPEG_B)],
+        )
+        from_json = make_event(
+            db_session=db_session, camera_id=camera.id,
+            key_frames_base64=json.dumps([_b64(JPEG_A)]),
+        )
+
+        assert from_list.key_frame_digests == [store.put(JPEG_A), store.put(JPEG_B)]
+        assert json.loads(from_list.key_frames_base64) == [_b64(JPEG_A), _b64(JPEG_B)]
+        assert from_json.key_frame_digests == [store.put(JPEG_A)]
+
+    def test_duplicate_frames_share_one_blob(self, store, db_session, camera):
+        make_event(db_session=db_session, camera_id=camera.id, thumbnail_base64=_b64(JPEG_A))
+        make_event(
+            db_session=db_session, camera_id=camera.id,
+            thumbnail_base64=_b64(JPEG_A), key_frames_base64=[_b64(JPEG_A), _b64(JPEG_B)],
+        )
+
+        assert len(list(store.root.glob("*/*"))) == 2
+        assert _ref_count(db_session, store.put(JPEG_A)) == 3
+        assert _ref_count(db_session, store.put(JPEG_B)) == 1
+
+    def test_update_and_delete_adjust_ref_counts(self, store, db_session, camera):
+        event = make_event(db_session=db_session, camera_id=camera.id, thumbnail_base64=_b64(JPEG_A))
+        digest_a, digest_b = store.put(JPEG_A), store.put(JPEG_B)
+
+        event.thumbnail_base64 = _b64(JPEG_B)
+        db_session.commit()
+        assert _ref_count(db_session, digest_a) == 0
+        assert _ref_count(db_session, digest_b) == 1
+
+        db_session.delete(event)
+        db_session.commit()
+        assert _ref_count(db_session, digest_b) == 0
+
+    def test_rolled_back_insert_keeps_no_reference(self, store, db_session, camera):
+        event = make_event(camera_id=camera.id, thumbnail_base64=_b64(JPEG_A))
+        db_session.add(event)
+        db_session.flush()
+        db_session.rollback()
+
+        assert _ref_count(db_session, store.put(JPEG_A)) is None
+
+
+class TestGarbageCollection:
+    def test_bulk_deleted_events_release_blobs(self, store, db_session, camera):
+        keep = make_event(db_session=db_session, camera_id=camera.id, thumbnail_base64=_b64(JPEG_A))
+        gone = make_event(db_session=db_session, camera_id=camera.id, key_frames_base64=[_b64(JPEG_B)])
+        gone_digest = gone.key_frame_digests[0]
+        db_session.query(Event).filter(Event.id == gone.id).delete(synchronize_session=False)
+        db_session.commit()
+
+        stats = store.collect_garbage(db_session, grace_seconds=0)
+
+        assert stats["blobs_deleted"] == 1
+        assert stats["bytes_freed"] == len(JPEG_B)
+        assert store.exists(keep.thumbnail_hash)
+        assert not store.exists(gone_digest)
+        assert db_session.get(MediaBlob, keep.thumbnail_hash).ref_count == 1
+        assert db_session.query(MediaBlob).count() == 1
+
+    def test_stale_untracked_files_are_swept(self, store, db_session):
+        fresh = store.put(JPEG_A)
+        stale = store.put(JPEG_B)
+        old = time.time() - 7200
+        os.utime(store.path_for(stale), (old, old))
+
+        stats = store.collect_garbage(db_session, grace_seconds=3600)
+
+        assert stats["orphans_deleted"] == 1
+        assert store.exists(fresh)
+        assert not store.exists(stale)
+
+    def test_recently_released_blobs_survive_grace_period(self, store, db_session, camera):
+        recent = make_event(db_session=db_session, camera_id=camera.id, thumbnail_base64=_b64(JPEG_A))
+        old = make_event(db_session=db_session, camera_id=camera.id, thumbnail_base64=_b64(JPEG_B))
+        recent_digest, old_digest = recent.thumbnail_hash, old.thumbnail_hash
+        db_session.delete(recent)
+        db_session.delete(old)
+        db_session.commit()
+        stale = time.time() - 7200
+        os.utime(store.path_for(old_digest), (stale, stale))
+
+        stats = store.collect_garbage(db_session, grace_seconds=3600)
+
+        assert stats["blobs_deleted"] == 1
+        assert store.exists(recent_digest)
+        assert not store.exists(old_digest)
+        assert _ref_count(db_session, recent_digest) == 0
+        assert _ref_count(db_session, old_digest) is None
+
+    def test_re_put_refreshes_grace_period(self, store, db_session):
+        digest = store.put(JPEG_A)
+        stale = time.time() - 7200
+        os.utime(store.path_for(digest), (stale, stale))
+
+        store.put(JPEG_A)
+        stats = store.collect_garbage(db_session, grace_seconds=3600)
+
+        assert stats["orphans_deleted"] == 0
+        assert store.exists(digest)
+
+    def test_singleton_accessor(self, store):
+        assert get_media_store() is store
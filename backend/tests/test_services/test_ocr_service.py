@@ -212,6 +212,162 @@ class TestIsOcrAvailable:
         assert isinstance(result, bool)
 
 
+def _overlay_frame(text: str = "CAM 1 12:00:00") -> np.ndarray:
+    """640x480 frame with white overlay text in the bottom-left corner."""
+    import cv2
+
+    frame = np.full((480, 640, 3), 90, dtype=np.uint8)
+    cv2.putText(frame, text, (5, 465), cv2.FONT_HERSHEY_SIMPLEX, 0.7, (255, 255, 255), 2)
+    return frame
+
+
+class TestOverlayProfiles:
+    """Per-camera learned overlay region and unchanged-overlay skip."""
+
+    @pytest.fixture(autouse=True)
+    def ocr_enabled(self):
+        from app.services import ocr_service
+
+        ocr_service.reset_overlay_profiles()
+        with patch.object(ocr_service, "OCR_AVAILABLE", True):
+            yield
+        ocr_service.reset_overlay_profiles()
+
+    @staticmethod
+    def _fake_ocr(calls, region="bottom_left", timestamp="12:00:00"):
+        def ocr(region_name, crop):
+            calls.append(region_name)
+            if region_name != region:
+                return None
+            return OCRResult(region=region_name, timestamp=timestamp, camera_name="1", raw_text="CAM 1 12:00:00")
+        return ocr
+
+    def test_first_frame_probes_and_learns_region(self):
+        from app.services import ocr_service
+
+        calls = []
+        with patch.object(ocr_service, "_ocr_region", side_effect=self._fake_ocr(calls)):
+            result = ocr_service.extract_overlay_text(_overlay_frame(), camera_id="cam-1")
+
+        assert result.region == "bottom_left"
+        # Corners are read in parallel; later corners may still be running
+        assert {"top_left", "top_right", "bottom_left"} <= set(calls)
+        profile = ocr_service.get_overlay_profile("cam-1")
+        assert profile.region == "bottom_left"
+        assert profile.bbox == (0, 432, 213, 48)
+
+    def test_unchanged_overlay_skips_ocr(self):
+        from app.services import ocr_service
+
+        calls = []
+        with patch.object(ocr_service, "_ocr_region", side_effect=self._fake_ocr(calls)):
+            first = ocr_service.extract_overlay_text(_overlay_frame(), camera_id="cam-1")
+            calls.clear()
+            second = ocr_service.extract_overlay_text(_overlay_frame(), camera_id="cam-1")
+
+        assert calls == []
+        assert second is first
+
+    def test_near_identical_timestamp_overlay_is_re_read(self):
+        from app.services import ocr_service
+
+        frame = _overlay_frame()
+        nudged = frame.copy()
+        nudged[470, 5] ^= 1  # within the perceptual hash distance
+
+        calls = []
+        with patch.object(ocr_service, "_ocr_region", side_effect=self._fake_ocr(calls)):
+            ocr_service.extract_overlay_text(frame, camera_id="cam-1")
+            calls.clear()
+            ocr_service.extract_overlay_text(nudged, camera_id="cam-1")
+
+        assert calls == ["bottom_left"]
+
+    def test_near_identical_name_only_overlay_skips_ocr(self):
+        from app.services import ocr_service
+
+        frame = _overlay_frame("FRONT DOOR")
+        nudged = frame.copy()
+        nudged[470, 5] ^= 1
+
+        calls = []
+        with patch.object(ocr_service, "_ocr_region", side_effect=self._fake_ocr(calls, timestamp=None)):
+            ocr_service.extract_overlay_text(frame, camera_id="cam-1")
+            calls.clear()
+            ocr_service.extract_overlay_text(nudged, camera_id="cam-1")
+
+        assert calls == []
+
+    def test_changed_overlay_reads_only_learned_region(self):
+        from app.services import ocr_service
+
+        calls = []
+        with patch.object(ocr_service, "_ocr_region", side_effect=self._fake_ocr(calls)):
+            ocr_service.extract_overlay_text(_overlay_frame("CAM 1 12:00:00"), camera_id="cam-1")
+            calls.clear()
+            ocr_service.extract_overlay_text(_overlay_frame("CAM 1 12:48:57"), camera_id="cam-1")
+
+        assert calls == ["bottom_left"]
+
+    def test_profile_is_forgotten_after_repeated_misses(self):
+        from app.services import ocr_service
+
+        calls = []
+        with patch.object(ocr_service, "_ocr_region", side_effect=self._fake_ocr(calls)):
+            ocr_service.extract_overlay_text(_overlay_frame(), camera_id="cam-1")
+
+        # Overlay moved to the top-right corner
+        calls.clear()
+        with patch.object(ocr_service, "_ocr_region", side_effect=self._fake_ocr(calls, "top_right")), \
+                patch.object(ocr_service.settings, "OCR_PROFILE_MAX_MISSES", 2):
+            assert ocr_service.extract_overlay_text(_overlay_frame("CAM 1 13:00:00"), camera_id="cam-1") is None
+            result = ocr_service.extract_overlay_text(_overlay_frame("CAM 1 13:00:01"), camera_id="cam-1")
+
+        assert result.region == "top_right"
+        assert calls[:2] == ["bottom_left", "bottom_left"]
+        assert "top_right" in calls[2:]
+        assert ocr_service.get_overlay_profile("cam-1").region == "top_right"
+
+    def test_without_camera_id_every_frame_is_probed(self):
+        from app.services import ocr_service
+
+        calls = []
+        with patch.object(ocr_service, "_ocr_region", side_effect=self._fake_ocr(calls)):
+            ocr_service.extract_overlay_text(_overlay_frame())
+            ocr_service.extract_overlay_text(_overlay_frame())
+
+        assert len(calls) == 8
+        assert ocr_service.get_overlay_profile("cam-1") is None
+
+    def test_probe_runs_regions_in_parallel(self):
+        import time
+        from app.services import ocr_service
+
+        def slow_tesseract(image, config=None):
+            time.sleep(0.1)
+            return ""
+
+        fake = MagicMock()
+        fake.image_to_string.side_effect = slow_tesseract
+        with patch.object(ocr_service, "pytesseract", fake, create=True):
+            t0 = time.perf_counter()
+            result = ocr_service.extract_overlay_text(_overlay_frame(), camera_id="cam-1")
+            elapsed = time.perf_counter() - t0
+
+        assert result is None
+        assert fake.image_to_string.call_count == 4
+        assert elapsed < 0.3
+
+    def test_overlay_hash_tolerates_identical_and_flags_changed_text(self):
+        from app.services.ocr_service import _hash_distance, overlay_hash
+
+        crop = _overlay_frame()[432:480, 0:213]
+        changed = _overlay_frame("CAM 1 12:48:57")[432:480, 0:213]
+
+        assert _hash_distance(overlay_hash(crop), overlay_hash(crop.copy())) == 0
+        assert _hash_distance(overlay_hash(crop), overlay_hash(changed)) > 2
+
+
 # NOTE: TestBuildContextPromptWithOCR (4 tests) was removed.
 #
 # Those tests imported `build_context_prompt` from `app.services.ai_service`
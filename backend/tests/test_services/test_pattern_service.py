@@ -33,6 +33,11 @@ from app.models.event import Event
 from app.models.camera import Camera
 
 
+def _time_buckets(timestamps) -> list[tuple[int, int, int]]:
+    """(hour, SQL day-of-week with Sunday=0, count) rows, one per timestamp."""
+    return [(ts.hour, (ts.weekday() + 1) % 7, 1) for ts in timestamps]
+
+
 class TestPatternServiceCalculations:
     """Test pattern calculation methods."""
 
@@ -43,14 +48,12 @@ class TestPatternServiceCalculations:
 
     def test_calculate_hourly_distribution_basic(self):
         """AC1: Test hourly distribution calculation with events spread across hours."""
-        # Create mock events at specific hours
-        events = []
-        for hour in [9, 9, 9, 14, 14, 17, 17, 17, 17]:
-            event = MagicMock(spec=Event)
-            event.timestamp = datetime(2025, 12, 10, hour, 30, tzinfo=timezone.utc)
-            events.append(event)
+        timestamps = [
+            datetime(2025, 12, 10, hour, 30, tzinfo=timezone.utc)
+            for hour in [9, 9, 9, 14, 14, 17, 17, 17, 17]
+        ]
 
-        result = self.service._calculate_hourly_distribution(events)
+        result, _ = self.service._fold_time_buckets(_time_buckets(timestamps))
 
         # Verify structure
         assert len(result) == 24  # All hours represented
@@ -65,35 +68,21 @@ class TestPatternServiceCalculations:
 
     def test_calculate_hourly_distribution_empty(self):
         """AC1: Test hourly distribution with no events."""
-        result = self.service._calculate_hourly_distribution([])
+        result, _ = self.service._fold_time_buckets([])
 
         assert len(result) == 24
         assert all(count == 0 for count in result.values())
 
     def test_calculate_daily_distribution_basic(self):
         """AC2: Test daily distribution calculation across days of week."""
-        # Create events: 3 on Monday (0), 5 on Wednesday (2), 2 on Saturday (5)
-        events = []
-
-        # Monday events (2025-12-08 is a Monday)
-        for _ in range(3):
-            event = MagicMock(spec=Event)
-            event.timestamp = datetime(2025, 12, 8, 10, 0, tzinfo=timezone.utc)
-            events.append(event)
-
-        # Wednesday events (2025-12-10 is a Wednesday)
-        for _ in range(5):
-            event = MagicMock(spec=Event)
-            event.timestamp = datetime(2025, 12, 10, 14, 0, tzinfo=timezone.utc)
-            events.append(event)
+        # 3 on Monday (0), 5 on Wednesday (2), 2 on Saturday (5)
+        timestamps = (
+            [datetime(2025, 12, 8, 10, 0, tzinfo=timezone.utc)] * 3  # Monday
+            + [datetime(2025, 12, 10, 14, 0, tzinfo=timezone.utc)] * 5  # Wednesday
+            + [datetime(2025, 12, 13, 9, 0, tzinfo=timezone.utc)] * 2  # Saturday
+        )
 
-        # Saturday events (2025-12-13 is a Saturday)
-        for _ in range(2):
-            event = MagicMock(spec=Event)
-            event.timestamp = datetime(2025, 12, 13, 9, 0, tzinfo=timezone.utc)
-            events.append(event)
-
-        result = self.service._calculate_daily_distribution(events)
+        _, result = self.service._fold_time_buckets(_time_buckets(timestamps))
 
         # Verify structure
         assert len(result) == 7  # All days represented
@@ -391,10 +380,9 @@ class TestPatternServiceEdgeCases:
 
     def test_calculate_hourly_distribution_single_event(self):
         """Test hourly distribution with single event."""
-        event = MagicMock(spec=Event)
-        event.timestamp = datetime(2025, 12, 10, 12, 0, tzinfo=timezone.utc)
+        timestamp = datetime(2025, 12, 10, 12, 0, tzinfo=timezone.utc)
 
-        result = self.service._calculate_hourly_distribution([event])
+        result, _ = self.service._fold_time_buckets(_time_buckets([timestamp]))
 
         assert result["12"] == 1
         assert sum(result.values()) == 1
@@ -430,15 +418,12 @@ class TestObjectTypeDistribution:
 
     def test_calculate_object_type_distribution_basic(self):
         """P4-7.1 AC5: Test object type distribution calculation."""
-        events = []
-
-        # Create events with various object types
-        for objects in [["person"], ["person", "vehicle"], ["vehicle"], ["person"], ["package"]]:
-            event = MagicMock(spec=Event)
-            event.objects_detected = json.dumps(objects)
-            events.append(event)
+        buckets = [
+            (json.dumps(objects), 1)
+            for objects in [["person"], ["person", "vehicle"], ["vehicle"], ["person"], ["package"]]
+        ]
 
-        result = self.service._calculate_object_type_distribution(events)
+        result = self.service._fold_object_buckets(buckets)
 
         assert result["person"] == 3
         assert result["vehicle"] == 2
@@ -446,37 +431,17 @@ class TestObjectTypeDistribution:
 
     def test_calculate_object_type_distribution_empty(self):
         """P4-7.1 AC5: Test object type distribution with no events."""
-        result = self.service._calculate_object_type_distribution([])
+        result = self.service._fold_object_buckets([])
         assert result == {}
 
     def test_calculate_object_type_distribution_no_objects(self):
         """P4-7.1 AC5: Test handling events with no objects_detected."""
-        events = []
-
-        event1 = MagicMock(spec=Event)
-        event1.objects_detected = None
-        events.append(event1)
-
-        event2 = MagicMock(spec=Event)
-        event2.objects_detected = json.dumps([])
-        events.append(event2)
-
-        result = self.service._calculate_object_type_distribution(events)
+        result = self.service._fold_object_buckets([(None, 1), (json.dumps([]), 1)])
         assert result == {}
 
     def test_calculate_object_type_distribution_invalid_json(self):
         """P4-7.1 AC5: Test handling events with invalid JSON in objects_detected."""
-        events = []
-
-        event1 = MagicMock(spec=Event)
-        event1.objects_detected = "invalid json"
-        events.append(event1)
-
-        event2 = MagicMock(spec=Event)
-        event2.objects_detected = json.dumps(["person"])
-        events.append(event2)
-
-        result = self.service._calculate_object_type_distribution(events)
+        result = self.service._fold_object_buckets([("invalid json", 1), (json.dumps(["person"]), 1)])
         # Should skip invalid JSON and count valid ones
         assert result == {"person": 1}
 
@@ -667,3 +632,131 @@ class TestGetPatternsWithObjectTypes:
 
         assert result.object_type_distribution is None
         assert result.dominant_object_type is None
+
+
+def _seed_events(db, camera_id: str, count: int, seed: int = 1) -> list[Event]:
+    """Insert `count` events spread over the last 25 days."""
+    import random
+    from tests.conftest import make_event
+
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    object_sets = ['["person"]', '["vehicle"]', '["person", "package"]', '[]', "not json"]
+    events = [
+        make_event(
+            camera_id=camera_id,
+            timestamp=now - timedelta(days=rng.uniform(8, 25), hours=rng.uniform(0, 24)),
+            objects_detected=rng.choice(object_sets),
+        )
+        for _ in range(count)
+    ]
+    db.add_all(events)
+    db.commit()
+    return events
+
+
+def python_distributions(events: list[Event]) -> tuple[dict, dict, dict]:
+    """Reference (hourly, daily, object type) distributions folded row by row."""
+    hourly = {str(h).zfill(2): 0 for h in range(24)}
+    daily = {str(d): 0 for d in range(7)}
+    object_types: dict[str, int] = {}
+    for event in events:
+        hourly[str(event.timestamp.hour).zfill(2)] += 1
+        daily[str(event.timestamp.weekday())] += 1
+        try:
+            objects = json.loads(event.objects_detected) if event.objects_detected else []
+        except (json.JSONDecodeError, TypeError):
+            continue
+        for obj_type in objects:
+            object_types[obj_type] = object_types.get(obj_type, 0) + 1
+    return hourly, daily, object_types
+
+
+class TestSqlAggregatedRecalculation:
+    """recalculate_patterns() aggregates in SQL and caches the baseline."""
+
+    def setup_method(self):
+        reset_pattern_service()
+        self.service = PatternService()
+
+    @pytest.mark.asyncio
+    async def test_sql_aggregation_matches_python_distributions(self, db_session):
+        from tests.conftest import make_camera
+
+        camera = make_camera(db_session=db_session)
+        events = _seed_events(db_session, camera.id, 300)
+
+        pattern = await self.service.recalculate_patterns(db_session, camera.id, force=True)
+
+        hourly, daily, object_types = python_distributions(events)
+        assert json.loads(pattern.hourly_distribution) == hourly
+        assert json.loads(pattern.daily_distribution) == daily
+        assert json.loads(pattern.object_type_distribution) == object_types
+        assert pattern.average_events_per_day == 300 / PatternService.DEFAULT_WINDOW_DAYS
+
+    @pytest.mark.asyncio
+    async def test_recalculation_does_not_load_event_rows(self, db_session):
+        from tests.conftest import make_camera
+
+        camera = make_camera(db_session=db_session)
+        _seed_events(db_session, camera.id, 50)
+
+        with patch.object(db_session, "query", wraps=db_session.query) as query:
+            await self.service.recalculate_patterns(db_session, camera.id, force=True)
+
+        assert all(call.args[0] is not Event for call in query.call_args_list)
+
+    @pytest.mark.asyncio
+    async def test_baseline_is_served_from_memory(self, db_session):
+        from tests.conftest import make_camera
+
+        camera = make_camera(db_session=db_session)
+        _seed_events(db_session, camera.id, 50)
+        await self.service.recalculate_patterns(db_session, camera.id, force=True)
+
+        db = MagicMock()
+        result = await self.service.get_patterns(db, camera.id)
+
+        db.query.assert_not_called()
+        assert sum(result.hourly_distribution.values()) == 50
+
+    @pytest.mark.asyncio
+    async def test_incremental_update_refreshes_cached_baseline(self, db_session):
+        from tests.conftest import make_camera, make_event
+
+        camera = make_camera(db_session=db_session)
+        _seed_events(db_session, camera.id, 50)
+        await self.service.recalculate_patterns(db_session, camera.id, force=True)
+
+        event = make_event(
+            db_session=db_session,
+            camera_id=camera.id,
+            timestamp=datetime(2025, 12, 10, 14, 30, tzinfo=timezone.utc),
+            objects_detected='["bicycle"]',
+        )
+        await self.service.update_baseline_incremental(db_session, camera.id, event)
+
+        cached = self.service.get_cached_patterns(camera.id)
+        assert sum(cached.hourly_distribution.values()) == 51
+        assert cached.object_type_distribution["bicycle"] == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_baseline_is_reread(self):
+        db = MagicMock()
+        mock_pattern = MagicMock(spec=CameraActivityPattern)
+        mock_pattern.hourly_distribution = json.dumps({"09": 1})
+        mock_pattern.daily_distribution = json.dumps({"0": 1})
+        mock_pattern.peak_hours = json.dumps([])
+        mock_pattern.quiet_hours = json.dumps([])
+        mock_pattern.object_type_distribution = None
+        mock_pattern.average_events_per_day = 1.0
+        mock_pattern.last_calculated_at = datetime.now(timezone.utc)
+        mock_pattern.calculation_window_days = 30
+        db.query.return_value.filter_by.return_value.first.return_value = mock_pattern
+
+        await self.service.get_patterns(db, "cam")
+        with patch.object(PatternService, "BASELINE_CACHE_TTL_SECONDS", -1):
+            assert self.service.get_cached_patterns("cam") is None
+        await self.service.get_patterns(db, "cam")
+
+        assert db.query.call_count == 2
@@ -266,10 +266,10 @@ class TestMatchFacesToPersons:
             mock_chain.filter = filter_handler
             return mock_chain
 
-        # Simpler approach: mock match_single_face directly for this test
-        original_match = person_service.match_single_face
+        # Simpler approach: mock the per-face matcher directly for this test
+        original_match = person_service._match_single_face
 
-        async def mock_match(db, fid, **kwargs):
+        def mock_match(db, fid, **kwargs):
             if fid in mock_faces:
                 face = mock_faces[fid]
                 return PersonMatchResult(
@@ -283,7 +283,7 @@ class TestMatchFacesToPersons:
                 )
             raise ValueError(f"Face {fid} not found")
 
-        person_service.match_single_face = mock_match
+        person_service._match_single_face = mock_match
 
         try:
             results = await person_service.match_faces_to_persons(
@@ -297,7 +297,7 @@ class TestMatchFacesToPersons:
                 assert result.is_new_person is True
                 assert result.person_id is not None
         finally:
-            person_service.match_single_face = original_match
+            person_service._match_single_face = original_match
 
 
 class TestAppearanceUpdate:
@@ -0,0 +1,224 @@
+"""Tests for the post-processing stage graph and the per-event unit of work."""
+import asyncio
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+from sqlalchemy.orm import sessionmaker
+
+from app.core.database import Base, create_sqlite_writer_engine
+from app.models.event import Event
+from app.models.event_embedding import EventEmbedding
+from app.services.database_writer import DatabaseWriter
+from app.services.embedding_service import EmbeddingService
+from app.services.post_processing import (
+    STATUS_ERROR,
+    STATUS_OK,
+    STATUS_TIMEOUT,
+    EventUnitOfWork,
+    PostProcessingGraph,
+    PostProcessingStage,
+)
+from tests.conftest import make_camera, make_event
+
+
+def _sleeper(seconds, log=None, name=None):
+    async def run():
+        if log is not None:
+            log.append(("start", name))
+        await asyncio.sleep(seconds)
+        if log is not None:
+            log.append(("end", name))
+        return name
+    return run
+
+
+class TestPostProcessingGraph:
+    @pytest.mark.asyncio
+    async def test_independent_stages_run_concurrently(self):
+        graph = PostProcessingGraph(
+            [PostProcessingStage(f"s{i}", _sleeper(0.1)) for i in range(3)],
+            max_concurrency=3,
+        )
+
+        t0 = time.perf_counter()
+        results = await graph.run()
+
+        assert time.perf_counter() - t0 < 0.25
+        assert all(r.status == STATUS_OK for r in results.values())
+
+    @pytest.mark.asyncio
+    async def test_dependent_stage_waits_even_if_dependency_fails(self):
+        log = []
+
+        async def broken():
+            log.append(("start", "broken"))
+            raise RuntimeError("boom")
+
+        graph = PostProcessingGraph([
+            PostProcessingStage("persist", _sleeper(0, log, "persist"), depends_on=("broken", "slow")),
+            PostProcessingStage("broken", broken),
+            PostProcessingStage("slow", _sleeper(0.05, log, "slow")),
+        ])
+
+        results = await graph.run()
+
+        assert log.index(("end", "slow")) < log.index(("start", "persist"))
+        assert results["broken"].status == STATUS_ERROR
+        assert results["broken"].error == "boom"
+        assert results["persist"].status == STATUS_OK
+
+    @pytest.mark.asyncio
+    async def test_timeout_is_recorded_without_blocking_siblings(self):
+        graph = PostProcessingGraph([
+            PostProcessingStage("hung", _sleeper(5), timeout=0.05),
+            PostProcessingStage("fast", _sleeper(0, name="fast")),
+        ])
+
+        results = await graph.run()
+
+        assert results["hung"].status == STATUS_TIMEOUT
+        assert results["fast"].value == "fast"
+        assert graph.summary()["hung"]["status"] == "timeout"
+
+    @pytest.mark.asyncio
+    async def test_concurrency_budget_and_priority_order(self):
+        log = []
+        graph = PostProcessingGraph(
+            [PostProcessingStage(f"s{i}", _sleeper(0.02, log, f"s{i}")) for i in range(4)],
+            max_concurrency=2,
+        )
+
+        await graph.run()
+
+        running = peak = 0
+        for kind, _ in log:
+            running += 1 if kind == "start" else -1
+            peak = max(peak, running)
+        assert peak == 2
+        assert [name for kind, name in log if kind == "start"][:2] == ["s0", "s1"]
+
+    def test_configured_timeouts_apply_per_stage(self):
+        graph = PostProcessingGraph(
+            [
+                PostProcessingStage("detections", _sleeper(0)),
+                PostProcessingStage("mqtt", _sleeper(0)),
+                PostProcessingStage("push", _sleeper(0), timeout=2),
+            ],
+            default_timeout=10,
+            stage_timeouts={"detections": 30, "push": 60},
+        )
+
+        assert graph.timeout_for(graph.stages[0]) == 30
+        assert graph.timeout_for(graph.stages[1]) == 10
+        assert graph.timeout_for(graph.stages[2]) == 2
+
+    def test_rejects_unknown_dependency_and_cycles(self):
+        with pytest.raises(ValueError):
+            PostProcessingGraph([PostProcessingStage("a", _sleeper(0), depends_on=("missing",))])
+        with pytest.raises(ValueError):
+            PostProcessingGraph([
+                PostProcessingStage("a", _sleeper(0), depends_on=("b",)),
+                PostProcessingStage("b", _sleeper(0), depends_on=("a",)),
+            ])
+
+
+@pytest.fixture
+def event_db(tmp_path):
+    """File database holding one camera and one event."""
+    url = f"sqlite:///{tmp_path / 'uow.db'}"
+    engine = create_sqlite_writer_engine(url)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+    camera = make_camera(db_session=session)
+    event = make_event(db_session=session, camera_id=camera.id)
+    event_id = event.id
+    session.close()
+    yield url, engine, event_id
+    engine.dispose()
+
+
+def _stage_writes(event_id):
+    uow = EventUnitOfWork(event_id)
+    uow.add(EmbeddingService().build_embedding(event_id, [0.5, 0.25]))
+    uow.set(post_processing_summary=json.dumps({"push_attempted": True}), final_entity_name="Mail carrier")
+    return uow
+
+
+def _assert_written(engine, event_id):
+    session = sessionmaker(bind=engine)()
+    try:
+        event = session.get(Event, event_id)
+        assert json.loads(event.post_processing_summary) == {"push_attempted": True}
+        assert event.final_entity_name == "Mail carrier"
+        embedding = session.query(EventEmbedding).filter_by(event_id=event_id).one()
+        assert json.loads(embedding.embedding) == [0.5, 0.25]
+    finally:
+        session.close()
+
+
+class TestEventUnitOfWork:
+    @pytest.mark.asyncio
+    async def test_commit_without_writer_uses_sync_session(self, event_db):
+        _, engine, event_id = event_db
+
+        with patch("app.core.database.SessionLocal", sessionmaker(bind=engine, autoflush=False)), \
+                patch("app.core.database.get_async_session_factory") as async_factory:
+            await _stage_writes(event_id).commit()
+
+        async_factory.assert_not_called()
+        _assert_written(engine, event_id)
+
+    @pytest.mark.asyncio
+    async def test_commit_is_one_writer_item(self, event_db):
+        _, engine, event_id = event_db
+        writer = DatabaseWriter(
+            session_factory=sessionmaker(bind=engine, autoflush=False, expire_on_commit=False)
+        )
+        writer.start()
+        try:
+            await _stage_writes(event_id).commit()
+            stats = writer.get_stats()
+        finally:
+            writer.stop()
+
+        assert stats["writes_committed"] == 1
+        _assert_written(engine, event_id)
+
+    @pytest.mark.asyncio
+    async def test_empty_unit_of_work_does_not_touch_the_database(self):
+        with patch("app.core.database.SessionLocal") as session_local:
+            await EventUnitOfWork("evt-1").commit()
+
+        session_local.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_staged_writes_share_the_commit_and_callbacks_run_after_it(self, event_db):
+        _, engine, event_id = event_db
+        log = []
+        uow = _stage_writes(event_id)
+
+        def rename(db):
+            log.append("stage")
+            db.get(Event, event_id).description = "staged"
+
+        def broken(db):
+            raise RuntimeError("boom")
+
+        async def after():
+            log.append("after_commit")
+
+        uow.stage(rename)
+        uow.stage(broken)
+        uow.after_commit(after)
+        with patch("app.core.database.SessionLocal", sessionmaker(bind=engine, autoflush=False)):
+            await uow.commit()
+
+        assert log == ["stage", "after_commit"]
+        _assert_written(engine, event_id)
+        session = sessionmaker(bind=engine)()
+        try:
+            assert session.get(Event, event_id).description == "staged"
+        finally:
+            session.close()
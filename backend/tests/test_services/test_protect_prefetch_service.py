@@ -0,0 +1,351 @@
+"""
+Tests for the Protect media prefetch pipeline.
+
+The controller client is a stand-in that streams a real fragmented MP4 to
+the output file in chunks, so partial handoff, per-controller concurrency and
+cancellation are exercised against actual clip bytes.
+"""
+import asyncio
+import shutil
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import av
+import numpy as np
+import pytest
+
+from app.services.clip_service import TEMP_CLIP_DIR, ClipService, reset_clip_service
+from app.services.protect_media_service import ProtectMediaService, reset_protect_media_service
+from app.services.protect_prefetch_service import (
+    ProtectPrefetchService,
+    clip_coverage_seconds,
+    get_protect_prefetch_service,
+    reset_protect_prefetch_service,
+)
+from app.services.snapshot_service import SnapshotResult
+
+EVENT_TIME = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def make_clip(path: Path, seconds: int = 6, fps: int = 10, fragmented: bool = True) -> bytes:
+    """Encode a small test clip; fragmented like a Protect export by default."""
+    options = {"movflags": "frag_keyframe+empty_moov"} if fragmented else {}
+    container = av.open(str(path), "w", options=options)
+    stream = container.add_stream("mpeg4", rate=fps)
+    stream.width, stream.height, stream.pix_fmt = 160, 120, "yuv420p"
+    stream.gop_size = fps
+    for i in range(seconds * fps):
+        image = np.full((120, 160, 3), (i * 4) % 255, dtype=np.uint8)
+        for packet in stream.encode(av.VideoFrame.from_ndarray(image, format="rgb24")):
+            container.mux(packet)
+    for packet in stream.encode():
+        container.mux(packet)
+    container.close()
+    return path.read_bytes()
+
+
+class StreamingClient:
+    """ProtectApiClient stand-in streaming ``data`` to output_file chunk by chunk."""
+
+    def __init__(self, data: bytes, chunk_size: int = 4096, delay: float = 0.002):
+        self.data = data
+        self.chunk_size = chunk_size
+        self.delay = delay
+        self.active = 0
+        self.max_active = 0
+        self.finished = 0
+        self.requested_ends = []
+
+    async def get_camera_video(self, camera_id, start, end, output_file, iterator_callback=None):
+        self.requested_ends.append(end)
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            with open(output_file, "wb") as output:
+                for offset in range(0, len(self.data), self.chunk_size):
+                    chunk = self.data[offset:offset + self.chunk_size]
+                    if iterator_callback is not None:
+                        await iterator_callback(len(self.data), chunk)
+                    output.write(chunk)
+                    output.flush()
+                    await asyncio.sleep(self.delay)
+            self.finished += 1
+        finally:
+            self.active -= 1
+
+
+@pytest.fixture
+def clip_bytes(tmp_path):
+    return make_clip(tmp_path / "source.mp4")
+
+
+@pytest.fixture
+def snapshot():
+    return SnapshotResult(
+        image_base64="abc",
+        thumbnail_path="/tmp/t.jpg",
+        width=1920,
+        height=1080,
+        camera_id="cam-1",
+        timestamp=datetime.now(timezone.utc),
+    )
+
+
+@pytest.fixture
+def protect(snapshot):
+    """ClipService bound to a fake ProtectService, snapshot service mocked."""
+    reset_clip_service()
+    reset_protect_prefetch_service()
+    reset_protect_media_service()
+    protect_service = MagicMock()
+    protect_service._connections = {}
+    ClipService(protect_service)
+    snapshot_service = MagicMock()
+    snapshot_service.get_snapshot = AsyncMock(return_value=snapshot)
+    with patch(
+        "app.services.protect_prefetch_service.get_snapshot_service",
+        return_value=snapshot_service,
+    ):
+        yield protect_service
+    reset_protect_prefetch_service()
+    reset_clip_service()
+    shutil.rmtree(TEMP_CLIP_DIR, ignore_errors=True)
+
+
+def start_job(service, event_id, controller_id="ctrl-1", fetch_clip=True, protect_event_id=None):
+    return service.start(
+        controller_id=controller_id,
+        protect_camera_id="protect-1",
+        camera_id="cam-1",
+        camera_name="Front Door",
+        event_id=event_id,
+        clip_start=EVENT_TIME - timedelta(seconds=15),
+        clip_end=EVENT_TIME + timedelta(seconds=15),
+        fetch_clip=fetch_clip,
+        protect_event_id=protect_event_id,
+    )
+
+
+class TestClipCoverage:
+    def test_partial_fragmented_clip_reports_available_seconds(self, tmp_path, clip_bytes):
+        partial = tmp_path / "partial.mp4"
+        partial.write_bytes(clip_bytes[:len(clip_bytes) // 2])
+
+        covered = clip_coverage_seconds(partial)
+
+        assert 1.0 < covered < 5.0
+        assert clip_coverage_seconds(tmp_path / "source.mp4") == pytest.approx(5.9, abs=0.2)
+
+    def test_unplayable_prefix_and_missing_file_report_zero(self, tmp_path):
+        data = make_clip(tmp_path / "flat.mp4", fragmented=False)
+        partial = tmp_path / "partial.mp4"
+        partial.write_bytes(data[:len(data) // 2])
+
+        assert clip_coverage_seconds(partial) == 0.0
+        assert clip_coverage_seconds(tmp_path / "missing.mp4") == 0.0
+
+
+class TestProtectPrefetchService:
+    @pytest.mark.asyncio
+    async def test_partial_clip_handed_off_before_download_completes(self, protect, clip_bytes):
+        client = StreamingClient(clip_bytes)
+        protect._connections["ctrl-1"] = client
+        service = ProtectPrefetchService(probe_bytes=8192)
+
+        job = start_job(service, "evt-partial")
+        clip_path = await service.wait_for_clip(job, min_seconds=2.0)
+
+        assert clip_path == job.clip_path
+        assert job.partial_handoff is True
+        assert not job.clip_task.done()
+        assert 0 < clip_path.stat().st_size < len(clip_bytes)
+        assert clip_coverage_seconds(clip_path) >= 2.0
+
+        # Releasing the event cancels the download and removes the file
+        assert service.discard("evt-partial") is True
+        await asyncio.gather(job.clip_task, return_exceptions=True)
+        await asyncio.sleep(0)
+        assert not clip_path.exists()
+        assert service.get_metrics()["partial_handoffs_total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_full_wait_returns_completed_clip(self, protect, clip_bytes):
+        client = StreamingClient(clip_bytes)
+        protect._connections["ctrl-1"] = client
+        service = ProtectPrefetchService()
+
+        job = start_job(service, "evt-full")
+        clip_path = await service.wait_for_clip(job)
+
+        assert clip_path.read_bytes() == clip_bytes
+        assert job.partial_handoff is False
+        assert job.chunks_received == -(-len(clip_bytes) // client.chunk_size)
+        assert await job.snapshot_task is not None
+        assert service.get_metrics()["complete_handoffs_total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_downloads_are_bounded_per_controller(self, protect, clip_bytes):
+        first = StreamingClient(clip_bytes, chunk_size=16384)
+        second = StreamingClient(clip_bytes, chunk_size=16384)
+        protect._connections.update({"ctrl-1": first, "ctrl-2": second})
+        service = ProtectPrefetchService(max_concurrency=2)
+
+        jobs = [start_job(service, f"evt-{i}", controller_id="ctrl-1") for i in range(5)]
+        jobs += [start_job(service, f"other-{i}", controller_id="ctrl-2") for i in range(2)]
+        paths = await asyncio.gather(*(service.wait_for_clip(job) for job in jobs))
+
+        assert all(path is not None for path in paths)
+        assert first.finished == 5 and first.max_active == 2
+        assert second.finished == 2 and second.max_active == 2
+
+    @pytest.mark.asyncio
+    async def test_start_is_idempotent_and_snapshot_only_jobs_have_no_clip(self, protect, clip_bytes):
+        protect._connections["ctrl-1"] = StreamingClient(clip_bytes)
+        service = ProtectPrefetchService()
+
+        job = start_job(service, "evt-1", fetch_clip=False)
+
+        assert start_job(service, "evt-1") is job
+        assert job.clip_task is None
+        assert await service.wait_for_clip(job) is None
+        assert service.get_job("evt-1") is job
+
+    @pytest.mark.asyncio
+    async def test_jobs_are_found_by_protect_event_id(self, protect, clip_bytes):
+        protect._connections["ctrl-1"] = StreamingClient(clip_bytes)
+        service = ProtectPrefetchService()
+
+        job = start_job(service, "evt-open", protect_event_id="protect-event-1")
+
+        assert job.protect_event_id == "protect-event-1"
+        assert service.get_job_for_protect_event("protect-event-1") is job
+        assert start_job(service, "evt-later", protect_event_id="protect-event-1") is job
+        await service.wait_for_clip(job)
+        service.discard("evt-open")
+        assert service.get_job_for_protect_event("protect-event-1") is None
+
+    @pytest.mark.asyncio
+    async def test_clip_export_covers_footage_recorded_so_far(self, protect, clip_bytes):
+        client = StreamingClient(clip_bytes)
+        protect._connections["ctrl-1"] = client
+        service = ProtectPrefetchService()
+        now = datetime.now(timezone.utc)
+
+        job = service.start(
+            controller_id="ctrl-1",
+            protect_camera_id="protect-1",
+            camera_id="cam-1",
+            camera_name="Front Door",
+            event_id="evt-live",
+            clip_start=now - timedelta(seconds=15),
+            clip_end=now + timedelta(seconds=15),
+        )
+
+        assert await service.wait_for_clip(job) is not None
+        assert client.finished == 1
+        assert now <= client.requested_ends[0] < now + timedelta(seconds=5)
+
+    @pytest.mark.asyncio
+    async def test_disconnected_controller_fails_clip(self, protect):
+        service = ProtectPrefetchService()
+
+        job = start_job(service, "evt-offline")
+
+        assert await service.wait_for_clip(job, min_seconds=1.0) is None
+        assert service.get_metrics()["failed_total"] == 1
+
+    def test_accessor_returns_singleton(self):
+        reset_protect_prefetch_service()
+        assert get_protect_prefetch_service() is get_protect_prefetch_service()
+
+
+class TestPrefetchedMedia:
+    async def _get_media(self, analysis_mode, event_id):
+        return await ProtectMediaService().get_media_for_event(
+            controller_id="ctrl-1",
+            protect_camera_id="protect-1",
+            camera_id="cam-1",
+            camera_name="Front Door",
+            event_id=event_id,
+            event_timestamp=EVENT_TIME,
+            analysis_mode=analysis_mode,
+            protect_event_id="protect-event-1",
+        )
+
+    @pytest.mark.asyncio
+    async def test_multi_frame_waits_for_complete_clip_by_default(self, protect, clip_bytes):
+        protect._connections["ctrl-1"] = StreamingClient(clip_bytes)
+        ProtectPrefetchService(partial_seconds=0, probe_bytes=8192)
+
+        bundle = await self._get_media("multi_frame", "evt-multi-full")
+
+        assert bundle.clip_path.read_bytes() == clip_bytes
+        assert get_protect_prefetch_service().get_job("evt-multi-full").partial_handoff is False
+
+    @pytest.mark.asyncio
+    async def test_analysis_starts_before_the_clip_window_ends(self, protect, clip_bytes):
+        protect._connections["ctrl-1"] = StreamingClient(clip_bytes)
+        event_timestamp = datetime.now(timezone.utc)
+
+        bundle = await ProtectMediaService().get_media_for_event(
+            controller_id="ctrl-1",
+            protect_camera_id="protect-1",
+            camera_id="cam-1",
+            camera_name="Front Door",
+            event_id="evt-live-media",
+            event_timestamp=event_timestamp,
+            analysis_mode="multi_frame",
+            protect_event_id="protect-event-live",
+        )
+
+        assert bundle.clip_path.read_bytes() == clip_bytes
+        assert datetime.now(timezone.utc) < event_timestamp + timedelta(seconds=15)
+
+    @pytest.mark.asyncio
+    async def test_media_reuses_job_started_when_event_opened(self, protect, clip_bytes):
+        protect._connections["ctrl-1"] = StreamingClient(clip_bytes)
+        media = ProtectMediaService()
+
+        job = media.start_prefetch(
+            controller_id="ctrl-1",
+            protect_camera_id="protect-1",
+            camera_id="cam-1",
+            camera_name="Front Door",
+            event_id="evt-opened",
+            event_timestamp=EVENT_TIME,
+            analysis_mode="video_native",
+            protect_event_id="protect-event-1",
+        )
+        bundle = await self._get_media("video_native", "evt-second-message")
+
+        assert get_protect_prefetch_service().get_metrics()["started_total"] == 1
+        assert bundle.clip_path == job.clip_path
+
+    @pytest.mark.asyncio
+    async def test_multi_frame_gets_partial_clip(self, protect, clip_bytes):
+        protect._connections["ctrl-1"] = StreamingClient(clip_bytes)
+        ProtectPrefetchService(partial_seconds=2.0, probe_bytes=8192)
+
+        bundle = await self._get_media("multi_frame", "evt-multi")
+
+        assert bundle.has_snapshot and bundle.has_clip
+        assert get_protect_prefetch_service().get_job("evt-multi").partial_handoff is True
+        assert ProtectMediaService().cleanup_clip("evt-multi") is True
+
+    @pytest.mark.asyncio
+    async def test_video_native_waits_for_complete_clip(self, protect, clip_bytes):
+        protect._connections["ctrl-1"] = StreamingClient(clip_bytes)
+        ProtectPrefetchService(partial_seconds=2.0, probe_bytes=8192)
+
+        bundle = await self._get_media("video_native", "evt-native")
+
+        assert bundle.clip_path.read_bytes() == clip_bytes
+        assert bundle.fallback_reason is None
+
+    @pytest.mark.asyncio
+    async def test_failed_clip_sets_fallback_reason(self, protect):
+        bundle = await self._get_media("multi_frame", "evt-no-clip")
+
+        assert bundle.has_snapshot and not bundle.has_clip
+        assert bundle.fallback_reason == "clip_download_failed"
@@ -18,6 +18,7 @@ from app.services.smart_reanalyze_service import (
     ScoredFrame,
     SmartReanalyzeResult,
 )
+from app.services.query_adaptive.frame_matrix import FrameEmbeddingMatrix
 
 
 class TestSmartReanalyzeServiceInit:
@@ -184,67 +185,158 @@ class TestDiversityFiltering:
         """Test that near-duplicate frames are filtered."""
         service = SmartReanalyzeService()
 
-        # Create scored frames with embeddings
-        scored_frames = [
-            ScoredFrame(frame_index=0, similarity_score=0.9, embedding_id="e1"),
-            ScoredFrame(frame_index=1, similarity_score=0.85, embedding_id="e2"),
-            ScoredFrame(frame_index=2, similarity_score=0.8, embedding_id="e3"),
-        ]
-
-        # Frame embeddings with frame 1 being near-duplicate of frame 0
+        # Frame 1 is a near-duplicate of frame 0; frame 2 points elsewhere
         frame_embeddings = [
             {"frame_index": 0, "embedding": [0.5] * 512},
-            {"frame_index": 1, "embedding": [0.501] * 512},  # Very similar to frame 0
-            {"frame_index": 2, "embedding": [0.3] * 512},  # Different
+            {"frame_index": 1, "embedding": [0.501] * 512},
+            {"frame_index": 2, "embedding": [0.5] * 256 + [-0.5] * 256},
         ]
+        matrix = FrameEmbeddingMatrix.from_rows("evt", frame_embeddings)
 
-        selected = service._select_diverse_frames(
-            scored_frames=scored_frames,
-            frame_embeddings=frame_embeddings,
-            top_k=5,
-            min_similarity=0.0,
+        rows, _ = service._diversity_filter.select_diverse(matrix.vectors, [0, 1, 2], 5)
+
+        assert [int(matrix.frame_indices[row]) for row in rows] == [0, 2]
+
+
+def _cosine(vec1, vec2):
+    a = np.asarray(vec1, dtype=np.float32)
+    b = np.asarray(vec2, dtype=np.float32)
+    norms = np.linalg.norm(a) * np.linalg.norm(b)
+    return float(np.dot(a, b) / norms) if norms else 0.0
+
+
+def _reference_diverse_selection(embeddings, order, top_k, threshold):
+    """Original pairwise greedy selection, used as the reference result."""
+    selected = []
+    for idx in order:
+        if len(selected) >= top_k:
+            break
+        if all(_cosine(embeddings[idx], embeddings[j]) <= threshold for j in selected):
+            selected.append(idx)
+    return selected
+
+
+def _clustered_embeddings(rng, n_frames, n_clusters=4):
+    """Random frames grouped into clusters of near-duplicates."""
+    centers = rng.standard_normal((n_clusters, 512))
+    return [
+        (centers[i % n_clusters] + rng.standard_normal(512) * 0.05).tolist()
+        for i in range(n_frames)
+    ]
+
+
+class TestFrameMatrixReranking:
+    """Tests for re-ranking from the cached frame embedding matrix."""
+
+    @pytest.fixture
+    def embeddings(self):
+        return _clustered_embeddings(np.random.default_rng(7), 12)
+
+    @pytest.fixture
+    def mock_embedding_service(self, embeddings):
+        mock = MagicMock()
+        mock.encode_text = AsyncMock(return_value=np.random.default_rng(3).standard_normal(512).tolist())
+        mock.get_frame_embeddings = AsyncMock(return_value=[
+            {"id": f"emb{i}", "frame_index": i, "embedding": emb, "model_version": "v1"}
+            for i, emb in enumerate(embeddings)
+        ])
+        return mock
+
+    @pytest.mark.asyncio
+    async def test_matrix_loaded_once_per_event(self, mock_embedding_service):
+        """Stored frame embeddings are decoded once, then served from the matrix cache."""
+        service = SmartReanalyzeService(embedding_service=mock_embedding_service)
+
+        first = await service.select_relevant_frames(
+            db=MagicMock(), event_id="evt-1", query="package", min_similarity=-1.0, use_cache=False
+        )
+        second = await service.select_relevant_frames(
+            db=MagicMock(), event_id="evt-1", query="package", min_similarity=-1.0, use_cache=False
         )
 
-        # Frame 1 should be filtered as near-duplicate
-        assert 0 in selected
-        # Frame 1 might be excluded due to high similarity to frame 0
-        assert len(selected) >= 1
+        mock_embedding_service.get_frame_embeddings.assert_awaited_once()
+        assert first.selected_frames == second.selected_frames
+        assert first.frame_scores == second.frame_scores
 
+    @pytest.mark.asyncio
+    async def test_matches_pairwise_selection(self, mock_embedding_service, embeddings):
+        """Vectorized scoring and diversity give the same frames as the pairwise version."""
+        service = SmartReanalyzeService(embedding_service=mock_embedding_service)
+        query = np.asarray(await mock_embedding_service.encode_text("package"))
 
-class TestCosineSimilarity:
-    """Tests for cosine similarity calculation."""
+        result = await service.select_relevant_frames(
+            db=MagicMock(), event_id="evt-1", query="package", top_k=4, min_similarity=-1.0, use_cache=False
+        )
 
-    def test_cosine_similarity_identical(self):
-        """Test cosine similarity of identical vectors."""
-        service = SmartReanalyzeService()
+        similarities = [
+            float(np.dot(query, e) / (np.linalg.norm(query) * np.linalg.norm(e))) for e in embeddings
+        ]
+        order = sorted(range(len(embeddings)), key=lambda i: similarities[i], reverse=True)
+        expected = _reference_diverse_selection(embeddings, order, 4, service.DIVERSITY_THRESHOLD)
+
+        assert result.selected_frames == expected
+        assert len(result.selected_frames) == 4  # one frame per cluster
+        assert sorted(f.frame_index for f in result.frame_scores) == list(range(len(embeddings)))
+        scores = [f.similarity_score for f in result.frame_scores]
+        assert scores == sorted(scores, reverse=True)
+        assert result.frame_scores[0].similarity_score == pytest.approx(similarities[order[0]], abs=1e-4)
 
-        vec = [0.5] * 512
-        similarity = service._cosine_similarity_single(vec, vec)
+    @pytest.mark.asyncio
+    async def test_invalidation_reloads_matrix_and_drops_cached_results(self, mock_embedding_service):
+        """Storing new frame embeddings invalidates the matrix and cached selections."""
+        from app.services.embedding_service import EmbeddingService
 
-        assert similarity == pytest.approx(1.0, abs=0.001)
+        service = SmartReanalyzeService(embedding_service=mock_embedding_service)
+        await service.select_relevant_frames(
+            db=MagicMock(), event_id="evt-1", query="package", min_similarity=-1.0
+        )
+        assert service.query_cache.get("evt-1", "package") is not None
 
-    def test_cosine_similarity_orthogonal(self):
-        """Test cosine similarity of orthogonal vectors."""
-        service = SmartReanalyzeService()
+        db = MagicMock()
+        db.query.return_value.filter.return_value.delete.return_value = 12
+        await EmbeddingService().delete_frame_embeddings(db, "evt-1")
 
-        # Create orthogonal vectors (not exactly 512 dims for simplicity in test)
-        vec1 = [1.0, 0.0, 0.0] + [0.0] * 509
-        vec2 = [0.0, 1.0, 0.0] + [0.0] * 509
+        assert service.query_cache.get("evt-1", "package") is None
+        await service.select_relevant_frames(
+            db=MagicMock(), event_id="evt-1", query="package", min_similarity=-1.0
+        )
+        assert mock_embedding_service.get_frame_embeddings.await_count == 2
+        service.query_cache.clear()
 
-        similarity = service._cosine_similarity_single(vec1, vec2)
 
-        assert similarity == pytest.approx(0.0, abs=0.001)
+class TestVectorizedDiversityFilter:
+    """Tests for DiversityFilter working on the embedding matrix."""
 
-    def test_cosine_similarity_zero_vector(self):
-        """Test cosine similarity with zero vector."""
-        service = SmartReanalyzeService()
+    def test_filter_matches_pairwise_reference(self):
+        """Greedy selection is unchanged by vectorization."""
+        from app.services.query_adaptive.diversity_filter import DiversityFilter
 
-        vec1 = [0.5] * 512
-        vec2 = [0.0] * 512
+        rng = np.random.default_rng(11)
+        embeddings = _clustered_embeddings(rng, 20, n_clusters=6)
+        embeddings[5] = [0.0] * 512  # zero vector is never a duplicate
+        relevance = rng.uniform(0, 100, 20).tolist()
+        order = sorted(range(20), key=lambda i: relevance[i], reverse=True)
 
-        similarity = service._cosine_similarity_single(vec1, vec2)
+        diversity_filter = DiversityFilter()
+        selected = diversity_filter.filter_diverse_frames(embeddings, relevance, top_k=7)
+
+        assert selected == _reference_diverse_selection(
+            embeddings, order, 7, DiversityFilter.DEFAULT_SIMILARITY_THRESHOLD
+        )
+        assert 5 in selected
+
+    def test_details_mark_filtered_frames(self):
+        """Near-duplicates of selected frames are reported as filtered."""
+        from app.services.query_adaptive.diversity_filter import DiversityFilter
+
+        base = np.random.default_rng(5).standard_normal(512)
+        embeddings = np.stack([base, base * 1.01, -base, base + 0.001])
+        selected, frames = DiversityFilter().get_filtered_frames_with_details(
+            embeddings, relevance_scores=[90, 80, 70, 60], top_k=2
+        )
 
-        assert similarity == 0.0
+        assert selected == [0, 2]
+        assert [f.was_filtered for f in frames] == [False, True, False, False]
 
 
 class TestScoredFrameDataclass:
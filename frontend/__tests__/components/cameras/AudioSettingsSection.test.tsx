@@ -73,6 +73,7 @@ describe('AudioSettingsSection', () => {
       expect(screen.getByText('Gunshot')).toBeInTheDocument();
       expect(screen.getByText('Scream')).toBeInTheDocument();
       expect(screen.getByText('Doorbell')).toBeInTheDocument();
+      expect(screen.getByText('Alarm')).toBeInTheDocument();
     });
 
     it('hides audio event options when disabled', () => {
@@ -84,11 +85,11 @@ describe('AudioSettingsSection', () => {
   });
 
   describe('Audio Event Types Selection (AC#2)', () => {
-    it('renders all four audio event type checkboxes when enabled', () => {
+    it('renders all five audio event type checkboxes when enabled', () => {
       render(<AudioSettingsSectionWrapper defaultValues={{ audio_enabled: true }} />);
 
       const checkboxes = screen.getAllByRole('checkbox');
-      expect(checkboxes).toHaveLength(4);
+      expect(checkboxes).toHaveLength(5);
     });
 
     it('checkboxes can be selected', () => {
@@ -449,6 +449,20 @@ describe('EventDetailModal', () => {
       expect(screen.getByText('(3 frames)')).toBeInTheDocument()
     })
 
+    it('loads key frames from key_frame_urls', () => {
+      const event = createMockEvent({
+        key_frame_urls: ['/api/v1/events/evt-1/key-frames/0.jpg', '/api/v1/events/evt-1/key-frames/1.jpg'],
+        frame_timestamps: [0.5, 1.5],
+      })
+      renderModal(event)
+
+      expect(screen.getByText('(2 frames)')).toBeInTheDocument()
+      expect(screen.getByAltText('Frame 2')).toHaveAttribute(
+        'src',
+        expect.stringContaining('/api/v1/events/evt-1/key-frames/1.jpg')
+      )
+    })
+
     it('does not show key frames gallery when no frames', () => {
       const event = createMockEvent({
         key_frames_base64: [],
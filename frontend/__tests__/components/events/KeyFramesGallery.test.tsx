@@ -82,6 +82,17 @@ describe('KeyFramesGallery', () => {
       expect(images[0]).toHaveAttribute('src', `data:image/jpeg;base64,${TEST_FRAME_BASE64}`)
     })
 
+    it('uses frame URLs as image sources', () => {
+      render(
+        <KeyFramesGallery
+          frames={['/api/v1/events/evt-1/key-frames/0.jpg']}
+          timestamps={[0.5]}
+        />
+      )
+
+      expect(screen.getByAltText('Frame 1')).toHaveAttribute('src', '/api/v1/events/evt-1/key-frames/0.jpg')
+    })
+
     it('displays frame numbers', () => {
       render(
         <KeyFramesGallery
@@ -62,6 +62,11 @@ const AUDIO_EVENT_TYPES = [
     label: 'Doorbell',
     description: 'Doorbell ring or chime sounds',
   },
+  {
+    id: 'alarm',
+    label: 'Alarm',
+    description: 'Smoke/CO alarm beeps or siren tones',
+  },
 ] as const;
 
 /**
@@ -109,7 +109,7 @@ export function CameraForm({
           homekit_stream_quality: initialData.homekit_stream_quality || 'medium',
           // Phase 6: Audio settings
           audio_enabled: initialData.audio_enabled ?? false,
-          audio_event_types: (initialData.audio_event_types ?? []) as Array<'glass_break' | 'gunshot' | 'scream' | 'doorbell'>,
+          audio_event_types: (initialData.audio_event_types ?? []) as Array<'glass_break' | 'gunshot' | 'scream' | 'doorbell' | 'alarm'>,
           audio_threshold: initialData.audio_threshold ?? null,
         }
       : {
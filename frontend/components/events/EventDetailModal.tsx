@@ -181,6 +181,11 @@ export function EventDetailModal({
 
   const imageSrc = getImageSrc();
 
+  // Media-store key frames are served as JPEGs; older responses inline them as base64
+  const keyFrames = event.key_frame_urls?.length
+    ? event.key_frame_urls.map((url) => `${apiUrl}${url}`)
+    : event.key_frames_base64 ?? [];
+
   return (
     <>
       <Dialog open={open} onOpenChange={(isOpen) => !isOpen && onClose()}>
@@ -504,9 +509,9 @@ export function EventDetailModal({
           )}
 
           {/* Story P3-7.5: Key Frames Gallery for multi-frame analysis */}
-          {event.key_frames_base64 && event.key_frames_base64.length > 0 && (
+          {keyFrames.length > 0 && (
             <KeyFramesGallery
-              frames={event.key_frames_base64}
+              frames={keyFrames}
               timestamps={event.frame_timestamps || []}
             />
           )}
@@ -19,12 +19,20 @@ import {
 import { Button } from '@/components/ui/button';
 
 interface KeyFramesGalleryProps {
-  /** Array of base64-encoded JPEG frame images */
+  /** Frame image URLs, or base64-encoded JPEGs from legacy responses */
   frames: string[];
   /** Array of timestamps in seconds for each frame */
   timestamps: number[];
 }
 
+/**
+ * Image src for a frame: URLs and data URIs pass through, bare base64 is wrapped
+ * (JPEG base64 starts with "/9j/", so only /api/ paths count as URLs)
+ */
+function frameSrc(frame: string): string {
+  return /^(https?:|data:|\/api\/)/.test(frame) ? frame : `data:image/jpeg;base64,${frame}`;
+}
+
 /**
  * Format timestamp in seconds to MM:SS.ms format
  */
@@ -82,7 +90,7 @@ export function KeyFramesGallery({ frames, timestamps }: KeyFramesGalleryProps)
               <div className="relative w-32 h-24 bg-gray-100">
                 {/* eslint-disable-next-line @next/next/no-img-element */}
                 <img
-                  src={`data:image/jpeg;base64,${frame}`}
+                  src={frameSrc(frame)}
                   alt={`Frame ${index + 1}`}
                   className="w-full h-full object-cover group-hover:opacity-90 transition-opacity"
                 />
@@ -123,7 +131,7 @@ export function KeyFramesGallery({ frames, timestamps }: KeyFramesGalleryProps)
           <div className="relative bg-black rounded-lg overflow-hidden">
             {/* eslint-disable-next-line @next/next/no-img-element */}
             <img
-              src={`data:image/jpeg;base64,${frames[selectedIndex]}`}
+              src={frameSrc(frames[selectedIndex])}
               alt={`Frame ${selectedIndex + 1}`}
               className="w-full h-auto max-h-[60vh] object-contain mx-auto"
             />
@@ -172,7 +180,7 @@ export function KeyFramesGallery({ frames, timestamps }: KeyFramesGalleryProps)
                 >
                   {/* eslint-disable-next-line @next/next/no-img-element */}
                   <img
-                    src={`data:image/jpeg;base64,${frame}`}
+                    src={frameSrc(frame)}
                     alt={`Thumbnail ${index + 1}`}
                     className="w-full h-full object-cover"
                   />
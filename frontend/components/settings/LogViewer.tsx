@@ -261,7 +261,8 @@ export function LogViewer() {
         {/* Results summary */}
         {data && (
           <div className="text-sm text-muted-foreground">
-            Showing {data.entries.length} of {data.total} log entries
+            Showing {data.entries.length} of {data.total}
+            {data.total_exact === false && '+'} log entries
             {data.has_more && ' (scroll for more)'}
           </div>
         )}
@@ -946,6 +946,8 @@ export const apiClient = {
     getAIProvidersStatus: async (): Promise<{
       providers: Array<{ provider: string; configured: boolean }>;
       order: string[];
+      routing?: Record<string, unknown> | null;
+      image_payload?: Record<string, unknown> | null;
     }> => {
       return apiFetch('/system/ai-providers');
     },
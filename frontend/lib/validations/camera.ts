@@ -150,7 +150,7 @@ export const cameraFormSchema = z.object({
   homekit_stream_quality: z.enum(['low', 'medium', 'high']).optional(),
   // Phase 6: Audio settings
   audio_enabled: z.boolean().optional(),
-  audio_event_types: z.array(z.enum(['glass_break', 'gunshot', 'scream', 'doorbell'])).optional(),
+  audio_event_types: z.array(z.enum(['glass_break', 'gunshot', 'scream', 'doorbell', 'alarm'])).optional(),
   audio_threshold: z.number().min(0).max(1).nullable().optional(),
 }).superRefine((data, ctx) => {
   // Validate RTSP-specific fields
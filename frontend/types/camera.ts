@@ -111,8 +111,9 @@ export interface ICamera {
   // Phase 6: Audio settings
   audio_enabled: boolean; // Whether audio capture is enabled
   audio_codec?: string | null; // Detected audio codec
-  audio_event_types?: string[] | null; // Audio event types to detect: glass_break, gunshot, scream, doorbell
+  audio_event_types?: string[] | null; // Audio event types to detect: glass_break, gunshot, scream, doorbell, alarm
   audio_threshold?: number | null; // Per-camera confidence threshold override (0.0-1.0)
+  description_cache_enabled?: boolean; // Reuse a recent AI description for near-identical frames
   // Phase 2: UniFi Protect integration fields
   source_type: CameraSourceType; // 'rtsp', 'usb', or 'protect'
   protect_controller_id?: string | null; // Foreign key to protect_controllers
@@ -148,6 +149,7 @@ export interface ICameraCreate {
   audio_enabled?: boolean;
   audio_event_types?: string[];
   audio_threshold?: number | null;
+  description_cache_enabled?: boolean;
 }
 
 /**
@@ -174,6 +176,7 @@ export interface ICameraUpdate {
   audio_enabled?: boolean;
   audio_event_types?: string[];
   audio_threshold?: number | null;
+  description_cache_enabled?: boolean;
 }
 
 /**
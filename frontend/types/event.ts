@@ -123,7 +123,7 @@ export interface IEvent {
   confidence: number;             // 0-100
   objects_detected: string[];     // ["person", "vehicle", "animal", "package", "unknown"]
   thumbnail_path: string | null;
-  thumbnail_base64: string | null;
+  thumbnail_base64: string | null;  // Only set for legacy inline thumbnails; media-store thumbnails come via thumbnail_path
   alert_triggered: boolean;
   created_at: string;             // ISO 8601 datetime
   // Phase 2: UniFi Protect event source fields
@@ -151,7 +151,8 @@ export interface IEvent {
   // Story P3-7.1: AI cost tracking
   ai_cost?: number | null;              // Estimated cost in USD for AI analysis
   // Story P3-7.5: Key frames for gallery display
-  key_frames_base64?: string[] | null;  // Base64-encoded key frames used for AI analysis
+  key_frames_base64?: string[] | null;  // Base64-encoded key frames (legacy responses)
+  key_frame_urls?: string[] | null;     // API paths of key frames in the media store (/events/{id}/key-frames/{n}.jpg)
   frame_timestamps?: number[] | null;   // Timestamps in seconds for each key frame
   // Story P4-5.1: User feedback
   feedback?: IEventFeedback | null;     // User feedback on this event's description
@@ -77,6 +77,8 @@ export interface LogsResponse {
   limit: number;
   offset: number;
   has_more: boolean;
+  /** False when the backend stopped scanning after this page; total is then a lower bound */
+  total_exact?: boolean;
 }
 
 export interface LogsQueryParams {